@@ -0,0 +1,68 @@
+"""Add job_analysis_cache table.
+
+Revision ID: 20261016_job_analysis_cache
+Revises: 20261016_structured_data
+Create Date: 2026-10-16
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_job_analysis_cache"
+down_revision: Union[str, None] = "20261016_structured_data"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the job_analysis_cache table."""
+    op.create_table(
+        "job_analysis_cache",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("cache_key", sa.String(64), nullable=False),
+        sa.Column("job_description_hash", sa.String(64), nullable=False),
+        sa.Column("resume_hash", sa.String(64), nullable=False),
+        sa.Column("model_name", sa.String(), nullable=False),
+        sa.Column(
+            "analysis",
+            postgresql.JSONB(astext_type=sa.Text()).with_variant(sa.JSON(), "sqlite"),
+            nullable=False,
+        ),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("last_used_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_job_analysis_cache_id"),
+        "job_analysis_cache",
+        ["id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_job_analysis_cache_cache_key"),
+        "job_analysis_cache",
+        ["cache_key"],
+        unique=True,
+    )
+    op.create_index(
+        op.f("ix_job_analysis_cache_last_used_at"),
+        "job_analysis_cache",
+        ["last_used_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop the job_analysis_cache table."""
+    op.drop_index(
+        op.f("ix_job_analysis_cache_last_used_at"),
+        table_name="job_analysis_cache",
+    )
+    op.drop_index(op.f("ix_job_analysis_cache_cache_key"), table_name="job_analysis_cache")
+    op.drop_index(op.f("ix_job_analysis_cache_id"), table_name="job_analysis_cache")
+    op.drop_table("job_analysis_cache")
@@ -0,0 +1,41 @@
+"""Add llm_fallback_endpoints to user_settings.
+
+Revision ID: 20261016_llm_fallbacks
+Revises: 20261016_job_analysis_cache
+Create Date: 2026-10-16
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_llm_fallbacks"
+down_revision: Union[str, None] = "20261016_job_analysis_cache"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add llm_fallback_endpoints column to user_settings table.
+
+    This column stores the ordered endpoints LLM calls fail over to while the
+    circuit of the user's primary endpoint is open. If NULL, there are none.
+
+    """
+    op.add_column(
+        "user_settings",
+        sa.Column(
+            "llm_fallback_endpoints",
+            postgresql.JSONB(astext_type=sa.Text()).with_variant(sa.JSON(), "sqlite"),
+            nullable=True,
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Remove llm_fallback_endpoints column from user_settings table."""
+    op.drop_column("user_settings", "llm_fallback_endpoints")
@@ -0,0 +1,41 @@
+"""Add structured data columns to resumes table.
+
+Revision ID: 20261016_structured_data
+Revises: 20260304_job_details
+Create Date: 2026-10-16
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_structured_data"
+down_revision: Union[str, None] = "20260304_job_details"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add structured data columns to resumes table."""
+    op.add_column(
+        "resumes",
+        sa.Column(
+            "structured_data",
+            postgresql.JSONB(astext_type=sa.Text()).with_variant(sa.JSON(), "sqlite"),
+            nullable=True,
+        ),
+    )
+    op.add_column(
+        "resumes",
+        sa.Column("structured_data_version", sa.Integer(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Remove structured data columns from resumes table."""
+    op.drop_column("resumes", "structured_data")
+    op.drop_column("resumes", "structured_data_version")
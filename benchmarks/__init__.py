@@ -0,0 +1 @@
+"""Benchmarks for resume parsing, filtering and serialization."""
@@ -0,0 +1,777 @@
+"""Deterministic OpenAI-compatible stand-in LLM server for load tests.
+
+Answers the chat-completions requests made by job analysis, role refinement,
+banner generation and the introduction steps with schema-valid JSON, after a
+configurable latency, and injects 429s, server errors and malformed JSON at
+configurable rates.
+
+Usage:
+    python -m benchmarks.fake_llm_server --port 8001 --latency-ms 800
+    python -m benchmarks.fake_llm_server --rate-limit-rate 0.05 --malformed-rate 0.02
+
+Set a user's LLM endpoint to ``http://127.0.0.1:8001/v1`` to send their
+refinements to it; no API key is needed.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import random
+import time
+from collections import Counter
+from collections.abc import AsyncIterator
+from dataclasses import asdict, dataclass, field
+from typing import Any, Literal
+
+import click
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
+
+from resume_editor.app.llm import prompts
+from resume_editor.app.llm.models import (
+    BannerBullet,
+    CandidateAnalysis,
+    CandidateRequirementAnalysis,
+    FactualEvidence,
+    GeneratedBanner,
+    GeneratedIntroduction,
+    JobAnalysis,
+    JobKeyRequirements,
+    RefinedRole,
+    RefinedRoleBatch,
+    RefinedSection,
+)
+from resume_editor.app.llm.rate_limiter import CHARS_PER_TOKEN
+
+log = logging.getLogger(__name__)
+
+LatencyDistribution = Literal["fixed", "uniform", "lognormal"]
+Fault = Literal["rate_limit", "error", "malformed"]
+
+DEFAULT_MODEL = "fake-llm"
+DEFAULT_LATENCY_MS = 800.0
+_SKILLS = (
+    "Python",
+    "SQL",
+    "FastAPI",
+    "PostgreSQL",
+    "Docker",
+    "Kubernetes",
+    "AWS",
+    "Terraform",
+    "React",
+    "Go",
+)
+_DUTIES = (
+    "Design and build backend services",
+    "Own production reliability",
+    "Mentor other engineers",
+    "Lead migrations to the cloud",
+    "Improve data pipelines",
+)
+_THEMES = ("ownership", "collaboration", "scale", "quality", "delivery speed")
+_FALLBACK_BASICS = {
+    "company": "Example Corp",
+    "title": "Software Engineer",
+    "start_date": "2020-01-01T00:00:00",
+}
+
+
+@dataclass(frozen=True)
+class FakeLLMProfile:
+    """How the stand-in server behaves.
+
+    Attributes:
+        latency_ms (float): Median time before a response, or before the first
+            streamed chunk.
+        latency_jitter_ms (float): Half-width of the uniform distribution.
+        latency_sigma (float): Shape of the lognormal distribution.
+        latency_distribution (LatencyDistribution): "fixed", "uniform" or "lognormal".
+        rate_limit_rate (float): Share of requests answered with a 429.
+        error_rate (float): Share of requests answered with a 500.
+        malformed_rate (float): Share of responses whose JSON is cut off.
+        retry_after_seconds (float): Retry-After sent with each 429.
+        stream_chunk_chars (int): Characters per streamed chunk.
+        stream_chunk_delay_ms (float): Pause between streamed chunks.
+        seed (int): Seed from which every request's latency, fault and content
+            are derived.
+
+    """
+
+    latency_ms: float = DEFAULT_LATENCY_MS
+    latency_jitter_ms: float = 0.0
+    latency_sigma: float = 0.5
+    latency_distribution: LatencyDistribution = "lognormal"
+    rate_limit_rate: float = 0.0
+    error_rate: float = 0.0
+    malformed_rate: float = 0.0
+    retry_after_seconds: float = 1.0
+    stream_chunk_chars: int = 16
+    stream_chunk_delay_ms: float = 5.0
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        """Validate the rates and timings.
+
+        Raises:
+            ValueError: If a rate is outside [0, 1], the rates sum above 1, or a
+                timing is negative.
+
+        """
+        rates = (self.rate_limit_rate, self.error_rate, self.malformed_rate)
+        if any(not 0.0 <= rate <= 1.0 for rate in rates) or sum(rates) > 1.0:
+            raise ValueError("fault rates must be in [0, 1] and sum to at most 1")
+        timings = (
+            self.latency_ms,
+            self.latency_jitter_ms,
+            self.latency_sigma,
+            self.retry_after_seconds,
+            self.stream_chunk_delay_ms,
+        )
+        if min(timings) < 0 or self.stream_chunk_chars < 1:
+            raise ValueError("latencies must be non-negative and chunks non-empty")
+
+
+@dataclass
+class FakeLLMStats:
+    """Counters of the requests the stand-in server answered.
+
+    Attributes:
+        requests (int): Chat-completion requests received.
+        streamed (int): Requests answered as a stream.
+        rate_limited (int): Requests answered with a 429.
+        errors (int): Requests answered with a 500.
+        malformed (int): Responses whose JSON was cut off.
+        by_kind (dict[str, int]): Requests per recognized prompt kind.
+
+    """
+
+    requests: int = 0
+    streamed: int = 0
+    rate_limited: int = 0
+    errors: int = 0
+    malformed: int = 0
+    by_kind: dict[str, int] = field(default_factory=dict)
+
+
+# (marker in the system prompt, prompt kind); the batch marker must come
+# before the single-role prompt it extends.
+_PROMPT_KINDS: tuple[tuple[str, str], ...] = (
+    ("**Several Roles at Once:**", "role_refine_batch"),
+    (prompts.ROLE_REFINE_SYSTEM_PROMPT[:80], "role_refine"),
+    (prompts.JOB_ANALYSIS_SYSTEM_PROMPT[:80], "job_analysis"),
+    (prompts.BANNER_GENERATION_SYSTEM_PROMPT[:80], "banner_generation"),
+    (prompts.INTRO_ANALYZE_JOB_SYSTEM_PROMPT[:80], "intro_analyze_job"),
+    (prompts.INTRO_ANALYZE_RESUME_SYSTEM_PROMPT[:80], "intro_analyze_resume"),
+    (prompts.INTRO_SYNTHESIZE_INTRODUCTION_SYSTEM_PROMPT[:80], "intro_synthesize"),
+    (prompts.RESUME_REFINE_SYSTEM_PROMPT[:80], "resume_refine"),
+)
+
+
+def message_text(message: dict[str, Any]) -> str:
+    """Return the text of a chat message.
+
+    Args:
+        message (dict[str, Any]): An OpenAI chat message.
+
+    Returns:
+        str: The content, with the text parts of a multi-part content joined.
+
+    """
+    content = message.get("content") or ""
+    if isinstance(content, str):
+        return content
+    return "".join(part.get("text", "") for part in content if isinstance(part, dict))
+
+
+def classify_prompt(messages: list[dict[str, Any]]) -> str:
+    """Recognize which of the application's prompts a request carries.
+
+    Args:
+        messages (list[dict[str, Any]]): The request's chat messages.
+
+    Returns:
+        str: The prompt kind, or "unknown".
+
+    """
+    text = "\n".join(message_text(message) for message in messages)
+    for marker, kind in _PROMPT_KINDS:
+        if marker in text:
+            return kind
+    return "unknown"
+
+
+def _section(text: str, heading: str) -> str | None:
+    """Return the text between the ``---`` lines following a prompt heading.
+
+    Args:
+        text (str): The prompt text.
+        heading (str): The heading preceding the section.
+
+    Returns:
+        str | None: The section, or None if the heading is missing.
+
+    """
+    at = text.find(heading)
+    if at < 0:
+        return None
+    start = text.find("---\n", at)
+    end = text.find("\n---", start + 4)
+    if start < 0 or end < 0:
+        return None
+    return text[start + 4 : end]
+
+
+def _loads(text: str | None) -> Any:
+    """Parse JSON, returning None if it is missing or invalid.
+
+    Args:
+        text (str | None): The JSON text.
+
+    Returns:
+        Any: The parsed value, or None.
+
+    """
+    try:
+        return json.loads(text) if text else None
+    except json.JSONDecodeError:
+        return None
+
+
+def _refined_role(role: Any, rng: random.Random) -> RefinedRole:
+    """Build a refinement of a role that keeps its basics and skills.
+
+    Args:
+        role (Any): The role from the prompt, or None if it could not be read.
+        rng (random.Random): The request's random number generator.
+
+    Returns:
+        RefinedRole: The refined role.
+
+    """
+    role = role if isinstance(role, dict) else {}
+    basics = role.get("basics") if isinstance(role.get("basics"), dict) else None
+    basics = basics or _FALLBACK_BASICS
+    skills = role.get("skills") if isinstance(role.get("skills"), dict) else None
+    focus = ", ".join(rng.sample(_THEMES, 2))
+    summary = (
+        f"As {basics.get('title')} at {basics.get('company')}, delivered work "
+        f"emphasizing {focus}, keeping every fact from the original role and "
+        "ordering it by relevance to the target job."
+    )
+    return RefinedRole.model_validate(
+        {
+            "basics": basics,
+            "summary": {"text": summary},
+            "responsibilities": {"text": f"* {rng.choice(_DUTIES)}."},
+            "skills": skills or {"skills": []},
+        },
+    )
+
+
+def _job_analysis(rng: random.Random) -> JobAnalysis:
+    """Build a job analysis from the fixed vocabulary.
+
+    Args:
+        rng (random.Random): The request's random number generator.
+
+    Returns:
+        JobAnalysis: The job analysis.
+
+    """
+    return JobAnalysis(
+        key_skills=rng.sample(_SKILLS, 5),
+        primary_duties=rng.sample(_DUTIES, 3),
+        themes=rng.sample(_THEMES, 2),
+        job_title="Senior Software Engineer",
+        company_name="Example Corp",
+    )
+
+
+def _banner(rng: random.Random) -> GeneratedBanner:
+    """Build a banner of three bullets from the fixed vocabulary.
+
+    Args:
+        rng (random.Random): The request's random number generator.
+
+    Returns:
+        GeneratedBanner: The banner.
+
+    """
+    return GeneratedBanner(
+        bullets=[
+            BannerBullet(
+                category=theme.title(),
+                description=f"Experience with {', '.join(rng.sample(_SKILLS, 3))}",
+            )
+            for theme in rng.sample(_THEMES, 3)
+        ],
+    )
+
+
+def _candidate_analysis(rng: random.Random) -> CandidateAnalysis:
+    """Build a candidate analysis with one piece of evidence per skill.
+
+    Args:
+        rng (random.Random): The request's random number generator.
+
+    Returns:
+        CandidateAnalysis: The candidate analysis.
+
+    """
+    return CandidateAnalysis(
+        analysis=[
+            CandidateRequirementAnalysis(
+                job_requirement=skill,
+                evidence=[
+                    FactualEvidence(
+                        evidence=f"Used {skill} in production",
+                        source_section="Work Experience",
+                        relevance="direct",
+                    ),
+                ],
+            )
+            for skill in rng.sample(_SKILLS, 3)
+        ],
+    )
+
+
+def build_response_model(
+    kind: str,
+    messages: list[dict[str, Any]],
+    rng: random.Random,
+) -> BaseModel | None:
+    """Build the model a prompt asks for.
+
+    Args:
+        kind (str): The prompt kind from `classify_prompt`.
+        messages (list[dict[str, Any]]): The request's chat messages.
+        rng (random.Random): The request's random number generator.
+
+    Returns:
+        BaseModel | None: The response model, or None for an unknown prompt.
+
+    Notes:
+        1. Refined roles echo the basics and skills of the roles in the last
+           message, so batched responses match their roles by company and title.
+
+    """
+    text = message_text(messages[-1]) if messages else ""
+    if kind == "role_refine":
+        return _refined_role(_loads(_section(text, "Role to Refine:")), rng)
+    if kind == "role_refine_batch":
+        roles = _loads(_section(text, "Roles to Refine"))
+        roles = roles if isinstance(roles, list) else [None]
+        return RefinedRoleBatch(roles=[_refined_role(role, rng) for role in roles])
+    builders = {
+        "job_analysis": _job_analysis,
+        "banner_generation": _banner,
+        "intro_analyze_resume": _candidate_analysis,
+        "intro_analyze_job": lambda r: JobKeyRequirements(
+            key_skills=r.sample(_SKILLS, 4),
+            candidate_priorities=r.sample(_DUTIES, 2),
+        ),
+        "intro_synthesize": lambda r: GeneratedIntroduction(
+            strengths=[f"Delivers {theme}" for theme in r.sample(_THEMES, 3)],
+        ),
+        "resume_refine": lambda r: RefinedSection(
+            refined_markdown=f"# Experience\n\n* {r.choice(_DUTIES)}.\n",
+        ),
+    }
+    builder = builders.get(kind)
+    return builder(rng) if builder else None
+
+
+def render_content(model: BaseModel | None, malformed: bool) -> str:
+    """Render a response model the way the application's prompts ask for it.
+
+    Args:
+        model (BaseModel | None): The response model; None renders an empty object.
+        malformed (bool): Whether to cut the JSON off halfway.
+
+    Returns:
+        str: The JSON in a ```json fence, or an unterminated half of it.
+
+    """
+    body = model.model_dump_json(exclude_none=True) if model else "{}"
+    if malformed:
+        return f"```json\n{body[: max(len(body) // 2, 1)]}"
+    return f"```json\n{body}\n```"
+
+
+def sample_latency(profile: FakeLLMProfile, rng: random.Random) -> float:
+    """Draw a response latency from the profile's distribution.
+
+    Args:
+        profile (FakeLLMProfile): The server profile.
+        rng (random.Random): The request's random number generator.
+
+    Returns:
+        float: The latency in seconds, never negative.
+
+    """
+    median = profile.latency_ms
+    if profile.latency_distribution == "uniform":
+        jitter = profile.latency_jitter_ms
+        latency_ms = median + rng.uniform(-jitter, jitter)
+    elif profile.latency_distribution == "lognormal":
+        latency_ms = median * math.exp(rng.gauss(0.0, profile.latency_sigma))
+    else:
+        latency_ms = median
+    return max(latency_ms, 0.0) / 1000
+
+
+def choose_fault(profile: FakeLLMProfile, rng: random.Random) -> Fault | None:
+    """Decide whether a request fails, and how.
+
+    Args:
+        profile (FakeLLMProfile): The server profile.
+        rng (random.Random): The request's random number generator.
+
+    Returns:
+        Fault | None: The injected fault, or None for a good response.
+
+    """
+    draw = rng.random()
+    for fault, rate in (
+        ("rate_limit", profile.rate_limit_rate),
+        ("error", profile.error_rate),
+        ("malformed", profile.malformed_rate),
+    ):
+        if draw < rate:
+            return fault
+        draw -= rate
+    return None
+
+
+def _error_response(status: int, message: str, headers: dict[str, str]) -> JSONResponse:
+    """Build an error in the OpenAI API's format.
+
+    Args:
+        status (int): The HTTP status.
+        message (str): The error message.
+        headers (dict[str, str]): Extra response headers.
+
+    Returns:
+        JSONResponse: The error response.
+
+    """
+    error_type = "rate_limit_error" if status == 429 else "server_error"
+    return JSONResponse(
+        {"error": {"message": message, "type": error_type, "code": None}},
+        status_code=status,
+        headers=headers,
+    )
+
+
+class FakeLLMServer:
+    """State of a stand-in server: its profile, counters and request attempts.
+
+    Attributes:
+        profile (FakeLLMProfile): How the server behaves.
+        stats (FakeLLMStats): Counters of the requests answered.
+
+    Notes:
+        1. Each request's random number generator is seeded from the profile's
+           seed, the request's messages and how often they were sent before, so
+           a run is reproducible however requests interleave, and a retried
+           request gets a fresh draw.
+
+    """
+
+    def __init__(self, profile: FakeLLMProfile) -> None:
+        """Initialize the server state.
+
+        Args:
+            profile (FakeLLMProfile): How the server behaves.
+
+        """
+        self.profile = profile
+        self.stats = FakeLLMStats()
+        self._attempts: Counter[str] = Counter()
+
+    def request_rng(self, messages: list[dict[str, Any]]) -> tuple[str, random.Random]:
+        """Derive a request's id and random number generator.
+
+        Args:
+            messages (list[dict[str, Any]]): The request's chat messages.
+
+        Returns:
+            tuple[str, random.Random]: The completion id and the generator.
+
+        """
+        digest = hashlib.sha256(
+            json.dumps(messages, sort_keys=True).encode(),
+        ).hexdigest()[:16]
+        attempt = self._attempts[digest]
+        self._attempts[digest] += 1
+        seed = f"{self.profile.seed}:{digest}:{attempt}"
+        return f"chatcmpl-{digest}-{attempt}", random.Random(seed)
+
+    def count(self, kind: str, fault: Fault | None, stream: bool) -> None:
+        """Count a request.
+
+        Args:
+            kind (str): The prompt kind.
+            fault (Fault | None): The injected fault, if any.
+            stream (bool): Whether the response is streamed.
+
+        """
+        self.stats.requests += 1
+        self.stats.streamed += int(stream)
+        self.stats.by_kind[kind] = self.stats.by_kind.get(kind, 0) + 1
+        if fault == "rate_limit":
+            self.stats.rate_limited += 1
+        elif fault == "error":
+            self.stats.errors += 1
+        elif fault == "malformed":
+            self.stats.malformed += 1
+
+
+def _usage(messages: list[dict[str, Any]], content: str) -> dict[str, int]:
+    """Estimate token usage the way the application's rate limiter does.
+
+    Args:
+        messages (list[dict[str, Any]]): The request's chat messages.
+        content (str): The response content.
+
+    Returns:
+        dict[str, int]: The OpenAI usage object.
+
+    """
+    prompt_tokens = sum(len(message_text(m)) for m in messages) // CHARS_PER_TOKEN
+    completion_tokens = len(content) // CHARS_PER_TOKEN
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+    }
+
+
+def completion_body(
+    completion_id: str,
+    model: str,
+    content: str,
+    usage: dict[str, int],
+) -> dict[str, Any]:
+    """Build a non-streamed chat completion.
+
+    Args:
+        completion_id (str): The completion id.
+        model (str): The requested model name.
+        content (str): The response content.
+        usage (dict[str, int]): The token usage.
+
+    Returns:
+        dict[str, Any]: The chat.completion object.
+
+    """
+    return {
+        "id": completion_id,
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            },
+        ],
+        "usage": usage,
+    }
+
+
+def _chunk(completion_id: str, model: str, delta: dict, finish: str | None) -> str:
+    """Format one chat.completion.chunk server-sent event.
+
+    Args:
+        completion_id (str): The completion id.
+        model (str): The requested model name.
+        delta (dict): The choice's delta.
+        finish (str | None): The finish reason of the last chunk.
+
+    Returns:
+        str: The ``data:`` line and its blank line.
+
+    """
+    payload = {
+        "id": completion_id,
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish}],
+    }
+    return f"data: {json.dumps(payload)}\n\n"
+
+
+async def stream_chunks(
+    completion_id: str,
+    model: str,
+    content: str,
+    usage: dict[str, int] | None,
+    profile: FakeLLMProfile,
+) -> AsyncIterator[str]:
+    """Stream a completion as chat.completion.chunk events.
+
+    Args:
+        completion_id (str): The completion id.
+        model (str): The requested model name.
+        content (str): The response content.
+        usage (dict[str, int] | None): The token usage, sent in a final chunk
+            when the client asked for it with ``stream_options.include_usage``.
+        profile (FakeLLMProfile): The server profile.
+
+    Yields:
+        str: The server-sent events, ending with ``data: [DONE]``.
+
+    """
+    yield _chunk(completion_id, model, {"role": "assistant", "content": ""}, None)
+    size = profile.stream_chunk_chars
+    for start in range(0, len(content), size):
+        await asyncio.sleep(profile.stream_chunk_delay_ms / 1000)
+        piece = content[start : start + size]
+        yield _chunk(completion_id, model, {"content": piece}, None)
+    yield _chunk(completion_id, model, {}, "stop")
+    if usage is not None:
+        payload = {
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [],
+            "usage": usage,
+        }
+        yield f"data: {json.dumps(payload)}\n\n"
+    yield "data: [DONE]\n\n"
+
+
+async def _complete(server: FakeLLMServer, body: dict[str, Any]) -> Any:
+    """Answer one chat-completions request.
+
+    Args:
+        server (FakeLLMServer): The server state.
+        body (dict[str, Any]): The request body.
+
+    Returns:
+        Any: A JSON, error or streaming response.
+
+    """
+    profile = server.profile
+    messages = body.get("messages") or []
+    model = body.get("model") or DEFAULT_MODEL
+    stream = bool(body.get("stream"))
+    completion_id, rng = server.request_rng(messages)
+    kind = classify_prompt(messages)
+    fault = choose_fault(profile, rng)
+    server.count(kind, fault, stream)
+
+    await asyncio.sleep(sample_latency(profile, rng))
+    if fault == "rate_limit":
+        headers = {"retry-after": f"{profile.retry_after_seconds:g}"}
+        return _error_response(429, "Rate limit reached (injected)", headers)
+    if fault == "error":
+        return _error_response(500, "Internal server error (injected)", {})
+
+    content = render_content(
+        build_response_model(kind, messages, rng),
+        malformed=fault == "malformed",
+    )
+    usage = _usage(messages, content)
+    if not stream:
+        return JSONResponse(completion_body(completion_id, model, content, usage))
+    include_usage = bool((body.get("stream_options") or {}).get("include_usage"))
+    return StreamingResponse(
+        stream_chunks(
+            completion_id,
+            model,
+            content,
+            usage if include_usage else None,
+            profile,
+        ),
+        media_type="text/event-stream",
+    )
+
+
+def create_app(profile: FakeLLMProfile | None = None) -> FastAPI:
+    """Create the stand-in server's application.
+
+    Args:
+        profile (FakeLLMProfile | None): How the server behaves; the defaults if None.
+
+    Returns:
+        FastAPI: The application, with the server state on ``app.state.fake_llm``.
+
+    Notes:
+        1. Serves ``POST /v1/chat/completions`` and ``GET /v1/models`` like the
+           OpenAI API, and the counters at ``GET /stats``.
+
+    """
+    server = FakeLLMServer(profile or FakeLLMProfile())
+    app = FastAPI(title="Fake LLM")
+    app.state.fake_llm = server
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request) -> Any:
+        return await _complete(server, await request.json())
+
+    @app.get("/v1/models")
+    async def models() -> dict[str, Any]:
+        return {
+            "object": "list",
+            "data": [{"id": DEFAULT_MODEL, "object": "model", "owned_by": "local"}],
+        }
+
+    @app.get("/stats")
+    async def stats() -> dict[str, Any]:
+        return asdict(server.stats)
+
+    return app
+
+
+@click.command()
+@click.option("--host", default="127.0.0.1", show_default=True)
+@click.option("--port", default=8001, show_default=True)
+@click.option("--latency-ms", default=DEFAULT_LATENCY_MS, show_default=True)
+@click.option("--latency-jitter-ms", default=0.0, show_default=True)
+@click.option("--latency-sigma", default=0.5, show_default=True)
+@click.option(
+    "--latency-distribution",
+    type=click.Choice(["fixed", "uniform", "lognormal"]),
+    default="lognormal",
+    show_default=True,
+)
+@click.option("--rate-limit-rate", default=0.0, show_default=True)
+@click.option("--error-rate", default=0.0, show_default=True)
+@click.option("--malformed-rate", default=0.0, show_default=True)
+@click.option("--retry-after-seconds", default=1.0, show_default=True)
+@click.option("--stream-chunk-chars", default=16, show_default=True)
+@click.option("--stream-chunk-delay-ms", default=5.0, show_default=True)
+@click.option("--seed", default=0, show_default=True)
+def main(host: str, port: int, **profile_options: Any) -> None:
+    """Run the stand-in LLM server until interrupted.
+
+    Args:
+        host (str): The interface to listen on.
+        port (int): The port to listen on.
+        **profile_options (Any): The FakeLLMProfile fields.
+
+    Notes:
+        1. Runs a single worker, so the attempt counts and stats cover every request.
+
+    """
+    try:
+        profile = FakeLLMProfile(**profile_options)
+    except ValueError as e:
+        raise click.BadParameter(str(e)) from e
+    _msg = f"Fake LLM server on http://{host}:{port}/v1 with {profile}"
+    log.info(_msg)
+    uvicorn.run(create_app(profile), host=host, port=port)
+
+
+if __name__ == "__main__":
+    main()
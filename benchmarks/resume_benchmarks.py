@@ -0,0 +1,489 @@
+"""Timing and allocation benchmarks for resume parse, filter and serialize paths.
+
+Usage:
+    python -m benchmarks.resume_benchmarks --scales 1,4,16 --output bench.json
+    python -m benchmarks.resume_benchmarks --baseline bench.json
+"""
+
+import json
+import logging
+import math
+import platform
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, replace
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+import click
+
+from benchmarks.resume_generator import SyntheticResumeSpec, generate_resume_markdown
+from resume_editor.app.api.routes.route_logic.resume_filtering import (
+    filter_experience_by_date,
+)
+from resume_editor.app.api.routes.route_logic.resume_parse_cache import (
+    resume_parse_cache,
+)
+from resume_editor.app.api.routes.route_logic.resume_reconstruction import (
+    build_complete_resume_from_sections,
+)
+from resume_editor.app.api.routes.route_logic.resume_section_extraction import (
+    extract_all_sections,
+    extract_experience_info,
+)
+from resume_editor.app.api.routes.route_logic.resume_section_index import (
+    get_section_index,
+)
+from resume_editor.app.api.routes.route_logic.resume_serialization import (
+    serialize_experience_to_markdown,
+)
+
+log = logging.getLogger(__name__)
+
+PERCENTILES = (50, 90, 99)
+DEFAULT_SCALES = (1, 4, 16)
+DEFAULT_ITERATIONS = 20
+DEFAULT_REGRESSION_THRESHOLD = 1.25
+# A log-log slope above this between the smallest and largest scale is
+# reported as superlinear; linear work sits near 1.0 and quadratic near 2.0.
+SUPERLINEAR_EXPONENT = 1.5
+
+
+@dataclass(frozen=True)
+class BenchmarkOperation:
+    """A benchmarked function and how to build its inputs.
+
+    Attributes:
+        name (str): Stable identifier used in reports and baseline comparison.
+        prepare (Callable[[str], tuple]): Builds the call arguments from resume content; run once per size, untimed.
+        func (Callable[..., Any]): The function being measured.
+        reset (Callable[[], None] | None): Called before every iteration, untimed, to defeat caches.
+
+    """
+
+    name: str
+    prepare: Callable[[str], tuple]
+    func: Callable[..., Any]
+    reset: Callable[[], None] | None = None
+
+
+def clear_parse_caches() -> None:
+    """Drop the shared parse cache and section index so each parse is cold."""
+    resume_parse_cache.clear()
+    get_section_index.cache_clear()
+
+
+def _filter_window(content: str) -> tuple:
+    """Build filter arguments that keep roughly the newest half of the roles.
+
+    Args:
+        content (str): The resume Markdown content.
+
+    Returns:
+        tuple: The experience, start date and end date arguments.
+
+    """
+    experience = extract_experience_info(content)
+    newest_year = max(
+        (role.basics.start_date.year for role in experience.roles if role.basics),
+        default=date.today().year,
+    )
+    start = date(newest_year - max(len(experience.roles) // 2, 1), 1, 1)
+    return experience, start, date(newest_year, 12, 31)
+
+
+def _sections_arguments(content: str) -> tuple:
+    """Build the arguments for rebuilding a resume from all of its sections.
+
+    Args:
+        content (str): The resume Markdown content.
+
+    Returns:
+        tuple: The personal, education, certifications and experience sections.
+
+    """
+    sections = extract_all_sections(content)
+    return (
+        sections.personal,
+        sections.education,
+        sections.certifications,
+        sections.experience,
+    )
+
+
+OPERATIONS: tuple[BenchmarkOperation, ...] = (
+    BenchmarkOperation(
+        name="extract_experience_info",
+        prepare=lambda content: (content,),
+        func=extract_experience_info,
+        reset=clear_parse_caches,
+    ),
+    BenchmarkOperation(
+        name="serialize_experience_to_markdown",
+        prepare=lambda content: (extract_experience_info(content),),
+        func=serialize_experience_to_markdown,
+    ),
+    BenchmarkOperation(
+        name="filter_experience_by_date",
+        prepare=_filter_window,
+        func=filter_experience_by_date,
+    ),
+    BenchmarkOperation(
+        name="build_complete_resume_from_sections",
+        prepare=_sections_arguments,
+        func=build_complete_resume_from_sections,
+    ),
+)
+
+
+def percentile_summary(samples: list[float]) -> dict[str, float]:
+    """Summarize samples with nearest-rank percentiles.
+
+    Args:
+        samples (list[float]): The measured values; must not be empty.
+
+    Returns:
+        dict[str, float]: The min, max, mean and each of `PERCENTILES`, keyed as "p50" etc.
+
+    """
+    ordered = sorted(samples)
+    summary = {
+        "min": ordered[0],
+        "max": ordered[-1],
+        "mean": sum(ordered) / len(ordered),
+    }
+    for percentile in PERCENTILES:
+        rank = max(math.ceil(percentile / 100 * len(ordered)), 1)
+        summary[f"p{percentile}"] = ordered[rank - 1]
+    return summary
+
+
+def _time_once(operation: BenchmarkOperation, args: tuple) -> float:
+    """Run an operation once and return its wall time in milliseconds.
+
+    Args:
+        operation (BenchmarkOperation): The operation to run.
+        args (tuple): The prepared call arguments.
+
+    Returns:
+        float: Elapsed milliseconds, excluding the reset hook.
+
+    """
+    if operation.reset is not None:
+        operation.reset()
+    started = time.perf_counter_ns()
+    operation.func(*args)
+    return (time.perf_counter_ns() - started) / 1_000_000
+
+
+def _peak_allocation_once(operation: BenchmarkOperation, args: tuple) -> float:
+    """Run an operation once under tracemalloc and return its peak allocation.
+
+    Args:
+        operation (BenchmarkOperation): The operation to run.
+        args (tuple): The prepared call arguments.
+
+    Returns:
+        float: Peak memory allocated above the starting point, in KiB.
+
+    Notes:
+        1. Must be called while tracemalloc is tracing.
+
+    """
+    if operation.reset is not None:
+        operation.reset()
+    baseline, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    operation.func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    return max(peak - baseline, 0) / 1024
+
+
+def measure_operation(
+    operation: BenchmarkOperation,
+    content: str,
+    iterations: int,
+) -> dict[str, dict[str, float]]:
+    """Measure timing and allocation percentiles for one operation on one resume.
+
+    Args:
+        operation (BenchmarkOperation): The operation to measure.
+        content (str): The resume Markdown content.
+        iterations (int): Number of measured runs for each of timing and allocation.
+
+    Returns:
+        dict[str, dict[str, float]]: "timing_ms" and "alloc_kib" percentile summaries.
+
+    Notes:
+        1. Prepares the arguments once and runs one untimed warm-up call.
+        2. Times every iteration with tracemalloc off, so tracing overhead does not skew timing.
+        3. Measures peak allocation in a separate pass with tracemalloc on.
+
+    """
+    args = operation.prepare(content)
+    operation.func(*args)
+
+    timings = [_time_once(operation, args) for _ in range(iterations)]
+
+    tracemalloc.start()
+    try:
+        allocations = [
+            _peak_allocation_once(operation, args) for _ in range(iterations)
+        ]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "timing_ms": percentile_summary(timings),
+        "alloc_kib": percentile_summary(allocations),
+    }
+
+
+def scaling_exponent(
+    small: tuple[int, float],
+    large: tuple[int, float],
+) -> float | None:
+    """Estimate the growth order between two (scale, p50) measurements.
+
+    Args:
+        small (tuple[int, float]): The smaller scale and its median time.
+        large (tuple[int, float]): The larger scale and its median time.
+
+    Returns:
+        float | None: The log-log slope, or None if it cannot be computed.
+
+    """
+    (small_scale, small_time), (large_scale, large_time) = small, large
+    if large_scale <= small_scale or small_time <= 0 or large_time <= 0:
+        return None
+    return math.log(large_time / small_time) / math.log(large_scale / small_scale)
+
+
+def _scaling_report(results: list[dict]) -> dict[str, dict]:
+    """Compute the scaling exponent of each operation across the measured scales.
+
+    Args:
+        results (list[dict]): The per-operation, per-scale results.
+
+    Returns:
+        dict[str, dict]: For each operation, its exponent and whether it is superlinear.
+
+    """
+    by_operation: dict[str, list[tuple[int, float]]] = {}
+    for result in results:
+        by_operation.setdefault(result["operation"], []).append(
+            (result["scale"], result["timing_ms"]["p50"]),
+        )
+
+    report = {}
+    for name, points in by_operation.items():
+        points.sort()
+        exponent = scaling_exponent(points[0], points[-1])
+        report[name] = {
+            "exponent": exponent,
+            "superlinear": exponent is not None and exponent > SUPERLINEAR_EXPONENT,
+        }
+    return report
+
+
+def run_benchmarks(
+    base_spec: SyntheticResumeSpec,
+    scales: tuple[int, ...] = DEFAULT_SCALES,
+    iterations: int = DEFAULT_ITERATIONS,
+    operations: tuple[BenchmarkOperation, ...] = OPERATIONS,
+) -> dict[str, Any]:
+    """Run every operation against generated resumes of increasing size.
+
+    Args:
+        base_spec (SyntheticResumeSpec): The resume shape at scale 1.
+        scales (tuple[int, ...]): Multipliers applied to the roles, projects and certifications of `base_spec`.
+        iterations (int): Number of measured runs per operation and scale.
+        operations (tuple[BenchmarkOperation, ...]): The operations to measure.
+
+    Returns:
+        dict[str, Any]: A JSON-serializable report with "meta", "results" and "scaling".
+
+    Notes:
+        1. Bullet density stays fixed across scales so growth reflects entry counts.
+        2. Each result records the generated spec and content size next to its measurements.
+
+    """
+    results = []
+    for scale in scales:
+        spec = replace(
+            base_spec,
+            roles=base_spec.roles * scale,
+            projects=base_spec.projects * scale,
+            certifications=base_spec.certifications * scale,
+        )
+        content = generate_resume_markdown(spec)
+        for operation in operations:
+            _msg = f"Benchmarking {operation.name} at scale {scale}"
+            log.info(_msg)
+            measured = measure_operation(operation, content, iterations)
+            results.append(
+                {
+                    "operation": operation.name,
+                    "scale": scale,
+                    "spec": asdict(spec),
+                    "content_bytes": len(content.encode("utf-8")),
+                    **measured,
+                },
+            )
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "iterations": iterations,
+            "scales": list(scales),
+        },
+        "results": results,
+        "scaling": _scaling_report(results),
+    }
+
+
+def compare_to_baseline(
+    report: dict[str, Any],
+    baseline: dict[str, Any],
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+) -> list[dict[str, Any]]:
+    """Compare a report's median timings against a baseline report.
+
+    Args:
+        report (dict[str, Any]): The current benchmark report.
+        baseline (dict[str, Any]): A previously saved benchmark report.
+        threshold (float): The current/baseline p50 ratio above which a result regresses.
+
+    Returns:
+        list[dict[str, Any]]: One entry per (operation, scale) present in both reports,
+            with both medians, their ratio and a "regressed" flag.
+
+    """
+    baseline_p50 = {
+        (result["operation"], result["scale"]): result["timing_ms"]["p50"]
+        for result in baseline.get("results", [])
+    }
+
+    comparisons = []
+    for result in report["results"]:
+        key = (result["operation"], result["scale"])
+        if key not in baseline_p50:
+            continue
+        previous = baseline_p50[key]
+        current = result["timing_ms"]["p50"]
+        ratio = current / previous if previous > 0 else math.inf
+        comparisons.append(
+            {
+                "operation": key[0],
+                "scale": key[1],
+                "baseline_p50_ms": previous,
+                "current_p50_ms": current,
+                "ratio": ratio,
+                "regressed": ratio > threshold,
+            },
+        )
+    return comparisons
+
+
+def _parse_scales(value: str) -> tuple[int, ...]:
+    """Parse a comma separated list of positive integer scales.
+
+    Args:
+        value (str): The option value, e.g. "1,4,16".
+
+    Returns:
+        tuple[int, ...]: The scales in ascending order.
+
+    Raises:
+        click.BadParameter: If any scale is not a positive integer.
+
+    """
+    try:
+        scales = tuple(sorted({int(part) for part in value.split(",") if part.strip()}))
+    except ValueError as e:
+        raise click.BadParameter("scales must be comma separated integers") from e
+    if not scales or scales[0] < 1:
+        raise click.BadParameter("scales must be positive integers")
+    return scales
+
+
+@click.command()
+@click.option("--roles", default=5, show_default=True, help="Roles at scale 1.")
+@click.option("--projects", default=2, show_default=True, help="Projects at scale 1.")
+@click.option(
+    "--certifications",
+    default=2,
+    show_default=True,
+    help="Certifications at scale 1.",
+)
+@click.option("--bullets", default=5, show_default=True, help="Bullets per role.")
+@click.option("--scales", default="1,4,16", show_default=True, help="Size multipliers.")
+@click.option("--iterations", default=DEFAULT_ITERATIONS, show_default=True)
+@click.option("--output", type=click.Path(dir_okay=False), help="Write the report here.")
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Compare against a saved report and exit 1 on regression.",
+)
+@click.option("--threshold", default=DEFAULT_REGRESSION_THRESHOLD, show_default=True)
+def main(  # noqa: PLR0913
+    roles: int,
+    projects: int,
+    certifications: int,
+    bullets: int,
+    scales: str,
+    iterations: int,
+    output: str | None,
+    baseline: str | None,
+    threshold: float,
+) -> None:
+    """Run the resume benchmarks and print the JSON report.
+
+    Args:
+        roles (int): Roles at scale 1.
+        projects (int): Projects at scale 1.
+        certifications (int): Certifications at scale 1.
+        bullets (int): Responsibility bullets per role.
+        scales (str): Comma separated size multipliers.
+        iterations (int): Measured runs per operation and scale.
+        output (str | None): Optional path to write the report to.
+        baseline (str | None): Optional path of a report to compare against.
+        threshold (float): The p50 ratio above which a comparison is a regression.
+
+    Notes:
+        1. The report is always printed to stdout as JSON.
+        2. With --baseline, a "comparison" list is added and the exit code is 1 if any result regressed.
+
+    """
+    base_spec = SyntheticResumeSpec(
+        roles=roles,
+        projects=projects,
+        certifications=certifications,
+        bullets_per_role=bullets,
+    )
+    report = run_benchmarks(base_spec, _parse_scales(scales), iterations)
+
+    regressed = False
+    if baseline:
+        comparison = compare_to_baseline(
+            report,
+            json.loads(Path(baseline).read_text()),
+            threshold,
+        )
+        report["comparison"] = comparison
+        regressed = any(entry["regressed"] for entry in comparison)
+
+    rendered = json.dumps(report, indent=2)
+    if output:
+        Path(output).write_text(rendered + "\n")
+    click.echo(rendered)
+    if regressed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+"""Synthetic generator for valid resume Markdown of configurable size."""
+
+import logging
+import random
+from dataclasses import dataclass
+
+log = logging.getLogger(__name__)
+
+_NEWEST_YEAR = 2024
+_SKILLS = (
+    "Python",
+    "SQL",
+    "FastAPI",
+    "PostgreSQL",
+    "Docker",
+    "Kubernetes",
+    "AWS",
+    "Terraform",
+    "React",
+    "Go",
+)
+_VERBS = ("Built", "Led", "Designed", "Migrated", "Automated", "Improved", "Shipped")
+_OBJECTS = (
+    "the billing pipeline",
+    "an internal reporting service",
+    "the customer onboarding flow",
+    "a distributed job scheduler",
+    "the search indexing workers",
+    "a data warehouse integration",
+)
+
+
+@dataclass(frozen=True)
+class SyntheticResumeSpec:
+    """Shape of a generated resume.
+
+    Attributes:
+        roles (int): Number of `### Role` entries under `## Roles`.
+        projects (int): Number of `### Project` entries under `## Projects`.
+        certifications (int): Number of `## Certification` entries.
+        bullets_per_role (int): Number of responsibility bullets per role and
+            description sentences per project.
+        seed (int): Seed for the random number generator, so output is reproducible.
+
+    """
+
+    roles: int = 5
+    projects: int = 2
+    certifications: int = 2
+    bullets_per_role: int = 5
+    seed: int = 0
+
+
+def _month_year(months_ago: int) -> str:
+    """Format a date a number of months before December of the newest year.
+
+    Args:
+        months_ago (int): Number of months to step back.
+
+    Returns:
+        str: The date formatted as MM/YYYY.
+
+    """
+    total = _NEWEST_YEAR * 12 + 11 - months_ago
+    return f"{total % 12 + 1:02d}/{total // 12}"
+
+
+def _bullet(rng: random.Random) -> str:
+    """Build one responsibility sentence.
+
+    Args:
+        rng (random.Random): The random number generator.
+
+    Returns:
+        str: A short sentence describing an accomplishment.
+
+    """
+    percent = rng.randint(5, 80)
+    return f"{rng.choice(_VERBS)} {rng.choice(_OBJECTS)}, cutting costs by {percent}%."
+
+
+def _skills(rng: random.Random) -> list[str]:
+    """Build a bulleted skills list.
+
+    Args:
+        rng (random.Random): The random number generator.
+
+    Returns:
+        list[str]: Skill lines, each starting with "* ".
+
+    """
+    return [f"* {skill}" for skill in rng.sample(_SKILLS, 3)]
+
+
+def _personal_lines() -> list[str]:
+    """Build the personal section.
+
+    Returns:
+        list[str]: The Markdown lines of the personal section.
+
+    """
+    return [
+        "# Personal",
+        "",
+        "## Contact Information",
+        "",
+        "Name: Synthetic Candidate",
+        "Email: candidate@example.com",
+        "Phone: 555-0100",
+        "Location: Austin, TX",
+        "",
+        "## Banner",
+        "",
+        "Engineer with a long history of synthetic accomplishments.",
+        "",
+    ]
+
+
+def _education_lines() -> list[str]:
+    """Build the education section.
+
+    Returns:
+        list[str]: The Markdown lines of the education section.
+
+    """
+    return [
+        "# Education",
+        "",
+        "## Degrees",
+        "",
+        "### Degree",
+        "",
+        "School: State University",
+        "Degree: Bachelor of Science",
+        "Major: Computer Science",
+        "Start date: 09/2000",
+        "End date: 05/2004",
+        "",
+    ]
+
+
+def _certification_lines(count: int) -> list[str]:
+    """Build the certifications section.
+
+    Args:
+        count (int): Number of certifications to generate.
+
+    Returns:
+        list[str]: The Markdown lines of the certifications section.
+
+    """
+    lines = ["# Certifications", ""]
+    for index in range(count):
+        lines.extend(
+            [
+                "## Certification",
+                "",
+                f"Name: Certification {index + 1}",
+                "Issuer: Example Board",
+                f"Issued: {_month_year(index * 6)}",
+                f"Certification ID: CERT-{index + 1:05d}",
+                "",
+            ],
+        )
+    return lines
+
+
+def _role_lines(index: int, spec: SyntheticResumeSpec, rng: random.Random) -> list[str]:
+    """Build one role, newest first, each lasting a year.
+
+    Args:
+        index (int): Position of the role; 0 is the most recent.
+        spec (SyntheticResumeSpec): The resume shape.
+        rng (random.Random): The random number generator.
+
+    Returns:
+        list[str]: The Markdown lines of the role.
+
+    """
+    lines = [
+        "### Role",
+        "",
+        "#### Basics",
+        "",
+        f"Company: Company {index + 1}",
+        f"Title: Engineer {index + 1}",
+        f"Start date: {_month_year(index * 12 + 11)}",
+    ]
+    if index > 0:
+        lines.append(f"End date: {_month_year(index * 12)}")
+    lines.extend(["", "#### Summary", "", _bullet(rng), ""])
+    lines.extend(["#### Responsibilities", ""])
+    lines.extend(f"* {_bullet(rng)}" for _ in range(spec.bullets_per_role))
+    lines.extend(["", "#### Skills", "", *_skills(rng), ""])
+    return lines
+
+
+def _project_lines(
+    index: int,
+    spec: SyntheticResumeSpec,
+    rng: random.Random,
+) -> list[str]:
+    """Build one project.
+
+    Args:
+        index (int): Position of the project; 0 is the most recent.
+        spec (SyntheticResumeSpec): The resume shape.
+        rng (random.Random): The random number generator.
+
+    Returns:
+        list[str]: The Markdown lines of the project.
+
+    """
+    description = " ".join(_bullet(rng) for _ in range(max(spec.bullets_per_role, 1)))
+    return [
+        "### Project",
+        "",
+        "#### Overview",
+        "",
+        f"Title: Project {index + 1}",
+        f"Url: https://example.com/projects/{index + 1}",
+        f"Start date: {_month_year(index * 6 + 5)}",
+        f"End date: {_month_year(index * 6)}",
+        "",
+        "#### Description",
+        "",
+        description,
+        "",
+        "#### Skills",
+        "",
+        *_skills(rng),
+        "",
+    ]
+
+
+def generate_resume_markdown(spec: SyntheticResumeSpec) -> str:
+    """Generate a valid resume Markdown document with the requested shape.
+
+    Args:
+        spec (SyntheticResumeSpec): The number of roles, projects, certifications and bullets.
+
+    Returns:
+        str: Resume Markdown following the resume_writer specification.
+
+    Notes:
+        1. Output is deterministic for a given spec, including its seed.
+        2. Roles and projects are dated newest first with non-overlapping ranges.
+        3. The certifications section and the `## Roles` and `## Projects` subsections are omitted when their count is zero.
+        4. No network, disk, or database access is performed.
+
+    """
+    _msg = f"generate_resume_markdown starting: {spec}"
+    log.debug(_msg)
+    rng = random.Random(spec.seed)  # noqa: S311
+
+    lines = _personal_lines() + _education_lines()
+    if spec.certifications:
+        lines.extend(_certification_lines(spec.certifications))
+    lines.extend(["# Experience", ""])
+    if spec.roles:
+        lines.extend(["## Roles", ""])
+        for index in range(spec.roles):
+            lines.extend(_role_lines(index, spec, rng))
+    if spec.projects:
+        lines.extend(["## Projects", ""])
+        for index in range(spec.projects):
+            lines.extend(_project_lines(index, spec, rng))
+
+    return "\n".join(lines)
@@ -0,0 +1,731 @@
+"""End-to-end load benchmark of streamed resume refinements.
+
+Starts the app (and, unless an LLM endpoint is given, the stand-in LLM server),
+seeds users and resumes through the API, opens concurrent
+``/api/resumes/{id}/refine/stream`` sessions and reports session latencies,
+event throughput and each worker's event-loop lag and peak RSS as JSON.
+
+Usage:
+    python -m benchmarks.sse_load_benchmark --sessions 20 --workers 2 --output sse.json
+    python -m benchmarks.sse_load_benchmark --sessions 20 --workers 2 --baseline sse.json
+    python -m benchmarks.sse_load_benchmark --base-url http://127.0.0.1:8000 \\
+        --llm-endpoint http://127.0.0.1:8001/v1
+
+The started app uses the database configured in the environment, as the app
+itself would.
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from collections import Counter
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+import click
+import httpx
+
+from benchmarks.resume_benchmarks import percentile_summary
+from benchmarks.resume_generator import SyntheticResumeSpec, generate_resume_markdown
+
+log = logging.getLogger(__name__)
+
+DEFAULT_JOB_DESCRIPTION = (
+    "Senior Python engineer to build FastAPI services on AWS with PostgreSQL, "
+    "Docker and Kubernetes, own production reliability and mentor the team."
+)
+DEFAULT_REGRESSION_THRESHOLD = 1.25
+BENCHMARK_PASSWORD = "benchmark-password"
+READY_TIMEOUT_SECONDS = 60.0
+# Metrics compared against a baseline; for throughput a drop is the regression.
+LATENCY_METRICS = ("time_to_first_event_ms", "time_to_done_ms")
+THROUGHPUT_METRIC = "events_per_second"
+
+
+@dataclass(frozen=True)
+class LoadTestConfig:
+    """Shape of a load test run.
+
+    Attributes:
+        sessions (int): Concurrent refinement sessions to open.
+        users (int): Users to seed; sessions are spread over them round-robin.
+        roles (int): Roles in each seeded resume.
+        job_description (str): The job description every session refines for.
+        force_fresh (bool): Whether sessions skip cached job analyses and roles.
+        timeout_seconds (float): Longest a session may take.
+        runtime_poll_seconds (float): Interval between worker runtime samples.
+
+    """
+
+    sessions: int = 10
+    users: int = 5
+    roles: int = 5
+    job_description: str = DEFAULT_JOB_DESCRIPTION
+    force_fresh: bool = True
+    timeout_seconds: float = 300.0
+    runtime_poll_seconds: float = 0.5
+
+
+@dataclass(frozen=True)
+class BenchmarkUser:
+    """A seeded user and the resume their sessions refine.
+
+    Attributes:
+        username (str): The user's name.
+        token (str): The user's access token, sent as the access_token cookie.
+        resume_id (int): The id of the user's seeded resume.
+
+    """
+
+    username: str
+    token: str
+    resume_id: int
+
+
+@dataclass
+class SessionResult:
+    """Outcome and timings of one refinement session.
+
+    Attributes:
+        status_code (int | None): The stream's HTTP status, if it was opened.
+        events (Counter[str]): Events received, by name.
+        time_to_first_event_s (float | None): Seconds until the first event.
+        time_to_done_s (float | None): Seconds until the ``done`` event.
+        duration_s (float): Seconds until the stream ended.
+        error (str | None): Why the session failed, if it did.
+
+    """
+
+    status_code: int | None = None
+    events: Counter[str] = field(default_factory=Counter)
+    time_to_first_event_s: float | None = None
+    time_to_done_s: float | None = None
+    duration_s: float = 0.0
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """bool: Whether the session received its ``done`` event."""
+        return self.time_to_done_s is not None
+
+
+async def ensure_initial_admin(client: httpx.AsyncClient) -> None:
+    """Create the initial admin if the app has no users yet.
+
+    Args:
+        client (httpx.AsyncClient): A client of the app.
+
+    Notes:
+        1. Until a user exists, every API route redirects to the setup page.
+
+    """
+    await client.post(
+        "/setup",
+        data={
+            "username": "benchmark-admin",
+            "password": BENCHMARK_PASSWORD,
+            "confirm_password": BENCHMARK_PASSWORD,
+        },
+    )
+
+
+async def seed_user(
+    client: httpx.AsyncClient,
+    username: str,
+    llm_endpoint: str,
+    resume_content: str,
+) -> BenchmarkUser:
+    """Register a user, point their LLM endpoint at the target and add a resume.
+
+    Args:
+        client (httpx.AsyncClient): A client of the app.
+        username (str): The new user's name.
+        llm_endpoint (str): The LLM endpoint to store in the user's settings.
+        resume_content (str): The Markdown of the user's resume.
+
+    Returns:
+        BenchmarkUser: The seeded user.
+
+    Raises:
+        httpx.HTTPStatusError: If any of the API calls fails.
+
+    """
+    response = await client.post(
+        "/api/users/register",
+        json={
+            "username": username,
+            "email": f"{username}@example.com",
+            "password": BENCHMARK_PASSWORD,
+        },
+    )
+    response.raise_for_status()
+    response = await client.post(
+        "/api/users/login",
+        data={"username": username, "password": BENCHMARK_PASSWORD},
+    )
+    response.raise_for_status()
+    token = response.json()["access_token"]
+
+    response = await client.put(
+        "/api/users/settings",
+        json={"llm_endpoint": llm_endpoint},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    response.raise_for_status()
+    response = await client.post(
+        "/api/resumes",
+        json={"name": f"{username} benchmark resume", "content": resume_content},
+        headers={"Accept": "application/json", "Cookie": f"access_token={token}"},
+    )
+    response.raise_for_status()
+    return BenchmarkUser(username, token, response.json()["id"])
+
+
+async def seed_users(
+    client: httpx.AsyncClient,
+    llm_endpoint: str,
+    config: LoadTestConfig,
+) -> list[BenchmarkUser]:
+    """Seed the users of a run, each with one resume.
+
+    Args:
+        client (httpx.AsyncClient): A client of the app.
+        llm_endpoint (str): The LLM endpoint to store in each user's settings.
+        config (LoadTestConfig): The run's shape.
+
+    Returns:
+        list[BenchmarkUser]: The seeded users.
+
+    Notes:
+        1. Usernames carry a per-run id, so runs against one database never clash.
+
+    """
+    await ensure_initial_admin(client)
+    run_id = uuid.uuid4().hex[:8]
+    content = generate_resume_markdown(SyntheticResumeSpec(roles=config.roles))
+    return [
+        await seed_user(client, f"bench-{run_id}-{i}", llm_endpoint, content)
+        for i in range(config.users)
+    ]
+
+
+async def run_session(
+    client: httpx.AsyncClient,
+    user: BenchmarkUser,
+    config: LoadTestConfig,
+) -> SessionResult:
+    """Open one refinement stream and time its events.
+
+    Args:
+        client (httpx.AsyncClient): A client of the app.
+        user (BenchmarkUser): The user whose resume is refined.
+        config (LoadTestConfig): The run's shape.
+
+    Returns:
+        SessionResult: The session's outcome; errors are recorded, not raised.
+
+    """
+    result = SessionResult()
+    started = time.perf_counter()
+    try:
+        async with asyncio.timeout(config.timeout_seconds):
+            async with client.stream(
+                "GET",
+                f"/api/resumes/{user.resume_id}/refine/stream",
+                params={
+                    "job_description": config.job_description,
+                    "force_fresh": str(config.force_fresh).lower(),
+                },
+                headers={
+                    "Accept": "text/event-stream",
+                    "Cookie": f"access_token={user.token}",
+                },
+            ) as response:
+                result.status_code = response.status_code
+                await _read_events(response, result, started)
+    except (httpx.HTTPError, TimeoutError) as e:
+        result.error = type(e).__name__
+    result.duration_s = time.perf_counter() - started
+    if result.error is None and result.status_code != 200:
+        result.error = f"HTTP {result.status_code}"
+    if result.error is None and not result.ok:
+        result.error = "error event" if result.events["error"] else "no done event"
+    return result
+
+
+async def _read_events(
+    response: httpx.Response,
+    result: SessionResult,
+    started: float,
+) -> None:
+    """Count a stream's events and note when the first and ``done`` arrive.
+
+    Args:
+        response (httpx.Response): The open streaming response.
+        result (SessionResult): The session result to fill in.
+        started (float): `time.perf_counter` when the session started.
+
+    """
+    async for line in response.aiter_lines():
+        if not line.startswith("event:"):
+            continue
+        event = line.removeprefix("event:").strip()
+        elapsed = time.perf_counter() - started
+        result.events[event] += 1
+        if result.time_to_first_event_s is None:
+            result.time_to_first_event_s = elapsed
+        if event == "done":
+            result.time_to_done_s = elapsed
+
+
+def merge_runtime_sample(
+    workers: dict[int, dict[str, Any]],
+    sample: dict[str, Any],
+) -> None:
+    """Fold one /health/runtime sample into the per-worker maxima.
+
+    Args:
+        workers (dict[int, dict[str, Any]]): The maxima so far, by pid.
+        sample (dict[str, Any]): A `RuntimeStats` response.
+
+    """
+    worker = workers.setdefault(
+        sample["pid"],
+        {
+            "pid": sample["pid"],
+            "samples": 0,
+            "loop_lag_p99_ms": 0.0,
+            "loop_lag_max_ms": 0.0,
+            "peak_rss_kib": 0,
+        },
+    )
+    worker["samples"] += 1
+    for key in ("loop_lag_p99_ms", "loop_lag_max_ms", "peak_rss_kib"):
+        worker[key] = max(worker[key], sample[key])
+
+
+async def poll_runtime(
+    base_url: str,
+    interval: float,
+    stop: asyncio.Event,
+) -> dict[int, dict[str, Any]]:
+    """Sample the workers' /health/runtime until told to stop.
+
+    Args:
+        base_url (str): The app's base URL.
+        interval (float): Seconds between samples.
+        stop (asyncio.Event): Set when the load has finished.
+
+    Returns:
+        dict[int, dict[str, Any]]: The largest lag and peak RSS seen per worker pid.
+
+    Notes:
+        1. Every sample uses a new connection, so the kernel spreads the samples
+           over the workers; a worker that was never sampled is missing.
+
+    """
+    workers: dict[int, dict[str, Any]] = {}
+    limits = httpx.Limits(max_keepalive_connections=0)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits) as client:
+        while True:
+            with contextlib.suppress(httpx.HTTPError):
+                response = await client.get("/health/runtime")
+                if response.status_code == 200:
+                    merge_runtime_sample(workers, response.json())
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(stop.wait(), timeout=interval)
+                return workers
+
+
+def _summary_or_none(samples: list[float]) -> dict[str, float] | None:
+    """Summarize samples, or return None if there are none.
+
+    Args:
+        samples (list[float]): The measured values.
+
+    Returns:
+        dict[str, float] | None: The percentile summary.
+
+    """
+    return percentile_summary(samples) if samples else None
+
+
+def summarize(
+    results: list[SessionResult],
+    wall_seconds: float,
+    workers: dict[int, dict[str, Any]],
+) -> dict[str, Any]:
+    """Build the report body from the session results and worker samples.
+
+    Args:
+        results (list[SessionResult]): Every session's result.
+        wall_seconds (float): Seconds from the first session's start to the last's end.
+        workers (dict[int, dict[str, Any]]): The per-worker runtime maxima.
+
+    Returns:
+        dict[str, Any]: Session counts, latency summaries in milliseconds, event
+            throughput and the workers' lag and memory.
+
+    """
+    events: Counter[str] = Counter()
+    for result in results:
+        events.update(result.events)
+    total_events = sum(events.values())
+    return {
+        "sessions": {
+            "started": len(results),
+            "completed": sum(result.ok for result in results),
+            "failed": sum(not result.ok for result in results),
+            "errors": dict(Counter(r.error for r in results if r.error)),
+        },
+        "time_to_first_event_ms": _summary_or_none(
+            [
+                r.time_to_first_event_s * 1000
+                for r in results
+                if r.time_to_first_event_s is not None
+            ],
+        ),
+        "time_to_done_ms": _summary_or_none(
+            [r.time_to_done_s * 1000 for r in results if r.ok],
+        ),
+        "events_per_second": total_events / wall_seconds if wall_seconds else 0.0,
+        "session_events_per_second": _summary_or_none(
+            [
+                sum(r.events.values()) / r.duration_s
+                for r in results
+                if r.duration_s > 0
+            ],
+        ),
+        "events": dict(events),
+        "workers": sorted(workers.values(), key=lambda worker: worker["pid"]),
+    }
+
+
+async def run_load_test(
+    base_url: str,
+    llm_endpoint: str,
+    config: LoadTestConfig,
+) -> dict[str, Any]:
+    """Seed the app and run the concurrent refinement sessions.
+
+    Args:
+        base_url (str): The app's base URL.
+        llm_endpoint (str): The LLM endpoint the seeded users refine with.
+        config (LoadTestConfig): The run's shape.
+
+    Returns:
+        dict[str, Any]: The report body from `summarize`.
+
+    Network access:
+        - Makes HTTP requests to the app, which makes LLM requests to the endpoint.
+
+    """
+    timeout = httpx.Timeout(config.timeout_seconds, connect=10.0)
+    limits = httpx.Limits(max_connections=config.sessions + 1)
+    async with httpx.AsyncClient(
+        base_url=base_url,
+        timeout=timeout,
+        limits=limits,
+    ) as client:
+        users = await seed_users(client, llm_endpoint, config)
+        stop = asyncio.Event()
+        poller = asyncio.create_task(
+            poll_runtime(base_url, config.runtime_poll_seconds, stop),
+        )
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *(
+                run_session(client, users[i % len(users)], config)
+                for i in range(config.sessions)
+            ),
+        )
+        wall_seconds = time.perf_counter() - started
+        stop.set()
+        workers = await poller
+    return summarize(list(results), wall_seconds, workers)
+
+
+def _comparison(
+    metric: str,
+    baseline_value: float | None,
+    current_value: float | None,
+    threshold: float,
+    higher_is_better: bool = False,
+) -> dict[str, Any] | None:
+    """Compare one metric, oriented so that a ratio above 1 is always worse.
+
+    Args:
+        metric (str): The metric's name.
+        baseline_value (float | None): The baseline's value.
+        current_value (float | None): The current value.
+        threshold (float): The ratio above which the metric regressed.
+        higher_is_better (bool): Whether larger values are better, as for throughput.
+
+    Returns:
+        dict[str, Any] | None: The comparison, or None if a value is missing or zero.
+
+    """
+    if not baseline_value or not current_value:
+        return None
+    ratio = (
+        baseline_value / current_value
+        if higher_is_better
+        else current_value / baseline_value
+    )
+    return {
+        "metric": metric,
+        "baseline": baseline_value,
+        "current": current_value,
+        "ratio": ratio,
+        "regressed": ratio > threshold,
+    }
+
+
+def compare_to_baseline(
+    report: dict[str, Any],
+    baseline: dict[str, Any],
+    threshold: float,
+) -> list[dict[str, Any]]:
+    """Compare a report's median latencies and throughput against a baseline report.
+
+    Args:
+        report (dict[str, Any]): The current report.
+        baseline (dict[str, Any]): A previously saved report.
+        threshold (float): The ratio above which a comparison is a regression.
+
+    Returns:
+        list[dict[str, Any]]: One comparison per metric both reports have.
+
+    """
+    comparisons = [
+        _comparison(
+            metric,
+            (baseline.get(metric) or {}).get("p50"),
+            (report.get(metric) or {}).get("p50"),
+            threshold,
+        )
+        for metric in LATENCY_METRICS
+    ]
+    comparisons.append(
+        _comparison(
+            THROUGHPUT_METRIC,
+            baseline.get(THROUGHPUT_METRIC),
+            report.get(THROUGHPUT_METRIC),
+            threshold,
+            higher_is_better=True,
+        ),
+    )
+    return [comparison for comparison in comparisons if comparison is not None]
+
+
+@contextlib.contextmanager
+def managed_process(
+    name: str,
+    args: list[str],
+    ready_url: str,
+) -> Iterator[None]:
+    """Run a server process for the duration of the block.
+
+    Args:
+        name (str): A name for the process, used in its log file and errors.
+        args (list[str]): The command line.
+        ready_url (str): A URL that answers once the server is ready.
+
+    Yields:
+        None: Once the server answers at `ready_url`.
+
+    Raises:
+        click.ClickException: If the server exits or is not ready in time.
+
+    Notes:
+        1. The server's output goes to a temporary log file named in the error.
+        2. The process is terminated when the block exits.
+
+    """
+    with tempfile.NamedTemporaryFile(
+        prefix=f"{name}-", suffix=".log", delete=False
+    ) as log_file:
+        process = subprocess.Popen(args, stdout=log_file, stderr=subprocess.STDOUT)
+    try:
+        _wait_until_ready(process, ready_url, f"{name} (log: {log_file.name})")
+        yield
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def _wait_until_ready(process: subprocess.Popen, url: str, name: str) -> None:
+    """Poll a URL until it answers or the process exits.
+
+    Args:
+        process (subprocess.Popen): The server process.
+        url (str): The URL to poll.
+        name (str): The server's name, for errors.
+
+    Raises:
+        click.ClickException: If the process exits or the URL does not answer in time.
+
+    """
+    deadline = time.monotonic() + READY_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise click.ClickException(f"{name} exited with {process.returncode}")
+        with contextlib.suppress(httpx.HTTPError):
+            if httpx.get(url, timeout=1.0).status_code == 200:
+                return
+        time.sleep(0.2)
+    raise click.ClickException(f"{name} was not ready after {READY_TIMEOUT_SECONDS}s")
+
+
+@click.command()
+@click.option("--sessions", default=10, show_default=True, help="Concurrent streams.")
+@click.option("--users", default=5, show_default=True, help="Seeded users.")
+@click.option("--roles", default=5, show_default=True, help="Roles per resume.")
+@click.option("--workers", default=1, show_default=True, help="App workers to start.")
+@click.option("--port", default=8010, show_default=True, help="Port of the started app.")
+@click.option("--base-url", help="Use a running app instead of starting one.")
+@click.option(
+    "--llm-endpoint",
+    help="LLM endpoint for the seeded users; starts the stand-in server if omitted.",
+)
+@click.option("--llm-port", default=8011, show_default=True)
+@click.option("--llm-latency-ms", default=800.0, show_default=True)
+@click.option("--use-cache", is_flag=True, help="Let sessions reuse cached results.")
+@click.option("--timeout", default=300.0, show_default=True, help="Seconds per session.")
+@click.option("--output", type=click.Path(dir_okay=False), help="Write the report here.")
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Compare against a saved report and exit 1 on regression.",
+)
+@click.option("--threshold", default=DEFAULT_REGRESSION_THRESHOLD, show_default=True)
+def main(  # noqa: PLR0913
+    sessions: int,
+    users: int,
+    roles: int,
+    workers: int,
+    port: int,
+    base_url: str | None,
+    llm_endpoint: str | None,
+    llm_port: int,
+    llm_latency_ms: float,
+    use_cache: bool,
+    timeout: float,
+    output: str | None,
+    baseline: str | None,
+    threshold: float,
+) -> None:
+    """Run the SSE refinement load test and print the JSON report.
+
+    Args:
+        sessions (int): Concurrent refinement sessions.
+        users (int): Users to seed.
+        roles (int): Roles per seeded resume.
+        workers (int): App workers to start.
+        port (int): Port of the started app.
+        base_url (str | None): A running app to use instead of starting one.
+        llm_endpoint (str | None): The LLM endpoint; the stand-in server if None.
+        llm_port (int): Port of the started stand-in server.
+        llm_latency_ms (float): Median latency of the stand-in server.
+        use_cache (bool): Whether sessions may reuse cached analyses and roles.
+        timeout (float): Longest a session may take, in seconds.
+        output (str | None): Optional path to write the report to.
+        baseline (str | None): Optional path of a report to compare against.
+        threshold (float): The ratio above which a comparison is a regression.
+
+    Notes:
+        1. The report is always printed to stdout as JSON.
+        2. With --baseline, a "comparison" list is added and the exit code is 1
+           if any metric regressed.
+
+    """
+    config = LoadTestConfig(
+        sessions=sessions,
+        users=max(min(users, sessions), 1),
+        roles=roles,
+        force_fresh=not use_cache,
+        timeout_seconds=timeout,
+    )
+    with contextlib.ExitStack() as stack:
+        if llm_endpoint is None:
+            llm_endpoint = f"http://127.0.0.1:{llm_port}/v1"
+            stack.enter_context(
+                managed_process(
+                    "fake-llm",
+                    [
+                        sys.executable,
+                        "-m",
+                        "benchmarks.fake_llm_server",
+                        "--port",
+                        str(llm_port),
+                        "--latency-ms",
+                        str(llm_latency_ms),
+                    ],
+                    f"{llm_endpoint}/models",
+                ),
+            )
+        if base_url is None:
+            base_url = f"http://127.0.0.1:{port}"
+            stack.enter_context(
+                managed_process(
+                    "resume-editor",
+                    [
+                        sys.executable,
+                        "-m",
+                        "uvicorn",
+                        "resume_editor.app.main:app",
+                        "--port",
+                        str(port),
+                        "--workers",
+                        str(workers),
+                        "--log-level",
+                        "warning",
+                    ],
+                    f"{base_url}/health",
+                ),
+            )
+        report = asyncio.run(run_load_test(base_url, llm_endpoint, config))
+
+    report = {
+        "meta": {
+            **asdict(config),
+            "base_url": base_url,
+            "llm_endpoint": llm_endpoint,
+            "workers": workers,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        **report,
+    }
+    regressed = False
+    if baseline:
+        comparison = compare_to_baseline(
+            report,
+            json.loads(Path(baseline).read_text()),
+            threshold,
+        )
+        report["comparison"] = comparison
+        regressed = any(entry["regressed"] for entry in comparison)
+
+    rendered = json.dumps(report, indent=2)
+    if output:
+        Path(output).write_text(rendered + "\n")
+    click.echo(rendered)
+    if regressed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
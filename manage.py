@@ -4,6 +4,9 @@ import subprocess
 import click
 
 from resume_editor.app.api.routes.route_logic.admin_crud import create_initial_admin
+from resume_editor.app.api.routes.route_logic.resume_structured_data import (
+    backfill_structured_data,
+)
 from resume_editor.app.database.database import get_session_local
 
 
@@ -151,6 +154,45 @@ def create_admin(username: str, password: str):
     log.debug(_msg)
 
 
+@cli.command("backfill-structured-data")
+def backfill_structured_data_command():
+    """
+    Derive the stored structured data for resumes that are missing it.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    Notes:
+        1. Establishes a database connection.
+        2. Calls the `backfill_structured_data` function to refresh stale resumes.
+        3. Prints the number of refreshed resumes or an error message.
+
+    """
+    _msg = "backfill_structured_data_command starting"
+    log.debug(_msg)
+    click.echo("Backfilling structured resume data...")
+
+    db_session_local = get_session_local()
+    db = db_session_local()
+    try:
+        count = backfill_structured_data(db=db)
+        _success_msg = f"Backfilled structured data for {count} resumes."
+        click.echo(_success_msg)
+        log.info(_success_msg)
+    except Exception as e:
+        _error_msg = f"Error backfilling structured data: {e}"
+        click.echo(_error_msg, err=True)
+        log.exception(_error_msg)
+    finally:
+        db.close()
+
+    _msg = "backfill_structured_data_command returning"
+    log.debug(_msg)
+
+
 def main():
     """Run the command line interface."""
     cli()
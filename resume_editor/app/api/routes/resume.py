@@ -33,9 +33,14 @@ from resume_editor.app.api.routes.route_logic.resume_crud import (
 from resume_editor.app.api.routes.route_logic.resume_crud import (
     update_resume as update_resume_db,
 )
+from resume_editor.app.api.routes.route_logic.resume_parse_executor import (
+    run_parse_task,
+)
 from resume_editor.app.api.routes.route_logic.resume_parsing import (
     parse_resume_content,
-    validate_resume_content,
+)
+from resume_editor.app.api.routes.route_logic.resume_structured_data import (
+    build_validated_structured_data,
 )
 from resume_editor.app.api.routes.route_models import (
     ParseRequest,
@@ -314,8 +319,8 @@ async def create_resume(
         HTTPException: If there's an error saving the resume to the database or if Markdown validation fails.
 
     Notes:
-        1. Validates the Markdown content using the resume parser.
-        2. Creates a new DatabaseResume instance with the provided name and content.
+        1. Validates the Markdown content and builds its structured data on the parse executor.
+        2. Creates a new DatabaseResume instance with the provided name, content and structured data.
         3. Associates the resume with the current user.
         4. Saves the new resume to the database.
         5. If the request is from HTMX, returns an HTMLResponse with a `HX-Redirect`
@@ -324,12 +329,16 @@ async def create_resume(
 
     """
     # Validate Markdown content before saving
-    validate_resume_content(request.content)
+    structured_data = await run_parse_task(
+        build_validated_structured_data,
+        request.content,
+    )
 
     resume_params = ResumeCreateParams(
         user_id=current_user.id,
         name=request.name,
         content=request.content,
+        structured_data=structured_data,
     )
     resume = create_resume_db(db=db, params=resume_params)
 
@@ -391,7 +400,8 @@ async def update_resume_details(
         HTTPException: If validation fails or an error occurs during the update.
 
     Notes:
-        1. Validates resume content if it is being updated.
+        1. Validates resume content if it is being updated, parsing only the sections that changed,
+           and builds its structured data on the parse executor.
         2. Updates the resume's name and/or content.
         3. For HTMX requests from the editor page, returns an `HX-Redirect` to the dashboard.
         4. For other HTMX requests, returns an HTML response containing both the updated resume
@@ -401,14 +411,20 @@ async def update_resume_details(
 
     """
     # Validate Markdown content only if it's a non-empty string
+    structured_data = None
     if form_data.content:
-        validate_resume_content(form_data.content)
+        structured_data = await run_parse_task(
+            build_validated_structured_data,
+            form_data.content,
+            original_content=resume.content,
+        )
 
     # If content is an empty string, treat it as None to prevent wiping content.
     content_to_update = form_data.content if form_data.content else None
     update_params = ResumeUpdateParams(
         name=form_data.name,
         content=content_to_update,
+        structured_data=structured_data,
     )
     updated_resume = update_resume_db(
         db=db,
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
@@ -26,14 +27,15 @@ from resume_editor.app.api.routes.route_logic.resume_ai_logic import (
 from resume_editor.app.api.routes.route_logic.resume_filtering import (
     filter_experience_by_date,
 )
+from resume_editor.app.api.routes.route_logic.resume_parse_executor import (
+    run_parse_task,
+)
 from resume_editor.app.api.routes.route_logic.resume_reconstruction import (
     build_complete_resume_from_sections,
 )
-from resume_editor.app.api.routes.route_logic.resume_serialization import (
-    extract_certifications_info,
-    extract_education_info,
-    extract_experience_info,
-    extract_personal_info,
+from resume_editor.app.api.routes.route_logic.resume_structured_data import (
+    load_all_sections,
+    load_section_data,
 )
 from resume_editor.app.api.routes.route_models import (
     ExperienceRefinementParams,
@@ -66,6 +68,7 @@ class _ExperienceStreamParams:
         limit_refinement_years (str | None): Original string form of the years limit for metadata.
         company (str | None): Optional company name for the refined resume.
         notes (str | None): Optional notes for the refined resume.
+        force_fresh (bool): If True, skip cached job analyses and refined roles.
 
     """
 
@@ -77,6 +80,7 @@ class _ExperienceStreamParams:
     limit_refinement_years: str | None
     company: str | None = None
     notes: str | None = None
+    force_fresh: bool = False
 
 
 router = APIRouter()
@@ -137,6 +141,7 @@ class RefineStreamOptionalParams(BaseModel):
     Attributes:
         company (str | None): Optional company name for the refined resume.
         notes (str | None): Optional notes for the refined resume.
+        force_fresh (bool): If True, skip cached job analyses and refined roles.
 
     Notes:
         1. Groups optional parameters to reduce function argument count.
@@ -146,23 +151,30 @@ class RefineStreamOptionalParams(BaseModel):
 
     company: str | None = None
     notes: str | None = None
+    force_fresh: bool = False
 
 
 def get_refine_stream_optional(
     company: Annotated[str | None, Query()] = None,
     notes: Annotated[str | None, Query()] = None,
+    force_fresh: Annotated[bool, Query()] = False,
 ) -> RefineStreamOptionalParams:
     """Dependency to collect optional query parameters.
 
     Args:
         company (str | None): Optional company name.
         notes (str | None): Optional notes.
+        force_fresh (bool): If True, skip cached job analyses and refined roles.
 
     Returns:
         RefineStreamOptionalParams: Aggregated optional parameters.
 
     """
-    return RefineStreamOptionalParams(company=company, notes=notes)
+    return RefineStreamOptionalParams(
+        company=company,
+        notes=notes,
+        force_fresh=force_fresh,
+    )
 
 
 def get_refine_stream_query(
@@ -282,12 +294,16 @@ def _parse_limit_years_for_stream(
 def _build_filtered_content_if_needed(
     resume_content: str,
     limit_years: int | None,
+    structured_data: dict | None = None,
+    structured_data_version: int | None = None,
 ) -> str:
     """Optionally filter experience by a date window and rebuild resume content.
 
     Args:
         resume_content (str): The original full resume content.
         limit_years (int | None): The positive number of years to include, or None.
+        structured_data (dict | None): The resume's stored structured data.
+        structured_data_version (int | None): The version the structured data was stored with.
 
     Returns:
         str: The content to refine (filtered if a limit was supplied).
@@ -296,7 +312,7 @@ def _build_filtered_content_if_needed(
         1. If limit_years is None, returns the original content unchanged.
         2. Otherwise:
             a. Computes a start_date of (today - limit_years years).
-            b. Extracts all sections from the original content.
+            b. Loads all sections, from the stored structured data when it is current.
             c. Filters experience by date range.
             d. Rebuilds a complete resume from the sections.
         3. This function may raise exceptions from extract/serialize helpers.
@@ -314,22 +330,23 @@ def _build_filtered_content_if_needed(
         days=int(limit_years * 365.25),
     )
 
-    personal_info = extract_personal_info(resume_content)
-    education_info = extract_education_info(resume_content)
-    experience_info = extract_experience_info(resume_content)
-    certifications_info = extract_certifications_info(resume_content)
+    sections = load_all_sections(
+        content=resume_content,
+        structured_data=structured_data,
+        structured_data_version=structured_data_version,
+    )
 
     filtered_experience = filter_experience_by_date(
-        experience=experience_info,
+        experience=sections.experience,
         start_date=start_date,
         end_date=None,
     )
 
     result = build_complete_resume_from_sections(
-        personal_info=personal_info,
-        education=education_info,
+        personal_info=sections.personal,
+        education=sections.education,
         experience=filtered_experience,
-        certifications=certifications_info,
+        certifications=sections.certifications,
     )
     _msg = "build_filtered_content_if_needed returning"
     log.debug(_msg)
@@ -406,6 +423,9 @@ async def _experience_refinement_stream(
         2. Handles exceptions during filtering and sends an SSE error.
         3. Validates that roles exist to refine after filtering, sending an SSE warning if not.
         4. Invokes `experience_refinement_sse_generator` which runs the full intro and experience flow.
+        5. Filtering and experience parsing run on the parse executor so other streams keep flowing.
+        6. Sections are read from the stored structured data while the content to refine matches
+           it, and the loaded experience is handed to the refinement so it is not parsed again.
 
     """
     _msg = "Starting SSE stream for resume refinement"
@@ -418,9 +438,12 @@ async def _experience_refinement_stream(
     )
 
     try:
-        content_to_refine = _build_filtered_content_if_needed(
+        content_to_refine = await run_parse_task(
+            _build_filtered_content_if_needed,
             resume_content=params.resume.content,
             limit_years=params.parsed_limit_years,
+            structured_data=params.resume.structured_data,
+            structured_data_version=params.resume.structured_data_version,
         )
     except Exception as e:
         _msg = f"Error during experience filtering: {e!s}"
@@ -431,7 +454,13 @@ async def _experience_refinement_stream(
         yield create_sse_close_message()
         return
 
-    experience = extract_experience_info(content_to_refine)
+    experience = await run_parse_task(
+        load_section_data,
+        content=content_to_refine,
+        structured_data=params.resume.structured_data,
+        structured_data_version=params.resume.structured_data_version,
+        section_name="experience",
+    )
     if not experience.roles:
         yield create_sse_error_message(
             "No roles available to refine within the specified date range.",
@@ -451,6 +480,9 @@ async def _experience_refinement_stream(
         running_log=running_log,
         company=params.company,
         notes=params.notes,
+        bypass_analysis_cache=params.force_fresh,
+        bypass_role_cache=params.force_fresh,
+        experience_info=experience,
     )
     try:
         generator = experience_refinement_sse_generator(params=exp_params)
@@ -647,6 +679,7 @@ async def refine_resume_stream_get(
         limit_refinement_years=query.limit_refinement_years,
         company=optional.company,
         notes=optional.notes,
+        force_fresh=optional.force_fresh,
     )
 
     result = StreamingResponse(
@@ -778,6 +811,7 @@ async def refine_resume_stream(
                 "limit_refinement_years": form_data.limit_refinement_years,
                 "company": form_data.company,
                 "notes": form_data.notes,
+                "force_fresh": form_data.force_fresh,
             },
         )
         _msg = "refine_resume_stream returning"
@@ -806,6 +840,7 @@ async def refine_resume_stream(
         limit_refinement_years=original_limit_str,
         company=form_data.company,
         notes=form_data.notes,
+        force_fresh=form_data.force_fresh,
     )
     result = _create_refinement_stream_response(params=params)
     _msg = "refine_resume_stream returning"
@@ -847,6 +882,7 @@ async def refine_resume(
             "limit_refinement_years": form_data.limit_refinement_years,
             "company": form_data.company,
             "notes": form_data.notes,
+            "force_fresh": form_data.force_fresh,
         },
     )
 
@@ -882,7 +918,7 @@ async def save_refined_resume_as_new(
         resume=resume,
         form_data=form_data,
     )
-    new_resume = handle_save_as_new_refinement(params)
+    new_resume = await asyncio.to_thread(handle_save_as_new_refinement, params)
 
     return Response(headers={"HX-Redirect": f"/resumes/{new_resume.id}/view"})
 
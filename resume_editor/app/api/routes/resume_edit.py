@@ -3,6 +3,7 @@ from datetime import datetime
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Response
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from resume_editor.app.api.dependencies import get_resume_for_user
@@ -12,13 +13,17 @@ from resume_editor.app.api.routes.route_logic.resume_crud import (
 from resume_editor.app.api.routes.route_logic.resume_crud import (
     update_resume as update_resume_db,
 )
+from resume_editor.app.api.routes.route_logic.resume_parse_executor import (
+    run_parse_task,
+)
 from resume_editor.app.api.routes.route_logic.resume_serialization import (
-    extract_certifications_info,
-    extract_education_info,
-    extract_experience_info,
-    extract_personal_info,
     update_resume_content_with_structured_data,
 )
+from resume_editor.app.api.routes.route_logic.resume_structured_data import (
+    build_structured_data,
+    load_resume_section,
+    load_section_data,
+)
 from resume_editor.app.api.routes.route_logic.resume_validation import (
     perform_pre_save_validation,
 )
@@ -48,6 +53,93 @@ log = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def _build_content_update(
+    current_content: str,
+    **sections: BaseModel,
+) -> ResumeUpdateParams:
+    """Rebuild resume content with updated sections, validate it, and derive its structured data.
+
+    Args:
+        current_content (str): The current Markdown content of the resume.
+        **sections (BaseModel): The updated sections, named as the arguments of
+            `update_resume_content_with_structured_data`.
+
+    Returns:
+        ResumeUpdateParams: The updated content with its structured data.
+
+    Raises:
+        HTTPException: If the updated content fails pre-save validation.
+
+    Notes:
+        1. Reconstructs the Markdown incrementally with `update_resume_content_with_structured_data`.
+        2. Performs pre-save validation on the updated content.
+        3. Builds the structured data here, so saving the content does not parse it again.
+        4. Runs on the parse executor, so it is a module-level function.
+
+    """
+    updated_content = update_resume_content_with_structured_data(
+        current_content=current_content,
+        incremental=True,
+        **sections,
+    )
+    perform_pre_save_validation(updated_content, current_content)
+    return ResumeUpdateParams(
+        content=updated_content,
+        structured_data=build_structured_data(updated_content),
+    )
+
+
+async def _save_updated_sections(
+    db: Session,
+    resume: DatabaseResume,
+    **sections: BaseModel,
+) -> None:
+    """Save a resume with updated sections, keeping the parsing off the event loop.
+
+    Args:
+        db (Session): Database session.
+        resume (DatabaseResume): The resume to update.
+        **sections (BaseModel): The updated sections, as for `_build_content_update`.
+
+    Returns:
+        None
+
+    Raises:
+        HTTPException: If the updated content fails pre-save validation.
+
+    Notes:
+        1. Runs `_build_content_update` on the parse executor.
+        2. Saves the content and its structured data to the database.
+
+    """
+    update_params = await run_parse_task(
+        _build_content_update,
+        resume.content,
+        **sections,
+    )
+    update_resume_db(db, resume, params=update_params)
+
+
+async def _load_section(resume: DatabaseResume, section_name: str) -> BaseModel:
+    """Load one section of a resume on the parse executor.
+
+    Args:
+        resume (DatabaseResume): The resume to read.
+        section_name (str): The section to load, as for `load_section_data`.
+
+    Returns:
+        BaseModel: The loaded section.
+
+    """
+    return await run_parse_task(
+        load_section_data,
+        content=resume.content,
+        structured_data=resume.structured_data,
+        structured_data_version=resume.structured_data_version,
+        section_name=section_name,
+    )
+
+
 @router.get("/{resume_id}/personal")
 async def get_personal_info(
     resume: Annotated[DatabaseResume, Depends(get_resume_for_user)],
@@ -66,13 +158,13 @@ async def get_personal_info(
     Notes:
         1. Queries the database for a resume with the given ID and user_id.
         2. If no resume is found, raises a 404 error.
-        3. Extracts personal information from the resume content using extract_personal_info.
+        3. Loads personal information from the stored structured data using load_resume_section, parsing the content only if it is stale.
         4. Returns the personal information as a PersonalInfoResponse.
         5. Performs database access: Reads from the database via db.query.
         6. Performs network access: None.
 
     """
-    return extract_personal_info(resume.content)
+    return load_resume_section(resume, "personal")
 
 
 @router.put("/{resume_id}/personal", status_code=200)
@@ -103,24 +195,14 @@ async def update_personal_info_structured(
         6. Saves the updated content to the database.
         7. Returns the updated personal information.
         8. This function performs database read and write operations.
+        9. Parsing, reconstruction and validation run on the parse executor, off the event loop.
 
     """
     try:
         # Create updated personal info object
         updated_info = PersonalInfoResponse(**request.model_dump())
 
-        # Reconstruct resume with updated personal info
-        updated_content = update_resume_content_with_structured_data(
-            current_content=resume.content,
-            personal_info=updated_info,
-        )
-
-        # Perform pre-save validation
-        perform_pre_save_validation(updated_content, resume.content)
-
-        # Save updated content to database
-        update_params = ResumeUpdateParams(content=updated_content)
-        update_resume_db(db, resume, params=update_params)
+        await _save_updated_sections(db, resume, personal_info=updated_info)
 
         return Response(headers={"HX-Redirect": "/dashboard"})
     except (ValueError, TypeError, HTTPException) as e:
@@ -156,6 +238,7 @@ async def update_projects(
         2. Appends the new project to the existing experience section.
         3. Reconstructs, validates, and saves the updated resume content.
         4. Returns an HTML partial of the updated resume view.
+        5. Parsing, reconstruction and validation run on the parse executor, off the event loop.
 
     """
     try:
@@ -174,17 +257,10 @@ async def update_projects(
         }
         new_project = Project.model_validate(new_project_data)
 
-        experience_info = extract_experience_info(resume.content)
+        experience_info = await _load_section(resume, "experience")
         experience_info.projects.append(new_project)
 
-        updated_content = update_resume_content_with_structured_data(
-            current_content=resume.content,
-            experience=experience_info,
-        )
-
-        perform_pre_save_validation(updated_content, resume.content)
-        update_params = ResumeUpdateParams(content=updated_content)
-        update_resume_db(db, resume=resume, params=update_params)
+        await _save_updated_sections(db, resume, experience=experience_info)
 
         return Response(headers={"HX-Redirect": "/dashboard"})
     except (ValueError, TypeError, HTTPException) as e:
@@ -218,6 +294,7 @@ async def update_certifications(
         2. Appends the new certification to the existing certifications section.
         3. Reconstructs, validates, and saves the updated resume content.
         4. Returns an HTML partial of the updated resume view.
+        5. Parsing, reconstruction and validation run on the parse executor, off the event loop.
 
     """
     try:
@@ -234,17 +311,10 @@ async def update_certifications(
         }
         new_cert = Certification.model_validate(new_cert_data)
 
-        certifications_info = extract_certifications_info(resume.content)
+        certifications_info = await _load_section(resume, "certifications")
         certifications_info.certifications.append(new_cert)
 
-        updated_content = update_resume_content_with_structured_data(
-            current_content=resume.content,
-            certifications=certifications_info,
-        )
-
-        perform_pre_save_validation(updated_content, resume.content)
-        update_params = ResumeUpdateParams(content=updated_content)
-        update_resume_db(db, resume=resume, params=update_params)
+        await _save_updated_sections(db, resume, certifications=certifications_info)
 
         return Response(headers={"HX-Redirect": "/dashboard"})
     except (ValueError, TypeError, HTTPException) as e:
@@ -272,14 +342,13 @@ async def get_projects_info(
     Notes:
         1. Queries the database for a resume with the given ID and user_id.
         2. If no resume is found, raises a 404 error.
-        3. Extracts experience information (which includes projects) from the resume content.
+        3. Loads the projects from the stored structured data using load_resume_section, parsing only the projects subsection if it is stale.
         4. Returns the projects information as a ProjectsResponse.
         5. Performs database access: Reads from the database via db.query.
         6. Performs network access: None.
 
     """
-    experience = extract_experience_info(resume.content)
-    return ProjectsResponse(projects=experience.projects)
+    return load_resume_section(resume, "projects")
 
 
 @router.put("/{resume_id}/projects", status_code=200)
@@ -310,12 +379,13 @@ async def update_projects_info_structured(
         6. Saves the updated content to the database.
         7. Returns the updated projects information.
         8. This function performs database read and write operations.
+        9. Parsing, reconstruction and validation run on the parse executor, off the event loop.
 
     """
     try:
         projects_to_update = request.projects or []
 
-        current_experience = extract_experience_info(resume.content)
+        current_experience = await _load_section(resume, "experience")
 
         # To update only projects, we need to preserve roles from the current experience.
         experience_with_updated_projects = ExperienceResponse(
@@ -323,16 +393,12 @@ async def update_projects_info_structured(
             projects=projects_to_update,
         )
 
-        updated_content = update_resume_content_with_structured_data(
-            current_content=resume.content,
+        await _save_updated_sections(
+            db,
+            resume,
             experience=experience_with_updated_projects,
         )
 
-        perform_pre_save_validation(updated_content, resume.content)
-
-        update_params = ResumeUpdateParams(content=updated_content)
-        update_resume_db(db, resume, params=update_params)
-
         return Response(headers={"HX-Redirect": "/dashboard"})
     except (ValueError, TypeError, HTTPException) as e:
         detail = getattr(e, "detail", str(e))
@@ -361,13 +427,13 @@ async def get_certifications_info(
     Notes:
         1. Queries the database for a resume with the given ID and user_id.
         2. If no resume is found, raises a 404 error.
-        3. Extracts certifications information from the resume content using extract_certifications_info.
+        3. Loads certifications information from the stored structured data using load_resume_section, parsing the content only if it is stale.
         4. Returns the certifications information as a CertificationsResponse.
         5. Performs database access: Reads from the database via db.query.
         6. Performs network access: None.
 
     """
-    return extract_certifications_info(resume.content)
+    return load_resume_section(resume, "certifications")
 
 
 @router.put("/{resume_id}/certifications", status_code=200)
@@ -398,6 +464,7 @@ async def update_certifications_info_structured(
         6. Saves the updated content to the database.
         7. Returns the updated certifications information.
         8. This function performs database read and write operations.
+        9. Parsing, reconstruction and validation run on the parse executor, off the event loop.
 
     """
     try:
@@ -405,16 +472,7 @@ async def update_certifications_info_structured(
             certifications=request.certifications,
         )
 
-        # Reconstruct resume with updated certifications
-        updated_content = update_resume_content_with_structured_data(
-            current_content=resume.content,
-            certifications=updated_certifications,
-        )
-
-        perform_pre_save_validation(updated_content, resume.content)
-
-        update_params = ResumeUpdateParams(content=updated_content)
-        update_resume_db(db, resume, params=update_params)
+        await _save_updated_sections(db, resume, certifications=updated_certifications)
 
         return Response(headers={"HX-Redirect": "/dashboard"})
     except (ValueError, TypeError, HTTPException) as e:
@@ -449,7 +507,8 @@ async def update_experience(
         1. Parses form data to create a new `Role` object.
         2. Appends the new role to the existing experience section.
         3. Reconstructs, validates, and saves the updated resume content.
-        4. Returns an HTML partial of the updated resume view.
+        4. Parsing, reconstruction and validation run on the parse executor, off the event loop.
+        5. Returns an HTML partial of the updated resume view.
 
     """
     try:
@@ -466,17 +525,10 @@ async def update_experience(
         }
         new_role = Role.model_validate(new_role_data)
 
-        experience_info = extract_experience_info(resume.content)
+        experience_info = await _load_section(resume, "experience")
         experience_info.roles.append(new_role)
 
-        updated_content = update_resume_content_with_structured_data(
-            current_content=resume.content,
-            experience=experience_info,
-        )
-
-        perform_pre_save_validation(updated_content, resume.content)
-        update_params = ResumeUpdateParams(content=updated_content)
-        update_resume_db(db, resume=resume, params=update_params)
+        await _save_updated_sections(db, resume, experience=experience_info)
 
         return Response(headers={"HX-Redirect": "/dashboard"})
     except (ValueError, TypeError, HTTPException) as e:
@@ -504,13 +556,20 @@ async def get_experience_info(
     Notes:
         1. Queries the database for a resume with the given ID and user_id.
         2. If no resume is found, raises a 404 error.
-        3. Extracts experience information from the resume content using extract_experience_info.
-        4. Returns the experience information as an ExperienceResponse.
-        5. Performs database access: Reads from the database via db.query.
-        6. Performs network access: None.
+        3. Loads experience information from the stored structured data using load_section_data, parsing the content only if it is stale.
+        4. The load runs on the parse executor, off the event loop.
+        5. Returns the experience information as an ExperienceResponse.
+        6. Performs database access: Reads from the database via db.query.
+        7. Performs network access: None.
 
     """
-    return extract_experience_info(resume.content)
+    return await run_parse_task(
+        load_section_data,
+        resume.content,
+        resume.structured_data,
+        resume.structured_data_version,
+        "experience",
+    )
 
 
 @router.put("/{resume_id}/experience", status_code=200)
@@ -541,11 +600,12 @@ async def update_experience_info_structured(
         6. Saves the updated content to the database.
         7. Returns the updated experience information.
         8. This function performs database read and write operations.
+        9. Parsing, reconstruction and validation run on the parse executor, off the event loop.
 
     """
     try:
         # Create updated experience object, using new data if provided, else current
-        current_experience = extract_experience_info(resume.content)
+        current_experience = await _load_section(resume, "experience")
         updated_experience = ExperienceResponse(
             roles=request.roles
             if request.roles is not None
@@ -557,18 +617,7 @@ async def update_experience_info_structured(
             ),
         )
 
-        # Reconstruct the resume content with the updated experience section
-        updated_content = update_resume_content_with_structured_data(
-            current_content=resume.content,
-            experience=updated_experience,
-        )
-
-        # Perform pre-save validation
-        perform_pre_save_validation(updated_content, resume.content)
-
-        # Save updated content to database
-        update_params = ResumeUpdateParams(content=updated_content)
-        update_resume_db(db, resume, params=update_params)
+        await _save_updated_sections(db, resume, experience=updated_experience)
 
         return Response(headers={"HX-Redirect": "/dashboard"})
     except (ValueError, TypeError, HTTPException) as e:
@@ -604,6 +653,7 @@ async def update_education(
         2. Appends the new degree to the existing education section.
         3. Reconstructs, validates, and saves the updated resume content.
         4. Returns an HTML partial of the updated resume view.
+        5. Parsing, reconstruction and validation run on the parse executor, off the event loop.
 
     """
     try:
@@ -621,17 +671,10 @@ async def update_education(
         }
         new_degree = Degree(**new_degree_data)
 
-        education_info = extract_education_info(resume.content)
+        education_info = await _load_section(resume, "education")
         education_info.degrees.append(new_degree)
 
-        updated_content = update_resume_content_with_structured_data(
-            current_content=resume.content,
-            education=education_info,
-        )
-
-        perform_pre_save_validation(updated_content, resume.content)
-        update_params = ResumeUpdateParams(content=updated_content)
-        update_resume_db(db, resume=resume, params=update_params)
+        await _save_updated_sections(db, resume, education=education_info)
 
         return Response(headers={"HX-Redirect": "/dashboard"})
     except (ValueError, TypeError, HTTPException) as e:
@@ -659,13 +702,13 @@ async def get_education_info(
     Notes:
         1. Queries the database for a resume with the given ID and user_id.
         2. If no resume is found, raises a 404 error.
-        3. Extracts education information from the resume content using extract_education_info.
+        3. Loads education information from the stored structured data using load_resume_section, parsing the content only if it is stale.
         4. Returns the education information as an EducationResponse.
         5. Performs database access: Reads from the database via db.query.
         6. Performs network access: None.
 
     """
-    return extract_education_info(resume.content)
+    return load_resume_section(resume, "education")
 
 
 @router.put("/{resume_id}/education", status_code=200)
@@ -696,24 +739,14 @@ async def update_education_info_structured(
         6. Saves the updated content to the database.
         7. Returns the updated education information.
         8. This function performs database read and write operations.
+        9. Parsing, reconstruction and validation run on the parse executor, off the event loop.
 
     """
     try:
         # Create updated education info object
         updated_info = EducationResponse(**request.model_dump())
 
-        # Reconstruct resume with updated education info
-        updated_content = update_resume_content_with_structured_data(
-            current_content=resume.content,
-            education=updated_info,
-        )
-
-        # Perform pre-save validation
-        perform_pre_save_validation(updated_content, resume.content)
-
-        # Save updated content to database
-        update_params = ResumeUpdateParams(content=updated_content)
-        update_resume_db(db, resume, params=update_params)
+        await _save_updated_sections(db, resume, education=updated_info)
 
         return Response(headers={"HX-Redirect": "/dashboard"})
     except (ValueError, TypeError, HTTPException) as e:
@@ -1,9 +1,10 @@
 import logging
+from collections.abc import Iterator
 from copy import deepcopy
 from datetime import date
 from typing import TYPE_CHECKING, Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
@@ -14,17 +15,17 @@ from resume_editor.app.api.routes.route_logic.resume_export import (
 from resume_editor.app.api.routes.route_logic.resume_filtering import (
     filter_experience_by_date,
 )
+from resume_editor.app.api.routes.route_logic.resume_parse_executor import (
+    run_parse_task,
+)
 from resume_editor.app.api.routes.route_logic.resume_parsing import (
     parse_resume_to_writer_object,
 )
 from resume_editor.app.api.routes.route_logic.resume_reconstruction import (
-    build_complete_resume_from_sections,
+    iter_complete_resume_from_sections,
 )
-from resume_editor.app.api.routes.route_logic.resume_serialization import (
-    extract_certifications_info,
-    extract_education_info,
-    extract_experience_info,
-    extract_personal_info,
+from resume_editor.app.api.routes.route_logic.resume_structured_data import (
+    load_all_sections,
 )
 from resume_editor.app.api.routes.route_models import (
     RenderFormat,
@@ -97,31 +98,102 @@ def _parse_date_range(
     return parsed_start_date, parsed_end_date
 
 
-def _get_filtered_resume_content(
+def _filtered_section_arguments(
     resume_content: str,
     start_date: date | None,
     end_date: date | None,
-) -> str:
-    """Filters resume content by date range if dates are provided."""
+    structured_data: dict | None = None,
+    structured_data_version: int | None = None,
+) -> dict[str, object]:
+    """Loads the resume's sections and filters its experience by date range.
+
+    Returns the keyword arguments for `iter_complete_resume_from_sections`. The
+    sections come from the stored structured data when it is current, otherwise
+    from parsing the content. Takes and returns only picklable values so it can
+    run on the parse executor.
+    """
+    sections = load_all_sections(
+        content=resume_content,
+        structured_data=structured_data,
+        structured_data_version=structured_data_version,
+    )
+
+    filtered_experience = filter_experience_by_date(
+        sections.experience,
+        start_date,
+        end_date,
+    )
+
+    return {
+        "personal_info": sections.personal,
+        "education": sections.education,
+        "experience": filtered_experience,
+        "certifications": sections.certifications,
+    }
+
+
+def _iter_filtered_resume_content(
+    resume_content: str,
+    start_date: date | None,
+    end_date: date | None,
+    structured_data: dict | None = None,
+    structured_data_version: int | None = None,
+) -> Iterator[str]:
+    """Filters resume content by date range, returning the result as chunks.
+
+    Parsing and filtering happen before this returns, so errors surface to the
+    caller; serialization happens lazily as the iterator is consumed.
+    """
     if not start_date and not end_date:
-        return resume_content
+        return iter((resume_content,))
+
+    return iter_complete_resume_from_sections(
+        **_filtered_section_arguments(
+            resume_content,
+            start_date,
+            end_date,
+            structured_data,
+            structured_data_version,
+        ),
+    )
 
-    personal_info = extract_personal_info(resume_content)
-    education_info = extract_education_info(resume_content)
-    experience_info = extract_experience_info(resume_content)
-    certifications_info = extract_certifications_info(resume_content)
 
-    filtered_experience = filter_experience_by_date(
-        experience_info,
+async def _iter_filtered_resume_content_offloaded(
+    resume: DatabaseResume,
+    start_date: date | None,
+    end_date: date | None,
+) -> Iterator[str]:
+    """Like `_iter_filtered_resume_content`, but loads sections on the parse executor."""
+    if not start_date and not end_date:
+        return iter((resume.content,))
+
+    arguments = await run_parse_task(
+        _filtered_section_arguments,
+        resume.content,
         start_date,
         end_date,
+        resume.structured_data,
+        resume.structured_data_version,
     )
+    return iter_complete_resume_from_sections(**arguments)
+
 
-    return build_complete_resume_from_sections(
-        personal_info=personal_info,
-        education=education_info,
-        experience=filtered_experience,
-        certifications=certifications_info,
+def _get_filtered_resume_content(
+    resume_content: str,
+    start_date: date | None,
+    end_date: date | None,
+    structured_data: dict | None = None,
+    structured_data_version: int | None = None,
+) -> str:
+    """Filters resume content by date range if dates are provided."""
+    return "".join(
+        _iter_filtered_resume_content(
+            resume_content,
+            start_date,
+            end_date,
+            structured_data,
+            structured_data_version,
+        ),
     )
 
 
@@ -130,7 +202,7 @@ async def export_resume_markdown(
     resume: Annotated[DatabaseResume, Depends(get_resume_for_user)],
     start_date: Annotated[str | None, Query()] = None,
     end_date: Annotated[str | None, Query()] = None,
-) -> Response:
+) -> StreamingResponse:
     """Export a resume as a Markdown file.
 
     Args:
@@ -139,17 +211,19 @@ async def export_resume_markdown(
         end_date (str | None): Optional end date to filter experience (YYYY-MM-DD).
 
     Returns:
-        Response: A response object containing the resume's Markdown content as a downloadable file.
+        StreamingResponse: A response streaming the resume's Markdown content as a downloadable file.
 
     Raises:
         HTTPException: If the resume is not found or does not belong to the user (handled by dependency).
 
     Notes:
         1. Fetches the resume using the get_resume_for_user dependency.
-        2. If a date range is provided, filters the experience section before exporting.
+        2. If a date range is provided, filters the experience section before exporting,
+           reading the sections from the stored structured data when it is current.
         3. Attempts to parse the resume content to generate a dynamic filename.
         4. On parsing failure, falls back to a simple sanitized filename based on `resume.name`.
-        5. Creates a Response object with the resume's content.
+        5. Parsing and filtering run on the parse executor; the StreamingResponse serializes
+           the content chunk by chunk in a worker thread as it is sent.
         6. Sets the 'Content-Type' header to 'text/markdown'.
         7. Sets the 'Content-Disposition' header to trigger a file download with the generated filename.
         8. Returns the response.
@@ -158,8 +232,8 @@ async def export_resume_markdown(
     parsed_start_date, parsed_end_date = _parse_date_range(start_date, end_date)
 
     try:
-        content_to_export = _get_filtered_resume_content(
-            resume.content,
+        content_chunks = await _iter_filtered_resume_content_offloaded(
+            resume,
             parsed_start_date,
             parsed_end_date,
         )
@@ -170,7 +244,10 @@ async def export_resume_markdown(
         raise HTTPException(status_code=422, detail=_msg)
 
     try:
-        parsed_resume: WriterResume = parse_resume_to_writer_object(resume.content)
+        parsed_resume: WriterResume = await run_parse_task(
+            parse_resume_to_writer_object,
+            resume.content,
+        )
         filename = generate_resume_filename(
             resume_db=resume,
             resume_writer=parsed_resume,
@@ -184,8 +261,8 @@ async def export_resume_markdown(
     headers = {
         "Content-Disposition": f'attachment; filename="{filename}"',
     }
-    return Response(
-        content=content_to_export,
+    return StreamingResponse(
+        content_chunks,
         media_type="text/markdown",
         headers=headers,
     )
@@ -218,11 +295,13 @@ async def download_resume(
 
     Notes:
         1. Persists the user's chosen export settings from the form to the database.
-        2. If a date range is provided, filters the experience section before rendering.
+        2. If a date range is provided, filters the experience section before rendering,
+           reading the sections from the stored structured data when it is current.
         3. Attempts to parse the resume content to generate a dynamic filename.
         4. If parsing fails, it falls back to a simple sanitized filename.
         5. Renders the resume content to a DOCX filestream.
-        6. Returns a StreamingResponse with the correct headers to trigger a download.
+        6. Parsing, filtering and rendering run on the parse executor, off the event loop.
+        7. Returns a StreamingResponse with the correct headers to trigger a download.
 
     """
     _msg = (
@@ -238,7 +317,10 @@ async def download_resume(
     db.commit()
 
     try:
-        parsed_resume: WriterResume = parse_resume_to_writer_object(resume.content)
+        parsed_resume: WriterResume = await run_parse_task(
+            parse_resume_to_writer_object,
+            resume.content,
+        )
         filename = generate_resume_filename(
             resume_db=resume,
             resume_writer=parsed_resume,
@@ -255,10 +337,13 @@ async def download_resume(
     )
 
     try:
-        content_to_parse = _get_filtered_resume_content(
+        content_to_parse = await run_parse_task(
+            _get_filtered_resume_content,
             resume.content,
             parsed_start_date,
             parsed_end_date,
+            resume.structured_data,
+            resume.structured_data_version,
         )
     except (ValueError, TypeError) as e:
         detail = getattr(e, "detail", str(e))
@@ -281,7 +366,8 @@ async def download_resume(
             resume.export_settings_render_projects_first
         )
 
-        file_stream = render_resume_to_docx_stream(
+        file_stream = await run_parse_task(
+            render_resume_to_docx_stream,
             resume_content=content_to_parse,
             render_format=download_params.render_format.value,
             settings_dict=settings_dict,
@@ -0,0 +1,337 @@
+"""Persistent, cross-worker cache of job description analyses."""
+
+import asyncio
+import hashlib
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import TypeVar
+
+from sqlalchemy.orm import Session
+
+from resume_editor.app.core.config import get_settings
+from resume_editor.app.database.database import get_session_local
+from resume_editor.app.llm.models import JobAnalysis
+from resume_editor.app.models.job_analysis_cache import JobAnalysisCacheEntry
+
+log = logging.getLogger(__name__)
+
+DEFAULT_ANALYSIS_MODEL_NAME = "gpt-4o"
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class JobAnalysisCacheKey:
+    """The identity of a cached job analysis.
+
+    Attributes:
+        job_description_hash (str): SHA-256 of the normalized job description.
+        resume_hash (str): SHA-256 of the resume content used as analysis context.
+        model_name (str): The LLM model that produces the analysis.
+
+    """
+
+    job_description_hash: str
+    resume_hash: str
+    model_name: str
+
+    @property
+    def digest(self) -> str:
+        """Return the SHA-256 over all key parts, used as the stored cache key."""
+        joined = f"{self.job_description_hash}:{self.resume_hash}:{self.model_name}"
+        return hashlib.sha256(joined.encode("utf-8")).hexdigest()
+
+
+def normalize_job_description(job_description: str) -> str:
+    """Normalize a job description so whitespace-only edits share a cache entry.
+
+    Args:
+        job_description (str): The job description text.
+
+    Returns:
+        str: The text with leading, trailing and repeated whitespace collapsed.
+
+    """
+    return " ".join(job_description.split())
+
+
+def job_analysis_cache_key(
+    job_description: str,
+    resume_content: str,
+    model_name: str | None,
+) -> JobAnalysisCacheKey:
+    """Build the cache key for analyzing a job description against a resume.
+
+    Args:
+        job_description (str): The job description text.
+        resume_content (str): The base resume content the analysis is run against.
+        model_name (str | None): The configured model name, or None for the default model.
+
+    Returns:
+        JobAnalysisCacheKey: The key for the analysis.
+
+    """
+    normalized = normalize_job_description(job_description)
+    return JobAnalysisCacheKey(
+        job_description_hash=hashlib.sha256(normalized.encode("utf-8")).hexdigest(),
+        resume_hash=hashlib.sha256(resume_content.encode("utf-8")).hexdigest(),
+        model_name=model_name or DEFAULT_ANALYSIS_MODEL_NAME,
+    )
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Return a datetime as timezone-aware UTC; naive values are taken to be UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+class JobAnalysisCache:
+    """Database-backed cache of `JobAnalysis` results.
+
+    The same job description is often analyzed against the same base resume again
+    minutes later, after a discard, with another years limit, or from another
+    worker. This cache persists each analysis so every worker can reuse it.
+
+    Attributes:
+        session_factory (Callable[[], Session]): Creates the session each lookup or
+            write runs on.
+        ttl_seconds (int): How long an analysis stays valid after it is stored.
+        max_entries (int): Maximum number of analyses kept.
+        bypass (bool): If True, lookups always miss, but fresh analyses are still stored.
+
+    Notes:
+        1. Lookups and writes run on a worker thread, each on its own session, so the
+           refinement stream never blocks the event loop on the database.
+        2. Cache failures are logged and never fail a refinement; lookups then miss.
+        3. Expired entries are deleted when found and on every write.
+        4. Above `max_entries`, the least recently used entries are deleted on write.
+
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        ttl_seconds: int,
+        max_entries: int,
+        bypass: bool = False,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            session_factory (Callable[[], Session]): Creates the session each lookup
+                or write runs on.
+            ttl_seconds (int): How long an analysis stays valid after it is stored.
+            max_entries (int): Maximum number of analyses kept.
+            bypass (bool): If True, lookups always miss, but fresh analyses are still stored.
+
+        """
+        self.session_factory = session_factory
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.bypass = bypass
+
+    def _is_expired(self, entry: JobAnalysisCacheEntry, now: datetime) -> bool:
+        """Return whether an entry is older than the TTL."""
+        age = now - _as_utc(entry.created_at)
+        return age > timedelta(seconds=self.ttl_seconds)
+
+    def _in_own_session(self, operation: Callable[..., T], *args: object) -> T:
+        """Run a cache operation on a new session, closing it afterwards.
+
+        Args:
+            operation (Callable[..., T]): The operation, called with the session first.
+            *args (object): The remaining arguments of the operation.
+
+        Returns:
+            T: The result of the operation.
+
+        """
+        db = self.session_factory()
+        try:
+            return operation(db, *args)
+        finally:
+            db.close()
+
+    async def get(self, key: JobAnalysisCacheKey) -> JobAnalysis | None:
+        """Return the cached analysis for a key, if present and fresh.
+
+        Args:
+            key (JobAnalysisCacheKey): The key of the analysis.
+
+        Returns:
+            JobAnalysis | None: The cached analysis, or None on a miss or bypass.
+
+        Notes:
+            1. The lookup runs on a worker thread with its own session.
+
+        Database access:
+            - Reads from and writes to the job_analysis_cache table.
+
+        """
+        if self.bypass:
+            _msg = "JobAnalysisCache bypassed"
+            log.debug(_msg)
+            return None
+        return await asyncio.to_thread(self._in_own_session, self._get, key)
+
+    def _get(self, db: Session, key: JobAnalysisCacheKey) -> JobAnalysis | None:
+        """Look up the analysis for a key on a session.
+
+        Args:
+            db (Session): The session to look the entry up on.
+            key (JobAnalysisCacheKey): The key of the analysis.
+
+        Returns:
+            JobAnalysis | None: The cached analysis, or None on a miss or failure.
+
+        Notes:
+            1. Deletes the entry if it has expired.
+            2. Records the lookup time on a hit.
+
+        """
+        try:
+            entry = (
+                db.query(JobAnalysisCacheEntry)
+                .filter(JobAnalysisCacheEntry.cache_key == key.digest)
+                .first()
+            )
+            if entry is None:
+                _msg = "JobAnalysisCache miss"
+                log.debug(_msg)
+                return None
+
+            now = datetime.now(timezone.utc)
+            if self._is_expired(entry, now):
+                _msg = "JobAnalysisCache entry expired"
+                log.debug(_msg)
+                db.delete(entry)
+                db.commit()
+                return None
+
+            analysis = JobAnalysis.model_validate(entry.analysis)
+            entry.last_used_at = now
+            db.commit()
+        except Exception as e:
+            _msg = f"JobAnalysisCache lookup failed: {e!s}"
+            log.warning(_msg)
+            db.rollback()
+            return None
+
+        _msg = "JobAnalysisCache hit"
+        log.debug(_msg)
+        return analysis
+
+    async def put(self, key: JobAnalysisCacheKey, analysis: JobAnalysis) -> None:
+        """Store an analysis, replacing any entry for the same key.
+
+        Args:
+            key (JobAnalysisCacheKey): The key of the analysis.
+            analysis (JobAnalysis): The analysis to store.
+
+        Notes:
+            1. The write runs on a worker thread with its own session.
+
+        Database access:
+            - Writes to the job_analysis_cache table.
+
+        """
+        await asyncio.to_thread(self._in_own_session, self._put, key, analysis)
+
+    def _put(
+        self,
+        db: Session,
+        key: JobAnalysisCacheKey,
+        analysis: JobAnalysis,
+    ) -> None:
+        """Store an analysis on a session.
+
+        Args:
+            db (Session): The session to write the entry on.
+            key (JobAnalysisCacheKey): The key of the analysis.
+            analysis (JobAnalysis): The analysis to store.
+
+        Notes:
+            1. Resets the entry's TTL.
+            2. Prunes expired and least recently used entries afterwards.
+
+        """
+        try:
+            now = datetime.now(timezone.utc)
+            entry = (
+                db.query(JobAnalysisCacheEntry)
+                .filter(JobAnalysisCacheEntry.cache_key == key.digest)
+                .first()
+            )
+            if entry is None:
+                entry = JobAnalysisCacheEntry(
+                    cache_key=key.digest,
+                    job_description_hash=key.job_description_hash,
+                    resume_hash=key.resume_hash,
+                    model_name=key.model_name,
+                    analysis=analysis.model_dump(mode="json"),
+                )
+                db.add(entry)
+            else:
+                entry.analysis = analysis.model_dump(mode="json")
+            entry.created_at = now
+            entry.last_used_at = now
+            db.commit()
+            self._prune(db, now)
+        except Exception as e:
+            _msg = f"JobAnalysisCache store failed: {e!s}"
+            log.warning(_msg)
+            db.rollback()
+
+    def _prune(self, db: Session, now: datetime) -> None:
+        """Delete expired entries and the least recently used entries above the cap.
+
+        Args:
+            db (Session): The session to delete the entries on.
+            now (datetime): The current time.
+
+        """
+        cutoff = now - timedelta(seconds=self.ttl_seconds)
+        db.query(JobAnalysisCacheEntry).filter(
+            JobAnalysisCacheEntry.created_at < cutoff,
+        ).delete(synchronize_session=False)
+
+        overflow = db.query(JobAnalysisCacheEntry).count() - self.max_entries
+        if overflow > 0:
+            stale_ids = [
+                row.id
+                for row in db.query(JobAnalysisCacheEntry.id)
+                .order_by(JobAnalysisCacheEntry.last_used_at.asc())
+                .limit(overflow)
+            ]
+            db.query(JobAnalysisCacheEntry).filter(
+                JobAnalysisCacheEntry.id.in_(stale_ids),
+            ).delete(synchronize_session=False)
+        db.commit()
+
+
+def get_job_analysis_cache(bypass: bool = False) -> JobAnalysisCache | None:
+    """Create the job analysis cache from the application settings.
+
+    Args:
+        bypass (bool): If True, lookups always miss, but fresh analyses are still stored.
+
+    Returns:
+        JobAnalysisCache | None: The cache, or None if caching is disabled.
+
+    Notes:
+        1. The cache opens its own sessions from the application's session factory,
+           since its work runs off the request's thread.
+
+    """
+    settings = get_settings()
+    if not settings.job_analysis_cache_enabled:
+        return None
+    return JobAnalysisCache(
+        session_factory=get_session_local(),
+        ttl_seconds=settings.job_analysis_cache_ttl_seconds,
+        max_entries=settings.job_analysis_cache_max_entries,
+        bypass=bypass,
+    )
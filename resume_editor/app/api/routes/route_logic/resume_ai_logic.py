@@ -9,6 +9,9 @@ from resume_editor.app.api.routes.route_logic.resume_ai_logic_extraction import
     _update_banner_in_raw_personal,
     reconstruct_resume_with_new_introduction,
 )
+from resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events import (
+    _stream_final_events,
+)
 from resume_editor.app.api.routes.route_logic.resume_ai_logic_helpers import (
     get_llm_config,
     handle_save_as_new_refinement,
@@ -33,7 +36,6 @@ from resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming import (
     _handle_role_refined_sse_event,
     _handle_sse_exception,
     _process_single_event,
-    _stream_final_events,
     _stream_llm_events,
     experience_refinement_sse_generator,
 )
@@ -2,64 +2,18 @@
 
 import logging
 
-log = logging.getLogger(__name__)
-
-
-def _is_top_level_section_header(line: str) -> bool:
-    """Check if line is a top-level section header (# Section but not ## Subsection)."""
-    stripped = line.strip()
-    return stripped.startswith("# ") and not stripped.startswith("## ")
-
-
-def _section_header_matches(line: str, section_header: str) -> bool:
-    """Check if line matches the target section header (case insensitive)."""
-    return line.strip().lower() == section_header
-
-
-def _process_section_line(
-    line: str,
-    section_header: str,
-    in_section: bool,
-    captured_lines: list[str],
-) -> tuple[bool, bool]:
-    """Process a single line during section parsing.
+from resume_editor.app.api.routes.route_logic.resume_section_index import (
+    SectionIndex,
+    get_section_index,
+)
 
-    Args:
-        line: The current line to process.
-        section_header: The target section header to match.
-        in_section: Whether we are currently inside the target section.
-        captured_lines: List to append captured lines to.
-
-    Returns:
-        Tuple of (new_in_section, should_continue).
-
-    """
-    if _is_top_level_section_header(line):
-        if _section_header_matches(line, section_header):
-            captured_lines.append(line)
-            return True, True
-        if in_section:
-            return False, False
-    return in_section, True
+log = logging.getLogger(__name__)
 
 
 def _parse_personal_section_lines(lines: list[str], section_name: str) -> list[str]:
     """Parse lines to extract personal section content."""
-    section_header = f"# {section_name.lower()}"
-    in_section = False
-    captured_lines = []
-
-    for line in lines:
-        new_in_section, should_continue = _process_section_line(
-            line, section_header, in_section, captured_lines
-        )
-        in_section = new_in_section
-        if not should_continue:
-            break
-        if in_section and not _is_top_level_section_header(line):
-            captured_lines.append(line)
-
-    return captured_lines
+    raw_section = SectionIndex.build("\n".join(lines)).raw_section(section_name)
+    return raw_section.split("\n") if raw_section else []
 
 
 def _rebuild_personal_section(
@@ -80,10 +34,7 @@ def _rebuild_personal_section(
 
 def _extract_raw_section(resume_content: str, section_name: str) -> str:
     """Extract the raw text of a section from resume content."""
-    lines = resume_content.splitlines()
-    captured_lines = _parse_personal_section_lines(lines, section_name)
-
-    result = "\n".join(captured_lines)
+    result = get_section_index(resume_content).raw_section(section_name)
     if result and not result.endswith("\n"):
         result += "\n"
     return result
@@ -0,0 +1,365 @@
+"""Final events of a streamed resume AI refinement: the introduction and result."""
+
+import logging
+from typing import AsyncGenerator
+
+from resume_editor.app.api.routes.route_logic.job_analysis_cache import (
+    get_job_analysis_cache,
+    job_analysis_cache_key,
+)
+from resume_editor.app.api.routes.route_logic.resume_ai_logic_extraction import (
+    reconstruct_resume_with_new_introduction,
+)
+from resume_editor.app.api.routes.route_logic.resume_ai_logic_helpers import (
+    process_refined_experience_result,
+)
+from resume_editor.app.api.routes.route_logic.resume_ai_logic_params import (
+    IntroductionGenerationParams,
+    ProcessExperienceResultParams,
+)
+from resume_editor.app.api.routes.route_logic.resume_ai_logic_reconstruction import (
+    _reconstruct_refined_resume_content,
+)
+from resume_editor.app.api.routes.route_logic.resume_ai_logic_sse import (
+    create_sse_done_message,
+    create_sse_error_message,
+    create_sse_metrics_message,
+    create_sse_progress_message,
+)
+from resume_editor.app.api.routes.route_logic.resume_section_extraction import (
+    extract_banner_text,
+)
+from resume_editor.app.api.routes.route_models import ExperienceRefinementParams
+from resume_editor.app.llm.models import JobAnalysis, LLMConfig, RunningLog
+from resume_editor.app.llm.orchestration_banner import (
+    async_generate_banner_from_running_log,
+    async_generate_introduction_from_resume,
+)
+from resume_editor.app.llm.retry_policy import (
+    RetryBudget,
+    call_with_retries,
+    get_retry_policy,
+)
+from resume_editor.app.llm.token_usage import TokenUsageLedger
+
+log = logging.getLogger(__name__)
+
+
+async def _resolve_cached_job_analysis(
+    params: ExperienceRefinementParams,
+    llm_config: LLMConfig,
+    running_log: RunningLog | None,
+) -> JobAnalysis | None:
+    """Return the session's job analysis, falling back to the persistent cache.
+
+    Args:
+        params: The refinement parameters.
+        llm_config: The LLM configuration.
+        running_log: The running log for this refinement, if any.
+
+    Returns:
+        The job analysis, or None if neither the running log nor the cache holds one.
+
+    """
+    if running_log is not None and running_log.job_analysis is not None:
+        return running_log.job_analysis
+
+    analysis_cache = get_job_analysis_cache()
+    if analysis_cache is None:
+        return None
+    return await analysis_cache.get(
+        job_analysis_cache_key(
+            params.job_description,
+            params.original_resume_content,
+            llm_config.llm_model_name,
+        ),
+    )
+
+
+async def _try_generate_from_running_log(
+    running_log: RunningLog,
+    resume_content: str,
+    llm_config: LLMConfig,
+    original_banner: str | None,
+) -> str | None:
+    """Try to generate introduction from running log.
+
+    Args:
+        running_log: The running log containing refined roles.
+        resume_content: The reconstructed resume content.
+        llm_config: The LLM configuration.
+        original_banner: The original banner text for context.
+
+    Returns:
+        Generated introduction or None if failed.
+
+    """
+    _msg = "Attempting banner generation from running log"
+    log.debug(_msg)
+    try:
+        intro = await async_generate_banner_from_running_log(
+            running_log=running_log,
+            original_resume_content=resume_content,
+            llm_config=llm_config,
+            original_banner=original_banner,
+        )
+        if intro and intro.strip():
+            _msg = "Banner generated successfully from running log"
+            log.debug(_msg)
+            return intro
+        _msg = "Banner generation from running log returned empty, falling back"
+        log.warning(_msg)
+    except Exception as e:
+        _msg = f"Banner generation from running log failed: {e!s}"
+        log.warning(_msg)
+    return None
+
+
+async def _try_generate_with_retries(
+    params: IntroductionGenerationParams,
+) -> str | None:
+    """Try to generate introduction with retries.
+
+    Args:
+        params: The resume content, job context, LLM configuration and retry budget;
+            its job analysis is reused instead of re-analyzing the job.
+
+    Returns:
+        Generated introduction or None if all retries fail.
+
+    Notes:
+        1. Only transient errors are retried, as the retry policy allows and while
+           the session's retry budget lasts.
+        2. An empty introduction is not retried.
+
+    """
+    try:
+        intro = await call_with_retries(
+            lambda: async_generate_introduction_from_resume(
+                resume_content=params.resume_content,
+                job_description=params.job_description,
+                llm_config=params.llm_config,
+                original_banner=params.original_banner,
+                job_analysis=params.job_analysis,
+            ),
+            policy=get_retry_policy(),
+            budget=params.retry_budget,
+            description="Introduction generation",
+        )
+    except Exception as e:
+        _msg = f"Introduction generation failed: {e!s}"
+        log.warning(_msg)
+        return None
+    if intro and intro.strip():
+        _msg = "Introduction generated successfully (legacy method)."
+        log.debug(_msg)
+        return intro
+    _msg = "Introduction generation yielded an empty introduction."
+    log.warning(_msg)
+    return None
+
+
+def _get_default_introduction() -> str:
+    """Return default introduction when generation fails.
+
+    Returns:
+        Default introduction text.
+
+    """
+    _msg = "Failed to generate introduction after all retries. Using default."
+    log.error(_msg)
+    return (
+        "Professional summary tailored to the provided job description. "
+        "Customize this section to emphasize your most relevant experience, "
+        "accomplishments, and skills."
+    )
+
+
+async def _generate_introduction_with_fallback(
+    params: IntroductionGenerationParams,
+) -> str:
+    """Generate introduction with fallback mechanisms.
+
+    Args:
+        params: The resume content, job context, LLM configuration, running log,
+            job analysis and retry budget to generate the introduction with.
+
+    Returns:
+        The generated introduction text.
+
+    """
+    generated_introduction = None
+
+    running_log = params.running_log
+    if running_log is not None and running_log.refined_roles:
+        generated_introduction = await _try_generate_from_running_log(
+            running_log,
+            params.resume_content,
+            params.llm_config,
+            params.original_banner,
+        )
+
+    if generated_introduction is None:
+        generated_introduction = await _try_generate_with_retries(params)
+
+    if not generated_introduction:
+        generated_introduction = _get_default_introduction()
+
+    return generated_introduction
+
+
+async def _stream_final_events(
+    refined_roles: dict,
+    params: ExperienceRefinementParams,
+    llm_config: LLMConfig,
+    running_log: RunningLog | None = None,
+    retry_budget: RetryBudget | None = None,
+) -> AsyncGenerator[str, None]:
+    """Handle the final sequential steps of AI refinement.
+
+    Args:
+        refined_roles: A dictionary of refined role data.
+        params: The original refinement parameters, carrying the token usage
+            recorded during the refinement, if tracked.
+        llm_config: The LLM configuration.
+        running_log: Optional running log for banner generation.
+        retry_budget: Optional retry budget shared by the whole session.
+
+    Yields:
+        SSE messages for introduction progress, potential warnings, and final events.
+
+    Notes:
+        1. The token usage, if any LLM call was recorded, is sent just before the
+           'done' message.
+
+    """
+    limit_years_int = (
+        int(params.limit_refinement_years) if params.limit_refinement_years else None
+    )
+
+    reconstruct_params = ProcessExperienceResultParams(
+        resume_id=params.resume.id,
+        original_resume_content=params.original_resume_content,
+        resume_content_to_refine=params.resume_content_to_refine,
+        refined_roles=refined_roles,
+        job_description=params.job_description,
+        limit_refinement_years=limit_years_int,
+    )
+    resume_with_refined_roles = _reconstruct_refined_resume_content(
+        params=reconstruct_params,
+    )
+
+    original_banner = extract_banner_text(params.original_resume_content)
+
+    # Job details come from the running log, or the analysis cache, if available
+    job_analysis = await _resolve_cached_job_analysis(params, llm_config, running_log)
+
+    yield create_sse_progress_message("Generating AI introduction...")
+
+    generated_introduction = await _generate_introduction_with_fallback(
+        IntroductionGenerationParams(
+            resume_content=resume_with_refined_roles,
+            job_description=params.job_description,
+            llm_config=llm_config,
+            original_banner=original_banner,
+            running_log=running_log,
+            job_analysis=job_analysis,
+            retry_budget=retry_budget,
+        ),
+    )
+
+    final_content = reconstruct_resume_with_new_introduction(
+        resume_content=resume_with_refined_roles,
+        introduction=generated_introduction,
+    )
+
+    if not refined_roles:
+        yield create_sse_error_message(
+            "Refinement finished, but no roles were found to refine.",
+            is_warning=True,
+        )
+
+    extracted_company_name = job_analysis.company_name if job_analysis else None
+    extracted_job_title = job_analysis.job_title if job_analysis else None
+    extracted_pay_rate = job_analysis.pay_rate if job_analysis else None
+    extracted_contact_info = job_analysis.contact_info if job_analysis else None
+    extracted_work_arrangement = job_analysis.work_arrangement if job_analysis else None
+    extracted_location = job_analysis.location if job_analysis else None
+    extracted_special_instructions = (
+        job_analysis.special_instructions if job_analysis else None
+    )
+
+    result_html = process_refined_experience_result(
+        resume_id=params.resume.id,
+        final_content=final_content,
+        job_description=params.job_description,
+        introduction=generated_introduction,
+        limit_refinement_years=limit_years_int,
+        company=params.company,
+        notes=params.notes,
+        extracted_company_name=extracted_company_name,
+        extracted_job_title=extracted_job_title,
+        extracted_pay_rate=extracted_pay_rate,
+        extracted_contact_info=extracted_contact_info,
+        extracted_work_arrangement=extracted_work_arrangement,
+        extracted_location=extracted_location,
+        extracted_special_instructions=extracted_special_instructions,
+    )
+    for message in _closing_messages(
+        result_html,
+        params.token_usage,
+        params.resume.id,
+    ):
+        yield message
+
+
+def _create_token_usage_message(
+    token_usage: TokenUsageLedger,
+    resume_id: int,
+) -> str | None:
+    """Log a refinement's token usage and format it as an SSE metrics message.
+
+    Args:
+        token_usage: The token usage recorded during the refinement.
+        resume_id: ID of the resume being refined.
+
+    Returns:
+        The SSE 'metrics' message, or None if no LLM call was made.
+
+    """
+    total = token_usage.total()
+    if not total.calls:
+        return None
+    usage = token_usage.as_dict()
+    _msg = (
+        f"Refinement of resume {resume_id} used {total.prompt_tokens} prompt and "
+        f"{total.completion_tokens} completion tokens in {total.calls} LLM calls"
+    )
+    log.info(_msg, extra={"resume_id": resume_id, "token_usage": usage})
+    return create_sse_metrics_message({"token_usage": usage})
+
+
+def _closing_messages(
+    result_html: str,
+    token_usage: TokenUsageLedger | None,
+    resume_id: int,
+) -> list[str]:
+    """Format the messages that end a refinement.
+
+    Args:
+        result_html: The HTML of the refined resume.
+        token_usage: The token usage recorded during the refinement, if tracked.
+        resume_id: ID of the resume being refined.
+
+    Returns:
+        The 'metrics' message if any LLM call was recorded, then the 'done' message.
+
+    Notes:
+        1. Metrics come first because clients close the stream on 'done'.
+
+    """
+    done_message = create_sse_done_message(result_html)
+    if token_usage is None:
+        return [done_message]
+    metrics_message = _create_token_usage_message(token_usage, resume_id)
+    return [metrics_message, done_message] if metrics_message else [done_message]
@@ -20,6 +20,9 @@ from resume_editor.app.api.routes.route_logic.resume_crud import (
 from resume_editor.app.api.routes.route_logic.resume_crud import (
     create_resume as create_resume_db,
 )
+from resume_editor.app.api.routes.route_logic.resume_structured_data import (
+    build_structured_data,
+)
 from resume_editor.app.api.routes.route_logic.resume_validation import (
     perform_pre_save_validation,
     validate_company_and_notes,
@@ -27,6 +30,7 @@ from resume_editor.app.api.routes.route_logic.resume_validation import (
 from resume_editor.app.api.routes.route_logic.settings_crud import get_user_settings
 from resume_editor.app.api.routes.route_models import SaveAsNewParams
 from resume_editor.app.core.security import decrypt_data
+from resume_editor.app.llm.models import LLMEndpoint
 from resume_editor.app.models.resume_model import Resume as DatabaseResume
 
 log = logging.getLogger(__name__)
@@ -69,6 +73,34 @@ def get_llm_config(
     return result
 
 
+def get_llm_fallbacks(db: Session, user_id: int) -> list[LLMEndpoint]:
+    """Retrieves a user's fallback LLM endpoints.
+
+    Args:
+        db: The database session.
+        user_id: The ID of the user.
+
+    Returns:
+        The fallback endpoints in the order they should be tried, each with its
+        own decrypted API key if it has one; empty if the user has none.
+
+    """
+    settings = get_user_settings(db, user_id)
+    fallbacks = settings.llm_fallback_endpoints if settings else None
+    if not isinstance(fallbacks, list):
+        return []
+    return [
+        LLMEndpoint(
+            llm_endpoint=fallback["llm_endpoint"],
+            llm_model_name=fallback.get("llm_model_name"),
+            api_key=decrypt_data(fallback["encrypted_api_key"])
+            if fallback.get("encrypted_api_key")
+            else None,
+        )
+        for fallback in fallbacks
+    ]
+
+
 def _get_str_field_from_form(form_data: object, field_name: str) -> str | None:
     """Extract a string field from form data, handling Mock and Form objects.
 
@@ -274,6 +306,8 @@ def handle_save_as_new_refinement(params: SaveAsNewParams) -> DatabaseResume:  #
         2. The introduction is taken from the form context and passed directly to the database.
         3. No resume reconstruction or on-the-fly introduction generation occurs here.
         4. Company and notes are validated and included in the new resume.
+        5. Structured data is built once from the validated content and stored with it.
+        6. Parses and writes to the database; async callers run it off the event loop.
 
     """
     _msg = "handle_save_as_new_refinement starting"
@@ -318,6 +352,7 @@ def handle_save_as_new_refinement(params: SaveAsNewParams) -> DatabaseResume:  #
         extracted_work_arrangement=data["extracted_work_arrangement"],
         extracted_location=data["extracted_location"],
         extracted_special_instructions=data["extracted_special_instructions"],
+        structured_data=build_structured_data(data["final_content"]),
     )
     new_resume = create_resume_db(
         db=params.db,
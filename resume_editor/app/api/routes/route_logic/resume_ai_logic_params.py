@@ -1,7 +1,9 @@
 """Parameter dataclasses for resume AI logic."""
 
 from dataclasses import dataclass
-from typing import Any
+
+from resume_editor.app.llm.models import JobAnalysis, LLMConfig, RunningLog
+from resume_editor.app.llm.retry_policy import RetryBudget
 
 
 @dataclass
@@ -24,3 +26,27 @@ class ProcessExperienceResultParams:
     refined_roles: dict
     job_description: str
     limit_refinement_years: int | None
+
+
+@dataclass
+class IntroductionGenerationParams:
+    """Parameters for generating the introduction of a refined resume.
+
+    Attributes:
+        resume_content: The reconstructed resume content.
+        job_description: The job description for context.
+        llm_config: The LLM configuration.
+        original_banner: The original banner text for context.
+        running_log: Optional running log for banner generation.
+        job_analysis: Optional job analysis reused by the legacy introduction pipeline.
+        retry_budget: Optional retry budget shared by the whole session.
+
+    """
+
+    resume_content: str
+    job_description: str
+    llm_config: LLMConfig
+    original_banner: str | None
+    running_log: RunningLog | None = None
+    job_analysis: JobAnalysis | None = None
+    retry_budget: RetryBudget | None = None
@@ -1,6 +1,8 @@
 """Resume reconstruction functions for resume AI logic."""
 
+import io
 import logging
+from collections.abc import Iterator
 
 from resume_editor.app.api.routes.route_logic.resume_ai_logic_extraction import (
     _extract_raw_section,
@@ -8,9 +10,11 @@ from resume_editor.app.api.routes.route_logic.resume_ai_logic_extraction import
 from resume_editor.app.api.routes.route_logic.resume_ai_logic_params import (
     ProcessExperienceResultParams,
 )
-from resume_editor.app.api.routes.route_logic.resume_serialization import (
+from resume_editor.app.api.routes.route_logic.resume_section_extraction import (
     extract_experience_info,
-    serialize_experience_to_markdown,
+)
+from resume_editor.app.api.routes.route_logic.resume_serialization import (
+    iter_experience_markdown,
 )
 from resume_editor.app.api.routes.route_models import ExperienceResponse
 from resume_editor.app.models.resume.experience import Role
@@ -18,30 +22,38 @@ from resume_editor.app.models.resume.experience import Role
 log = logging.getLogger(__name__)
 
 
-def _build_resume_sections(
-    raw_personal: str,
-    raw_education: str,
-    raw_certifications: str,
-    experience_markdown: str,
-) -> list[str]:
-    """Build list of resume sections from raw content.
+def _write_resume_sections(
+    buffer: io.StringIO,
+    raw_sections: list[str],
+    experience_chunks: Iterator[str],
+) -> None:
+    """Write preserved raw sections and streamed experience into a buffer.
 
     Args:
-        raw_personal: Raw personal section content.
-        raw_education: Raw education section content.
-        raw_certifications: Raw certifications section content.
-        experience_markdown: Serialized experience section.
+        buffer: The buffer receiving the resume Markdown.
+        raw_sections: Raw personal, education and certifications section content.
+        experience_chunks: Chunks of the serialized experience section.
 
-    Returns:
-        List of section strings to combine.
+    Notes:
+        1. Blank raw sections are skipped; the others are stripped and end with a newline.
+        2. Non-empty pieces are separated by a single newline.
+        3. Experience chunks are written as they are produced, without joining them first.
 
     """
-    sections = []
-    for section in [raw_personal, raw_education, raw_certifications]:
+    separator = ""
+    for section in raw_sections:
         if section.strip():
-            sections.append(section.strip() + "\n")
-    sections.append(experience_markdown)
-    return sections
+            buffer.write(separator)
+            buffer.write(section.strip() + "\n")
+            separator = "\n"
+
+    first_chunk = next(experience_chunks, None)
+    if first_chunk is None:
+        return
+    buffer.write(separator)
+    buffer.write(first_chunk)
+    for chunk in experience_chunks:
+        buffer.write(chunk)
 
 
 def _update_roles_with_refined_data(
@@ -106,15 +118,14 @@ def _reconstruct_refined_resume_content(
         projects=original_experience_info.projects,
     )
 
-    # Reconstruct full resume
-    experience_markdown = serialize_experience_to_markdown(updated_experience)
-    sections = _build_resume_sections(
-        raw_personal,
-        raw_education,
-        raw_certifications,
-        experience_markdown,
+    # Reconstruct full resume, streaming the experience section into the buffer
+    buffer = io.StringIO()
+    _write_resume_sections(
+        buffer,
+        [raw_personal, raw_education, raw_certifications],
+        iter_experience_markdown(updated_experience),
     )
-    final_content = "\n".join(filter(None, sections))
+    final_content = buffer.getvalue()
 
     _msg = "_reconstruct_refined_resume_content returning"
     log.debug(_msg)
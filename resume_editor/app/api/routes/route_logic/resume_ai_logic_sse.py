@@ -1,6 +1,7 @@
 """SSE message helpers for resume AI logic."""
 
 import html
+import json
 import logging
 
 log = logging.getLogger(__name__)
@@ -72,6 +73,37 @@ def create_sse_done_message(html_content: str) -> str:
     return create_sse_message(event="done", data=html_content)
 
 
+def create_sse_role_progress_message(role_title: str, summary: str) -> str:
+    """Creates an SSE 'role_progress' message.
+
+    Args:
+        role_title: The title of the role being refined.
+        summary: The refined summary written so far.
+
+    Returns:
+        The formatted SSE 'role_progress' message.
+
+    """
+    preview_html = (
+        f"<p><span class='font-semibold'>{html.escape(role_title)}:</span> "
+        f"{html.escape(summary)}</p>"
+    )
+    return create_sse_message(event="role_progress", data=preview_html)
+
+
+def create_sse_metrics_message(metrics: dict) -> str:
+    """Creates an SSE 'metrics' message.
+
+    Args:
+        metrics: JSON-serializable metrics of the refinement, such as token usage.
+
+    Returns:
+        The formatted SSE 'metrics' message.
+
+    """
+    return create_sse_message(event="metrics", data=json.dumps(metrics))
+
+
 def create_sse_close_message() -> str:
     """Creates an SSE 'close' message.
 
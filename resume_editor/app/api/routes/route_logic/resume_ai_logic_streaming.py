@@ -7,38 +7,38 @@ from typing import Any, AsyncGenerator
 from cryptography.fernet import InvalidToken
 from openai import AuthenticationError
 
-from resume_editor.app.api.routes.route_logic.resume_ai_logic_params import (
-    ProcessExperienceResultParams,
+from resume_editor.app.api.routes.route_logic.job_analysis_cache import (
+    get_job_analysis_cache,
+    job_analysis_cache_key,
 )
-from resume_editor.app.api.routes.route_logic.resume_ai_logic_reconstruction import (
-    _reconstruct_refined_resume_content,
+from resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events import (
+    _stream_final_events,
 )
 from resume_editor.app.api.routes.route_logic.resume_ai_logic_sse import (
     create_sse_close_message,
-    create_sse_done_message,
     create_sse_error_message,
     create_sse_progress_message,
-)
-from resume_editor.app.api.routes.route_logic.resume_serialization import (
-    extract_banner_text,
+    create_sse_role_progress_message,
 )
 from resume_editor.app.api.routes.route_models import ExperienceRefinementParams
-from resume_editor.app.llm.models import LLMConfig, RefinedRoleRecord, RunningLog
-from resume_editor.app.llm.orchestration import generate_introduction_from_resume
-from resume_editor.app.llm.orchestration_banner import generate_banner_from_running_log
+from resume_editor.app.llm.models import (
+    JobAnalysis,
+    LLMConfig,
+    RefinedRoleRecord,
+    RunningLog,
+)
 from resume_editor.app.llm.orchestration_refinement import (
     async_refine_experience_section,
 )
+from resume_editor.app.llm.retry_policy import RetryBudget, get_retry_policy
+from resume_editor.app.llm.token_usage import track_token_usage
 from resume_editor.app.models.resume.experience import Role
 from resume_editor.app.api.routes.route_logic.refinement_checkpoint import (
     running_log_manager,
 )
-from resume_editor.app.api.routes.route_logic.resume_ai_logic_extraction import (
-    reconstruct_resume_with_new_introduction,
-)
 from resume_editor.app.api.routes.route_logic.resume_ai_logic_helpers import (
     get_llm_config,
-    process_refined_experience_result,
+    get_llm_fallbacks,
 )
 
 log = logging.getLogger(__name__)
@@ -68,6 +68,11 @@ def _process_single_event(event: dict, refined_roles: dict) -> str | None:
         sse_message = create_sse_progress_message(message)
     elif status == "role_refined":
         sse_message = _handle_role_refined_sse_event(event, refined_roles)
+    elif status == "role_progress":
+        sse_message = create_sse_role_progress_message(
+            event.get("role_title", ""),
+            event.get("summary", ""),
+        )
     else:
         _msg = f"Unhandled SSE event received: {event}"
         log.warning(_msg)
@@ -102,8 +107,9 @@ def _handle_role_refined_sse_event(event: dict, refined_roles: dict) -> str | No
             raise ValueError("Refined role data is missing 'basics' section.")
 
         refined_roles[index] = role.model_dump(mode="json")
+        suffix = " (cached)" if event.get("cached") else ""
         return create_sse_progress_message(
-            f"Refined Role: {role.basics.title} at {role.basics.company}",
+            f"Refined Role: {role.basics.title} at {role.basics.company}{suffix}",
         )
     except Exception as e:
         _msg = f"Failed to validate refined role data: {e!s}"
@@ -321,6 +327,7 @@ async def _stream_llm_events(
     llm_config: LLMConfig,
     refined_roles: dict,
     running_log: RunningLog | None = None,
+    retry_budget: RetryBudget | None = None,
 ) -> AsyncGenerator[str, None]:
     """Stream events from the LLM and yield SSE messages.
 
@@ -329,10 +336,17 @@ async def _stream_llm_events(
         llm_config: The LLM configuration.
         refined_roles: Dictionary to collect refined role data.
         running_log: Optional running log for checkpoint/resumption support.
+        retry_budget: Optional retry budget shared by the whole session.
 
     Yields:
         SSE formatted messages.
 
+    Notes:
+        1. The job analysis is looked up in, and stored to, the persistent cache, keyed
+           by the original resume content so any years limit shares the entry.
+        2. Roles are served from the role refinement cache unless `bypass_role_cache` is set.
+        3. The experience section loaded by the route is passed on, so it is not parsed again.
+
     """
     _msg = "_stream_llm_events starting"
     log.debug(_msg)
@@ -344,6 +358,15 @@ async def _stream_llm_events(
     refinement_state = RefinementState(
         job_analysis=job_analysis,
         skip_indices=skip_indices,
+        analysis_cache=get_job_analysis_cache(bypass=params.bypass_analysis_cache),
+        analysis_cache_key=job_analysis_cache_key(
+            params.job_description,
+            params.original_resume_content,
+            llm_config.llm_model_name,
+        ),
+        bypass_role_cache=params.bypass_role_cache,
+        experience_info=params.experience_info,
+        retry_budget=retry_budget,
     )
     refinement_stream = async_refine_experience_section(
         resume_content=params.resume_content_to_refine,
@@ -366,227 +389,6 @@ async def _stream_llm_events(
     log.debug(_msg)
 
 
-async def _try_generate_from_running_log(
-    running_log: RunningLog,
-    resume_content: str,
-    llm_config: LLMConfig,
-    original_banner: str | None,
-) -> str | None:
-    """Try to generate introduction from running log.
-
-    Args:
-        running_log: The running log containing refined roles.
-        resume_content: The reconstructed resume content.
-        llm_config: The LLM configuration.
-        original_banner: The original banner text for context.
-
-    Returns:
-        Generated introduction or None if failed.
-
-    """
-    _msg = "Attempting banner generation from running log"
-    log.debug(_msg)
-    try:
-        intro = generate_banner_from_running_log(
-            running_log=running_log,
-            original_resume_content=resume_content,
-            llm_config=llm_config,
-            original_banner=original_banner,
-        )
-        if intro and intro.strip():
-            _msg = "Banner generated successfully from running log"
-            log.debug(_msg)
-            return intro
-        _msg = "Banner generation from running log returned empty, falling back"
-        log.warning(_msg)
-    except Exception as e:
-        _msg = f"Banner generation from running log failed: {e!s}"
-        log.warning(_msg)
-    return None
-
-
-async def _try_generate_with_retries(
-    resume_content: str,
-    job_description: str,
-    llm_config: LLMConfig,
-    original_banner: str | None,
-) -> str | None:
-    """Try to generate introduction with retries.
-
-    Args:
-        resume_content: The reconstructed resume content.
-        job_description: The job description for context.
-        llm_config: The LLM configuration.
-        original_banner: The original banner text for context.
-
-    Returns:
-        Generated introduction or None if all retries fail.
-
-    """
-    for i in range(3):
-        try:
-            _msg = f"Attempt {i + 1} to generate introduction (legacy method)."
-            log.debug(_msg)
-            intro = generate_introduction_from_resume(
-                resume_content=resume_content,
-                job_description=job_description,
-                llm_config=llm_config,
-                original_banner=original_banner,
-            )
-            if intro and intro.strip():
-                _msg = "Introduction generated successfully (legacy method)."
-                log.debug(_msg)
-                return intro
-            _msg = f"Attempt {i + 1} yielded empty introduction."
-            log.warning(_msg)
-        except Exception as e:
-            _msg = f"Attempt {i + 1} to generate introduction failed: {e!s}"
-            log.warning(_msg)
-    return None
-
-
-def _get_default_introduction() -> str:
-    """Return default introduction when generation fails.
-
-    Returns:
-        Default introduction text.
-
-    """
-    _msg = "Failed to generate introduction after all retries. Using default."
-    log.error(_msg)
-    return (
-        "Professional summary tailored to the provided job description. "
-        "Customize this section to emphasize your most relevant experience, "
-        "accomplishments, and skills."
-    )
-
-
-async def _generate_introduction_with_fallback(
-    resume_content: str,
-    job_description: str,
-    llm_config: LLMConfig,
-    original_banner: str | None,
-    running_log: RunningLog | None,
-) -> str:
-    """Generate introduction with fallback mechanisms.
-
-    Args:
-        resume_content: The reconstructed resume content.
-        job_description: The job description for context.
-        llm_config: The LLM configuration.
-        original_banner: The original banner text for context.
-        running_log: Optional running log for banner generation.
-
-    Returns:
-        The generated introduction text.
-
-    """
-    generated_introduction = None
-
-    if running_log is not None and running_log.refined_roles:
-        generated_introduction = await _try_generate_from_running_log(
-            running_log, resume_content, llm_config, original_banner
-        )
-
-    if generated_introduction is None:
-        generated_introduction = await _try_generate_with_retries(
-            resume_content, job_description, llm_config, original_banner
-        )
-
-    if not generated_introduction:
-        generated_introduction = _get_default_introduction()
-
-    return generated_introduction
-
-
-async def _stream_final_events(
-    refined_roles: dict,
-    params: ExperienceRefinementParams,
-    llm_config: LLMConfig,
-    running_log: RunningLog | None = None,
-) -> AsyncGenerator[str, None]:
-    """Handle the final sequential steps of AI refinement.
-
-    Args:
-        refined_roles: A dictionary of refined role data.
-        params: The original refinement parameters.
-        llm_config: The LLM configuration.
-        running_log: Optional running log for banner generation.
-
-    Yields:
-        SSE messages for introduction progress, potential warnings, and final events.
-
-    """
-    limit_years_int = (
-        int(params.limit_refinement_years) if params.limit_refinement_years else None
-    )
-
-    reconstruct_params = ProcessExperienceResultParams(
-        resume_id=params.resume.id,
-        original_resume_content=params.original_resume_content,
-        resume_content_to_refine=params.resume_content_to_refine,
-        refined_roles=refined_roles,
-        job_description=params.job_description,
-        limit_refinement_years=limit_years_int,
-    )
-    resume_with_refined_roles = _reconstruct_refined_resume_content(
-        params=reconstruct_params,
-    )
-
-    original_banner = extract_banner_text(params.original_resume_content)
-
-    yield create_sse_progress_message("Generating AI introduction...")
-
-    generated_introduction = await _generate_introduction_with_fallback(
-        resume_content=resume_with_refined_roles,
-        job_description=params.job_description,
-        llm_config=llm_config,
-        original_banner=original_banner,
-        running_log=running_log,
-    )
-
-    final_content = reconstruct_resume_with_new_introduction(
-        resume_content=resume_with_refined_roles,
-        introduction=generated_introduction,
-    )
-
-    if not refined_roles:
-        yield create_sse_error_message(
-            "Refinement finished, but no roles were found to refine.",
-            is_warning=True,
-        )
-
-    # Extract job details from running_log if available
-    job_analysis = running_log.job_analysis if running_log else None
-    extracted_company_name = job_analysis.company_name if job_analysis else None
-    extracted_job_title = job_analysis.job_title if job_analysis else None
-    extracted_pay_rate = job_analysis.pay_rate if job_analysis else None
-    extracted_contact_info = job_analysis.contact_info if job_analysis else None
-    extracted_work_arrangement = job_analysis.work_arrangement if job_analysis else None
-    extracted_location = job_analysis.location if job_analysis else None
-    extracted_special_instructions = (
-        job_analysis.special_instructions if job_analysis else None
-    )
-
-    result_html = process_refined_experience_result(
-        resume_id=params.resume.id,
-        final_content=final_content,
-        job_description=params.job_description,
-        introduction=generated_introduction,
-        limit_refinement_years=limit_years_int,
-        company=params.company,
-        notes=params.notes,
-        extracted_company_name=extracted_company_name,
-        extracted_job_title=extracted_job_title,
-        extracted_pay_rate=extracted_pay_rate,
-        extracted_contact_info=extracted_contact_info,
-        extracted_work_arrangement=extracted_work_arrangement,
-        extracted_location=extracted_location,
-        extracted_special_instructions=extracted_special_instructions,
-    )
-    yield create_sse_done_message(result_html)
-
-
 def _prepare_refinement_params(params: ExperienceRefinementParams) -> LLMConfig:
     """Prepare LLM configuration from refinement parameters.
 
@@ -594,7 +396,7 @@ def _prepare_refinement_params(params: ExperienceRefinementParams) -> LLMConfig:
         params: The refinement parameters containing user and db info.
 
     Returns:
-        The configured LLMConfig object.
+        The configured LLMConfig object, including the user's fallback endpoints.
 
     """
     llm_endpoint, llm_model_name, api_key = get_llm_config(params.db, params.user.id)
@@ -602,6 +404,7 @@ def _prepare_refinement_params(params: ExperienceRefinementParams) -> LLMConfig:
         llm_endpoint=llm_endpoint,
         api_key=api_key,
         llm_model_name=llm_model_name,
+        fallbacks=get_llm_fallbacks(params.db, params.user.id),
     )
 
 
@@ -726,24 +529,34 @@ async def _stream_refinement_events(
     Yields:
         SSE formatted messages.
 
+    Notes:
+        1. The token usage of every LLM call is recorded by stage and sent in a
+           'metrics' message just before 'done' when any LLM call was made.
+        2. Refinement and introduction generation share one retry budget.
+
     """
     refined_roles = _prepopulate_refined_roles(running_log)
+    retry_budget = RetryBudget(get_retry_policy().retry_budget)
 
-    async for sse_message in _stream_llm_events(
-        params=params,
-        llm_config=llm_config,
-        refined_roles=refined_roles,
-        running_log=running_log,
-    ):
-        yield sse_message
-
-    async for sse_message in _stream_final_events(
-        refined_roles=refined_roles,
-        params=params,
-        llm_config=llm_config,
-        running_log=running_log,
-    ):
-        yield sse_message
+    with track_token_usage() as token_usage:
+        async for sse_message in _stream_llm_events(
+            params=params,
+            llm_config=llm_config,
+            refined_roles=refined_roles,
+            running_log=running_log,
+            retry_budget=retry_budget,
+        ):
+            yield sse_message
+
+        params.token_usage = token_usage
+        async for sse_message in _stream_final_events(
+            refined_roles=refined_roles,
+            params=params,
+            llm_config=llm_config,
+            running_log=running_log,
+            retry_budget=retry_budget,
+        ):
+            yield sse_message
 
 
 async def _yield_resumption_message(is_resuming: bool) -> AsyncGenerator[str, None]:
@@ -7,6 +7,9 @@ from pydantic import BaseModel
 from sqlalchemy import and_, func, or_
 from sqlalchemy.orm import Query, Session
 
+from resume_editor.app.api.routes.route_logic.resume_structured_data import (
+    STRUCTURED_DATA_VERSION,
+)
 from resume_editor.app.models.resume_model import (
     Resume as DatabaseResume,
 )
@@ -62,6 +65,8 @@ class ResumeCreateParams(BaseModel):
     extracted_work_arrangement: str | None = None
     extracted_location: str | None = None
     extracted_special_instructions: str | None = None
+    # Structured data already built for `content` with `build_structured_data`.
+    structured_data: dict | None = None
 
 
 class ResumeUpdateParams(BaseModel):
@@ -79,6 +84,8 @@ class ResumeUpdateParams(BaseModel):
     extracted_work_arrangement: str | None = None
     extracted_location: str | None = None
     extracted_special_instructions: str | None = None
+    # Structured data already built for `content` with `build_structured_data`.
+    structured_data: dict | None = None
 
 
 def get_week_range(week_offset: int = 0) -> DateRange:
@@ -388,11 +395,12 @@ def create_resume(
 
     Notes:
         1. Create a new DatabaseResume instance with all provided details.
-        2. Add the instance to the database session.
-        3. Commit the transaction to persist the changes.
-        4. Refresh the instance to ensure it has the latest state, including the generated ID.
-        5. Return the created resume.
-        6. This function performs a database write operation.
+        2. Store the structured data supplied with the content using _store_structured_data.
+        3. Add the instance to the database session.
+        4. Commit the transaction to persist the changes.
+        5. Refresh the instance to ensure it has the latest state, including the generated ID.
+        6. Return the created resume.
+        7. This function performs a database write operation.
 
     """
     resume_data = ResumeData(
@@ -414,6 +422,7 @@ def create_resume(
         extracted_special_instructions=params.extracted_special_instructions,
     )
     resume = DatabaseResume(data=resume_data)
+    _store_structured_data(resume, params.structured_data)
     db.add(resume)
     db.commit()
     db.refresh(resume)
@@ -441,6 +450,49 @@ def _apply_resume_field_update(
         setattr(resume, field_name, value)
 
 
+def _store_structured_data(
+    resume: DatabaseResume,
+    structured_data: dict | None,
+) -> None:
+    """Assign structured data built by the caller to a resume.
+
+    Args:
+        resume (DatabaseResume): The resume whose content has been set or changed.
+        structured_data (dict | None): The structured data built for the content with
+            `build_structured_data`, or None if none is available.
+
+    Notes:
+        1. Does not parse; callers build the structured data off the event loop.
+        2. Missing structured data clears both columns, so reads fall back to parsing
+           the Markdown and `manage.py backfill-structured-data` picks the row up.
+
+    """
+    resume.structured_data = structured_data
+    resume.structured_data_version = (
+        STRUCTURED_DATA_VERSION if structured_data is not None else None
+    )
+
+
+def _update_structured_data(
+    resume: DatabaseResume,
+    params: ResumeUpdateParams,
+) -> None:
+    """Bring the structured data of a resume in line with updated content.
+
+    Args:
+        resume (DatabaseResume): The resume being updated.
+        params (ResumeUpdateParams): The update being applied.
+
+    Notes:
+        1. If the content is not being updated, do nothing.
+        2. Otherwise store the structured data supplied with the content using _store_structured_data.
+
+    """
+    if params.content is None:
+        return
+    _store_structured_data(resume, params.structured_data)
+
+
 def update_resume(
     db: Session,
     resume: DatabaseResume,
@@ -458,10 +510,11 @@ def update_resume(
 
     Notes:
         1. Apply updates for each field using _apply_resume_field_update.
-        2. Commit the transaction to save the changes to the database.
-        3. Refresh the resume object to ensure it reflects the latest state.
-        4. Return the updated resume.
-        5. This function performs a database write operation.
+        2. If the content changed, update the structured sections using _update_structured_data.
+        3. Commit the transaction to save the changes to the database.
+        4. Refresh the resume object to ensure it reflects the latest state.
+        5. Return the updated resume.
+        6. This function performs a database write operation.
 
     """
     _apply_resume_field_update(resume, "name", params.name)
@@ -486,6 +539,7 @@ def update_resume(
     _apply_resume_field_update(
         resume, "extracted_special_instructions", params.extracted_special_instructions
     )
+    _update_structured_data(resume, params)
     db.commit()
     db.refresh(resume)
     return resume
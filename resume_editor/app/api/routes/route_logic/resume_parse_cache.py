@@ -0,0 +1,290 @@
+"""Content-hash keyed cache for parsed resume structures."""
+
+import copy
+import hashlib
+import logging
+import sys
+import threading
+import types
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+log = logging.getLogger(__name__)
+
+DEFAULT_PARSE_CACHE_MAX_ENTRIES = 256
+DEFAULT_PARSE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+# Shared by every value that references them, so never charged to an entry.
+_UNSIZED_TYPES = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+)
+
+
+@dataclass(frozen=True)
+class ParseCacheStats:
+    """Point-in-time counters for a ResumeParseCache.
+
+    Attributes:
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups that required a fresh computation.
+        evictions (int): Number of entries dropped to honour the size or byte cap.
+        entries (int): Number of entries currently held.
+        total_bytes (int): Estimated bytes currently held by the cached values.
+
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    total_bytes: int
+
+
+@dataclass
+class _CacheEntry:
+    """A single cached value and its accounted size.
+
+    Attributes:
+        value (Any): The cached value; never handed out directly.
+        size (int): The estimated size of the value, charged against the byte cap.
+
+    """
+
+    value: Any
+    size: int
+
+
+def content_hash(content: str) -> str:
+    """Compute the cache key digest for resume content.
+
+    Args:
+        content (str): The resume Markdown content.
+
+    Returns:
+        str: The hex SHA-256 digest of the UTF-8 encoded content.
+
+    """
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _referents(value: object) -> list[object]:
+    """Return the objects a value holds references to.
+
+    Args:
+        value (object): A container or plain object.
+
+    Returns:
+        list[object]: The items of a container, or the attributes of an object.
+
+    """
+    if isinstance(value, dict):
+        return [*value.keys(), *value.values()]
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return list(value)
+    attributes = getattr(value, "__dict__", None)
+    return list(attributes.values()) if isinstance(attributes, dict) else []
+
+
+def estimate_size(value: object) -> int:
+    """Estimate the memory held by a value and everything it references.
+
+    Args:
+        value (object): The value to measure.
+
+    Returns:
+        int: The summed `sys.getsizeof` of every distinct object reachable from
+            the value through containers and instance attributes.
+
+    Notes:
+        1. Objects reached more than once are counted once.
+        2. Classes, functions and modules are not followed or counted.
+
+    """
+    seen: set[int] = set()
+    pending = [value]
+    total = 0
+    while pending:
+        current = pending.pop()
+        if id(current) in seen or isinstance(current, _UNSIZED_TYPES):
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+        pending.extend(_referents(current))
+    return total
+
+
+class ResumeParseCache:
+    """Bounded LRU cache of parse results keyed by a hash of the resume content.
+
+    Parsing the same resume content repeatedly (for example once per extracted
+    section during an export) is expensive. This cache stores the result of a
+    computation for a given (content hash, kind) pair and answers subsequent
+    lookups from memory.
+
+    Attributes:
+        max_entries (int): Maximum number of entries held before eviction.
+        max_bytes (int): Maximum estimated size of the cached values before eviction.
+
+    Notes:
+        1. Keys are (SHA-256 of content, kind) so several derived forms of the same content can coexist.
+        2. Every lookup returns a deep copy, so callers own their result and can never
+           modify the stored value.
+        3. Each entry is charged the `estimate_size` of its value.
+        4. Entries are evicted least-recently-used first when either cap is exceeded.
+        5. Exceptions raised by the computation are propagated and nothing is cached.
+        6. All operations are protected by a threading.Lock for thread safety.
+
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_PARSE_CACHE_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_PARSE_CACHE_MAX_BYTES,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries (int): Maximum number of entries held before eviction.
+            max_bytes (int): Maximum estimated size of the cached values before eviction.
+
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[str, str], _CacheEntry] = OrderedDict()
+        self._total_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def _lookup(self, key: tuple[str, str]) -> tuple[bool, Any]:
+        """Look up a key and record a hit or miss.
+
+        Args:
+            key (tuple[str, str]): The (content hash, kind) key.
+
+        Returns:
+            tuple[bool, Any]: Whether the key was found, and the stored value if so.
+
+        Notes:
+            1. On a hit, moves the entry to the most-recently-used position.
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return True, entry.value
+
+    def _evict_over_limits(self) -> None:
+        """Evict least-recently-used entries until both caps are honoured.
+
+        Notes:
+            1. Must be called with the lock held.
+
+        """
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes
+        ):
+            _, evicted = self._entries.popitem(last=False)
+            self._total_bytes -= evicted.size
+            self._evictions += 1
+
+    def _store(self, key: tuple[str, str], value: Any) -> None:
+        """Store a value under a key.
+
+        Args:
+            key (tuple[str, str]): The (content hash, kind) key.
+            value (Any): The value to store.
+
+        Notes:
+            1. Values whose estimated size exceeds the byte cap are not stored.
+            2. Replaces any existing entry for the key.
+            3. Evicts least-recently-used entries if a cap is exceeded.
+
+        """
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            return
+        stored = _CacheEntry(value=value, size=size)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= previous.size
+            self._entries[key] = stored
+            self._total_bytes += size
+            self._evict_over_limits()
+
+    def get_or_compute(
+        self,
+        content: str,
+        kind: str,
+        compute: Callable[[str], Any],
+    ) -> Any:
+        """Return the cached result for content, computing and storing it on a miss.
+
+        Args:
+            content (str): The resume Markdown content used as the cache key.
+            kind (str): A label distinguishing different computations over the same content.
+            compute (Callable[[str], Any]): Function called with the content on a miss.
+
+        Returns:
+            Any: A deep copy of the result, owned by the caller.
+
+        Raises:
+            Exception: Any exception raised by `compute` is propagated and nothing is cached.
+
+        Notes:
+            1. Hashes the content and looks up (hash, kind).
+            2. On a hit, returns a deep copy of the stored value.
+            3. On a miss, calls `compute`, stores the value, and returns a deep copy of it.
+
+        """
+        key = (content_hash(content), kind)
+        found, value = self._lookup(key)
+        if found:
+            _msg = f"ResumeParseCache hit for kind '{kind}'"
+            log.debug(_msg)
+            return copy.deepcopy(value)
+
+        _msg = f"ResumeParseCache miss for kind '{kind}'"
+        log.debug(_msg)
+        value = compute(content)
+        self._store(key, value)
+        return copy.deepcopy(value)
+
+    def stats(self) -> ParseCacheStats:
+        """Return a snapshot of the cache counters.
+
+        Returns:
+            ParseCacheStats: Hits, misses, evictions, entry count and byte total.
+
+        """
+        with self._lock:
+            return ParseCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                total_bytes=self._total_bytes,
+            )
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+
+# Module-level singleton instance
+resume_parse_cache = ResumeParseCache()
@@ -0,0 +1,336 @@
+"""Worker pool for CPU-bound resume parsing and serialization."""
+
+import asyncio
+import functools
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from fastapi import HTTPException
+from pydantic import BaseModel
+
+log = logging.getLogger(__name__)
+
+ParseExecutorKind = Literal["thread", "process"]
+
+DEFAULT_PARSE_EXECUTOR_KIND: ParseExecutorKind = "thread"
+DEFAULT_PARSE_EXECUTOR_WORKERS = 4
+
+
+@dataclass(frozen=True)
+class ParseExecutorStats:
+    """Point-in-time counters for a ResumeParseExecutor.
+
+    Attributes:
+        kind (str): The pool kind, "thread" or "process".
+        max_workers (int): The number of workers in the pool.
+        submitted (int): Number of tasks submitted.
+        completed (int): Number of tasks that returned a result.
+        failed (int): Number of tasks that raised an exception.
+        in_flight (int): Number of tasks submitted but not yet finished.
+        queue_depth (int): Number of in-flight tasks waiting for a free worker.
+        max_queue_depth (int): The largest queue depth observed.
+        total_wait_ms (float): Summed time tasks spent queued before a worker started them.
+        max_wait_ms (float): The longest time a single task spent queued.
+
+    """
+
+    kind: str
+    max_workers: int
+    submitted: int
+    completed: int
+    failed: int
+    in_flight: int
+    queue_depth: int
+    max_queue_depth: int
+    total_wait_ms: float
+    max_wait_ms: float
+
+
+@dataclass(frozen=True)
+class _WorkerHTTPError:
+    """A picklable stand-in for an HTTPException raised inside a worker.
+
+    Attributes:
+        status_code (int): The status code of the original exception.
+        detail (Any): The detail of the original exception.
+
+    """
+
+    status_code: int
+    detail: Any
+
+
+@dataclass(frozen=True)
+class _DumpedModel:
+    """A pydantic result dumped for transfer out of a worker process.
+
+    Attributes:
+        model (type[BaseModel]): The model class to validate the data with.
+        data (dict): The output of `model_dump` on the original result.
+
+    """
+
+    model: type[BaseModel]
+    data: dict
+
+
+def _timed_call(
+    func: Callable[..., Any],
+    args: tuple,
+    kwargs: dict,
+    dump_models: bool,
+) -> tuple[float, Any]:
+    """Run a task inside a worker and record when it started.
+
+    Args:
+        func (Callable[..., Any]): The task to run.
+        args (tuple): Positional arguments for the task.
+        kwargs (dict): Keyword arguments for the task.
+        dump_models (bool): Whether to dump a pydantic result for transfer to another process.
+
+    Returns:
+        tuple[float, Any]: The wall-clock start time and the task result.
+
+    Notes:
+        1. Uses wall-clock time so the start can be compared across processes.
+        2. An HTTPException is returned as `_WorkerHTTPError`, as it cannot be pickled.
+
+    """
+    started = time.time()
+    try:
+        result = func(*args, **kwargs)
+    except HTTPException as e:
+        return started, _WorkerHTTPError(status_code=e.status_code, detail=e.detail)
+    if dump_models and isinstance(result, BaseModel):
+        result = _DumpedModel(model=type(result), data=result.model_dump())
+    return started, result
+
+
+def _unwrap_result(result: Any) -> Any:
+    """Turn a worker result back into what the task returned or raised.
+
+    Args:
+        result (Any): The result returned by `_timed_call`.
+
+    Returns:
+        Any: The task result, with dumped models validated again.
+
+    Raises:
+        HTTPException: If the task raised an HTTPException.
+
+    """
+    if isinstance(result, _WorkerHTTPError):
+        raise HTTPException(status_code=result.status_code, detail=result.detail)
+    if isinstance(result, _DumpedModel):
+        return result.model.model_validate(result.data)
+    return result
+
+
+class ResumeParseExecutor:
+    """Configurable worker pool that keeps resume parsing off the event loop.
+
+    Parsing and serializing resume Markdown is CPU-bound. Running it directly in an
+    `async def` route blocks the event loop for every other connection, including
+    live SSE streams. This class runs such work in a thread or process pool and
+    records queue depth and wait time.
+
+    Attributes:
+        kind (str): The pool kind, "thread" or "process".
+        max_workers (int): The number of workers in the pool.
+
+    Notes:
+        1. The pool is created on first use and recreated after `configure` or `shutdown`.
+        2. With a process pool, tasks and their arguments must be picklable; pydantic
+           results are dumped in the worker and validated again in the caller.
+        3. Queue depth is the number of in-flight tasks beyond the worker count.
+        4. Wait time is measured from submission until a worker starts the task.
+        5. All bookkeeping is protected by a threading.Lock for thread safety.
+
+    """
+
+    def __init__(
+        self,
+        kind: ParseExecutorKind = DEFAULT_PARSE_EXECUTOR_KIND,
+        max_workers: int = DEFAULT_PARSE_EXECUTOR_WORKERS,
+    ) -> None:
+        """Initialize the executor without starting any workers.
+
+        Args:
+            kind (ParseExecutorKind): The pool kind, "thread" or "process".
+            max_workers (int): The number of workers in the pool.
+
+        """
+        self.kind = kind
+        self.max_workers = max_workers
+        self._pool: Executor | None = None
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._max_queue_depth = 0
+        self._total_wait_ms = 0.0
+        self._max_wait_ms = 0.0
+        self._lock = threading.Lock()
+
+    def configure(self, kind: ParseExecutorKind, max_workers: int) -> None:
+        """Change the pool kind and size, replacing any running pool.
+
+        Args:
+            kind (ParseExecutorKind): The pool kind, "thread" or "process".
+            max_workers (int): The number of workers in the pool.
+
+        Raises:
+            ValueError: If the kind is unknown or max_workers is less than 1.
+
+        """
+        if kind not in ("thread", "process") or max_workers < 1:
+            _msg = f"Invalid parse executor configuration: {kind!r}, {max_workers!r}"
+            raise ValueError(_msg)
+        self.shutdown()
+        with self._lock:
+            self.kind = kind
+            self.max_workers = max_workers
+        _msg = f"ResumeParseExecutor configured: kind={kind}, max_workers={max_workers}"
+        log.info(_msg)
+
+    def _get_pool(self) -> Executor:
+        """Return the running pool, creating it if needed.
+
+        Returns:
+            Executor: The thread or process pool.
+
+        Notes:
+            1. Must be called with the lock held.
+
+        """
+        if self._pool is None:
+            pool_class = (
+                ProcessPoolExecutor if self.kind == "process" else ThreadPoolExecutor
+            )
+            self._pool = pool_class(max_workers=self.max_workers)
+        return self._pool
+
+    def _queue_depth(self) -> int:
+        """Return the number of in-flight tasks waiting for a worker.
+
+        Notes:
+            1. Must be called with the lock held.
+
+        """
+        in_flight = self._submitted - self._completed - self._failed
+        return max(in_flight - self.max_workers, 0)
+
+    def _record_finish(self, submitted_at: float, started_at: float, failed: bool) -> None:
+        """Record a finished task and how long it waited.
+
+        Args:
+            submitted_at (float): Wall-clock time the task was submitted.
+            started_at (float): Wall-clock time a worker started the task.
+            failed (bool): Whether the task raised an exception.
+
+        """
+        wait_ms = max(started_at - submitted_at, 0.0) * 1000
+        with self._lock:
+            if failed:
+                self._failed += 1
+            else:
+                self._completed += 1
+            self._total_wait_ms += wait_ms
+            self._max_wait_ms = max(self._max_wait_ms, wait_ms)
+        _msg = f"ResumeParseExecutor task waited {wait_ms:.1f}ms"
+        log.debug(_msg)
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a CPU-bound task in the pool without blocking the event loop.
+
+        Args:
+            func (Callable[..., Any]): The task to run; module-level for a process pool.
+            *args (Any): Positional arguments for the task.
+            **kwargs (Any): Keyword arguments for the task.
+
+        Returns:
+            Any: The result of the task.
+
+        Raises:
+            Exception: Any exception raised by the task is propagated.
+
+        Notes:
+            1. Records the submission and updates the maximum queue depth.
+            2. Awaits the task in the pool and records its wait time.
+            3. A task that raises before reporting its start is charged no wait time.
+
+        """
+        with self._lock:
+            pool = self._get_pool()
+            dump_models = self.kind == "process"
+            self._submitted += 1
+            self._max_queue_depth = max(self._max_queue_depth, self._queue_depth())
+
+        submitted_at = time.time()
+        call = functools.partial(_timed_call, func, args, kwargs, dump_models)
+        try:
+            started_at, result = await asyncio.get_running_loop().run_in_executor(
+                pool,
+                call,
+            )
+        except BaseException:
+            self._record_finish(submitted_at, submitted_at, failed=True)
+            raise
+
+        self._record_finish(
+            submitted_at,
+            started_at,
+            failed=isinstance(result, _WorkerHTTPError),
+        )
+        return _unwrap_result(result)
+
+    def stats(self) -> ParseExecutorStats:
+        """Return a snapshot of the executor counters.
+
+        Returns:
+            ParseExecutorStats: Task counts, queue depth and wait times.
+
+        """
+        with self._lock:
+            return ParseExecutorStats(
+                kind=self.kind,
+                max_workers=self.max_workers,
+                submitted=self._submitted,
+                completed=self._completed,
+                failed=self._failed,
+                in_flight=self._submitted - self._completed - self._failed,
+                queue_depth=self._queue_depth(),
+                max_queue_depth=self._max_queue_depth,
+                total_wait_ms=self._total_wait_ms,
+                max_wait_ms=self._max_wait_ms,
+            )
+
+    def shutdown(self) -> None:
+        """Stop the running pool, if any, waiting for queued tasks to finish."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+
+# Module-level singleton instance
+resume_parse_executor = ResumeParseExecutor()
+
+
+async def run_parse_task(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a CPU-bound parse or serialize task on the shared executor.
+
+    Args:
+        func (Callable[..., Any]): The task to run; module-level for a process pool.
+        *args (Any): Positional arguments for the task.
+        **kwargs (Any): Keyword arguments for the task.
+
+    Returns:
+        Any: The result of the task.
+
+    """
+    return await resume_parse_executor.run(func, *args, **kwargs)
@@ -5,40 +5,40 @@ from fastapi import HTTPException
 from resume_writer.models.parsers import ParseContext
 from resume_writer.models.resume import Resume as WriterResume
 
-from resume_editor.app.api.routes.route_logic.resume_serialization import (
-    extract_certifications_info,
-    extract_education_info,
-    extract_experience_info,
-    extract_personal_info,
+from resume_editor.app.api.routes.route_logic.resume_parse_cache import (
+    resume_parse_cache,
+)
+from resume_editor.app.api.routes.route_logic.resume_section_extraction import (
+    extract_all_sections,
+)
+from resume_editor.app.api.routes.route_logic.resume_section_index import (
+    get_section_index,
 )
 
 log = logging.getLogger(__name__)
 
+TRIMMED_WRITER_RESUME_CACHE_KIND = "writer_resume_trimmed"
+VALIDATED_CONTENT_CACHE_KIND = "validated_content"
+
 
-def _find_first_valid_header_index(lines: list[str], valid_headers: set[str]) -> int:
-    """Find the index of the first valid top-level section header.
+def _find_first_valid_header_offset(markdown_content: str, valid_headers: set[str]) -> int:
+    """Find the offset of the first valid top-level section header.
 
     Args:
-        lines (list[str]): The lines of Markdown content to search.
+        markdown_content (str): The Markdown content to search.
         valid_headers (set[str]): A set of valid header names (lowercase).
 
     Returns:
-        int: The index of the first valid header, or -1 if none found.
+        int: The character offset of the first valid header line, or -1 if none found.
 
     Notes:
-        1. Iterate through each line.
-        2. Check if line starts with "# " but not "##" (top-level header).
-        3. Extract header name and check if it's in valid_headers.
-        4. Return the index of the first match, or -1 if no match found.
+        1. Look up the shared section index for the content.
+        2. Return the start offset of the first section whose name is in valid_headers.
+        3. Return -1 if no section matches.
 
     """
-    for i, line in enumerate(lines):
-        stripped_line = line.strip()
-        if stripped_line.startswith("# ") and not stripped_line.startswith("##"):
-            header_name = stripped_line[2:].lower()
-            if header_name in valid_headers:
-                return i
-    return -1
+    span = get_section_index(markdown_content).first_of(valid_headers)
+    return span.start if span is not None else -1
 
 
 def _has_valid_resume_sections(parsed_resume: WriterResume) -> bool:
@@ -68,6 +68,33 @@ def _has_valid_resume_sections(parsed_resume: WriterResume) -> bool:
     )
 
 
+def _parse_from_first_valid_header(markdown_content: str) -> WriterResume:
+    """Parse Markdown resume content starting at the first valid section header.
+
+    Args:
+        markdown_content (str): The Markdown content to parse.
+
+    Returns:
+        WriterResume: The parsed resume object, which may contain no sections.
+
+    Notes:
+        1. Find the first valid section header using _find_first_valid_header_offset.
+        2. Truncate the content to start from the valid header if found.
+        3. Split the content into individual lines.
+        4. Create a ParseContext and parse into a WriterResume object.
+
+    """
+    valid_headers = set(WriterResume.expected_blocks().keys())
+
+    first_valid_offset = _find_first_valid_header_offset(markdown_content, valid_headers)
+    if first_valid_offset != -1:
+        markdown_content = markdown_content[first_valid_offset:]
+
+    lines = markdown_content.split("\n")
+    parse_context = ParseContext(lines, 1)
+    return WriterResume.parse(parse_context)
+
+
 def parse_resume_to_writer_object(markdown_content: str) -> WriterResume:
     """Parse Markdown resume content into a resume_writer Resume object.
 
@@ -81,24 +108,18 @@ def parse_resume_to_writer_object(markdown_content: str) -> WriterResume:
         ValueError: If the parsed content contains no valid resume sections.
 
     Notes:
-        1. Split the input Markdown content into individual lines.
-        2. Find the first valid section header using _find_first_valid_header_index.
-        3. Truncate lines to start from the valid header if found.
-        4. Create a ParseContext and parse into a WriterResume object.
-        5. Validate that at least one section was parsed using _has_valid_resume_sections.
-        6. Raise ValueError if no valid sections were parsed.
-        7. Return the fully parsed WriterResume object.
+        1. Look up the content in the shared parse cache.
+        2. On a miss, parse with _parse_from_first_valid_header and cache the result.
+        3. Validate that at least one section was parsed using _has_valid_resume_sections.
+        4. Raise ValueError if no valid sections were parsed.
+        5. Return the caller-owned WriterResume object.
 
     """
-    lines = markdown_content.split("\n")
-    valid_headers = set(WriterResume.expected_blocks().keys())
-
-    first_valid_index = _find_first_valid_header_index(lines, valid_headers)
-    if first_valid_index != -1:
-        lines = lines[first_valid_index:]
-
-    parse_context = ParseContext(lines, 1)
-    parsed_resume = WriterResume.parse(parse_context)
+    parsed_resume = resume_parse_cache.get_or_compute(
+        content=markdown_content,
+        kind=TRIMMED_WRITER_RESUME_CACHE_KIND,
+        compute=_parse_from_first_valid_header,
+    )
 
     if not _has_valid_resume_sections(parsed_resume):
         raise ValueError("No valid resume sections found in content.")
@@ -125,7 +146,7 @@ def parse_resume(markdown_content: str) -> dict[str, Any]:
 
     Notes:
         1. Log the start of the parsing process.
-        2. Call a series of extraction functions to get serializable Pydantic models.
+        2. Call `extract_all_sections` to get serializable Pydantic models from a single parse.
         3. Construct a dictionary from these models.
         4. Log successful completion.
         5. Return the dictionary representation.
@@ -136,10 +157,11 @@ def parse_resume(markdown_content: str) -> dict[str, Any]:
     log.debug(_msg)
 
     try:
-        personal_info = extract_personal_info(markdown_content)
-        education_info = extract_education_info(markdown_content)
-        experience_info = extract_experience_info(markdown_content)
-        certifications_info = extract_certifications_info(markdown_content)
+        sections = extract_all_sections(markdown_content)
+        personal_info = sections.personal
+        education_info = sections.education
+        experience_info = sections.experience
+        certifications_info = sections.certifications
 
         resume_dict = {
             "personal": personal_info,
@@ -222,11 +244,114 @@ def parse_resume_content(markdown_content: str) -> dict[str, Any]:
         ) from e
 
 
-def validate_resume_content(content: str) -> None:
+def _changed_sections_content(content: str, original_content: str) -> str | None:
+    """Collect the top-level sections whose text differs from the original content.
+
+    Args:
+        content (str): The new resume Markdown content.
+        original_content (str): The previously saved resume Markdown content.
+
+    Returns:
+        str | None: The changed sections concatenated in document order, an empty string if
+            no section changed, or None if the sections were added, removed or reordered.
+
+    Notes:
+        1. Compares sections by their offsets in the shared section index of each content.
+        2. Text before the first header is ignored, as the parser skips it.
+
+    """
+    spans = get_section_index(content).spans
+    original_spans = get_section_index(original_content).spans
+    if [span.name for span in spans] != [span.name for span in original_spans]:
+        return None
+
+    return "".join(
+        content[span.start : span.end]
+        for span, original in zip(spans, original_spans, strict=True)
+        if content[span.start : span.end] != original_content[original.start : original.end]
+    )
+
+
+def _parse_for_validation(content: str) -> bool:
+    """Parse content solely to check that it is valid.
+
+    Args:
+        content (str): The Markdown content to parse.
+
+    Returns:
+        bool: Always True; invalid content raises instead.
+
+    Raises:
+        ValueError: If the content cannot be parsed.
+
+    """
+    parse_resume(content)
+    return True
+
+
+def _validate_cached(content: str) -> None:
+    """Validate content, answering from the shared parse cache when it was validated before.
+
+    Args:
+        content (str): The Markdown content to validate.
+
+    Raises:
+        ValueError: If the content cannot be parsed.
+
+    Notes:
+        1. Successful validations are cached by content hash; failures are not cached.
+
+    """
+    resume_parse_cache.get_or_compute(
+        content=content,
+        kind=VALIDATED_CONTENT_CACHE_KIND,
+        compute=_parse_for_validation,
+    )
+
+
+def _validate_changed_sections(content: str, original_content: str | None) -> None:
+    """Validate only the sections that changed, falling back to the whole content.
+
+    Args:
+        content (str): The Markdown content to validate.
+        original_content (str | None): The previously saved content, or None to validate everything.
+
+    Raises:
+        ValueError: If the content cannot be parsed.
+
+    Notes:
+        1. Without original content, or if the section layout changed, the whole content is validated.
+        2. If no section changed, nothing is parsed.
+        3. If the changed sections fail on their own, the whole content is validated so that the
+           error reflects the full document.
+
+    """
+    changed = (
+        None
+        if original_content is None
+        else _changed_sections_content(content, original_content)
+    )
+    if changed == "":
+        _msg = "validate_resume_content found no changed sections"
+        log.debug(_msg)
+        return
+    if changed is not None:
+        try:
+            _validate_cached(changed)
+            return
+        except ValueError:
+            _msg = "Changed sections failed alone; validating full content"
+            log.debug(_msg)
+    _validate_cached(content)
+
+
+def validate_resume_content(content: str, original_content: str | None = None) -> None:
     """Validate resume Markdown content for proper format.
 
     Args:
         content (str): The Markdown content to validate, expected to be in a format compatible with resume_writer.
+        original_content (str | None): The previously saved, already valid content. When given, only the
+            top-level sections whose text changed are parsed.
 
     Returns:
         None: The function returns nothing if validation passes.
@@ -236,17 +361,18 @@ def validate_resume_content(content: str) -> None:
 
     Notes:
         1. Log the start of the validation process.
-        2. Attempt to parse the provided content using the parse_resume function.
-        3. If parsing fails, raise an HTTPException with a descriptive error message.
-        4. Log successful completion if no exception is raised.
-        5. No disk, network, or database access is performed.
+        2. Parse the changed sections, or the whole content, using `_validate_changed_sections`.
+        3. Content that was already validated is answered from the shared parse cache by content hash.
+        4. If parsing fails, raise an HTTPException with a descriptive error message.
+        5. Log successful completion if no exception is raised.
+        6. No disk, network, or database access is performed.
 
     """
     _msg = "validate_resume_content starting"
     log.debug(_msg)
 
     try:
-        parse_resume(content)
+        _validate_changed_sections(content, original_content)
         _msg = "validate_resume_content returning successfully"
         log.debug(_msg)
     except ValueError as e:
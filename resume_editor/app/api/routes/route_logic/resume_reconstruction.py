@@ -1,6 +1,10 @@
 import logging
-from typing import Any, Callable
+from collections.abc import Callable, Iterator
+from typing import Any
 
+from resume_editor.app.api.routes.route_logic.resume_section_index import (
+    get_section_index,
+)
 from resume_editor.app.api.routes.route_models import (
     CertificationsResponse,
     EducationResponse,
@@ -11,93 +15,134 @@ from resume_editor.app.api.routes.route_models import (
 log = logging.getLogger(__name__)
 
 
-def _serialize_section_if_present(
+def _iter_serialized_section(
     section_data: Any,
     serializer: Callable[[Any], str],
-) -> str | None:
-    """Serialize a resume section if data is present.
+) -> Iterator[str]:
+    """Serialize a small resume section as a single chunk if data is present.
 
     Args:
         section_data (Any): The section data to serialize, or None.
         serializer (Callable): The function to serialize the section.
 
-    Returns:
-        str | None: The serialized section string, or None if section_data is None or empty.
-
-    Notes:
-        1. If section_data is None, return None.
-        2. Otherwise, call the serializer function with section_data.
-        3. Return the result if it's truthy, otherwise return None.
+    Yields:
+        str: The serialized section, if `section_data` is not None and serializes to non-empty text.
 
     """
     if section_data is None:
-        return None
+        return
     serialized = serializer(section_data)
-    return serialized if serialized else None
+    if serialized:
+        yield serialized
+
 
+def _iter_stripped(chunks: Iterator[str]) -> Iterator[str]:
+    """Strip leading and trailing whitespace from a stream of chunks.
 
-def _collect_resume_sections(
+    Args:
+        chunks (Iterator[str]): The chunks of one serialized section.
+
+    Yields:
+        str: The same text as `"".join(chunks).strip()`, without empty chunks.
+
+    Notes:
+        1. Whitespace at the end of a chunk is held back until more text follows it, and dropped at the end of the stream.
+
+    """
+    pending = ""
+    started = False
+    for chunk in chunks:
+        text = chunk.rstrip()
+        if not started:
+            text = text.lstrip()
+        if text:
+            yield pending + text
+            started = True
+            pending = chunk[len(chunk.rstrip()) :]
+        elif started:
+            pending += chunk
+
+
+def _iter_resume_sections(
     personal_info: PersonalInfoResponse | None,
     education: EducationResponse | None,
     certifications: CertificationsResponse | None,
-    experience: ExperienceResponse | None,
-) -> list[str]:
-    """Collect all non-empty resume sections into a list.
+    experience_chunks: Iterator[str],
+) -> Iterator[str]:
+    """Join serialized resume sections with double newlines, one chunk at a time.
 
     Args:
-        personal_info (PersonalInfoResponse | None): Personal information data.
-        education (EducationResponse | None): Education information data.
-        certifications (CertificationsResponse | None): Certifications information data.
-        experience (ExperienceResponse | None): Experience information data.
+        personal_info (PersonalInfoResponse | None): Personal information data, or None to omit it.
+        education (EducationResponse | None): Education information data, or None to omit it.
+        certifications (CertificationsResponse | None): Certifications information data, or None to omit it.
+        experience_chunks (Iterator[str]): The already serialized experience section, as chunks.
 
-    Returns:
-        list[str]: A list of serialized section strings.
+    Yields:
+        str: Consecutive pieces of the Markdown resume document.
 
     Notes:
-        1. Import serialization functions.
-        2. Serialize each section if present using _serialize_section_if_present.
-        3. Collect all non-None results into a list.
-        4. Return the list of serialized sections.
+        1. Personal, education and certifications are serialized whole.
+        2. Each section is stripped of surrounding whitespace and empty sections are skipped.
+        3. Sections are separated by double newlines.
 
     """
     from resume_editor.app.api.routes.route_logic.resume_serialization import (
         serialize_certifications_to_markdown,
         serialize_education_to_markdown,
-        serialize_experience_to_markdown,
         serialize_personal_info_to_markdown,
     )
 
-    sections = []
-
-    personal_section = _serialize_section_if_present(
-        personal_info,
-        serialize_personal_info_to_markdown,
+    section_streams = (
+        _iter_serialized_section(personal_info, serialize_personal_info_to_markdown),
+        _iter_serialized_section(education, serialize_education_to_markdown),
+        _iter_serialized_section(certifications, serialize_certifications_to_markdown),
+        experience_chunks,
     )
-    if personal_section:
-        sections.append(personal_section)
 
-    education_section = _serialize_section_if_present(
-        education,
-        serialize_education_to_markdown,
-    )
-    if education_section:
-        sections.append(education_section)
+    separator = ""
+    for stream in section_streams:
+        chunks = _iter_stripped(stream)
+        first = next(chunks, None)
+        if first is None:
+            continue
+        yield separator + first
+        yield from chunks
+        separator = "\n\n"
 
-    certifications_section = _serialize_section_if_present(
-        certifications,
-        serialize_certifications_to_markdown,
-    )
-    if certifications_section:
-        sections.append(certifications_section)
 
-    experience_section = _serialize_section_if_present(
-        experience,
-        serialize_experience_to_markdown,
+def iter_resume_markdown(
+    personal_info: PersonalInfoResponse | None = None,
+    education: EducationResponse | None = None,
+    certifications: CertificationsResponse | None = None,
+    experience: ExperienceResponse | None = None,
+) -> Iterator[str]:
+    """Reconstruct a complete resume Markdown document, one chunk at a time.
+
+    Args:
+        personal_info (PersonalInfoResponse | None): Personal information data structure. If None, the personal info section is omitted.
+        education (EducationResponse | None): Education information data structure. If None, the education section is omitted.
+        certifications (CertificationsResponse | None): Certifications information data structure. If None, the certifications section is omitted.
+        experience (ExperienceResponse | None): Experience information data structure, containing roles and projects. If None, the experience section is omitted.
+
+    Yields:
+        str: Consecutive pieces of the Markdown resume document.
+
+    Notes:
+        1. Experience is streamed per role and project via `iter_experience_markdown`.
+        2. Joining the chunks produces exactly the output of `reconstruct_resume_markdown`.
+        3. No network, disk, or database access is performed.
+
+    """
+    from resume_editor.app.api.routes.route_logic.resume_serialization import (
+        iter_experience_markdown,
     )
-    if experience_section:
-        sections.append(experience_section)
 
-    return sections
+    yield from _iter_resume_sections(
+        personal_info,
+        education,
+        certifications,
+        iter_experience_markdown(experience),
+    )
 
 
 def reconstruct_resume_markdown(
@@ -118,21 +163,53 @@ def reconstruct_resume_markdown(
         str: A complete Markdown formatted resume document with all provided sections joined by double newlines.
 
     Notes:
-        1. Collect all sections using _collect_resume_sections.
-        2. Filter out any empty strings and strip whitespace from each section.
-        3. Join all sections with double newlines to ensure proper spacing.
-        4. Return the complete Markdown resume content.
-        5. No network, disk, or database access is performed.
+        1. Serializes experience whole using `serialize_experience_to_markdown`.
+        2. Joins the chunks produced by `_iter_resume_sections` once.
+        3. No network, disk, or database access is performed.
 
     """
-    sections = _collect_resume_sections(
-        personal_info,
-        education,
-        certifications,
-        experience,
+    from resume_editor.app.api.routes.route_logic.resume_serialization import (
+        serialize_experience_to_markdown,
+    )
+
+    return "".join(
+        _iter_resume_sections(
+            personal_info,
+            education,
+            certifications,
+            _iter_serialized_section(experience, serialize_experience_to_markdown),
+        ),
     )
 
-    return "\n\n".join(filter(None, [s.strip() for s in sections]))
+
+def iter_complete_resume_from_sections(
+    personal_info: PersonalInfoResponse,
+    education: EducationResponse,
+    certifications: CertificationsResponse,
+    experience: ExperienceResponse,
+) -> Iterator[str]:
+    """Stream a complete resume Markdown document from all structured sections.
+
+    Args:
+        personal_info (PersonalInfoResponse): Personal information data structure.
+        education (EducationResponse): Education information data structure.
+        certifications (CertificationsResponse): Certifications information data structure.
+        experience (ExperienceResponse): Experience information data structure.
+
+    Returns:
+        Iterator[str]: Chunks that join to the output of `build_complete_resume_from_sections`.
+
+    Notes:
+        1. Delegates to `iter_resume_markdown`; serialization happens as the iterator is consumed.
+        2. No network, disk, or database access is performed.
+
+    """
+    return iter_resume_markdown(
+        personal_info=personal_info,
+        education=education,
+        certifications=certifications,
+        experience=experience,
+    )
 
 
 def build_complete_resume_from_sections(
@@ -165,3 +242,69 @@ def build_complete_resume_from_sections(
         certifications=certifications,
         experience=experience,
     )
+
+
+def _section_splice_text(serialized: str, is_last: bool, content: str) -> str:
+    """Format a serialized section for insertion at an existing section's offsets.
+
+    Args:
+        serialized (str): The newly serialized section Markdown.
+        is_last (bool): Whether the replaced section runs to the end of the content.
+        content (str): The original resume content.
+
+    Returns:
+        str: The text to insert, or an empty string to remove the section.
+
+    Notes:
+        1. Strip surrounding whitespace from the serialized section.
+        2. An empty section is removed entirely.
+        3. A section followed by another keeps a single blank line before the next header.
+        4. A final section keeps the original content's trailing newline, if any.
+
+    """
+    text = serialized.strip()
+    if not text:
+        return ""
+    if not is_last:
+        return text + "\n\n"
+    return text + "\n" if content.endswith("\n") else text
+
+
+def splice_resume_sections(
+    current_content: str,
+    serialized_sections: dict[str, str],
+) -> str | None:
+    """Replace individual top-level sections in place, leaving all other text untouched.
+
+    Args:
+        current_content (str): The original resume Markdown content.
+        serialized_sections (dict[str, str]): Newly serialized Markdown keyed by section name
+            (e.g., "experience").
+
+    Returns:
+        str | None: The content with each section replaced at its original offsets, or None if
+            any section could not be located in the original content.
+
+    Notes:
+        1. Look up each section's offsets in the shared section index.
+        2. Return None if any section is missing so the caller can rebuild the whole document.
+        3. Replace sections from the end of the document backwards so earlier offsets stay valid.
+        4. No network, disk, or database access is performed.
+
+    """
+    index = get_section_index(current_content)
+    spans = {name: index.get(name) for name in serialized_sections}
+    if any(span is None for span in spans.values()):
+        _msg = "splice_resume_sections could not locate every section"
+        log.debug(_msg)
+        return None
+
+    result = current_content
+    for name, span in sorted(spans.items(), key=lambda item: item[1].start, reverse=True):
+        replacement = _section_splice_text(
+            serialized=serialized_sections[name],
+            is_last=span.end == len(current_content),
+            content=current_content,
+        )
+        result = result[: span.start] + replacement + result[span.end :]
+    return result
@@ -0,0 +1,471 @@
+"""Extraction of structured section responses from resume Markdown."""
+
+import logging
+
+from resume_editor.app.api.routes.route_logic.resume_serialization_helpers import (
+    _check_for_unparsed_content,
+    _convert_writer_project_to_dict,
+    _convert_writer_role_to_dict,
+    _extract_data_from_personal_section,
+    _parse_resume,
+    _projects_scoped_content,
+    _section_scoped_content,
+)
+from resume_editor.app.api.routes.route_models import (
+    CertificationsResponse,
+    EducationResponse,
+    ExperienceResponse,
+    PersonalInfoResponse,
+    ProjectsResponse,
+    ResumeSectionsResponse,
+)
+
+log = logging.getLogger(__name__)
+
+RESUME_SECTION_NAMES = ("personal", "education", "experience", "certifications")
+
+
+def _build_personal_info_response(
+    parsed_resume: object,
+    resume_content: str,
+) -> PersonalInfoResponse:
+    """Build the personal information response from an already parsed resume.
+
+    Args:
+        parsed_resume (object): The parsed resume object returned by `_parse_resume`.
+        resume_content (str): The Markdown content the resume was parsed from.
+
+    Returns:
+        PersonalInfoResponse: Extracted personal information.
+
+    Raises:
+        ValueError: If the personal section contains content that could not be parsed.
+
+    Notes:
+        1. Extracts data from the parsed personal section using `_extract_data_from_personal_section`.
+        2. If no data was extracted, checks for unparsed content in the "personal" section.
+        3. Constructs and returns a `PersonalInfoResponse` with the extracted data.
+
+    """
+    personal = getattr(parsed_resume, "personal", None)
+    data = _extract_data_from_personal_section(personal)
+
+    if not data:
+        # If no data was extracted from the 'personal' object, it implies
+        # that either the section is genuinely empty or contains unparseable content.
+        # We must manually check for the presence of raw, unparsed content.
+        # Passing 'None' to '_check_for_unparsed_content' forces it to perform this scan.
+        _check_for_unparsed_content(resume_content, "personal", None)
+
+    return PersonalInfoResponse(**data)
+
+
+def extract_personal_info(resume_content: str) -> PersonalInfoResponse:
+    """Extract personal information from resume content.
+
+    Args:
+        resume_content (str): The Markdown content of the resume to parse.
+
+    Returns:
+        PersonalInfoResponse: Extracted personal information containing name, email, phone, location, and website.
+
+    Raises:
+        ValueError: If parsing fails due to invalid or malformed resume content.
+
+    Notes:
+        1. Scopes the content to the personal section using `_section_scoped_content`.
+        2. Parses the scoped content using `_parse_resume`.
+        3. Builds the response using `_build_personal_info_response`.
+
+    """
+    log.debug("extract_personal_info starting")
+    section_content = _section_scoped_content(resume_content, "personal")
+    try:
+        parsed_resume = _parse_resume(section_content)
+    except ValueError as e:
+        _msg = "Failed to parse personal info from resume content."
+        raise ValueError(_msg) from e
+
+    response = _build_personal_info_response(parsed_resume, section_content)
+    log.debug("extract_personal_info returning")
+    return response
+
+
+def _build_education_response(parsed_resume: object) -> EducationResponse:
+    """Build the education response from an already parsed resume.
+
+    Args:
+        parsed_resume (object): The parsed resume object returned by `_parse_resume`.
+
+    Returns:
+        EducationResponse: Extracted education information containing a list of degree entries.
+
+    Notes:
+        1. Retrieves the education section from the parsed resume.
+        2. Checks if education data is present; if not, returns an empty response.
+        3. Maps each degree's school, degree, major, start_date, end_date, and gpa into a dictionary.
+        4. Returns the list of dictionaries wrapped in the EducationResponse model.
+
+    """
+    education = parsed_resume.education
+
+    if not education or not hasattr(education, "degrees") or not education.degrees:
+        return EducationResponse(degrees=[])
+
+    degrees_list = []
+    for degree in education.degrees:
+        degrees_list.append(
+            {
+                "school": degree.school if degree.school else None,
+                "degree": degree.degree if degree.degree else None,
+                "major": degree.major if degree.major else None,
+                "start_date": degree.start_date,
+                "end_date": degree.end_date,
+                "gpa": degree.gpa if degree.gpa else None,
+            },
+        )
+
+    return EducationResponse(degrees=degrees_list)
+
+
+def extract_education_info(resume_content: str) -> EducationResponse:
+    """Extract education information from resume content.
+
+    Args:
+        resume_content (str): The Markdown content of the resume to parse.
+
+    Returns:
+        EducationResponse: Extracted education information containing a list of degree entries.
+
+    Raises:
+        ValueError: If parsing fails due to invalid or malformed resume content.
+
+    Notes:
+        1. Scopes the content to the education section using `_section_scoped_content`.
+        2. Parses the scoped content using `_parse_resume`.
+        3. Builds the response using `_build_education_response`.
+        4. No network, disk, or database access is performed during this function.
+
+    """
+    section_content = _section_scoped_content(resume_content, "education")
+    try:
+        parsed_resume = _parse_resume(section_content)
+    except ValueError as e:
+        _msg = "Failed to parse education info from resume content."
+        raise ValueError(_msg) from e
+
+    return _build_education_response(parsed_resume)
+
+
+def _extract_roles_list(experience: any) -> list[dict]:
+    """Extract roles from experience object into a list of dictionaries.
+
+    Args:
+        experience: The experience object from parsed resume, may be None.
+
+    Returns:
+        list[dict]: List of role dictionaries extracted from the experience.
+
+    Notes:
+        1. Returns empty list if experience is None or has no roles attribute.
+        2. Iterates through each role in experience.roles.
+        3. Converts each role to dictionary using `_convert_writer_role_to_dict`.
+        4. Filters out empty dictionaries.
+        5. Returns the collected list of role dictionaries.
+
+    """
+    roles_list = []
+    if experience and hasattr(experience, "roles") and experience.roles is not None:
+        for role in experience.roles:
+            role_dict = _convert_writer_role_to_dict(role)
+            if role_dict:
+                roles_list.append(role_dict)
+    return roles_list
+
+
+def _extract_projects_list(experience: any) -> list[dict]:
+    """Extract projects from experience object into a list of dictionaries.
+
+    Args:
+        experience: The experience object from parsed resume, may be None.
+
+    Returns:
+        list[dict]: List of project dictionaries extracted from the experience.
+
+    Notes:
+        1. Returns empty list if experience is None or has no projects attribute.
+        2. Iterates through each project in experience.projects.
+        3. Converts each project to dictionary using `_convert_writer_project_to_dict`.
+        4. Filters out empty dictionaries.
+        5. Returns the collected list of project dictionaries.
+
+    """
+    projects_list = []
+    if (
+        experience
+        and hasattr(experience, "projects")
+        and experience.projects is not None
+    ):
+        for project in experience.projects:
+            project_dict = _convert_writer_project_to_dict(project)
+            if project_dict:
+                projects_list.append(project_dict)
+    return projects_list
+
+
+def _build_experience_response(
+    parsed_resume: object,
+    resume_content: str,
+) -> ExperienceResponse:
+    """Build the experience response from an already parsed resume.
+
+    Args:
+        parsed_resume (object): The parsed resume object returned by `_parse_resume`.
+        resume_content (str): The Markdown content the resume was parsed from.
+
+    Returns:
+        ExperienceResponse: Extracted experience information containing lists of roles and projects.
+
+    Raises:
+        ValueError: If the experience section contains content that could not be parsed.
+
+    Notes:
+        1. Extracts roles list using `_extract_roles_list`.
+        2. Extracts projects list using `_extract_projects_list`.
+        3. If both lists are empty, checks for unparsed content.
+        4. Returns an `ExperienceResponse` with the collected lists.
+
+    """
+    experience = parsed_resume.experience
+
+    roles_list = _extract_roles_list(experience)
+    projects_list = _extract_projects_list(experience)
+
+    if not roles_list and not projects_list:
+        _check_for_unparsed_content(resume_content, "experience", None)
+
+    return ExperienceResponse(roles=roles_list, projects=projects_list)
+
+
+def extract_experience_info(resume_content: str) -> ExperienceResponse:
+    """Extract experience information from resume content.
+
+    Args:
+        resume_content (str): The Markdown content of the resume to parse.
+
+    Returns:
+        ExperienceResponse: Extracted experience information containing lists of roles and projects.
+
+    Raises:
+        ValueError: If parsing fails due to invalid or malformed resume content.
+
+    Notes:
+        1. Scopes the content to the experience section using `_section_scoped_content`.
+        2. Parses the scoped content using `_parse_resume`.
+        3. Builds the response using `_build_experience_response`, which raises ValueError via `_check_for_unparsed_content` if raw experience content could not be parsed.
+
+    """
+    section_content = _section_scoped_content(resume_content, "experience")
+    try:
+        parsed_resume = _parse_resume(section_content)
+    except ValueError as e:
+        _msg = "Failed to parse experience info from resume content."
+        raise ValueError(_msg) from e
+
+    return _build_experience_response(parsed_resume, resume_content)
+
+
+def extract_projects_info(resume_content: str) -> ProjectsResponse:
+    """Extract only the projects of the experience section from resume content.
+
+    Args:
+        resume_content (str): The Markdown content of the resume to parse.
+
+    Returns:
+        ProjectsResponse: Extracted projects information.
+
+    Raises:
+        ValueError: If parsing fails due to invalid or malformed resume content.
+
+    Notes:
+        1. Scopes the content to the `## Projects` subsection using `_projects_scoped_content`, so roles are never parsed.
+        2. Parses the scoped content using `_parse_resume`.
+        3. Converts the parsed projects using `_extract_projects_list`.
+
+    """
+    section_content = _projects_scoped_content(resume_content)
+    try:
+        parsed_resume = _parse_resume(section_content)
+    except ValueError as e:
+        _msg = "Failed to parse projects info from resume content."
+        raise ValueError(_msg) from e
+
+    return ProjectsResponse(projects=_extract_projects_list(parsed_resume.experience))
+
+
+def _build_certifications_response(parsed_resume: object) -> CertificationsResponse:
+    """Build the certifications response from an already parsed resume.
+
+    Args:
+        parsed_resume (object): The parsed resume object returned by `_parse_resume`.
+
+    Returns:
+        CertificationsResponse: Extracted certifications information containing a list of certifications.
+
+    Notes:
+        1. Retrieves the certifications section from the parsed resume.
+        2. Checks if certifications data is present; if not, returns an empty response.
+        3. Maps each certification's name, issuer, certification_id, issued, and expires into a dictionary.
+        4. Returns the list of dictionaries wrapped in the CertificationsResponse model.
+
+    """
+    certifications = parsed_resume.certifications
+
+    if not certifications or not hasattr(certifications, "__iter__"):
+        return CertificationsResponse(certifications=[])
+
+    certs_list = []
+    for cert in certifications:
+        issued = getattr(cert, "issued", None)
+        expires = getattr(cert, "expires", None)
+        certs_list.append(
+            {
+                "name": getattr(cert, "name", None),
+                "issuer": getattr(cert, "issuer", None),
+                "certification_id": getattr(
+                    cert,
+                    "certification_id",
+                    getattr(cert, "id", None),
+                ),
+                "issued": issued,
+                "expires": expires,
+            },
+        )
+
+    return CertificationsResponse(certifications=certs_list)
+
+
+def extract_certifications_info(resume_content: str) -> CertificationsResponse:
+    """Extract certifications information from resume content.
+
+    Args:
+        resume_content (str): The Markdown content of the resume to parse.
+
+    Returns:
+        CertificationsResponse: Extracted certifications information containing a list of certifications.
+
+    Raises:
+        ValueError: If parsing fails due to invalid or malformed resume content.
+
+    Notes:
+        1. Scopes the content to the certifications section using `_section_scoped_content`.
+        2. Parses the scoped content using `_parse_resume`.
+        3. Builds the response using `_build_certifications_response`.
+        4. No network, disk, or database access is performed during this function.
+
+    """
+    section_content = _section_scoped_content(resume_content, "certifications")
+    try:
+        parsed_resume = _parse_resume(section_content)
+    except ValueError as e:
+        _msg = "Failed to parse certifications info from resume content."
+        raise ValueError(_msg) from e
+
+    return _build_certifications_response(parsed_resume)
+
+
+def _extract_sections(
+    resume_content: str,
+    section_names: tuple[str, ...],
+) -> dict[str, object]:
+    """Build the requested section responses from a single parse of the resume content.
+
+    Args:
+        resume_content (str): The Markdown content of the resume to parse.
+        section_names (tuple[str, ...]): Names of the sections to build, drawn from
+            "personal", "education", "experience", and "certifications".
+
+    Returns:
+        dict[str, object]: The built section responses keyed by section name.
+
+    Raises:
+        ValueError: If parsing fails, or if a requested personal or experience section contains unparsed content.
+
+    Notes:
+        1. Parses the resume content once using `_parse_resume`.
+        2. Builds only the requested sections, in the order given, so unparsed-content checks run only for those sections.
+
+    """
+    try:
+        parsed_resume = _parse_resume(resume_content)
+    except ValueError as e:
+        _msg = "Failed to parse resume sections from resume content."
+        raise ValueError(_msg) from e
+
+    builders = {
+        "personal": lambda: _build_personal_info_response(parsed_resume, resume_content),
+        "education": lambda: _build_education_response(parsed_resume),
+        "experience": lambda: _build_experience_response(parsed_resume, resume_content),
+        "certifications": lambda: _build_certifications_response(parsed_resume),
+    }
+    return {name: builders[name]() for name in section_names}
+
+
+def extract_all_sections(resume_content: str) -> ResumeSectionsResponse:
+    """Extract personal, education, experience, and certifications information in a single pass.
+
+    Args:
+        resume_content (str): The Markdown content of the resume to parse.
+
+    Returns:
+        ResumeSectionsResponse: The four section responses built from one parse of the content.
+
+    Raises:
+        ValueError: If parsing fails, or if the personal or experience section contains unparsed content.
+
+    Notes:
+        1. Parses the resume content once and builds every section using `_extract_sections`.
+        2. Applies the same unparsed-content checks as the individual `extract_*` functions.
+        3. Callers needing more than one section should prefer this over calling the individual `extract_*` functions.
+        4. No network, disk, or database access is performed during this function.
+
+    """
+    log.debug("extract_all_sections starting")
+    sections = _extract_sections(resume_content, RESUME_SECTION_NAMES)
+    response = ResumeSectionsResponse(**sections)
+    log.debug("extract_all_sections returning")
+    return response
+
+
+def extract_banner_text(resume_content: str) -> str | None:
+    """Extract banner text from resume content.
+
+    Args:
+        resume_content (str): The Markdown content of the resume to parse.
+
+    Returns:
+        str | None: The banner text if found, otherwise None.
+
+    Notes:
+        1. Parses the resume content using `_parse_resume`.
+        2. Safely accesses the `personal` section and its `banner` attribute.
+        3. Extracts the text from the banner object.
+        4. Returns the banner text or None if not found or on parsing error.
+
+    """
+    log.debug("extract_banner_text starting")
+    try:
+        parsed_resume = _parse_resume(resume_content)
+        personal_section = getattr(parsed_resume, "personal", None)
+        if personal_section:
+            banner = getattr(personal_section, "banner", None)
+            if banner and hasattr(banner, "text"):
+                log.debug("extract_banner_text returning")
+                return banner.text
+    except ValueError:
+        log.warning("Could not parse resume to extract banner text.")
+        # Return None on parsing error as per design for this simple extractor
+        return None
+
+    log.debug("extract_banner_text returning")
+    return None
@@ -0,0 +1,223 @@
+"""Single-pass index of top-level Markdown section offsets."""
+
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+
+log = logging.getLogger(__name__)
+
+SECTION_INDEX_CACHE_SIZE = 32
+
+
+@dataclass(frozen=True)
+class SectionSpan:
+    """Character offsets of one top-level `# Section` within resume content.
+
+    Attributes:
+        name (str): The lowercased header text, without the leading "# ".
+        start (int): Offset of the first character of the header line.
+        body_start (int): Offset of the first character after the header line.
+        end (int): Offset of the next top-level header line, or the content length.
+
+    """
+
+    name: str
+    start: int
+    body_start: int
+    end: int
+
+
+def _top_level_header_name(line: str) -> str | None:
+    """Return the lowercased section name if a line is a top-level header.
+
+    Args:
+        line (str): The line to check, without its line terminator.
+
+    Returns:
+        str | None: The section name for a `# Name` line, or None otherwise.
+
+    """
+    stripped = line.strip()
+    if not stripped.startswith("# "):
+        return None
+    return stripped[2:].strip().lower()
+
+
+class SectionIndex:
+    """Offsets of every top-level section in a resume, built in a single pass.
+
+    Attributes:
+        content (str): The Markdown content the index was built from.
+        spans (tuple[SectionSpan, ...]): Every top-level section, in document order.
+
+    Notes:
+        1. A top-level header is any line whose stripped text starts with "# "; "##" and deeper headers are section content.
+        2. Section names are matched case-insensitively and exactly.
+        3. When a section name repeats, lookups return the first occurrence.
+        4. Instances are immutable so they can be shared between callers.
+
+    """
+
+    def __init__(self, content: str, spans: tuple[SectionSpan, ...]) -> None:
+        """Initialize the index from pre-computed spans.
+
+        Args:
+            content (str): The Markdown content the spans refer to.
+            spans (tuple[SectionSpan, ...]): The top-level sections, in document order.
+
+        """
+        self.content = content
+        self.spans = spans
+        self._by_name: dict[str, SectionSpan] = {}
+        for span in spans:
+            self._by_name.setdefault(span.name, span)
+
+    @classmethod
+    def build(cls, content: str) -> "SectionIndex":
+        """Scan content once and record the offsets of every top-level section.
+
+        Args:
+            content (str): The Markdown content to index.
+
+        Returns:
+            SectionIndex: The index of top-level sections.
+
+        Notes:
+            1. Walks the content line by line, tracking the offset of each line.
+            2. Records (name, start, body_start) for each top-level header.
+            3. Closes each section at the start of the next header, and the last at the content length.
+
+        """
+        headers: list[tuple[str, int, int]] = []
+        offset = 0
+        for line in content.split("\n"):
+            name = _top_level_header_name(line)
+            line_end = offset + len(line)
+            if name is not None:
+                headers.append((name, offset, min(line_end + 1, len(content))))
+            offset = line_end + 1
+
+        ends = [start for _, start, _ in headers[1:]] + (
+            [len(content)] if headers else []
+        )
+        spans = tuple(
+            SectionSpan(name=name, start=start, body_start=body_start, end=end)
+            for (name, start, body_start), end in zip(headers, ends, strict=True)
+        )
+        return cls(content=content, spans=spans)
+
+    def get(self, section_name: str) -> SectionSpan | None:
+        """Look up the first section with a given name.
+
+        Args:
+            section_name (str): The section name, matched case-insensitively.
+
+        Returns:
+            SectionSpan | None: The section's offsets, or None if it is absent.
+
+        """
+        return self._by_name.get(section_name.strip().lower())
+
+    def first_of(self, section_names: set[str]) -> SectionSpan | None:
+        """Find the first section, in document order, whose name is in a set.
+
+        Args:
+            section_names (set[str]): Lowercased section names to accept.
+
+        Returns:
+            SectionSpan | None: The earliest matching section, or None if none match.
+
+        """
+        for span in self.spans:
+            if span.name in section_names:
+                return span
+        return None
+
+    def raw_section(self, section_name: str) -> str:
+        """Return the raw text of a section, including its header line.
+
+        Args:
+            section_name (str): The section name, matched case-insensitively.
+
+        Returns:
+            str: The section's lines joined by newlines, without the terminator of its
+                last line, or an empty string if the section is absent.
+
+        """
+        span = self.get(section_name)
+        if span is None:
+            return ""
+        text = self.content[span.start : span.end]
+        return text.removesuffix("\n")
+
+    def raw_subsection(self, section_name: str, subsection_name: str) -> str:
+        """Return the raw text of a `## Subsection` within a top-level section.
+
+        Args:
+            section_name (str): The top-level section name, matched case-insensitively.
+            subsection_name (str): The subsection name, matched case-insensitively.
+
+        Returns:
+            str: The subsection header and body lines joined by newlines, or an empty
+                string if either the section or the subsection is absent.
+
+        Notes:
+            1. Only the lines of the enclosing section are scanned.
+            2. The subsection ends at the next `## ` header or the end of the section.
+
+        """
+        subsection_header = f"## {subsection_name.strip().lower()}"
+        captured_lines: list[str] = []
+        for line in self.raw_section(section_name).split("\n"):
+            stripped = line.strip()
+            if captured_lines and stripped.startswith("## "):
+                break
+            if captured_lines or stripped.lower() == subsection_header:
+                captured_lines.append(line)
+        return "\n".join(captured_lines)
+
+    def section_body(self, section_name: str) -> str | None:
+        """Return the text of a section after its header line.
+
+        Args:
+            section_name (str): The section name, matched case-insensitively.
+
+        Returns:
+            str | None: The section body, or None if the section is absent.
+
+        """
+        span = self.get(section_name)
+        if span is None:
+            return None
+        return self.content[span.body_start : span.end]
+
+    def has_content(self, section_name: str) -> bool:
+        """Check whether a section contains any non-blank text after its header.
+
+        Args:
+            section_name (str): The section name, matched case-insensitively.
+
+        Returns:
+            bool: True if the section exists and its body is not blank.
+
+        """
+        body = self.section_body(section_name)
+        return bool(body and body.strip())
+
+
+@lru_cache(maxsize=SECTION_INDEX_CACHE_SIZE)
+def get_section_index(content: str) -> SectionIndex:
+    """Return the section index for content, building it on first use.
+
+    Args:
+        content (str): The Markdown content to index.
+
+    Returns:
+        SectionIndex: The shared, immutable index for the content.
+
+    Notes:
+        1. Results are memoized so helpers scanning the same content share one pass.
+
+    """
+    log.debug("get_section_index building index")
+    return SectionIndex.build(content)
@@ -1,5 +1,11 @@
+import itertools
 import logging
+from collections.abc import Callable, Iterator
+from typing import Any
 
+from resume_editor.app.api.routes.route_logic.resume_section_extraction import (
+    _extract_sections,
+)
 from resume_editor.app.api.routes.route_logic.resume_serialization_helpers import (
     _add_banner_markdown,
     _add_contact_info_markdown,
@@ -13,11 +19,6 @@ from resume_editor.app.api.routes.route_logic.resume_serialization_helpers impor
     _add_role_summary_markdown,
     _add_visa_status_markdown,
     _add_websites_markdown,
-    _check_for_unparsed_content,
-    _convert_writer_project_to_dict,
-    _convert_writer_role_to_dict,
-    _extract_data_from_personal_section,
-    _parse_resume,
 )
 from resume_editor.app.api.routes.route_models import (
     CertificationsResponse,
@@ -30,285 +31,6 @@ from resume_editor.app.models.resume.experience import InclusionStatus, Project,
 log = logging.getLogger(__name__)
 
 
-def extract_personal_info(resume_content: str) -> PersonalInfoResponse:
-    """Extract personal information from resume content.
-
-    Args:
-        resume_content (str): The Markdown content of the resume to parse.
-
-    Returns:
-        PersonalInfoResponse: Extracted personal information containing name, email, phone, location, and website.
-
-    Raises:
-        ValueError: If parsing fails due to invalid or malformed resume content.
-
-    Notes:
-        1. Parses the resume content using `_parse_resume`.
-        2. Checks for unparsed content in the "personal" section using `_check_for_unparsed_content`.
-        3. If no personal section was parsed, an empty response is returned.
-        4. Extracts data from the parsed personal section using `_extract_data_from_personal_section`.
-        5. Constructs and returns a `PersonalInfoResponse` with the extracted data.
-
-    """
-    log.debug("extract_personal_info starting")
-    try:
-        parsed_resume = _parse_resume(resume_content)
-    except ValueError as e:
-        _msg = "Failed to parse personal info from resume content."
-        raise ValueError(_msg) from e
-
-    personal = getattr(parsed_resume, "personal", None)
-    data = _extract_data_from_personal_section(personal)
-
-    if not data:
-        # If no data was extracted from the 'personal' object, it implies
-        # that either the section is genuinely empty or contains unparseable content.
-        # We must manually check for the presence of raw, unparsed content.
-        # Passing 'None' to '_check_for_unparsed_content' forces it to perform this scan.
-        _check_for_unparsed_content(resume_content, "personal", None)
-
-    response = PersonalInfoResponse(**data)
-    log.debug("extract_personal_info returning")
-    return response
-
-
-def extract_education_info(resume_content: str) -> EducationResponse:
-    """Extract education information from resume content.
-
-    Args:
-        resume_content (str): The Markdown content of the resume to parse.
-
-    Returns:
-        EducationResponse: Extracted education information containing a list of degree entries.
-
-    Raises:
-        ValueError: If parsing fails due to invalid or malformed resume content.
-
-    Notes:
-        1. Splits the resume content into lines.
-        2. Creates a ParseContext for parsing.
-        3. Parses the resume using the resume_writer module.
-        4. Retrieves the education section from the parsed resume.
-        5. Checks if education data is present; if not, returns an empty response.
-        6. Loops through each degree and extracts school, degree, major, start_date, end_date, and gpa.
-        7. Maps each degree's fields into a dictionary.
-        8. Returns a list of dictionaries wrapped in the EducationResponse model.
-        9. If parsing fails, returns an empty response.
-        10. No network, disk, or database access is performed during this function.
-
-    """
-    try:
-        parsed_resume = _parse_resume(resume_content)
-    except ValueError as e:
-        _msg = "Failed to parse education info from resume content."
-        raise ValueError(_msg) from e
-
-    education = parsed_resume.education
-
-    if not education or not hasattr(education, "degrees") or not education.degrees:
-        return EducationResponse(degrees=[])
-
-    degrees_list = []
-    for degree in education.degrees:
-        degrees_list.append(
-            {
-                "school": degree.school if degree.school else None,
-                "degree": degree.degree if degree.degree else None,
-                "major": degree.major if degree.major else None,
-                "start_date": degree.start_date,
-                "end_date": degree.end_date,
-                "gpa": degree.gpa if degree.gpa else None,
-            },
-        )
-
-    return EducationResponse(degrees=degrees_list)
-
-
-def _extract_roles_list(experience: any) -> list[dict]:
-    """Extract roles from experience object into a list of dictionaries.
-
-    Args:
-        experience: The experience object from parsed resume, may be None.
-
-    Returns:
-        list[dict]: List of role dictionaries extracted from the experience.
-
-    Notes:
-        1. Returns empty list if experience is None or has no roles attribute.
-        2. Iterates through each role in experience.roles.
-        3. Converts each role to dictionary using `_convert_writer_role_to_dict`.
-        4. Filters out empty dictionaries.
-        5. Returns the collected list of role dictionaries.
-
-    """
-    roles_list = []
-    if experience and hasattr(experience, "roles") and experience.roles is not None:
-        for role in experience.roles:
-            role_dict = _convert_writer_role_to_dict(role)
-            if role_dict:
-                roles_list.append(role_dict)
-    return roles_list
-
-
-def _extract_projects_list(experience: any) -> list[dict]:
-    """Extract projects from experience object into a list of dictionaries.
-
-    Args:
-        experience: The experience object from parsed resume, may be None.
-
-    Returns:
-        list[dict]: List of project dictionaries extracted from the experience.
-
-    Notes:
-        1. Returns empty list if experience is None or has no projects attribute.
-        2. Iterates through each project in experience.projects.
-        3. Converts each project to dictionary using `_convert_writer_project_to_dict`.
-        4. Filters out empty dictionaries.
-        5. Returns the collected list of project dictionaries.
-
-    """
-    projects_list = []
-    if (
-        experience
-        and hasattr(experience, "projects")
-        and experience.projects is not None
-    ):
-        for project in experience.projects:
-            project_dict = _convert_writer_project_to_dict(project)
-            if project_dict:
-                projects_list.append(project_dict)
-    return projects_list
-
-
-def extract_experience_info(resume_content: str) -> ExperienceResponse:
-    """Extract experience information from resume content.
-
-    Args:
-        resume_content (str): The Markdown content of the resume to parse.
-
-    Returns:
-        ExperienceResponse: Extracted experience information containing lists of roles and projects.
-
-    Raises:
-        ValueError: If parsing fails due to invalid or malformed resume content.
-
-    Notes:
-        1. Parses the resume content using `_parse_resume`.
-        2. Retrieves the experience section. If it's missing but raw content exists, raises ValueError via `_check_for_unparsed_content`.
-        3. Extracts roles list using `_extract_roles_list`.
-        4. Extracts projects list using `_extract_projects_list`.
-        5. If both lists are empty, checks for unparsed content.
-        6. Returns an `ExperienceResponse` with the collected lists.
-
-    """
-    try:
-        parsed_resume = _parse_resume(resume_content)
-    except ValueError as e:
-        _msg = "Failed to parse experience info from resume content."
-        raise ValueError(_msg) from e
-
-    experience = parsed_resume.experience
-
-    roles_list = _extract_roles_list(experience)
-    projects_list = _extract_projects_list(experience)
-
-    if not roles_list and not projects_list:
-        _check_for_unparsed_content(resume_content, "experience", None)
-
-    return ExperienceResponse(roles=roles_list, projects=projects_list)
-
-
-def extract_certifications_info(resume_content: str) -> CertificationsResponse:
-    """Extract certifications information from resume content.
-
-    Args:
-        resume_content (str): The Markdown content of the resume to parse.
-
-    Returns:
-        CertificationsResponse: Extracted certifications information containing a list of certifications.
-
-    Raises:
-        ValueError: If parsing fails due to invalid or malformed resume content.
-
-    Notes:
-        1. Splits the resume content into lines.
-        2. Creates a ParseContext for parsing.
-        3. Parses the resume using the resume_writer module.
-        4. Retrieves the certifications section from the parsed resume.
-        5. Checks if certifications data is present; if not, returns an empty response.
-        6. Loops through each certification and extracts name, issuer, certification_id, issued, and expires.
-        7. Maps the extracted data into a dictionary.
-        8. Returns a list of dictionaries wrapped in the CertificationsResponse model.
-        9. If parsing fails, returns an empty response.
-        10. No network, disk, or database access is performed during this function.
-
-    """
-    try:
-        parsed_resume = _parse_resume(resume_content)
-    except ValueError as e:
-        _msg = "Failed to parse certifications info from resume content."
-        raise ValueError(_msg) from e
-
-    certifications = parsed_resume.certifications
-
-    if not certifications or not hasattr(certifications, "__iter__"):
-        return CertificationsResponse(certifications=[])
-
-    certs_list = []
-    for cert in certifications:
-        issued = getattr(cert, "issued", None)
-        expires = getattr(cert, "expires", None)
-        certs_list.append(
-            {
-                "name": getattr(cert, "name", None),
-                "issuer": getattr(cert, "issuer", None),
-                "certification_id": getattr(
-                    cert,
-                    "certification_id",
-                    getattr(cert, "id", None),
-                ),
-                "issued": issued,
-                "expires": expires,
-            },
-        )
-
-    return CertificationsResponse(certifications=certs_list)
-
-
-def extract_banner_text(resume_content: str) -> str | None:
-    """Extract banner text from resume content.
-
-    Args:
-        resume_content (str): The Markdown content of the resume to parse.
-
-    Returns:
-        str | None: The banner text if found, otherwise None.
-
-    Notes:
-        1. Parses the resume content using `_parse_resume`.
-        2. Safely accesses the `personal` section and its `banner` attribute.
-        3. Extracts the text from the banner object.
-        4. Returns the banner text or None if not found or on parsing error.
-
-    """
-    log.debug("extract_banner_text starting")
-    try:
-        parsed_resume = _parse_resume(resume_content)
-        personal_section = getattr(parsed_resume, "personal", None)
-        if personal_section:
-            banner = getattr(personal_section, "banner", None)
-            if banner and hasattr(banner, "text"):
-                log.debug("extract_banner_text returning")
-                return banner.text
-    except ValueError:
-        log.warning("Could not parse resume to extract banner text.")
-        # Return None on parsing error as per design for this simple extractor
-        return None
-
-    log.debug("extract_banner_text returning")
-    return None
-
-
 def serialize_personal_info_to_markdown(
     personal_info: PersonalInfoResponse | None,
 ) -> str:
@@ -568,86 +290,82 @@ def _serialize_role_to_markdown(role: Role) -> list[str]:
     return []
 
 
-def _extract_roles_from_experience(experience: ExperienceResponse) -> list[str]:
-    """Extract and serialize roles from experience into markdown lines.
+def _iter_entry_chunks(
+    entries: list | None,
+    serializer: Callable[[Any], list[str]],
+) -> Iterator[str]:
+    """Yield the Markdown of each serialized entry as a single chunk.
 
     Args:
-        experience (ExperienceResponse): Experience object containing roles.
+        entries (list | None): The roles or projects to serialize.
+        serializer (Callable[[Any], list[str]]): Serializes one entry to Markdown lines.
 
-    Returns:
-        list[str]: List of markdown lines for all roles.
+    Yields:
+        str: The lines of one entry joined by newlines, with a trailing newline.
 
     Notes:
-        1. Checks if experience has a roles attribute with data.
-        2. Iterates through each role and serializes it using `_serialize_role_to_markdown`.
-        3. Collects all serialized role lines into a single list.
-        4. Returns the combined list of markdown lines.
+        1. Entries whose serializer returns no lines (for example, omitted entries) are skipped.
+        2. Concatenating the chunks equals joining every entry's lines with newlines.
 
     """
-    role_lines = []
-    if hasattr(experience, "roles") and experience.roles:
-        for role in experience.roles:
-            role_lines.extend(_serialize_role_to_markdown(role))
-    return role_lines
+    for entry in entries or []:
+        entry_lines = serializer(entry)
+        if entry_lines:
+            yield "\n".join(entry_lines) + "\n"
 
 
-def _extract_projects_from_experience(experience: ExperienceResponse) -> list[str]:
-    """Extract and serialize projects from experience into markdown lines.
+def _iter_with_header(header: str, chunks: Iterator[str]) -> Iterator[str]:
+    """Prefix a stream of chunks with a header, but only if the stream is not empty.
 
     Args:
-        experience (ExperienceResponse): Experience object containing projects.
+        header (str): The text to emit before the first chunk.
+        chunks (Iterator[str]): The chunks to pass through.
 
-    Returns:
-        list[str]: List of markdown lines for all projects.
-
-    Notes:
-        1. Checks if experience has a projects attribute with data.
-        2. Iterates through each project and serializes it using `_serialize_project_to_markdown`.
-        3. Collects all serialized project lines into a single list.
-        4. Returns the combined list of markdown lines.
+    Yields:
+        str: The header followed by every chunk, or nothing if `chunks` is empty.
 
     """
-    project_lines = []
-    if hasattr(experience, "projects") and experience.projects:
-        for project in experience.projects:
-            project_lines.extend(_serialize_project_to_markdown(project))
-    return project_lines
+    first = next(chunks, None)
+    if first is None:
+        return
+    yield header
+    yield first
+    yield from chunks
 
 
-def _build_experience_markdown(
-    project_lines: list[str],
-    role_lines: list[str],
-) -> str:
-    """Build the final experience markdown string from project and role lines.
+def iter_experience_markdown(
+    experience: ExperienceResponse | None,
+) -> Iterator[str]:
+    """Serialize experience information to Markdown, one chunk at a time.
 
     Args:
-        project_lines (list[str]): Markdown lines for projects section.
-        role_lines (list[str]): Markdown lines for roles section.
+        experience (ExperienceResponse | None): Experience information to serialize, containing lists of roles and projects.
 
-    Returns:
-        str: Complete markdown formatted experience section.
+    Yields:
+        str: Consecutive pieces of the Markdown experience section.
 
     Notes:
-        1. Returns empty string if both project_lines and role_lines are empty.
-        2. Initializes the lines list with the main "# Experience" header.
-        3. If project_lines exist, adds the "## Projects" header and project content.
-        4. If role_lines exist, adds the "## Roles" header and role content.
-        5. Joins all lines with newlines and appends a trailing newline.
-        6. Returns the formatted markdown string.
+        1. Yields nothing if there is no experience or every role and project is omitted.
+        2. Emits the "# Experience" header, then the "## Projects" and "## Roles" subsections, each only if it has content.
+        3. Each role and project is serialized and yielded separately, so the section is never held as one list of lines.
+        4. Joining the chunks produces exactly the output of `serialize_experience_to_markdown`.
+        5. No network, disk, or database access is performed during this function.
 
     """
-    if not project_lines and not role_lines:
-        return ""
-
-    lines = ["# Experience", ""]
-    if project_lines:
-        lines.extend(["## Projects", ""])
-        lines.extend(project_lines)
-    if role_lines:
-        lines.extend(["## Roles", ""])
-        lines.extend(role_lines)
-
-    return "\n".join(lines) + "\n"
+    if not experience:
+        return
+
+    subsections = itertools.chain(
+        _iter_with_header(
+            "## Projects\n\n",
+            _iter_entry_chunks(experience.projects, _serialize_project_to_markdown),
+        ),
+        _iter_with_header(
+            "## Roles\n\n",
+            _iter_entry_chunks(experience.roles, _serialize_role_to_markdown),
+        ),
+    )
+    yield from _iter_with_header("# Experience\n\n", subsections)
 
 
 def serialize_experience_to_markdown(experience: ExperienceResponse | None) -> str:
@@ -657,23 +375,14 @@ def serialize_experience_to_markdown(experience: ExperienceResponse | None) -> s
         experience (ExperienceResponse | None): Experience information to serialize, containing lists of roles and projects.
 
     Returns:
-        str: Markdown formatted experience section.
+        str: Markdown formatted experience section, or an empty string if there is nothing to serialize.
 
     Notes:
-        1. Checks if the experience object is empty, creates empty response if so.
-        2. Extracts project lines using `_extract_projects_from_experience`.
-        3. Extracts role lines using `_extract_roles_from_experience`.
-        4. Builds final markdown using `_build_experience_markdown`.
-        5. No network, disk, or database access is performed during this function.
+        1. Joins the chunks produced by `iter_experience_markdown` once.
+        2. No network, disk, or database access is performed during this function.
 
     """
-    if not experience:
-        experience = ExperienceResponse(roles=[], projects=[])
-
-    project_lines = _extract_projects_from_experience(experience)
-    role_lines = _extract_roles_from_experience(experience)
-
-    return _build_experience_markdown(project_lines, role_lines)
+    return "".join(iter_experience_markdown(experience))
 
 
 def _format_certification_field(cert: any, field: str, label: str) -> str | None:
@@ -831,12 +540,38 @@ def serialize_certifications_to_markdown(
     return ""
 
 
-def update_resume_content_with_structured_data(
+def _serialize_provided_sections(
+    sections: dict[str, object | None],
+) -> dict[str, str]:
+    """Serialize the sections that were provided for an update.
+
+    Args:
+        sections (dict[str, object | None]): Section responses keyed by section name; None means not provided.
+
+    Returns:
+        dict[str, str]: Serialized Markdown for each provided section, keyed by section name.
+
+    """
+    serializers = {
+        "personal": serialize_personal_info_to_markdown,
+        "education": serialize_education_to_markdown,
+        "experience": serialize_experience_to_markdown,
+        "certifications": serialize_certifications_to_markdown,
+    }
+    return {
+        name: serializers[name](value)
+        for name, value in sections.items()
+        if value is not None
+    }
+
+
+def update_resume_content_with_structured_data(  # noqa: PLR0913
     current_content: str,
     personal_info: PersonalInfoResponse | None = None,
     education: EducationResponse | None = None,
     certifications: CertificationsResponse | None = None,
     experience: ExperienceResponse | None = None,
+    incremental: bool = False,
 ) -> str:
     """Update resume content with structured data by replacing specific sections.
 
@@ -846,34 +581,45 @@ def update_resume_content_with_structured_data(
         education (EducationResponse | None): Updated education information to insert. If None, the existing info is preserved.
         certifications (CertificationsResponse | None): Updated certifications information to insert. If None, the existing info is preserved.
         experience (ExperienceResponse | None): Updated experience information to insert. If None, the existing info is preserved.
+        incremental (bool): If True, reserialize only the provided sections and splice them into `current_content`
+            at their original offsets, leaving all other text byte-for-byte unchanged.
 
     Returns:
         str: Updated resume content with new structured data.
 
     Notes:
-        1. Extracts existing sections from `current_content` if they are not provided as arguments.
-        2. reconstructs the full resume using the combination of new and existing data.
+        1. In incremental mode, serializes the provided sections and splices them in with `splice_resume_sections`.
+        2. If a provided section is not present in `current_content`, incremental mode falls back to a full rebuild.
+        3. Otherwise, extracts the sections not provided as arguments from `current_content` using a single parse via `_extract_sections`.
+        4. Reconstructs the full resume using the combination of new and existing data.
 
     """
     from resume_editor.app.api.routes.route_logic.resume_reconstruction import (
         reconstruct_resume_markdown,
+        splice_resume_sections,
     )
 
-    if personal_info is None:
-        personal_info = extract_personal_info(current_content)
-
-    if education is None:
-        education = extract_education_info(current_content)
-
-    if experience is None:
-        experience = extract_experience_info(current_content)
+    provided = {
+        "personal": personal_info,
+        "education": education,
+        "experience": experience,
+        "certifications": certifications,
+    }
+    if incremental:
+        spliced = splice_resume_sections(
+            current_content=current_content,
+            serialized_sections=_serialize_provided_sections(provided),
+        )
+        if spliced is not None:
+            return spliced
 
-    if certifications is None:
-        certifications = extract_certifications_info(current_content)
+    missing = tuple(name for name, value in provided.items() if value is None)
+    if missing:
+        provided.update(_extract_sections(current_content, missing))
 
     return reconstruct_resume_markdown(
-        personal_info=personal_info,
-        education=education,
-        certifications=certifications,
-        experience=experience,
+        personal_info=provided["personal"],
+        education=provided["education"],
+        certifications=provided["certifications"],
+        experience=provided["experience"],
     )
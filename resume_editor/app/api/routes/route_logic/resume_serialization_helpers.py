@@ -3,15 +3,23 @@ import logging
 from resume_writer.models.parsers import ParseContext
 from resume_writer.models.resume import Resume as WriterResume
 
+from resume_editor.app.api.routes.route_logic.resume_parse_cache import (
+    resume_parse_cache,
+)
+from resume_editor.app.api.routes.route_logic.resume_section_index import (
+    get_section_index,
+)
 from resume_editor.app.api.routes.route_models import PersonalInfoResponse
 from resume_editor.app.models.resume.experience import InclusionStatus
 from resume_editor.app.models.resume.personal import Banner, Note
 
 log = logging.getLogger(__name__)
 
+WRITER_RESUME_CACHE_KIND = "writer_resume"
 
-def _parse_resume(resume_content: str) -> WriterResume:
-    """Parse resume content using resume_writer.
+
+def _parse_resume_uncached(resume_content: str) -> WriterResume:
+    """Run the resume_writer parser over resume content.
 
     Args:
         resume_content (str): The Markdown content of the resume to parse.
@@ -19,100 +27,92 @@ def _parse_resume(resume_content: str) -> WriterResume:
     Returns:
         WriterResume: The parsed resume object.
 
-    Raises:
-        ValueError: If parsing fails.
-
     Notes:
         1. Splits content into lines.
-        2. Creates a ParseContext.
-        3. Attempts to parse the resume using WriterResume.parse.
-        4. On any exception, logs and raises a ValueError.
+        2. Creates a ParseContext and parses with WriterResume.parse.
 
     """
-    log.debug("_parse_resume starting")
-    try:
-        lines = resume_content.splitlines()
-        parse_context = ParseContext(lines, 1)
-        parsed_resume = WriterResume.parse(parse_context)
-        log.debug("_parse_resume returning")
-        return parsed_resume
-    except Exception as e:
-        _msg = "Failed to parse resume content."
-        log.exception(_msg)
-        raise ValueError(_msg) from e
+    lines = resume_content.splitlines()
+    parse_context = ParseContext(lines, 1)
+    return WriterResume.parse(parse_context)
 
 
-def _is_section_start(line: str, section_header: str) -> bool:
-    """Check if line is the section header.
+def _parse_resume(resume_content: str) -> WriterResume:
+    """Parse resume content using resume_writer.
 
     Args:
-        line (str): The line to check.
-        section_header (str): The section header to match.
+        resume_content (str): The Markdown content of the resume to parse.
 
     Returns:
-        bool: True if line matches section header.
-
-    """
-    return line.strip().lower() == section_header
-
-
-def _is_next_section(line: str) -> bool:
-    """Check if line is the start of a new section.
+        WriterResume: The parsed resume object, owned by the caller.
 
-    Args:
-        line (str): The line to check.
+    Raises:
+        ValueError: If parsing fails.
 
-    Returns:
-        bool: True if line starts a new section.
+    Notes:
+        1. Looks up the content in the shared parse cache.
+        2. On a miss, parses with `_parse_resume_uncached` and caches the result.
+        3. On any exception, logs and raises a ValueError.
 
     """
-    return line.strip().lower().startswith("# ")
+    log.debug("_parse_resume starting")
+    try:
+        parsed_resume = resume_parse_cache.get_or_compute(
+            content=resume_content,
+            kind=WRITER_RESUME_CACHE_KIND,
+            compute=_parse_resume_uncached,
+        )
+    except Exception as e:
+        _msg = "Failed to parse resume content."
+        log.exception(_msg)
+        raise ValueError(_msg) from e
+    else:
+        log.debug("_parse_resume returning")
+        return parsed_resume
 
 
-def _scan_section_for_content(lines: list[str], section_header: str) -> bool:
-    """Scan lines for content within a specific section.
+def _section_scoped_content(resume_content: str, section_name: str) -> str:
+    """Return the smallest content that parses a single top-level section.
 
     Args:
-        lines (list[str]): The content lines to search.
-        section_header (str): The section header to find.
+        resume_content (str): The full Markdown content of the resume.
+        section_name (str): The top-level section to parse (e.g., "personal").
 
     Returns:
-        bool: True if content is found in the section.
+        str: The section's header and body, or the full content if the section cannot be scoped.
 
     Notes:
-        1. Iterate through lines to find the section header.
-        2. Once inside the section, check for any non-empty lines before next section.
-        3. Return True if content is found, False otherwise.
+        1. Only sections known to the resume_writer parser (`WriterResume.expected_blocks()`) are scoped.
+        2. Slices the section's header and body from the shared section index.
+        3. Falls back to the full content when the section is unknown or absent, preserving whole-resume parsing.
 
     """
-    in_section = False
+    if section_name not in WriterResume.expected_blocks():
+        return resume_content
 
-    for line in lines:
-        if not in_section:
-            in_section = _is_section_start(line, section_header)
-        elif _is_next_section(line):
-            break
-        elif line.strip():
-            return True
+    raw_section = get_section_index(resume_content).raw_section(section_name)
+    return raw_section if raw_section else resume_content
 
-    return False
 
-
-def _find_content_in_section(lines: list[str], section_header: str) -> bool:
-    """Check if any content exists in a section.
+def _projects_scoped_content(resume_content: str) -> str:
+    """Return the smallest content that parses the experience projects.
 
     Args:
-        lines (list[str]): The content lines to search.
-        section_header (str): The section header to find.
+        resume_content (str): The full Markdown content of the resume.
 
     Returns:
-        bool: True if content is found in the section.
+        str: An experience section holding only the `## Projects` subsection, or the
+            scoped experience section if there is no projects subsection.
 
     Notes:
-        1. Delegate to scanning function to check for content.
+        1. Slices the `## Projects` subsection of `# Experience` from the shared section index.
+        2. Wraps it in an `# Experience` header so the experience block parser can read it without any roles.
 
     """
-    return _scan_section_for_content(lines, section_header)
+    projects = get_section_index(resume_content).raw_subsection("experience", "projects")
+    if not projects:
+        return _section_scoped_content(resume_content, "experience")
+    return f"# Experience\n\n{projects}\n"
 
 
 def _check_for_unparsed_content(
@@ -132,7 +132,7 @@ def _check_for_unparsed_content(
 
     Notes:
         1. If 'parsed_section' is not empty, return.
-        2. Search for content in the section using helper function.
+        2. Look up the section in the shared section index and check for non-blank body text.
         3. If any content is found, log a warning and raise a ValueError.
 
     """
@@ -141,9 +141,7 @@ def _check_for_unparsed_content(
         log.debug("_check_for_unparsed_content returning, parsed_section found")
         return
 
-    lines = resume_content.splitlines()
-    section_header = f"# {section_name.lower()}"
-    content_found = _find_content_in_section(lines, section_header)
+    content_found = get_section_index(resume_content).has_content(section_name)
 
     if content_found:
         _msg = f"Failed to parse {section_name} info from resume content."
@@ -0,0 +1,318 @@
+"""Persisted structured representation of resume Markdown content."""
+
+import logging
+from collections.abc import Callable
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from resume_editor.app.api.routes.route_logic.resume_parse_cache import content_hash
+from resume_editor.app.api.routes.route_logic.resume_parsing import (
+    validate_resume_content,
+)
+from resume_editor.app.api.routes.route_logic.resume_section_extraction import (
+    extract_all_sections,
+    extract_certifications_info,
+    extract_education_info,
+    extract_experience_info,
+    extract_personal_info,
+    extract_projects_info,
+)
+from resume_editor.app.api.routes.route_models import (
+    CertificationsResponse,
+    EducationResponse,
+    ExperienceResponse,
+    PersonalInfoResponse,
+    ProjectsResponse,
+    ResumeSectionsResponse,
+)
+from resume_editor.app.models.resume_model import Resume as DatabaseResume
+
+log = logging.getLogger(__name__)
+
+# Bump whenever the shape of the stored sections changes so stale rows fall
+# back to Markdown parsing on read and are picked up by
+# `manage.py backfill-structured-data`.
+STRUCTURED_DATA_VERSION = 1
+
+_SECTION_MODELS: dict[str, type[BaseModel]] = {
+    "personal": PersonalInfoResponse,
+    "education": EducationResponse,
+    "experience": ExperienceResponse,
+    "certifications": CertificationsResponse,
+}
+
+_SECTION_EXTRACTORS: dict[str, Callable[[str], BaseModel]] = {
+    "personal": extract_personal_info,
+    "education": extract_education_info,
+    "experience": extract_experience_info,
+    "certifications": extract_certifications_info,
+    "projects": extract_projects_info,
+}
+
+
+def build_structured_data(content: str) -> dict | None:
+    """Derive the structured representation stored alongside resume content.
+
+    Args:
+        content (str): The Markdown content of the resume.
+
+    Returns:
+        dict | None: A JSON-serializable dict with the content hash and every parsed
+            section, or None if the content could not be parsed.
+
+    Notes:
+        1. Parses the content once using `extract_all_sections`.
+        2. Records the SHA-256 of the content so stale data can be detected on read.
+        3. Parse failures are logged and yield None; the Markdown stays the source of truth.
+
+    """
+    try:
+        sections = extract_all_sections(content)
+    except ValueError:
+        _msg = "build_structured_data could not parse resume content"
+        log.warning(_msg)
+        return None
+
+    return {
+        "content_hash": content_hash(content),
+        "sections": sections.model_dump(mode="json"),
+    }
+
+
+def build_validated_structured_data(
+    content: str,
+    original_content: str | None = None,
+) -> dict | None:
+    """Validate resume content and derive its structured representation.
+
+    Args:
+        content (str): The Markdown content of the resume.
+        original_content (str | None): The previously saved content, used to
+            validate only the sections that changed.
+
+    Returns:
+        dict | None: The structured data for `content`, as built by `build_structured_data`.
+
+    Raises:
+        HTTPException: If the content fails validation.
+
+    Notes:
+        1. Module-level so routes can run validation and the structured build in a
+           single `run_parse_task` call, off the event loop.
+        2. The validation parse warms the parse cache the structured build reads from.
+
+    """
+    validate_resume_content(content, original_content=original_content)
+    return build_structured_data(content)
+
+
+def refresh_structured_data(resume: DatabaseResume) -> None:
+    """Re-derive and assign the structured data columns of a resume.
+
+    Args:
+        resume (DatabaseResume): The resume whose content has been set or changed.
+
+    Returns:
+        None
+
+    Notes:
+        1. Builds the structured data from `resume.content` using `build_structured_data`.
+        2. Assigns `structured_data` and `structured_data_version` on the instance.
+        3. Does not commit; callers persist the change in the same transaction as the content.
+
+    """
+    resume.structured_data = build_structured_data(resume.content)
+    resume.structured_data_version = STRUCTURED_DATA_VERSION
+
+
+def _stored_sections(
+    content: str,
+    structured_data: dict | None,
+    structured_data_version: int | None,
+) -> dict | None:
+    """Return the stored sections if they are current for the resume content.
+
+    Args:
+        content (str): The Markdown content of the resume.
+        structured_data (dict | None): The stored structured data of the resume.
+        structured_data_version (int | None): The version the structured data was stored with.
+
+    Returns:
+        dict | None: The stored sections, or None if they are missing, from another
+            version, or derived from different content.
+
+    """
+    if structured_data_version != STRUCTURED_DATA_VERSION or not structured_data:
+        return None
+    if structured_data.get("content_hash") != content_hash(content):
+        return None
+    return structured_data.get("sections")
+
+
+def _section_from_stored(sections: dict, section_name: str) -> BaseModel:
+    """Validate a single section from stored structured data.
+
+    Args:
+        sections (dict): The stored sections keyed by section name.
+        section_name (str): The section to load, or "projects".
+
+    Returns:
+        BaseModel: The validated response model for the section.
+
+    Raises:
+        KeyError: If the section is not present in the stored data.
+        ValidationError: If the stored data does not match the response model.
+
+    Notes:
+        1. "projects" is served from the projects of the stored experience section.
+
+    """
+    if section_name == "projects":
+        return ProjectsResponse.model_validate(
+            {"projects": sections["experience"]["projects"]},
+        )
+    return _SECTION_MODELS[section_name].model_validate(sections[section_name])
+
+
+def load_section_data(
+    content: str,
+    structured_data: dict | None,
+    structured_data_version: int | None,
+    section_name: str,
+) -> BaseModel:
+    """Load one structured section from resume column values, preferring the stored representation.
+
+    Args:
+        content (str): The Markdown content of the resume.
+        structured_data (dict | None): The stored structured data of the resume.
+        structured_data_version (int | None): The version the structured data was stored with.
+        section_name (str): One of "personal", "education", "experience",
+            "certifications" or "projects".
+
+    Returns:
+        BaseModel: The matching response model for the section.
+
+    Raises:
+        ValueError: If the stored data is unusable and the Markdown cannot be parsed.
+
+    Notes:
+        1. Uses the stored sections when their version and content hash are current.
+        2. Otherwise, or if the stored section fails validation, parses the Markdown with the section's extractor.
+        3. Takes plain column values rather than a database object, so it can run in a worker process.
+        4. No database access is performed; stale rows are refreshed on the next write or by the backfill command.
+
+    """
+    sections = _stored_sections(content, structured_data, structured_data_version)
+    if sections is not None:
+        try:
+            return _section_from_stored(sections, section_name)
+        except (KeyError, TypeError, ValidationError):
+            _msg = f"Stored structured data unusable for section '{section_name}'"
+            log.warning(_msg)
+
+    _msg = f"load_section_data parsing markdown for section '{section_name}'"
+    log.debug(_msg)
+    return _SECTION_EXTRACTORS[section_name](content)
+
+
+def load_all_sections(
+    content: str,
+    structured_data: dict | None,
+    structured_data_version: int | None,
+) -> ResumeSectionsResponse:
+    """Load every structured section from resume column values, preferring the stored representation.
+
+    Args:
+        content (str): The Markdown content of the resume.
+        structured_data (dict | None): The stored structured data of the resume.
+        structured_data_version (int | None): The version the structured data was stored with.
+
+    Returns:
+        ResumeSectionsResponse: The personal, education, experience and certifications sections.
+
+    Raises:
+        ValueError: If the stored data is unusable and the Markdown cannot be parsed.
+
+    Notes:
+        1. Uses the stored sections when their version and content hash are current.
+        2. Otherwise, or if the stored sections fail validation, parses the Markdown with `extract_all_sections`.
+        3. Takes plain column values rather than a database object, so it can run in a worker process.
+
+    """
+    sections = _stored_sections(content, structured_data, structured_data_version)
+    if sections is not None:
+        try:
+            stored = ResumeSectionsResponse.model_validate(sections)
+        except ValidationError:
+            _msg = "Stored structured data unusable for all sections"
+            log.warning(_msg)
+        else:
+            return stored
+
+    _msg = "load_all_sections parsing markdown"
+    log.debug(_msg)
+    return extract_all_sections(content)
+
+
+def load_resume_section(resume: DatabaseResume, section_name: str) -> BaseModel:
+    """Load one structured section of a resume, preferring the stored representation.
+
+    Args:
+        resume (DatabaseResume): The resume to read from.
+        section_name (str): One of "personal", "education", "experience",
+            "certifications" or "projects".
+
+    Returns:
+        BaseModel: The matching response model for the section.
+
+    Raises:
+        ValueError: If the stored data is unusable and the Markdown cannot be parsed.
+
+    Notes:
+        1. Delegates to `load_section_data` with the resume's column values.
+
+    """
+    return load_section_data(
+        resume.content,
+        resume.structured_data,
+        resume.structured_data_version,
+        section_name,
+    )
+
+
+def backfill_structured_data(db: Session) -> int:
+    """Derive structured data for every resume stored with a missing or old version.
+
+    Args:
+        db (Session): The database session.
+
+    Returns:
+        int: The number of resumes that were refreshed.
+
+    Notes:
+        1. Selects resumes whose `structured_data_version` is NULL or not the current version.
+        2. Refreshes each one using `refresh_structured_data`.
+        3. Commits once after all resumes have been refreshed.
+        4. This function performs database reads and a database write.
+
+    """
+    version_column = DatabaseResume.structured_data_version
+    stale_resumes = (
+        db.query(DatabaseResume)
+        .filter(
+            or_(
+                version_column.is_(None),
+                version_column != STRUCTURED_DATA_VERSION,
+            ),
+        )
+        .all()
+    )
+    for resume in stale_resumes:
+        refresh_structured_data(resume)
+    db.commit()
+
+    _msg = f"backfill_structured_data refreshed {len(stale_resumes)} resumes"
+    log.info(_msg)
+    return len(stale_resumes)
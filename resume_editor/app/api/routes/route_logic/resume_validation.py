@@ -227,11 +227,14 @@ def validate_refinement_form(
 
 def perform_pre_save_validation(
     markdown_content: str,
+    original_content: str | None = None,
 ) -> None:
     """Perform comprehensive pre-save validation on resume content.
 
     Args:
         markdown_content (str): The updated resume Markdown content to validate.
+        original_content (str | None): The resume content before the update. When given,
+            only the sections whose text changed are parsed.
 
     Returns:
         None: This function does not return any value.
@@ -246,10 +249,10 @@ def perform_pre_save_validation(
            error messages.
         3. This function performs validation checks on resume content before
            saving to ensure data integrity.
-        4. Validation includes parsing the Markdown content to verify its
-           structure and format.
+        4. Sections unchanged from `original_content` were validated when they were
+           saved and are not parsed again.
         5. The function accesses the resume parsing module to validate the
            content structure.
 
     """
-    validate_resume_content(markdown_content)
+    validate_resume_content(markdown_content, original_content=original_content)
@@ -4,7 +4,11 @@ from typing import TYPE_CHECKING
 from sqlalchemy.orm import Session
 
 from resume_editor.app.core.security import encrypt_data
-from resume_editor.app.models.user_settings import UserSettings
+from resume_editor.app.llm.models import LLMEndpoint
+from resume_editor.app.models.user_settings import (
+    UserSettings,
+    UserSettingsData,
+)
 
 if TYPE_CHECKING:
     from resume_editor.app.schemas.user import UserSettingsUpdateRequest
@@ -12,6 +16,9 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+# Marks the API key of a fallback endpoint on the settings form.
+FALLBACK_API_KEY_PREFIX = "key="
+
 
 def get_user_settings(db: Session, user_id: int) -> UserSettings | None:
     """Retrieves the settings for a given user.
@@ -57,7 +64,7 @@ def _get_or_create_user_settings(
     if not settings:
         _msg = f"No settings found for user_id: {user_id}. Creating new settings."
         log.debug(_msg)
-        settings = UserSettings(user_id=user_id)
+        settings = UserSettings(data=UserSettingsData(user_id=user_id))
         db.add(settings)
     return settings
 
@@ -132,6 +139,142 @@ def _update_access_token_expire_minutes(
         settings.access_token_expire_minutes = value
 
 
+def _store_fallback_endpoint(
+    fallback: LLMEndpoint,
+    stored_keys: dict[str, str | None],
+) -> dict:
+    """Build the stored form of a fallback endpoint.
+
+    Args:
+        fallback (LLMEndpoint): The fallback endpoint.
+        stored_keys (dict[str, str | None]): The encrypted API keys already
+            stored, by endpoint URL.
+
+    Returns:
+        dict: The endpoint URL, model name and encrypted API key.
+
+    Notes:
+        1. An endpoint given without an API key keeps the key stored for the same
+           URL, since the settings form never shows keys.
+
+    """
+    if fallback.api_key:
+        encrypted_api_key = encrypt_data(data=fallback.api_key)
+    else:
+        encrypted_api_key = stored_keys.get(fallback.llm_endpoint)
+    return {
+        "llm_endpoint": fallback.llm_endpoint,
+        "llm_model_name": fallback.llm_model_name,
+        "encrypted_api_key": encrypted_api_key,
+    }
+
+
+def _update_fallback_endpoints(
+    settings: UserSettings,
+    fallbacks: list[LLMEndpoint] | None,
+) -> None:
+    """Replace the fallback endpoints if a list is provided.
+
+    Args:
+        settings (UserSettings): The settings object to update.
+        fallbacks (list[LLMEndpoint] | None): The ordered fallback endpoints, or None
+            to skip.
+
+    Notes:
+        1. If fallbacks is None, do nothing (field remains unchanged).
+        2. If fallbacks is empty, set field to None.
+        3. Otherwise, store the endpoints as a list of dictionaries, each with its
+           own API key encrypted.
+
+    """
+    if fallbacks is not None:
+        stored_keys = {
+            stored["llm_endpoint"]: stored.get("encrypted_api_key")
+            for stored in settings.llm_fallback_endpoints or []
+        }
+        settings.llm_fallback_endpoints = [
+            _store_fallback_endpoint(fallback, stored_keys) for fallback in fallbacks
+        ] or None
+
+
+def _parse_fallback_line(fields: list[str]) -> LLMEndpoint:
+    """Parse one line of the fallback endpoints entered on the settings form.
+
+    Args:
+        fields (list[str]): The line's whitespace-separated fields.
+
+    Returns:
+        LLMEndpoint: The endpoint, with its model and API key if given.
+
+    Raises:
+        ValueError: If the line is not an http(s) URL with at most one model name
+            and one API key.
+
+    """
+    api_key = None
+    if len(fields) > 1 and fields[-1].startswith(FALLBACK_API_KEY_PREFIX):
+        api_key = fields.pop().removeprefix(FALLBACK_API_KEY_PREFIX) or None
+    if len(fields) > 2 or not fields[0].startswith(("http://", "https://")):
+        _msg = (
+            "Each fallback endpoint must be an http(s) URL, optionally followed by a "
+            f"model name and {FALLBACK_API_KEY_PREFIX} with the endpoint's API key."
+        )
+        raise ValueError(_msg)
+    return LLMEndpoint(
+        llm_endpoint=fields[0],
+        llm_model_name=fields[1] if len(fields) == 2 else None,
+        api_key=api_key,
+    )
+
+
+def parse_fallback_endpoints(text: str | None) -> list[LLMEndpoint] | None:
+    """Parse the fallback endpoints entered on the settings form.
+
+    Args:
+        text (str | None): One endpoint URL per line, optionally followed by a
+            space and the model to request from it, then by `key=` and the
+            endpoint's API key.
+
+    Returns:
+        list[LLMEndpoint] | None: The endpoints in order, or None if the field
+            was not submitted.
+
+    Raises:
+        ValueError: If a line is not an http(s) URL with at most one model name
+            and one API key.
+
+    Notes:
+        1. Blank lines are ignored, so an empty field removes every fallback.
+
+    """
+    if text is None:
+        return None
+    return [
+        _parse_fallback_line(fields)
+        for fields in (line.split() for line in text.splitlines())
+        if fields
+    ]
+
+
+def format_fallback_endpoints(fallbacks: list[dict] | None) -> str:
+    """Format stored fallback endpoints for the settings form.
+
+    Args:
+        fallbacks (list[dict] | None): The stored fallback endpoints.
+
+    Returns:
+        str: One endpoint URL per line, followed by its model name if it has one.
+
+    Notes:
+        1. API keys are never shown; saving the lines unchanged keeps them.
+
+    """
+    return "\n".join(
+        f"{fallback['llm_endpoint']} {fallback.get('llm_model_name') or ''}".strip()
+        for fallback in fallbacks or []
+    )
+
+
 def update_user_settings(
     db: Session,
     user_id: int,
@@ -152,8 +295,9 @@ def update_user_settings(
         2. Update llm_endpoint using _update_optional_string_field.
         3. Update llm_model_name using _update_optional_string_field if present.
         4. Update API key using _update_api_key_if_present.
-        5. Commit the transaction and refresh the settings object.
-        6. This function performs a database read and possibly a write operation.
+        5. Replace the fallback endpoints using _update_fallback_endpoints.
+        6. Commit the transaction and refresh the settings object.
+        7. This function performs a database read and possibly a write operation.
 
     """
     _msg = f"Updating settings for user_id: {user_id}"
@@ -178,6 +322,11 @@ def update_user_settings(
             settings_data.access_token_expire_minutes,
         )
 
+    _update_fallback_endpoints(
+        settings,
+        getattr(settings_data, "llm_fallback_endpoints", None),
+    )
+
     db.commit()
     db.refresh(settings)
     return settings
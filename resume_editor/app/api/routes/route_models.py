@@ -388,11 +388,13 @@ class RefineForm:
         limit_refinement_years: str | None = Form(None),
         company: str | None = Form(None),
         notes: str | None = Form(None),
+        force_fresh: bool = Form(False),
     ) -> None:
         self.job_description = job_description
         self.limit_refinement_years = limit_refinement_years
         self.company = company
         self.notes = notes
+        self.force_fresh = force_fresh
 
 
 class RefinementContext:
@@ -469,6 +471,8 @@ class SettingsUpdateForm:
         llm_model_name (str | None): The user-specified LLM model name.
         api_key (str | None): Plaintext API key for the LLM service.
         access_token_expire_minutes (str | None): Session timeout in minutes.
+        llm_fallback_endpoints (str | None): Fallback endpoint URLs, one per line,
+            each optionally followed by a model name and `key=` with its API key.
 
     """
 
@@ -478,11 +482,13 @@ class SettingsUpdateForm:
         llm_model_name: str | None = Form(None),
         api_key: str | None = Form(None),
         access_token_expire_minutes: str | None = Form(None),
+        llm_fallback_endpoints: str | None = Form(None),
     ) -> None:
         self.llm_endpoint = llm_endpoint
         self.llm_model_name = llm_model_name
         self.api_key = api_key
         self.access_token_expire_minutes = access_token_expire_minutes
+        self.llm_fallback_endpoints = llm_fallback_endpoints
 
 
 class RefineResponse(BaseModel):
@@ -651,6 +657,26 @@ class CertificationsResponse(BaseModel):
     certifications: list[Certification]
 
 
+class ResumeSectionsResponse(BaseModel):
+    """Bundle of all structured sections extracted from a single resume parse.
+
+    Attributes:
+        personal (PersonalInfoResponse): The personal information section.
+        education (EducationResponse): The education section.
+        experience (ExperienceResponse): The experience section, with roles and projects.
+        certifications (CertificationsResponse): The certifications section.
+
+    Notes:
+        1. Produced by `extract_all_sections` so that callers needing several sections parse the content only once.
+
+    """
+
+    personal: PersonalInfoResponse
+    education: EducationResponse
+    experience: ExperienceResponse
+    certifications: CertificationsResponse
+
+
 class ProjectUpdateForm:
     """Form data for updating projects."""
 
@@ -769,3 +795,9 @@ class ExperienceRefinementParams(BaseModel):
     extracted_work_arrangement: str | None = None
     extracted_location: str | None = None
     extracted_special_instructions: str | None = None
+    bypass_analysis_cache: bool = False
+    bypass_role_cache: bool = False
+    # The experience section of resume_content_to_refine, if already loaded.
+    experience_info: Any = None
+    # The token usage ledger of the refinement, set while it streams.
+    token_usage: Any = None
@@ -268,6 +268,7 @@ def get_user_settings(
     return UserSettingsResponse(
         llm_endpoint=settings.llm_endpoint,
         api_key_is_set=bool(settings.encrypted_api_key),
+        llm_fallback_endpoints=settings.llm_fallback_endpoints or [],
     )
 
 
@@ -299,6 +300,7 @@ def update_user_settings(
     return UserSettingsResponse(
         llm_endpoint=settings.llm_endpoint,
         api_key_is_set=bool(settings.encrypted_api_key),
+        llm_fallback_endpoints=settings.llm_fallback_endpoints or [],
     )
 
 
@@ -1,5 +1,8 @@
 import logging
+import os
+import tempfile
 from functools import lru_cache
+from typing import Literal
 
 from pydantic import Field, PostgresDsn, computed_field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -25,6 +28,45 @@ class Settings(BaseSettings):
         llm_api_key (str | None): API key for accessing LLM services.
             Optional; used when LLM functionality is needed.
         encryption_key (str): Key used for encrypting sensitive data.
+        parse_executor_kind (str): Worker pool used for CPU-bound resume parsing,
+            either "thread" or "process".
+        parse_executor_max_workers (int): Number of workers in the parsing pool.
+        job_analysis_cache_enabled (bool): Whether job analyses are cached in the database.
+        job_analysis_cache_ttl_seconds (int): How long a cached job analysis stays valid.
+        job_analysis_cache_max_entries (int): Maximum number of cached job analyses kept.
+        llm_retry_max_attempts (int): Attempts per LLM request, including the first.
+        llm_retry_base_delay_seconds (float): Backoff ceiling of the first LLM retry.
+        llm_retry_max_delay_seconds (float): Largest delay waited before an LLM retry.
+        llm_retry_budget (int): LLM retries allowed per refinement.
+        llm_rate_limit_requests_per_minute (int): LLM requests allowed per minute for
+            each endpoint and API key, or 0 for no limit.
+        llm_rate_limit_tokens_per_minute (int): Estimated LLM tokens allowed per minute
+            for each endpoint and API key, or 0 for no limit.
+        llm_rate_limit_backend (str): Where the LLM rate limits are kept, "memory" for
+            each worker process or "file" to share them between workers.
+        llm_rate_limit_state_dir (str): Directory of the "file" backend's state files.
+        llm_prompt_encoding (str): JSON encoding of structured prompt data, "compact"
+            to drop whitespace, nulls, defaults and unused fields, or "indented".
+        llm_role_batch_token_budget (int): Estimated tokens of role JSON packed into one
+            role refinement request, or 0 to refine every role in its own request.
+        llm_role_batch_max_roles (int): Most roles packed into one role refinement request.
+        llm_role_refine_streaming (bool): Whether single-role refinement responses are
+            streamed, sending the summary to the browser as it is written.
+        llm_hedge_enabled (bool): Whether a role refinement request slower than the
+            endpoint's recent 95th percentile is duplicated, using whichever finishes first.
+        llm_hedge_max_ratio (float): Hedged requests allowed per role refinement request.
+        llm_hedge_min_delay_seconds (float): Shortest wait before a request is hedged.
+        llm_circuit_breaker_enabled (bool): Whether LLM calls skip an endpoint whose
+            recent calls mostly failed or were slow, using its fallbacks instead.
+        llm_circuit_breaker_failure_rate (float): Share of failed calls in the last
+            minute that opens an endpoint's circuit.
+        llm_circuit_breaker_slow_call_seconds (float): Latency from which a call is slow.
+        llm_circuit_breaker_slow_call_rate (float): Share of slow calls in the last
+            minute that opens an endpoint's circuit.
+        llm_circuit_breaker_min_calls (int): Calls in the last minute needed before
+            an endpoint's circuit can open.
+        llm_circuit_breaker_open_seconds (float): How long an open circuit skips its
+            endpoint before trial calls are let through.
 
     """
 
@@ -87,6 +129,148 @@ class Settings(BaseSettings):
     # Encryption key
     encryption_key: str = Field(validation_alias="ENCRYPTION_KEY")
 
+    # Resume parsing worker pool
+    parse_executor_kind: Literal["thread", "process"] = Field(
+        default="thread",
+        validation_alias="PARSE_EXECUTOR_KIND",
+    )
+    parse_executor_max_workers: int = Field(
+        default=4,
+        ge=1,
+        validation_alias="PARSE_EXECUTOR_MAX_WORKERS",
+    )
+
+    # Persistent job analysis cache
+    job_analysis_cache_enabled: bool = Field(
+        default=True,
+        validation_alias="JOB_ANALYSIS_CACHE_ENABLED",
+    )
+    job_analysis_cache_ttl_seconds: int = Field(
+        default=7 * 24 * 60 * 60,
+        ge=0,
+        validation_alias="JOB_ANALYSIS_CACHE_TTL_SECONDS",
+    )
+    job_analysis_cache_max_entries: int = Field(
+        default=1000,
+        ge=1,
+        validation_alias="JOB_ANALYSIS_CACHE_MAX_ENTRIES",
+    )
+
+    # LLM retry policy
+    llm_retry_max_attempts: int = Field(
+        default=3,
+        ge=1,
+        validation_alias="LLM_RETRY_MAX_ATTEMPTS",
+    )
+    llm_retry_base_delay_seconds: float = Field(
+        default=1.0,
+        ge=0,
+        validation_alias="LLM_RETRY_BASE_DELAY_SECONDS",
+    )
+    llm_retry_max_delay_seconds: float = Field(
+        default=30.0,
+        ge=0,
+        validation_alias="LLM_RETRY_MAX_DELAY_SECONDS",
+    )
+    llm_retry_budget: int = Field(
+        default=10,
+        ge=0,
+        validation_alias="LLM_RETRY_BUDGET",
+    )
+
+    # Shared LLM rate limits
+    llm_rate_limit_requests_per_minute: int = Field(
+        default=0,
+        ge=0,
+        validation_alias="LLM_RATE_LIMIT_REQUESTS_PER_MINUTE",
+    )
+    llm_rate_limit_tokens_per_minute: int = Field(
+        default=0,
+        ge=0,
+        validation_alias="LLM_RATE_LIMIT_TOKENS_PER_MINUTE",
+    )
+    llm_rate_limit_backend: Literal["memory", "file"] = Field(
+        default="memory",
+        validation_alias="LLM_RATE_LIMIT_BACKEND",
+    )
+    llm_rate_limit_state_dir: str = Field(
+        default=os.path.join(tempfile.gettempdir(), "resume_editor_llm_rate_limits"),
+        validation_alias="LLM_RATE_LIMIT_STATE_DIR",
+    )
+
+    # Prompt encoding
+    llm_prompt_encoding: Literal["compact", "indented"] = Field(
+        default="compact",
+        validation_alias="LLM_PROMPT_ENCODING",
+    )
+
+    # Batched role refinement
+    llm_role_batch_token_budget: int = Field(
+        default=1500,
+        ge=0,
+        validation_alias="LLM_ROLE_BATCH_TOKEN_BUDGET",
+    )
+    llm_role_batch_max_roles: int = Field(
+        default=6,
+        ge=1,
+        validation_alias="LLM_ROLE_BATCH_MAX_ROLES",
+    )
+
+    # Streamed role refinement
+    llm_role_refine_streaming: bool = Field(
+        default=True,
+        validation_alias="LLM_ROLE_REFINE_STREAMING",
+    )
+
+    # Hedged role refinement requests
+    llm_hedge_enabled: bool = Field(
+        default=False,
+        validation_alias="LLM_HEDGE_ENABLED",
+    )
+    llm_hedge_max_ratio: float = Field(
+        default=0.1,
+        ge=0,
+        validation_alias="LLM_HEDGE_MAX_RATIO",
+    )
+    llm_hedge_min_delay_seconds: float = Field(
+        default=2.0,
+        ge=0,
+        validation_alias="LLM_HEDGE_MIN_DELAY_SECONDS",
+    )
+
+    # LLM endpoint circuit breakers
+    llm_circuit_breaker_enabled: bool = Field(
+        default=True,
+        validation_alias="LLM_CIRCUIT_BREAKER_ENABLED",
+    )
+    llm_circuit_breaker_failure_rate: float = Field(
+        default=0.5,
+        gt=0,
+        le=1,
+        validation_alias="LLM_CIRCUIT_BREAKER_FAILURE_RATE",
+    )
+    llm_circuit_breaker_slow_call_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        validation_alias="LLM_CIRCUIT_BREAKER_SLOW_CALL_SECONDS",
+    )
+    llm_circuit_breaker_slow_call_rate: float = Field(
+        default=0.8,
+        gt=0,
+        le=1,
+        validation_alias="LLM_CIRCUIT_BREAKER_SLOW_CALL_RATE",
+    )
+    llm_circuit_breaker_min_calls: int = Field(
+        default=10,
+        ge=1,
+        validation_alias="LLM_CIRCUIT_BREAKER_MIN_CALLS",
+    )
+    llm_circuit_breaker_open_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        validation_alias="LLM_CIRCUIT_BREAKER_OPEN_SECONDS",
+    )
+
 
 @lru_cache
 def get_settings() -> Settings:
@@ -0,0 +1,195 @@
+"""Event-loop lag and memory measurements of the running worker."""
+
+import asyncio
+import contextlib
+import logging
+import math
+import os
+import resource
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+
+log = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL_SECONDS = 0.1
+# Ten minutes of samples at the default interval.
+DEFAULT_WINDOW_SIZE = 6000
+
+
+@dataclass(frozen=True)
+class RuntimeStats:
+    """Snapshot of a worker's event-loop lag and memory use.
+
+    Attributes:
+        pid (int): The worker's process id.
+        running (bool): Whether the lag monitor is running.
+        lag_samples (int): Lag samples in the window.
+        loop_lag_p50_ms (float): Median event-loop lag over the window.
+        loop_lag_p99_ms (float): 99th-percentile event-loop lag over the window.
+        loop_lag_max_ms (float): Largest event-loop lag since the last reset.
+        rss_kib (int | None): Current resident set size, if the platform reports it.
+        peak_rss_kib (int): Largest resident set size of the process so far.
+
+    """
+
+    pid: int
+    running: bool
+    lag_samples: int
+    loop_lag_p50_ms: float
+    loop_lag_p99_ms: float
+    loop_lag_max_ms: float
+    rss_kib: int | None
+    peak_rss_kib: int
+
+
+def _quantile(ordered: list[float], quantile: float) -> float:
+    """Return the nearest-rank quantile of sorted values, or 0 if there are none.
+
+    Args:
+        ordered (list[float]): The values, in ascending order.
+        quantile (float): The quantile, between 0 and 1.
+
+    Returns:
+        float: The value at the quantile.
+
+    """
+    if not ordered:
+        return 0.0
+    return ordered[max(math.ceil(quantile * len(ordered)), 1) - 1]
+
+
+def current_rss_kib() -> int | None:
+    """Return the process's current resident set size.
+
+    Returns:
+        int | None: The RSS in KiB, or None where /proc is unavailable.
+
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            resident_pages = int(statm.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE") // 1024
+
+
+def peak_rss_kib() -> int:
+    """Return the largest resident set size of the process so far.
+
+    Returns:
+        int: The peak RSS in KiB.
+
+    Notes:
+        1. `ru_maxrss` is in KiB on Linux and in bytes on macOS.
+
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if os.uname().sysname == "Darwin" else peak
+
+
+class EventLoopLagMonitor:
+    """Measures how late the event loop wakes up a task that sleeps at intervals.
+
+    Attributes:
+        interval (float): Seconds the probe task sleeps between samples.
+        window_size (int): Number of recent lag samples kept.
+
+    Notes:
+        1. The lag is how much longer than `interval` each sleep took: time the
+           loop spent running other callbacks, such as blocking code in a handler.
+        2. Samples are protected by a threading.Lock, since stats are read from
+           the health endpoint.
+
+    """
+
+    def __init__(
+        self,
+        interval: float = DEFAULT_INTERVAL_SECONDS,
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a stopped monitor.
+
+        Args:
+            interval (float): Seconds the probe task sleeps between samples.
+            window_size (int): Number of recent lag samples kept.
+            clock (Callable[[], float]): Monotonic time source.
+
+        """
+        self.interval = interval
+        self.window_size = window_size
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._lags: deque[float] = deque(maxlen=window_size)
+        self._max_lag = 0.0
+        self._task: asyncio.Task | None = None
+
+    def record_lag(self, lag: float) -> None:
+        """Record one lag sample.
+
+        Args:
+            lag (float): Seconds the probe woke up late.
+
+        """
+        with self._lock:
+            self._lags.append(lag)
+            self._max_lag = max(self._max_lag, lag)
+
+    async def _probe(self) -> None:
+        """Sleep for the interval forever, recording how late each wake-up is."""
+        while True:
+            started_at = self._clock()
+            await asyncio.sleep(self.interval)
+            self.record_lag(max(self._clock() - started_at - self.interval, 0.0))
+
+    def start(self) -> None:
+        """Start sampling on the running event loop, if not already started."""
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.get_running_loop().create_task(self._probe())
+        _msg = f"Event loop lag monitor started, sampling every {self.interval}s"
+        log.debug(_msg)
+
+    async def stop(self) -> None:
+        """Stop sampling and wait for the probe task to finish."""
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    def stats(self) -> RuntimeStats:
+        """Return a snapshot of the lag samples and the process's memory use.
+
+        Returns:
+            RuntimeStats: The current state.
+
+        """
+        with self._lock:
+            ordered = sorted(self._lags)
+            max_lag = self._max_lag
+        rss = current_rss_kib()
+        return RuntimeStats(
+            pid=os.getpid(),
+            running=self._task is not None and not self._task.done(),
+            lag_samples=len(ordered),
+            loop_lag_p50_ms=_quantile(ordered, 0.5) * 1000,
+            loop_lag_p99_ms=_quantile(ordered, 0.99) * 1000,
+            loop_lag_max_ms=max_lag * 1000,
+            rss_kib=rss,
+            peak_rss_kib=max(peak_rss_kib(), rss or 0),
+        )
+
+    def reset(self) -> None:
+        """Forget the lag samples; the probe task keeps running."""
+        with self._lock:
+            self._lags.clear()
+            self._max_lag = 0.0
+
+
+# Module-level singleton instance
+runtime_monitor = EventLoopLagMonitor()
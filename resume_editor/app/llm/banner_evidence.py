@@ -0,0 +1,416 @@
+"""Cross-section evidence and role formatting used as banner generation input."""
+
+import logging
+from typing import Any
+
+from resume_editor.app.api.routes.route_logic.resume_section_index import (
+    get_section_index,
+)
+from resume_editor.app.llm.models import (
+    CrossSectionEvidence,
+    JobAnalysis,
+    RefinedRoleRecord,
+)
+
+log = logging.getLogger(__name__)
+
+
+def _extract_section_content(resume_content: str, section_name: str) -> str | None:
+    """Extract the raw content of a section from resume markdown.
+
+    Args:
+        resume_content: The full Markdown content.
+        section_name: The name of the section to extract.
+
+    Returns:
+        The section content or None if not found.
+
+    Notes:
+        1. Looks up the # SectionName header (case-insensitive) in the shared section index.
+        2. Slices the content until the next # header or end of content.
+
+    """
+    body = get_section_index(resume_content).section_body(section_name)
+    result = body.strip() if body else ""
+    return result if result else None
+
+
+def _has_skill_match(line_lower: str, job_skills_lower: list[str]) -> bool:
+    """Check if line contains any job skill.
+
+    Args:
+        line_lower: Lowercase line to check.
+        job_skills_lower: Lowercase job skills for matching.
+
+    Returns:
+        True if any skill matches.
+
+    """
+    return any(skill in line_lower for skill in job_skills_lower)
+
+
+def _has_theme_match(line_lower: str, job_themes_lower: list[str]) -> bool:
+    """Check if line contains any job theme.
+
+    Args:
+        line_lower: Lowercase line to check.
+        job_themes_lower: Lowercase job themes for matching.
+
+    Returns:
+        True if any theme matches.
+
+    """
+    return any(theme in line_lower for theme in job_themes_lower)
+
+
+def _is_advanced_degree(line_lower: str) -> bool:
+    """Check if line indicates an advanced degree.
+
+    Args:
+        line_lower: Lowercase line to check.
+
+    Returns:
+        True if advanced degree detected.
+
+    """
+    return any(term in line_lower for term in ["master", "phd", "doctorate", "mba"])
+
+
+def _has_senior_themes(job_themes_lower: list[str]) -> bool:
+    """Check if themes indicate senior-level role.
+
+    Args:
+        job_themes_lower: Lowercase job themes.
+
+    Returns:
+        True if senior themes detected.
+
+    """
+    all_themes = " ".join(job_themes_lower)
+    return any(
+        term in all_themes for term in ["senior", "lead", "principal", "advanced"]
+    )
+
+
+def _calculate_education_relevance(
+    education_line: str,
+    job_skills_lower: list[str],
+    job_themes_lower: list[str],
+) -> int:
+    """Calculate relevance score for an education entry.
+
+    Args:
+        education_line: A line from the education section.
+        job_skills_lower: Lowercase job skills for matching.
+        job_themes_lower: Lowercase job themes for matching.
+
+    Returns:
+        Relevance score from 1-10.
+
+    Notes:
+        1. Base score of 5 for any degree.
+        2. +2 if field of study matches job skills/themes.
+        3. +1 for advanced degrees with senior roles.
+
+    """
+    score = 5
+    line_lower = education_line.lower()
+
+    if _has_skill_match(line_lower, job_skills_lower):
+        score += 2
+
+    if _has_theme_match(line_lower, job_themes_lower):
+        score += 1
+
+    if _is_advanced_degree(line_lower) and _has_senior_themes(job_themes_lower):
+        score += 1
+
+    return min(score, 10)
+
+
+def _calculate_certification_relevance(
+    cert_line: str,
+    job_skills_lower: list[str],
+) -> int:
+    """Calculate relevance score for a certification entry.
+
+    Args:
+        cert_line: A line from the certifications section.
+        job_skills_lower: Lowercase job skills for matching.
+
+    Returns:
+        Relevance score from 1-10.
+
+    Notes:
+        1. Base score of 6 for any certification.
+        2. +3 if certification matches a job skill.
+
+    """
+    score = 6
+    line_lower = cert_line.lower()
+
+    for skill in job_skills_lower:
+        if skill in line_lower:
+            score += 3
+            break
+
+    return min(score, 10)
+
+
+def _calculate_project_relevance(
+    project_chunk: str,
+    job_skills_lower: list[str],
+    job_themes_lower: list[str],
+) -> int:
+    """Calculate relevance score for a project entry.
+
+    Args:
+        project_chunk: Text describing a project.
+        job_skills_lower: Lowercase job skills for matching.
+        job_themes_lower: Lowercase job themes for matching.
+
+    Returns:
+        Relevance score from 1-10.
+
+    Notes:
+        1. Base score of 4 for any project.
+        2. +2 for each matching job skill (up to +4).
+        3. +1 for each matching theme (up to +2).
+
+    """
+    score = 4
+    chunk_lower = project_chunk.lower()
+
+    skill_matches = sum(1 for skill in job_skills_lower if skill in chunk_lower)
+    score += min(skill_matches * 2, 4)
+
+    theme_matches = sum(1 for theme in job_themes_lower if theme in chunk_lower)
+    score += min(theme_matches, 2)
+
+    return min(score, 10)
+
+
+def _split_projects_section(projects_section: str) -> list[str]:
+    """Split the projects section into individual project chunks.
+
+    Args:
+        projects_section: The content of the projects section.
+
+    Returns:
+        List of project chunks.
+
+    """
+    lines = projects_section.splitlines()
+    chunks = []
+    current_chunk = []
+
+    for line in lines:
+        if line.strip().startswith("### "):
+            if current_chunk:
+                chunks.append("\n".join(current_chunk))
+                current_chunk = []
+        current_chunk.append(line)
+
+    if current_chunk:
+        chunks.append("\n".join(current_chunk))
+
+    return chunks if chunks else [projects_section]
+
+
+def _extract_education_evidence(
+    resume_content: str,
+    job_analysis: JobAnalysis,
+) -> list[CrossSectionEvidence]:
+    """Extract education-related evidence.
+
+    Args:
+        resume_content: The resume markdown content.
+        job_analysis: The job analysis for context.
+
+    Returns:
+        List of education evidence items.
+
+    """
+    evidence_list = []
+    job_skills_lower = [skill.lower() for skill in job_analysis.key_skills]
+    job_themes_lower = [
+        theme.lower() for theme in job_analysis.themes + job_analysis.inferred_themes
+    ]
+
+    education_section = _extract_section_content(resume_content, "education")
+    if not education_section:
+        return evidence_list
+
+    degree_keywords = [
+        "bachelor",
+        "master",
+        "phd",
+        "doctorate",
+        "bs",
+        "ms",
+        "ba",
+        "ma",
+        "mba",
+    ]
+
+    for line in education_section.split("\n"):
+        line_lower = line.lower()
+        if any(keyword in line_lower for keyword in degree_keywords):
+            relevance = _calculate_education_relevance(
+                line, job_skills_lower, job_themes_lower
+            )
+            if relevance >= 5:
+                evidence_list.append(
+                    CrossSectionEvidence(
+                        section_type="Education",
+                        content=line.strip(),
+                        relevance_score=relevance,
+                    ),
+                )
+
+    return evidence_list
+
+
+def _extract_certification_evidence(
+    resume_content: str,
+    job_analysis: JobAnalysis,
+) -> list[CrossSectionEvidence]:
+    """Extract certification-related evidence.
+
+    Args:
+        resume_content: The resume markdown content.
+        job_analysis: The job analysis for context.
+
+    Returns:
+        List of certification evidence items.
+
+    """
+    evidence_list = []
+    job_skills_lower = [skill.lower() for skill in job_analysis.key_skills]
+
+    certifications_section = _extract_section_content(resume_content, "certifications")
+    if not certifications_section:
+        return evidence_list
+
+    for line in certifications_section.split("\n"):
+        line_stripped = line.strip()
+        if line_stripped and not line_stripped.startswith("#"):
+            relevance = _calculate_certification_relevance(
+                line_stripped, job_skills_lower
+            )
+            if relevance >= 6:
+                evidence_list.append(
+                    CrossSectionEvidence(
+                        section_type="Certification",
+                        content=line_stripped,
+                        relevance_score=relevance,
+                    ),
+                )
+
+    return evidence_list
+
+
+def _extract_project_evidence(
+    resume_content: str,
+    job_analysis: JobAnalysis,
+) -> list[CrossSectionEvidence]:
+    """Extract project-related evidence.
+
+    Args:
+        resume_content: The resume markdown content.
+        job_analysis: The job analysis for context.
+
+    Returns:
+        List of project evidence items.
+
+    """
+    evidence_list = []
+    job_skills_lower = [skill.lower() for skill in job_analysis.key_skills]
+    job_themes_lower = [
+        theme.lower() for theme in job_analysis.themes + job_analysis.inferred_themes
+    ]
+
+    projects_section = _extract_section_content(resume_content, "projects")
+    if not projects_section:
+        return evidence_list
+
+    project_chunks = _split_projects_section(projects_section)
+    for chunk in project_chunks:
+        relevance = _calculate_project_relevance(
+            chunk, job_skills_lower, job_themes_lower
+        )
+        if relevance >= 5:
+            evidence_list.append(
+                CrossSectionEvidence(
+                    section_type="Project",
+                    content=chunk.strip()[:200],
+                    relevance_score=relevance,
+                ),
+            )
+
+    return evidence_list
+
+
+def _extract_cross_section_evidence(
+    resume_content: str,
+    job_analysis: JobAnalysis,
+) -> list[CrossSectionEvidence]:
+    """Extract relevant evidence from Education, Certifications, and Projects.
+
+    Args:
+        resume_content: The full Markdown content.
+        job_analysis: The job analysis containing key skills and themes.
+
+    Returns:
+        List of evidence items ordered by relevance score.
+
+    """
+    _msg = "_extract_cross_section_evidence starting"
+    log.debug(_msg)
+
+    evidence_list: list[CrossSectionEvidence] = []
+
+    evidence_list.extend(_extract_education_evidence(resume_content, job_analysis))
+    evidence_list.extend(_extract_certification_evidence(resume_content, job_analysis))
+    evidence_list.extend(_extract_project_evidence(resume_content, job_analysis))
+
+    evidence_list.sort(key=lambda x: x.relevance_score, reverse=True)
+
+    _msg = f"_extract_cross_section_evidence returning {len(evidence_list)} items"
+    log.debug(_msg)
+    return evidence_list
+
+
+def _format_role_data_for_banner(
+    refined_roles: list[RefinedRoleRecord],
+) -> list[dict[str, Any]]:
+    """Format refined role records for banner generation input.
+
+    Args:
+        refined_roles: List of refined role records.
+
+    Returns:
+        Formatted role data suitable for LLM prompt.
+
+    """
+    _msg = "_format_role_data_for_banner starting"
+    log.debug(_msg)
+
+    formatted_roles = []
+    for role in refined_roles:
+        role_data = {
+            "company": role.company,
+            "title": role.title,
+            "description": role.refined_description[:300]
+            if len(role.refined_description) > 300
+            else role.refined_description,
+            "skills": role.relevant_skills,
+            "position": role.original_index,
+        }
+        formatted_roles.append(role_data)
+
+    formatted_roles.sort(key=lambda x: x["position"])
+
+    _msg = f"_format_role_data_for_banner returning {len(formatted_roles)} roles"
+    log.debug(_msg)
+    return formatted_roles
@@ -0,0 +1,723 @@
+"""Per-endpoint circuit breakers that route LLM calls around a degraded endpoint."""
+
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Literal, TypeVar
+
+import httpx
+from openai import APIConnectionError
+
+from resume_editor.app.llm.concurrency_limiter import (
+    concurrency_limiter_key,
+    endpoint_label,
+    is_overload_error,
+)
+from resume_editor.app.llm.models import LLMConfig
+from resume_editor.app.llm.orchestration_registry import llm_client_key
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+CLOSED: CircuitState = "closed"
+OPEN: CircuitState = "open"
+HALF_OPEN: CircuitState = "half_open"
+
+DEFAULT_FAILURE_RATE_THRESHOLD = 0.5
+DEFAULT_SLOW_CALL_SECONDS = 30.0
+DEFAULT_SLOW_CALL_RATE_THRESHOLD = 0.8
+DEFAULT_MIN_CALLS = 10
+DEFAULT_WINDOW_SECONDS = 60.0
+DEFAULT_OPEN_SECONDS = 30.0
+DEFAULT_MAX_ENDPOINTS = 64
+# Trial calls let through while half-open; all of them must succeed to close.
+HALF_OPEN_TRIAL_CALLS = 2
+
+_TRANSPORT_ERROR_TYPES = (ConnectionError, APIConnectionError, httpx.TransportError)
+
+
+class CircuitOpenError(ValueError):
+    """Raised when the circuits of an LLM endpoint and all its fallbacks are open."""
+
+
+def circuit_breaker_key(llm_config: LLMConfig) -> str:
+    """Compute the registry key for the circuit breaker of an LLM configuration.
+
+    Args:
+        llm_config (LLMConfig): The LLM configuration.
+
+    Returns:
+        str: The endpoint, model and API key digest, like the rate limit key
+            with the model added.
+
+    Notes:
+        1. A model or an account can fail on an endpoint that is otherwise
+           healthy, so each gets its own breaker.
+
+    """
+    _endpoint, model, api_key_hash = llm_client_key(llm_config)
+    return f"{concurrency_limiter_key(llm_config)}#{model}#{api_key_hash}"
+
+
+def is_endpoint_failure(error: BaseException) -> bool:
+    """Determine if an error says the endpoint itself is unhealthy.
+
+    Args:
+        error (BaseException): The error raised by an LLM request.
+
+    Returns:
+        bool: True for transport errors, timeouts, HTTP 429 and HTTP 5xx
+            responses, False otherwise.
+
+    Notes:
+        1. Malformed or invalid responses are retried but do not count against
+           the endpoint: they come from the model's output, not its health.
+
+    """
+    return is_overload_error(error) or isinstance(error, _TRANSPORT_ERROR_TYPES)
+
+
+@dataclass(frozen=True)
+class CircuitBreakerPolicy:
+    """When a circuit opens and how long it stays open.
+
+    Attributes:
+        failure_rate_threshold (float): Share of failed calls in the window that
+            opens the circuit.
+        slow_call_seconds (float): Latency from which a successful call is slow.
+        slow_call_rate_threshold (float): Share of slow calls in the window that
+            opens the circuit.
+        min_calls (int): Calls the window must hold before the rates are trusted.
+        window_seconds (float): How far back the rolling window reaches.
+        open_seconds (float): How long an open circuit rejects calls before
+            letting trial calls through.
+
+    """
+
+    failure_rate_threshold: float = DEFAULT_FAILURE_RATE_THRESHOLD
+    slow_call_seconds: float = DEFAULT_SLOW_CALL_SECONDS
+    slow_call_rate_threshold: float = DEFAULT_SLOW_CALL_RATE_THRESHOLD
+    min_calls: int = DEFAULT_MIN_CALLS
+    window_seconds: float = DEFAULT_WINDOW_SECONDS
+    open_seconds: float = DEFAULT_OPEN_SECONDS
+
+    def __post_init__(self) -> None:
+        """Validate the thresholds and durations.
+
+        Raises:
+            ValueError: If a rate is not in (0, 1], or the call count or a duration
+                is not positive.
+
+        """
+        rates_valid = (
+            0 < self.failure_rate_threshold <= 1
+            and 0 < self.slow_call_rate_threshold <= 1
+        )
+        durations_valid = (
+            min(self.slow_call_seconds, self.window_seconds, self.open_seconds) > 0
+        )
+        if not (rates_valid and durations_valid and self.min_calls >= 1):
+            _msg = f"Invalid LLM circuit breaker settings: {self!r}"
+            raise ValueError(_msg)
+
+
+@dataclass(frozen=True)
+class CircuitBreakerStats:
+    """Point-in-time state of a CircuitBreaker.
+
+    Attributes:
+        endpoint (str): Label of the circuit's endpoint, model and API key, from
+            `endpoint_label` of its key.
+        state (str): "closed", "open" or "half_open".
+        calls (int): Calls in the rolling window.
+        failure_rate (float): Share of the window's calls that failed.
+        slow_call_rate (float): Share of the window's calls that were slow.
+        times_opened (int): Number of times the circuit opened.
+        rejected (int): Calls refused while the circuit was open or its trial
+            calls were taken.
+        seconds_until_half_open (float | None): Time left before trial calls are
+            let through, or None unless the circuit is open.
+
+    """
+
+    endpoint: str
+    state: str
+    calls: int
+    failure_rate: float
+    slow_call_rate: float
+    times_opened: int
+    rejected: int
+    seconds_until_half_open: float | None
+
+
+@dataclass(frozen=True)
+class CircuitPermit:
+    """Permission for one call through a CircuitBreaker.
+
+    Attributes:
+        breaker (CircuitBreaker): The breaker that granted the call.
+        generation (int): The breaker's state generation when the call started.
+        started_at (float): Clock time the call started.
+        counted (bool): Whether the call's outcome is recorded; False for calls let
+            through a circuit that opened only because calls were slow.
+
+    """
+
+    breaker: "CircuitBreaker"
+    generation: int
+    started_at: float
+    counted: bool = True
+
+
+class CircuitBreaker:
+    """Closed, open and half-open circuit of one LLM endpoint.
+
+    While closed, every call is let through and its outcome is kept in a rolling
+    window. Once the window holds min_calls calls and too many of them failed or
+    were slow, the circuit opens and refuses calls for open_seconds. It then
+    turns half-open and lets HALF_OPEN_TRIAL_CALLS trial calls through: if they
+    all succeed quickly it closes with an empty window, otherwise it opens again.
+
+    Attributes:
+        endpoint (str): The LLM endpoint the circuit protects.
+        key (str): The registry key of the circuit, from `circuit_breaker_key`.
+        policy (CircuitBreakerPolicy): When the circuit opens and for how long.
+
+    Notes:
+        1. Only transport errors, timeouts, 429s and 5xx responses count as
+           failures, see `is_endpoint_failure`. Other errors, such as malformed
+           responses, and cancelled calls leave the window unchanged.
+        2. Outcomes of calls started before the last state change are ignored.
+        3. A circuit that opened only because calls were slow, not because they
+           failed, still lets calls through `acquire_degraded`.
+        4. State is protected by a threading.Lock.
+
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        policy: CircuitBreakerPolicy | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        key: str | None = None,
+    ) -> None:
+        """Initialize a closed circuit with an empty window.
+
+        Args:
+            endpoint (str): The LLM endpoint the circuit protects.
+            policy (CircuitBreakerPolicy | None): When the circuit opens and for
+                how long; the defaults when None.
+            clock (Callable[[], float]): Monotonic clock in seconds.
+            key (str | None): The registry key of the circuit; the endpoint when None.
+
+        """
+        self.endpoint = endpoint
+        self.key = key or endpoint
+        self.policy = policy or CircuitBreakerPolicy()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state: CircuitState = CLOSED
+        self._generation = 0
+        self._opened_at = 0.0
+        self._opened_for_slowness = False
+        # (finished_at, failed, slow) of each counted call, oldest first.
+        self._outcomes: deque[tuple[float, bool, bool]] = deque()
+        self._trials_started = 0
+        self._trial_successes = 0
+        self._times_opened = 0
+        self._rejected = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """CircuitState: The current state."""
+        with self._lock:
+            self._refresh(self._clock())
+            return self._state
+
+    def _transition(
+        self,
+        state: CircuitState,
+        now: float,
+        slow_only: bool = False,
+    ) -> None:
+        """Enter a state; the caller must hold the lock.
+
+        Args:
+            state (CircuitState): The new state.
+            now (float): Current clock time.
+            slow_only (bool): Whether an opening circuit opened only because calls
+                were slow.
+
+        """
+        self._state = state
+        self._generation += 1
+        self._trials_started = 0
+        self._trial_successes = 0
+        if state == OPEN:
+            self._opened_at = now
+            self._opened_for_slowness = slow_only
+            self._times_opened += 1
+            _msg = f"Circuit opened for LLM endpoint {self.endpoint}"
+            log.warning(_msg)
+        elif state == CLOSED:
+            self._outcomes.clear()
+            _msg = f"Circuit closed for LLM endpoint {self.endpoint}"
+            log.info(_msg)
+
+    def _refresh(self, now: float) -> None:
+        """Turn an open circuit half-open once it has been open long enough.
+
+        Args:
+            now (float): Current clock time.
+
+        """
+        if self._state == OPEN and now - self._opened_at >= self.policy.open_seconds:
+            self._transition(HALF_OPEN, now)
+
+    def acquire(self) -> CircuitPermit | None:
+        """Ask to make a call to the endpoint.
+
+        Returns:
+            CircuitPermit | None: The permit to pass to `record` when the call
+                ends, or None if the circuit refuses the call.
+
+        """
+        with self._lock:
+            now = self._clock()
+            self._refresh(now)
+            allowed = self._state == CLOSED or (
+                self._state == HALF_OPEN
+                and self._trials_started < HALF_OPEN_TRIAL_CALLS
+            )
+            if not allowed:
+                self._rejected += 1
+                return None
+            if self._state == HALF_OPEN:
+                self._trials_started += 1
+            return CircuitPermit(self, self._generation, now)
+
+    def acquire_degraded(self) -> CircuitPermit | None:
+        """Ask to make a call to an endpoint whose circuit opened only for slowness.
+
+        Returns:
+            CircuitPermit | None: A permit whose outcome is not recorded, or None
+                if the circuit is closed or opened because calls failed.
+
+        Notes:
+            1. Meant as a last resort when no endpoint's circuit lets a call through:
+               a slow endpoint still answers, so refusing the call only adds errors.
+
+        """
+        with self._lock:
+            now = self._clock()
+            self._refresh(now)
+            if self._state == CLOSED or not self._opened_for_slowness:
+                return None
+            return CircuitPermit(self, self._generation, now, counted=False)
+
+    def _classify(
+        self,
+        error: BaseException | None,
+        latency: float,
+    ) -> tuple[bool, bool] | None:
+        """Classify a call's outcome.
+
+        Args:
+            error (BaseException | None): The error the call failed with, if any.
+            latency (float): Seconds the call took.
+
+        Returns:
+            tuple[bool, bool] | None: Whether the call failed and whether it was
+                slow, or None if the outcome says nothing about the endpoint.
+
+        """
+        if error is None:
+            return False, latency >= self.policy.slow_call_seconds
+        if is_endpoint_failure(error):
+            return True, False
+        return None
+
+    def _record_trial(self, outcome: tuple[bool, bool] | None, now: float) -> None:
+        """Apply a half-open trial call's outcome; the caller must hold the lock.
+
+        Args:
+            outcome (tuple[bool, bool] | None): Whether the call failed and
+                whether it was slow, or None to free the trial for another call.
+            now (float): Current clock time.
+
+        """
+        if outcome is None:
+            self._trials_started -= 1
+        elif any(outcome):
+            failed, _slow = outcome
+            self._transition(OPEN, now, slow_only=not failed)
+        else:
+            self._trial_successes += 1
+            if self._trial_successes >= HALF_OPEN_TRIAL_CALLS:
+                self._transition(CLOSED, now)
+
+    def _prune(self, now: float) -> None:
+        """Drop outcomes older than the window; the caller must hold the lock.
+
+        Args:
+            now (float): Current clock time.
+
+        """
+        horizon = now - self.policy.window_seconds
+        while self._outcomes and self._outcomes[0][0] < horizon:
+            self._outcomes.popleft()
+
+    def _rates(self) -> tuple[float, float]:
+        """Return the window's failure and slow-call rates; the caller must hold the lock.
+
+        Returns:
+            tuple[float, float]: The failure rate and the slow-call rate.
+
+        """
+        if not self._outcomes:
+            return 0.0, 0.0
+        calls = len(self._outcomes)
+        failures = sum(failed for _, failed, _ in self._outcomes)
+        slow = sum(is_slow for _, _, is_slow in self._outcomes)
+        return failures / calls, slow / calls
+
+    def _record_closed(self, outcome: tuple[bool, bool], now: float) -> None:
+        """Add a call to the window and open the circuit if the rates call for it.
+
+        Args:
+            outcome (tuple[bool, bool]): Whether the call failed and whether it was slow.
+            now (float): Current clock time.
+
+        """
+        self._outcomes.append((now, *outcome))
+        self._prune(now)
+        if len(self._outcomes) < self.policy.min_calls:
+            return
+        failure_rate, slow_call_rate = self._rates()
+        failing = failure_rate >= self.policy.failure_rate_threshold
+        if failing or slow_call_rate >= self.policy.slow_call_rate_threshold:
+            self._transition(OPEN, now, slow_only=not failing)
+
+    def record(self, permit: CircuitPermit, error: BaseException | None = None) -> None:
+        """Report how a permitted call ended.
+
+        Args:
+            permit (CircuitPermit): The permit returned by `acquire`.
+            error (BaseException | None): The error the call failed with, if any.
+
+        """
+        with self._lock:
+            now = self._clock()
+            if not permit.counted or permit.generation != self._generation:
+                return
+            outcome = self._classify(error, now - permit.started_at)
+            if self._state == HALF_OPEN:
+                self._record_trial(outcome, now)
+            elif self._state == CLOSED and outcome is not None:
+                self._record_closed(outcome, now)
+
+    def stats(self) -> CircuitBreakerStats:
+        """Return a snapshot of the circuit's state.
+
+        Returns:
+            CircuitBreakerStats: State, window rates and counters.
+
+        """
+        with self._lock:
+            now = self._clock()
+            self._refresh(now)
+            self._prune(now)
+            failure_rate, slow_call_rate = self._rates()
+            until_half_open = None
+            if self._state == OPEN:
+                until_half_open = self._opened_at + self.policy.open_seconds - now
+            return CircuitBreakerStats(
+                endpoint=endpoint_label(self.key),
+                state=self._state,
+                calls=len(self._outcomes),
+                failure_rate=failure_rate,
+                slow_call_rate=slow_call_rate,
+                times_opened=self._times_opened,
+                rejected=self._rejected,
+                seconds_until_half_open=until_half_open,
+            )
+
+
+def failover_configs(llm_config: LLMConfig) -> list[LLMConfig]:
+    """Return an LLM configuration followed by one for each of its fallbacks.
+
+    Args:
+        llm_config (LLMConfig): The LLM configuration.
+
+    Returns:
+        list[LLMConfig]: The configuration itself, then its fallbacks in order.
+
+    Notes:
+        1. Fallbacks use the configuration's model unless they name their own.
+        2. Fallbacks only send their own API key, never the configuration's,
+           since the primary's key must not reach another host.
+
+    """
+    return [llm_config] + [
+        LLMConfig(
+            llm_endpoint=fallback.llm_endpoint,
+            api_key=fallback.api_key,
+            llm_model_name=fallback.llm_model_name or llm_config.llm_model_name,
+        )
+        for fallback in getattr(llm_config, "fallbacks", None) or []
+    ]
+
+
+class CircuitBreakerRegistry:
+    """Process-wide map of LLM endpoints, models and API keys to their circuit breakers.
+
+    Attributes:
+        enabled (bool): Whether calls are routed by circuit state.
+        policy (CircuitBreakerPolicy): The policy of new breakers.
+        max_endpoints (int): Maximum number of breakers held before eviction.
+
+    Notes:
+        1. Every session calling the same endpoint and model with the same API key
+           shares one breaker.
+        2. Breakers are evicted least-recently-used first when the cap is exceeded.
+        3. All operations are protected by a threading.Lock for thread safety.
+
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        policy: CircuitBreakerPolicy | None = None,
+        max_endpoints: int = DEFAULT_MAX_ENDPOINTS,
+    ) -> None:
+        """Initialize an empty registry.
+
+        Args:
+            enabled (bool): Whether calls are routed by circuit state.
+            policy (CircuitBreakerPolicy | None): The policy of new breakers; the
+                defaults when None.
+            max_endpoints (int): Maximum number of breakers held before eviction.
+
+        """
+        self.enabled = enabled
+        self.policy = policy or CircuitBreakerPolicy()
+        self.max_endpoints = max_endpoints
+        self._breakers: OrderedDict[str, CircuitBreaker] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def configure(
+        self,
+        enabled: bool,
+        policy: CircuitBreakerPolicy | None = None,
+    ) -> None:
+        """Set whether calls are routed by circuit state, and the breakers' policy.
+
+        Args:
+            enabled (bool): Whether calls are routed by circuit state.
+            policy (CircuitBreakerPolicy | None): The breakers' policy; the
+                defaults when None.
+
+        Notes:
+            1. Existing breakers are dropped so every endpoint uses the new policy.
+
+        """
+        with self._lock:
+            self.enabled = enabled
+            self.policy = policy or CircuitBreakerPolicy()
+            self._breakers.clear()
+        _msg = f"CircuitBreakerRegistry configured: enabled={enabled}, {self.policy}"
+        log.info(_msg)
+
+    def for_endpoint(self, llm_config: LLMConfig) -> CircuitBreaker:
+        """Return the breaker for the endpoint, model and API key of an LLM configuration.
+
+        Args:
+            llm_config (LLMConfig): The LLM configuration.
+
+        Returns:
+            CircuitBreaker: The shared breaker, created on first use.
+
+        """
+        key = circuit_breaker_key(llm_config)
+        with self._lock:
+            breaker = self._breakers.pop(key, None)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    endpoint=concurrency_limiter_key(llm_config),
+                    policy=self.policy,
+                    key=key,
+                )
+            self._breakers[key] = breaker
+            while len(self._breakers) > self.max_endpoints:
+                self._breakers.popitem(last=False)
+            return breaker
+
+    def _acquire_healthy(
+        self,
+        candidates: list[LLMConfig],
+    ) -> tuple[LLMConfig, CircuitPermit] | None:
+        """Return the first candidate whose circuit lets a call through.
+
+        Args:
+            candidates (list[LLMConfig]): The configuration, then its fallbacks.
+
+        Returns:
+            tuple[LLMConfig, CircuitPermit] | None: The candidate and its permit,
+                or None if every circuit refuses the call.
+
+        """
+        for candidate in candidates:
+            permit = self.for_endpoint(candidate).acquire()
+            if permit is not None:
+                if candidate is not candidates[0]:
+                    _msg = f"Routing LLM call to fallback {permit.breaker.endpoint}"
+                    log.info(_msg)
+                return candidate, permit
+        return None
+
+    def _acquire_slow(
+        self,
+        candidates: list[LLMConfig],
+    ) -> tuple[LLMConfig, CircuitPermit] | None:
+        """Return the first candidate whose circuit opened only for slowness.
+
+        Args:
+            candidates (list[LLMConfig]): The configuration, then its fallbacks.
+
+        Returns:
+            tuple[LLMConfig, CircuitPermit] | None: The candidate and an uncounted
+                permit, or None if every circuit opened because calls failed.
+
+        """
+        for candidate in candidates:
+            permit = self.for_endpoint(candidate).acquire_degraded()
+            if permit is not None:
+                _msg = f"No healthy LLM endpoint; calling slow {permit.breaker.endpoint}"
+                log.warning(_msg)
+                return candidate, permit
+        return None
+
+    def acquire(self, llm_config: LLMConfig) -> tuple[LLMConfig, CircuitPermit | None]:
+        """Choose the endpoint for a call: the first whose circuit lets it through.
+
+        Args:
+            llm_config (LLMConfig): The LLM configuration, with its fallbacks.
+
+        Returns:
+            tuple[LLMConfig, CircuitPermit | None]: The configuration to call and
+                the permit to pass to `record`; the configuration itself and no
+                permit when the registry is disabled.
+
+        Raises:
+            CircuitOpenError: If the circuits of every endpoint are open and none
+                opened only because calls were slow.
+
+        Notes:
+            1. When no circuit lets the call through, it goes to the first endpoint
+               whose circuit opened only for slowness: a slow answer beats an error.
+
+        """
+        if not self.enabled:
+            return llm_config, None
+        candidates = failover_configs(llm_config)
+        chosen = self._acquire_healthy(candidates) or self._acquire_slow(candidates)
+        if chosen is not None:
+            return chosen
+        _msg = (
+            f"The LLM endpoint {concurrency_limiter_key(llm_config)} is unavailable "
+            "and no fallback endpoint is healthy. Please try again shortly."
+        )
+        raise CircuitOpenError(_msg)
+
+    def route(self, llm_config: LLMConfig) -> LLMConfig:
+        """Choose the endpoint for a call whose outcome is not reported.
+
+        Args:
+            llm_config (LLMConfig): The LLM configuration, with its fallbacks.
+
+        Returns:
+            LLMConfig: The first configuration whose circuit is closed, or the
+                configuration itself if there is none or the registry is disabled.
+
+        """
+        if not self.enabled:
+            return llm_config
+        for candidate in failover_configs(llm_config):
+            if self.for_endpoint(candidate).state == CLOSED:
+                return candidate
+        return llm_config
+
+    def record(
+        self,
+        permit: CircuitPermit | None,
+        error: BaseException | None = None,
+    ) -> None:
+        """Report how a call made with `acquire` ended.
+
+        Args:
+            permit (CircuitPermit | None): The permit returned by `acquire`.
+            error (BaseException | None): The error the call failed with, if any.
+
+        """
+        if permit is not None:
+            permit.breaker.record(permit, error)
+
+    def stats(self) -> list[CircuitBreakerStats]:
+        """Return a snapshot of every breaker's state.
+
+        Returns:
+            list[CircuitBreakerStats]: One entry per breaker, least recently used first.
+
+        """
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return [breaker.stats() for breaker in breakers]
+
+    def reset(self) -> None:
+        """Disable routing, restore the default policy and drop all breakers."""
+        with self._lock:
+            self.enabled = False
+            self.policy = CircuitBreakerPolicy()
+            self._breakers.clear()
+
+
+async def call_with_failover(
+    llm_config: LLMConfig,
+    operation: Callable[[LLMConfig], Awaitable[T]],
+) -> T:
+    """Make a call to the first endpoint whose circuit lets it through.
+
+    Args:
+        llm_config (LLMConfig): The LLM configuration, with its fallbacks.
+        operation (Callable[[LLMConfig], Awaitable[T]]): Makes the call to the
+            configuration it is given.
+
+    Returns:
+        T: The call's result.
+
+    Raises:
+        CircuitOpenError: If the circuits of every endpoint are open.
+        Exception: The call's error, after it is reported to the breaker.
+
+    Network access:
+        - Makes a network request to the chosen LLM endpoint.
+
+    """
+    target, permit = llm_circuit_breakers.acquire(llm_config)
+    try:
+        result = await operation(target)
+    except BaseException as e:
+        llm_circuit_breakers.record(permit, e)
+        raise
+    llm_circuit_breakers.record(permit)
+    return result
+
+
+# Module-level singleton instance
+llm_circuit_breakers = CircuitBreakerRegistry()
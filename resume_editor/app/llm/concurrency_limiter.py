@@ -0,0 +1,449 @@
+"""Adaptive per-endpoint concurrency limits for LLM requests."""
+
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+import httpx
+from openai import APITimeoutError, InternalServerError, RateLimitError
+
+from resume_editor.app.llm.models import LLMConfig
+from resume_editor.app.llm.orchestration_registry import DEFAULT_OPENAI_BASE_URL
+
+log = logging.getLogger(__name__)
+
+DEFAULT_INITIAL_LIMIT = 5
+DEFAULT_MIN_LIMIT = 1
+DEFAULT_MAX_LIMIT = 32
+DEFAULT_BACKOFF_RATIO = 0.5
+DEFAULT_LATENCY_TOLERANCE = 2.0
+DEFAULT_MAX_ENDPOINTS = 64
+# Hex digits of the SHA-256 digest that label an endpoint in published stats.
+ENDPOINT_LABEL_LENGTH = 12
+
+# Weight of a new sample in the smoothed latency.
+LATENCY_SMOOTHING = 0.2
+# Share of the gap to a slower sample the baseline moves by, so a single
+# unusually fast response does not pin the baseline forever.
+BASELINE_DRIFT = 0.01
+
+
+@dataclass(frozen=True)
+class ConcurrencyLimitPolicy:
+    """How an AdaptiveConcurrencyLimiter adjusts its limit.
+
+    Attributes:
+        initial_limit (int): Limit before any request completes.
+        min_limit (int): Lowest limit the limiter cuts to.
+        max_limit (int): Highest limit the limiter raises to.
+        backoff_ratio (float): Factor the limit is multiplied by on overload.
+        latency_tolerance (float): Multiple of the baseline latency still treated as flat.
+
+    """
+
+    initial_limit: int = DEFAULT_INITIAL_LIMIT
+    min_limit: int = DEFAULT_MIN_LIMIT
+    max_limit: int = DEFAULT_MAX_LIMIT
+    backoff_ratio: float = DEFAULT_BACKOFF_RATIO
+    latency_tolerance: float = DEFAULT_LATENCY_TOLERANCE
+
+
+@dataclass(frozen=True)
+class ConcurrencyLimiterStats:
+    """Point-in-time state of an AdaptiveConcurrencyLimiter.
+
+    Attributes:
+        endpoint (str): Label of the LLM endpoint the limiter governs, from
+            `endpoint_label`.
+        limit (int): Number of requests currently allowed in flight.
+        in_flight (int): Number of requests currently in flight.
+        waiting (int): Number of requests waiting for a slot.
+        min_latency_seconds (float | None): Baseline latency, or None before the first success.
+        smoothed_latency_seconds (float | None): Smoothed recent latency, or None before the
+            first success.
+        increases (int): Number of times the limit was raised.
+        decreases (int): Number of times the limit was cut.
+
+    """
+
+    endpoint: str
+    limit: int
+    in_flight: int
+    waiting: int
+    min_latency_seconds: float | None
+    smoothed_latency_seconds: float | None
+    increases: int
+    decreases: int
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """Determine if an error signals that the endpoint is overloaded.
+
+    Args:
+        error (BaseException): The error raised by an LLM request.
+
+    Returns:
+        bool: True for timeouts, HTTP 429 and HTTP 5xx responses, False otherwise.
+
+    """
+    overload_types = (
+        TimeoutError,
+        httpx.TimeoutException,
+        APITimeoutError,
+        RateLimitError,
+        InternalServerError,
+    )
+    if isinstance(error, overload_types):
+        return True
+    status_code = getattr(error, "status_code", None)
+    return isinstance(status_code, int) and (status_code == 429 or status_code >= 500)
+
+
+def concurrency_limiter_key(llm_config: LLMConfig) -> str:
+    """Compute the registry key for the endpoint of an LLM configuration.
+
+    Args:
+        llm_config (LLMConfig): The LLM configuration.
+
+    Returns:
+        str: The endpoint URL without a trailing slash; OpenAI's when none is configured.
+
+    """
+    return (llm_config.llm_endpoint or DEFAULT_OPENAI_BASE_URL).rstrip("/")
+
+
+def endpoint_label(endpoint: str) -> str:
+    """Compute a stable label for an LLM endpoint that does not reveal its URL.
+
+    Args:
+        endpoint (str): The registry key of the endpoint.
+
+    Returns:
+        str: The first ENDPOINT_LABEL_LENGTH hex digits of the key's SHA-256 digest.
+
+    Notes:
+        1. Endpoints are user settings, so stats served without login carry
+           this label instead of the URL.
+
+    """
+    digest = hashlib.sha256(endpoint.encode("utf-8")).hexdigest()
+    return digest[:ENDPOINT_LABEL_LENGTH]
+
+
+@dataclass
+class ConcurrencySlot:
+    """A granted request slot of an AdaptiveConcurrencyLimiter.
+
+    Attributes:
+        started_at (float): Clock time the slot was granted.
+        error (BaseException | None): The error the request failed with, if any.
+
+    """
+
+    started_at: float
+    error: BaseException | None = None
+
+    def fail(self, error: BaseException) -> None:
+        """Record that the request failed.
+
+        Args:
+            error (BaseException): The error the request failed with.
+
+        """
+        self.error = error
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD limit on concurrent requests to one LLM endpoint.
+
+    A fixed concurrency either overloads a slow self-hosted endpoint or leaves
+    a large hosted one underused. This limiter raises its limit additively,
+    by about one per limit's worth of successful requests, while it is
+    saturated and latency stays near its baseline. It cuts the limit
+    multiplicatively when a request times out or is answered with 429 or 5xx.
+
+    Attributes:
+        endpoint (str): The LLM endpoint the limiter governs.
+        policy (ConcurrencyLimitPolicy): How the limit is raised and cut.
+
+    Notes:
+        1. Slots are granted in request order.
+        2. The limit is cut at most once per round of requests: failures of requests
+           started before the last cut are ignored.
+        3. Failures that do not signal overload leave the limit unchanged.
+        4. State is protected by a threading.Lock; waiters are resolved on the event
+           loop that releases a slot, so one limiter serves one event loop at a time.
+
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        policy: ConcurrencyLimitPolicy | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a limiter with no requests in flight.
+
+        Args:
+            endpoint (str): The LLM endpoint the limiter governs.
+            policy (ConcurrencyLimitPolicy | None): How the limit is raised and cut;
+                the default policy when None.
+            clock (Callable[[], float]): Monotonic clock in seconds.
+
+        """
+        self.endpoint = endpoint
+        self.policy = policy or ConcurrencyLimitPolicy()
+        self._clock = clock
+        self._limit = float(self.policy.initial_limit)
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._min_latency: float | None = None
+        self._smoothed_latency: float | None = None
+        self._last_decrease_at = float("-inf")
+        self._increases = 0
+        self._decreases = 0
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        """int: Number of requests currently allowed in flight."""
+        with self._lock:
+            return self._capacity()
+
+    def _capacity(self) -> int:
+        """Return the whole-request limit; the caller must hold the lock."""
+        return max(self.policy.min_limit, int(self._limit))
+
+    async def acquire(self) -> ConcurrencySlot:
+        """Wait for a request slot.
+
+        Returns:
+            ConcurrencySlot: The granted slot; pass it to `release` when the request ends.
+
+        """
+        with self._lock:
+            if not self._waiters and self._in_flight < self._capacity():
+                self._in_flight += 1
+                return ConcurrencySlot(started_at=self._clock())
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            self._abandon(waiter)
+            raise
+        return ConcurrencySlot(started_at=self._clock())
+
+    def _abandon(self, waiter: asyncio.Future) -> None:
+        """Hand a slot granted to a cancelled waiter to the next one.
+
+        Args:
+            waiter (asyncio.Future): The cancelled waiter.
+
+        """
+        with self._lock:
+            if waiter.done() and not waiter.cancelled():
+                self._in_flight -= 1
+                self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        """Grant free slots to waiters in order; the caller must hold the lock."""
+        while self._waiters and self._in_flight < self._capacity():
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._in_flight += 1
+            waiter.set_result(None)
+
+    def release(self, slot: ConcurrencySlot) -> None:
+        """Return a slot and adjust the limit from the request's outcome.
+
+        Args:
+            slot (ConcurrencySlot): The slot returned by `acquire`.
+
+        """
+        now = self._clock()
+        with self._lock:
+            self._in_flight -= 1
+            if slot.error is None:
+                self._on_success(now - slot.started_at)
+            elif is_overload_error(slot.error):
+                self._on_overload(slot.started_at, now)
+            self._wake_waiters()
+
+    def _observe_latency(self, latency: float) -> None:
+        """Fold a latency sample into the baseline and smoothed latency.
+
+        Args:
+            latency (float): Seconds the successful request took.
+
+        """
+        if self._min_latency is None or latency < self._min_latency:
+            self._min_latency = latency
+        else:
+            self._min_latency += (latency - self._min_latency) * BASELINE_DRIFT
+
+        if self._smoothed_latency is None:
+            self._smoothed_latency = latency
+        else:
+            self._smoothed_latency += (
+                latency - self._smoothed_latency
+            ) * LATENCY_SMOOTHING
+
+    def _on_success(self, latency: float) -> None:
+        """Raise the limit additively if it is saturated and latency is flat.
+
+        Args:
+            latency (float): Seconds the successful request took.
+
+        """
+        self._observe_latency(latency)
+        saturated = self._in_flight + 1 >= self._capacity() or bool(self._waiters)
+        latency_flat = (
+            self._smoothed_latency <= self._min_latency * self.policy.latency_tolerance
+        )
+        if not (saturated and latency_flat):
+            return
+
+        before = self._capacity()
+        self._limit = min(
+            float(self.policy.max_limit),
+            self._limit + 1.0 / self._limit,
+        )
+        if self._capacity() > before:
+            self._increases += 1
+            _msg = f"Raised concurrency limit for {self.endpoint} to {self._capacity()}"
+            log.debug(_msg)
+
+    def _on_overload(self, started_at: float, now: float) -> None:
+        """Cut the limit multiplicatively, at most once per round of requests.
+
+        Args:
+            started_at (float): Clock time the failed request started.
+            now (float): Current clock time.
+
+        """
+        if started_at < self._last_decrease_at:
+            return
+        self._limit = max(
+            float(self.policy.min_limit),
+            self._limit * self.policy.backoff_ratio,
+        )
+        self._last_decrease_at = now
+        self._decreases += 1
+        _msg = f"Cut concurrency limit for {self.endpoint} to {self._capacity()}"
+        log.warning(_msg)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[ConcurrencySlot]:
+        """Hold a request slot for the duration of a `with` block.
+
+        Yields:
+            ConcurrencySlot: The granted slot; call `fail` on it for errors the block handles.
+
+        Notes:
+            1. An exception escaping the block is recorded as the request's error.
+
+        """
+        granted = await self.acquire()
+        try:
+            yield granted
+        except BaseException as e:
+            granted.fail(e)
+            raise
+        finally:
+            self.release(granted)
+
+    def stats(self) -> ConcurrencyLimiterStats:
+        """Return a snapshot of the limiter's state.
+
+        Returns:
+            ConcurrencyLimiterStats: Limit, load, latency estimates and adjustment counts.
+
+        """
+        with self._lock:
+            return ConcurrencyLimiterStats(
+                endpoint=endpoint_label(self.endpoint),
+                limit=self._capacity(),
+                in_flight=self._in_flight,
+                waiting=sum(1 for w in self._waiters if not w.done()),
+                min_latency_seconds=self._min_latency,
+                smoothed_latency_seconds=self._smoothed_latency,
+                increases=self._increases,
+                decreases=self._decreases,
+            )
+
+
+class ConcurrencyLimiterRegistry:
+    """Process-wide map of LLM endpoints to their adaptive limiters.
+
+    Attributes:
+        max_endpoints (int): Maximum number of limiters held before eviction.
+
+    Notes:
+        1. Every refinement session calling the same endpoint shares one limiter.
+        2. Limiters are evicted least-recently-used first when the cap is exceeded;
+           sessions already holding an evicted limiter keep using it.
+        3. All operations are protected by a threading.Lock for thread safety.
+
+    """
+
+    def __init__(self, max_endpoints: int = DEFAULT_MAX_ENDPOINTS) -> None:
+        """Initialize an empty registry.
+
+        Args:
+            max_endpoints (int): Maximum number of limiters held before eviction.
+
+        """
+        self.max_endpoints = max_endpoints
+        self._limiters: OrderedDict[str, AdaptiveConcurrencyLimiter] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def for_endpoint(self, llm_config: LLMConfig) -> AdaptiveConcurrencyLimiter:
+        """Return the limiter for the endpoint of an LLM configuration.
+
+        Args:
+            llm_config (LLMConfig): The LLM configuration.
+
+        Returns:
+            AdaptiveConcurrencyLimiter: The shared limiter, created on first use.
+
+        """
+        key = concurrency_limiter_key(llm_config)
+        with self._lock:
+            limiter = self._limiters.get(key)
+            if limiter is None:
+                limiter = AdaptiveConcurrencyLimiter(endpoint=key)
+                self._limiters[key] = limiter
+                while len(self._limiters) > self.max_endpoints:
+                    self._limiters.popitem(last=False)
+            else:
+                self._limiters.move_to_end(key)
+            return limiter
+
+    def stats(self) -> list[ConcurrencyLimiterStats]:
+        """Return a snapshot of every limiter's state.
+
+        Returns:
+            list[ConcurrencyLimiterStats]: One entry per endpoint, least recently used first.
+
+        """
+        with self._lock:
+            limiters = list(self._limiters.values())
+        return [limiter.stats() for limiter in limiters]
+
+    def clear(self) -> None:
+        """Drop all limiters."""
+        with self._lock:
+            self._limiters.clear()
+
+
+# Module-level singleton instance
+llm_concurrency_limiters = ConcurrencyLimiterRegistry()
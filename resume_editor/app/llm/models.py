@@ -87,12 +87,42 @@ class RefinedRole(BaseModel):
     skills: RoleSkills | None = None
 
 
+class RefinedRoleBatch(BaseModel):
+    """Several roles refined by an LLM in one request, in the order they were given."""
+
+    roles: list[RefinedRole]
+
+
+class LLMEndpoint(BaseModel):
+    """A fallback LLM endpoint and the model to request from it.
+
+    Attributes:
+        llm_endpoint: The OpenAI-compatible endpoint.
+        llm_model_name: The model requested from it; the primary's when None.
+        api_key: The endpoint's own API key; none is sent when None.
+
+    """
+
+    llm_endpoint: str = Field(..., min_length=1)
+    llm_model_name: str | None = None
+    api_key: str | None = None
+
+
 class LLMConfig(BaseModel):
-    """Configuration for LLM client initialization."""
+    """Configuration for LLM client initialization.
+
+    Attributes:
+        llm_endpoint: The primary OpenAI-compatible endpoint; OpenAI's when None.
+        api_key: The API key of the primary endpoint; never sent to the fallbacks.
+        llm_model_name: The model requested from the primary endpoint.
+        fallbacks: Endpoints tried in order while the circuits before them are open.
+
+    """
 
     llm_endpoint: str | None = None
     api_key: str | None = None
     llm_model_name: str | None = None
+    fallbacks: list[LLMEndpoint] = Field(default_factory=list)
 
 
 class RoleRefinementJob(BaseModel):
@@ -102,6 +132,9 @@ class RoleRefinementJob(BaseModel):
     job_analysis: JobAnalysis
     llm_config: LLMConfig
     original_index: int
+    bypass_cache: bool = False
+    # The role refinement cache entry, looked up once when the job is built.
+    cached_data: dict | None = None
 
 
 class JobKeyRequirements(BaseModel):
@@ -3,20 +3,19 @@
 # Import models for backward compatibility during transition
 from resume_editor.app.llm.models import GeneratedBanner
 from resume_editor.app.llm.orchestration_analysis import analyze_job_description
-from resume_editor.app.llm.orchestration_banner import (
+from resume_editor.app.llm.banner_evidence import (
     _calculate_certification_relevance,
     _calculate_education_relevance,
     _calculate_project_relevance,
     _extract_cross_section_evidence,
     _extract_section_content,
     _format_role_data_for_banner,
-    _generate_introduction_from_analysis,
-    _invoke_chain_and_parse,
-    _invoke_banner_generation_chain,
-    _parse_json_with_fix,
     _split_projects_section,
-    generate_banner_from_running_log,
-    generate_introduction_from_resume,
+)
+from resume_editor.app.llm.orchestration_banner import (
+    _parse_json_with_fix,
+    async_generate_banner_from_running_log,
+    async_generate_introduction_from_resume,
 )
 from resume_editor.app.llm.orchestration_client import (
     DEFAULT_LLM_TEMPERATURE,
@@ -43,9 +42,6 @@ __all__ = [
     "_extract_cross_section_evidence",
     "_extract_section_content",
     "_format_role_data_for_banner",
-    "_generate_introduction_from_analysis",
-    "_invoke_banner_generation_chain",
-    "_invoke_chain_and_parse",
     "_is_retryable_error",
     "_log_failed_attempt",
     "_parse_json_with_fix",
@@ -53,10 +49,10 @@ __all__ = [
     "_truncate_for_log",
     "_unwrap_exception_group",
     "analyze_job_description",
+    "async_generate_banner_from_running_log",
+    "async_generate_introduction_from_resume",
     "async_refine_experience_section",
     "DEFAULT_LLM_TEMPERATURE",
-    "generate_banner_from_running_log",
-    "generate_introduction_from_resume",
     "GeneratedBanner",
     "initialize_llm_client",
     "refine_role",
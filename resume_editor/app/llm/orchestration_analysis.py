@@ -3,20 +3,59 @@
 import json
 import logging
 
-from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.output_parsers import PydanticOutputParser, StrOutputParser
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.utils.json import parse_json_markdown
 from langchain_openai import ChatOpenAI
 
+from resume_editor.app.llm.circuit_breaker import call_with_failover
 from resume_editor.app.llm.models import JobAnalysis
-from resume_editor.app.llm.orchestration_client import initialize_llm_client
+from resume_editor.app.llm.orchestration_registry import (
+    get_llm_client,
+    get_prepared_chain,
+    llm_client_key,
+)
 from resume_editor.app.llm.prompts import (
     JOB_ANALYSIS_HUMAN_PROMPT,
     JOB_ANALYSIS_SYSTEM_PROMPT,
 )
+from resume_editor.app.llm.rate_limiter import llm_rate_limiter, rate_limit_key
+from resume_editor.app.llm.retry_policy import (
+    RetryBudget,
+    call_with_retries,
+    get_retry_policy,
+)
+from resume_editor.app.llm.token_usage import token_usage_config
 
 log = logging.getLogger(__name__)
 
+JOB_ANALYSIS_CHAIN = "job_analysis"
+
+
+def _build_job_analysis_chain(llm: ChatOpenAI) -> object:
+    """Build the prompt, LLM and output parser chain for job analysis.
+
+    Args:
+        llm: The client the chain runs on.
+
+    Returns:
+        The LangChain runnable chain.
+
+    Notes:
+        1. Renders the JobAnalysis format instructions into the prompt once.
+
+    """
+    parser = PydanticOutputParser(pydantic_object=JobAnalysis)
+
+    prompt = ChatPromptTemplate.from_messages(
+        [
+            ("system", JOB_ANALYSIS_SYSTEM_PROMPT),
+            ("human", JOB_ANALYSIS_HUMAN_PROMPT),
+        ],
+    ).partial(format_instructions=parser.get_format_instructions())
+
+    return prompt | llm | StrOutputParser()
+
 
 def _parse_job_analysis_response(response_str: str) -> JobAnalysis:
     """Parse and validate job analysis LLM response.
@@ -57,6 +96,7 @@ async def analyze_job_description(
     job_description: str,
     llm_config: object,
     resume_content_for_context: str,
+    retry_budget: RetryBudget | None = None,
 ) -> tuple[JobAnalysis, str | None]:
     """Uses an LLM to analyze a job description.
 
@@ -64,6 +104,7 @@ async def analyze_job_description(
         job_description: The job description to analyze.
         llm_config: LLM configuration including endpoint, API key, and model name.
         resume_content_for_context: The full resume content for context.
+        retry_budget: Optional retry budget shared by the whole refinement.
 
     Returns:
         Tuple of (JobAnalysis, introduction or None).
@@ -73,11 +114,13 @@ async def analyze_job_description(
 
     Notes:
         1. Validates job description is not empty.
-        2. Sets up PydanticOutputParser for structured output.
-        3. Creates ChatPromptTemplate with system and human prompts.
-        4. Initializes LLM client and creates invocation chain.
-        5. Invokes chain asynchronously with job description.
-        6. Parses and validates the response.
+        2. Each attempt goes to the first of the endpoint and its fallbacks whose
+           circuit is not open, using that endpoint's pooled LLM client and
+           prepared job analysis chain.
+        3. Invokes chain asynchronously with job description once the shared rate
+           limits allow it, retrying transient failures according to the
+           configured retry policy.
+        4. Parses and validates the response.
 
     Network access:
         - Makes a network request to the LLM endpoint.
@@ -89,30 +132,32 @@ async def analyze_job_description(
     if not job_description.strip():
         raise ValueError("Job description cannot be empty.")
 
-    parser = PydanticOutputParser(pydantic_object=JobAnalysis)
-
     resume_content_block = (
         f"Resume Content:\n---\n{resume_content_for_context}\n---\n\n"
     )
 
-    prompt = ChatPromptTemplate.from_messages(
-        [
-            ("system", JOB_ANALYSIS_SYSTEM_PROMPT),
-            ("human", JOB_ANALYSIS_HUMAN_PROMPT),
-        ],
-    ).partial(format_instructions=parser.get_format_instructions())
-
-    llm = initialize_llm_client(llm_config)
-
-    from langchain_core.output_parsers import StrOutputParser
-
-    chain = prompt | llm | StrOutputParser()
-
-    response_str = await chain.ainvoke(
-        {
-            "job_description": job_description,
-            "resume_content_block": resume_content_block,
-        },
+    chain_input = {
+        "job_description": job_description,
+        "resume_content_block": resume_content_block,
+    }
+    usage_config = token_usage_config(JOB_ANALYSIS_CHAIN)
+
+    async def invoke(target: object) -> str:
+        chain = get_prepared_chain(
+            get_llm_client(target),
+            JOB_ANALYSIS_CHAIN,
+            _build_job_analysis_chain,
+        )
+        throttle_key = rate_limit_key(llm_client_key(target))
+        return await llm_rate_limiter.ainvoke(
+            chain, chain_input, throttle_key, config=usage_config
+        )
+
+    response_str = await call_with_retries(
+        lambda: call_with_failover(llm_config, invoke),
+        policy=get_retry_policy(),
+        budget=retry_budget,
+        description="Job analysis",
     )
 
     analysis = _parse_job_analysis_response(response_str)
@@ -3,6 +3,7 @@
 import logging
 from typing import Any
 
+import httpx
 from langchain_openai import ChatOpenAI
 
 from resume_editor.app.llm.models import LLMConfig
@@ -12,11 +13,39 @@ log = logging.getLogger(__name__)
 DEFAULT_LLM_TEMPERATURE = 0.2
 
 
-def initialize_llm_client(llm_config: LLMConfig) -> ChatOpenAI:
+def _http_client_params(
+    http_client: httpx.Client | None,
+    http_async_client: httpx.AsyncClient | None,
+) -> dict[str, Any]:
+    """Build the ChatOpenAI parameters for the shared HTTP pools.
+
+    Args:
+        http_client: Optional shared sync HTTP pool.
+        http_async_client: Optional shared async HTTP pool.
+
+    Returns:
+        The `http_client` and `http_async_client` parameters for the pools provided.
+
+    """
+    params: dict[str, Any] = {}
+    if http_client is not None:
+        params["http_client"] = http_client
+    if http_async_client is not None:
+        params["http_async_client"] = http_async_client
+    return params
+
+
+def initialize_llm_client(
+    llm_config: LLMConfig,
+    http_client: httpx.Client | None = None,
+    http_async_client: httpx.AsyncClient | None = None,
+) -> ChatOpenAI:
     """Initializes the ChatOpenAI client from configuration.
 
     Args:
         llm_config: Configuration for the LLM client.
+        http_client: Optional shared sync HTTP pool for the client to use.
+        http_async_client: Optional shared async HTTP pool for the client to use.
 
     Returns:
         An initialized ChatOpenAI client instance.
@@ -25,6 +54,7 @@ def initialize_llm_client(llm_config: LLMConfig) -> ChatOpenAI:
         1. Determines the model name, using provided llm_model_name or default.
         2. Sets up LLM parameters for temperature, endpoint, and headers.
         3. Sets the API key if provided, or uses a dummy key for custom endpoints.
+        4. Passes the shared HTTP pools through if provided, using `_http_client_params`.
 
     """
     _msg = "initialize_llm_client starting"
@@ -46,6 +76,7 @@ def initialize_llm_client(llm_config: LLMConfig) -> ChatOpenAI:
         llm_params["api_key"] = llm_config.api_key
     elif llm_config.llm_endpoint and "openrouter.ai" not in llm_config.llm_endpoint:
         llm_params["api_key"] = "not-needed"
+    llm_params.update(_http_client_params(http_client, http_async_client))
 
     _msg = "initialize_llm_client returning"
     log.debug(_msg)
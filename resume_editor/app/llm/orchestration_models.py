@@ -2,9 +2,14 @@
 
 import asyncio
 from collections.abc import Awaitable, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from resume_editor.app.llm.models import JobAnalysis
+from resume_editor.app.llm.retry_policy import (
+    DEFAULT_MAX_ATTEMPTS,
+    RetryBudget,
+    RetryPolicy,
+)
 from resume_editor.app.models.resume.experience import Role
 
 
@@ -18,6 +23,8 @@ class HandleRetryDelayParams:
         response_str: The LLM response string.
         error: The error that occurred.
         job_analysis: The job analysis context.
+        delay_seconds: Seconds to wait before the next attempt.
+        max_attempts: Total number of attempts allowed for the role.
         semaphore: Optional semaphore to release during delay.
         progress_callback: Optional callback for progress updates.
 
@@ -28,6 +35,8 @@ class HandleRetryDelayParams:
     response_str: str
     error: Exception
     job_analysis: JobAnalysis
+    delay_seconds: float
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS
     semaphore: asyncio.Semaphore | None = None
     progress_callback: Callable[[str], Awaitable[None]] | None = None
 
@@ -44,6 +53,8 @@ class ProcessRefinementErrorParams:
         job_analysis: The job analysis context.
         semaphore: Optional semaphore for retry delays.
         progress_callback: Optional callback for progress updates.
+        retry_policy: The policy deciding whether and when to retry.
+        retry_budget: Optional retry budget shared by the whole refinement.
 
     """
 
@@ -54,3 +65,46 @@ class ProcessRefinementErrorParams:
     job_analysis: JobAnalysis
     semaphore: asyncio.Semaphore | None = None
     progress_callback: Callable[[str], Awaitable[None]] | None = None
+    retry_policy: RetryPolicy = field(default_factory=RetryPolicy)
+    retry_budget: RetryBudget | None = None
+
+
+@dataclass
+class RefineRoleOptions:
+    """Optional settings for refine_role.
+
+    Attributes:
+        semaphore: Optional semaphore released during retry delays.
+        progress_callback: Optional callback for progress updates.
+        retry_policy: Optional retry policy; the configured policy when None.
+        retry_budget: Optional retry budget shared by the whole refinement.
+        partial_callback: Optional callback for the refined summary as it is
+            written. If given, responses are streamed.
+
+    """
+
+    semaphore: asyncio.Semaphore | None = None
+    progress_callback: Callable[[str], Awaitable[None]] | None = None
+    retry_policy: RetryPolicy | None = None
+    retry_budget: RetryBudget | None = None
+    partial_callback: Callable[[str], Awaitable[None]] | None = None
+
+
+@dataclass
+class RoleRefinementRequest:
+    """Payloads and routing of one role refinement request.
+
+    Attributes:
+        job_analysis_json: JSON string of the job analysis.
+        role_json: JSON string of the role to refine.
+        throttle_key: Optional key of the shared rate limits to wait for. If given,
+            the request may also be hedged.
+        partial_callback: Optional callback for the summary as it is written. If
+            given, the response is streamed.
+
+    """
+
+    job_analysis_json: str
+    role_json: str
+    throttle_key: str | None = None
+    partial_callback: Callable[[str], Awaitable[None]] | None = None
@@ -1,42 +1,60 @@
 """Role refinement functions for LLM orchestration."""
 
 import asyncio
-import json
 import logging
-from collections.abc import AsyncGenerator, Awaitable, Callable
+from collections.abc import AsyncGenerator
 from dataclasses import dataclass
 
-from cryptography.fernet import InvalidToken
-from langchain_core.output_parsers import PydanticOutputParser
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.utils.json import parse_json_markdown
-from langchain_openai import ChatOpenAI
-from openai import AuthenticationError
-from pydantic import ValidationError
-
-from resume_editor.app.api.routes.route_logic.resume_serialization import (
+from resume_editor.app.api.routes.route_logic.job_analysis_cache import (
+    JobAnalysisCache,
+    JobAnalysisCacheKey,
+)
+from resume_editor.app.api.routes.route_logic.resume_section_extraction import (
     extract_experience_info,
 )
+from resume_editor.app.llm.circuit_breaker import llm_circuit_breakers
 from resume_editor.app.llm.models import (
     JobAnalysis,
     LLMConfig,
     RefinedRole,
     RoleRefinementJob,
 )
-from resume_editor.app.llm.orchestration_client import initialize_llm_client
+from resume_editor.app.llm.orchestration_registry import warm_llm_client
 from resume_editor.app.llm.orchestration_models import (
     HandleRetryDelayParams,
     ProcessRefinementErrorParams,
+    RefineRoleOptions,
+)
+from resume_editor.app.llm.prompt_encoding import (
+    ROLE_REFINE_JOB_ANALYSIS_FIELDS,
+    ROLE_REFINE_ROLE_EXCLUDE,
+    encode_model,
 )
-from resume_editor.app.llm.prompts import (
-    ROLE_REFINE_HUMAN_PROMPT,
-    ROLE_REFINE_SYSTEM_PROMPT,
+from resume_editor.app.llm.retry_policy import (
+    RetryBudget,
+    get_retry_policy,
+    is_retryable_llm_error,
+)
+from resume_editor.app.llm.role_batching import (
+    estimate_role_tokens,
+    get_role_batch_policy,
+    plan_role_batches,
+    refine_role_batch,
+)
+from resume_editor.app.llm.role_requests import _attempt_refine_role_with_failover
+from resume_editor.app.llm.role_streaming import is_role_streaming_enabled
+from resume_editor.app.llm.role_refinement_cache import (
+    role_refinement_cache,
+    role_refinement_cache_key,
 )
 from resume_editor.app.api.routes.route_models import ExperienceResponse
 from resume_editor.app.models.resume.experience import Role
 
 log = logging.getLogger(__name__)
 
+# Strong references to background warm-up tasks so they are not garbage collected
+_warmup_tasks: set[asyncio.Task] = set()
+
 
 @dataclass
 class RefinementState:
@@ -45,11 +63,24 @@ class RefinementState:
     Attributes:
         job_analysis: Optional cached job analysis.
         skip_indices: Optional set of role indices to skip.
+        analysis_cache: Optional persistent cache of job analyses.
+        analysis_cache_key: Key of this refinement's job analysis in `analysis_cache`.
+        bypass_role_cache: If True, every role is refined fresh instead of served from
+            the role refinement cache.
+        experience_info: Optional experience section already loaded for the resume
+            content, for example from its stored structured data.
+        retry_budget: Optional retry budget of the whole session, shared with
+            calls made after the refinement; a fresh one is used when None.
 
     """
 
     job_analysis: JobAnalysis | None = None
     skip_indices: set[int] | None = None
+    analysis_cache: JobAnalysisCache | None = None
+    analysis_cache_key: JobAnalysisCacheKey | None = None
+    bypass_role_cache: bool = False
+    experience_info: ExperienceResponse | None = None
+    retry_budget: RetryBudget | None = None
 
 
 @dataclass
@@ -60,16 +91,19 @@ class RefinementOrchestratorParams:
         resume_content: The full Markdown content of the resume.
         job_description: The job description to align with.
         llm_config: LLM configuration.
-        max_concurrency: Maximum roles to refine in parallel.
+        max_concurrency: Optional cap on roles refined in parallel by this session.
+            Without it, only the endpoint's shared adaptive limiter applies.
         state: Optional refinement state containing job_analysis and skip_indices.
+        retry_budget: Optional retry budget shared by every LLM call of the refinement.
 
     """
 
     resume_content: str
     job_description: str
     llm_config: LLMConfig
-    max_concurrency: int = 5
+    max_concurrency: int | None = None
     state: RefinementState | None = None
+    retry_budget: RetryBudget | None = None
 
 
 def _is_retryable_error(e: Exception) -> bool:
@@ -82,18 +116,14 @@ def _is_retryable_error(e: Exception) -> bool:
         True if the error is retryable, False otherwise.
 
     Notes:
-        1. Retryable: json.JSONDecodeError, TimeoutError, ConnectionError.
-        2. Non-retryable: AuthenticationError, ValidationError, InvalidToken.
+        1. Retryable: json.JSONDecodeError, TimeoutError, ConnectionError, OpenAI
+           connection and timeout errors, rate limits and 408/409/429/5xx responses.
+        2. Non-retryable: AuthenticationError, ValidationError, InvalidToken and
+           other client errors.
+        3. Delegates to `is_retryable_llm_error`.
 
     """
-    retryable_types = (json.JSONDecodeError, TimeoutError, ConnectionError)
-    non_retryable_types = (AuthenticationError, ValidationError, InvalidToken)
-
-    if isinstance(e, retryable_types):
-        return True
-    if isinstance(e, non_retryable_types):
-        return False
-    return False
+    return is_retryable_llm_error(e)
 
 
 def _truncate_for_log(text: str, max_len: int = 500) -> str:
@@ -160,44 +190,6 @@ def _create_error_context(role: Role, max_attempts: int) -> str:
     return _msg
 
 
-async def _attempt_refine_role(
-    chain: object,
-    job_analysis_json: str,
-    role_json: str,
-) -> tuple[bool, RefinedRole | None, Exception | None]:
-    """Attempt a single LLM refinement invocation.
-
-    Args:
-        chain: The LangChain runnable chain to invoke.
-        job_analysis_json: JSON string of the job analysis.
-        role_json: JSON string of the role to refine.
-
-    Returns:
-        Tuple of (success, result, error).
-
-    Raises:
-        AuthenticationError: Re-raises immediately if authentication fails.
-
-    Network access:
-        - Makes a network request to the LLM endpoint.
-
-    """
-    try:
-        response_str = await chain.ainvoke(
-            {
-                "job_analysis_json": job_analysis_json,
-                "role_json": role_json,
-            },
-        )
-        parsed_json = parse_json_markdown(response_str)
-        refined_role = RefinedRole.model_validate(parsed_json)
-        return True, refined_role, None
-    except AuthenticationError:
-        raise
-    except Exception as e:
-        return False, None, e
-
-
 async def _handle_retry_delay(params: HandleRetryDelayParams) -> None:
     """Handle the delay and logging between retry attempts.
 
@@ -208,7 +200,7 @@ async def _handle_retry_delay(params: HandleRetryDelayParams) -> None:
         1. Logs the failed attempt.
         2. Calls progress_callback with retry message if provided.
         3. Releases semaphore if provided.
-        4. Sleeps for 3 seconds.
+        4. Sleeps for the delay chosen by the retry policy.
         5. Re-acquires semaphore if provided.
 
     """
@@ -223,14 +215,14 @@ async def _handle_retry_delay(params: HandleRetryDelayParams) -> None:
     if params.progress_callback is not None:
         _retry_msg = (
             f"Retrying role refinement for '{params.role.basics.title} @ {params.role.basics.company}' "
-            f"(attempt {params.attempt + 2}/3)..."
+            f"(attempt {params.attempt + 2}/{params.max_attempts})..."
         )
         await params.progress_callback(_retry_msg)
 
     if params.semaphore is not None:
         params.semaphore.release()
 
-    await asyncio.sleep(3)
+    await asyncio.sleep(params.delay_seconds)
 
     if params.semaphore is not None:
         await params.semaphore.acquire()
@@ -243,7 +235,8 @@ async def _process_refinement_error(params: ProcessRefinementErrorParams) -> boo
         params: Parameters including error, attempt, role, etc.
 
     Returns:
-        True if should retry, False if max attempts reached.
+        True if should retry, False if max attempts reached, the server asked for
+        too long a wait or the retry budget is exhausted.
 
     Raises:
         Exception: Re-raises if error is not retryable.
@@ -252,27 +245,32 @@ async def _process_refinement_error(params: ProcessRefinementErrorParams) -> boo
     if not _is_retryable_error(params.error):
         raise params.error
 
-    if params.attempt < 2:  # Not the last attempt
-        delay_params = HandleRetryDelayParams(
-            attempt=params.attempt,
-            role=params.role,
-            response_str=params.response_str,
-            error=params.error,
-            job_analysis=params.job_analysis,
-            semaphore=params.semaphore,
-            progress_callback=params.progress_callback,
-        )
-        await _handle_retry_delay(delay_params)
-        return True
-    return False
+    delay = params.retry_policy.next_delay(
+        params.error, params.attempt, params.retry_budget
+    )
+    if delay is None:
+        return False
+
+    delay_params = HandleRetryDelayParams(
+        attempt=params.attempt,
+        role=params.role,
+        response_str=params.response_str,
+        error=params.error,
+        job_analysis=params.job_analysis,
+        delay_seconds=delay,
+        max_attempts=params.retry_policy.max_attempts,
+        semaphore=params.semaphore,
+        progress_callback=params.progress_callback,
+    )
+    await _handle_retry_delay(delay_params)
+    return True
 
 
 async def refine_role(
     role: Role,
     job_analysis: JobAnalysis,
     llm_config: LLMConfig,
-    semaphore: asyncio.Semaphore | None = None,
-    progress_callback: Callable[[str], Awaitable[None]] | None = None,
+    options: RefineRoleOptions | None = None,
 ) -> RefinedRole:
     """Uses an LLM to refine a single resume Role.
 
@@ -280,21 +278,30 @@ async def refine_role(
         role: The structured Role object to refine.
         job_analysis: The structured job analysis to align with.
         llm_config: LLM configuration.
-        semaphore: Optional semaphore for retry delays.
-        progress_callback: Optional callback for progress updates.
+        options: Optional semaphore, callbacks, retry policy and retry budget;
+            the defaults when None.
 
     Returns:
         The refined and validated Role object.
 
     Raises:
         ValueError: If all retries fail.
+        CircuitOpenError: If the circuits of the endpoint and its fallbacks are open.
         AuthenticationError: If authentication fails.
 
     Notes:
-        1. Sets up PydanticOutputParser for RefinedRole.
-        2. Serializes role and job_analysis to JSON.
-        3. Creates prompt and initializes LLM client.
-        4. Attempts up to 3 times with retry logic.
+        1. Each attempt goes to the first of the endpoint and its fallbacks whose
+           circuit is not open, using that endpoint's pooled LLM client and
+           prepared role refinement chain.
+        2. Serializes role and job_analysis to JSON in the configured prompt
+           encoding, keeping only the fields the prompt uses when compact.
+        3. Attempts up to the policy's max_attempts, waiting a jittered backoff
+           or the server's Retry-After between attempts. Each attempt waits for
+           the shared rate limits and runs within the endpoint's adaptive
+           concurrency limit.
+        4. With options.partial_callback, each attempt streams the response and passes
+           the summary to the callback as it grows. Only the complete response
+           is validated and returned.
         5. Preserves original inclusion_status.
 
     Network access:
@@ -304,32 +311,24 @@ async def refine_role(
     _msg = "refine_role starting"
     log.debug(_msg)
 
-    parser = PydanticOutputParser(pydantic_object=RefinedRole)
-
-    prompt = ChatPromptTemplate.from_messages(
-        [
-            ("system", ROLE_REFINE_SYSTEM_PROMPT),
-            ("human", ROLE_REFINE_HUMAN_PROMPT),
-        ],
-    ).partial(format_instructions=parser.get_format_instructions())
-
-    llm = initialize_llm_client(llm_config)
-
-    from langchain_core.output_parsers import StrOutputParser
-
-    chain = prompt | llm | StrOutputParser()
+    options = options or RefineRoleOptions()
+    policy = options.retry_policy or get_retry_policy()
 
-    role_json = role.model_dump_json(indent=2)
-    job_analysis_json = job_analysis.model_dump_json(indent=2)
+    role_json = encode_model(role, exclude=ROLE_REFINE_ROLE_EXCLUDE)
+    job_analysis_json = encode_model(
+        job_analysis,
+        include=ROLE_REFINE_JOB_ANALYSIS_FIELDS,
+    )
 
     last_error: Exception | None = None
     refined_role: RefinedRole | None = None
 
-    for attempt in range(3):
-        success, result, error = await _attempt_refine_role(
-            chain=chain,
+    for attempt in range(policy.max_attempts):
+        success, result, error = await _attempt_refine_role_with_failover(
+            llm_config=llm_config,
             job_analysis_json=job_analysis_json,
             role_json=role_json,
+            partial_callback=options.partial_callback,
         )
 
         if success:
@@ -343,8 +342,10 @@ async def refine_role(
             role=role,
             response_str="",  # Populated by _log_failed_attempt if needed
             job_analysis=job_analysis,
-            semaphore=semaphore,
-            progress_callback=progress_callback,
+            semaphore=options.semaphore,
+            progress_callback=options.progress_callback,
+            retry_policy=policy,
+            retry_budget=options.retry_budget,
         )
         should_retry = await _process_refinement_error(error_params)
 
@@ -352,7 +353,7 @@ async def refine_role(
             break
 
     if refined_role is None:
-        _error_msg = _create_error_context(role, 3)
+        _error_msg = _create_error_context(role, attempt + 1)
         raise ValueError(_error_msg) from last_error
 
     refined_role.basics.inclusion_status = role.basics.inclusion_status
@@ -381,10 +382,58 @@ def _unwrap_exception_group(e: Exception) -> None:
     raise e
 
 
+def _cached_refinement(job: RoleRefinementJob) -> dict | None:
+    """Look up a job's role in the role refinement cache.
+
+    Args:
+        job: The refinement job.
+
+    Returns:
+        The cached refined role data, or None on a miss or if the job bypasses
+        the cache.
+
+    """
+    if job.bypass_cache:
+        return None
+    cache_key = role_refinement_cache_key(
+        job.role, job.job_analysis, job.llm_config.llm_model_name
+    )
+    return role_refinement_cache.get(cache_key)
+
+
+async def _put_refined_role(
+    job: RoleRefinementJob,
+    refined_role: RefinedRole,
+    event_queue: asyncio.Queue,
+) -> None:
+    """Cache a freshly refined role and put its event onto the queue.
+
+    Args:
+        job: The refinement job the role was refined for.
+        refined_role: The refined role.
+        event_queue: The queue to send the event to.
+
+    """
+    cache_key = role_refinement_cache_key(
+        job.role, job.job_analysis, job.llm_config.llm_model_name
+    )
+    refined_data = refined_role.model_dump(mode="json")
+    role_refinement_cache.put(cache_key, refined_data)
+    await event_queue.put(
+        {
+            "status": "role_refined",
+            "data": refined_data,
+            "original_index": job.original_index,
+            "cached": False,
+        },
+    )
+
+
 async def _refine_role_and_put_on_queue(
     job: RoleRefinementJob,
     semaphore: asyncio.Semaphore,
     event_queue: asyncio.Queue,
+    retry_budget: RetryBudget | None = None,
 ) -> None:
     """Refines a single role and puts events onto a queue.
 
@@ -392,12 +441,32 @@ async def _refine_role_and_put_on_queue(
         job: The refinement job containing role, job analysis, etc.
         semaphore: The semaphore to control concurrency.
         event_queue: The queue to send events to.
+        retry_budget: Optional retry budget shared by the whole refinement.
+
+    Notes:
+        1. A job carrying a cached result emits it immediately, without waiting
+           on the semaphore.
+        2. The role_refined event carries a "cached" flag.
+        3. Fresh results are stored in the role refinement cache.
+        4. When role streaming is enabled, role_progress events carry the
+           refined summary as it is written.
 
     """
-    log.debug(
-        "Waiting on semaphore for role refinement for index %d",
-        job.original_index,
-    )
+    if job.cached_data is not None:
+        _msg = f"Using cached refinement for role index {job.original_index}"
+        log.debug(_msg)
+        await event_queue.put(
+            {
+                "status": "role_refined",
+                "data": job.cached_data,
+                "original_index": job.original_index,
+                "cached": True,
+            },
+        )
+        return
+
+    _msg = f"Waiting on semaphore for role refinement for index {job.original_index}"
+    log.debug(_msg)
     async with semaphore:
         role_title = f"{job.role.basics.title} @ {job.role.basics.company}"
         await event_queue.put(
@@ -407,28 +476,156 @@ async def _refine_role_and_put_on_queue(
             },
         )
 
-        log.debug(
-            "Semaphore acquired, refining role for index %d",
-            job.original_index,
-        )
+        _msg = f"Semaphore acquired, refining role for index {job.original_index}"
+        log.debug(_msg)
 
         async def _progress_callback(message: str) -> None:
             await event_queue.put({"status": "in_progress", "message": message})
 
+        async def _partial_callback(summary: str) -> None:
+            await event_queue.put(
+                {
+                    "status": "role_progress",
+                    "original_index": job.original_index,
+                    "role_title": role_title,
+                    "summary": summary,
+                },
+            )
+
         refined_role = await refine_role(
             role=job.role,
             job_analysis=job.job_analysis,
             llm_config=job.llm_config,
+            options=RefineRoleOptions(
+                semaphore=semaphore,
+                progress_callback=_progress_callback,
+                retry_budget=retry_budget,
+                partial_callback=(
+                    _partial_callback if is_role_streaming_enabled() else None
+                ),
+            ),
+        )
+        await _put_refined_role(job, refined_role, event_queue)
+
+
+async def _put_batch_results(
+    jobs: list[RoleRefinementJob],
+    refined_roles: list[RefinedRole | None],
+    event_queue: asyncio.Queue,
+) -> list[RoleRefinementJob]:
+    """Put the events of a batch's refined roles onto the queue.
+
+    Args:
+        jobs: The jobs of the batch.
+        refined_roles: The batch's result for each job.
+        event_queue: The queue to send events to.
+
+    Returns:
+        The jobs whose role the batch did not refine.
+
+    """
+    failed_jobs = []
+    for job, refined_role in zip(jobs, refined_roles, strict=True):
+        if refined_role is None:
+            failed_jobs.append(job)
+        else:
+            await _put_refined_role(job, refined_role, event_queue)
+    return failed_jobs
+
+
+async def _refine_batch_and_put_on_queue(
+    jobs: list[RoleRefinementJob],
+    semaphore: asyncio.Semaphore,
+    event_queue: asyncio.Queue,
+    retry_budget: RetryBudget | None = None,
+) -> None:
+    """Refines a batch of roles in one request and puts events onto a queue.
+
+    Args:
+        jobs: The refinement jobs of the batch, sharing a job analysis and config.
+        semaphore: The semaphore to control concurrency.
+        event_queue: The queue to send events to.
+        retry_budget: Optional retry budget shared by the whole refinement.
+
+    Notes:
+        1. A batch of one job is refined as a single role.
+        2. The batch request holds one semaphore slot.
+        3. Roles the batch did not refine validly fall back to single-role
+           refinement, concurrently and after the batch's slot is released.
+
+    """
+    if len(jobs) == 1:
+        await _refine_role_and_put_on_queue(
+            job=jobs[0],
             semaphore=semaphore,
-            progress_callback=_progress_callback,
+            event_queue=event_queue,
+            retry_budget=retry_budget,
+        )
+        return
+
+    async with semaphore:
+        role_titles = ", ".join(
+            f"'{job.role.basics.title} @ {job.role.basics.company}'" for job in jobs
         )
         await event_queue.put(
             {
-                "status": "role_refined",
-                "data": refined_role.model_dump(mode="json"),
-                "original_index": job.original_index,
+                "status": "in_progress",
+                "message": f"Refining {len(jobs)} roles together: {role_titles}...",
             },
         )
+        refined_roles = await refine_role_batch(
+            roles=[job.role for job in jobs],
+            job_analysis=jobs[0].job_analysis,
+            llm_config=jobs[0].llm_config,
+        )
+
+    failed_jobs = await _put_batch_results(jobs, refined_roles, event_queue)
+    if failed_jobs:
+        _msg = f"Refining {len(failed_jobs)} roles of a batch one by one"
+        log.debug(_msg)
+        await asyncio.gather(
+            *(
+                _refine_role_and_put_on_queue(
+                    job=job,
+                    semaphore=semaphore,
+                    event_queue=event_queue,
+                    retry_budget=retry_budget,
+                )
+                for job in failed_jobs
+            ),
+        )
+
+
+def _plan_refinement_batches(
+    jobs: list[RoleRefinementJob],
+) -> list[list[RoleRefinementJob]]:
+    """Group refinement jobs into the requests that will refine them.
+
+    Args:
+        jobs: The refinement jobs, in resume order.
+
+    Returns:
+        The batches of jobs; cached roles are batches of their own.
+
+    Notes:
+        1. Roles not in the role refinement cache are packed by the size of their
+           encoded JSON, up to the configured role batch token budget.
+
+    """
+    policy = get_role_batch_policy()
+    if not policy.enabled:
+        return [[job] for job in jobs]
+
+    cached_jobs: list[RoleRefinementJob] = []
+    fresh_jobs: list[RoleRefinementJob] = []
+    for job in jobs:
+        (fresh_jobs if job.cached_data is None else cached_jobs).append(job)
+    token_counts = [
+        estimate_role_tokens(encode_model(job.role, exclude=ROLE_REFINE_ROLE_EXCLUDE))
+        for job in fresh_jobs
+    ]
+    batches = plan_role_batches(fresh_jobs, token_counts, policy)
+    return [[job] for job in cached_jobs] + batches
 
 
 def _get_role_title(role: Role, index: int) -> str:
@@ -479,9 +676,24 @@ async def _analyze_job_if_needed(
     Returns:
         JobAnalysis object.
 
+    Notes:
+        1. Uses the job analysis already held in the refinement state, if any.
+        2. Otherwise uses the persistent analysis cache when one is configured.
+        3. Otherwise analyzes the job description and stores the result in the cache.
+
     """
-    if params.state and params.state.job_analysis is not None:
-        return params.state.job_analysis
+    state = params.state or RefinementState()
+    if state.job_analysis is not None:
+        return state.job_analysis
+
+    cache, cache_key = state.analysis_cache, state.analysis_cache_key
+    use_cache = cache is not None and cache_key is not None
+    if use_cache:
+        cached_analysis = await cache.get(cache_key)
+        if cached_analysis is not None:
+            _msg = "Using job analysis from the persistent cache"
+            log.debug(_msg)
+            return cached_analysis
 
     from resume_editor.app.llm.orchestration_analysis import analyze_job_description
 
@@ -489,7 +701,10 @@ async def _analyze_job_if_needed(
         job_description=params.job_description,
         llm_config=params.llm_config,
         resume_content_for_context=params.resume_content,
+        retry_budget=params.retry_budget,
     )
+    if use_cache:
+        await cache.put(cache_key, job_analysis)
     return job_analysis
 
 
@@ -516,6 +731,40 @@ async def _process_events_from_queue(
         event_queue.task_done()
 
 
+def _build_refinement_jobs(
+    params: RefinementOrchestratorParams,
+    job_analysis: JobAnalysis,
+    roles_to_refine: list[tuple[int, Role]],
+) -> list[RoleRefinementJob]:
+    """Build the refinement jobs, looking each role up in the cache once.
+
+    Args:
+        params: The refinement parameters.
+        job_analysis: The job analysis to use.
+        roles_to_refine: List of (index, role) tuples to refine.
+
+    Returns:
+        The refinement jobs, in resume order, carrying their cached results.
+
+    Notes:
+        1. Batch planning and the single-role path both read `cached_data` from the
+           job, so the cache hit and miss counts see one lookup per role.
+
+    """
+    jobs = []
+    for index, role in roles_to_refine:
+        job = RoleRefinementJob(
+            role=role,
+            job_analysis=job_analysis,
+            llm_config=params.llm_config,
+            original_index=index,
+            bypass_cache=params.state.bypass_role_cache,
+        )
+        job.cached_data = _cached_refinement(job)
+        jobs.append(job)
+    return jobs
+
+
 async def _run_refinement_tasks(
     params: RefinementOrchestratorParams,
     job_analysis: JobAnalysis,
@@ -533,23 +782,20 @@ async def _run_refinement_tasks(
 
     """
     event_queue: asyncio.Queue = asyncio.Queue()
-    semaphore = asyncio.Semaphore(params.max_concurrency)
     num_roles_to_refine = len(roles_to_refine)
+    semaphore = asyncio.Semaphore(params.max_concurrency or max(num_roles_to_refine, 1))
+
+    jobs = _build_refinement_jobs(params, job_analysis, roles_to_refine)
 
     try:
         async with asyncio.TaskGroup() as tg:
-            for index, role in roles_to_refine:
-                job = RoleRefinementJob(
-                    role=role,
-                    job_analysis=job_analysis,
-                    llm_config=params.llm_config,
-                    original_index=index,
-                )
+            for batch in _plan_refinement_batches(jobs):
                 tg.create_task(
-                    _refine_role_and_put_on_queue(
-                        job=job,
+                    _refine_batch_and_put_on_queue(
+                        jobs=batch,
                         semaphore=semaphore,
                         event_queue=event_queue,
+                        retry_budget=params.retry_budget,
                     ),
                 )
 
@@ -558,7 +804,8 @@ async def _run_refinement_tasks(
             ):
                 yield event
     except Exception as e:
-        log.exception("Error during role refinement task group.")
+        _msg = "Error during role refinement task group."
+        log.exception(_msg)
         _unwrap_exception_group(e)
 
 
@@ -585,11 +832,49 @@ async def _yield_skipped_roles(
             }
 
 
+def _start_connection_warmup(llm_config: LLMConfig) -> None:
+    """Warm the pooled connection to the LLM endpoint in the background.
+
+    Args:
+        llm_config: LLM configuration.
+
+    Notes:
+        1. Runs while the resume is parsed and the job analyzed, so the first
+           role refinement does not pay for the TCP and TLS handshakes.
+        2. Warms the first of the endpoint and its fallbacks whose circuit is closed.
+        3. Keeps a reference to the task until it finishes.
+
+    """
+    target = llm_circuit_breakers.route(llm_config)
+    task = asyncio.create_task(warm_llm_client(target))
+    _warmup_tasks.add(task)
+    task.add_done_callback(_warmup_tasks.discard)
+
+
+def _load_experience_info(
+    resume_content: str,
+    state: RefinementState,
+) -> ExperienceResponse:
+    """Return the experience section to refine.
+
+    Args:
+        resume_content: The full Markdown content of the resume.
+        state: The refinement state, possibly holding the loaded experience section.
+
+    Returns:
+        The state's experience_info, or the experience parsed from resume_content.
+
+    """
+    if state.experience_info is not None:
+        return state.experience_info
+    return extract_experience_info(resume_content)
+
+
 async def async_refine_experience_section(
     resume_content: str,
     job_description: str,
     llm_config: LLMConfig,
-    max_concurrency: int = 5,
+    max_concurrency: int | None = None,
     state: RefinementState | None = None,
 ) -> AsyncGenerator[dict, None]:
     """Orchestrates concurrent refinement of the experience section.
@@ -598,12 +883,20 @@ async def async_refine_experience_section(
         resume_content: The full Markdown content of the resume.
         job_description: The job description to align with.
         llm_config: LLM configuration.
-        max_concurrency: Maximum roles to refine in parallel.
+        max_concurrency: Optional cap on roles refined in parallel by this session.
+            Without it, only the endpoint's shared adaptive limiter applies.
         state: Optional refinement state containing job_analysis and skip_indices.
 
     Yields:
         Status updates and refined role data.
 
+    Notes:
+        1. Starts warming the pooled LLM connection before parsing the resume.
+        2. Uses the state's experience_info when given; the resume is parsed only
+           without it.
+        3. Job analysis and every role share one retry budget, the state's if it
+           has one.
+
     """
     _msg = "async_refine_experience_section starting"
     log.debug(_msg)
@@ -616,12 +909,16 @@ async def async_refine_experience_section(
         llm_config=llm_config,
         max_concurrency=max_concurrency,
         state=state,
+        retry_budget=state.retry_budget
+        or RetryBudget(get_retry_policy().retry_budget),
     )
 
     skip_indices = params.state.skip_indices or set()
 
+    _start_connection_warmup(llm_config)
+
     yield {"status": "in_progress", "message": "Parsing resume..."}
-    experience_info = extract_experience_info(resume_content)
+    experience_info = _load_experience_info(resume_content, state)
 
     if params.state.job_analysis is None:
         yield {"status": "in_progress", "message": "Analyzing job description..."}
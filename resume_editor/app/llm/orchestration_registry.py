@@ -0,0 +1,465 @@
+"""Per-process registry of pooled LLM clients and prepared chains."""
+
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+from langchain_openai import ChatOpenAI
+
+from resume_editor.app.llm.models import LLMConfig
+from resume_editor.app.llm.orchestration_client import initialize_llm_client
+
+log = logging.getLogger(__name__)
+
+DEFAULT_MAX_CLIENTS = 32
+DEFAULT_MAX_CHAINS = 128
+DEFAULT_KEEPALIVE_EXPIRY_SECONDS = 60.0
+DEFAULT_WARM_TIMEOUT_SECONDS = 5.0
+DEFAULT_OPENAI_BASE_URL = "https://api.openai.com/v1"
+
+ClientKey = tuple[str, str, str]
+
+
+@dataclass(frozen=True)
+class LLMRegistryStats:
+    """Point-in-time counters for an LLMClientRegistry.
+
+    Attributes:
+        clients (int): Number of clients currently held.
+        chains (int): Number of prepared chains currently held.
+        client_hits (int): Number of client lookups answered from the registry.
+        client_misses (int): Number of client lookups that created a new client.
+        chain_hits (int): Number of chain lookups answered from the registry.
+        chain_misses (int): Number of chain lookups that built a new chain.
+        evictions (int): Number of clients and chains dropped to honour the size caps.
+        warmups (int): Number of connection warm-up requests sent.
+
+    """
+
+    clients: int
+    chains: int
+    client_hits: int
+    client_misses: int
+    chain_hits: int
+    chain_misses: int
+    evictions: int
+    warmups: int
+
+
+@dataclass
+class _ClientEntry:
+    """A pooled client and the time its connections were last warmed.
+
+    Attributes:
+        client (ChatOpenAI): The pooled client.
+        warmed_at (float | None): Monotonic time of the last warm-up, or None.
+
+    """
+
+    client: ChatOpenAI
+    warmed_at: float | None = None
+
+
+@dataclass
+class _HttpPools:
+    """The shared keep-alive HTTP pools handed to every client.
+
+    Attributes:
+        sync_client (httpx.Client): Pool used by synchronous calls.
+        async_client (httpx.AsyncClient): Pool used by asynchronous calls.
+        loop (asyncio.AbstractEventLoop | None): The event loop the async pool belongs to.
+
+    """
+
+    sync_client: httpx.Client
+    async_client: httpx.AsyncClient
+    loop: asyncio.AbstractEventLoop | None = field(default=None)
+
+
+def llm_client_key(llm_config: LLMConfig) -> ClientKey:
+    """Compute the registry key for an LLM configuration.
+
+    Args:
+        llm_config (LLMConfig): The LLM configuration.
+
+    Returns:
+        ClientKey: The (endpoint, model, SHA-256 of the API key) tuple.
+
+    Notes:
+        1. The API key is hashed so it is never held in a key or written to a log.
+        2. Missing values are normalized the same way `initialize_llm_client` resolves them.
+
+    """
+    api_key_hash = hashlib.sha256((llm_config.api_key or "").encode("utf-8")).hexdigest()
+    return (
+        llm_config.llm_endpoint or "",
+        llm_config.llm_model_name or "gpt-4o",
+        api_key_hash,
+    )
+
+
+def _create_http_pools(
+    loop: asyncio.AbstractEventLoop | None,
+    keepalive_expiry: float,
+) -> _HttpPools:
+    """Create the shared keep-alive HTTP pools.
+
+    Args:
+        loop (asyncio.AbstractEventLoop | None): The event loop the async pool will run on.
+        keepalive_expiry (float): Seconds an idle connection is kept open.
+
+    Returns:
+        _HttpPools: The sync and async pools.
+
+    """
+    limits = httpx.Limits(
+        max_connections=100,
+        max_keepalive_connections=20,
+        keepalive_expiry=keepalive_expiry,
+    )
+    return _HttpPools(
+        sync_client=httpx.Client(limits=limits),
+        async_client=httpx.AsyncClient(limits=limits),
+        loop=loop,
+    )
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    """Return the running event loop, or None when called outside of one."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class LLMClientRegistry:
+    """Bounded LRU registry of LLM clients and prepared chains.
+
+    Creating a `ChatOpenAI` per call gives every call its own connection pool and a
+    new TLS handshake, and rebuilding prompt templates and format instructions on
+    every call repeats the same work. This registry keeps one client per
+    (endpoint, model, key hash) and one prepared chain per (client, chain name).
+
+    Attributes:
+        max_clients (int): Maximum number of clients held before eviction.
+        max_chains (int): Maximum number of prepared chains held before eviction.
+        keepalive_expiry (float): Seconds an idle pooled connection is kept open.
+
+    Notes:
+        1. All clients share one sync and one async keep-alive `httpx` pool.
+        2. The async pool is bound to an event loop; if the running loop changes, the
+           pools, clients and chains are replaced.
+        3. Evicting a client also evicts its prepared chains.
+        4. Chains are only cached for clients that belong to the registry; any other
+           client gets a freshly built chain.
+        5. All bookkeeping is protected by a threading.Lock for thread safety.
+
+    """
+
+    def __init__(
+        self,
+        max_clients: int = DEFAULT_MAX_CLIENTS,
+        max_chains: int = DEFAULT_MAX_CHAINS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY_SECONDS,
+    ) -> None:
+        """Initialize an empty registry without opening any connections.
+
+        Args:
+            max_clients (int): Maximum number of clients held before eviction.
+            max_chains (int): Maximum number of prepared chains held before eviction.
+            keepalive_expiry (float): Seconds an idle pooled connection is kept open.
+
+        """
+        self.max_clients = max_clients
+        self.max_chains = max_chains
+        self.keepalive_expiry = keepalive_expiry
+        self._clients: OrderedDict[ClientKey, _ClientEntry] = OrderedDict()
+        self._client_keys: dict[int, ClientKey] = {}
+        self._chains: OrderedDict[tuple[ClientKey, str], Any] = OrderedDict()
+        self._pools: _HttpPools | None = None
+        self._client_hits = 0
+        self._client_misses = 0
+        self._chain_hits = 0
+        self._chain_misses = 0
+        self._evictions = 0
+        self._warmups = 0
+        self._lock = threading.Lock()
+
+    def _current_pools(self) -> _HttpPools:
+        """Return the shared HTTP pools for the running event loop.
+
+        Returns:
+            _HttpPools: The sync and async pools.
+
+        Notes:
+            1. Must be called with the lock held.
+            2. Pools created outside of an event loop are adopted by the first loop that uses them.
+            3. If the async pool belongs to another loop, drops every client and chain
+               and creates new pools.
+
+        """
+        loop = _running_loop()
+        pools = self._pools
+        if pools is not None and pools.loop is None:
+            pools.loop = loop
+        if pools is None or (loop is not None and pools.loop is not loop):
+            if pools is not None:
+                _msg = "LLMClientRegistry event loop changed, replacing pooled clients"
+                log.debug(_msg)
+                pools.sync_client.close()
+            self._clients.clear()
+            self._client_keys.clear()
+            self._chains.clear()
+            self._pools = _create_http_pools(loop, self.keepalive_expiry)
+        return self._pools
+
+    def _evict_over_limits(self) -> None:
+        """Evict least-recently-used clients and chains until both caps are honoured.
+
+        Notes:
+            1. Must be called with the lock held.
+
+        """
+        while len(self._clients) > self.max_clients:
+            key, entry = self._clients.popitem(last=False)
+            self._client_keys.pop(id(entry.client), None)
+            for chain_key in [k for k in self._chains if k[0] == key]:
+                del self._chains[chain_key]
+                self._evictions += 1
+            self._evictions += 1
+        while len(self._chains) > self.max_chains:
+            self._chains.popitem(last=False)
+            self._evictions += 1
+
+    def _get_entry(self, llm_config: LLMConfig) -> tuple[ClientKey, _ClientEntry]:
+        """Return the client entry for a configuration, creating it on a miss.
+
+        Args:
+            llm_config (LLMConfig): The LLM configuration.
+
+        Returns:
+            tuple[ClientKey, _ClientEntry]: The registry key and the client entry.
+
+        """
+        key = llm_client_key(llm_config)
+        with self._lock:
+            pools = self._current_pools()
+            entry = self._clients.get(key)
+            if entry is not None:
+                self._clients.move_to_end(key)
+                self._client_hits += 1
+                return key, entry
+
+            client = initialize_llm_client(
+                llm_config,
+                http_client=pools.sync_client,
+                http_async_client=pools.async_client,
+            )
+            entry = _ClientEntry(client=client)
+            self._clients[key] = entry
+            self._client_keys[id(client)] = key
+            self._client_misses += 1
+            self._evict_over_limits()
+
+        _msg = f"LLMClientRegistry created client for endpoint '{key[0]}', model '{key[1]}'"
+        log.debug(_msg)
+        return key, entry
+
+    def get_client(self, llm_config: LLMConfig) -> ChatOpenAI:
+        """Return the pooled client for a configuration.
+
+        Args:
+            llm_config (LLMConfig): The LLM configuration.
+
+        Returns:
+            ChatOpenAI: A client sharing the registry's keep-alive connection pool.
+
+        """
+        _, entry = self._get_entry(llm_config)
+        return entry.client
+
+    def get_chain(
+        self,
+        llm: ChatOpenAI,
+        chain_name: str,
+        build: Callable[[ChatOpenAI], Any],
+    ) -> Any:
+        """Return the prepared chain for a client, building it on a miss.
+
+        Args:
+            llm (ChatOpenAI): The client the chain runs on.
+            chain_name (str): A label identifying the prompt and output handling.
+            build (Callable[[ChatOpenAI], Any]): Builds the chain for the client on a miss.
+
+        Returns:
+            Any: The prepared LangChain runnable.
+
+        Notes:
+            1. Prompt templates and format instructions are built once per client and name.
+            2. A client that does not belong to the registry always gets a fresh chain.
+
+        """
+        with self._lock:
+            client_key = self._client_keys.get(id(llm))
+            if client_key is not None:
+                chain = self._chains.get((client_key, chain_name))
+                if chain is not None:
+                    self._chains.move_to_end((client_key, chain_name))
+                    self._chain_hits += 1
+                    return chain
+            self._chain_misses += 1
+
+        chain = build(llm)
+        if client_key is None:
+            return chain
+
+        with self._lock:
+            if self._client_keys.get(id(llm)) == client_key:
+                self._chains[(client_key, chain_name)] = chain
+                self._evict_over_limits()
+        return chain
+
+    def client_key(self, llm: ChatOpenAI) -> ClientKey | None:
+        """Return the registry key a pooled client was created for.
+
+        Args:
+            llm (ChatOpenAI): The client.
+
+        Returns:
+            ClientKey | None: The client's key, or None if it does not belong to the registry.
+
+        """
+        with self._lock:
+            return self._client_keys.get(id(llm))
+
+    async def warm(self, llm_config: LLMConfig) -> None:
+        """Open a pooled connection to the configuration's endpoint ahead of use.
+
+        Args:
+            llm_config (LLMConfig): The LLM configuration.
+
+        Notes:
+            1. Sends a lightweight GET for the endpoint's model list through the shared async pool,
+               so the TCP and TLS handshakes happen before the first LLM call.
+            2. Skips the request if the client was warmed within the keep-alive window.
+            3. Failures are logged and ignored; warming is best-effort.
+
+        Network access:
+            - Makes a network request to the LLM endpoint.
+
+        """
+        try:
+            key, entry = self._get_entry(llm_config)
+            now = time.monotonic()
+            with self._lock:
+                if (
+                    entry.warmed_at is not None
+                    and now - entry.warmed_at < self.keepalive_expiry
+                ):
+                    return
+                entry.warmed_at = now
+                self._warmups += 1
+                async_client = self._current_pools().async_client
+            base_url = (key[0] or DEFAULT_OPENAI_BASE_URL).rstrip("/")
+            await async_client.get(
+                f"{base_url}/models",
+                timeout=DEFAULT_WARM_TIMEOUT_SECONDS,
+            )
+        except Exception as e:
+            _msg = f"LLMClientRegistry warm-up failed: {e!s}"
+            log.debug(_msg)
+
+    def stats(self) -> LLMRegistryStats:
+        """Return a snapshot of the registry counters.
+
+        Returns:
+            LLMRegistryStats: Entry counts, hits, misses, evictions and warm-ups.
+
+        """
+        with self._lock:
+            return LLMRegistryStats(
+                clients=len(self._clients),
+                chains=len(self._chains),
+                client_hits=self._client_hits,
+                client_misses=self._client_misses,
+                chain_hits=self._chain_hits,
+                chain_misses=self._chain_misses,
+                evictions=self._evictions,
+                warmups=self._warmups,
+            )
+
+    def clear(self) -> None:
+        """Drop all clients and chains and reset the counters."""
+        with self._lock:
+            self._clients.clear()
+            self._client_keys.clear()
+            self._chains.clear()
+            self._client_hits = 0
+            self._client_misses = 0
+            self._chain_hits = 0
+            self._chain_misses = 0
+            self._evictions = 0
+            self._warmups = 0
+
+    async def aclose(self) -> None:
+        """Drop all clients and chains and close the shared HTTP pools."""
+        self.clear()
+        with self._lock:
+            pools, self._pools = self._pools, None
+        if pools is not None:
+            pools.sync_client.close()
+            if pools.loop is None or pools.loop is _running_loop():
+                await pools.async_client.aclose()
+
+
+# Module-level singleton instance
+llm_client_registry = LLMClientRegistry()
+
+
+def get_llm_client(llm_config: LLMConfig) -> ChatOpenAI:
+    """Return the shared pooled client for an LLM configuration.
+
+    Args:
+        llm_config (LLMConfig): The LLM configuration.
+
+    Returns:
+        ChatOpenAI: The pooled client.
+
+    """
+    return llm_client_registry.get_client(llm_config)
+
+
+def get_prepared_chain(
+    llm: ChatOpenAI,
+    chain_name: str,
+    build: Callable[[ChatOpenAI], Any],
+) -> Any:
+    """Return the shared prepared chain for a client.
+
+    Args:
+        llm (ChatOpenAI): The client the chain runs on.
+        chain_name (str): A label identifying the prompt and output handling.
+        build (Callable[[ChatOpenAI], Any]): Builds the chain for the client on a miss.
+
+    Returns:
+        Any: The prepared LangChain runnable.
+
+    """
+    return llm_client_registry.get_chain(llm, chain_name, build)
+
+
+async def warm_llm_client(llm_config: LLMConfig) -> None:
+    """Warm the shared connection pool for an LLM configuration.
+
+    Args:
+        llm_config (LLMConfig): The LLM configuration.
+
+    """
+    await llm_client_registry.warm(llm_config)
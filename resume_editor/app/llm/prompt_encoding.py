@@ -0,0 +1,118 @@
+"""JSON encoding of structured data embedded in LLM prompts."""
+
+import json
+import logging
+from collections.abc import Iterable
+from typing import Any, Literal
+
+from pydantic import BaseModel
+
+from resume_editor.app.core.config import get_settings
+
+log = logging.getLogger(__name__)
+
+PromptEncoding = Literal["compact", "indented"]
+
+# Job analysis fields the role refinement prompt aligns roles with; the
+# extracted job details (company, pay rate, contact, ...) do not affect a role.
+ROLE_REFINE_JOB_ANALYSIS_FIELDS = frozenset(
+    {"key_skills", "primary_duties", "themes", "inferred_themes"},
+)
+# Role fields the role refinement prompt does not need; the inclusion status
+# is restored from the original role after refinement.
+ROLE_REFINE_ROLE_EXCLUDE = {"basics": {"inclusion_status"}}
+
+
+def get_prompt_encoding() -> PromptEncoding:
+    """Return the configured prompt encoding.
+
+    Returns:
+        PromptEncoding: "compact" or "indented".
+
+    """
+    return get_settings().llm_prompt_encoding
+
+
+def encode_model(
+    model: BaseModel,
+    encoding: PromptEncoding | None = None,
+    include: Any = None,
+    exclude: Any = None,
+) -> str:
+    """Encode a pydantic model as JSON for a prompt.
+
+    Args:
+        model (BaseModel): The model to encode.
+        encoding (PromptEncoding | None): The encoding; the configured one if None.
+        include (Any): Fields to keep in compact encoding, as for `model_dump_json`.
+        exclude (Any): Fields to drop in compact encoding, as for `model_dump_json`.
+
+    Returns:
+        str: The JSON text.
+
+    Notes:
+        1. Compact encoding drops indentation, None values, defaults and the
+           excluded fields.
+        2. Indented encoding dumps every field with two-space indentation.
+
+    """
+    if (encoding or get_prompt_encoding()) == "indented":
+        return model.model_dump_json(indent=2)
+    return model.model_dump_json(
+        include=include,
+        exclude=exclude,
+        exclude_none=True,
+        exclude_defaults=True,
+    )
+
+
+def encode_models(
+    models: Iterable[BaseModel],
+    encoding: PromptEncoding | None = None,
+    exclude: Any = None,
+) -> str:
+    """Encode a list of pydantic models as a JSON array for a prompt.
+
+    Args:
+        models (Iterable[BaseModel]): The models to encode.
+        encoding (PromptEncoding | None): The encoding; the configured one if None.
+        exclude (Any): Fields of each model to drop in compact encoding, as for
+            `model_dump`.
+
+    Returns:
+        str: The JSON text.
+
+    Notes:
+        1. Compact encoding drops None values, defaults and the excluded fields
+           of each model, as `encode_model` does.
+        2. Indented encoding dumps every field of each model.
+
+    """
+    encoding = encoding or get_prompt_encoding()
+    compact = encoding == "compact"
+    data = [
+        model.model_dump(
+            mode="json",
+            exclude=exclude if compact else None,
+            exclude_none=compact,
+            exclude_defaults=compact,
+        )
+        for model in models
+    ]
+    return encode_json(data, encoding)
+
+
+def encode_json(data: Any, encoding: PromptEncoding | None = None) -> str:
+    """Encode plain data as JSON for a prompt.
+
+    Args:
+        data (Any): JSON-serializable data.
+        encoding (PromptEncoding | None): The encoding; the configured one if None.
+
+    Returns:
+        str: The JSON text, without whitespace between tokens when compact.
+
+    """
+    if (encoding or get_prompt_encoding()) == "indented":
+        return json.dumps(data, indent=2)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
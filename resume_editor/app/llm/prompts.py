@@ -173,6 +173,27 @@ Role to Refine:
 Now, output the refined role as a JSON object:
 """
 
+ROLE_REFINE_BATCH_SYSTEM_PROMPT = (
+    ROLE_REFINE_SYSTEM_PROMPT
+    + """
+**Several Roles at Once:**
+You will be given a JSON array of roles instead of a single role. Refine each role independently, applying every rule above to that role alone: never move facts, skills or achievements from one role to another. Your response MUST be a single JSON object enclosed in ```json ... ``` with a `roles` list holding exactly one refined role per input role, in the same order as the input. This object, not a single role, is what the schema above describes.
+"""
+)
+
+ROLE_REFINE_BATCH_HUMAN_PROMPT = """Job Analysis (for context):
+---
+{job_analysis_json}
+---
+
+Roles to Refine (a JSON array of {role_count} roles):
+---
+{roles_json}
+---
+
+Now, output the JSON object with the {role_count} refined roles, in order:
+"""
+
 INTRO_ANALYZE_JOB_SYSTEM_PROMPT = """As a professional career coach, your task is to analyze the provided `Job Description` to extract the most critical skills and qualifications.
 
 **Instructions:**
@@ -0,0 +1,600 @@
+"""Shared request and token rate limits for LLM endpoints."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Literal, Protocol
+
+from langchain_core.runnables import RunnableConfig
+from langchain_openai import ChatOpenAI
+
+from resume_editor.app.llm.orchestration_registry import (
+    DEFAULT_OPENAI_BASE_URL,
+    ClientKey,
+    llm_client_registry,
+)
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+log = logging.getLogger(__name__)
+
+RateLimitBackendKind = Literal["memory", "file"]
+
+DEFAULT_STATE_DIR = Path(tempfile.gettempdir()) / "resume_editor_llm_rate_limits"
+DEFAULT_MAX_KEYS = 256
+
+# Rough size of a token in characters of English text and JSON.
+CHARS_PER_TOKEN = 4
+# Allowance for the prompt template around the chain's input variables.
+PROMPT_TEMPLATE_TOKENS = 500
+# Allowance for the completion, which providers count against the same budget.
+COMPLETION_TOKENS = 1000
+
+BucketState = dict[str, float]
+
+
+@dataclass(frozen=True)
+class RateLimits:
+    """Per-minute budgets shared by every caller of one endpoint and API key.
+
+    Attributes:
+        requests_per_minute (int): Requests allowed per minute, or 0 for no limit.
+        tokens_per_minute (int): Estimated tokens allowed per minute, or 0 for no limit.
+
+    """
+
+    requests_per_minute: int = 0
+    tokens_per_minute: int = 0
+
+    @property
+    def enabled(self) -> bool:
+        """bool: Whether either budget is limited."""
+        return self.requests_per_minute > 0 or self.tokens_per_minute > 0
+
+    def capacities(self) -> dict[str, int]:
+        """Return the size of each limited bucket.
+
+        Returns:
+            dict[str, int]: Bucket name to capacity, for the limited budgets only.
+
+        """
+        capacities = {
+            "requests": self.requests_per_minute,
+            "tokens": self.tokens_per_minute,
+        }
+        return {name: cap for name, cap in capacities.items() if cap > 0}
+
+
+@dataclass(frozen=True)
+class RateLimiterStats:
+    """Point-in-time state of the LLMRateLimiter.
+
+    Attributes:
+        backend (str): Where the buckets are kept, "memory" or "file".
+        requests_per_minute (int): Requests allowed per minute, or 0 for no limit.
+        tokens_per_minute (int): Estimated tokens allowed per minute, or 0 for no limit.
+        acquired (int): Number of requests let through.
+        throttled (int): Number of requests that had to wait.
+        total_wait_seconds (float): Total time requests spent waiting.
+        max_wait_seconds (float): Longest time a single request waited.
+
+    """
+
+    backend: str
+    requests_per_minute: int
+    tokens_per_minute: int
+    acquired: int
+    throttled: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+
+
+def rate_limit_key(client_key: ClientKey) -> str:
+    """Compute the rate limit key for an LLM client.
+
+    Args:
+        client_key (ClientKey): The client's (endpoint, model, SHA-256 of the API key) key.
+
+    Returns:
+        str: The endpoint and API key digest; models on one account share its limits.
+
+    """
+    endpoint, _model, api_key_hash = client_key
+    endpoint = (endpoint or DEFAULT_OPENAI_BASE_URL).rstrip("/")
+    return f"{endpoint}#{api_key_hash}"
+
+
+def client_rate_limit_key(llm: ChatOpenAI) -> str | None:
+    """Compute the rate limit key for a pooled LLM client.
+
+    Args:
+        llm (ChatOpenAI): The client.
+
+    Returns:
+        str | None: The client's rate limit key, or None if it does not belong to the
+            client registry.
+
+    """
+    client_key = llm_client_registry.client_key(llm)
+    return rate_limit_key(client_key) if client_key is not None else None
+
+
+def estimate_tokens(chain_input: Mapping[str, object]) -> int:
+    """Estimate the tokens a chain invocation counts against the token budget.
+
+    Args:
+        chain_input (Mapping[str, object]): The input variables of the chain.
+
+    Returns:
+        int: Estimated prompt and completion tokens.
+
+    Notes:
+        1. Providers count the prompt and the requested completion, so the estimate
+           adds allowances for the prompt template and the completion to the
+           length of the input variables.
+
+    """
+    chars = sum(len(str(value)) for value in chain_input.values())
+    return chars // CHARS_PER_TOKEN + PROMPT_TEMPLATE_TOKENS + COMPLETION_TOKENS
+
+
+def take_from_buckets(
+    state: BucketState | None,
+    limits: RateLimits,
+    tokens: int,
+    now: float,
+) -> tuple[BucketState, float]:
+    """Refill the request and token buckets and take one request from them.
+
+    Args:
+        state (BucketState | None): Bucket levels and last update time, or None for full buckets.
+        limits (RateLimits): The per-minute budgets.
+        tokens (int): Estimated tokens of the request.
+        now (float): Current wall-clock time in seconds.
+
+    Returns:
+        tuple[BucketState, float]: The new state, and 0.0 if the request was taken
+            or the seconds until both buckets can cover it.
+
+    Notes:
+        1. Each bucket holds one minute's budget and refills continuously.
+        2. A request is taken from both buckets or from neither.
+        3. A request larger than the token budget is charged the whole budget
+           so it still goes through once the bucket is full.
+
+    """
+    capacities = limits.capacities()
+    levels = {name: float(cap) for name, cap in capacities.items()}
+    if state is not None:
+        elapsed = max(now - state.get("updated_at", now), 0.0)
+        for name, cap in capacities.items():
+            level = state.get(name, float(cap)) + elapsed * cap / 60
+            levels[name] = min(float(cap), level)
+
+    costs = {"requests": 1, "tokens": min(tokens, limits.tokens_per_minute)}
+    wait = max(
+        ((costs[name] - levels[name]) * 60 / cap for name, cap in capacities.items()),
+        default=0.0,
+    )
+    if wait <= 0:
+        levels = {name: level - costs[name] for name, level in levels.items()}
+    return {**levels, "updated_at": now}, max(wait, 0.0)
+
+
+class RateLimitBackend(Protocol):
+    """Storage for the buckets of every rate limit key.
+
+    Attributes:
+        name (str): The backend kind, as configured.
+        blocking (bool): Whether `try_acquire` can block on I/O or other
+            processes, so it must not run on the event loop.
+
+    """
+
+    name: str
+    blocking: bool
+
+    def try_acquire(self, key: str, limits: RateLimits, tokens: int, now: float) -> float:
+        """Take a request from the key's buckets if they can cover it.
+
+        Args:
+            key (str): The rate limit key.
+            limits (RateLimits): The per-minute budgets.
+            tokens (int): Estimated tokens of the request.
+            now (float): Current wall-clock time in seconds.
+
+        Returns:
+            float: 0.0 if the request was taken, otherwise seconds to wait first.
+
+        """
+        ...
+
+
+class MemoryRateLimitBackend:
+    """Buckets kept in this process, shared by all of its threads and event loops.
+
+    Attributes:
+        max_keys (int): Maximum number of keys held before eviction.
+
+    Notes:
+        1. Keys are evicted least-recently-used first; an evicted key starts again
+           with full buckets.
+        2. All operations are protected by a threading.Lock for thread safety.
+
+    """
+
+    name = "memory"
+    blocking = False
+
+    def __init__(self, max_keys: int = DEFAULT_MAX_KEYS) -> None:
+        """Initialize an empty backend.
+
+        Args:
+            max_keys (int): Maximum number of keys held before eviction.
+
+        """
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, BucketState] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def try_acquire(self, key: str, limits: RateLimits, tokens: int, now: float) -> float:
+        """Take a request from the key's buckets if they can cover it.
+
+        Args:
+            key (str): The rate limit key.
+            limits (RateLimits): The per-minute budgets.
+            tokens (int): Estimated tokens of the request.
+            now (float): Current wall-clock time in seconds.
+
+        Returns:
+            float: 0.0 if the request was taken, otherwise seconds to wait first.
+
+        """
+        with self._lock:
+            state, wait = take_from_buckets(self._buckets.get(key), limits, tokens, now)
+            self._buckets[key] = state
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return wait
+
+
+class FileRateLimitBackend:
+    """Buckets kept in lock-protected files, shared by every worker on the host.
+
+    Attributes:
+        state_dir (Path): Directory holding one state file per key.
+
+    Notes:
+        1. Each update holds an exclusive `fcntl.flock` on the key's file while it
+           reads, refills and writes the buckets, so gunicorn workers never
+           overspend a budget between them.
+        2. File names are digests of the keys, so endpoints and API key digests
+           are not written to the file system.
+        3. An unreadable state file is replaced with full buckets.
+        4. Requires `fcntl`, which is not available on Windows.
+        5. Blocks while another worker holds the lock, so `LLMRateLimiter` calls
+           it in a worker thread.
+
+    """
+
+    name = "file"
+    blocking = True
+
+    def __init__(self, state_dir: str | Path = DEFAULT_STATE_DIR) -> None:
+        """Initialize the backend, creating the state directory if needed.
+
+        Args:
+            state_dir (str | Path): Directory holding one state file per key.
+
+        Raises:
+            RuntimeError: If file locking is not available on this platform.
+
+        """
+        if fcntl is None:
+            raise RuntimeError("The file rate limit backend requires fcntl.")
+        self.state_dir = Path(state_dir)
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        """Return the state file of a key.
+
+        Args:
+            key (str): The rate limit key.
+
+        Returns:
+            Path: The key's state file.
+
+        """
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.state_dir / f"{digest}.json"
+
+    def try_acquire(self, key: str, limits: RateLimits, tokens: int, now: float) -> float:
+        """Take a request from the key's buckets if they can cover it.
+
+        Args:
+            key (str): The rate limit key.
+            limits (RateLimits): The per-minute budgets.
+            tokens (int): Estimated tokens of the request.
+            now (float): Current wall-clock time in seconds.
+
+        Returns:
+            float: 0.0 if the request was taken, otherwise seconds to wait first.
+
+        """
+        fd = os.open(self._path(key), os.O_RDWR | os.O_CREAT, 0o600)
+        with os.fdopen(fd, "r+", encoding="utf-8") as state_file:
+            fcntl.flock(state_file, fcntl.LOCK_EX)
+            try:
+                try:
+                    state = json.loads(state_file.read() or "null")
+                except json.JSONDecodeError:
+                    state = None
+                state, wait = take_from_buckets(state, limits, tokens, now)
+                state_file.seek(0)
+                state_file.truncate()
+                state_file.write(json.dumps(state))
+                state_file.flush()
+            finally:
+                fcntl.flock(state_file, fcntl.LOCK_UN)
+        return wait
+
+
+def create_rate_limit_backend(
+    kind: RateLimitBackendKind,
+    state_dir: str | Path = DEFAULT_STATE_DIR,
+) -> RateLimitBackend:
+    """Create a rate limit backend.
+
+    Args:
+        kind (RateLimitBackendKind): "memory" for this process only, "file" for all
+            workers on the host.
+        state_dir (str | Path): Directory for the file backend's state files.
+
+    Returns:
+        RateLimitBackend: The backend.
+
+    Raises:
+        ValueError: If the kind is unknown.
+
+    """
+    if kind == "memory":
+        return MemoryRateLimitBackend()
+    if kind == "file":
+        return FileRateLimitBackend(state_dir)
+    _msg = f"Invalid rate limit backend: {kind!r}"
+    raise ValueError(_msg)
+
+
+class LLMRateLimiter:
+    """Process-wide request and token budgets per LLM endpoint and API key.
+
+    Each session's concurrency limit keeps one refinement from flooding the
+    endpoint, but concurrent sessions on the same account still add up. The
+    limiter holds every LLM call until the account's per-minute budgets can
+    cover it, and with the file backend the budgets are shared by all workers.
+
+    Notes:
+        1. Unlimited until `configure` sets a budget.
+        2. Waiting callers re-check after the time the buckets need to refill;
+           callers are not served in strict arrival order.
+        3. Statistics are protected by a threading.Lock for thread safety.
+
+    """
+
+    def __init__(
+        self,
+        limits: RateLimits | None = None,
+        backend: RateLimitBackend | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            limits (RateLimits | None): The per-minute budgets; unlimited if None.
+            backend (RateLimitBackend | None): Bucket storage; in memory if None.
+            clock (Callable[[], float]): Wall-clock time source, shared across workers.
+
+        """
+        self.limits = limits or RateLimits()
+        self._backend: RateLimitBackend = backend or MemoryRateLimitBackend()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._reset_stats()
+
+    def _reset_stats(self) -> None:
+        """Zero the statistics."""
+        self._acquired = 0
+        self._throttled = 0
+        self._total_wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+
+    def configure(
+        self,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        backend: RateLimitBackendKind = "memory",
+        state_dir: str | Path = DEFAULT_STATE_DIR,
+    ) -> None:
+        """Set the budgets and the backend that stores them.
+
+        Args:
+            requests_per_minute (int): Requests allowed per minute, or 0 for no limit.
+            tokens_per_minute (int): Estimated tokens allowed per minute, or 0 for no limit.
+            backend (RateLimitBackendKind): "memory" or "file".
+            state_dir (str | Path): Directory for the file backend's state files.
+
+        Raises:
+            ValueError: If a budget is negative or the backend is unknown.
+
+        """
+        if requests_per_minute < 0 or tokens_per_minute < 0:
+            _msg = (
+                "Invalid LLM rate limits: "
+                f"{requests_per_minute!r} requests, {tokens_per_minute!r} tokens"
+            )
+            raise ValueError(_msg)
+        new_backend = create_rate_limit_backend(backend, state_dir)
+        with self._lock:
+            self.limits = RateLimits(requests_per_minute, tokens_per_minute)
+            self._backend = new_backend
+        _msg = (
+            f"LLMRateLimiter configured: requests_per_minute={requests_per_minute}, "
+            f"tokens_per_minute={tokens_per_minute}, backend={backend}"
+        )
+        log.info(_msg)
+
+    def _record(self, waited: float) -> None:
+        """Record a request let through and how long it waited.
+
+        Args:
+            waited (float): Seconds the request waited.
+
+        """
+        with self._lock:
+            self._acquired += 1
+            if waited > 0:
+                self._throttled += 1
+                self._total_wait_seconds += waited
+                self._max_wait_seconds = max(self._max_wait_seconds, waited)
+
+    async def _try_backend(
+        self,
+        backend: RateLimitBackend,
+        key: str,
+        limits: RateLimits,
+        tokens: int,
+    ) -> float:
+        """Ask a backend to take a request, off the event loop if it blocks.
+
+        Args:
+            backend (RateLimitBackend): The bucket storage.
+            key (str): The rate limit key.
+            limits (RateLimits): The per-minute budgets.
+            tokens (int): Estimated tokens of the request.
+
+        Returns:
+            float: 0.0 if the request was taken, otherwise seconds to wait first.
+
+        """
+        if backend.blocking:
+            return await asyncio.to_thread(
+                backend.try_acquire, key, limits, tokens, self._clock()
+            )
+        return backend.try_acquire(key, limits, tokens, self._clock())
+
+    async def acquire(self, key: str, tokens: int) -> float:
+        """Wait until the key's budgets can cover a request, then take it.
+
+        Args:
+            key (str): The rate limit key of the endpoint and API key.
+            tokens (int): Estimated tokens of the request.
+
+        Returns:
+            float: Seconds spent waiting.
+
+        """
+        limits, backend = self.limits, self._backend
+        if not limits.enabled:
+            return 0.0
+
+        started_at = self._clock()
+        wait = await self._try_backend(backend, key, limits, tokens)
+        while wait > 0:
+            _msg = f"LLM rate limit reached; waiting {wait:.2f}s"
+            log.debug(_msg)
+            await asyncio.sleep(wait)
+            wait = await self._try_backend(backend, key, limits, tokens)
+
+        waited = max(self._clock() - started_at, 0.0)
+        self._record(waited)
+        return waited
+
+    async def try_acquire(self, key: str, tokens: int) -> bool:
+        """Take a request from the key's budgets only if they cover it now.
+
+        Args:
+            key (str): The rate limit key of the endpoint and API key.
+            tokens (int): Estimated tokens of the request.
+
+        Returns:
+            bool: True if the request was taken, False if it would have to wait.
+
+        Notes:
+            1. For optional requests, such as hedges, that are not worth waiting for.
+
+        """
+        limits, backend = self.limits, self._backend
+        if not limits.enabled:
+            return True
+        if await self._try_backend(backend, key, limits, tokens) > 0:
+            return False
+        self._record(0.0)
+        return True
+
+    async def ainvoke(
+        self,
+        chain: Any,
+        chain_input: Mapping[str, object],
+        key: str | None,
+        config: RunnableConfig | None = None,
+    ) -> Any:
+        """Invoke a chain once the key's budgets can cover it.
+
+        Args:
+            chain (Any): The LangChain runnable.
+            chain_input (Mapping[str, object]): The input variables of the chain.
+            key (str | None): The rate limit key, or None to invoke without waiting.
+            config (RunnableConfig | None): Optional config for the invocation.
+
+        Returns:
+            Any: The chain's result.
+
+        Network access:
+            - Makes a network request to the LLM endpoint.
+
+        """
+        if key is not None:
+            await self.acquire(key, estimate_tokens(chain_input))
+        return await chain.ainvoke(chain_input, config=config)
+
+    def stats(self) -> RateLimiterStats:
+        """Return a snapshot of the limiter's configuration and statistics.
+
+        Returns:
+            RateLimiterStats: The current state.
+
+        """
+        with self._lock:
+            return RateLimiterStats(
+                backend=self._backend.name,
+                requests_per_minute=self.limits.requests_per_minute,
+                tokens_per_minute=self.limits.tokens_per_minute,
+                acquired=self._acquired,
+                throttled=self._throttled,
+                total_wait_seconds=self._total_wait_seconds,
+                max_wait_seconds=self._max_wait_seconds,
+            )
+
+    def reset(self) -> None:
+        """Remove the budgets, drop the buckets and zero the statistics."""
+        with self._lock:
+            self.limits = RateLimits()
+            self._backend = MemoryRateLimitBackend()
+            self._reset_stats()
+
+
+# Module-level singleton instance
+llm_rate_limiter = LLMRateLimiter()
@@ -0,0 +1,370 @@
+"""Hedged LLM requests to cut the tail latency of role refinement."""
+
+import asyncio
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TypeVar
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_KEYS = 256
+LATENCY_WINDOW_SIZE = 200
+# Recent calls needed before the hedge delay is trusted.
+MIN_LATENCY_SAMPLES = 20
+HEDGE_QUANTILE = 0.95
+DEFAULT_HEDGE_RATIO = 0.1
+DEFAULT_MIN_HEDGE_DELAY_SECONDS = 2.0
+# Hedges that may be sent back to back after a quiet period.
+MAX_HEDGE_CREDITS = 10.0
+
+
+@dataclass(frozen=True)
+class RequestHedgerStats:
+    """Snapshot of the request hedger's configuration and counters.
+
+    Attributes:
+        enabled (bool): Whether slow requests are hedged.
+        max_hedge_ratio (float): Hedges allowed per request.
+        min_hedge_delay_seconds (float): Shortest wait before a hedge is sent.
+        requests (int): Requests made through the hedger.
+        hedges (int): Second requests sent.
+        hedge_wins (int): Hedges that finished first and were used.
+        hedges_denied (int): Hedges not sent for lack of hedge budget or rate limit.
+        hedge_rate (float): Hedges per request.
+
+    """
+
+    enabled: bool
+    max_hedge_ratio: float
+    min_hedge_delay_seconds: float
+    requests: int
+    hedges: int
+    hedge_wins: int
+    hedges_denied: int
+    hedge_rate: float
+
+
+def latency_quantile(latencies: list[float], quantile: float) -> float:
+    """Return the nearest-rank quantile of a list of latencies.
+
+    Args:
+        latencies (list[float]): The latencies, in any order; must not be empty.
+        quantile (float): The quantile, between 0 and 1.
+
+    Returns:
+        float: The latency at the quantile.
+
+    """
+    ordered = sorted(latencies)
+    rank = max(math.ceil(quantile * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+async def _first_success(tasks: list[asyncio.Task]) -> asyncio.Task:
+    """Wait for the first of the tasks to finish without an error.
+
+    Args:
+        tasks (list[asyncio.Task]): The tasks, in order of preference.
+
+    Returns:
+        asyncio.Task: The first successful task, or the last to fail if all fail.
+
+    """
+    pending = set(tasks)
+    while True:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        finished = [task for task in tasks if task in done]
+        winner = next((task for task in finished if task.exception() is None), None)
+        if winner is not None or not pending:
+            return winner or finished[-1]
+
+
+class RequestHedger:
+    """Sends a second, identical request when the first one is slower than usual.
+
+    Attributes:
+        enabled (bool): Whether slow requests are hedged.
+        max_hedge_ratio (float): Hedges allowed per request, over time.
+        min_hedge_delay_seconds (float): Shortest wait before a hedge is sent.
+        max_keys (int): Maximum number of endpoints whose latencies are kept.
+
+    Notes:
+        1. The hedge delay is the 95th percentile of the endpoint's recent
+           request latencies, and at least min_hedge_delay_seconds. Nothing is
+           hedged until the endpoint has MIN_LATENCY_SAMPLES recent latencies.
+        2. Each request earns max_hedge_ratio hedge credits, up to
+           MAX_HEDGE_CREDITS; a hedge spends one.
+        3. The first request to succeed is used and the other is cancelled.
+        4. Latencies and counters are protected by a threading.Lock.
+
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        max_hedge_ratio: float = DEFAULT_HEDGE_RATIO,
+        min_hedge_delay_seconds: float = DEFAULT_MIN_HEDGE_DELAY_SECONDS,
+        max_keys: int = DEFAULT_MAX_KEYS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the hedger.
+
+        Args:
+            enabled (bool): Whether slow requests are hedged.
+            max_hedge_ratio (float): Hedges allowed per request, over time.
+            min_hedge_delay_seconds (float): Shortest wait before a hedge is sent.
+            max_keys (int): Maximum number of endpoints whose latencies are kept.
+            clock (Callable[[], float]): Monotonic time source.
+
+        """
+        self.enabled = enabled
+        self.max_hedge_ratio = max_hedge_ratio
+        self.min_hedge_delay_seconds = min_hedge_delay_seconds
+        self.max_keys = max_keys
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._latencies: OrderedDict[str, deque[float]] = OrderedDict()
+        self._reset_stats()
+
+    def _reset_stats(self) -> None:
+        """Zero the counters and the hedge credits."""
+        self._credits = 0.0
+        self._requests = 0
+        self._hedges = 0
+        self._hedge_wins = 0
+        self._hedges_denied = 0
+
+    def configure(
+        self,
+        enabled: bool,
+        max_hedge_ratio: float = DEFAULT_HEDGE_RATIO,
+        min_hedge_delay_seconds: float = DEFAULT_MIN_HEDGE_DELAY_SECONDS,
+    ) -> None:
+        """Set whether and how eagerly slow requests are hedged.
+
+        Args:
+            enabled (bool): Whether slow requests are hedged.
+            max_hedge_ratio (float): Hedges allowed per request, over time.
+            min_hedge_delay_seconds (float): Shortest wait before a hedge is sent.
+
+        Raises:
+            ValueError: If the ratio or the delay is negative.
+
+        """
+        if max_hedge_ratio < 0 or min_hedge_delay_seconds < 0:
+            _msg = (
+                "Invalid LLM hedging settings: "
+                f"ratio {max_hedge_ratio!r}, delay {min_hedge_delay_seconds!r}"
+            )
+            raise ValueError(_msg)
+        with self._lock:
+            self.enabled = enabled
+            self.max_hedge_ratio = max_hedge_ratio
+            self.min_hedge_delay_seconds = min_hedge_delay_seconds
+        _msg = (
+            f"RequestHedger configured: enabled={enabled}, "
+            f"max_hedge_ratio={max_hedge_ratio}, "
+            f"min_hedge_delay_seconds={min_hedge_delay_seconds}"
+        )
+        log.info(_msg)
+
+    def record_latency(self, key: str, latency: float) -> None:
+        """Record the latency of a successful request.
+
+        Args:
+            key (str): The endpoint key.
+            latency (float): Seconds the request took.
+
+        """
+        with self._lock:
+            window = self._latencies.pop(key, None)
+            if window is None:
+                window = deque(maxlen=LATENCY_WINDOW_SIZE)
+            window.append(latency)
+            self._latencies[key] = window
+            while len(self._latencies) > self.max_keys:
+                self._latencies.popitem(last=False)
+
+    def hedge_delay(self, key: str) -> float | None:
+        """Return how long a request waits before it is hedged.
+
+        Args:
+            key (str): The endpoint key.
+
+        Returns:
+            float | None: Seconds to wait, or None if requests to the endpoint are
+                not hedged.
+
+        """
+        with self._lock:
+            if not self.enabled:
+                return None
+            window = list(self._latencies.get(key, ()))
+        if len(window) < MIN_LATENCY_SAMPLES:
+            return None
+        return max(
+            latency_quantile(window, HEDGE_QUANTILE),
+            self.min_hedge_delay_seconds,
+        )
+
+    def _start_request(self) -> None:
+        """Count a request and earn its hedge credit."""
+        with self._lock:
+            self._requests += 1
+            self._credits = min(self._credits + self.max_hedge_ratio, MAX_HEDGE_CREDITS)
+
+    async def _take_hedge_credit(
+        self,
+        admit: Callable[[], Awaitable[bool]] | None,
+    ) -> bool:
+        """Spend a hedge credit if one is left and the hedge is admitted.
+
+        Args:
+            admit (Callable[[], Awaitable[bool]] | None): Optional check, such as
+                a shared rate limit, the hedge must also pass.
+
+        Returns:
+            bool: True if the hedge may be sent.
+
+        """
+        with self._lock:
+            allowed = self._credits >= 1.0
+            if allowed:
+                self._credits -= 1.0
+        if allowed and admit is not None and not await admit():
+            with self._lock:
+                self._credits += 1.0
+            allowed = False
+        with self._lock:
+            if allowed:
+                self._hedges += 1
+            else:
+                self._hedges_denied += 1
+        return allowed
+
+    async def _timed(self, key: str, request: Awaitable[T]) -> T:
+        """Await a request and record its latency if it succeeds.
+
+        Args:
+            key (str): The endpoint key.
+            request (Awaitable[T]): The request.
+
+        Returns:
+            T: The request's result.
+
+        """
+        started_at = self._clock()
+        result = await request
+        self.record_latency(key, self._clock() - started_at)
+        return result
+
+    async def _race(
+        self,
+        key: str,
+        primary: asyncio.Task,
+        request: Callable[[bool], Awaitable[T]],
+    ) -> T:
+        """Race a hedge against the primary request.
+
+        Args:
+            key (str): The endpoint key.
+            primary (asyncio.Task): The primary request's task.
+            request (Callable[[bool], Awaitable[T]]): Starts a request; called
+                with True for the hedge.
+
+        Returns:
+            T: The result of the first request to succeed.
+
+        """
+        hedge = asyncio.create_task(self._timed(key, request(True)))
+        try:
+            winner = await _first_success([primary, hedge])
+        finally:
+            for task in (primary, hedge):
+                task.cancel()
+        if winner is hedge and hedge.exception() is None:
+            with self._lock:
+                self._hedge_wins += 1
+            _msg = "Hedged LLM request finished first"
+            log.debug(_msg)
+        return winner.result()
+
+    async def run(
+        self,
+        key: str,
+        request: Callable[[bool], Awaitable[T]],
+        admit: Callable[[], Awaitable[bool]] | None = None,
+    ) -> T:
+        """Make a request, hedging it if it is slower than usual.
+
+        Args:
+            key (str): The endpoint key whose latencies set the hedge delay.
+            request (Callable[[bool], Awaitable[T]]): Starts an identical request
+                on each call; called with False for the primary and True for the
+                hedge.
+            admit (Callable[[], Awaitable[bool]] | None): Optional check the
+                hedge must pass when it is due, without waiting.
+
+        Returns:
+            T: The result of the first request to succeed.
+
+        Raises:
+            Exception: The error of the primary, or of the last request to fail.
+
+        Network access:
+            - Makes one or two network requests to the LLM endpoint.
+
+        """
+        self._start_request()
+        delay = self.hedge_delay(key)
+        primary = asyncio.create_task(self._timed(key, request(False)))
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+        except BaseException:
+            primary.cancel()
+            raise
+        if done or not await self._take_hedge_credit(admit):
+            return await primary
+
+        _msg = f"LLM request slower than {delay:.2f}s; sending a hedge"
+        log.debug(_msg)
+        return await self._race(key, primary, request)
+
+    def stats(self) -> RequestHedgerStats:
+        """Return a snapshot of the hedger's configuration and counters.
+
+        Returns:
+            RequestHedgerStats: The current state.
+
+        """
+        with self._lock:
+            return RequestHedgerStats(
+                enabled=self.enabled,
+                max_hedge_ratio=self.max_hedge_ratio,
+                min_hedge_delay_seconds=self.min_hedge_delay_seconds,
+                requests=self._requests,
+                hedges=self._hedges,
+                hedge_wins=self._hedge_wins,
+                hedges_denied=self._hedges_denied,
+                hedge_rate=self._hedges / self._requests if self._requests else 0.0,
+            )
+
+    def reset(self) -> None:
+        """Disable hedging, forget all latencies and zero the counters."""
+        with self._lock:
+            self.enabled = False
+            self.max_hedge_ratio = DEFAULT_HEDGE_RATIO
+            self.min_hedge_delay_seconds = DEFAULT_MIN_HEDGE_DELAY_SECONDS
+            self._latencies.clear()
+            self._reset_stats()
+
+
+# Module-level singleton instance
+llm_request_hedger = RequestHedger()
@@ -0,0 +1,329 @@
+"""Retry policy for LLM requests."""
+
+import asyncio
+import email.utils
+import json
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TypeVar
+
+import httpx
+from cryptography.fernet import InvalidToken
+from openai import (
+    APIConnectionError,
+    APIStatusError,
+    AuthenticationError,
+    BadRequestError,
+    NotFoundError,
+    PermissionDeniedError,
+    RateLimitError,
+)
+from pydantic import ValidationError
+
+from resume_editor.app.core.config import get_settings
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_BASE_DELAY_SECONDS = 1.0
+DEFAULT_MAX_DELAY_SECONDS = 30.0
+DEFAULT_RETRY_BUDGET = 10
+
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429})
+
+_RETRYABLE_TYPES = (
+    json.JSONDecodeError,
+    TimeoutError,
+    ConnectionError,
+    APIConnectionError,
+    httpx.TimeoutException,
+    httpx.NetworkError,
+)
+_NON_RETRYABLE_TYPES = (
+    AuthenticationError,
+    PermissionDeniedError,
+    BadRequestError,
+    NotFoundError,
+    ValidationError,
+    InvalidToken,
+)
+
+
+def _is_retryable_status(status_code: object) -> bool:
+    """Determine if an HTTP status code is worth retrying.
+
+    Args:
+        status_code (object): The status code of an API error.
+
+    Returns:
+        bool: True for 408, 409, 429 and 5xx status codes.
+
+    """
+    if not isinstance(status_code, int):
+        return False
+    return status_code in RETRYABLE_STATUS_CODES or status_code >= 500
+
+
+def is_retryable_llm_error(error: BaseException) -> bool:
+    """Determine if a failed LLM request is worth retrying.
+
+    Args:
+        error (BaseException): The error the request failed with.
+
+    Returns:
+        bool: True if the error is transient, False otherwise.
+
+    Notes:
+        1. Authentication, permission, bad request, not found, validation and
+           decryption errors are never retried.
+        2. Rate limit errors are retried unless the account's quota is exhausted.
+        3. Other OpenAI API errors are retried for 408, 409, 429 and 5xx status codes.
+        4. Timeouts, connection errors and malformed JSON responses are retried.
+
+    """
+    if isinstance(error, _NON_RETRYABLE_TYPES):
+        return False
+    if isinstance(error, RateLimitError):
+        return getattr(error, "code", None) != "insufficient_quota"
+    if isinstance(error, APIStatusError):
+        return _is_retryable_status(error.status_code)
+    return isinstance(error, _RETRYABLE_TYPES)
+
+
+def _parse_retry_after(value: str) -> float | None:
+    """Parse a Retry-After header value.
+
+    Args:
+        value (str): Delay in seconds, or an HTTP date.
+
+    Returns:
+        float | None: Seconds to wait, or None if the value cannot be parsed.
+
+    """
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def retry_after_seconds(error: BaseException) -> float | None:
+    """Read the server's requested retry delay from an API error.
+
+    Args:
+        error (BaseException): The error the request failed with.
+
+    Returns:
+        float | None: Seconds to wait, or None if the response carries no usable hint.
+
+    Notes:
+        1. The millisecond `retry-after-ms` header sent by OpenAI takes precedence
+           over the standard `Retry-After` header.
+
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if headers is None:
+        return None
+
+    retry_after_ms = headers.get("retry-after-ms")
+    if isinstance(retry_after_ms, str):
+        delay = _parse_retry_after(retry_after_ms)
+        if delay is not None:
+            return delay / 1000
+
+    retry_after = headers.get("retry-after")
+    return _parse_retry_after(retry_after) if isinstance(retry_after, str) else None
+
+
+class RetryBudget:
+    """Number of retries left for one refinement, shared by all of its LLM calls.
+
+    Per-call retry limits still let a failing endpoint receive several times
+    the normal load while every role of a refinement retries at once. The
+    budget caps the retries of the whole refinement so an outage fails fast.
+
+    Attributes:
+        max_retries (int): Number of retries the refinement may make.
+
+    Notes:
+        1. Callers share the budget from one event loop, where `try_acquire`
+           runs without interruption, so no lock is needed.
+
+    """
+
+    def __init__(self, max_retries: int = DEFAULT_RETRY_BUDGET) -> None:
+        """Initialize a budget with no retries spent.
+
+        Args:
+            max_retries (int): Number of retries the refinement may make.
+
+        """
+        self.max_retries = max_retries
+        self._used = 0
+
+    @property
+    def remaining(self) -> int:
+        """int: Number of retries left."""
+        return self.max_retries - self._used
+
+    def try_acquire(self) -> bool:
+        """Spend one retry if any are left.
+
+        Returns:
+            bool: True if the retry may go ahead, False if the budget is exhausted.
+
+        """
+        if self._used >= self.max_retries:
+            return False
+        self._used += 1
+        return True
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How failed LLM requests are retried.
+
+    Attributes:
+        max_attempts (int): Attempts per request, including the first.
+        base_delay_seconds (float): Backoff ceiling of the first retry.
+        max_delay_seconds (float): Largest delay waited before a retry.
+        retry_budget (int): Retries allowed per refinement.
+
+    Notes:
+        1. Delays use exponential backoff with full jitter: a random delay between
+           zero and `base_delay_seconds * 2**attempt`, capped at `max_delay_seconds`.
+        2. A server-provided Retry-After delay replaces the backoff; when it exceeds
+           `max_delay_seconds` the request is not retried.
+
+    """
+
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    base_delay_seconds: float = DEFAULT_BASE_DELAY_SECONDS
+    max_delay_seconds: float = DEFAULT_MAX_DELAY_SECONDS
+    retry_budget: int = DEFAULT_RETRY_BUDGET
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Return a fully jittered exponential backoff delay.
+
+        Args:
+            attempt (int): The failed attempt number (0-indexed).
+
+        Returns:
+            float: Seconds to wait before the next attempt.
+
+        """
+        ceiling = min(self.max_delay_seconds, self.base_delay_seconds * 2**attempt)
+        return random.uniform(0.0, ceiling)
+
+    def _delay_for(self, error: BaseException, attempt: int) -> float | None:
+        """Return the delay before retrying, honouring Retry-After.
+
+        Args:
+            error (BaseException): The error the attempt failed with.
+            attempt (int): The failed attempt number (0-indexed).
+
+        Returns:
+            float | None: Seconds to wait, or None if the server asks for longer
+                than `max_delay_seconds`.
+
+        """
+        retry_after = retry_after_seconds(error)
+        if retry_after is None:
+            return self.backoff_delay(attempt)
+        return retry_after if retry_after <= self.max_delay_seconds else None
+
+    def next_delay(
+        self,
+        error: BaseException,
+        attempt: int,
+        budget: RetryBudget | None = None,
+    ) -> float | None:
+        """Decide whether to retry a failed attempt and how long to wait first.
+
+        Args:
+            error (BaseException): The error the attempt failed with.
+            attempt (int): The failed attempt number (0-indexed).
+            budget (RetryBudget | None): The refinement's retry budget, if any.
+
+        Returns:
+            float | None: Seconds to wait before retrying, or None to give up.
+
+        Notes:
+            1. Gives up on the last attempt, on errors that are not transient and
+               on Retry-After delays beyond `max_delay_seconds`.
+            2. Spends one retry from the budget only when retrying.
+
+        """
+        if attempt + 1 >= self.max_attempts or not is_retryable_llm_error(error):
+            return None
+        delay = self._delay_for(error, attempt)
+        if delay is None:
+            return None
+        if budget is not None and not budget.try_acquire():
+            _msg = "Retry budget exhausted, not retrying"
+            log.warning(_msg)
+            return None
+        return delay
+
+
+def get_retry_policy() -> RetryPolicy:
+    """Build the retry policy from the application settings.
+
+    Returns:
+        RetryPolicy: The configured retry policy.
+
+    """
+    settings = get_settings()
+    return RetryPolicy(
+        max_attempts=settings.llm_retry_max_attempts,
+        base_delay_seconds=settings.llm_retry_base_delay_seconds,
+        max_delay_seconds=settings.llm_retry_max_delay_seconds,
+        retry_budget=settings.llm_retry_budget,
+    )
+
+
+async def call_with_retries(
+    operation: Callable[[], Awaitable[T]],
+    policy: RetryPolicy,
+    budget: RetryBudget | None = None,
+    description: str = "LLM request",
+) -> T:
+    """Await an operation, retrying transient failures according to a policy.
+
+    Args:
+        operation (Callable[[], Awaitable[T]]): Starts a fresh attempt on each call.
+        policy (RetryPolicy): The retry policy.
+        budget (RetryBudget | None): The refinement's retry budget, if any.
+        description (str): What the operation does, for log messages.
+
+    Returns:
+        T: The result of the first successful attempt.
+
+    Raises:
+        Exception: The last attempt's error once the policy gives up.
+
+    """
+    attempt = 0
+    while True:
+        try:
+            return await operation()
+        except Exception as e:
+            delay = policy.next_delay(e, attempt, budget)
+            if delay is None:
+                raise
+            _msg = (
+                f"{description} failed ({type(e).__name__}); retrying in "
+                f"{delay:.1f}s (attempt {attempt + 2}/{policy.max_attempts})"
+            )
+            log.warning(_msg)
+            await asyncio.sleep(delay)
+            attempt += 1
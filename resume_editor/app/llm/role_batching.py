@@ -0,0 +1,392 @@
+"""Planning and LLM requests of batched role refinement."""
+
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TypeVar
+
+from langchain_core.output_parsers import PydanticOutputParser, StrOutputParser
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.utils.json import parse_json_markdown
+from langchain_openai import ChatOpenAI
+from openai import AuthenticationError
+from pydantic import ValidationError
+
+from resume_editor.app.core.config import get_settings
+from resume_editor.app.llm.circuit_breaker import call_with_failover
+from resume_editor.app.llm.concurrency_limiter import (
+    AdaptiveConcurrencyLimiter,
+    llm_concurrency_limiters,
+)
+from resume_editor.app.llm.models import (
+    JobAnalysis,
+    LLMConfig,
+    RefinedRole,
+    RefinedRoleBatch,
+)
+from resume_editor.app.llm.orchestration_registry import (
+    get_llm_client,
+    get_prepared_chain,
+    llm_client_key,
+)
+from resume_editor.app.llm.prompt_encoding import (
+    ROLE_REFINE_JOB_ANALYSIS_FIELDS,
+    ROLE_REFINE_ROLE_EXCLUDE,
+    encode_model,
+    encode_models,
+)
+from resume_editor.app.llm.prompts import (
+    ROLE_REFINE_BATCH_HUMAN_PROMPT,
+    ROLE_REFINE_BATCH_SYSTEM_PROMPT,
+)
+from resume_editor.app.llm.rate_limiter import (
+    CHARS_PER_TOKEN,
+    COMPLETION_TOKENS,
+    estimate_tokens,
+    llm_rate_limiter,
+    rate_limit_key,
+)
+from resume_editor.app.llm.token_usage import token_usage_config
+from resume_editor.app.models.resume.experience import Role
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_TOKEN_BUDGET = 1500
+DEFAULT_MAX_ROLES = 6
+
+ROLE_REFINE_BATCH_CHAIN = "role_refine_batch"
+
+
+@dataclass(frozen=True)
+class RoleBatchPolicy:
+    """How many roles may be packed into one role refinement request.
+
+    Attributes:
+        token_budget (int): Estimated tokens of role JSON per request, or 0 to
+            refine every role in its own request.
+        max_roles (int): Most roles per request.
+
+    """
+
+    token_budget: int = DEFAULT_TOKEN_BUDGET
+    max_roles: int = DEFAULT_MAX_ROLES
+
+    @property
+    def enabled(self) -> bool:
+        """bool: Whether more than one role may share a request."""
+        return self.token_budget > 0 and self.max_roles > 1
+
+
+def get_role_batch_policy() -> RoleBatchPolicy:
+    """Build the role batch policy from the application settings.
+
+    Returns:
+        RoleBatchPolicy: The configured batch policy.
+
+    """
+    settings = get_settings()
+    return RoleBatchPolicy(
+        token_budget=settings.llm_role_batch_token_budget,
+        max_roles=settings.llm_role_batch_max_roles,
+    )
+
+
+def estimate_role_tokens(role_json: str) -> int:
+    """Estimate the tokens of a role's prompt JSON.
+
+    Args:
+        role_json (str): The role, encoded for the prompt.
+
+    Returns:
+        int: The estimated token count, at least 1.
+
+    """
+    return max(len(role_json) // CHARS_PER_TOKEN, 1)
+
+
+def _first_fit(
+    batches: list[list[T]],
+    batch_tokens: list[int],
+    tokens: int,
+    policy: RoleBatchPolicy,
+) -> int | None:
+    """Find the first batch with room for another role.
+
+    Args:
+        batches (list[list[T]]): The batches planned so far.
+        batch_tokens (list[int]): The estimated tokens of each batch.
+        tokens (int): The estimated tokens of the role to place.
+        policy (RoleBatchPolicy): The batch policy.
+
+    Returns:
+        int | None: The index of the batch, or None if no batch has room.
+
+    """
+    for i, batch in enumerate(batches):
+        if (
+            len(batch) < policy.max_roles
+            and batch_tokens[i] + tokens <= policy.token_budget
+        ):
+            return i
+    return None
+
+
+def plan_role_batches(
+    items: Sequence[T],
+    token_counts: Sequence[int],
+    policy: RoleBatchPolicy,
+) -> list[list[T]]:
+    """Pack roles into as few requests as the batch policy allows.
+
+    Args:
+        items (Sequence[T]): The roles, or jobs holding them, in resume order.
+        token_counts (Sequence[int]): The estimated tokens of each item's role.
+        policy (RoleBatchPolicy): The batch policy.
+
+    Returns:
+        list[list[T]]: The batches, each in resume order; a batch of one item is
+            refined on its own.
+
+    Notes:
+        1. Each item goes into the first batch with room for its tokens and
+           another role, so small roles fill the gaps left by larger ones.
+        2. A role above the token budget is always a batch of its own.
+        3. Without batching, every item is its own batch.
+
+    """
+    if not policy.enabled:
+        return [[item] for item in items]
+
+    batches: list[list[T]] = []
+    batch_tokens: list[int] = []
+    for item, tokens in zip(items, token_counts, strict=True):
+        i = _first_fit(batches, batch_tokens, tokens, policy)
+        if i is None:
+            batches.append([item])
+            batch_tokens.append(tokens)
+        else:
+            batches[i].append(item)
+            batch_tokens[i] += tokens
+
+    _msg = f"Planned {len(batches)} role refinement requests for {len(items)} roles"
+    log.debug(_msg)
+    return batches
+
+
+def _build_role_refine_batch_chain(llm: ChatOpenAI) -> object:
+    """Build the prompt, LLM and output parser chain for batched role refinement.
+
+    Args:
+        llm: The client the chain runs on.
+
+    Returns:
+        The LangChain runnable chain.
+
+    Notes:
+        1. Renders the RefinedRoleBatch format instructions into the prompt once.
+
+    """
+    parser = PydanticOutputParser(pydantic_object=RefinedRoleBatch)
+
+    prompt = ChatPromptTemplate.from_messages(
+        [
+            ("system", ROLE_REFINE_BATCH_SYSTEM_PROMPT),
+            ("human", ROLE_REFINE_BATCH_HUMAN_PROMPT),
+        ],
+    ).partial(format_instructions=parser.get_format_instructions())
+
+    return prompt | llm | StrOutputParser()
+
+
+def _parse_batch_role(item: object, role: Role) -> RefinedRole | None:
+    """Validate one role of a batched refinement response.
+
+    Args:
+        item: The response's entry for the role.
+        role: The role the entry should refine.
+
+    Returns:
+        The refined role with the original inclusion_status, or None if the entry
+        is invalid or refines a different role.
+
+    """
+    try:
+        refined_role = RefinedRole.model_validate(item)
+    except ValidationError:
+        return None
+    refined_basics = (refined_role.basics.company, refined_role.basics.title)
+    if refined_basics != (role.basics.company, role.basics.title):
+        return None
+    refined_role.basics.inclusion_status = role.basics.inclusion_status
+    return refined_role
+
+
+def _parse_role_batch_response(
+    response_str: str,
+    roles: list[Role],
+) -> list[RefinedRole | None]:
+    """Parse a batched refinement response into one result per role.
+
+    Args:
+        response_str: The LLM response.
+        roles: The roles of the batch, in the order they were sent.
+
+    Returns:
+        The refined roles in input order; None for each role without a valid entry.
+
+    Raises:
+        OutputParserException: If the response holds no JSON.
+
+    Notes:
+        1. Entries are matched to roles by position; missing entries are None
+           and surplus entries are ignored.
+
+    """
+    parsed = parse_json_markdown(response_str)
+    items = parsed.get("roles") if isinstance(parsed, dict) else None
+    if not isinstance(items, list):
+        items = []
+    items = items + [None] * (len(roles) - len(items))
+    return [_parse_batch_role(item, role) for item, role in zip(items, roles)]
+
+
+async def _invoke_role_batch_with_limit(
+    limiter: AdaptiveConcurrencyLimiter,
+    chain: object,
+    chain_input: dict[str, object],
+    role_count: int,
+    throttle_key: str | None = None,
+) -> str:
+    """Invoke the batched role refinement chain within the endpoint's limits.
+
+    Args:
+        limiter: The adaptive concurrency limiter of the LLM endpoint.
+        chain: The LangChain runnable chain to invoke.
+        chain_input: The chain's input variables.
+        role_count: The number of roles in the batch.
+        throttle_key: Optional key of the shared rate limits to wait for.
+
+    Returns:
+        The LLM response.
+
+    Notes:
+        1. The token estimate allows for a completion per role.
+
+    Network access:
+        - Makes a network request to the LLM endpoint.
+
+    """
+    if throttle_key is not None:
+        await llm_rate_limiter.acquire(
+            throttle_key,
+            estimate_tokens(chain_input) + (role_count - 1) * COMPLETION_TOKENS,
+        )
+    async with limiter.slot():
+        return await chain.ainvoke(
+            chain_input,
+            config=token_usage_config(ROLE_REFINE_BATCH_CHAIN),
+        )
+
+
+async def _invoke_role_batch_on_endpoint(
+    llm_config: LLMConfig,
+    chain_input: dict[str, object],
+    role_count: int,
+) -> str:
+    """Invoke the batched role refinement chain of one endpoint.
+
+    Args:
+        llm_config: LLM configuration of the endpoint.
+        chain_input: The chain's input variables.
+        role_count: The number of roles in the batch.
+
+    Returns:
+        The LLM response.
+
+    Network access:
+        - Makes a network request to the LLM endpoint.
+
+    """
+    chain = get_prepared_chain(
+        get_llm_client(llm_config),
+        ROLE_REFINE_BATCH_CHAIN,
+        _build_role_refine_batch_chain,
+    )
+    return await _invoke_role_batch_with_limit(
+        limiter=llm_concurrency_limiters.for_endpoint(llm_config),
+        chain=chain,
+        chain_input=chain_input,
+        role_count=role_count,
+        throttle_key=rate_limit_key(llm_client_key(llm_config)),
+    )
+
+
+async def refine_role_batch(
+    roles: list[Role],
+    job_analysis: JobAnalysis,
+    llm_config: LLMConfig,
+) -> list[RefinedRole | None]:
+    """Uses an LLM to refine several resume Roles in one request.
+
+    Args:
+        roles: The structured Role objects to refine.
+        job_analysis: The structured job analysis to align with.
+        llm_config: LLM configuration.
+
+    Returns:
+        The refined roles in input order; None for each role the response did not
+        refine validly, including every role when the request fails.
+
+    Raises:
+        AuthenticationError: If authentication fails.
+
+    Notes:
+        1. Sends the request to the first of the endpoint and its fallbacks whose
+           circuit is not open, using that endpoint's pooled LLM client and
+           prepared batch refinement chain.
+        2. Sends the job analysis, system prompt and format instructions once for
+           all roles, encoded as for refine_role.
+        3. Makes a single attempt within the shared rate limits and the endpoint's
+           adaptive concurrency limit. Callers refine the roles left None one by
+           one with refine_role, which retries.
+        4. Preserves each role's original inclusion_status.
+
+    Network access:
+        - Makes a network request to the LLM endpoint.
+
+    """
+    _msg = f"refine_role_batch starting for {len(roles)} roles"
+    log.debug(_msg)
+
+    chain_input = {
+        "job_analysis_json": encode_model(
+            job_analysis,
+            include=ROLE_REFINE_JOB_ANALYSIS_FIELDS,
+        ),
+        "roles_json": encode_models(roles, exclude=ROLE_REFINE_ROLE_EXCLUDE),
+        "role_count": len(roles),
+    }
+
+    try:
+        response_str = await call_with_failover(
+            llm_config,
+            lambda target: _invoke_role_batch_on_endpoint(
+                target, chain_input, len(roles)
+            ),
+        )
+        refined_roles = _parse_role_batch_response(response_str, roles)
+    except AuthenticationError:
+        raise
+    except Exception as e:
+        _msg = f"Batched refinement of {len(roles)} roles failed: {type(e).__name__}"
+        log.warning(_msg)
+        return [None] * len(roles)
+
+    _msg = (
+        f"refine_role_batch returning {sum(r is not None for r in refined_roles)} "
+        f"of {len(roles)} roles"
+    )
+    log.debug(_msg)
+    return refined_roles
@@ -0,0 +1,183 @@
+"""Content-addressed cache of refined roles."""
+
+import copy
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from resume_editor.app.llm.models import JobAnalysis
+from resume_editor.app.llm.prompts import (
+    ROLE_REFINE_BATCH_HUMAN_PROMPT,
+    ROLE_REFINE_BATCH_SYSTEM_PROMPT,
+    ROLE_REFINE_HUMAN_PROMPT,
+    ROLE_REFINE_SYSTEM_PROMPT,
+)
+from resume_editor.app.models.resume.experience import Role
+
+log = logging.getLogger(__name__)
+
+DEFAULT_ROLE_CACHE_MAX_ENTRIES = 512
+DEFAULT_ROLE_REFINE_MODEL_NAME = "gpt-4o"
+
+# Changes whenever the single-role or batched role refinement prompts change,
+# so edited prompts never serve results produced by an older prompt. Both feed
+# the same cache entries.
+ROLE_REFINE_PROMPT_VERSION = hashlib.sha256(
+    "\0".join(
+        (
+            ROLE_REFINE_SYSTEM_PROMPT,
+            ROLE_REFINE_HUMAN_PROMPT,
+            ROLE_REFINE_BATCH_SYSTEM_PROMPT,
+            ROLE_REFINE_BATCH_HUMAN_PROMPT,
+        ),
+    ).encode(),
+).hexdigest()[:16]
+
+
+@dataclass(frozen=True)
+class RoleRefinementCacheStats:
+    """Point-in-time counters for a RoleRefinementCache.
+
+    Attributes:
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups that required an LLM call.
+        evictions (int): Number of entries dropped to honour the size cap.
+        entries (int): Number of entries currently held.
+        hit_rate (float): Hits divided by lookups, or 0.0 before the first lookup.
+
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    hit_rate: float
+
+
+def role_refinement_cache_key(
+    role: Role,
+    job_analysis: JobAnalysis,
+    model_name: str | None,
+) -> str:
+    """Build the content-addressed key for refining a role against a job analysis.
+
+    Args:
+        role (Role): The role to refine.
+        job_analysis (JobAnalysis): The job analysis the role is aligned with.
+        model_name (str | None): The configured model name, or None for the default model.
+
+    Returns:
+        str: The hex SHA-256 over the role hash, job analysis hash, model and prompt version.
+
+    """
+    role_hash = hashlib.sha256(role.model_dump_json().encode("utf-8")).hexdigest()
+    analysis_hash = hashlib.sha256(
+        job_analysis.model_dump_json().encode("utf-8"),
+    ).hexdigest()
+    model = model_name or DEFAULT_ROLE_REFINE_MODEL_NAME
+    joined = f"{role_hash}:{analysis_hash}:{model}:{ROLE_REFINE_PROMPT_VERSION}"
+    return hashlib.sha256(joined.encode("utf-8")).hexdigest()
+
+
+class RoleRefinementCache:
+    """Bounded LRU cache of refined role data keyed by its inputs.
+
+    Refining the same base resume against the same job again re-sends every
+    role to the LLM although the inputs are unchanged. This cache stores each
+    refined role under a key derived from the role, the job analysis, the model
+    and the prompt version, and answers repeated refinements from memory.
+
+    Attributes:
+        max_entries (int): Maximum number of entries held before eviction.
+
+    Notes:
+        1. Values are the JSON-mode dumps of `RefinedRole` results.
+        2. Stored values are private; every hit returns a deep copy.
+        3. Entries are evicted least-recently-used first when the cap is exceeded.
+        4. All operations are protected by a threading.Lock for thread safety.
+
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_ROLE_CACHE_MAX_ENTRIES) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries (int): Maximum number of entries held before eviction.
+
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> dict | None:
+        """Return the cached refined role data for a key and record a hit or miss.
+
+        Args:
+            key (str): The key from `role_refinement_cache_key`.
+
+        Returns:
+            dict | None: A deep copy of the refined role data, or None on a miss.
+
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        return copy.deepcopy(value)
+
+    def put(self, key: str, refined_role_data: dict) -> None:
+        """Store a private copy of refined role data under a key.
+
+        Args:
+            key (str): The key from `role_refinement_cache_key`.
+            refined_role_data (dict): The JSON-mode dump of the refined role.
+
+        Notes:
+            1. Replaces any existing entry for the key.
+            2. Evicts least-recently-used entries if the cap is exceeded.
+
+        """
+        stored = copy.deepcopy(refined_role_data)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = stored
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def stats(self) -> RoleRefinementCacheStats:
+        """Return a snapshot of the cache counters.
+
+        Returns:
+            RoleRefinementCacheStats: Hits, misses, evictions, entry count and hit rate.
+
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return RoleRefinementCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                hit_rate=self._hits / lookups if lookups else 0.0,
+            )
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+
+# Module-level singleton instance
+role_refinement_cache = RoleRefinementCache()
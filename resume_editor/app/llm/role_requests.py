@@ -0,0 +1,386 @@
+"""LLM requests that refine a single resume role."""
+
+import json
+import logging
+from collections.abc import Awaitable, Callable
+
+from langchain_core.output_parsers import PydanticOutputParser, StrOutputParser
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.utils.json import parse_json_markdown
+from langchain_openai import ChatOpenAI
+from openai import AuthenticationError
+
+from resume_editor.app.llm.circuit_breaker import llm_circuit_breakers
+from resume_editor.app.llm.concurrency_limiter import (
+    AdaptiveConcurrencyLimiter,
+    llm_concurrency_limiters,
+)
+from resume_editor.app.llm.models import LLMConfig, RefinedRole
+from resume_editor.app.llm.orchestration_models import RoleRefinementRequest
+from resume_editor.app.llm.orchestration_registry import (
+    get_llm_client,
+    get_prepared_chain,
+    llm_client_key,
+)
+from resume_editor.app.llm.prompts import (
+    ROLE_REFINE_HUMAN_PROMPT,
+    ROLE_REFINE_SYSTEM_PROMPT,
+)
+from resume_editor.app.llm.rate_limiter import (
+    estimate_tokens,
+    llm_rate_limiter,
+    rate_limit_key,
+)
+from resume_editor.app.llm.request_hedging import llm_request_hedger
+from resume_editor.app.llm.role_streaming import PartialRoleParser
+from resume_editor.app.llm.token_usage import token_usage_config
+
+log = logging.getLogger(__name__)
+
+ROLE_REFINE_CHAIN = "role_refine"
+ROLE_REFINE_STREAM_CHAIN = "role_refine_stream"
+
+
+def _build_role_refine_chain(llm: ChatOpenAI) -> object:
+    """Build the prompt, LLM and output parser chain for role refinement.
+
+    Args:
+        llm: The client the chain runs on.
+
+    Returns:
+        The LangChain runnable chain.
+
+    Notes:
+        1. Renders the RefinedRole format instructions into the prompt once.
+
+    """
+    parser = PydanticOutputParser(pydantic_object=RefinedRole)
+
+    prompt = ChatPromptTemplate.from_messages(
+        [
+            ("system", ROLE_REFINE_SYSTEM_PROMPT),
+            ("human", ROLE_REFINE_HUMAN_PROMPT),
+        ],
+    ).partial(format_instructions=parser.get_format_instructions())
+
+    return prompt | llm | StrOutputParser()
+
+
+def _build_role_refine_stream_chain(llm: ChatOpenAI) -> object:
+    """Build the role refinement chain for streamed responses.
+
+    Args:
+        llm: The client the chain runs on.
+
+    Returns:
+        The LangChain runnable chain.
+
+    Notes:
+        1. Asks the endpoint to report token usage at the end of the stream,
+           which it only does for streamed requests on request.
+
+    """
+    parser = PydanticOutputParser(pydantic_object=RefinedRole)
+
+    prompt = ChatPromptTemplate.from_messages(
+        [
+            ("system", ROLE_REFINE_SYSTEM_PROMPT),
+            ("human", ROLE_REFINE_HUMAN_PROMPT),
+        ],
+    ).partial(format_instructions=parser.get_format_instructions())
+
+    return prompt | llm.bind(stream_usage=True) | StrOutputParser()
+
+
+def _get_role_refine_chain(llm: ChatOpenAI, streaming: bool) -> object:
+    """Get the prepared role refinement chain of a client.
+
+    Args:
+        llm: The pooled client.
+        streaming: Whether the chain's responses will be streamed.
+
+    Returns:
+        The LangChain runnable chain.
+
+    """
+    if streaming:
+        return get_prepared_chain(
+            llm, ROLE_REFINE_STREAM_CHAIN, _build_role_refine_stream_chain
+        )
+    return get_prepared_chain(llm, ROLE_REFINE_CHAIN, _build_role_refine_chain)
+
+
+def _role_refine_chain_input(job_analysis_json: str, role_json: str) -> dict[str, str]:
+    """Build the input variables of the role refinement chain.
+
+    Args:
+        job_analysis_json: JSON string of the job analysis.
+        role_json: JSON string of the role to refine.
+
+    Returns:
+        The chain's input variables.
+
+    """
+    return {
+        "job_analysis_json": job_analysis_json,
+        "role_json": role_json,
+    }
+
+
+async def _stream_role_response(
+    chain: object,
+    chain_input: dict[str, str],
+    partial_callback: Callable[[str], Awaitable[None]],
+) -> str:
+    """Stream a role refinement response, previewing its summary as it is written.
+
+    Args:
+        chain: The streaming LangChain runnable chain.
+        chain_input: The chain's input variables.
+        partial_callback: Called with the summary written so far whenever it grows.
+
+    Returns:
+        The complete response.
+
+    Network access:
+        - Makes a streaming network request to the LLM endpoint.
+
+    """
+    parser = PartialRoleParser()
+    async for chunk in chain.astream(
+        chain_input,
+        config=token_usage_config(ROLE_REFINE_CHAIN),
+    ):
+        summary = parser.feed(chunk)
+        if summary is not None:
+            await partial_callback(summary)
+    return parser.text
+
+
+async def _request_refined_role(
+    chain: object,
+    chain_input: dict[str, str],
+    partial_callback: Callable[[str], Awaitable[None]] | None = None,
+) -> RefinedRole:
+    """Request, parse and validate one role refinement.
+
+    Args:
+        chain: The LangChain runnable chain to invoke.
+        chain_input: The chain's input variables.
+        partial_callback: Optional callback for the summary as it is written. If
+            given, the response is streamed from the chain.
+
+    Returns:
+        The validated refined role.
+
+    Notes:
+        1. A streamed response is validated once complete; the previews are never
+           used as the result. It is parsed strictly, so a stream cut off mid-role
+           fails the request instead of being closed like the previews are.
+
+    Network access:
+        - Makes a network request to the LLM endpoint.
+
+    """
+    if partial_callback is None:
+        response_str = await chain.ainvoke(
+            chain_input,
+            config=token_usage_config(ROLE_REFINE_CHAIN),
+        )
+        parsed_json = parse_json_markdown(response_str)
+    else:
+        response_str = await _stream_role_response(chain, chain_input, partial_callback)
+        parsed_json = parse_json_markdown(response_str, parser=json.loads)
+    return RefinedRole.model_validate(parsed_json)
+
+
+async def _discard_summary(summary: str) -> None:
+    """Ignore the summary previews of a hedge request.
+
+    Args:
+        summary: The summary written so far.
+
+    """
+
+
+async def _request_refined_role_hedged(
+    chain: object,
+    chain_input: dict[str, str],
+    partial_callback: Callable[[str], Awaitable[None]] | None,
+    hedge_key: str,
+) -> RefinedRole:
+    """Request one role refinement, hedging it if the endpoint is slow to answer.
+
+    Args:
+        chain: The LangChain runnable chain to invoke.
+        chain_input: The chain's input variables.
+        partial_callback: Optional callback for the summary as it is written.
+        hedge_key: The rate limit key of the endpoint and API key.
+
+    Returns:
+        The validated refined role of the first request to succeed.
+
+    Notes:
+        1. A hedge is only sent if the shared rate limits admit it without waiting.
+        2. A hedge of a streamed request is streamed too, but only the primary's
+           summary is previewed.
+
+    Network access:
+        - Makes one or two network requests to the LLM endpoint.
+
+    """
+    hedge_callback = None if partial_callback is None else _discard_summary
+
+    def request(hedge: bool) -> Awaitable[RefinedRole]:
+        callback = hedge_callback if hedge else partial_callback
+        return _request_refined_role(chain, chain_input, callback)
+
+    return await llm_request_hedger.run(
+        hedge_key,
+        request,
+        admit=lambda: llm_rate_limiter.try_acquire(
+            hedge_key, estimate_tokens(chain_input)
+        ),
+    )
+
+
+async def _attempt_refine_role(
+    chain: object,
+    job_analysis_json: str,
+    role_json: str,
+    partial_callback: Callable[[str], Awaitable[None]] | None = None,
+    hedge_key: str | None = None,
+) -> tuple[bool, RefinedRole | None, Exception | None]:
+    """Attempt a single LLM refinement invocation.
+
+    Args:
+        chain: The LangChain runnable chain to invoke.
+        job_analysis_json: JSON string of the job analysis.
+        role_json: JSON string of the role to refine.
+        partial_callback: Optional callback for the summary as it is written. If
+            given, the response is streamed from the chain.
+        hedge_key: Optional rate limit key of the endpoint. If given, the request
+            may be hedged.
+
+    Returns:
+        Tuple of (success, result, error).
+
+    Raises:
+        AuthenticationError: Re-raises immediately if authentication fails.
+
+    Network access:
+        - Makes a network request to the LLM endpoint, or two if hedged.
+
+    """
+    chain_input = _role_refine_chain_input(job_analysis_json, role_json)
+    try:
+        if hedge_key is None:
+            refined_role = await _request_refined_role(
+                chain, chain_input, partial_callback
+            )
+        else:
+            refined_role = await _request_refined_role_hedged(
+                chain, chain_input, partial_callback, hedge_key
+            )
+        return True, refined_role, None
+    except AuthenticationError:
+        raise
+    except Exception as e:
+        return False, None, e
+
+
+async def _attempt_refine_role_with_limit(
+    limiter: AdaptiveConcurrencyLimiter,
+    chain: object,
+    request: RoleRefinementRequest,
+) -> tuple[bool, RefinedRole | None, Exception | None]:
+    """Attempt a single LLM refinement invocation within the endpoint's limits.
+
+    Args:
+        limiter: The adaptive concurrency limiter of the LLM endpoint.
+        chain: The LangChain runnable chain to invoke.
+        request: The payloads of the refinement and where to throttle them.
+
+    Returns:
+        Tuple of (success, result, error).
+
+    Notes:
+        1. Waits for the shared request and token budgets first, so time spent
+           throttled does not hold a concurrency slot or count as latency.
+        2. Waits for a limiter slot and reports the attempt's latency or error to it.
+        3. With a throttle_key, a request slower than the endpoint's recent 95th
+           percentile may be hedged within the same slot.
+
+    Network access:
+        - Makes a network request to the LLM endpoint, or two if hedged.
+
+    """
+    if request.throttle_key is not None:
+        chain_input = _role_refine_chain_input(
+            request.job_analysis_json, request.role_json
+        )
+        await llm_rate_limiter.acquire(
+            request.throttle_key, estimate_tokens(chain_input)
+        )
+    async with limiter.slot() as slot:
+        success, result, error = await _attempt_refine_role(
+            chain=chain,
+            job_analysis_json=request.job_analysis_json,
+            role_json=request.role_json,
+            partial_callback=request.partial_callback,
+            hedge_key=request.throttle_key,
+        )
+        if error is not None:
+            slot.fail(error)
+    return success, result, error
+
+
+async def _attempt_refine_role_with_failover(
+    llm_config: LLMConfig,
+    job_analysis_json: str,
+    role_json: str,
+    partial_callback: Callable[[str], Awaitable[None]] | None = None,
+) -> tuple[bool, RefinedRole | None, Exception | None]:
+    """Attempt a single LLM refinement on the first endpoint whose circuit is not open.
+
+    Args:
+        llm_config: LLM configuration, with its fallback endpoints.
+        job_analysis_json: JSON string of the job analysis.
+        role_json: JSON string of the role to refine.
+        partial_callback: Optional callback for the summary as it is written.
+
+    Returns:
+        Tuple of (success, result, error).
+
+    Raises:
+        CircuitOpenError: If the circuits of every endpoint are open.
+
+    Notes:
+        1. Uses the chosen endpoint's pooled client, limits and rate limit key.
+        2. Reports the attempt's latency or error to the endpoint's circuit breaker.
+
+    Network access:
+        - Makes a network request to the chosen LLM endpoint, or two if hedged.
+
+    """
+    target, permit = llm_circuit_breakers.acquire(llm_config)
+    try:
+        chain = _get_role_refine_chain(
+            get_llm_client(target),
+            streaming=partial_callback is not None,
+        )
+        success, result, error = await _attempt_refine_role_with_limit(
+            limiter=llm_concurrency_limiters.for_endpoint(target),
+            chain=chain,
+            request=RoleRefinementRequest(
+                job_analysis_json=job_analysis_json,
+                role_json=role_json,
+                throttle_key=rate_limit_key(llm_client_key(target)),
+                partial_callback=partial_callback,
+            ),
+        )
+    except BaseException as e:
+        llm_circuit_breakers.record(permit, e)
+        raise
+    llm_circuit_breakers.record(permit, error)
+    return success, result, error
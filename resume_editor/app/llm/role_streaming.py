@@ -0,0 +1,99 @@
+"""Incremental previews of streamed role refinement responses."""
+
+import logging
+
+from langchain_core.utils.json import parse_json_markdown
+
+from resume_editor.app.core.config import get_settings
+
+log = logging.getLogger(__name__)
+
+# New characters received before the partial response is parsed again.
+ROLE_PROGRESS_MIN_CHARS = 40
+
+
+def is_role_streaming_enabled() -> bool:
+    """Return whether role refinement responses are streamed.
+
+    Returns:
+        bool: The configured `llm_role_refine_streaming` setting.
+
+    """
+    return get_settings().llm_role_refine_streaming
+
+
+def partial_role_summary(text: str) -> str | None:
+    """Read the summary written so far from a partial role refinement response.
+
+    Args:
+        text (str): The response received so far, possibly in a ```json fence.
+
+    Returns:
+        str | None: The partial `summary.text`, or None if it has not started.
+
+    Notes:
+        1. Unterminated strings, objects and fences are closed before parsing.
+
+    """
+    try:
+        partial = parse_json_markdown(text)
+    except ValueError:
+        return None
+    summary = partial.get("summary") if isinstance(partial, dict) else None
+    summary_text = summary.get("text") if isinstance(summary, dict) else None
+    return summary_text if isinstance(summary_text, str) else None
+
+
+class PartialRoleParser:
+    """Accumulates a streamed role refinement response and previews its summary.
+
+    Attributes:
+        min_chars (int): New characters received before the response is parsed again.
+
+    Notes:
+        1. The previews are for display only; the complete response is validated
+           as a RefinedRole once the stream ends.
+
+    """
+
+    def __init__(self, min_chars: int = ROLE_PROGRESS_MIN_CHARS) -> None:
+        """Initialize an empty parser.
+
+        Args:
+            min_chars (int): New characters received before the response is
+                parsed again.
+
+        """
+        self.min_chars = min_chars
+        self._chunks: list[str] = []
+        self._length = 0
+        self._parsed_length = 0
+        self._summary: str | None = None
+
+    @property
+    def text(self) -> str:
+        """str: The response received so far."""
+        return "".join(self._chunks)
+
+    def feed(self, chunk: str) -> str | None:
+        """Add a streamed chunk of the response.
+
+        Args:
+            chunk (str): The next chunk of the response.
+
+        Returns:
+            str | None: The summary written so far if it changed since the last
+                preview, otherwise None.
+
+        """
+        self._chunks.append(chunk)
+        self._length += len(chunk)
+        if self._length - self._parsed_length < self.min_chars:
+            return None
+
+        self._parsed_length = self._length
+        summary = partial_role_summary(self.text)
+        if not summary or summary == self._summary:
+            return None
+        self._summary = summary
+        return summary
@@ -0,0 +1,252 @@
+"""Prompt and completion token accounting for LLM calls."""
+
+import logging
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+from langchain_core.runnables import RunnableConfig
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TokenUsage:
+    """Tokens reported by the LLM endpoint for one or more calls.
+
+    Attributes:
+        calls (int): Number of LLM calls.
+        prompt_tokens (int): Tokens in the prompts.
+        completion_tokens (int): Tokens in the completions.
+
+    """
+
+    calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+    @property
+    def total_tokens(self) -> int:
+        """int: Prompt and completion tokens together."""
+        return self.prompt_tokens + self.completion_tokens
+
+    def __add__(self, other: "TokenUsage") -> "TokenUsage":
+        """Add the usage of two sets of calls.
+
+        Args:
+            other (TokenUsage): The usage to add.
+
+        Returns:
+            TokenUsage: The combined usage.
+
+        """
+        return TokenUsage(
+            calls=self.calls + other.calls,
+            prompt_tokens=self.prompt_tokens + other.prompt_tokens,
+            completion_tokens=self.completion_tokens + other.completion_tokens,
+        )
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the usage as a dictionary, including the total.
+
+        Returns:
+            dict[str, int]: The counters and `total_tokens`.
+
+        """
+        return {**asdict(self), "total_tokens": self.total_tokens}
+
+
+def _usage_from_messages(result: LLMResult) -> tuple[int, int]:
+    """Sum the standard usage metadata of the result's messages.
+
+    Args:
+        result (LLMResult): The result of an LLM call.
+
+    Returns:
+        tuple[int, int]: Prompt and completion tokens, zero if none were reported.
+
+    """
+    prompt_tokens = completion_tokens = 0
+    for generations in result.generations:
+        for generation in generations:
+            message = getattr(generation, "message", None)
+            usage = getattr(message, "usage_metadata", None) or {}
+            prompt_tokens += usage.get("input_tokens", 0)
+            completion_tokens += usage.get("output_tokens", 0)
+    return prompt_tokens, completion_tokens
+
+
+def usage_from_llm_result(result: LLMResult) -> TokenUsage:
+    """Read the token usage the endpoint reported for an LLM call.
+
+    Args:
+        result (LLMResult): The result of an LLM call.
+
+    Returns:
+        TokenUsage: The usage of the call; zero tokens if the endpoint reported none.
+
+    Notes:
+        1. The messages' `usage_metadata` is preferred; the provider's
+           `token_usage` in `llm_output` is the fallback.
+
+    """
+    prompt_tokens, completion_tokens = _usage_from_messages(result)
+    if not (prompt_tokens or completion_tokens):
+        token_usage = (result.llm_output or {}).get("token_usage") or {}
+        prompt_tokens = token_usage.get("prompt_tokens", 0)
+        completion_tokens = token_usage.get("completion_tokens", 0)
+    return TokenUsage(
+        calls=1,
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+    )
+
+
+class TokenUsageLedger:
+    """Token usage of one refinement, by stage.
+
+    Notes:
+        1. Stages are the names of the prepared chains, such as "role_refine".
+        2. All operations are protected by a threading.Lock for thread safety.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty ledger."""
+        self._stages: dict[str, TokenUsage] = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, usage: TokenUsage) -> None:
+        """Add the usage of a call to its stage.
+
+        Args:
+            stage (str): The stage the call belongs to.
+            usage (TokenUsage): The usage of the call.
+
+        """
+        with self._lock:
+            self._stages[stage] = self._stages.get(stage, TokenUsage()) + usage
+
+    def stages(self) -> dict[str, TokenUsage]:
+        """Return the usage of each stage.
+
+        Returns:
+            dict[str, TokenUsage]: Stage name to usage, in order of first use.
+
+        """
+        with self._lock:
+            return dict(self._stages)
+
+    def total(self) -> TokenUsage:
+        """Return the usage of all stages together.
+
+        Returns:
+            TokenUsage: The combined usage.
+
+        """
+        return sum(self.stages().values(), TokenUsage())
+
+    def as_dict(self) -> dict[str, dict[str, int]]:
+        """Return the usage of each stage and the total as dictionaries.
+
+        Returns:
+            dict[str, dict[str, int]]: Stage name, and "total", to usage counters.
+
+        """
+        usage = {stage: u.as_dict() for stage, u in self.stages().items()}
+        usage["total"] = self.total().as_dict()
+        return usage
+
+
+_current_ledger: ContextVar[TokenUsageLedger | None] = ContextVar(
+    "llm_token_usage_ledger",
+    default=None,
+)
+
+
+@contextmanager
+def track_token_usage() -> Iterator[TokenUsageLedger]:
+    """Record the token usage of LLM calls made within the block.
+
+    Yields:
+        TokenUsageLedger: The ledger the calls are recorded in.
+
+    Notes:
+        1. The ledger is held in a context variable, so tasks started within the
+           block record into it as well.
+
+    """
+    ledger = TokenUsageLedger()
+    token = _current_ledger.set(ledger)
+    try:
+        yield ledger
+    finally:
+        _current_ledger.reset(token)
+
+
+class TokenUsageCallbackHandler(BaseCallbackHandler):
+    """LangChain callback that logs and records the token usage of LLM calls.
+
+    Attributes:
+        stage (str): The stage the calls belong to.
+        ledger (TokenUsageLedger | None): The ledger to record in, if any.
+
+    """
+
+    # Recording is cheap, so run in the calling task rather than an executor.
+    run_inline = True
+
+    def __init__(self, stage: str, ledger: TokenUsageLedger | None = None) -> None:
+        """Initialize the handler.
+
+        Args:
+            stage (str): The stage the calls belong to.
+            ledger (TokenUsageLedger | None): The ledger to record in, if any.
+
+        """
+        self.stage = stage
+        self.ledger = ledger
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        """Log and record the usage of a finished LLM call.
+
+        Args:
+            response (LLMResult): The result of the call.
+            **kwargs (Any): Further callback arguments, unused.
+
+        """
+        usage = usage_from_llm_result(response)
+        _msg = (
+            f"LLM {self.stage} call used {usage.prompt_tokens} prompt and "
+            f"{usage.completion_tokens} completion tokens"
+        )
+        log.info(
+            _msg,
+            extra={
+                "llm_stage": self.stage,
+                "prompt_tokens": usage.prompt_tokens,
+                "completion_tokens": usage.completion_tokens,
+            },
+        )
+        if self.ledger is not None:
+            self.ledger.record(self.stage, usage)
+
+
+def token_usage_config(stage: str) -> RunnableConfig:
+    """Build the runnable config that accounts for a chain invocation's tokens.
+
+    Args:
+        stage (str): The stage the invocation belongs to.
+
+    Returns:
+        RunnableConfig: A config with a TokenUsageCallbackHandler recording into
+            the current ledger, if any.
+
+    """
+    handler = TokenUsageCallbackHandler(stage, _current_ledger.get())
+    return {"callbacks": [handler]}
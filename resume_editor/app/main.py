@@ -1,5 +1,6 @@
 import logging
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 import nltk
@@ -15,8 +16,20 @@ from resume_editor.app.api.routes.resume import router as resume_router
 from resume_editor.app.api.routes.resume_ai import router as resume_ai_router
 from resume_editor.app.api.routes.resume_export import router as resume_export_router
 from resume_editor.app.api.routes.route_logic import user_crud
+from resume_editor.app.api.routes.route_logic.resume_parse_executor import (
+    resume_parse_executor,
+)
 from resume_editor.app.api.routes.user import router as user_router
+from resume_editor.app.core.config import get_settings
+from resume_editor.app.core.runtime_monitor import runtime_monitor
 from resume_editor.app.database.database import get_session_local
+from resume_editor.app.llm.circuit_breaker import (
+    CircuitBreakerPolicy,
+    llm_circuit_breakers,
+)
+from resume_editor.app.llm.orchestration_registry import llm_client_registry
+from resume_editor.app.llm.rate_limiter import llm_rate_limiter
+from resume_editor.app.llm.request_hedging import llm_request_hedger
 from resume_editor.app.middleware import refresh_session_middleware
 from resume_editor.app.web.admin import router as admin_web_router
 from resume_editor.app.web.admin_forms import router as admin_forms_router
@@ -115,6 +128,57 @@ def _register_routes(app: FastAPI) -> None:
     app.include_router(web_pages_router)
 
 
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Start and stop application-wide resources.
+
+    Args:
+        app: The FastAPI application instance.
+
+    Notes:
+        1. Configure the resume parsing worker pool, the shared LLM rate limits,
+           LLM request hedging and the LLM endpoint circuit breakers from settings
+           on startup.
+        2. Start sampling this worker's event-loop lag on startup.
+        3. Stop the sampling, shut the worker pool down and close the pooled LLM
+           connections on shutdown.
+
+    """
+    settings = get_settings()
+    resume_parse_executor.configure(
+        kind=settings.parse_executor_kind,
+        max_workers=settings.parse_executor_max_workers,
+    )
+    llm_rate_limiter.configure(
+        requests_per_minute=settings.llm_rate_limit_requests_per_minute,
+        tokens_per_minute=settings.llm_rate_limit_tokens_per_minute,
+        backend=settings.llm_rate_limit_backend,
+        state_dir=settings.llm_rate_limit_state_dir,
+    )
+    llm_request_hedger.configure(
+        enabled=settings.llm_hedge_enabled,
+        max_hedge_ratio=settings.llm_hedge_max_ratio,
+        min_hedge_delay_seconds=settings.llm_hedge_min_delay_seconds,
+    )
+    llm_circuit_breakers.configure(
+        enabled=settings.llm_circuit_breaker_enabled,
+        policy=CircuitBreakerPolicy(
+            failure_rate_threshold=settings.llm_circuit_breaker_failure_rate,
+            slow_call_seconds=settings.llm_circuit_breaker_slow_call_seconds,
+            slow_call_rate_threshold=settings.llm_circuit_breaker_slow_call_rate,
+            min_calls=settings.llm_circuit_breaker_min_calls,
+            open_seconds=settings.llm_circuit_breaker_open_seconds,
+        ),
+    )
+    runtime_monitor.start()
+    try:
+        yield
+    finally:
+        await runtime_monitor.stop()
+        resume_parse_executor.shutdown()
+        await llm_client_registry.aclose()
+
+
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application.
 
@@ -134,7 +198,8 @@ def create_app() -> FastAPI:
         7. Add static file serving for CSS/JS assets.
         8. Add template rendering for HTML pages.
         9. Define dashboard routes for the HTMX-based interface.
-        10. Log a success message indicating the application was created.
+        10. Configure the resume parsing worker pool for the lifetime of the application.
+        11. Log a success message indicating the application was created.
 
     """
     _msg = "Creating FastAPI application"
@@ -147,7 +212,7 @@ def create_app() -> FastAPI:
     except LookupError:
         nltk.download("punkt")
 
-    app = FastAPI(title="Resume Editor API")
+    app = FastAPI(title="Resume Editor API", lifespan=_lifespan)
 
     _setup_middleware(app)
     _register_routes(app)
@@ -8,6 +8,7 @@ log = logging.getLogger(__name__)
 Base = declarative_base()
 
 # Import all models here to ensure they are registered with SQLAlchemy's metadata
+from .job_analysis_cache import JobAnalysisCacheEntry  # noqa
 from .resume_model import Resume  # noqa
 from .role import Role  # noqa
 from .user import User  # noqa
@@ -0,0 +1,77 @@
+import logging
+from datetime import datetime, timezone
+
+from sqlalchemy import JSON, Column, DateTime, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB
+
+from resume_editor.app.models import Base
+
+log = logging.getLogger(__name__)
+
+
+class JobAnalysisCacheEntry(Base):
+    """A persisted job description analysis, shared by all workers.
+
+    Attributes:
+        id (int): Primary key.
+        cache_key (str): SHA-256 over the job description hash, resume hash and model name.
+        job_description_hash (str): SHA-256 of the normalized job description.
+        resume_hash (str): SHA-256 of the resume content used as analysis context.
+        model_name (str): The LLM model that produced the analysis.
+        analysis (dict): The `JobAnalysis` dumped as JSON.
+        created_at (datetime): When the analysis was stored; drives the TTL.
+        last_used_at (datetime): When the analysis was last served; drives size-cap eviction.
+
+    """
+
+    __tablename__ = "job_analysis_cache"
+
+    id = Column(Integer, primary_key=True, index=True)
+    cache_key = Column(String(64), nullable=False, unique=True, index=True)
+    job_description_hash = Column(String(64), nullable=False)
+    resume_hash = Column(String(64), nullable=False)
+    model_name = Column(String, nullable=False)
+    analysis = Column(JSONB().with_variant(JSON, "sqlite"), nullable=False)
+    created_at = Column(
+        DateTime,
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+    last_used_at = Column(
+        DateTime,
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+        index=True,
+    )
+
+    def __init__(
+        self,
+        cache_key: str,
+        job_description_hash: str,
+        resume_hash: str,
+        model_name: str,
+        analysis: dict,
+    ):
+        """Initialize a JobAnalysisCacheEntry instance.
+
+        Args:
+            cache_key (str): SHA-256 over the job description hash, resume hash and model name.
+            job_description_hash (str): SHA-256 of the normalized job description.
+            resume_hash (str): SHA-256 of the resume content used as analysis context.
+            model_name (str): The LLM model that produced the analysis.
+            analysis (dict): The `JobAnalysis` dumped as JSON.
+
+        Returns:
+            None
+
+        Notes:
+            1. Assign all values to instance attributes.
+            2. Timestamps are set by the column defaults on insert.
+            3. This operation does not involve network, disk, or database access.
+
+        """
+        self.cache_key = cache_key
+        self.job_description_hash = job_description_hash
+        self.resume_hash = resume_hash
+        self.model_name = model_name
+        self.analysis = analysis
@@ -3,7 +3,17 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 
 import sqlalchemy as sa
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Integer,
+    String,
+    Text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
 from resume_editor.app.models import Base
@@ -63,6 +73,8 @@ class Resume(Base):
         extracted_work_arrangement (str | None): Work arrangement extracted from job description.
         extracted_location (str | None): Location extracted from job description.
         extracted_special_instructions (str | None): Special instructions extracted from job description.
+        structured_data (dict | None): Parsed sections derived from `content`, with the hash of the content they came from.
+        structured_data_version (int | None): Format version of `structured_data`, used to detect stale rows.
 
     """
 
@@ -100,6 +112,10 @@ class Resume(Base):
     extracted_location = Column(String(255), nullable=True)
     extracted_special_instructions = Column(Text, nullable=True)
 
+    # Structured sections derived from content on every write
+    structured_data = Column(JSONB().with_variant(JSON, "sqlite"), nullable=True)
+    structured_data_version = Column(Integer, nullable=True)
+
     export_settings_include_projects = Column(
         Boolean,
         default=True,
@@ -1,6 +1,8 @@
 import logging
+from dataclasses import dataclass
 
-from sqlalchemy import Column, ForeignKey, Integer, String
+from sqlalchemy import JSON, Column, ForeignKey, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
 from resume_editor.app.models import Base
@@ -8,6 +10,18 @@ from resume_editor.app.models import Base
 log = logging.getLogger(__name__)
 
 
+@dataclass
+class UserSettingsData:
+    """Dataclass to hold data for UserSettings initialization."""
+
+    user_id: int
+    llm_endpoint: str | None = None
+    llm_model_name: str | None = None
+    encrypted_api_key: str | None = None
+    access_token_expire_minutes: int | None = None
+    llm_fallback_endpoints: list[dict] | None = None
+
+
 class UserSettings(Base):
     """Stores user-specific settings, such as LLM configurations.
 
@@ -18,6 +32,8 @@ class UserSettings(Base):
         llm_model_name (str | None): The user-specified LLM model name.
         encrypted_api_key (str | None): Encrypted API key for the LLM service.
         access_token_expire_minutes (int | None): User's preferred session timeout in minutes.
+        llm_fallback_endpoints (list[dict] | None): Ordered fallback endpoints, each with
+            an "llm_endpoint" and an optional "llm_model_name".
         user (User): Relationship to the User model.
 
     """
@@ -30,40 +46,31 @@ class UserSettings(Base):
     llm_model_name = Column(String, nullable=True)
     encrypted_api_key = Column(String, nullable=True)
     access_token_expire_minutes = Column(Integer, nullable=True)
+    llm_fallback_endpoints = Column(JSONB().with_variant(JSON, "sqlite"), nullable=True)
 
     user = relationship("User", back_populates="settings")
 
-    def __init__(
-        self,
-        user_id: int,
-        llm_endpoint: str | None = None,
-        llm_model_name: str | None = None,
-        encrypted_api_key: str | None = None,
-        access_token_expire_minutes: int | None = None,
-    ):
+    def __init__(self, data: UserSettingsData):
         """Initialize a UserSettings instance.
 
         Args:
-            user_id (int): The ID of the user these settings belong to.
-            llm_endpoint (str | None): Custom LLM API endpoint URL.
-            llm_model_name (str | None): The user-specified LLM model name.
-            encrypted_api_key (str | None): Encrypted API key for the LLM service.
-            access_token_expire_minutes (int | None): User's preferred session timeout in minutes.
+            data (UserSettingsData): An object containing the data for the new settings.
 
         Returns:
             None
 
         Notes:
-            1. Assign all values to instance attributes.
+            1. Assign all values from the `data` object to instance attributes.
             2. Log the initialization of the user settings.
             3. This operation does not involve network, disk, or database access.
 
         """
-        _msg = f"Initializing UserSettings for user_id: {user_id}"
+        _msg = f"Initializing UserSettings for user_id: {data.user_id}"
         log.debug(_msg)
 
-        self.user_id = user_id
-        self.llm_endpoint = llm_endpoint
-        self.llm_model_name = llm_model_name
-        self.encrypted_api_key = encrypted_api_key
-        self.access_token_expire_minutes = access_token_expire_minutes
+        self.user_id = data.user_id
+        self.llm_endpoint = data.llm_endpoint
+        self.llm_model_name = data.llm_model_name
+        self.encrypted_api_key = data.encrypted_api_key
+        self.access_token_expire_minutes = data.access_token_expire_minutes
+        self.llm_fallback_endpoints = data.llm_fallback_endpoints
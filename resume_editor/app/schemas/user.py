@@ -4,6 +4,8 @@ from typing import Any
 
 from pydantic import BaseModel, ConfigDict, EmailStr, Field, computed_field
 
+from resume_editor.app.llm.models import LLMEndpoint
+
 log = logging.getLogger(__name__)
 
 
@@ -277,18 +279,23 @@ class UserSettingsUpdateRequest(BaseModel):
         llm_model_name (str | None): The user-specified LLM model name.
         api_key (str | None): Plaintext API key for the LLM service.
         access_token_expire_minutes (int | None): Session timeout in minutes (15-1440).
+        llm_fallback_endpoints (list[LLMEndpoint] | None): Ordered fallback endpoints,
+            or an empty list to remove them.
 
     Attributes:
         llm_endpoint (str | None): Custom LLM endpoint URL.
         llm_model_name (str | None): The user-specified LLM model name.
         api_key (str | None): Plaintext API key for the LLM service.
         access_token_expire_minutes (int | None): Session timeout in minutes (15-1440).
+        llm_fallback_endpoints (list[LLMEndpoint] | None): Ordered fallback endpoints,
+            or an empty list to remove them.
 
     Notes:
         1. The API key is not returned in the response for security.
         2. The settings are stored in the user database.
         3. Network access may occur when the LLM service is accessed using the endpoint.
         4. Session timeout must be between 15 and 1440 minutes (24 hours).
+        5. Fallback endpoints left as None are unchanged.
 
     """
 
@@ -296,6 +303,7 @@ class UserSettingsUpdateRequest(BaseModel):
     llm_model_name: str | None = None
     api_key: str | None = None
     access_token_expire_minutes: int | None = None
+    llm_fallback_endpoints: list[LLMEndpoint] | None = None
 
 
 class UserSettingsResponse(BaseModel):
@@ -307,14 +315,17 @@ class UserSettingsResponse(BaseModel):
         llm_endpoint (str | None): Custom LLM endpoint URL.
         api_key_is_set (bool): Whether an API key has been set.
         access_token_expire_minutes (int | None): Session timeout in minutes.
+        llm_fallback_endpoints (list[LLMEndpoint]): Ordered fallback endpoints.
 
     Attributes:
         llm_endpoint (str | None): Custom LLM endpoint URL.
         api_key_is_set (bool): Whether an API key has been set.
         access_token_expire_minutes (int | None): Session timeout in minutes.
+        llm_fallback_endpoints (list[LLMEndpoint]): Ordered fallback endpoints.
 
     Notes:
-        1. The API key is not returned in the response.
+        1. Neither the API key nor the fallback endpoints' keys are returned in
+           the response.
         2. The data is retrieved from the user database.
         3. The model uses ConfigDict(from_attributes=True) to support ORM attribute mapping.
 
@@ -323,5 +334,6 @@ class UserSettingsResponse(BaseModel):
     llm_endpoint: str | None = None
     api_key_is_set: bool = False
     access_token_expire_minutes: int | None = None
+    llm_fallback_endpoints: list[LLMEndpoint] = Field(default_factory=list)
 
     model_config = ConfigDict(from_attributes=True)
@@ -1,5 +1,5 @@
 import logging
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Annotated
 
@@ -25,16 +25,24 @@ from resume_editor.app.models.resume_model import Resume as DatabaseResume
 from resume_editor.app.api.routes.route_logic.resume_validation import (
     validate_company_and_notes,
 )
-from resume_editor.app.api.routes.route_logic.resume_parsing import (
-    validate_resume_content,
+from resume_editor.app.api.routes.route_logic.resume_parse_executor import (
+    resume_parse_executor,
+    run_parse_task,
+)
+from resume_editor.app.api.routes.route_logic.resume_structured_data import (
+    build_structured_data,
+    build_validated_structured_data,
 )
 from resume_editor.app.api.routes.route_logic.settings_crud import (
+    format_fallback_endpoints,
     get_user_settings,
+    parse_fallback_endpoints,
     update_user_settings,
 )
 from resume_editor.app.api.routes.route_models import SettingsUpdateForm
 from resume_editor.app.core.auth import get_current_user_from_cookie
 from resume_editor.app.core.config import Settings, get_settings
+from resume_editor.app.core.runtime_monitor import runtime_monitor
 from resume_editor.app.core.security import (
     authenticate_user,
     create_access_token,
@@ -42,6 +50,11 @@ from resume_editor.app.core.security import (
     verify_password,
 )
 from resume_editor.app.database.database import get_db
+from resume_editor.app.llm.circuit_breaker import llm_circuit_breakers
+from resume_editor.app.llm.concurrency_limiter import llm_concurrency_limiters
+from resume_editor.app.llm.rate_limiter import llm_rate_limiter
+from resume_editor.app.llm.request_hedging import llm_request_hedger
+from resume_editor.app.llm.role_refinement_cache import role_refinement_cache
 from resume_editor.app.models.user import User
 from resume_editor.app.schemas.user import (
     UserSettingsUpdateRequest,
@@ -350,6 +363,30 @@ def _handle_validation_error(
     )
 
 
+def _build_content_with_introduction(
+    resume_content: str,
+    introduction: str | None,
+) -> tuple[str, dict | None]:
+    """Reconstruct resume content with a new introduction and build its structured data.
+
+    Args:
+        resume_content (str): The current Markdown content of the resume.
+        introduction (str | None): The new introduction for the banner section.
+
+    Returns:
+        tuple[str, dict | None]: The reconstructed content and its structured data.
+
+    Notes:
+        1. Module-level so it can run through `run_parse_task`, off the event loop.
+
+    """
+    new_content = reconstruct_resume_with_new_introduction(
+        resume_content=resume_content,
+        introduction=introduction,
+    )
+    return new_content, build_structured_data(new_content)
+
+
 @router.post("/resumes/{resume_id}/view", response_class=HTMLResponse)
 async def handle_resume_view_update(
     request: Request,
@@ -375,7 +412,8 @@ async def handle_resume_view_update(
         1. Validate company and notes using validate_company_and_notes.
         2. If validation fails, return error HTML for HTMX requests
            or redirect for regular requests.
-        3. Reconstruct resume content with new introduction.
+        3. Reconstruct resume content with new introduction and build its structured
+           data on the parse executor.
         4. Update the resume with all provided fields.
         5. Redirect back to the view page.
 
@@ -395,9 +433,10 @@ async def handle_resume_view_update(
         return _handle_validation_error(params, error_message)
 
     # Reconstruct resume content with new introduction
-    new_content = reconstruct_resume_with_new_introduction(
-        resume_content=str(resume.content),
-        introduction=form_data.introduction,
+    new_content, structured_data = await run_parse_task(
+        _build_content_with_introduction,
+        str(resume.content),
+        form_data.introduction,
     )
 
     # Update the resume
@@ -406,6 +445,7 @@ async def handle_resume_view_update(
         notes=form_data.notes,
         company=form_data.company,
         content=new_content,
+        structured_data=structured_data,
     )
     update_resume(
         db=db,
@@ -451,7 +491,7 @@ async def handle_create_resume(
 ) -> RedirectResponse | HTMLResponse:
     """Handle the form submission for creating a new resume."""
     try:
-        validate_resume_content(content)
+        structured_data = await run_parse_task(build_validated_structured_data, content)
     except HTTPException as e:
         return templates.TemplateResponse(
             request,
@@ -469,6 +509,7 @@ async def handle_create_resume(
         user_id=current_user.id,
         name=name,
         content=content,
+        structured_data=structured_data,
     )
     resume = create_resume_db(
         db=db,
@@ -534,6 +575,9 @@ async def settings_page(
         "access_token_expire_minutes": user_settings.access_token_expire_minutes
         if user_settings
         else None,
+        "llm_fallback_endpoints": format_fallback_endpoints(
+            user_settings.llm_fallback_endpoints if user_settings else None,
+        ),
     }
     return templates.TemplateResponse(request, "settings.html", context=context)
 
@@ -558,7 +602,8 @@ async def update_settings(
     Notes:
         1. Depends on `get_current_user_from_cookie` for authentication.
         2. Validate the access_token_expire_minutes value if provided.
-        3. Construct a UserSettingsUpdateRequest object from form data.
+        3. Construct a UserSettingsUpdateRequest object from form data, parsing
+           the fallback endpoints one per line.
         4. Call update_user_settings to persist changes.
         5. Return an HTML snippet with a success or error message.
 
@@ -585,14 +630,16 @@ async def update_settings(
                 content=f'<div class="p-4 mb-4 text-sm text-red-800 rounded-lg bg-red-50" role="alert"><span class="font-medium">Error!</span> {_msg}</div>',
             )
 
-    settings_data = UserSettingsUpdateRequest(
-        llm_endpoint=form_data.llm_endpoint,
-        llm_model_name=form_data.llm_model_name,
-        api_key=form_data.api_key,
-        access_token_expire_minutes=timeout_minutes,
-    )
-
     try:
+        settings_data = UserSettingsUpdateRequest(
+            llm_endpoint=form_data.llm_endpoint,
+            llm_model_name=form_data.llm_model_name,
+            api_key=form_data.api_key,
+            access_token_expire_minutes=timeout_minutes,
+            llm_fallback_endpoints=parse_fallback_endpoints(
+                form_data.llm_fallback_endpoints,
+            ),
+        )
         update_user_settings(
             db=db,
             user_id=current_user.id,
@@ -677,3 +724,137 @@ async def health_check() -> dict[str, str]:
     _msg = "Health check endpoint called"
     log.debug(_msg)
     return {"status": "ok"}
+
+
+@router.get("/health/parse-executor")
+async def parse_executor_health() -> dict[str, str | int | float]:
+    """Report queue depth and wait time metrics of the resume parsing worker pool.
+
+    Args:
+        None
+
+    Returns:
+        dict[str, str | int | float]: The fields of the current `ParseExecutorStats`.
+
+    Notes:
+        1. Return a snapshot of the parse executor counters.
+        2. No database or network access required.
+
+    """
+    return asdict(resume_parse_executor.stats())
+
+
+@router.get("/health/role-refinement-cache")
+async def role_refinement_cache_health() -> dict[str, int | float]:
+    """Report hit-rate metrics of the refined role cache.
+
+    Args:
+        None
+
+    Returns:
+        dict[str, int | float]: The fields of the current `RoleRefinementCacheStats`.
+
+    Notes:
+        1. Return a snapshot of the role refinement cache counters.
+        2. No database or network access required.
+
+    """
+    return asdict(role_refinement_cache.stats())
+
+
+@router.get("/health/llm-concurrency")
+async def llm_concurrency_health() -> list[dict[str, str | int | float | None]]:
+    """Report the adaptive concurrency limit of each LLM endpoint.
+
+    Args:
+        None
+
+    Returns:
+        list[dict[str, str | int | float | None]]: The fields of each endpoint's
+            current `ConcurrencyLimiterStats`.
+
+    Notes:
+        1. Return a snapshot of every endpoint's limit, load and latency estimates.
+        2. Endpoints are identified by `endpoint_label`, not by URL, since this
+           route needs no login.
+        3. No database or network access required.
+
+    """
+    return [asdict(stats) for stats in llm_concurrency_limiters.stats()]
+
+
+@router.get("/health/llm-rate-limit")
+async def llm_rate_limit_health() -> dict[str, str | int | float]:
+    """Report the shared LLM rate limits and how often requests waited for them.
+
+    Args:
+        None
+
+    Returns:
+        dict[str, str | int | float]: The fields of the current `RateLimiterStats`.
+
+    Notes:
+        1. Return a snapshot of the configured budgets and this worker's waits.
+        2. No database or network access required.
+
+    """
+    return asdict(llm_rate_limiter.stats())
+
+
+@router.get("/health/llm-hedging")
+async def llm_hedging_health() -> dict[str, bool | int | float]:
+    """Report how often slow LLM requests were hedged and how often the hedge won.
+
+    Args:
+        None
+
+    Returns:
+        dict[str, bool | int | float]: The fields of the current `RequestHedgerStats`.
+
+    Notes:
+        1. Return a snapshot of the hedging settings and this worker's counters.
+        2. No database or network access required.
+
+    """
+    return asdict(llm_request_hedger.stats())
+
+
+@router.get("/health/llm-circuit-breakers")
+async def llm_circuit_breakers_health() -> list[dict[str, str | int | float | None]]:
+    """Report the circuit breaker state of each LLM endpoint.
+
+    Args:
+        None
+
+    Returns:
+        list[dict[str, str | int | float | None]]: The fields of each endpoint's
+            current `CircuitBreakerStats`.
+
+    Notes:
+        1. Return a snapshot of every endpoint's circuit state, recent failure and
+           slow-call rates, and how often calls were routed away from it.
+        2. Endpoints are identified by `endpoint_label`, not by URL, since this
+           route needs no login.
+        3. No database or network access required.
+
+    """
+    return [asdict(stats) for stats in llm_circuit_breakers.stats()]
+
+
+@router.get("/health/runtime")
+async def runtime_health() -> dict[str, bool | int | float | None]:
+    """Report this worker's event-loop lag and memory use.
+
+    Args:
+        None
+
+    Returns:
+        dict[str, bool | int | float | None]: The fields of the current `RuntimeStats`.
+
+    Notes:
+        1. Return a snapshot of the lag samples, RSS and peak RSS of the worker
+           that served the request; `pid` tells workers apart.
+        2. No database or network access required.
+
+    """
+    return asdict(runtime_monitor.stats())
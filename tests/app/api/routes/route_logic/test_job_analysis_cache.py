@@ -0,0 +1,158 @@
+"""Tests for job_analysis_cache module."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from resume_editor.app.api.routes.route_logic.job_analysis_cache import (
+    JobAnalysisCache,
+    get_job_analysis_cache,
+    job_analysis_cache_key,
+)
+from resume_editor.app.llm.models import JobAnalysis
+from resume_editor.app.models import Base
+from resume_editor.app.models.job_analysis_cache import JobAnalysisCacheEntry
+
+ANALYSIS = JobAnalysis(
+    key_skills=["python"],
+    primary_duties=["build things"],
+    themes=["ownership"],
+    company_name="Acme",
+)
+
+
+@pytest.fixture
+def session_factory():
+    """Provide a session factory on an in-memory SQLite database.
+
+    The cache opens its sessions on worker threads, so every session shares one
+    connection that may be used from any thread.
+    """
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.drop_all(bind=engine)
+
+
+def _key(job_description: str = "Senior Python role", model: str | None = "m"):
+    return job_analysis_cache_key(job_description, "# Resume", model)
+
+
+def test_cache_key_normalizes_whitespace_and_separates_models():
+    """Test that whitespace-only edits share a key but other inputs do not."""
+    assert _key("Senior  Python\n role ") == _key("Senior Python role")
+    assert _key(model="m") != _key(model="other")
+    assert _key(model=None).model_name == "gpt-4o"
+    assert job_analysis_cache_key("jd", "a", "m") != job_analysis_cache_key(
+        "jd", "b", "m"
+    )
+
+
+async def test_put_then_get_round_trips_analysis(session_factory):
+    """Test that a stored analysis is returned for the same key."""
+    cache = JobAnalysisCache(session_factory, ttl_seconds=3600, max_entries=10)
+
+    assert await cache.get(_key()) is None
+    await cache.put(_key(), ANALYSIS)
+
+    assert await cache.get(_key()) == ANALYSIS
+    assert await cache.get(_key(model="other")) is None
+
+
+async def test_bypass_misses_but_still_stores(session_factory):
+    """Test that a bypassed cache always misses but refreshes the stored entry."""
+    bypassed = JobAnalysisCache(
+        session_factory, ttl_seconds=3600, max_entries=10, bypass=True
+    )
+    await bypassed.put(_key(), ANALYSIS)
+
+    assert await bypassed.get(_key()) is None
+    cache = JobAnalysisCache(session_factory, ttl_seconds=3600, max_entries=10)
+    assert await cache.get(_key()) == ANALYSIS
+
+
+async def test_expired_entry_is_deleted(session_factory):
+    """Test that an entry older than the TTL misses and is removed."""
+    cache = JobAnalysisCache(session_factory, ttl_seconds=60, max_entries=10)
+    await cache.put(_key(), ANALYSIS)
+    db = session_factory()
+    entry = db.query(JobAnalysisCacheEntry).one()
+    entry.created_at = datetime.now(timezone.utc) - timedelta(minutes=5)
+    db.commit()
+
+    assert await cache.get(_key()) is None
+    assert db.query(JobAnalysisCacheEntry).count() == 0
+    db.close()
+
+
+async def test_put_evicts_least_recently_used_over_cap(session_factory):
+    """Test that writes prune the least recently used entries above the cap."""
+    cache = JobAnalysisCache(session_factory, ttl_seconds=3600, max_entries=2)
+    await cache.put(_key("first"), ANALYSIS)
+    await cache.put(_key("second"), ANALYSIS)
+    assert await cache.get(_key("first")) == ANALYSIS
+
+    await cache.put(_key("third"), ANALYSIS)
+
+    db = session_factory()
+    assert db.query(JobAnalysisCacheEntry).count() == 2
+    db.close()
+    assert await cache.get(_key("second")) is None
+    assert await cache.get(_key("first")) == ANALYSIS
+
+
+async def test_database_errors_are_swallowed():
+    """Test that cache failures roll back, close their sessions, and never raise."""
+    db = MagicMock()
+    db.query.side_effect = RuntimeError("db down")
+    cache = JobAnalysisCache(lambda: db, ttl_seconds=3600, max_entries=10)
+
+    assert await cache.get(_key()) is None
+    await cache.put(_key(), ANALYSIS)
+
+    assert db.rollback.call_count == 2
+    assert db.close.call_count == 2
+
+
+def test_get_job_analysis_cache_follows_settings():
+    """Test that the cache is built from settings and disabled on request."""
+    settings = MagicMock(
+        job_analysis_cache_enabled=True,
+        job_analysis_cache_ttl_seconds=10,
+        job_analysis_cache_max_entries=5,
+    )
+    session_factory = MagicMock()
+    with (
+        patch(
+            "resume_editor.app.api.routes.route_logic.job_analysis_cache.get_settings",
+            return_value=settings,
+        ),
+        patch(
+            "resume_editor.app.api.routes.route_logic.job_analysis_cache.get_session_local",
+            return_value=session_factory,
+        ),
+    ):
+        cache = get_job_analysis_cache(bypass=True)
+        settings.job_analysis_cache_enabled = False
+        disabled = get_job_analysis_cache()
+
+    assert (
+        cache.session_factory,
+        cache.ttl_seconds,
+        cache.max_entries,
+        cache.bypass,
+    ) == (
+        session_factory,
+        10,
+        5,
+        True,
+    )
+    assert disabled is None
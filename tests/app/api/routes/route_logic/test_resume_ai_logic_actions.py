@@ -19,6 +19,9 @@ from resume_editor.app.models.resume_model import (
 )
 
 
+@patch(
+    "resume_editor.app.api.routes.route_logic.resume_ai_logic_helpers.build_structured_data"
+)
 @patch(
     "resume_editor.app.api.routes.route_logic.resume_ai_logic_helpers.create_resume_db"
 )
@@ -28,6 +31,7 @@ from resume_editor.app.models.resume_model import (
 def test_handle_save_as_new_refinement_success(
     mock_validate,
     mock_create,
+    mock_build_structured,
     test_user,
     test_resume,
 ):
@@ -58,6 +62,8 @@ def test_handle_save_as_new_refinement_success(
     )
     new_resume = DatabaseResume(data=resume_data)
     mock_create.return_value = new_resume
+    structured_data = {"content_hash": "hash", "sections": {}}
+    mock_build_structured.return_value = structured_data
 
     # Act
     result = handle_save_as_new_refinement(params)
@@ -75,7 +81,9 @@ def test_handle_save_as_new_refinement_success(
         introduction=context.introduction,
         company="Test Company",
         notes="Test Notes",
+        structured_data=structured_data,
     )
+    mock_build_structured.assert_called_once_with(form_data.refined_content)
     mock_create.assert_called_once_with(db=db, params=expected_create_params)
 
 
@@ -1,6 +1,6 @@
 import logging
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -73,19 +73,20 @@ class TestStreamFinalEventsWithRunningLog:
     """Tests for _stream_final_events with running_log parameter."""
 
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.generate_banner_from_running_log"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.async_generate_banner_from_running_log",
+        new_callable=AsyncMock,
     )
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming._reconstruct_refined_resume_content"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events._reconstruct_refined_resume_content"
     )
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.extract_banner_text"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.extract_banner_text"
     )
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.reconstruct_resume_with_new_introduction"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.reconstruct_resume_with_new_introduction"
     )
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.process_refined_experience_result"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.process_refined_experience_result"
     )
     async def test_uses_banner_from_running_log_when_available(
         self,
@@ -112,6 +113,7 @@ class TestStreamFinalEventsWithRunningLog:
         mock_params.resume_content_to_refine = "# To Refine"
         mock_params.job_description = "Job description"
         mock_params.limit_refinement_years = None
+        mock_params.token_usage = None
 
         refined_roles = {0: {"basics": {"company": "Tech Corp", "title": "Engineer"}}}
 
@@ -134,22 +136,24 @@ class TestStreamFinalEventsWithRunningLog:
         assert call_kwargs["llm_config"] == llm_config_fixture
 
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.generate_introduction_from_resume"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.async_generate_introduction_from_resume",
+        new_callable=AsyncMock,
     )
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.generate_banner_from_running_log"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.async_generate_banner_from_running_log",
+        new_callable=AsyncMock,
     )
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming._reconstruct_refined_resume_content"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events._reconstruct_refined_resume_content"
     )
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.extract_banner_text"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.extract_banner_text"
     )
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.reconstruct_resume_with_new_introduction"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.reconstruct_resume_with_new_introduction"
     )
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.process_refined_experience_result"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.process_refined_experience_result"
     )
     async def test_falls_back_to_legacy_when_banner_generation_fails(
         self,
@@ -178,6 +182,7 @@ class TestStreamFinalEventsWithRunningLog:
         mock_params.resume_content_to_refine = "# To Refine"
         mock_params.job_description = "Job description"
         mock_params.limit_refinement_years = None
+        mock_params.token_usage = None
 
         refined_roles = {0: {"basics": {"company": "Tech Corp", "title": "Engineer"}}}
 
@@ -196,19 +201,20 @@ class TestStreamFinalEventsWithRunningLog:
         mock_generate_intro.assert_called_once()
 
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.generate_introduction_from_resume"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.async_generate_introduction_from_resume",
+        new_callable=AsyncMock,
     )
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming._reconstruct_refined_resume_content"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events._reconstruct_refined_resume_content"
     )
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.extract_banner_text"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.extract_banner_text"
     )
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.reconstruct_resume_with_new_introduction"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.reconstruct_resume_with_new_introduction"
     )
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.process_refined_experience_result"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.process_refined_experience_result"
     )
     async def test_uses_legacy_when_no_running_log(
         self,
@@ -234,6 +240,7 @@ class TestStreamFinalEventsWithRunningLog:
         mock_params.resume_content_to_refine = "# To Refine"
         mock_params.job_description = "Job description"
         mock_params.limit_refinement_years = None
+        mock_params.token_usage = None
 
         refined_roles = {0: {"basics": {"company": "Tech Corp", "title": "Engineer"}}}
 
@@ -252,22 +259,24 @@ class TestStreamFinalEventsWithRunningLog:
         # Banner generation from running log should not be called
 
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.generate_introduction_from_resume"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.async_generate_introduction_from_resume",
+        new_callable=AsyncMock,
     )
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.generate_banner_from_running_log"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.async_generate_banner_from_running_log",
+        new_callable=AsyncMock,
     )
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming._reconstruct_refined_resume_content"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events._reconstruct_refined_resume_content"
     )
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.extract_banner_text"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.extract_banner_text"
     )
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.reconstruct_resume_with_new_introduction"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.reconstruct_resume_with_new_introduction"
     )
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.process_refined_experience_result"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.process_refined_experience_result"
     )
     async def test_running_log_without_refined_roles_uses_legacy(
         self,
@@ -299,6 +308,7 @@ class TestStreamFinalEventsWithRunningLog:
         mock_params.resume_content_to_refine = "# To Refine"
         mock_params.job_description = "Job description"
         mock_params.limit_refinement_years = None
+        mock_params.token_usage = None
 
         refined_roles = {}
 
@@ -319,22 +329,24 @@ class TestStreamFinalEventsWithRunningLog:
         mock_generate_intro.assert_called_once()
 
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.generate_introduction_from_resume"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.async_generate_introduction_from_resume",
+        new_callable=AsyncMock,
     )
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.generate_banner_from_running_log"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.async_generate_banner_from_running_log",
+        new_callable=AsyncMock,
     )
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming._reconstruct_refined_resume_content"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events._reconstruct_refined_resume_content"
     )
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.extract_banner_text"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.extract_banner_text"
     )
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.reconstruct_resume_with_new_introduction"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.reconstruct_resume_with_new_introduction"
     )
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.process_refined_experience_result"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.process_refined_experience_result"
     )
     async def test_falls_back_to_legacy_when_banner_generation_raises_exception(
         self,
@@ -363,6 +375,7 @@ class TestStreamFinalEventsWithRunningLog:
         mock_params.resume_content_to_refine = "# To Refine"
         mock_params.job_description = "Job description"
         mock_params.limit_refinement_years = None
+        mock_params.token_usage = None
 
         refined_roles = {0: {"basics": {"company": "Tech Corp", "title": "Engineer"}}}
 
@@ -386,25 +399,26 @@ class TestStreamFinalEventsBannerIntegration:
     """Integration-style tests for banner generation in _stream_final_events."""
 
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.generate_banner_from_running_log"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.async_generate_banner_from_running_log",
+        new_callable=AsyncMock,
     )
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming._reconstruct_refined_resume_content"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events._reconstruct_refined_resume_content"
     )
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.extract_banner_text"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.extract_banner_text"
     )
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.reconstruct_resume_with_new_introduction"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.reconstruct_resume_with_new_introduction"
     )
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.process_refined_experience_result"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.process_refined_experience_result"
     )
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.create_sse_done_message"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.create_sse_done_message"
     )
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.create_sse_progress_message"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.create_sse_progress_message"
     )
     async def test_yields_progress_message(
         self,
@@ -435,6 +449,7 @@ class TestStreamFinalEventsBannerIntegration:
         mock_params.resume_content_to_refine = "# To Refine"
         mock_params.job_description = "Job description"
         mock_params.limit_refinement_years = None
+        mock_params.token_usage = None
 
         refined_roles = {0: {"basics": {"company": "Tech Corp", "title": "Engineer"}}}
 
@@ -490,7 +490,7 @@ async def test_experience_refinement_sse_generator_passes_running_log_to_stream(
     mock_get_llm_config,
     mock_log_manager,
 ):
-    """Test that the running_log is passed to _stream_llm_events."""
+    """Test that the running_log and one shared retry budget are passed on."""
     mock_get_llm_config.return_value = (None, None, None)
 
     now = datetime.now()
@@ -544,6 +544,8 @@ async def test_experience_refinement_sse_generator_passes_running_log_to_stream(
         mock_stream.assert_called_once()
         call_kwargs = mock_stream.call_args.kwargs
         assert call_kwargs.get("running_log") == running_log
+        assert call_kwargs["retry_budget"] is not None
+        assert mock_final.call_args.kwargs["retry_budget"] is call_kwargs["retry_budget"]
 
 
 @pytest.mark.asyncio
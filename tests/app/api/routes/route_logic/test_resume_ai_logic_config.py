@@ -4,7 +4,13 @@ import pytest
 from cryptography.fernet import InvalidToken
 
 from resume_editor.app.api.routes.route_logic.resume_ai_logic import get_llm_config
-from resume_editor.app.models.user_settings import UserSettings
+from resume_editor.app.api.routes.route_logic.resume_ai_logic_helpers import (
+    get_llm_fallbacks,
+)
+from resume_editor.app.models.user_settings import (
+    UserSettings,
+    UserSettingsData,
+)
 
 
 @patch("resume_editor.app.api.routes.route_logic.resume_ai_logic_helpers.decrypt_data")
@@ -15,10 +21,12 @@ def test_get_llm_config_with_key(mock_get_user_settings, mock_decrypt_data):
     mock_db = MagicMock()
     user_id = 1
     mock_settings = UserSettings(
-        user_id=user_id,
-        llm_endpoint="http://example.com",
-        llm_model_name="test-model",
-        encrypted_api_key="encrypted_key",
+        data=UserSettingsData(
+            user_id=user_id,
+            llm_endpoint="http://example.com",
+            llm_model_name="test-model",
+            encrypted_api_key="encrypted_key",
+        ),
     )
     mock_get_user_settings.return_value = mock_settings
     mock_decrypt_data.return_value = "decrypted_key"
@@ -42,10 +50,12 @@ def test_get_llm_config_no_key(mock_get_user_settings, mock_decrypt_data):
     mock_db = MagicMock()
     user_id = 1
     mock_settings = UserSettings(
-        user_id=user_id,
-        llm_endpoint="http://example.com",
-        llm_model_name="test-model",
-        encrypted_api_key=None,
+        data=UserSettingsData(
+            user_id=user_id,
+            llm_endpoint="http://example.com",
+            llm_model_name="test-model",
+            encrypted_api_key=None,
+        ),
     )
     mock_get_user_settings.return_value = mock_settings
 
@@ -86,7 +96,9 @@ def test_get_llm_config_decryption_error(mock_get_user_settings, mock_decrypt_da
     mock_db = MagicMock()
     user_id = 1
     mock_settings = UserSettings(
-        user_id=user_id, encrypted_api_key="bad_encrypted_key"
+        data=UserSettingsData(
+            user_id=user_id, encrypted_api_key="bad_encrypted_key"
+        ),
     )
     mock_get_user_settings.return_value = mock_settings
     mock_decrypt_data.side_effect = InvalidToken
@@ -95,3 +107,46 @@ def test_get_llm_config_decryption_error(mock_get_user_settings, mock_decrypt_da
     with pytest.raises(InvalidToken):
         get_llm_config(mock_db, user_id)
     mock_decrypt_data.assert_called_once_with("bad_encrypted_key")
+
+
+@patch("resume_editor.app.api.routes.route_logic.resume_ai_logic_helpers.decrypt_data")
+@patch("resume_editor.app.api.routes.route_logic.resume_ai_logic_helpers.get_user_settings")
+def test_get_llm_fallbacks(mock_get_user_settings, mock_decrypt_data):
+    """Test get_llm_fallbacks returns the stored endpoints in order, with their own keys."""
+    # Arrange
+    mock_db = MagicMock()
+    mock_get_user_settings.return_value = UserSettings(
+        data=UserSettingsData(
+            user_id=1,
+            llm_fallback_endpoints=[
+                {
+                    "llm_endpoint": "http://backup/v1",
+                    "llm_model_name": "small",
+                    "encrypted_api_key": "encrypted_key",
+                },
+                {"llm_endpoint": "http://spare/v1", "llm_model_name": None},
+            ],
+        ),
+    )
+    mock_decrypt_data.return_value = "backup_key"
+
+    # Act
+    fallbacks = get_llm_fallbacks(mock_db, 1)
+
+    # Assert
+    assert [(f.llm_endpoint, f.llm_model_name, f.api_key) for f in fallbacks] == [
+        ("http://backup/v1", "small", "backup_key"),
+        ("http://spare/v1", None, None),
+    ]
+    mock_get_user_settings.assert_called_once_with(mock_db, 1)
+    mock_decrypt_data.assert_called_once_with("encrypted_key")
+
+
+@patch("resume_editor.app.api.routes.route_logic.resume_ai_logic_helpers.get_user_settings")
+def test_get_llm_fallbacks_none(mock_get_user_settings):
+    """Test get_llm_fallbacks is empty without settings or fallbacks."""
+    mock_get_user_settings.return_value = None
+    assert get_llm_fallbacks(MagicMock(), 1) == []
+
+    mock_get_user_settings.return_value = UserSettings(data=UserSettingsData(user_id=1))
+    assert get_llm_fallbacks(MagicMock(), 1) == []
@@ -0,0 +1,447 @@
+"""Tests for the final events of a streamed resume AI refinement."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events import (
+    _generate_introduction_with_fallback,
+    _stream_final_events,
+)
+from resume_editor.app.api.routes.route_logic.resume_ai_logic_params import (
+    IntroductionGenerationParams,
+)
+from resume_editor.app.llm.models import (
+    JobAnalysis,
+    LLMConfig,
+    RefinedRoleRecord,
+    RunningLog,
+)
+from resume_editor.app.llm.retry_policy import RetryBudget
+from resume_editor.app.llm.token_usage import TokenUsage, TokenUsageLedger
+
+
+def create_test_running_log(**kwargs):
+    """Create a RunningLog with default required fields."""
+    defaults = {
+        "resume_id": 1,
+        "user_id": 1,
+        "job_description": "Test job description",
+        "created_at": datetime.now(),
+        "updated_at": datetime.now(),
+        "refined_roles": [],
+    }
+    defaults.update(kwargs)
+    return RunningLog(**defaults)
+
+
+class TestGenerateIntroductionWithFallback:
+    """Tests for _generate_introduction_with_fallback function."""
+
+    @pytest.mark.asyncio
+    @patch(
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.async_generate_banner_from_running_log",
+        new_callable=AsyncMock,
+    )
+    async def test_uses_running_log_banner(self, mock_generate_banner):
+        """Test using banner from running log."""
+        mock_generate_banner.return_value = "Generated banner"
+        resume_content = "test content"
+        job_description = "test job"
+        llm_config = LLMConfig()
+        original_banner = "original"
+        now = datetime.now()
+        refined_role = RefinedRoleRecord(
+            original_index=0,
+            company="Test Corp",
+            title="Engineer",
+            refined_description="",
+            relevant_skills=[],
+            start_date=now,
+            end_date=None,
+            timestamp=now,
+        )
+        running_log = create_test_running_log(refined_roles=[refined_role])
+
+        result = await _generate_introduction_with_fallback(
+            IntroductionGenerationParams(
+                resume_content, job_description, llm_config, original_banner, running_log
+            )
+        )
+
+        assert result == "Generated banner"
+        mock_generate_banner.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch(
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.async_generate_introduction_from_resume",
+        new_callable=AsyncMock,
+    )
+    @patch(
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.async_generate_banner_from_running_log",
+        new_callable=AsyncMock,
+    )
+    async def test_falls_back_to_legacy(
+        self, mock_generate_banner, mock_generate_intro
+    ):
+        """Test falling back to legacy introduction generation."""
+        mock_generate_banner.return_value = None
+        mock_generate_intro.return_value = "Legacy intro"
+        resume_content = "test content"
+        job_description = "test job"
+        llm_config = LLMConfig()
+        original_banner = "original"
+
+        result = await _generate_introduction_with_fallback(
+            IntroductionGenerationParams(
+                resume_content, job_description, llm_config, original_banner
+            )
+        )
+
+        assert result == "Legacy intro"
+        mock_generate_intro.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch(
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.async_generate_introduction_from_resume",
+        new_callable=AsyncMock,
+    )
+    async def test_legacy_reuses_job_analysis(self, mock_generate_intro):
+        """Test the session's job analysis is passed to the legacy pipeline."""
+        mock_generate_intro.return_value = "Legacy intro"
+        job_analysis = JobAnalysis(
+            key_skills=["python"], primary_duties=["build"], themes=[]
+        )
+
+        result = await _generate_introduction_with_fallback(
+            IntroductionGenerationParams(
+                "test content",
+                "test job",
+                LLMConfig(),
+                "original",
+                job_analysis=job_analysis,
+            )
+        )
+
+        assert result == "Legacy intro"
+        assert mock_generate_intro.call_args.kwargs["job_analysis"] is job_analysis
+
+    @pytest.mark.asyncio
+    @patch("resume_editor.app.llm.retry_policy.asyncio.sleep", new_callable=AsyncMock)
+    @patch(
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.async_generate_introduction_from_resume",
+        new_callable=AsyncMock,
+    )
+    @patch(
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.async_generate_banner_from_running_log",
+        new_callable=AsyncMock,
+    )
+    async def test_retries_on_failure(
+        self, mock_generate_banner, mock_generate_intro, mock_sleep
+    ):
+        """Test that a transient failure is retried by the retry policy."""
+        mock_generate_banner.return_value = None
+        mock_generate_intro.side_effect = [TimeoutError("Fail"), "Success"]
+        resume_content = "test content"
+        job_description = "test job"
+        llm_config = LLMConfig()
+        original_banner = "original"
+
+        result = await _generate_introduction_with_fallback(
+            IntroductionGenerationParams(
+                resume_content, job_description, llm_config, original_banner
+            )
+        )
+
+        assert result == "Success"
+        assert mock_generate_intro.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch(
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.async_generate_introduction_from_resume",
+        new_callable=AsyncMock,
+    )
+    @patch(
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.async_generate_banner_from_running_log",
+        new_callable=AsyncMock,
+    )
+    async def test_empty_string_is_not_retried(
+        self, mock_generate_banner, mock_generate_intro
+    ):
+        """Test that an empty introduction falls back to the default without a retry."""
+        mock_generate_banner.return_value = None
+        mock_generate_intro.side_effect = ["   ", "Success"]
+        resume_content = "test content"
+        job_description = "test job"
+        llm_config = LLMConfig()
+        original_banner = "original"
+
+        result = await _generate_introduction_with_fallback(
+            IntroductionGenerationParams(
+                resume_content, job_description, llm_config, original_banner
+            )
+        )
+
+        assert "Professional summary tailored" in result
+        assert mock_generate_intro.call_count == 1
+
+    @pytest.mark.asyncio
+    @patch("resume_editor.app.llm.retry_policy.asyncio.sleep", new_callable=AsyncMock)
+    @patch(
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.async_generate_introduction_from_resume",
+        new_callable=AsyncMock,
+    )
+    @pytest.mark.parametrize(
+        ("error", "retry_budget"),
+        [(ValueError("bad request"), None), (TimeoutError("slow"), RetryBudget(0))],
+    )
+    async def test_no_retry_without_transient_error_or_budget(
+        self, mock_generate_intro, mock_sleep, error, retry_budget
+    ):
+        """Test that permanent errors and an exhausted session budget are not retried."""
+        mock_generate_intro.side_effect = [error, "Success"]
+
+        result = await _generate_introduction_with_fallback(
+            IntroductionGenerationParams(
+                "test content",
+                "test job",
+                LLMConfig(),
+                "original",
+                retry_budget=retry_budget,
+            )
+        )
+
+        assert "Professional summary tailored" in result
+        assert mock_generate_intro.call_count == 1
+        mock_sleep.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    @patch("resume_editor.app.llm.retry_policy.asyncio.sleep", new_callable=AsyncMock)
+    @patch(
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.async_generate_introduction_from_resume",
+        new_callable=AsyncMock,
+    )
+    @patch(
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.async_generate_banner_from_running_log",
+        new_callable=AsyncMock,
+    )
+    async def test_default_on_total_failure(
+        self, mock_generate_banner, mock_generate_intro, mock_sleep
+    ):
+        """Test default intro when all retries fail."""
+        mock_generate_banner.return_value = None
+        mock_generate_intro.side_effect = [
+            TimeoutError("Fail 1"),
+            TimeoutError("Fail 2"),
+            TimeoutError("Fail 3"),
+        ]
+        resume_content = "test content"
+        job_description = "test job"
+        llm_config = LLMConfig()
+        original_banner = "original"
+
+        result = await _generate_introduction_with_fallback(
+            IntroductionGenerationParams(
+                resume_content, job_description, llm_config, original_banner
+            )
+        )
+
+        assert "Professional summary tailored" in result
+        assert mock_generate_intro.call_count == 3
+
+
+class TestStreamFinalEvents:
+    """Tests for _stream_final_events function."""
+
+    @pytest.mark.asyncio
+    @patch(
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.reconstruct_resume_with_new_introduction"
+    )
+    @patch(
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events._generate_introduction_with_fallback"
+    )
+    @patch(
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events._reconstruct_refined_resume_content"
+    )
+    @patch(
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.extract_banner_text"
+    )
+    async def test_yields_intro_progress(
+        self,
+        mock_extract_banner,
+        mock_reconstruct_content,
+        mock_generate_intro,
+        mock_reconstruct_final,
+    ):
+        """Test that intro generation progress is yielded."""
+        mock_extract_banner.return_value = "original"
+        mock_reconstruct_content.return_value = "content"
+        mock_generate_intro.return_value = "intro"
+        mock_reconstruct_final.return_value = "final"
+
+        params = Mock()
+        params.resume.id = 1
+        params.original_resume_content = "original"
+        params.resume_content_to_refine = "content"
+        params.job_description = "job"
+        params.limit_refinement_years = None
+        params.token_usage = None
+        params.company = None
+        params.notes = None
+        llm_config = LLMConfig()
+        refined_roles = {}
+
+        results = []
+        async for msg in _stream_final_events(refined_roles, params, llm_config, None):
+            results.append(msg)
+
+        # First message should be intro progress
+        assert any("Generating AI introduction" in msg for msg in results)
+
+    @pytest.mark.asyncio
+    @patch(
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.reconstruct_resume_with_new_introduction"
+    )
+    @patch(
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events._generate_introduction_with_fallback"
+    )
+    @patch(
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events._reconstruct_refined_resume_content"
+    )
+    @patch(
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.extract_banner_text"
+    )
+    @patch(
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.process_refined_experience_result"
+    )
+    async def test_yields_done_event(
+        self,
+        mock_process_result,
+        mock_extract_banner,
+        mock_reconstruct_content,
+        mock_generate_intro,
+        mock_reconstruct_final,
+    ):
+        """Test that done event is yielded."""
+        mock_extract_banner.return_value = "original"
+        mock_reconstruct_content.return_value = "content"
+        mock_generate_intro.return_value = "intro"
+        mock_reconstruct_final.return_value = "final"
+        mock_process_result.return_value = "<html>result</html>"
+
+        params = Mock()
+        params.resume.id = 1
+        params.original_resume_content = "original"
+        params.resume_content_to_refine = "content"
+        params.job_description = "job"
+        params.limit_refinement_years = None
+        params.token_usage = None
+        llm_config = LLMConfig()
+        refined_roles = {0: {"basics": {"company": "Test"}}}
+
+        results = []
+        async for msg in _stream_final_events(refined_roles, params, llm_config, None):
+            results.append(msg)
+
+        assert any("event: done" in msg for msg in results)
+        assert any("<html>result</html>" in msg for msg in results)
+
+    @pytest.mark.asyncio
+    @patch(
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.reconstruct_resume_with_new_introduction"
+    )
+    @patch(
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events._generate_introduction_with_fallback"
+    )
+    @patch(
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events._reconstruct_refined_resume_content"
+    )
+    @patch(
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.extract_banner_text"
+    )
+    @patch(
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.process_refined_experience_result"
+    )
+    async def test_yields_metrics_before_done(
+        self,
+        mock_process_result,
+        mock_extract_banner,
+        mock_reconstruct_content,
+        mock_generate_intro,
+        mock_reconstruct_final,
+    ):
+        """Test that the token usage is sent before done, which clients close on."""
+        mock_extract_banner.return_value = "original"
+        mock_reconstruct_content.return_value = "content"
+        mock_generate_intro.return_value = "intro"
+        mock_reconstruct_final.return_value = "final"
+        mock_process_result.return_value = "<html>result</html>"
+        token_usage = TokenUsageLedger()
+        token_usage.record(
+            "role_refine",
+            TokenUsage(calls=1, prompt_tokens=90, completion_tokens=10),
+        )
+
+        params = Mock()
+        params.resume.id = 1
+        params.limit_refinement_years = None
+        params.token_usage = token_usage
+        results = [
+            msg
+            async for msg in _stream_final_events(
+                {0: {"basics": {"company": "Test"}}},
+                params,
+                LLMConfig(),
+                None,
+            )
+        ]
+
+        assert "event: metrics" in results[-2]
+        assert '"role_refine": {"calls": 1, "prompt_tokens": 90' in results[-2]
+        assert "event: done" in results[-1]
+
+    @pytest.mark.asyncio
+    @patch(
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.reconstruct_resume_with_new_introduction"
+    )
+    @patch(
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events._generate_introduction_with_fallback"
+    )
+    @patch(
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events._reconstruct_refined_resume_content"
+    )
+    @patch(
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.extract_banner_text"
+    )
+    async def test_warning_on_no_roles(
+        self,
+        mock_extract_banner,
+        mock_reconstruct_content,
+        mock_generate_intro,
+        mock_reconstruct_final,
+    ):
+        """Test warning when no roles refined."""
+        mock_extract_banner.return_value = "original"
+        mock_reconstruct_content.return_value = "content"
+        mock_generate_intro.return_value = "intro"
+        mock_reconstruct_final.return_value = "final"
+
+        params = Mock()
+        params.resume.id = 1
+        params.original_resume_content = "original"
+        params.resume_content_to_refine = "content"
+        params.job_description = "job"
+        params.limit_refinement_years = None
+        params.token_usage = None
+        params.company = None
+        params.notes = None
+        llm_config = LLMConfig()
+        refined_roles = {}  # No roles
+
+        results = []
+        async for msg in _stream_final_events(refined_roles, params, llm_config, None):
+            results.append(msg)
+
+        # Should yield warning
+        assert any("no roles were found to refine" in msg for msg in results)
@@ -68,7 +68,7 @@ def test_process_refined_experience_result(
 
 
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_ai_logic_reconstruction.serialize_experience_to_markdown"
+    "resume_editor.app.api.routes.route_logic.resume_ai_logic_reconstruction.iter_experience_markdown"
 )
 @patch(
     "resume_editor.app.api.routes.route_logic.resume_ai_logic_reconstruction._extract_raw_section"
@@ -157,7 +157,7 @@ Company: Old Co
     ).model_dump()
     refined_roles = {0: refined_role_data}  # Index 0 of the filtered list
 
-    mock_serialize_experience.return_value = "serialized experience"
+    mock_serialize_experience.return_value = iter(["serialized experience"])
 
     # Act
     params = ProcessExperienceResultParams(
@@ -200,7 +200,7 @@ Company: Old Co
 
 
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_ai_logic_reconstruction.serialize_experience_to_markdown"
+    "resume_editor.app.api.routes.route_logic.resume_ai_logic_reconstruction.iter_experience_markdown"
 )
 @patch(
     "resume_editor.app.api.routes.route_logic.resume_ai_logic_extraction._extract_raw_section"
@@ -250,7 +250,7 @@ def test_reconstruct_refined_resume_content_out_of_bounds_index(
     )
     refined_roles_from_llm = {1: refined_role_llm.model_dump(mode="json")}
 
-    mock_serialize_experience.return_value = "serialized experience"
+    mock_serialize_experience.return_value = iter(["serialized experience"])
 
     # Act
     params = ProcessExperienceResultParams(
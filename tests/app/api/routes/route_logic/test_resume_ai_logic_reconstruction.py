@@ -1,5 +1,6 @@
 """Tests for resume_ai_logic_reconstruction module."""
 
+import io
 from unittest.mock import Mock, patch
 
 import pytest
@@ -9,6 +10,7 @@ from resume_editor.app.api.routes.route_logic.resume_ai_logic_params import (
 )
 from resume_editor.app.api.routes.route_logic.resume_ai_logic_reconstruction import (
     _reconstruct_refined_resume_content,
+    _write_resume_sections,
     process_refined_experience_result,
 )
 
@@ -46,14 +48,39 @@ Description
         mock_extract.return_value = mock_experience
 
         with patch(
-            "resume_editor.app.api.routes.route_logic.resume_ai_logic_reconstruction.serialize_experience_to_markdown"
+            "resume_editor.app.api.routes.route_logic.resume_ai_logic_reconstruction.iter_experience_markdown"
         ) as mock_serialize:
-            mock_serialize.return_value = "# Experience\n"
+            mock_serialize.return_value = iter(["# Experience\n"])
             result = _reconstruct_refined_resume_content(params)
             assert "# Personal" in result
             assert "# Education" in result
 
 
+def test_write_resume_sections_matches_joined_layout():
+    """Test that buffered output separates non-empty pieces with one newline."""
+    buffer = io.StringIO()
+
+    _write_resume_sections(
+        buffer,
+        ["# Personal\nName: A\n\n", "   ", "# Certifications\n"],
+        iter(["# Experience\n\n", "## Roles\n\n", "### Role\n"]),
+    )
+
+    assert buffer.getvalue() == (
+        "# Personal\nName: A\n\n# Certifications\n\n"
+        "# Experience\n\n## Roles\n\n### Role\n"
+    )
+
+
+def test_write_resume_sections_without_experience():
+    """Test that no trailing separator is written when experience is empty."""
+    buffer = io.StringIO()
+
+    _write_resume_sections(buffer, ["# Personal\n", "# Education\n"], iter([]))
+
+    assert buffer.getvalue() == "# Personal\n\n# Education\n"
+
+
 @pytest.mark.asyncio
 async def test_process_refined_experience_result():
     """Test async processing of refined experience result."""
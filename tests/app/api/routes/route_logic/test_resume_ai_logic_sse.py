@@ -5,7 +5,9 @@ from resume_editor.app.api.routes.route_logic.resume_ai_logic_sse import (
     create_sse_done_message,
     create_sse_error_message,
     create_sse_message,
+    create_sse_metrics_message,
     create_sse_progress_message,
+    create_sse_role_progress_message,
 )
 
 
@@ -60,3 +62,17 @@ def test_create_sse_close_message():
     result = create_sse_close_message()
     assert "event: close" in result
     assert "stream complete" in result
+
+
+def test_create_sse_metrics_message():
+    """Test metrics message creation."""
+    result = create_sse_metrics_message({"total": {"calls": 1}})
+    assert "event: metrics" in result
+    assert 'data: {"total": {"calls": 1}}' in result
+
+
+def test_create_sse_role_progress_message():
+    """Test role progress message creation escapes the preview."""
+    result = create_sse_role_progress_message("Dev @ A&B", "Built <things>")
+    assert "event: role_progress" in result
+    assert "Dev @ A&amp;B:</span> Built &lt;things&gt;" in result
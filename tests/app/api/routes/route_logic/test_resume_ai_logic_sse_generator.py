@@ -1,5 +1,5 @@
 import asyncio
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from cryptography.fernet import InvalidToken
@@ -25,13 +25,14 @@ from resume_editor.app.models.resume.experience import (
 
 @pytest.mark.asyncio
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.reconstruct_resume_with_new_introduction"
+    "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.reconstruct_resume_with_new_introduction"
 )
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.generate_introduction_from_resume"
+    "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.async_generate_introduction_from_resume",
+    new_callable=AsyncMock,
 )
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.process_refined_experience_result"
+    "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.process_refined_experience_result"
 )
 @patch(
     "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.async_refine_experience_section"
@@ -126,19 +127,20 @@ async def test_sse_generator_processes_multiple_roles(
 
 @pytest.mark.asyncio
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.extract_banner_text"
+    "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.extract_banner_text"
 )
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.reconstruct_resume_with_new_introduction"
+    "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.reconstruct_resume_with_new_introduction"
 )
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming._reconstruct_refined_resume_content"
+    "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events._reconstruct_refined_resume_content"
 )
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.generate_introduction_from_resume"
+    "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.async_generate_introduction_from_resume",
+    new_callable=AsyncMock,
 )
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.process_refined_experience_result"
+    "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.process_refined_experience_result"
 )
 @patch(
     "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.async_refine_experience_section"
@@ -217,6 +219,7 @@ async def test_sse_generator_generates_introduction_at_end(
         job_description="a new job",
         llm_config=LLMConfig(llm_endpoint=None, api_key=None, llm_model_name=None),
         original_banner="original banner",
+        job_analysis=None,
     )
 
     mock_reconstruct_intro.assert_called_once_with(
@@ -342,10 +345,11 @@ async def test_experience_refinement_sse_generator_orchestration_error(
     ],
 )
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.generate_introduction_from_resume"
+    "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.async_generate_introduction_from_resume",
+    new_callable=AsyncMock,
 )
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.process_refined_experience_result"
+    "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.process_refined_experience_result"
 )
 @patch(
     "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.async_refine_experience_section"
@@ -395,10 +399,11 @@ async def test_experience_refinement_sse_generator_malformed_events(
 
 @pytest.mark.asyncio
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.generate_introduction_from_resume"
+    "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.async_generate_introduction_from_resume",
+    new_callable=AsyncMock,
 )
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.process_refined_experience_result"
+    "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.process_refined_experience_result"
 )
 @patch(
     "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.async_refine_experience_section"
@@ -585,10 +590,11 @@ def test_process_sse_event_handles_job_analysis_complete():
     return_value="not a close message",
 )
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.generate_introduction_from_resume"
+    "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.async_generate_introduction_from_resume",
+    new_callable=AsyncMock,
 )
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.process_refined_experience_result"
+    "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.process_refined_experience_result"
 )
 @patch(
     "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.async_refine_experience_section"
@@ -706,10 +712,11 @@ async def test_generator_handles_client_disconnect_gracefully(
 
 @pytest.mark.asyncio
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.generate_introduction_from_resume"
+    "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.async_generate_introduction_from_resume",
+    new_callable=AsyncMock,
 )
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.process_refined_experience_result"
+    "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.process_refined_experience_result"
 )
 @patch(
     "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.async_refine_experience_section"
@@ -769,19 +776,20 @@ async def test_generator_with_slow_llm_stream(
 
 @pytest.mark.asyncio
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.extract_banner_text"
+    "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.extract_banner_text"
 )
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.reconstruct_resume_with_new_introduction"
+    "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.reconstruct_resume_with_new_introduction"
 )
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming._reconstruct_refined_resume_content"
+    "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events._reconstruct_refined_resume_content"
 )
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.generate_introduction_from_resume"
+    "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.async_generate_introduction_from_resume",
+    new_callable=AsyncMock,
 )
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.process_refined_experience_result"
+    "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.process_refined_experience_result"
 )
 @patch(
     "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.async_refine_experience_section"
@@ -850,19 +858,20 @@ async def test_sse_generator_intro_generation_retries_on_failure(
 
 @pytest.mark.asyncio
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.extract_banner_text"
+    "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.extract_banner_text"
 )
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.reconstruct_resume_with_new_introduction"
+    "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.reconstruct_resume_with_new_introduction"
 )
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming._reconstruct_refined_resume_content"
+    "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events._reconstruct_refined_resume_content"
 )
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.generate_introduction_from_resume"
+    "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.async_generate_introduction_from_resume",
+    new_callable=AsyncMock,
 )
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.process_refined_experience_result"
+    "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.process_refined_experience_result"
 )
 @patch(
     "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.async_refine_experience_section"
@@ -930,19 +939,20 @@ async def test_sse_generator_intro_generation_retries_on_empty_string(
 
 @pytest.mark.asyncio
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.extract_banner_text"
+    "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.extract_banner_text"
 )
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.reconstruct_resume_with_new_introduction"
+    "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.reconstruct_resume_with_new_introduction"
 )
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming._reconstruct_refined_resume_content"
+    "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events._reconstruct_refined_resume_content"
 )
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.generate_introduction_from_resume"
+    "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.async_generate_introduction_from_resume",
+    new_callable=AsyncMock,
 )
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.process_refined_experience_result"
+    "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.process_refined_experience_result"
 )
 @patch(
     "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.async_refine_experience_section"
@@ -1006,19 +1016,20 @@ async def test_sse_generator_intro_generation_fallback_on_total_failure(
 
 @pytest.mark.asyncio
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.extract_banner_text"
+    "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.extract_banner_text"
 )
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.reconstruct_resume_with_new_introduction"
+    "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.reconstruct_resume_with_new_introduction"
 )
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming._reconstruct_refined_resume_content"
+    "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events._reconstruct_refined_resume_content"
 )
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.generate_introduction_from_resume"
+    "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.async_generate_introduction_from_resume",
+    new_callable=AsyncMock,
 )
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.process_refined_experience_result"
+    "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.process_refined_experience_result"
 )
 @patch(
     "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.async_refine_experience_section"
@@ -1113,6 +1124,7 @@ async def test_sse_generator_e2e_refine_then_introduce_workflow(
         job_description="a new job",
         llm_config=LLMConfig(llm_endpoint=None, api_key=None, llm_model_name=None),
         original_banner="original banner",
+        job_analysis=None,
     )
     mock_reconstruct_intro.assert_called_once_with(
         resume_content="reconstructed content for intro gen",
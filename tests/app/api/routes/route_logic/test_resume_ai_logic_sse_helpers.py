@@ -116,6 +116,30 @@ def test_process_sse_event_role_refined_validation_fails(caplog):
     assert "Failed to validate refined role data" in caplog.text
 
 
+
+def test_process_sse_event_role_refined_marks_cached_roles():
+    """Test that a role served from the role refinement cache is labelled as cached."""
+    event = {
+        "status": "role_refined",
+        "data": {
+            "basics": {
+                "company": "Acme",
+                "title": "Engineer",
+                "start_date": "2020-01-01T00:00:00",
+            },
+        },
+        "original_index": 0,
+        "cached": True,
+    }
+    refined_roles = {}
+
+    sse_message = _process_sse_event(event, refined_roles)
+
+    assert sse_message == create_sse_progress_message(
+        "Refined Role: Engineer at Acme (cached)",
+    )
+    assert 0 in refined_roles
+
 @pytest.mark.parametrize(
     "malformed_event",
     [
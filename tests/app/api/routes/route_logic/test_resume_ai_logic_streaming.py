@@ -6,6 +6,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 from cryptography.fernet import InvalidToken
+from langchain_core.outputs import LLMResult
 from openai import AuthenticationError
 
 from resume_editor.app.api.routes.route_logic.resume_ai_logic_params import (
@@ -20,18 +21,21 @@ from resume_editor.app.api.routes.route_logic.resume_ai_logic_sse import (
 from resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming import (
     _build_skip_indices_from_log,
     _create_refined_role_record,
-    _generate_introduction_with_fallback,
     _handle_job_analysis_event,
     _handle_role_refined_event,
     _handle_sse_exception,
     _prepare_refinement_params,
     _process_single_event,
-    _stream_final_events,
     _stream_llm_events,
     experience_refinement_sse_generator,
 )
 from resume_editor.app.api.routes.route_models import ExperienceRefinementParams
-from resume_editor.app.llm.models import LLMConfig, RefinedRoleRecord, RunningLog
+from resume_editor.app.llm.models import (
+    LLMConfig,
+    RefinedRoleRecord,
+    RunningLog,
+)
+from resume_editor.app.llm.token_usage import token_usage_config
 from resume_editor.app.models.resume.experience import Role, RoleBasics, RoleSummary
 
 
@@ -97,6 +101,22 @@ class TestProcessSingleEvent:
         assert "Engineer at Test Corp" in result
         assert refined_roles[0] == role.model_dump(mode="json")
 
+    def test_role_progress_event(self):
+        """Test that a partial summary becomes a role_progress message only."""
+        refined_roles = {}
+        event = {
+            "status": "role_progress",
+            "original_index": 0,
+            "role_title": "Engineer @ Test Corp",
+            "summary": "Backend engineer who",
+        }
+
+        result = _process_single_event(event, refined_roles)
+
+        assert result.startswith("event: role_progress")
+        assert "Backend engineer who" in result
+        assert refined_roles == {}
+
     def test_unknown_event(self):
         """Test processing unknown event type."""
         refined_roles = {}
@@ -194,143 +214,6 @@ class TestHandleRoleRefinedEvent:
         _handle_role_refined_event(event, running_log, resume_id=1, user_id=1)
 
 
-class TestGenerateIntroductionWithFallback:
-    """Tests for _generate_introduction_with_fallback function."""
-
-    @pytest.mark.asyncio
-    @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.generate_banner_from_running_log"
-    )
-    async def test_uses_running_log_banner(self, mock_generate_banner):
-        """Test using banner from running log."""
-        mock_generate_banner.return_value = "Generated banner"
-        resume_content = "test content"
-        job_description = "test job"
-        llm_config = LLMConfig()
-        original_banner = "original"
-        now = datetime.now()
-        refined_role = RefinedRoleRecord(
-            original_index=0,
-            company="Test Corp",
-            title="Engineer",
-            refined_description="",
-            relevant_skills=[],
-            start_date=now,
-            end_date=None,
-            timestamp=now,
-        )
-        running_log = create_test_running_log(refined_roles=[refined_role])
-
-        result = await _generate_introduction_with_fallback(
-            resume_content, job_description, llm_config, original_banner, running_log
-        )
-
-        assert result == "Generated banner"
-        mock_generate_banner.assert_called_once()
-
-    @pytest.mark.asyncio
-    @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.generate_introduction_from_resume"
-    )
-    @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.generate_banner_from_running_log"
-    )
-    async def test_falls_back_to_legacy(
-        self, mock_generate_banner, mock_generate_intro
-    ):
-        """Test falling back to legacy introduction generation."""
-        mock_generate_banner.return_value = None
-        mock_generate_intro.return_value = "Legacy intro"
-        resume_content = "test content"
-        job_description = "test job"
-        llm_config = LLMConfig()
-        original_banner = "original"
-
-        result = await _generate_introduction_with_fallback(
-            resume_content, job_description, llm_config, original_banner, None
-        )
-
-        assert result == "Legacy intro"
-        mock_generate_intro.assert_called_once()
-
-    @pytest.mark.asyncio
-    @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.generate_introduction_from_resume"
-    )
-    @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.generate_banner_from_running_log"
-    )
-    async def test_retries_on_failure(self, mock_generate_banner, mock_generate_intro):
-        """Test retry mechanism on generation failure."""
-        mock_generate_banner.return_value = None
-        mock_generate_intro.side_effect = [Exception("Fail"), "Success"]
-        resume_content = "test content"
-        job_description = "test job"
-        llm_config = LLMConfig()
-        original_banner = "original"
-
-        result = await _generate_introduction_with_fallback(
-            resume_content, job_description, llm_config, original_banner, None
-        )
-
-        assert result == "Success"
-        assert mock_generate_intro.call_count == 2
-
-    @pytest.mark.asyncio
-    @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.generate_introduction_from_resume"
-    )
-    @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.generate_banner_from_running_log"
-    )
-    async def test_retries_on_empty_string(
-        self, mock_generate_banner, mock_generate_intro
-    ):
-        """Test retry mechanism on empty string result."""
-        mock_generate_banner.return_value = None
-        mock_generate_intro.side_effect = ["   ", "Success"]
-        resume_content = "test content"
-        job_description = "test job"
-        llm_config = LLMConfig()
-        original_banner = "original"
-
-        result = await _generate_introduction_with_fallback(
-            resume_content, job_description, llm_config, original_banner, None
-        )
-
-        assert result == "Success"
-        assert mock_generate_intro.call_count == 2
-
-    @pytest.mark.asyncio
-    @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.generate_introduction_from_resume"
-    )
-    @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.generate_banner_from_running_log"
-    )
-    async def test_default_on_total_failure(
-        self, mock_generate_banner, mock_generate_intro
-    ):
-        """Test default intro when all retries fail."""
-        mock_generate_banner.return_value = None
-        mock_generate_intro.side_effect = [
-            Exception("Fail 1"),
-            Exception("Fail 2"),
-            Exception("Fail 3"),
-        ]
-        resume_content = "test content"
-        job_description = "test job"
-        llm_config = LLMConfig()
-        original_banner = "original"
-
-        result = await _generate_introduction_with_fallback(
-            resume_content, job_description, llm_config, original_banner, None
-        )
-
-        assert "Professional summary tailored" in result
-        assert mock_generate_intro.call_count == 3
-
-
 class TestPrepareRefinementParams:
     """Tests for _prepare_refinement_params function."""
 
@@ -646,127 +529,39 @@ class TestStreamLlmEvents:
         assert state.skip_indices == {0}
 
 
-class TestStreamFinalEvents:
-    """Tests for _stream_final_events function."""
-
-    @pytest.mark.asyncio
-    @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.reconstruct_resume_with_new_introduction"
-    )
-    @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming._generate_introduction_with_fallback"
-    )
-    @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming._reconstruct_refined_resume_content"
-    )
-    @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.extract_banner_text"
-    )
-    async def test_yields_intro_progress(
-        self,
-        mock_extract_banner,
-        mock_reconstruct_content,
-        mock_generate_intro,
-        mock_reconstruct_final,
-    ):
-        """Test that intro generation progress is yielded."""
-        mock_extract_banner.return_value = "original"
-        mock_reconstruct_content.return_value = "content"
-        mock_generate_intro.return_value = "intro"
-        mock_reconstruct_final.return_value = "final"
-
-        params = Mock()
-        params.resume.id = 1
-        params.original_resume_content = "original"
-        params.resume_content_to_refine = "content"
-        params.job_description = "job"
-        params.limit_refinement_years = None
-        params.company = None
-        params.notes = None
-        llm_config = LLMConfig()
-        refined_roles = {}
-
-        results = []
-        async for msg in _stream_final_events(refined_roles, params, llm_config, None):
-            results.append(msg)
-
-        # First message should be intro progress
-        assert any("Generating AI introduction" in msg for msg in results)
+class TestExperienceRefinementSseGenerator:
+    """Tests for experience_refinement_sse_generator function."""
 
     @pytest.mark.asyncio
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.reconstruct_resume_with_new_introduction"
-    )
-    @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming._generate_introduction_with_fallback"
-    )
-    @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming._reconstruct_refined_resume_content"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming._stream_final_events"
     )
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.extract_banner_text"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming._stream_llm_events"
     )
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.process_refined_experience_result"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.get_llm_config"
     )
-    async def test_yields_done_event(
-        self,
-        mock_process_result,
-        mock_extract_banner,
-        mock_reconstruct_content,
-        mock_generate_intro,
-        mock_reconstruct_final,
+    async def test_successful_refinement(
+        self, mock_get_config, mock_stream_llm, mock_stream_final
     ):
-        """Test that done event is yielded."""
-        mock_extract_banner.return_value = "original"
-        mock_reconstruct_content.return_value = "content"
-        mock_generate_intro.return_value = "intro"
-        mock_reconstruct_final.return_value = "final"
-        mock_process_result.return_value = "<html>result</html>"
-
-        params = Mock()
-        params.resume.id = 1
-        params.original_resume_content = "original"
-        params.resume_content_to_refine = "content"
-        params.job_description = "job"
-        params.limit_refinement_years = None
-        llm_config = LLMConfig()
-        refined_roles = {0: {"basics": {"company": "Test"}}}
+        """Test successful refinement flow."""
+        mock_get_config.return_value = (None, None, None)
 
-        results = []
-        async for msg in _stream_final_events(refined_roles, params, llm_config, None):
-            results.append(msg)
+        async def mock_llm_gen():
+            yield create_sse_progress_message("Progress 1")
 
-        assert any("event: done" in msg for msg in results)
-        assert any("<html>result</html>" in msg for msg in results)
+        async def mock_final_gen():
+            yield create_sse_done_message("<html>result</html>")
 
-    @pytest.mark.asyncio
-    @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.reconstruct_resume_with_new_introduction"
-    )
-    @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming._generate_introduction_with_fallback"
-    )
-    @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming._reconstruct_refined_resume_content"
-    )
-    @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.extract_banner_text"
-    )
-    async def test_warning_on_no_roles(
-        self,
-        mock_extract_banner,
-        mock_reconstruct_content,
-        mock_generate_intro,
-        mock_reconstruct_final,
-    ):
-        """Test warning when no roles refined."""
-        mock_extract_banner.return_value = "original"
-        mock_reconstruct_content.return_value = "content"
-        mock_generate_intro.return_value = "intro"
-        mock_reconstruct_final.return_value = "final"
+        mock_stream_llm.return_value = mock_llm_gen()
+        mock_stream_final.return_value = mock_final_gen()
 
         params = Mock()
+        params.db = Mock()
+        params.user = Mock()
+        params.user.id = 1
+        params.resume = Mock()
         params.resume.id = 1
         params.original_resume_content = "original"
         params.resume_content_to_refine = "content"
@@ -774,19 +569,15 @@ class TestStreamFinalEvents:
         params.limit_refinement_years = None
         params.company = None
         params.notes = None
-        llm_config = LLMConfig()
-        refined_roles = {}  # No roles
 
         results = []
-        async for msg in _stream_final_events(refined_roles, params, llm_config, None):
+        async for msg in experience_refinement_sse_generator(params):
             results.append(msg)
 
-        # Should yield warning
-        assert any("no roles were found to refine" in msg for msg in results)
-
-
-class TestExperienceRefinementSseGenerator:
-    """Tests for experience_refinement_sse_generator function."""
+        assert len(results) >= 3  # progress, done, close
+        assert any("event: done" in msg for msg in results)
+        assert any("event: close" in msg for msg in results)
+        assert not any("event: metrics" in msg for msg in results)
 
     @pytest.mark.asyncio
     @patch(
@@ -798,13 +589,22 @@ class TestExperienceRefinementSseGenerator:
     @patch(
         "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.get_llm_config"
     )
-    async def test_successful_refinement(
+    async def test_reports_token_usage_metrics(
         self, mock_get_config, mock_stream_llm, mock_stream_final
     ):
-        """Test successful refinement flow."""
+        """Test that the token usage of the refinement's LLM calls reaches the final events."""
         mock_get_config.return_value = (None, None, None)
 
         async def mock_llm_gen():
+            handler = token_usage_config("role_refine")["callbacks"][0]
+            handler.on_llm_end(
+                LLMResult(
+                    generations=[[]],
+                    llm_output={
+                        "token_usage": {"prompt_tokens": 90, "completion_tokens": 10},
+                    },
+                ),
+            )
             yield create_sse_progress_message("Progress 1")
 
         async def mock_final_gen():
@@ -814,25 +614,15 @@ class TestExperienceRefinementSseGenerator:
         mock_stream_final.return_value = mock_final_gen()
 
         params = Mock()
-        params.db = Mock()
-        params.user = Mock()
         params.user.id = 1
-        params.resume = Mock()
         params.resume.id = 1
-        params.original_resume_content = "original"
-        params.resume_content_to_refine = "content"
-        params.job_description = "job"
-        params.limit_refinement_years = None
-        params.company = None
-        params.notes = None
 
-        results = []
-        async for msg in experience_refinement_sse_generator(params):
-            results.append(msg)
+        results = [msg async for msg in experience_refinement_sse_generator(params)]
 
-        assert len(results) >= 3  # progress, done, close
-        assert any("event: done" in msg for msg in results)
-        assert any("event: close" in msg for msg in results)
+        assert "event: done" in results[-2]
+        assert "event: close" in results[-1]
+        token_usage = mock_stream_final.call_args.kwargs["params"].token_usage
+        assert token_usage.as_dict()["role_refine"]["prompt_tokens"] == 90
 
     @pytest.mark.asyncio
     @patch(
@@ -1033,16 +823,16 @@ class TestIntegration:
 
     @pytest.mark.asyncio
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.process_refined_experience_result"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.process_refined_experience_result"
     )
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.reconstruct_resume_with_new_introduction"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events.reconstruct_resume_with_new_introduction"
     )
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming._generate_introduction_with_fallback"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events._generate_introduction_with_fallback"
     )
     @patch(
-        "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming._reconstruct_refined_resume_content"
+        "resume_editor.app.api.routes.route_logic.resume_ai_logic_final_events._reconstruct_refined_resume_content"
     )
     @patch(
         "resume_editor.app.api.routes.route_logic.resume_ai_logic_streaming.async_refine_experience_section"
@@ -0,0 +1,185 @@
+import textwrap
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from resume_editor.app.api.routes.route_logic.resume_section_extraction import (
+    extract_all_sections,
+    extract_certifications_info,
+    extract_education_info,
+    extract_experience_info,
+    extract_personal_info,
+)
+from resume_editor.app.api.routes.route_logic.resume_serialization import (
+    update_resume_content_with_structured_data,
+)
+from resume_editor.app.api.routes.route_models import (
+    PersonalInfoResponse,
+    ResumeSectionsResponse,
+)
+
+VALID_RESUME = textwrap.dedent(
+    """\
+    # Personal
+
+    ## Contact Information
+
+    Name: Test Person
+
+    # Education
+
+    ## Degrees
+
+    ### Degree
+
+    School: A School
+
+    # Certifications
+
+    ## Certification
+
+    Name: A Cert
+
+    # Experience
+
+    ## Roles
+
+    ### Role
+
+    #### Basics
+
+    Company: A Company
+    Title: A Role
+    Start date: 01/2024
+
+    ### Role
+
+    #### Basics
+
+    Company: B Company
+    Title: B Role
+    Start date: 01/2023
+
+    ## Projects
+
+    ### Project
+
+    #### Overview
+
+    Title: A Cool Project
+    """
+)
+
+
+def test_extract_all_sections_matches_individual_extractors():
+    """Test that extract_all_sections returns the same data as the individual extractors."""
+    result = extract_all_sections(VALID_RESUME)
+
+    assert isinstance(result, ResumeSectionsResponse)
+    assert result.personal == extract_personal_info(VALID_RESUME)
+    assert result.education == extract_education_info(VALID_RESUME)
+    assert result.experience == extract_experience_info(VALID_RESUME)
+    assert result.certifications == extract_certifications_info(
+        VALID_RESUME
+    )
+    assert result.personal.name == "Test Person"
+    assert len(result.experience.roles) == 2
+    assert len(result.experience.projects) == 1
+
+
+@patch("resume_editor.app.api.routes.route_logic.resume_section_extraction._parse_resume")
+def test_extract_all_sections_parses_once(mock_parse_resume):
+    """Test that extract_all_sections parses the content a single time."""
+    mock_parsed_resume = MagicMock()
+    mock_parsed_resume.personal = None
+    mock_parsed_resume.education = None
+    mock_parsed_resume.experience = None
+    mock_parsed_resume.certifications = None
+    mock_parse_resume.return_value = mock_parsed_resume
+
+    result = extract_all_sections("# Personal\n\n# Education\n")
+
+    mock_parse_resume.assert_called_once_with("# Personal\n\n# Education\n")
+    assert result.personal == PersonalInfoResponse()
+    assert result.education.degrees == []
+    assert result.experience.roles == []
+    assert result.certifications.certifications == []
+
+
+@patch(
+    "resume_editor.app.api.routes.route_logic.resume_section_extraction._parse_resume",
+    side_effect=ValueError("mocked error"),
+)
+def test_extract_all_sections_with_parsing_error(mock_parse_resume):
+    """Test that extract_all_sections raises a ValueError when parsing fails."""
+    with pytest.raises(
+        ValueError, match="Failed to parse resume sections from resume content."
+    ):
+        extract_all_sections("some invalid content")
+
+
+@patch("resume_editor.app.api.routes.route_logic.resume_section_extraction._parse_resume")
+def test_extract_all_sections_unparsed_experience_raises_error(mock_parse_resume):
+    """Test that extract_all_sections applies the unparsed experience check."""
+    mock_parsed_resume = MagicMock()
+    mock_parsed_resume.personal = None
+    mock_parsed_resume.experience = None
+    mock_parse_resume.return_value = mock_parsed_resume
+
+    content = textwrap.dedent(
+        """\
+        # Personal
+
+        # Experience
+        some unparseable content
+        """
+    )
+    with pytest.raises(
+        ValueError, match="Failed to parse experience info from resume content."
+    ):
+        extract_all_sections(content)
+
+
+@patch("resume_editor.app.api.routes.route_logic.resume_section_extraction._parse_resume")
+def test_update_resume_content_extracts_missing_sections_once(mock_parse_resume):
+    """Test that missing sections are extracted from a single parse."""
+    mock_parsed_resume = MagicMock()
+    mock_parsed_resume.personal = None
+    mock_parsed_resume.education = None
+    mock_parsed_resume.experience = None
+    mock_parsed_resume.certifications = None
+    mock_parse_resume.return_value = mock_parsed_resume
+
+    updated = update_resume_content_with_structured_data(
+        current_content="# Personal\n",
+        personal_info=PersonalInfoResponse(name="Jane Doe"),
+    )
+
+    mock_parse_resume.assert_called_once_with("# Personal\n")
+    assert "Name: Jane Doe" in updated
+
+
+@patch("resume_editor.app.api.routes.route_logic.resume_section_extraction._parse_resume")
+def test_update_resume_content_skips_check_for_provided_sections(mock_parse_resume):
+    """Test that provided sections are not re-extracted from the current content."""
+    mock_parsed_resume = MagicMock()
+    mock_parsed_resume.personal = None
+    mock_parsed_resume.education = None
+    mock_parsed_resume.experience = None
+    mock_parsed_resume.certifications = None
+    mock_parse_resume.return_value = mock_parsed_resume
+
+    content = textwrap.dedent(
+        """\
+        # Personal
+        This is some junk.
+        # Education
+        """
+    )
+    updated = update_resume_content_with_structured_data(
+        current_content=content,
+        personal_info=PersonalInfoResponse(name="Jane Doe"),
+    )
+
+    assert "This is some junk." not in updated
+    assert "Name: Jane Doe" in updated
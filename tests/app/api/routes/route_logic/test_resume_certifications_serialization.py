@@ -2,8 +2,10 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from resume_editor.app.api.routes.route_logic.resume_serialization import (
+from resume_editor.app.api.routes.route_logic.resume_section_extraction import (
     extract_certifications_info,
+)
+from resume_editor.app.api.routes.route_logic.resume_serialization import (
     serialize_certifications_to_markdown,
 )
 from resume_editor.app.api.routes.route_models import CertificationsResponse
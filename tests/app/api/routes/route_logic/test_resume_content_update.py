@@ -146,3 +146,49 @@ def test_update_resume_content_with_unparseable_personal_info():
         ValueError, match="Failed to parse personal info from resume content."
     ):
         update_resume_content_with_structured_data(current_content)
+
+
+def test_update_resume_content_incremental_preserves_other_sections():
+    """Test that incremental mode only reserializes the provided section."""
+    current_content = (
+        "# Personal\n\nName:    Spaced   Out\n\n"
+        "# Certifications\n\n## Certification\n\nName: Old Cert\n"
+    )
+    certifications = CertificationsResponse(
+        certifications=[{"name": "New Cert"}],
+    )
+
+    with patch(
+        "resume_editor.app.api.routes.route_logic.resume_section_extraction._parse_resume"
+    ) as mock_parse_resume:
+        updated_content = update_resume_content_with_structured_data(
+            current_content=current_content,
+            certifications=certifications,
+            incremental=True,
+        )
+
+    mock_parse_resume.assert_not_called()
+    assert updated_content.startswith("# Personal\n\nName:    Spaced   Out\n\n")
+    assert "Name: New Cert" in updated_content
+    assert "Old Cert" not in updated_content
+
+
+@patch(
+    "resume_editor.app.api.routes.route_logic.resume_reconstruction.reconstruct_resume_markdown",
+    return_value="rebuilt",
+)
+def test_update_resume_content_incremental_falls_back_when_section_missing(
+    mock_reconstruct,
+):
+    """Test that incremental mode rebuilds when the section is not in the content."""
+    current_content = "# Personal\n\n## Contact Information\n\nName: Jane\n"
+    education = EducationResponse(degrees=[{"school": "A School"}])
+
+    updated_content = update_resume_content_with_structured_data(
+        current_content=current_content,
+        education=education,
+        incremental=True,
+    )
+
+    assert updated_content == "rebuilt"
+    assert mock_reconstruct.call_args.kwargs["education"] == education
@@ -15,6 +15,9 @@ from resume_editor.app.api.routes.route_logic.resume_crud import (
     get_user_resumes,
     update_resume,
 )
+from resume_editor.app.api.routes.route_logic.resume_structured_data import (
+    STRUCTURED_DATA_VERSION,
+)
 from resume_editor.app.models.resume_model import (
     Resume as DatabaseResume,
     ResumeData,
@@ -291,6 +294,80 @@ def test_update_resume_no_changes():
     assert result == mock_resume
 
 
+@patch("resume_editor.app.api.routes.route_logic.resume_crud.DatabaseResume")
+def test_create_resume_stores_supplied_structured_data(mock_db_resume):
+    """Test create_resume persists the structured data built by the caller."""
+    mock_db = Mock(spec=Session)
+    mock_instance = Mock()
+    mock_db_resume.return_value = mock_instance
+    structured_data = {"content_hash": "abc", "sections": {}}
+
+    params = ResumeCreateParams(
+        user_id=1,
+        name="Resume",
+        content="Content",
+        structured_data=structured_data,
+    )
+    create_resume(db=mock_db, params=params)
+
+    assert mock_instance.structured_data == structured_data
+    assert mock_instance.structured_data_version == STRUCTURED_DATA_VERSION
+    mock_db.commit.assert_called_once()
+
+
+@patch("resume_editor.app.api.routes.route_logic.resume_crud.DatabaseResume")
+def test_create_resume_without_structured_data_leaves_it_for_backfill(mock_db_resume):
+    """Test create_resume clears the structured columns when none were supplied."""
+    mock_db = Mock(spec=Session)
+    mock_instance = Mock()
+    mock_db_resume.return_value = mock_instance
+
+    create_resume(
+        db=mock_db,
+        params=ResumeCreateParams(user_id=1, name="Resume", content="Content"),
+    )
+
+    assert mock_instance.structured_data is None
+    assert mock_instance.structured_data_version is None
+
+
+def test_update_resume_stores_structured_data_only_on_content_change():
+    """Test update_resume touches the structured columns only when content changes."""
+    mock_db = Mock(spec=Session)
+    mock_resume = Mock(spec=DatabaseResume)
+    mock_resume.structured_data = "untouched"
+
+    update_resume(db=mock_db, resume=mock_resume, params=ResumeUpdateParams(name="N"))
+    assert mock_resume.structured_data == "untouched"
+
+    update_resume(
+        db=mock_db,
+        resume=mock_resume,
+        params=ResumeUpdateParams(content="New Content"),
+    )
+    assert mock_resume.structured_data is None
+    assert mock_resume.structured_data_version is None
+
+
+def test_update_resume_uses_supplied_structured_data():
+    """Test update_resume stores structured data built by the caller without parsing."""
+    mock_db = Mock(spec=Session)
+    mock_resume = Mock(spec=DatabaseResume)
+    structured_data = {"content_hash": "abc", "sections": {}}
+
+    update_resume(
+        db=mock_db,
+        resume=mock_resume,
+        params=ResumeUpdateParams(
+            content="New Content",
+            structured_data=structured_data,
+        ),
+    )
+
+    assert mock_resume.structured_data == structured_data
+    assert mock_resume.structured_data_version == STRUCTURED_DATA_VERSION
+
+
 def test_update_resume_only_name():
     """Test update_resume with only name."""
     mock_db = Mock(spec=Session)
@@ -4,8 +4,10 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from resume_editor.app.api.routes.route_logic.resume_serialization import (
+from resume_editor.app.api.routes.route_logic.resume_section_extraction import (
     extract_education_info,
+)
+from resume_editor.app.api.routes.route_logic.resume_serialization import (
     serialize_education_to_markdown,
 )
 from resume_editor.app.api.routes.route_models import EducationResponse
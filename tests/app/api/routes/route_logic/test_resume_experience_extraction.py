@@ -3,20 +3,21 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from resume_editor.app.api.routes.route_logic.resume_serialization import (
+from resume_editor.app.api.routes.route_logic.resume_section_extraction import (
     extract_experience_info,
+    extract_projects_info,
 )
 from resume_editor.app.models.resume.experience import InclusionStatus
 
 
-@patch("resume_editor.app.api.routes.route_logic.resume_serialization._check_for_unparsed_content")
+@patch("resume_editor.app.api.routes.route_logic.resume_section_extraction._check_for_unparsed_content")
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_serialization._convert_writer_project_to_dict"
+    "resume_editor.app.api.routes.route_logic.resume_section_extraction._convert_writer_project_to_dict"
 )
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_serialization._convert_writer_role_to_dict"
+    "resume_editor.app.api.routes.route_logic.resume_section_extraction._convert_writer_role_to_dict"
 )
-@patch("resume_editor.app.api.routes.route_logic.resume_serialization._parse_resume")
+@patch("resume_editor.app.api.routes.route_logic.resume_section_extraction._parse_resume")
 class TestRefactoredExtractExperienceInfo:
     """Unit tests for the refactored extract_experience_info function."""
 
@@ -157,3 +158,49 @@ class TestRefactoredExtractExperienceInfo:
         mock_role_conv.assert_not_called()
         mock_proj_conv.assert_not_called()
         mock_check.assert_not_called()
+
+
+@patch("resume_editor.app.api.routes.route_logic.resume_section_extraction._parse_resume")
+def test_extract_experience_info_parses_only_experience_section(mock_parse):
+    """Test that extract_experience_info parses the experience section on its own."""
+    mock_parse.return_value = Mock(experience=None)
+    content = "# Personal\nName: Jane\n\n# Experience\n"
+
+    extract_experience_info(content)
+
+    mock_parse.assert_called_once_with("# Experience")
+
+
+@patch(
+    "resume_editor.app.api.routes.route_logic.resume_section_extraction._convert_writer_project_to_dict"
+)
+@patch("resume_editor.app.api.routes.route_logic.resume_section_extraction._parse_resume")
+def test_extract_projects_info_parses_only_projects(mock_parse, mock_proj_conv):
+    """Test that extract_projects_info parses the projects subsection without roles."""
+    mock_project = Mock()
+    mock_parse.return_value = Mock(experience=Mock(projects=[mock_project]))
+    mock_proj_conv.return_value = {
+        "overview": {"title": "Test Project", "inclusion_status": InclusionStatus.INCLUDE}
+    }
+    content = (
+        "# Experience\n## Roles\n### Role\nCompany: A\n"
+        "## Projects\n### Project\nTitle: Test Project\n"
+    )
+
+    result = extract_projects_info(content)
+
+    mock_parse.assert_called_once_with(
+        "# Experience\n\n## Projects\n### Project\nTitle: Test Project\n"
+    )
+    mock_proj_conv.assert_called_once_with(mock_project)
+    assert result.projects[0].overview.title == "Test Project"
+
+
+@patch(
+    "resume_editor.app.api.routes.route_logic.resume_section_extraction._parse_resume",
+    side_effect=ValueError("mocked error"),
+)
+def test_extract_projects_info_parse_error(mock_parse):
+    """Test that extract_projects_info raises a ValueError when parsing fails."""
+    with pytest.raises(ValueError, match="Failed to parse projects info"):
+        extract_projects_info("# Experience\n## Projects\n")
@@ -7,6 +7,7 @@ import pytest
 
 from resume_editor.app.api.routes.route_logic.resume_serialization import (
     _serialize_role_to_markdown,
+    iter_experience_markdown,
     serialize_experience_to_markdown,
 )
 from resume_editor.app.api.routes.route_models import ExperienceResponse
@@ -108,6 +109,64 @@ def test_serialize_experience_with_inclusion_controls(sample_experience_data):
     assert "Inclusion Status" not in markdown
 
 
+def test_iter_experience_markdown_streams_one_chunk_per_entry(sample_experience_data):
+    """Test that the streaming serializer yields headers and entries separately."""
+    experience = ExperienceResponse(**sample_experience_data)
+
+    chunks = list(iter_experience_markdown(experience))
+
+    assert chunks[0] == "# Experience\n\n"
+    assert chunks[1] == "## Projects\n\n"
+    assert "## Roles\n\n" in chunks
+    assert sum(chunk.startswith("### Role") for chunk in chunks) == 2
+    assert sum(chunk.startswith("### Project") for chunk in chunks) == 2
+    assert "".join(chunks) == serialize_experience_to_markdown(experience)
+
+
+def test_iter_experience_markdown_matches_joined_lines():
+    """Test that streamed output equals joining every entry's lines at once."""
+    roles = [
+        Role(
+            basics=RoleBasics(
+                company=f"Company {index}",
+                title="Engineer",
+                start_date=datetime(2020, 1, 1),
+            ),
+            summary=RoleSummary(text=f"Summary {index}"),
+        )
+        for index in range(3)
+    ]
+    experience = ExperienceResponse(roles=roles, projects=[])
+
+    expected_lines = ["# Experience", "", "## Roles", ""]
+    for role in roles:
+        expected_lines.extend(_serialize_role_to_markdown(role))
+
+    assert "".join(iter_experience_markdown(experience)) == (
+        "\n".join(expected_lines) + "\n"
+    )
+
+
+def test_iter_experience_markdown_yields_nothing_when_all_omitted():
+    """Test that no headers are emitted if every entry is omitted."""
+    experience = ExperienceResponse(
+        roles=[
+            Role(
+                basics=RoleBasics(
+                    company="Omit Ltd",
+                    title="Dev",
+                    start_date=datetime(2020, 1, 1),
+                    inclusion_status=InclusionStatus.OMIT,
+                ),
+            ),
+        ],
+        projects=[],
+    )
+
+    assert list(iter_experience_markdown(experience)) == []
+    assert list(iter_experience_markdown(None)) == []
+
+
 def test_serialize_empty_experience():
     """Test serializing an empty experience section returns an empty string."""
     assert serialize_experience_to_markdown(None) == ""
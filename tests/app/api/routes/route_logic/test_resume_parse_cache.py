@@ -0,0 +1,131 @@
+from unittest.mock import Mock
+
+import pytest
+
+from resume_editor.app.api.routes.route_logic.resume_parse_cache import (
+    ResumeParseCache,
+    content_hash,
+    estimate_size,
+)
+
+
+def test_content_hash_is_stable_and_distinct():
+    """Test that content_hash is deterministic and distinguishes content."""
+    assert content_hash("abc") == content_hash("abc")
+    assert content_hash("abc") != content_hash("abd")
+
+
+def test_get_or_compute_miss_then_hit():
+    """Test a miss computes once and a hit is served from the cache."""
+    cache = ResumeParseCache()
+    compute = Mock(return_value={"roles": [1, 2]})
+
+    first = cache.get_or_compute(content="resume", kind="k", compute=compute)
+    second = cache.get_or_compute(content="resume", kind="k", compute=compute)
+
+    compute.assert_called_once_with("resume")
+    assert first == second
+    stats = cache.stats()
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert stats.entries == 1
+    assert stats.total_bytes == estimate_size(first)
+
+
+def test_get_or_compute_returns_isolated_copies():
+    """Test that callers cannot corrupt the cached value."""
+    cache = ResumeParseCache()
+
+    first = cache.get_or_compute(
+        content="resume", kind="k", compute=lambda _c: {"roles": [1]}
+    )
+    first["roles"].append(2)
+    second = cache.get_or_compute(content="resume", kind="k", compute=Mock())
+    second["roles"].append(3)
+    third = cache.get_or_compute(content="resume", kind="k", compute=Mock())
+
+    assert third == {"roles": [1]}
+    assert second is not third
+
+
+def test_estimate_size_follows_containers_and_attributes():
+    """Test that nested values are measured and shared objects counted once."""
+
+    class Role:
+        def __init__(self, text: str) -> None:
+            self.text = text
+
+    text = "x" * 1000
+    role = Role(text)
+
+    assert estimate_size(role) > estimate_size(text)
+    assert estimate_size([role, role]) == estimate_size([role]) + 8
+    assert estimate_size(Role) == 0
+
+
+def test_get_or_compute_separates_kinds():
+    """Test that different kinds over the same content are cached separately."""
+    cache = ResumeParseCache()
+
+    a = cache.get_or_compute(content="resume", kind="a", compute=lambda _c: "A")
+    b = cache.get_or_compute(content="resume", kind="b", compute=lambda _c: "B")
+
+    assert (a, b) == ("A", "B")
+    assert cache.stats().entries == 2
+
+
+def test_get_or_compute_does_not_cache_exceptions():
+    """Test that a failing computation propagates and is retried next time."""
+    cache = ResumeParseCache()
+    compute = Mock(side_effect=[ValueError("boom"), "ok"])
+
+    with pytest.raises(ValueError, match="boom"):
+        cache.get_or_compute(content="resume", kind="k", compute=compute)
+
+    assert cache.get_or_compute(content="resume", kind="k", compute=compute) == "ok"
+    assert compute.call_count == 2
+    assert cache.stats().entries == 1
+
+
+def test_entry_cap_evicts_least_recently_used():
+    """Test that the entry cap evicts the least recently used entry."""
+    cache = ResumeParseCache(max_entries=2)
+    cache.get_or_compute(content="one", kind="k", compute=lambda c: c)
+    cache.get_or_compute(content="two", kind="k", compute=lambda c: c)
+    # Touch "one" so that "two" becomes least recently used.
+    cache.get_or_compute(content="one", kind="k", compute=Mock())
+    cache.get_or_compute(content="three", kind="k", compute=lambda c: c)
+
+    compute = Mock(return_value="two")
+    cache.get_or_compute(content="two", kind="k", compute=compute)
+
+    compute.assert_called_once()
+    assert cache.stats().evictions == 2
+
+
+def test_byte_cap_evicts_and_skips_oversized_values():
+    """Test that the byte cap charges the stored values' size."""
+    size = estimate_size("aaaaaa")
+    cache = ResumeParseCache(max_bytes=size + size // 2)
+    cache.get_or_compute(content="aaaaaa", kind="k", compute=lambda c: c)
+    cache.get_or_compute(content="bbbbbb", kind="k", compute=lambda c: c)
+
+    stats = cache.stats()
+    assert stats.entries == 1
+    assert stats.total_bytes == size
+    assert stats.evictions == 1
+
+    cache.get_or_compute(content="c", kind="k", compute=lambda c: c * size)
+    assert cache.stats().entries == 1
+
+
+def test_clear_resets_entries_and_counters():
+    """Test that clear drops entries and resets counters."""
+    cache = ResumeParseCache()
+    cache.get_or_compute(content="resume", kind="k", compute=lambda c: c)
+    cache.get_or_compute(content="resume", kind="k", compute=lambda c: c)
+
+    cache.clear()
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries, stats.total_bytes) == (0, 0, 0, 0)
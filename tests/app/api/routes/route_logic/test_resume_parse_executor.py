@@ -0,0 +1,140 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from resume_editor.app.api.routes.route_logic.resume_parse_executor import (
+    ResumeParseExecutor,
+    _DumpedModel,
+    _timed_call,
+    _unwrap_result,
+    _WorkerHTTPError,
+)
+from resume_editor.app.api.routes.route_models import PersonalInfoResponse
+
+
+def _raise_http_error() -> None:
+    raise HTTPException(status_code=422, detail="Invalid Markdown format")
+
+
+def _raise_value_error() -> None:
+    raise ValueError("bad content")
+
+
+@pytest.fixture
+def executor():
+    """Provide a small thread executor that is shut down after the test."""
+    parse_executor = ResumeParseExecutor(kind="thread", max_workers=1)
+    yield parse_executor
+    parse_executor.shutdown()
+
+
+def test_run_returns_result_off_the_event_loop(executor):
+    """Test that tasks run in a worker thread and their result is returned."""
+
+    async def run():
+        return await executor.run(
+            lambda a, b=0: (threading.current_thread(), a + b),
+            1,
+            b=2,
+        )
+
+    worker_thread, total = asyncio.run(run())
+
+    assert total == 3
+    assert worker_thread is not threading.current_thread()
+    stats = executor.stats()
+    assert (stats.submitted, stats.completed, stats.failed, stats.in_flight) == (
+        1,
+        1,
+        0,
+        0,
+    )
+
+
+def test_run_propagates_exceptions_and_counts_failures(executor):
+    """Test that task exceptions reach the caller and are counted as failures."""
+    with pytest.raises(ValueError, match="bad content"):
+        asyncio.run(executor.run(_raise_value_error))
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(executor.run(_raise_http_error))
+
+    assert exc_info.value.status_code == 422
+    assert executor.stats().failed == 2
+
+
+def test_run_records_queue_depth_and_wait_time(executor):
+    """Test that tasks queued behind a busy worker are reflected in the metrics."""
+    release = threading.Event()
+
+    async def run():
+        blocker = asyncio.ensure_future(executor.run(release.wait, 5))
+        queued = [asyncio.ensure_future(executor.run(lambda: None)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        depth_while_blocked = executor.stats().queue_depth
+        release.set()
+        await asyncio.gather(blocker, *queued)
+        return depth_while_blocked
+
+    depth_while_blocked = asyncio.run(run())
+
+    stats = executor.stats()
+    assert depth_while_blocked == 2
+    assert stats.max_queue_depth == 2
+    assert stats.queue_depth == 0
+    assert stats.max_wait_ms > 0
+    assert stats.total_wait_ms >= stats.max_wait_ms
+
+
+def test_timed_call_dumps_models_for_process_transfer():
+    """Test that pydantic results are dumped in the worker and validated again."""
+    _, result = _timed_call(
+        PersonalInfoResponse,
+        (),
+        {"name": "Jane"},
+        True,
+    )
+
+    assert isinstance(result, _DumpedModel)
+    assert result.data["name"] == "Jane"
+    assert _unwrap_result(result) == PersonalInfoResponse(name="Jane")
+
+
+def test_timed_call_wraps_http_exceptions():
+    """Test that an HTTPException is returned as a picklable stand-in."""
+    _, result = _timed_call(_raise_http_error, (), {}, False)
+
+    assert result == _WorkerHTTPError(
+        status_code=422,
+        detail="Invalid Markdown format",
+    )
+
+
+def test_process_pool_runs_module_level_tasks():
+    """Test that a process pool runs picklable tasks and returns validated models."""
+    parse_executor = ResumeParseExecutor(kind="process", max_workers=1)
+    try:
+        result = asyncio.run(parse_executor.run(PersonalInfoResponse, name="Jane"))
+    finally:
+        parse_executor.shutdown()
+
+    assert result == PersonalInfoResponse(name="Jane")
+
+
+@pytest.mark.parametrize(("kind", "max_workers"), [("fibers", 2), ("thread", 0)])
+def test_configure_rejects_invalid_settings(executor, kind, max_workers):
+    """Test that unknown pool kinds and empty pools are rejected."""
+    with pytest.raises(ValueError, match="Invalid parse executor configuration"):
+        executor.configure(kind=kind, max_workers=max_workers)
+
+
+def test_configure_replaces_running_pool(executor):
+    """Test that reconfiguring shuts down the old pool and applies the new size."""
+    asyncio.run(executor.run(lambda: None))
+
+    executor.configure(kind="thread", max_workers=3)
+
+    assert executor.stats().max_workers == 3
+    assert asyncio.run(executor.run(lambda: "ok")) == "ok"
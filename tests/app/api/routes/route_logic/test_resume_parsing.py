@@ -34,30 +34,28 @@ Name: Another Person
     assert result_no_indent["personal"].name == "Another Person"
 
 
-@patch(
-    "resume_editor.app.api.routes.route_logic.resume_parsing.extract_personal_info"
-)
-@patch(
-    "resume_editor.app.api.routes.route_logic.resume_parsing.extract_education_info"
-)
-@patch(
-    "resume_editor.app.api.routes.route_logic.resume_parsing.extract_experience_info"
-)
-@patch(
-    "resume_editor.app.api.routes.route_logic.resume_parsing.extract_certifications_info"
-)
-def test_parse_resume_failure(
-    mock_extract_cert,
-    mock_extract_exp,
-    mock_extract_edu,
-    mock_extract_personal,
-):
+@patch("resume_editor.app.api.routes.route_logic.resume_parsing.extract_all_sections")
+def test_parse_resume_failure(mock_extract_all_sections):
     """Test that parse_resume raises ValueError on failure."""
-    mock_extract_personal.side_effect = ValueError("Parsing failed")
+    mock_extract_all_sections.side_effect = ValueError("Parsing failed")
     with pytest.raises(ValueError):
         parse_resume("invalid markdown")
 
 
+@patch("resume_editor.app.api.routes.route_logic.resume_parsing.extract_all_sections")
+def test_parse_resume_extracts_sections_once(mock_extract_all_sections):
+    """Test that parse_resume extracts every section with a single call."""
+    mock_extract_all_sections.return_value.personal.model_dump.return_value = {
+        "name": "Testy McTestface",
+    }
+
+    result = parse_resume("# Personal")
+
+    mock_extract_all_sections.assert_called_once_with("# Personal")
+    assert result["personal"] is mock_extract_all_sections.return_value.personal
+    assert result["experience"] is mock_extract_all_sections.return_value.experience
+
+
 def test_validate_resume_content_success():
     """Test that validate_resume_content passes with valid markdown."""
     valid_markdown = """
@@ -130,3 +128,62 @@ Some content
     with pytest.raises(ValueError) as exc_info:
         parse_resume_to_writer_object(markdown_with_invalid_header)
     assert "No valid resume sections found in content." in str(exc_info.value)
+
+
+ORIGINAL_SECTIONS = (
+    "# Personal\n## Contact Information\nName: Old Name\n\n"
+    "# Education\n## Degrees\n### Degree\nSchool: A School\n"
+)
+
+
+@patch("resume_editor.app.api.routes.route_logic.resume_parsing.parse_resume")
+def test_validate_resume_content_skips_unchanged_content(mock_parse_resume):
+    """Test that content identical to the original is not parsed again."""
+    validate_resume_content(ORIGINAL_SECTIONS, original_content=ORIGINAL_SECTIONS)
+
+    mock_parse_resume.assert_not_called()
+
+
+@patch("resume_editor.app.api.routes.route_logic.resume_parsing.parse_resume")
+def test_validate_resume_content_parses_only_changed_sections(mock_parse_resume):
+    """Test that only the sections whose text changed are parsed."""
+    updated = ORIGINAL_SECTIONS.replace("Old Name", "New Name")
+
+    validate_resume_content(updated, original_content=ORIGINAL_SECTIONS)
+
+    mock_parse_resume.assert_called_once_with(
+        "# Personal\n## Contact Information\nName: New Name\n\n"
+    )
+
+
+@patch("resume_editor.app.api.routes.route_logic.resume_parsing.parse_resume")
+def test_validate_resume_content_parses_all_when_sections_added(mock_parse_resume):
+    """Test that a changed section layout validates the whole content."""
+    updated = ORIGINAL_SECTIONS + "# Certifications\n## Certification\nName: C\n"
+
+    validate_resume_content(updated, original_content=ORIGINAL_SECTIONS)
+
+    mock_parse_resume.assert_called_once_with(updated)
+
+
+@patch("resume_editor.app.api.routes.route_logic.resume_parsing.parse_resume")
+def test_validate_resume_content_falls_back_when_changed_sections_fail(
+    mock_parse_resume,
+):
+    """Test that changed sections failing alone are re-validated with the full content."""
+    updated = ORIGINAL_SECTIONS.replace("Old Name", "New Name")
+    mock_parse_resume.side_effect = [ValueError("alone"), None]
+
+    validate_resume_content(updated, original_content=ORIGINAL_SECTIONS)
+
+    assert mock_parse_resume.call_count == 2
+    assert mock_parse_resume.call_args.args == (updated,)
+
+
+@patch("resume_editor.app.api.routes.route_logic.resume_parsing.parse_resume")
+def test_validate_resume_content_reuses_cached_validation(mock_parse_resume):
+    """Test that validating the same content twice parses it once."""
+    validate_resume_content(ORIGINAL_SECTIONS)
+    validate_resume_content(ORIGINAL_SECTIONS)
+
+    mock_parse_resume.assert_called_once_with(ORIGINAL_SECTIONS)
@@ -3,7 +3,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from resume_editor.app.api.routes.route_logic.resume_serialization import (
+from resume_editor.app.api.routes.route_logic.resume_section_extraction import (
     extract_banner_text,
     extract_personal_info,
 )
@@ -53,7 +53,7 @@ def test_extract_personal_info_all_fields():
     assert result.note == "This is a note."
 
 
-@patch("resume_editor.app.api.routes.route_logic.resume_serialization._parse_resume")
+@patch("resume_editor.app.api.routes.route_logic.resume_section_extraction._parse_resume")
 def test_extract_personal_info_unparseable_check_raises_error(mock_parse_resume):
     """
     Test that the manual check for unparseable content raises an error.
@@ -79,7 +79,7 @@ def test_extract_personal_info_unparseable_check_raises_error(mock_parse_resume)
         extract_personal_info(content)
 
 
-@patch("resume_editor.app.api.routes.route_logic.resume_serialization._parse_resume")
+@patch("resume_editor.app.api.routes.route_logic.resume_section_extraction._parse_resume")
 def test_extract_personal_info_empty_section_manual_check(mock_parse_resume):
     """
     Test that the manual check for content correctly handles an empty section.
@@ -101,7 +101,7 @@ def test_extract_personal_info_empty_section_manual_check(mock_parse_resume):
 
 
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_serialization._parse_resume",
+    "resume_editor.app.api.routes.route_logic.resume_section_extraction._parse_resume",
     side_effect=ValueError("mocked error"),
 )
 def test_extract_personal_info_with_parsing_error(mock_parse_resume):
@@ -151,7 +151,7 @@ def test_extract_banner_text(content: str, expected_banner: str | None):
 
 
 @patch(
-    "resume_editor.app.api.routes.route_logic.resume_serialization._parse_resume",
+    "resume_editor.app.api.routes.route_logic.resume_section_extraction._parse_resume",
     side_effect=ValueError("mocked error"),
 )
 def test_extract_banner_text_with_parsing_error(mock_parse_resume):
@@ -1,8 +1,15 @@
+import pytest
+
 from resume_editor.app.api.routes.route_logic.resume_reconstruction import (
+    _iter_stripped,
+    iter_resume_markdown,
     reconstruct_resume_markdown,
+    splice_resume_sections,
 )
 from resume_editor.app.api.routes.route_models import (
+    CertificationsResponse,
     EducationResponse,
+    ExperienceResponse,
     PersonalInfoResponse,
 )
 
@@ -27,3 +34,108 @@ def test_reconstruct_resume_markdown_with_empty_personal_info():
     assert "# Personal" not in result
     assert "# Education" in result
     assert "University of Testing" in result
+
+
+SPLICE_CONTENT = (
+    "# Personal\n\nName:   Odd  Spacing\n\n"
+    "# Education\n\nSchool: Old School\n\n"
+    "# Experience\n\nCompany: Keep Me\n"
+)
+
+
+@pytest.mark.parametrize(
+    "chunks",
+    [
+        ["\n  # Experience\n\n", "## Roles\n\n", "### Role\n\n"],
+        ["", "  ", "# A", "\n\n", "", "b  ", "\n"],
+        ["  \n"],
+        [],
+    ],
+)
+def test_iter_stripped_matches_strip_of_joined_chunks(chunks):
+    """Test that stripping a stream equals stripping the joined text."""
+    streamed = list(_iter_stripped(iter(chunks)))
+
+    assert "".join(streamed) == "".join(chunks).strip()
+    assert "" not in streamed
+
+
+def test_iter_resume_markdown_joins_to_reconstructed_markdown():
+    """Test that streamed sections join to the same document as the string builder."""
+    sections = {
+        "personal_info": PersonalInfoResponse(name="Jane Doe"),
+        "education": EducationResponse(degrees=[{"school": "A School"}]),
+        "certifications": CertificationsResponse(certifications=[]),
+        "experience": ExperienceResponse(
+            roles=[
+                {
+                    "basics": {
+                        "company": "A Company",
+                        "title": "Engineer",
+                        "start_date": "2020-01-01T00:00:00",
+                    },
+                },
+            ],
+            projects=[],
+        ),
+    }
+
+    chunks = list(iter_resume_markdown(**sections))
+
+    assert len(chunks) > 3
+    assert "".join(chunks) == reconstruct_resume_markdown(**sections)
+    assert "".join(chunks).startswith("# Personal")
+    assert "\n\n# Education" in "".join(chunks)
+    assert "".join(chunks).endswith("Start date: 01/2020")
+
+
+def test_splice_resume_sections_replaces_only_target_section():
+    """Test that splicing leaves every other section byte-for-byte unchanged."""
+    result = splice_resume_sections(
+        current_content=SPLICE_CONTENT,
+        serialized_sections={"education": "# Education\n\nSchool: New School\n"},
+    )
+
+    assert result == (
+        "# Personal\n\nName:   Odd  Spacing\n\n"
+        "# Education\n\nSchool: New School\n\n"
+        "# Experience\n\nCompany: Keep Me\n"
+    )
+
+
+def test_splice_resume_sections_last_section_and_multiple_sections():
+    """Test replacing several sections, including the final one."""
+    result = splice_resume_sections(
+        current_content=SPLICE_CONTENT,
+        serialized_sections={
+            "experience": "# Experience\n\nCompany: New Co\n\n",
+            "personal": "# Personal\n\nName: Jane\n",
+        },
+    )
+
+    assert result == (
+        "# Personal\n\nName: Jane\n\n"
+        "# Education\n\nSchool: Old School\n\n"
+        "# Experience\n\nCompany: New Co\n"
+    )
+
+
+def test_splice_resume_sections_removes_empty_section():
+    """Test that an empty serialized section removes the original section."""
+    result = splice_resume_sections(
+        current_content=SPLICE_CONTENT,
+        serialized_sections={"education": ""},
+    )
+
+    assert "# Education" not in result
+    assert result.startswith("# Personal\n\nName:   Odd  Spacing\n\n# Experience")
+
+
+def test_splice_resume_sections_missing_section_returns_none():
+    """Test that a section absent from the content cannot be spliced."""
+    result = splice_resume_sections(
+        current_content=SPLICE_CONTENT,
+        serialized_sections={"certifications": "# Certifications\n"},
+    )
+
+    assert result is None
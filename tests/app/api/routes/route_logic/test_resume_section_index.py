@@ -0,0 +1,127 @@
+import textwrap
+
+import pytest
+
+from resume_editor.app.api.routes.route_logic.resume_section_index import (
+    SectionIndex,
+    SectionSpan,
+    get_section_index,
+)
+
+RESUME_CONTENT = textwrap.dedent(
+    """\
+    Leading junk
+    # Personal
+    ## Contact Information
+    Name: Jane Doe
+
+    # EDUCATION
+    School: A School
+    # Experience
+    """
+)
+
+
+def test_build_records_top_level_sections_in_order():
+    """Test that build records every top-level header with its offsets."""
+    index = SectionIndex.build(RESUME_CONTENT)
+
+    assert [span.name for span in index.spans] == [
+        "personal",
+        "education",
+        "experience",
+    ]
+    personal = index.spans[0]
+    assert RESUME_CONTENT[personal.start : personal.body_start] == "# Personal\n"
+    assert personal.end == index.spans[1].start
+    assert index.spans[-1].end == len(RESUME_CONTENT)
+
+
+def test_build_ignores_subsection_headers():
+    """Test that ## headers are treated as section content."""
+    index = SectionIndex.build("# Personal\n## Banner\nText")
+
+    assert len(index.spans) == 1
+    assert index.section_body("personal") == "## Banner\nText"
+
+
+def test_get_is_case_insensitive_and_returns_first_occurrence():
+    """Test lookup by name ignores case and prefers the first duplicate."""
+    index = SectionIndex.build("# Notes\nfirst\n# notes\nsecond\n")
+
+    span = index.get("NOTES")
+
+    assert span == SectionSpan(name="notes", start=0, body_start=8, end=14)
+    assert index.get("missing") is None
+
+
+def test_raw_section_includes_header_without_final_terminator():
+    """Test raw_section returns the header and body lines joined by newlines."""
+    index = SectionIndex.build(RESUME_CONTENT)
+
+    assert index.raw_section("personal") == (
+        "# Personal\n## Contact Information\nName: Jane Doe\n"
+    )
+    assert index.raw_section("education") == "# EDUCATION\nSchool: A School"
+    assert index.raw_section("certifications") == ""
+
+
+def test_raw_subsection_stops_at_next_level_two_header():
+    """Test raw_subsection slices one ## subsection from its parent section."""
+    index = SectionIndex.build(
+        "# Experience\n## Roles\n### Role\n## Projects\n### Project\n"
+        "Title: P\n# Personal\n## Projects\nNot experience\n"
+    )
+
+    assert index.raw_subsection("experience", "projects") == (
+        "## Projects\n### Project\nTitle: P"
+    )
+    assert index.raw_subsection("experience", "roles") == "## Roles\n### Role"
+    assert index.raw_subsection("experience", "missing") == ""
+    assert index.raw_subsection("education", "projects") == ""
+
+
+def test_section_body_and_has_content():
+    """Test section body slicing and the non-blank content check."""
+    index = SectionIndex.build(RESUME_CONTENT)
+
+    assert index.section_body("education") == "School: A School\n"
+    assert index.section_body("certifications") is None
+    assert index.has_content("education") is True
+    assert index.has_content("experience") is False
+    assert index.has_content("certifications") is False
+
+
+def test_header_at_end_without_newline():
+    """Test a trailing header with no line terminator has an empty body."""
+    index = SectionIndex.build("# Personal\nName: Me\n# Education")
+
+    span = index.get("education")
+    assert span.body_start == span.end == len("# Personal\nName: Me\n# Education")
+    assert index.section_body("education") == ""
+
+
+def test_first_of_returns_earliest_matching_section():
+    """Test first_of finds the first section in document order."""
+    index = SectionIndex.build(RESUME_CONTENT)
+
+    assert index.first_of({"experience", "education"}).name == "education"
+    assert index.first_of({"projects"}) is None
+
+
+def test_get_section_index_reuses_index_for_same_content():
+    """Test that the shared builder memoizes the index per content."""
+    first = get_section_index(RESUME_CONTENT)
+    second = get_section_index(RESUME_CONTENT)
+
+    assert first is second
+    assert get_section_index("# Personal\n") is not first
+
+
+@pytest.mark.parametrize("content", ["", "Just some text\n## Not top level\n"])
+def test_build_content_without_headers_has_no_spans(content):
+    """Test that empty or header-less content yields an empty index."""
+    index = SectionIndex.build(content)
+
+    assert index.spans == ()
+    assert index.raw_section("personal") == ""
@@ -22,6 +22,8 @@ from resume_editor.app.api.routes.route_logic.resume_serialization_helpers impor
     _convert_writer_role_to_dict,
     _extract_data_from_personal_section,
     _parse_resume,
+    _projects_scoped_content,
+    _section_scoped_content,
 )
 from resume_editor.app.api.routes.route_models import PersonalInfoResponse
 from resume_editor.app.models.resume.experience import InclusionStatus
@@ -33,12 +35,11 @@ from resume_editor.app.models.resume.personal import Banner, Note
 )
 def test_parse_resume_success(mock_parse):
     """Test _parse_resume successfully parses content."""
-    mock_resume = Mock()
-    mock_parse.return_value = mock_resume
+    mock_parse.return_value = {"personal": {"name": "Parsed"}}
 
     result = _parse_resume("some content")
 
-    assert result is mock_resume
+    assert result == {"personal": {"name": "Parsed"}}
     mock_parse.assert_called_once()
 
 
@@ -54,6 +55,21 @@ def test_parse_resume_failure(mock_parse):
     mock_parse.assert_called_once()
 
 
+@patch(
+    "resume_editor.app.api.routes.route_logic.resume_serialization_helpers.WriterResume.parse"
+)
+def test_parse_resume_reuses_cached_parse(mock_parse):
+    """Test _parse_resume parses identical content only once and hands out copies."""
+    mock_parse.return_value = {"personal": {"name": "Cached"}}
+
+    first = _parse_resume("same content")
+    second = _parse_resume("same content")
+
+    mock_parse.assert_called_once()
+    assert first == second
+    assert first is not second
+
+
 class TestCheckForUnparsedContent:
     @pytest.mark.parametrize("section_name", ["personal", "experience", "education"])
     def test_parsed_section_exists(self, section_name):
@@ -743,3 +759,60 @@ class TestAddRoleSkillsMarkdown:
         lines = []
         _add_role_skills_markdown(skills, lines)
         assert lines == []
+
+
+SCOPED_RESUME_CONTENT = textwrap.dedent(
+    """\
+    # Personal
+    ## Contact Information
+    Name: Jane Doe
+
+    # Experience
+    ## Roles
+    ### Role
+    #### Basics
+    Company: A Company
+
+    ## Projects
+    ### Project
+    #### Overview
+    Title: A Project
+
+    # Certifications
+    ## Certification
+    Name: A Cert
+    """
+)
+
+
+def test_section_scoped_content_slices_single_section():
+    """Test that a known section is sliced out of the full content."""
+    result = _section_scoped_content(SCOPED_RESUME_CONTENT, "personal")
+    assert result == "# Personal\n## Contact Information\nName: Jane Doe\n"
+
+
+def test_section_scoped_content_falls_back_to_full_content():
+    """Test that absent or unknown sections parse the whole content."""
+    assert (
+        _section_scoped_content(SCOPED_RESUME_CONTENT, "education")
+        == SCOPED_RESUME_CONTENT
+    )
+    assert (
+        _section_scoped_content(SCOPED_RESUME_CONTENT, "unknown")
+        == SCOPED_RESUME_CONTENT
+    )
+
+
+def test_projects_scoped_content_excludes_roles():
+    """Test that only the projects subsection is kept under an experience header."""
+    result = _projects_scoped_content(SCOPED_RESUME_CONTENT)
+    assert result.startswith("# Experience\n\n## Projects\n")
+    assert "Title: A Project" in result
+    assert "Company: A Company" not in result
+    assert "Name: A Cert" not in result
+
+
+def test_projects_scoped_content_without_projects_uses_experience():
+    """Test that the experience section is used when there is no projects subsection."""
+    content = "# Experience\n## Roles\n### Role\n"
+    assert _projects_scoped_content(content) == "# Experience\n## Roles\n### Role"
@@ -0,0 +1,276 @@
+import textwrap
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from resume_editor.app.api.routes.route_logic.resume_parse_cache import content_hash
+from resume_editor.app.api.routes.route_logic.resume_structured_data import (
+    STRUCTURED_DATA_VERSION,
+    backfill_structured_data,
+    build_structured_data,
+    build_validated_structured_data,
+    load_all_sections,
+    load_resume_section,
+    load_section_data,
+    refresh_structured_data,
+)
+from resume_editor.app.api.routes.route_models import (
+    CertificationsResponse,
+    EducationResponse,
+    ExperienceResponse,
+    PersonalInfoResponse,
+    ProjectsResponse,
+)
+
+VALID_RESUME = textwrap.dedent(
+    """\
+    # Personal
+
+    ## Contact Information
+
+    Name: Test Person
+
+    # Education
+
+    ## Degrees
+
+    ### Degree
+
+    School: A School
+
+    # Certifications
+
+    ## Certification
+
+    Name: A Cert
+
+    # Experience
+
+    ## Roles
+
+    ### Role
+
+    #### Basics
+
+    Company: A Company
+    Title: A Role
+    Start date: 01/2024
+
+    ## Projects
+
+    ### Project
+
+    #### Overview
+
+    Title: A Cool Project
+    """
+)
+
+MODULE = "resume_editor.app.api.routes.route_logic.resume_structured_data"
+
+
+def _make_resume(content: str = VALID_RESUME) -> SimpleNamespace:
+    """Build a stand-in resume with current structured data for its content."""
+    resume = SimpleNamespace(
+        content=content,
+        structured_data=None,
+        structured_data_version=None,
+    )
+    refresh_structured_data(resume)
+    return resume
+
+
+def test_build_structured_data_records_hash_and_sections():
+    """Test that the stored representation holds the content hash and all sections."""
+    data = build_structured_data(VALID_RESUME)
+
+    assert data["content_hash"] == content_hash(VALID_RESUME)
+    assert set(data["sections"]) == {
+        "personal",
+        "education",
+        "experience",
+        "certifications",
+    }
+    assert data["sections"]["personal"]["name"] == "Test Person"
+
+
+@patch(f"{MODULE}.extract_all_sections", side_effect=ValueError("bad"))
+def test_build_structured_data_returns_none_on_parse_error(mock_extract_all):
+    """Test that unparseable content yields no structured data."""
+    assert build_structured_data("garbage") is None
+    mock_extract_all.assert_called_once_with("garbage")
+
+
+@patch(f"{MODULE}.validate_resume_content")
+def test_build_validated_structured_data_validates_then_builds(mock_validate):
+    """Test that content is validated against the original before being built."""
+    data = build_validated_structured_data(VALID_RESUME, original_content="old")
+
+    mock_validate.assert_called_once_with(VALID_RESUME, original_content="old")
+    assert data["content_hash"] == content_hash(VALID_RESUME)
+
+
+@patch(f"{MODULE}.build_structured_data")
+@patch(f"{MODULE}.validate_resume_content", side_effect=HTTPException(status_code=422))
+def test_build_validated_structured_data_skips_build_on_invalid(
+    mock_validate,
+    mock_build,
+):
+    """Test that invalid content raises before any structured data is built."""
+    with pytest.raises(HTTPException):
+        build_validated_structured_data("garbage")
+
+    mock_validate.assert_called_once_with("garbage", original_content=None)
+    mock_build.assert_not_called()
+
+
+def test_refresh_structured_data_sets_columns():
+    """Test that refresh assigns the data and the current version."""
+    resume = _make_resume()
+
+    assert resume.structured_data_version == STRUCTURED_DATA_VERSION
+    assert resume.structured_data["content_hash"] == content_hash(VALID_RESUME)
+
+
+@pytest.mark.parametrize(
+    ("section_name", "model"),
+    [
+        ("personal", PersonalInfoResponse),
+        ("education", EducationResponse),
+        ("experience", ExperienceResponse),
+        ("certifications", CertificationsResponse),
+        ("projects", ProjectsResponse),
+    ],
+)
+def test_load_resume_section_serves_from_stored_data(section_name, model):
+    """Test that current stored data is served without parsing the Markdown."""
+    resume = _make_resume()
+
+    with patch(f"{MODULE}._SECTION_EXTRACTORS") as mock_extractors:
+        result = load_resume_section(resume, section_name)
+
+    mock_extractors.__getitem__.assert_not_called()
+    assert isinstance(result, model)
+
+
+def test_load_resume_section_round_trips_stored_sections():
+    """Test that stored sections match a fresh parse of the content."""
+    resume = _make_resume()
+
+    experience = load_resume_section(resume, "experience")
+    projects = load_resume_section(resume, "projects")
+
+    assert len(experience.roles) == 1
+    assert experience.roles[0].basics.company == "A Company"
+    assert projects.projects == experience.projects
+    assert load_resume_section(resume, "personal").name == "Test Person"
+
+
+@pytest.mark.parametrize(
+    "stale_change",
+    [
+        {"structured_data_version": None},
+        {"structured_data_version": STRUCTURED_DATA_VERSION + 1},
+        {"structured_data": None},
+        {"content": VALID_RESUME.replace("Test Person", "Other Person")},
+    ],
+)
+def test_load_resume_section_parses_when_stale(stale_change):
+    """Test that missing, old, or mismatched stored data falls back to parsing."""
+    resume = _make_resume()
+    for field, value in stale_change.items():
+        setattr(resume, field, value)
+    parsed = PersonalInfoResponse(name="Parsed")
+
+    with patch.dict(
+        f"{MODULE}._SECTION_EXTRACTORS",
+        {"personal": Mock(return_value=parsed)},
+    ):
+        result = load_resume_section(resume, "personal")
+
+    assert result is parsed
+
+
+def test_load_resume_section_parses_when_stored_section_invalid():
+    """Test that a stored section failing validation falls back to parsing."""
+    resume = _make_resume()
+    resume.structured_data["sections"]["education"] = {"degrees": "not-a-list"}
+    parsed = EducationResponse(degrees=[])
+    mock_extract = Mock(return_value=parsed)
+
+    with patch.dict(f"{MODULE}._SECTION_EXTRACTORS", {"education": mock_extract}):
+        result = load_resume_section(resume, "education")
+
+    assert result is parsed
+    mock_extract.assert_called_once_with(resume.content)
+
+
+@patch(f"{MODULE}.refresh_structured_data")
+def test_backfill_structured_data_refreshes_stale_resumes(mock_refresh):
+    """Test that backfill refreshes every stale resume and commits once."""
+    stale_resumes = [Mock(), Mock()]
+    mock_db = Mock()
+    mock_db.query.return_value.filter.return_value.all.return_value = stale_resumes
+
+    count = backfill_structured_data(db=mock_db)
+
+    assert count == 2
+    assert [call.args[0] for call in mock_refresh.call_args_list] == stale_resumes
+    mock_db.commit.assert_called_once()
+
+
+def test_load_section_data_uses_column_values():
+    """Test that sections load from plain column values without a resume object."""
+    data = build_structured_data(VALID_RESUME)
+
+    result = load_section_data(
+        VALID_RESUME,
+        data,
+        STRUCTURED_DATA_VERSION,
+        "certifications",
+    )
+
+    assert result.certifications[0].name == "A Cert"
+
+
+@patch(f"{MODULE}.extract_all_sections")
+def test_load_all_sections_uses_stored_data(mock_extract_all):
+    """Test that all sections load from current stored data without parsing."""
+    data = build_structured_data(VALID_RESUME)
+
+    result = load_all_sections(
+        content=VALID_RESUME,
+        structured_data=data,
+        structured_data_version=STRUCTURED_DATA_VERSION,
+    )
+
+    assert result.personal.name == "Test Person"
+    assert result.experience.projects[0].overview.title == "A Cool Project"
+    mock_extract_all.assert_not_called()
+
+
+@pytest.mark.parametrize("stale_change", ["content", "version", "invalid"])
+def test_load_all_sections_parses_when_stored_data_unusable(stale_change):
+    """Test that stale or invalid stored data falls back to parsing the content."""
+    data = build_structured_data(VALID_RESUME)
+    content = VALID_RESUME
+    version = STRUCTURED_DATA_VERSION
+    if stale_change == "content":
+        content = VALID_RESUME + "\n"
+    elif stale_change == "version":
+        version = STRUCTURED_DATA_VERSION - 1
+    else:
+        data["sections"]["education"] = {"degrees": "not-a-list"}
+    parsed = Mock()
+
+    with patch(f"{MODULE}.extract_all_sections", return_value=parsed) as mock_extract_all:
+        result = load_all_sections(
+            content=content,
+            structured_data=data,
+            structured_data_version=version,
+        )
+
+    assert result is parsed
+    mock_extract_all.assert_called_once_with(content)
@@ -1,11 +1,19 @@
 import logging
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from resume_editor.app.api.routes.route_logic.settings_crud import (
+    format_fallback_endpoints,
     get_user_settings,
+    parse_fallback_endpoints,
     update_user_settings,
 )
-from resume_editor.app.models.user_settings import UserSettings
+from resume_editor.app.llm.models import LLMEndpoint
+from resume_editor.app.models.user_settings import (
+    UserSettings,
+    UserSettingsData,
+)
 from resume_editor.app.schemas.user import UserSettingsUpdateRequest
 
 log = logging.getLogger(__name__)
@@ -18,7 +26,7 @@ def test_get_user_settings_found():
     # Arrange
     db = MagicMock()
     user_id = 1
-    expected_settings = UserSettings(user_id=user_id)
+    expected_settings = UserSettings(data=UserSettingsData(user_id=user_id))
     db.query.return_value.filter.return_value.first.return_value = expected_settings
 
     # Act
@@ -88,7 +96,9 @@ def test_update_user_settings_update_existing_llm_model_name(mock_get_settings):
     # Arrange
     db = MagicMock()
     user_id = 1
-    existing_settings = UserSettings(user_id=user_id, llm_model_name="old-model")
+    existing_settings = UserSettings(
+        data=UserSettingsData(user_id=user_id, llm_model_name="old-model"),
+    )
     mock_get_settings.return_value = existing_settings
     settings_data = type(
         "MockSettings", (), {"llm_model_name": "new-model", "llm_endpoint": None, "api_key": None}
@@ -114,7 +124,9 @@ def test_update_user_settings_clear_llm_model_name(mock_get_settings):
     # Arrange
     db = MagicMock()
     user_id = 1
-    existing_settings = UserSettings(user_id=user_id, llm_model_name="some-model")
+    existing_settings = UserSettings(
+        data=UserSettingsData(user_id=user_id, llm_model_name="some-model"),
+    )
     mock_get_settings.return_value = existing_settings
     settings_data = type(
         "MockSettings", (), {"llm_model_name": "", "llm_endpoint": None, "api_key": None}
@@ -143,7 +155,9 @@ def test_update_user_settings_no_change_to_llm_model_name(
     # Arrange
     db = MagicMock()
     user_id = 1
-    existing_settings = UserSettings(user_id=user_id, llm_model_name="stable-model")
+    existing_settings = UserSettings(
+        data=UserSettingsData(user_id=user_id, llm_model_name="stable-model"),
+    )
     mock_get_settings.return_value = existing_settings
     mock_encrypt.return_value = "encrypted-key"
 
@@ -172,7 +186,9 @@ def test_update_user_settings_update_llm_endpoint(mock_get_settings):
     # Arrange
     db = MagicMock()
     user_id = 1
-    existing_settings = UserSettings(user_id=user_id, llm_endpoint="old-endpoint")
+    existing_settings = UserSettings(
+        data=UserSettingsData(user_id=user_id, llm_endpoint="old-endpoint"),
+    )
     mock_get_settings.return_value = existing_settings
     settings_data = UserSettingsUpdateRequest(llm_endpoint="new-endpoint")
 
@@ -195,7 +211,9 @@ def test_update_user_settings_clear_llm_endpoint(mock_get_settings):
     # Arrange
     db = MagicMock()
     user_id = 1
-    existing_settings = UserSettings(user_id=user_id, llm_endpoint="old-endpoint")
+    existing_settings = UserSettings(
+        data=UserSettingsData(user_id=user_id, llm_endpoint="old-endpoint"),
+    )
     mock_get_settings.return_value = existing_settings
     settings_data = UserSettingsUpdateRequest(llm_endpoint="")
 
@@ -221,7 +239,9 @@ def test_update_user_settings_preserves_api_key_with_empty_string(
     # Arrange
     db = MagicMock()
     user_id = 1
-    existing_settings = UserSettings(user_id=user_id, encrypted_api_key="old-key")
+    existing_settings = UserSettings(
+        data=UserSettingsData(user_id=user_id, encrypted_api_key="old-key"),
+    )
     mock_get_settings.return_value = existing_settings
     settings_data = UserSettingsUpdateRequest(api_key="")
 
@@ -249,7 +269,9 @@ def test_update_user_settings_preserves_api_key_with_none(
     # Arrange
     db = MagicMock()
     user_id = 1
-    existing_settings = UserSettings(user_id=user_id, encrypted_api_key="old-key")
+    existing_settings = UserSettings(
+        data=UserSettingsData(user_id=user_id, encrypted_api_key="old-key"),
+    )
     mock_get_settings.return_value = existing_settings
     # The Pydantic model defaults api_key to None if not provided
     settings_data = UserSettingsUpdateRequest(
@@ -267,3 +289,152 @@ def test_update_user_settings_preserves_api_key_with_none(
     db.commit.assert_called_once()
     db.refresh.assert_called_once_with(existing_settings)
     assert result == existing_settings
+
+
+@patch("resume_editor.app.api.routes.route_logic.settings_crud.get_user_settings")
+def test_update_user_settings_fallback_endpoints(mock_get_settings):
+    """
+    Test Case: Fallback endpoints are stored in order, left alone when None is
+    provided, and cleared by an empty list.
+    """
+    # Arrange
+    db = MagicMock()
+    user_id = 1
+    existing_settings = UserSettings(data=UserSettingsData(user_id=user_id))
+    mock_get_settings.return_value = existing_settings
+    fallbacks = [
+        LLMEndpoint(llm_endpoint="http://backup/v1", llm_model_name="small"),
+        LLMEndpoint(llm_endpoint="http://spare/v1"),
+    ]
+
+    # Act & Assert
+    update_user_settings(
+        db=db,
+        user_id=user_id,
+        settings_data=UserSettingsUpdateRequest(llm_fallback_endpoints=fallbacks),
+    )
+    assert existing_settings.llm_fallback_endpoints == [
+        {
+            "llm_endpoint": "http://backup/v1",
+            "llm_model_name": "small",
+            "encrypted_api_key": None,
+        },
+        {
+            "llm_endpoint": "http://spare/v1",
+            "llm_model_name": None,
+            "encrypted_api_key": None,
+        },
+    ]
+
+    update_user_settings(
+        db=db,
+        user_id=user_id,
+        settings_data=UserSettingsUpdateRequest(llm_model_name="model"),
+    )
+    assert len(existing_settings.llm_fallback_endpoints) == 2
+
+    update_user_settings(
+        db=db,
+        user_id=user_id,
+        settings_data=UserSettingsUpdateRequest(llm_fallback_endpoints=[]),
+    )
+    assert existing_settings.llm_fallback_endpoints is None
+
+
+@patch("resume_editor.app.api.routes.route_logic.settings_crud.encrypt_data")
+@patch("resume_editor.app.api.routes.route_logic.settings_crud.get_user_settings")
+def test_update_user_settings_fallback_api_keys(mock_get_settings, mock_encrypt):
+    """
+    Test Case: A fallback's own API key is stored encrypted, and a fallback
+    saved again without a key keeps the key stored for its URL.
+    """
+    # Arrange
+    db = MagicMock()
+    existing_settings = UserSettings(
+        data=UserSettingsData(
+            user_id=1,
+            llm_fallback_endpoints=[
+                {
+                    "llm_endpoint": "http://spare/v1",
+                    "llm_model_name": None,
+                    "encrypted_api_key": "spare-encrypted",
+                },
+            ],
+        ),
+    )
+    mock_get_settings.return_value = existing_settings
+    mock_encrypt.return_value = "backup-encrypted"
+    fallbacks = [
+        LLMEndpoint(llm_endpoint="http://backup/v1", api_key="backup-key"),
+        LLMEndpoint(llm_endpoint="http://spare/v1", llm_model_name="small"),
+        LLMEndpoint(llm_endpoint="http://other/v1"),
+    ]
+
+    # Act
+    update_user_settings(
+        db=db,
+        user_id=1,
+        settings_data=UserSettingsUpdateRequest(llm_fallback_endpoints=fallbacks),
+    )
+
+    # Assert
+    mock_encrypt.assert_called_once_with(data="backup-key")
+    assert [
+        (stored["llm_endpoint"], stored["encrypted_api_key"])
+        for stored in existing_settings.llm_fallback_endpoints
+    ] == [
+        ("http://backup/v1", "backup-encrypted"),
+        ("http://spare/v1", "spare-encrypted"),
+        ("http://other/v1", None),
+    ]
+
+
+def test_parse_fallback_endpoints():
+    """
+    Test Case: Each non-blank line becomes an endpoint with an optional model
+    and API key.
+    """
+    assert parse_fallback_endpoints(None) is None
+    assert parse_fallback_endpoints("  \n") == []
+    assert parse_fallback_endpoints(
+        "https://backup/v1 small\n\n  http://spare/v1  \nhttp://own/v1 key=sk-own\n"
+        "http://both/v1 big key=sk-both",
+    ) == [
+        LLMEndpoint(llm_endpoint="https://backup/v1", llm_model_name="small"),
+        LLMEndpoint(llm_endpoint="http://spare/v1"),
+        LLMEndpoint(llm_endpoint="http://own/v1", api_key="sk-own"),
+        LLMEndpoint(llm_endpoint="http://both/v1", llm_model_name="big", api_key="sk-both"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["backup/v1 small", "http://backup/v1 a b", "http://backup/v1 a b key=sk"],
+)
+def test_parse_fallback_endpoints_invalid(text):
+    """
+    Test Case: Lines without an http(s) URL or with extra fields are rejected.
+    """
+    with pytest.raises(ValueError, match="fallback endpoint"):
+        parse_fallback_endpoints(text)
+
+
+def test_format_fallback_endpoints():
+    """
+    Test Case: Stored endpoints are shown one per line, as they are entered,
+    without their API keys.
+    """
+    assert format_fallback_endpoints(None) == ""
+    assert (
+        format_fallback_endpoints(
+            [
+                {"llm_endpoint": "http://backup/v1", "llm_model_name": "small"},
+                {
+                    "llm_endpoint": "http://spare/v1",
+                    "llm_model_name": None,
+                    "encrypted_api_key": "spare-encrypted",
+                },
+            ],
+        )
+        == "http://backup/v1 small\nhttp://spare/v1"
+    )
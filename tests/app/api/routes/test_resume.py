@@ -242,7 +242,10 @@ def test_delete_resume_not_found(client_with_auth_no_resume):
     assert response.json() == {"detail": "Resume not found"}
 
 
-@patch("resume_editor.app.api.routes.resume.validate_resume_content")
+@patch(
+    "resume_editor.app.api.routes.resume.build_validated_structured_data",
+    return_value=None,
+)
 def test_update_resume_name_only_no_htmx(
     mock_validate, client_with_auth_and_resume, test_resume
 ):
@@ -256,7 +259,10 @@ def test_update_resume_name_only_no_htmx(
     mock_validate.assert_not_called()
 
 
-@patch("resume_editor.app.api.routes.resume.validate_resume_content")
+@patch(
+    "resume_editor.app.api.routes.resume.build_validated_structured_data",
+    return_value=None,
+)
 @patch("resume_editor.app.api.routes.resume.get_user_resumes")
 @patch("resume_editor.app.api.routes.resume._generate_resume_list_html")
 @patch("resume_editor.app.api.routes.resume._generate_resume_detail_html")
@@ -306,7 +312,9 @@ def test_update_resume_htmx(
     assert detail_div is not None
     assert detail_div.text == "detail_html"
 
-    mock_validate.assert_called_once_with(updated_content)
+    mock_validate.assert_called_once_with(
+        updated_content, original_content=VALID_MINIMAL_RESUME_CONTENT
+    )
 
     mock_get_resumes.assert_called_once_with(
         db=ANY, user_id=test_user.id, sort_by=expected_sort_by_val
@@ -327,7 +335,10 @@ def test_update_resume_htmx(
     mock_gen_detail_html.assert_called_once_with(resume=test_resume)
 
 
-@patch("resume_editor.app.api.routes.resume.validate_resume_content")
+@patch(
+    "resume_editor.app.api.routes.resume.build_validated_structured_data",
+    return_value=None,
+)
 def test_update_resume_details_from_editor(
     mock_validate, client_with_auth_and_resume, test_resume
 ):
@@ -349,7 +360,9 @@ def test_update_resume_details_from_editor(
     assert response.status_code == 200
     assert response.headers["HX-Redirect"] == "/dashboard"
     assert not response.content
-    mock_validate.assert_called_once_with(updated_content)
+    mock_validate.assert_called_once_with(
+        updated_content, original_content=VALID_MINIMAL_RESUME_CONTENT
+    )
 
 
 @patch("resume_editor.app.api.routes.resume.get_oldest_resume_date")
@@ -732,13 +745,17 @@ def test_get_resume(client_with_auth_and_resume, test_resume):
     assert settings_name_select.find("option", {"value": "executive_summary"})
 
 
-@patch("resume_editor.app.api.routes.resume.validate_resume_content")
+@patch(
+    "resume_editor.app.api.routes.resume.build_validated_structured_data",
+    return_value=None,
+)
 @patch("resume_editor.app.api.routes.resume.create_resume_db")
 def test_create_resume_no_htmx(
     mock_create_resume_db, mock_validate, client_with_auth_no_resume, test_user
 ):
     """Test creating a resume without HTMX returns a JSON response."""
-    mock_validate.return_value = None
+    structured_data = {"content_hash": "hash", "sections": {}}
+    mock_validate.return_value = structured_data
     resume_data = ResumeData(
         user_id=test_user.id,
         name="New Resume",
@@ -763,9 +780,13 @@ def test_create_resume_no_htmx(
     assert isinstance(params, ResumeCreateParams)
     assert params.name == "New Resume"
     assert params.content == VALID_MINIMAL_RESUME_CONTENT
+    assert params.structured_data == structured_data
 
 
-@patch("resume_editor.app.api.routes.resume.validate_resume_content")
+@patch(
+    "resume_editor.app.api.routes.resume.build_validated_structured_data",
+    return_value=None,
+)
 @patch("resume_editor.app.api.routes.resume.create_resume_db")
 def test_create_resume_htmx_redirect(
     mock_create_resume_db, mock_validate, client_with_auth_no_resume, test_user
@@ -798,7 +819,10 @@ def test_create_resume_htmx_redirect(
     assert params.content == VALID_MINIMAL_RESUME_CONTENT
 
 
-@patch("resume_editor.app.api.routes.resume.validate_resume_content")
+@patch(
+    "resume_editor.app.api.routes.resume.build_validated_structured_data",
+    return_value=None,
+)
 def test_update_resume_no_htmx(mock_validate, client_with_auth_and_resume, test_resume):
     """Test updating a resume without HTMX returns JSON success message."""
     mock_validate.return_value = None
@@ -808,7 +832,9 @@ def test_update_resume_no_htmx(mock_validate, client_with_auth_and_resume, test_
     )
     assert response.status_code == 200
     assert response.json()["name"] == "Updated Name"
-    mock_validate.assert_called_once_with(test_resume.content)
+    mock_validate.assert_called_once_with(
+        VALID_MINIMAL_RESUME_CONTENT, original_content=VALID_MINIMAL_RESUME_CONTENT
+    )
 
 
 def test_get_resume_htmx_renders_edit_button_for_all_resumes(
@@ -147,7 +147,7 @@ class TestExperienceRefinementStreamIntegration:
             self.mock_manager,
         ):
             with patch(
-                "resume_editor.app.api.routes.resume_ai.extract_experience_info",
+                "resume_editor.app.api.routes.resume_ai.load_section_data",
             ) as mock_extract:
                 mock_experience = Mock()
                 mock_experience.roles = [Mock()]
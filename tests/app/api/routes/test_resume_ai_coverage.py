@@ -13,8 +13,6 @@ from resume_editor.app.api.routes.route_logic.refinement_checkpoint import (
     RunningLog,
 )
 from resume_editor.app.llm.models import (
-    BannerBullet,
-    GeneratedBanner,
     JobAnalysis,
 )
 
@@ -56,79 +54,17 @@ class TestCalculateEducationRelevanceThemeMatching:
         assert score == 6
 
 
-class TestInvokeBannerGenerationChainSuccess:
-    """Tests for _invoke_banner_generation_chain success path - covers lines 1418-1423."""
-
-    @patch("resume_editor.app.llm.orchestration_banner.GeneratedBanner")
-    @patch("resume_editor.app.llm.orchestration_banner.ChatPromptTemplate")
-    @patch("langchain_core.output_parsers.StrOutputParser")
-    @patch("resume_editor.app.llm.orchestration_banner.parse_json_markdown")
-    def test_invoke_banner_chain_successful_parse_and_validate(
-        self,
-        mock_parse_json,
-        mock_str_parser,
-        mock_prompt_template,
-        mock_banner_model,
-    ):
-        """Test successful banner generation covering lines 1418-1423."""
-        from resume_editor.app.llm.orchestration_banner import (
-            _invoke_banner_generation_chain,
-        )
-
-        # Setup the mock chain using pipe operator
-        mock_prompt = MagicMock()
-        mock_prompt_partial = MagicMock()
-        mock_prompt.partial.return_value = mock_prompt_partial
-        mock_prompt_template.from_messages.return_value = mock_prompt
-
-        # Mock the pipe operations: prompt | llm | parser
-        mock_chain_after_prompt = MagicMock()
-        mock_prompt_partial.__or__ = MagicMock(return_value=mock_chain_after_prompt)
-
-        mock_chain_final = MagicMock()
-        mock_chain_after_prompt.__or__ = MagicMock(return_value=mock_chain_final)
-
-        mock_chain_final.invoke.return_value = '{"bullets": []}'
-
-        mock_parse_json.return_value = {
-            "bullets": [{"category": "Backend", "description": "Python expert"}],
-            "education_bullet": None,
-        }
-
-        expected_banner = GeneratedBanner(
-            bullets=[BannerBullet(category="Backend", description="Python expert")],
-            education_bullet=None,
-        )
-        mock_banner_model.model_validate.return_value = expected_banner
-
-        mock_llm = MagicMock()
-
-        result = _invoke_banner_generation_chain(
-            llm=mock_llm,
-            job_analysis=JobAnalysis(
-                key_skills=[],
-                primary_duties=[],
-                themes=[],
-            ),
-            refined_roles=[],
-            cross_section_evidence=[],
-            original_banner=None,
-        )
-
-        # Verify the chain was invoked and parsing/validation happened
-        mock_chain_final.invoke.assert_called_once()
-        mock_parse_json.assert_called_once()
-        mock_banner_model.model_validate.assert_called_once()
-        assert result == expected_banner
-
-
 class TestRefineRoleAndPutOnQueueProgressCallback:
     """Tests for progress callback in _refine_role_and_put_on_queue - covers line 293."""
 
     @pytest.mark.asyncio
+    @patch(
+        "resume_editor.app.llm.orchestration_refinement.role_refinement_cache_key",
+        return_value="role-key",
+    )
     @patch("resume_editor.app.llm.orchestration_refinement.refine_role")
     async def test_progress_callback_called_during_role_refinement(
-        self, mock_refine_role
+        self, mock_refine_role, _mock_cache_key
     ):
         """Test that progress callback is called - covers line 293."""
         import asyncio
@@ -199,12 +135,12 @@ class TestExperienceRefinementStreamException:
     @pytest.mark.asyncio
     @patch("resume_editor.app.api.routes.resume_ai.running_log_manager")
     @patch("resume_editor.app.api.routes.resume_ai.experience_refinement_sse_generator")
-    @patch("resume_editor.app.api.routes.resume_ai.extract_experience_info")
+    @patch("resume_editor.app.api.routes.resume_ai.load_section_data")
     @patch("resume_editor.app.api.routes.resume_ai._build_filtered_content_if_needed")
     async def test_exception_keeps_running_log(
         self,
         mock_build_filtered,
-        mock_extract_exp,
+        mock_load_experience,
         mock_generator,
         mock_running_log_manager,
     ):
@@ -230,7 +166,7 @@ class TestExperienceRefinementStreamException:
         mock_db = MagicMock()
 
         mock_build_filtered.return_value = "filtered content"
-        mock_extract_exp.return_value = MagicMock(roles=[MagicMock()])
+        mock_load_experience.return_value = MagicMock(roles=[MagicMock()])
 
         # Create generator that raises exception after yielding
         async def failing_generator(*args, **kwargs):
@@ -262,12 +198,12 @@ class TestExperienceRefinementStreamException:
     @pytest.mark.asyncio
     @patch("resume_editor.app.api.routes.resume_ai.running_log_manager")
     @patch("resume_editor.app.api.routes.resume_ai.experience_refinement_sse_generator")
-    @patch("resume_editor.app.api.routes.resume_ai.extract_experience_info")
+    @patch("resume_editor.app.api.routes.resume_ai.load_section_data")
     @patch("resume_editor.app.api.routes.resume_ai._build_filtered_content_if_needed")
     async def test_success_clears_running_log(
         self,
         mock_build_filtered,
-        mock_extract_exp,
+        mock_load_experience,
         mock_generator,
         mock_running_log_manager,
     ):
@@ -293,7 +229,7 @@ class TestExperienceRefinementStreamException:
         mock_db = MagicMock()
 
         mock_build_filtered.return_value = "filtered content"
-        mock_extract_exp.return_value = MagicMock(roles=[MagicMock()])
+        mock_load_experience.return_value = MagicMock(roles=[MagicMock()])
 
         # Create successful generator
         async def success_generator(*args, **kwargs):
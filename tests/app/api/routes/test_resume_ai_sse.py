@@ -160,19 +160,15 @@ async def test_refine_resume_stream_invalid_limit(
 @pytest.mark.asyncio
 @patch("resume_editor.app.api.routes.resume_ai.build_complete_resume_from_sections")
 @patch("resume_editor.app.api.routes.resume_ai.filter_experience_by_date")
-@patch("resume_editor.app.api.routes.resume_ai.extract_certifications_info")
-@patch("resume_editor.app.api.routes.resume_ai.extract_experience_info")
-@patch("resume_editor.app.api.routes.resume_ai.extract_education_info")
-@patch("resume_editor.app.api.routes.resume_ai.extract_personal_info")
+@patch("resume_editor.app.api.routes.resume_ai.load_section_data")
+@patch("resume_editor.app.api.routes.resume_ai.load_all_sections")
 @patch(
     "resume_editor.app.api.routes.resume_ai.experience_refinement_sse_generator",
 )
 async def test_refine_resume_stream_with_filtering(
     mock_sse_generator,
-    mock_extract_personal,
-    mock_extract_edu,
-    mock_extract_exp,
-    mock_extract_certs,
+    mock_load_all_sections,
+    mock_load_experience,
     mock_filter_exp,
     mock_build_resume,
     client_with_auth_and_resume,
@@ -203,12 +199,19 @@ async def test_refine_resume_stream_with_filtering(
         assert response.status_code == 200
         response.read()
 
-    mock_extract_personal.assert_called_once_with(test_resume.content)
-    mock_extract_edu.assert_called_once_with(test_resume.content)
-    # extract_experience_info is called in _build_filtered_content_if_needed,
-    # and again in _experience_refinement_stream
-    assert mock_extract_exp.call_count == 2
-    mock_extract_certs.assert_called_once_with(test_resume.content)
+    # All sections are extracted once in _build_filtered_content_if_needed,
+    # and experience is extracted again in _experience_refinement_stream
+    mock_load_all_sections.assert_called_once_with(
+        content=test_resume.content,
+        structured_data=test_resume.structured_data,
+        structured_data_version=test_resume.structured_data_version,
+    )
+    mock_load_experience.assert_called_once_with(
+        content="filtered content",
+        structured_data=test_resume.structured_data,
+        structured_data_version=test_resume.structured_data_version,
+        section_name="experience",
+    )
     mock_filter_exp.assert_called_once()
     mock_build_resume.assert_called_once()
 
@@ -226,14 +229,14 @@ async def test_refine_resume_stream_with_filtering(
 
 @pytest.mark.asyncio
 @patch(
-    "resume_editor.app.api.routes.resume_ai.extract_personal_info",
+    "resume_editor.app.api.routes.resume_ai.load_all_sections",
     side_effect=Exception("Kaboom!"),
 )
 @patch(
     "resume_editor.app.api.routes.resume_ai.experience_refinement_sse_generator",
 )
 async def test_refine_resume_stream_with_filtering_exception(
-    mock_sse_generator, mock_extract_personal, client_with_auth_and_resume
+    mock_sse_generator, mock_load_all_sections, client_with_auth_and_resume
 ):
     """
     Test that the stream refinement route handles exceptions during experience filtering.
@@ -255,26 +258,22 @@ async def test_refine_resume_stream_with_filtering_exception(
         assert "An error occurred while filtering experience." in content
         assert "event: close" in content
 
-    mock_extract_personal.assert_called_once()
+    mock_load_all_sections.assert_called_once()
     mock_sse_generator.assert_not_called()
 
 
 @pytest.mark.asyncio
 @patch("resume_editor.app.api.routes.resume_ai.build_complete_resume_from_sections")
 @patch("resume_editor.app.api.routes.resume_ai.filter_experience_by_date")
-@patch("resume_editor.app.api.routes.resume_ai.extract_certifications_info")
-@patch("resume_editor.app.api.routes.resume_ai.extract_experience_info")
-@patch("resume_editor.app.api.routes.resume_ai.extract_education_info")
-@patch("resume_editor.app.api.routes.resume_ai.extract_personal_info")
+@patch("resume_editor.app.api.routes.resume_ai.load_section_data")
+@patch("resume_editor.app.api.routes.resume_ai.load_all_sections")
 @patch(
     "resume_editor.app.api.routes.resume_ai.experience_refinement_sse_generator",
 )
 async def test_refine_resume_stream_get_no_roles_after_filtering(
     mock_sse_generator,
-    mock_extract_personal,
-    mock_extract_edu,
-    mock_extract_exp,
-    mock_extract_certs,
+    mock_load_all_sections,
+    mock_load_experience,
     mock_filter_exp,
     mock_build_resume,
     client_with_auth_and_resume,
@@ -283,11 +282,8 @@ async def test_refine_resume_stream_get_no_roles_after_filtering(
     Test that the GET SSE stream sends a warning and closes if no roles are left after filtering.
     """
     # Arrange
-    # This mock now applies to both calls to extract_experience_info
-    mock_extract_exp.side_effect = [
-        Mock(roles=[Mock()]),  # First call in _build_filtered_content_if_needed
-        Mock(roles=[]),  # Second call in _experience_refinement_stream
-    ]
+    mock_load_all_sections.return_value = Mock(experience=Mock(roles=[Mock()]))
+    mock_load_experience.return_value = Mock(roles=[])  # Call in _experience_refinement_stream
     mock_build_resume.return_value = "filtered content with no roles"
 
     params = {
@@ -306,26 +302,27 @@ async def test_refine_resume_stream_get_no_roles_after_filtering(
         assert "No roles available to refine within the specified date range." in content
         assert "event: close" in content
 
-    assert mock_extract_exp.call_count == 2
+    mock_load_all_sections.assert_called_once()
+    mock_load_experience.assert_called_once()
+    assert (
+        mock_load_experience.call_args.kwargs["content"]
+        == "filtered content with no roles"
+    )
     mock_sse_generator.assert_not_called()
 
 
 @pytest.mark.asyncio
 @patch("resume_editor.app.api.routes.resume_ai.build_complete_resume_from_sections")
 @patch("resume_editor.app.api.routes.resume_ai.filter_experience_by_date")
-@patch("resume_editor.app.api.routes.resume_ai.extract_certifications_info")
-@patch("resume_editor.app.api.routes.resume_ai.extract_experience_info")
-@patch("resume_editor.app.api.routes.resume_ai.extract_education_info")
-@patch("resume_editor.app.api.routes.resume_ai.extract_personal_info")
+@patch("resume_editor.app.api.routes.resume_ai.load_section_data")
+@patch("resume_editor.app.api.routes.resume_ai.load_all_sections")
 @patch(
     "resume_editor.app.api.routes.resume_ai.experience_refinement_sse_generator",
 )
 async def test_refine_resume_stream_post_no_roles_after_filtering(
     mock_sse_generator,
-    mock_extract_personal,
-    mock_extract_edu,
-    mock_extract_exp,
-    mock_extract_certs,
+    mock_load_all_sections,
+    mock_load_experience,
     mock_filter_exp,
     mock_build_resume,
     client_with_auth_and_resume,
@@ -334,11 +331,9 @@ async def test_refine_resume_stream_post_no_roles_after_filtering(
     Test that the POST SSE stream sends a warning and closes if no roles are left after filtering.
     """
     # Arrange
-    # First call inside _build_filtered_content_if_needed, second call in wrapper
-    mock_extract_exp.side_effect = [
-        Mock(roles=[Mock()]),  # has roles initially
-        Mock(roles=[]),  # no roles after filtering/parsing
-    ]
+    # Sections are extracted inside _build_filtered_content_if_needed
+    mock_load_all_sections.return_value = Mock(experience=Mock(roles=[Mock()]))
+    mock_load_experience.return_value = Mock(roles=[])  # no roles after filtering/parsing
     mock_build_resume.return_value = "filtered content with no roles"
 
     form_data = {
@@ -357,7 +352,12 @@ async def test_refine_resume_stream_post_no_roles_after_filtering(
         assert "No roles available to refine within the specified date range." in content
         assert "event: close" in content
 
-    assert mock_extract_exp.call_count == 2
+    mock_load_all_sections.assert_called_once()
+    mock_load_experience.assert_called_once()
+    assert (
+        mock_load_experience.call_args.kwargs["content"]
+        == "filtered content with no roles"
+    )
     mock_sse_generator.assert_not_called()
 
 
@@ -176,17 +176,13 @@ def test_refine_resume_stream_post_invalid_alpha_limit(
 
 @patch("resume_editor.app.api.routes.resume_ai.build_complete_resume_from_sections")
 @patch("resume_editor.app.api.routes.resume_ai.filter_experience_by_date")
-@patch("resume_editor.app.api.routes.resume_ai.extract_certifications_info")
-@patch("resume_editor.app.api.routes.resume_ai.extract_experience_info")
-@patch("resume_editor.app.api.routes.resume_ai.extract_education_info")
-@patch("resume_editor.app.api.routes.resume_ai.extract_personal_info")
+@patch("resume_editor.app.api.routes.resume_ai.load_section_data")
+@patch("resume_editor.app.api.routes.resume_ai.load_all_sections")
 @patch("resume_editor.app.api.routes.resume_ai.experience_refinement_sse_generator")
 def test_refine_resume_stream_post_with_filtering(
     mock_sse_generator,
-    mock_extract_personal,
-    mock_extract_edu,
-    mock_extract_exp,
-    mock_extract_certs,
+    mock_load_all_sections,
+    mock_load_experience,
     mock_filter_exp,
     mock_build_resume,
     client_with_auth_and_resume,
@@ -212,10 +208,17 @@ def test_refine_resume_stream_post_with_filtering(
         assert response.status_code == 200
         response.read()
 
-    mock_extract_personal.assert_called_once_with(test_resume.content)
-    mock_extract_edu.assert_called_once_with(test_resume.content)
-    assert mock_extract_exp.call_count == 2
-    mock_extract_certs.assert_called_once_with(test_resume.content)
+    mock_load_all_sections.assert_called_once_with(
+        content=test_resume.content,
+        structured_data=test_resume.structured_data,
+        structured_data_version=test_resume.structured_data_version,
+    )
+    mock_load_experience.assert_called_once_with(
+        content="filtered content",
+        structured_data=test_resume.structured_data,
+        structured_data_version=test_resume.structured_data_version,
+        section_name="experience",
+    )
     mock_filter_exp.assert_called_once()
     mock_build_resume.assert_called_once()
 
@@ -226,12 +229,12 @@ def test_refine_resume_stream_post_with_filtering(
 
 
 @patch(
-    "resume_editor.app.api.routes.resume_ai.extract_personal_info",
+    "resume_editor.app.api.routes.resume_ai.load_all_sections",
     side_effect=Exception("Kaboom!"),
 )
 @patch("resume_editor.app.api.routes.resume_ai.experience_refinement_sse_generator")
 def test_refine_resume_stream_post_filtering_exception(
-    mock_sse_generator, mock_extract_personal, client_with_auth_and_resume
+    mock_sse_generator, mock_load_all_sections, client_with_auth_and_resume
 ):
     """
     Test that POST stream route handles exceptions during filtering.
@@ -250,7 +253,7 @@ def test_refine_resume_stream_post_filtering_exception(
         assert "An error occurred while filtering experience." in content
         assert "event: close" in content
 
-    mock_extract_personal.assert_called_once()
+    mock_load_all_sections.assert_called_once()
     mock_sse_generator.assert_not_called()
 
 
@@ -93,15 +93,15 @@ def test_get_certifications_info_success(
 ):
     """Test successful retrieval of certifications info."""
     with patch(
-        "resume_editor.app.api.routes.resume_edit.extract_certifications_info",
-    ) as mock_extract:
-        mock_extract.return_value = CertificationsResponse(certifications=[])
+        "resume_editor.app.api.routes.resume_edit.load_resume_section",
+    ) as mock_load:
+        mock_load.return_value = CertificationsResponse(certifications=[])
         response = client_with_auth_and_resume.get(
             f"/api/resumes/{test_resume.id}/certifications"
         )
         assert response.status_code == 200
         assert response.json() == {"certifications": []}
-        mock_extract.assert_called_once_with(test_resume.content)
+        mock_load.assert_called_once_with(test_resume, "certifications")
 
 
 @patch("resume_editor.app.api.routes.resume_edit.update_resume_db")
@@ -209,18 +209,18 @@ def apply_form_update_patches(func):
 
 
 # Tests for update_certifications
-@patch("resume_editor.app.api.routes.resume_edit.extract_certifications_info")
+@patch("resume_editor.app.api.routes.resume_edit.load_section_data")
 @apply_form_update_patches
 def test_update_certifications_success(
     mock_update_db,
     mock_validate,
     mock_reconstruct,
-    mock_extract,
+    mock_load,
     client_with_auth_and_resume: TestClient,
     test_resume,
 ):
     """Test adding a new certification via form submission."""
-    mock_extract.return_value = CertificationsResponse(certifications=[])
+    mock_load.return_value = CertificationsResponse(certifications=[])
 
     form_data = {
         "name": "New Cert",
@@ -236,7 +236,12 @@ def test_update_certifications_success(
     assert response.status_code == 200
     assert response.headers["HX-Redirect"] == "/dashboard"
     assert not response.content
-    mock_extract.assert_called_once_with(test_resume.content)
+    mock_load.assert_called_once_with(
+        content=test_resume.content,
+        structured_data=test_resume.structured_data,
+        structured_data_version=test_resume.structured_data_version,
+        section_name="certifications",
+    )
 
     mock_reconstruct.assert_called_once()
     _, kwargs = mock_reconstruct.call_args
@@ -260,14 +265,14 @@ def test_update_certifications_invalid_data(
     assert "Failed to update certifications info" in response.json()["detail"]
 
 
-@patch("resume_editor.app.api.routes.resume_edit.extract_certifications_info")
+@patch("resume_editor.app.api.routes.resume_edit.load_section_data")
 def test_update_certifications_extraction_fails(
-    mock_extract,
+    mock_load,
     client_with_auth_and_resume: TestClient,
     test_resume,
 ):
     """Test that a parsing failure during certification creation via form is handled."""
-    mock_extract.side_effect = ValueError("Bad certifications section")
+    mock_load.side_effect = ValueError("Bad certifications section")
     form_data = {
         "name": "New Cert",
     }
@@ -90,15 +90,15 @@ def test_get_education_info_success(
 ):
     """Test successful retrieval of education info."""
     with patch(
-        "resume_editor.app.api.routes.resume_edit.extract_education_info"
-    ) as mock_extract:
-        mock_extract.return_value = EducationResponse(degrees=[])
+        "resume_editor.app.api.routes.resume_edit.load_resume_section"
+    ) as mock_load:
+        mock_load.return_value = EducationResponse(degrees=[])
         response = client_with_auth_and_resume.get(
             f"/api/resumes/{test_resume.id}/education"
         )
         assert response.status_code == 200
         assert response.json() == {"degrees": []}
-        mock_extract.assert_called_once_with(test_resume.content)
+        mock_load.assert_called_once_with(test_resume, "education")
 
 
 @patch("resume_editor.app.api.routes.resume_edit.update_resume_db")
@@ -171,7 +171,7 @@ def test_update_education_info_reconstruction_error(
 # Tests for update_education form
 
 
-@patch("resume_editor.app.api.routes.resume_edit.extract_education_info")
+@patch("resume_editor.app.api.routes.resume_edit.load_section_data")
 @patch(
     "resume_editor.app.api.routes.resume_edit.update_resume_db",
 )
@@ -185,7 +185,7 @@ def test_update_education_success_form(
     mock_reconstruct,
     mock_validate,
     mock_update_db,
-    mock_extract,
+    mock_load,
     client_with_auth_and_resume: TestClient,
     test_resume,
 ):
@@ -193,7 +193,7 @@ def test_update_education_success_form(
     from datetime import datetime
 
     mock_reconstruct.return_value = "Updated Content"
-    mock_extract.return_value = EducationResponse(degrees=[])
+    mock_load.return_value = EducationResponse(degrees=[])
 
     form_data = {
         "school": "New School",
@@ -208,7 +208,12 @@ def test_update_education_success_form(
     assert response.status_code == 200
     assert response.headers["HX-Redirect"] == "/dashboard"
     assert not response.content
-    mock_extract.assert_called_once_with(test_resume.content)
+    mock_load.assert_called_once_with(
+        content=test_resume.content,
+        structured_data=test_resume.structured_data,
+        structured_data_version=test_resume.structured_data_version,
+        section_name="education",
+    )
 
     mock_reconstruct.assert_called_once()
     _, kwargs = mock_reconstruct.call_args
@@ -232,14 +237,14 @@ def test_update_education_invalid_data_form(
     assert "Failed to update education info" in response.json()["detail"]
 
 
-@patch("resume_editor.app.api.routes.resume_edit.extract_education_info")
+@patch("resume_editor.app.api.routes.resume_edit.load_section_data")
 def test_update_education_extraction_fails_form(
-    mock_extract,
+    mock_load,
     client_with_auth_and_resume: TestClient,
     test_resume,
 ):
     """Test that a parsing failure during degree creation via form is handled."""
-    mock_extract.side_effect = ValueError("Bad education section")
+    mock_load.side_effect = ValueError("Bad education section")
     form_data = {
         "school": "New School",
         "degree": "BSc",
@@ -91,15 +91,20 @@ def test_get_experience_info_success(
     """Test successful retrieval of experience info."""
 
     with patch(
-        "resume_editor.app.api.routes.resume_edit.extract_experience_info",
-    ) as mock_extract:
-        mock_extract.return_value = ExperienceResponse(roles=[], projects=[])
+        "resume_editor.app.api.routes.resume_edit.load_section_data",
+    ) as mock_load:
+        mock_load.return_value = ExperienceResponse(roles=[], projects=[])
         response = client_with_auth_and_resume.get(
             f"/api/resumes/{test_resume.id}/experience"
         )
         assert response.status_code == 200
         assert response.json() == {"roles": [], "projects": []}
-        mock_extract.assert_called_once_with(test_resume.content)
+        mock_load.assert_called_once_with(
+            test_resume.content,
+            test_resume.structured_data,
+            test_resume.structured_data_version,
+            "experience",
+        )
 
 
 @patch("resume_editor.app.api.routes.resume_edit.update_resume_db")
@@ -192,7 +197,7 @@ def test_update_experience_info_reconstruction_error(
     mock_update_db.assert_not_called()
 
 
-@patch("resume_editor.app.api.routes.resume_edit.extract_experience_info")
+@patch("resume_editor.app.api.routes.resume_edit.load_section_data")
 @patch(
     "resume_editor.app.api.routes.resume_edit.update_resume_db",
 )
@@ -206,7 +211,7 @@ def test_update_experience_success_form(
     mock_reconstruct,
     mock_validate,
     mock_update_db,
-    mock_extract,
+    mock_load,
     client_with_auth_and_resume: TestClient,
     test_resume,
 ):
@@ -214,7 +219,7 @@ def test_update_experience_success_form(
     from resume_editor.app.api.routes.route_models import ExperienceResponse
 
     mock_reconstruct.return_value = "Updated Content"
-    mock_extract.return_value = ExperienceResponse(roles=[], projects=[])
+    mock_load.return_value = ExperienceResponse(roles=[], projects=[])
 
     form_data = {
         "company": "New Company",
@@ -229,7 +234,12 @@ def test_update_experience_success_form(
     assert response.status_code == 200
     assert response.headers["HX-Redirect"] == "/dashboard"
     assert not response.content
-    mock_extract.assert_called_once_with(test_resume.content)
+    mock_load.assert_called_once_with(
+        content=test_resume.content,
+        structured_data=test_resume.structured_data,
+        structured_data_version=test_resume.structured_data_version,
+        section_name="experience",
+    )
 
     mock_reconstruct.assert_called_once()
     _, kwargs = mock_reconstruct.call_args
@@ -252,16 +262,16 @@ def test_update_experience_invalid_data_form(
     assert "Failed to update experience info" in response.json()["detail"]
 
 
-@patch("resume_editor.app.api.routes.resume_edit.extract_experience_info")
+@patch("resume_editor.app.api.routes.resume_edit.load_section_data")
 def test_update_experience_extraction_fails_form(
-    mock_extract,
+    mock_load,
     client_with_auth_and_resume: TestClient,
     test_resume,
 ):
     """Test that a parsing failure during experience role creation via form is handled."""
     from resume_editor.app.api.routes.route_models import ExperienceResponse
 
-    mock_extract.side_effect = ValueError("Bad experience section")
+    mock_load.side_effect = ValueError("Bad experience section")
     form_data = {
         "company": "New Company",
         "title": "Developer",
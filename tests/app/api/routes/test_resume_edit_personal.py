@@ -1,10 +1,11 @@
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi import HTTPException
 from fastapi.testclient import TestClient
 
 from resume_editor.app.api.dependencies import get_db, get_resume_for_user
+from resume_editor.app.api.routes.resume_edit import _build_content_update
 from resume_editor.app.api.routes.route_logic.resume_crud import ResumeUpdateParams
 from resume_editor.app.api.routes.route_models import PersonalInfoResponse
 from resume_editor.app.main import create_app
@@ -92,9 +93,9 @@ def test_get_personal_info_success(
 ):
     """Test successful retrieval of personal info."""
     with patch(
-        "resume_editor.app.api.routes.resume_edit.extract_personal_info"
-    ) as mock_extract:
-        mock_extract.return_value = PersonalInfoResponse(name="Test User")
+        "resume_editor.app.api.routes.resume_edit.load_resume_section"
+    ) as mock_load:
+        mock_load.return_value = PersonalInfoResponse(name="Test User")
         response = client_with_auth_and_resume.get(
             f"/api/resumes/{test_resume.id}/personal"
         )
@@ -113,7 +114,7 @@ def test_get_personal_info_success(
             "banner": None,
             "note": None,
         }
-        mock_extract.assert_called_once_with(test_resume.content)
+        mock_load.assert_called_once_with(test_resume, "personal")
 
 
 @patch("resume_editor.app.api.routes.resume_edit.update_resume_db")
@@ -197,3 +198,59 @@ def test_update_personal_info_structured_validation_error(
         test_resume.content,
     )
     mock_update_db.assert_not_called()
+
+
+@patch("resume_editor.app.api.routes.resume_edit.update_resume_db")
+@patch(
+    "resume_editor.app.api.routes.resume_edit.run_parse_task",
+    new_callable=AsyncMock,
+)
+def test_update_personal_info_structured_runs_on_parse_executor(
+    mock_run_parse_task,
+    mock_update_db,
+    client_with_auth_and_resume: TestClient,
+    test_resume,
+):
+    """Test that reconstruction and validation are handed to the parse executor."""
+    update_params = ResumeUpdateParams(content="new updated content")
+    mock_run_parse_task.return_value = update_params
+
+    response = client_with_auth_and_resume.put(
+        f"/api/resumes/{test_resume.id}/personal",
+        json={"name": "new name"},
+    )
+
+    assert response.status_code == 200
+    mock_run_parse_task.assert_awaited_once()
+    args = mock_run_parse_task.call_args.args
+    assert args == (_build_content_update, test_resume.content)
+    assert mock_run_parse_task.call_args.kwargs["personal_info"].name == "new name"
+    assert mock_update_db.call_args.kwargs["params"] is update_params
+
+
+@patch("resume_editor.app.api.routes.resume_edit.build_structured_data")
+@patch("resume_editor.app.api.routes.resume_edit.perform_pre_save_validation")
+@patch(
+    "resume_editor.app.api.routes.resume_edit.update_resume_content_with_structured_data"
+)
+def test_build_content_update_includes_structured_data(
+    mock_update_content,
+    mock_validate,
+    mock_build,
+):
+    """Test that the update carries structured data built from the new content."""
+    mock_update_content.return_value = "new content"
+    mock_build.return_value = {"content_hash": "abc", "sections": {}}
+    personal_info = PersonalInfoResponse(name="new name")
+
+    params = _build_content_update("old content", personal_info=personal_info)
+
+    mock_update_content.assert_called_once_with(
+        current_content="old content",
+        incremental=True,
+        personal_info=personal_info,
+    )
+    mock_validate.assert_called_once_with("new content", "old content")
+    mock_build.assert_called_once_with("new content")
+    assert params.content == "new content"
+    assert params.structured_data == mock_build.return_value
@@ -6,7 +6,10 @@ from fastapi.testclient import TestClient
 
 from resume_editor.app.api.dependencies import get_db, get_resume_for_user
 from resume_editor.app.api.routes.route_logic.resume_crud import ResumeUpdateParams
-from resume_editor.app.api.routes.route_models import ExperienceResponse
+from resume_editor.app.api.routes.route_models import (
+    ExperienceResponse,
+    ProjectsResponse,
+)
 from resume_editor.app.main import create_app
 from resume_editor.app.models.resume_model import (
     Resume as DatabaseResume,
@@ -91,15 +94,15 @@ def test_get_projects_info_success(
 ):
     """Test successful retrieval of projects info."""
     with patch(
-        "resume_editor.app.api.routes.resume_edit.extract_experience_info",
-    ) as mock_extract:
-        mock_extract.return_value = ExperienceResponse(roles=[], projects=[])
+        "resume_editor.app.api.routes.resume_edit.load_resume_section",
+    ) as mock_load:
+        mock_load.return_value = ProjectsResponse(projects=[])
         response = client_with_auth_and_resume.get(
             f"/api/resumes/{test_resume.id}/projects"
         )
         assert response.status_code == 200
         assert response.json() == {"projects": []}
-        mock_extract.assert_called_once_with(test_resume.content)
+        mock_load.assert_called_once_with(test_resume, "projects")
 
 
 @patch("resume_editor.app.api.routes.resume_edit.update_resume_db")
@@ -229,18 +232,18 @@ def apply_form_update_patches(func):
 
 
 # Tests for update_projects
-@patch("resume_editor.app.api.routes.resume_edit.extract_experience_info")
+@patch("resume_editor.app.api.routes.resume_edit.load_section_data")
 @apply_form_update_patches
 def test_update_projects_success(
     mock_update_db,
     mock_validate,
     mock_reconstruct,
-    mock_extract,
+    mock_load,
     client_with_auth_and_resume: TestClient,
     test_resume,
 ):
     """Test adding a new project via form submission."""
-    mock_extract.return_value = ExperienceResponse(roles=[], projects=[])
+    mock_load.return_value = ExperienceResponse(roles=[], projects=[])
 
     form_data = {
         "title": "New Project",
@@ -254,7 +257,12 @@ def test_update_projects_success(
     assert response.status_code == 200
     assert response.headers["HX-Redirect"] == "/dashboard"
     assert not response.content
-    mock_extract.assert_called_once_with(test_resume.content)
+    mock_load.assert_called_once_with(
+        content=test_resume.content,
+        structured_data=test_resume.structured_data,
+        structured_data_version=test_resume.structured_data_version,
+        section_name="experience",
+    )
 
     mock_reconstruct.assert_called_once()
     _, kwargs = mock_reconstruct.call_args
@@ -280,14 +288,14 @@ def test_update_projects_invalid_data(
     assert "Failed to update projects info" in response.json()["detail"]
 
 
-@patch("resume_editor.app.api.routes.resume_edit.extract_experience_info")
+@patch("resume_editor.app.api.routes.resume_edit.load_section_data")
 def test_update_projects_extraction_fails(
-    mock_extract,
+    mock_load,
     client_with_auth_and_resume: TestClient,
     test_resume,
 ):
     """Test that a parsing failure during project creation via form is handled."""
-    mock_extract.side_effect = ValueError("Bad projects section")
+    mock_load.side_effect = ValueError("Bad projects section")
     form_data = {
         "title": "New Project",
         "description": "A cool project",
@@ -142,19 +142,12 @@ def test_export_resume_markdown_no_filter(
     ],
 )
 @patch(
-    "resume_editor.app.api.routes.resume_export.build_complete_resume_from_sections",
-    return_value=FILTERED_RESUME_CONTENT,
+    "resume_editor.app.api.routes.resume_export.iter_complete_resume_from_sections",
 )
 @patch("resume_editor.app.api.routes.resume_export.filter_experience_by_date")
-@patch("resume_editor.app.api.routes.resume_export.extract_certifications_info")
-@patch("resume_editor.app.api.routes.resume_export.extract_experience_info")
-@patch("resume_editor.app.api.routes.resume_export.extract_education_info")
-@patch("resume_editor.app.api.routes.resume_export.extract_personal_info")
+@patch("resume_editor.app.api.routes.resume_export.load_all_sections")
 def test_export_resume_markdown_with_filter(
-    mock_extract_personal,
-    mock_extract_education,
-    mock_extract_experience,
-    mock_extract_certs,
+    mock_load_all_sections,
     mock_filter_experience,
     mock_build_sections,
     client: TestClient,
@@ -164,41 +157,37 @@ def test_export_resume_markdown_with_filter(
     expected_end: date | None,
 ):
     """Test exporting a resume in Markdown format with date filtering."""
-    mock_personal = MagicMock()
-    mock_education = MagicMock()
-    mock_experience = MagicMock()
-    mock_certs = MagicMock()
+    mock_sections = MagicMock()
     mock_filtered_experience = MagicMock()
 
-    mock_extract_personal.return_value = mock_personal
-    mock_extract_education.return_value = mock_education
-    mock_extract_experience.return_value = mock_experience
-    mock_extract_certs.return_value = mock_certs
+    mock_load_all_sections.return_value = mock_sections
     mock_filter_experience.return_value = mock_filtered_experience
+    mock_build_sections.return_value = iter(["filtered ", "content"])
 
     response = client.get(url)
 
     assert response.status_code == 200
 
-    mock_extract_personal.assert_called_once_with(VALID_RESUME_CONTENT)
-    mock_extract_education.assert_called_once_with(VALID_RESUME_CONTENT)
-    mock_extract_experience.assert_called_once_with(VALID_RESUME_CONTENT)
-    mock_extract_certs.assert_called_once_with(VALID_RESUME_CONTENT)
+    mock_load_all_sections.assert_called_once_with(
+        content=VALID_RESUME_CONTENT,
+        structured_data=None,
+        structured_data_version=None,
+    )
 
     mock_filter_experience.assert_called_once_with(
-        mock_experience, expected_start, expected_end
+        mock_sections.experience, expected_start, expected_end
     )
     mock_build_sections.assert_called_once_with(
-        personal_info=mock_personal,
-        education=mock_education,
+        personal_info=mock_sections.personal,
+        education=mock_sections.education,
         experience=mock_filtered_experience,
-        certifications=mock_certs,
+        certifications=mock_sections.certifications,
     )
     assert response.text == FILTERED_RESUME_CONTENT
 
 
 @patch(
-    "resume_editor.app.api.routes.resume_export._get_filtered_resume_content",
+    "resume_editor.app.api.routes.resume_export._filtered_section_arguments",
     side_effect=ValueError("parsing failed"),
 )
 def test_export_resume_markdown_parsing_error(
@@ -467,7 +456,11 @@ def test_download_resume_with_filter(
     assert response.content == b"filtered docx"
 
     mock_get_filtered_content.assert_called_once_with(
-        VALID_RESUME_CONTENT, date(2021, 1, 1), None
+        VALID_RESUME_CONTENT,
+        date(2021, 1, 1),
+        None,
+        mock_resume.structured_data,
+        mock_resume.structured_data_version,
     )
 
     mock_get_settings.assert_called_once_with(RenderSettingsName.GENERAL.value)
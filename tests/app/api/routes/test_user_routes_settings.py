@@ -4,7 +4,10 @@ from unittest.mock import patch
 import pytest
 
 from resume_editor.app.api.routes.user import get_current_user
-from resume_editor.app.models.user_settings import UserSettings
+from resume_editor.app.models.user_settings import (
+    UserSettings,
+    UserSettingsData,
+)
 
 log = logging.getLogger(__name__)
 
@@ -37,6 +40,7 @@ def test_get_user_settings_when_no_settings_exist(settings_client):
         "llm_endpoint": None,
         "api_key_is_set": False,
         "access_token_expire_minutes": None,
+        "llm_fallback_endpoints": [],
     }
 
 
@@ -71,9 +75,11 @@ def test_get_user_settings_when_settings_exist(settings_client):
     # Test GET when settings exist
     mock_db.reset_mock()
     mock_settings = UserSettings(
-        user_id=1,
-        llm_endpoint="http://existing.com",
-        encrypted_api_key="existing_key",
+        data=UserSettingsData(
+            user_id=1,
+            llm_endpoint="http://existing.com",
+            encrypted_api_key="existing_key",
+        ),
     )
     mock_db.query.return_value.filter.return_value.first.return_value = mock_settings
     response = client.get("/api/users/settings")
@@ -82,6 +88,7 @@ def test_get_user_settings_when_settings_exist(settings_client):
         "llm_endpoint": "http://existing.com",
         "api_key_is_set": True,
         "access_token_expire_minutes": None,
+        "llm_fallback_endpoints": [],
     }
 
 
@@ -92,9 +99,11 @@ def test_put_to_update_user_settings_both_fields(settings_client):
     # Test PUT to update both fields
     mock_db.reset_mock()
     mock_settings = UserSettings(
-        user_id=1,
-        llm_endpoint="http://existing.com",
-        encrypted_api_key="existing_key",
+        data=UserSettingsData(
+            user_id=1,
+            llm_endpoint="http://existing.com",
+            encrypted_api_key="existing_key",
+        ),
     )
     mock_db.query.return_value.filter.return_value.first.return_value = mock_settings
     with patch(
@@ -118,9 +127,11 @@ def test_put_to_preserve_api_key_on_empty_string(settings_client):
     # Test PUT to preserve API key when sending empty string
     mock_db.reset_mock()
     mock_settings = UserSettings(
-        user_id=1,
-        llm_endpoint="http://existing.com",
-        encrypted_api_key="existing_key",
+        data=UserSettingsData(
+            user_id=1,
+            llm_endpoint="http://existing.com",
+            encrypted_api_key="existing_key",
+        ),
     )
     mock_db.query.return_value.filter.return_value.first.return_value = mock_settings
     with patch(
@@ -143,9 +154,11 @@ def test_put_to_update_only_endpoint(settings_client):
     # Test PUT to update only endpoint
     mock_db.reset_mock()
     mock_settings = UserSettings(
-        user_id=1,
-        llm_endpoint="http://existing.com",
-        encrypted_api_key="existing_key",
+        data=UserSettingsData(
+            user_id=1,
+            llm_endpoint="http://existing.com",
+            encrypted_api_key="existing_key",
+        ),
     )
     mock_db.query.return_value.filter.return_value.first.return_value = mock_settings
     with patch(
@@ -168,9 +181,11 @@ def test_put_to_update_only_api_key(settings_client):
     # Test PUT to update only API key
     mock_db.reset_mock()
     mock_settings = UserSettings(
-        user_id=1,
-        llm_endpoint="http://existing.com",
-        encrypted_api_key="existing_key",
+        data=UserSettingsData(
+            user_id=1,
+            llm_endpoint="http://existing.com",
+            encrypted_api_key="existing_key",
+        ),
     )
     mock_db.query.return_value.filter.return_value.first.return_value = mock_settings
     with patch(
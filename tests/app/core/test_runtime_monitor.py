@@ -0,0 +1,72 @@
+"""Tests for runtime_monitor module."""
+
+import asyncio
+import time
+
+import pytest
+
+from resume_editor.app.core.runtime_monitor import (
+    EventLoopLagMonitor,
+    current_rss_kib,
+    peak_rss_kib,
+)
+
+
+def test_stats_summarize_recorded_lags():
+    """Test the lag percentiles and maximum, in milliseconds."""
+    monitor = EventLoopLagMonitor()
+    for lag in [0.001] * 99 + [0.25]:
+        monitor.record_lag(lag)
+
+    stats = monitor.stats()
+
+    assert stats.lag_samples == 100
+    assert stats.loop_lag_p50_ms == pytest.approx(1.0)
+    assert stats.loop_lag_p99_ms == pytest.approx(1.0)
+    assert stats.loop_lag_max_ms == pytest.approx(250.0)
+    assert stats.running is False
+
+
+def test_empty_stats_and_reset():
+    """Test that a monitor without samples reports zero lag."""
+    monitor = EventLoopLagMonitor(window_size=2)
+    monitor.record_lag(0.5)
+    monitor.reset()
+
+    stats = monitor.stats()
+
+    assert (stats.lag_samples, stats.loop_lag_p99_ms, stats.loop_lag_max_ms) == (
+        0,
+        0.0,
+        0.0,
+    )
+
+
+def test_memory_use_is_reported():
+    """Test that the peak RSS is reported and never below the current RSS."""
+    stats = EventLoopLagMonitor().stats()
+
+    assert peak_rss_kib() > 0
+    assert stats.peak_rss_kib >= (stats.rss_kib or 0)
+    if current_rss_kib() is not None:
+        assert stats.rss_kib > 0
+
+
+@pytest.mark.asyncio
+async def test_probe_measures_blocking_code():
+    """Test that blocking the event loop shows up as lag until the monitor stops."""
+    monitor = EventLoopLagMonitor(interval=0.01)
+    monitor.start()
+    monitor.start()
+    await asyncio.sleep(0.03)
+
+    time.sleep(0.1)
+    await asyncio.sleep(0.03)
+
+    assert monitor.stats().running is True
+    await monitor.stop()
+    await monitor.stop()
+    stats = monitor.stats()
+    assert stats.running is False
+    assert stats.lag_samples >= 2
+    assert stats.loop_lag_max_ms >= 50.0
@@ -0,0 +1,390 @@
+"""Tests for circuit_breaker module."""
+
+import json
+
+import httpx
+import pytest
+
+from resume_editor.app.llm.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    HALF_OPEN_TRIAL_CALLS,
+    OPEN,
+    CircuitBreaker,
+    CircuitBreakerPolicy,
+    CircuitBreakerRegistry,
+    CircuitOpenError,
+    call_with_failover,
+    circuit_breaker_key,
+    failover_configs,
+    is_endpoint_failure,
+    llm_circuit_breakers,
+)
+from resume_editor.app.llm.concurrency_limiter import endpoint_label
+from resume_editor.app.llm.models import LLMConfig, LLMEndpoint
+
+
+def _policy(**overrides) -> CircuitBreakerPolicy:
+    """Build a policy that opens after four calls in the window."""
+    values = {"min_calls": 4, "window_seconds": 60.0, "open_seconds": 30.0}
+    values.update(overrides)
+    return CircuitBreakerPolicy(**values)
+
+
+def _call(breaker: CircuitBreaker, clock, error=None, seconds=1.0) -> None:
+    """Make one permitted call that takes the given time."""
+    permit = breaker.acquire()
+    assert permit is not None
+    clock.now += seconds
+    breaker.record(permit, error)
+
+
+def _open_breaker(clock) -> CircuitBreaker:
+    """Build a breaker and open it with failed calls."""
+    breaker = CircuitBreaker("e", policy=_policy(), clock=clock)
+    for _ in range(4):
+        _call(breaker, clock, TimeoutError())
+    assert breaker.state == OPEN
+    return breaker
+
+
+def _config(**fallbacks: str | None) -> LLMConfig:
+    """Build a configuration for http://primary with the given fallbacks."""
+    return LLMConfig(
+        llm_endpoint="http://primary",
+        api_key="key",
+        llm_model_name="big",
+        fallbacks=[
+            LLMEndpoint(llm_endpoint=f"http://{name}", llm_model_name=model)
+            for name, model in fallbacks.items()
+        ],
+    )
+
+
+def _open_endpoint(registry: CircuitBreakerRegistry, llm_config: LLMConfig) -> None:
+    """Open the circuit of a configuration in the registry with one failed call."""
+    breaker = registry.for_endpoint(llm_config)
+    breaker.record(breaker.acquire(), TimeoutError())
+    assert breaker.state == OPEN
+
+
+def _label(llm_config: LLMConfig) -> str:
+    """Return the label the stats give the breaker of a configuration."""
+    return endpoint_label(circuit_breaker_key(llm_config))
+
+
+def test_opens_on_failure_rate_once_window_is_full(fake_clock):
+    """Test that failures only open the circuit once min_calls calls are counted."""
+    breaker = CircuitBreaker("e", policy=_policy(), clock=fake_clock)
+
+    _call(breaker, fake_clock)
+    _call(breaker, fake_clock, TimeoutError())
+    _call(breaker, fake_clock, TimeoutError())
+    assert breaker.state == CLOSED
+
+    _call(breaker, fake_clock)
+    stats = breaker.stats()
+
+    assert stats.state == OPEN
+    assert stats.failure_rate == pytest.approx(0.5)
+    assert stats.times_opened == 1
+    assert breaker.acquire() is None
+    assert breaker.stats().rejected == 1
+
+
+def test_opens_on_slow_call_rate(fake_clock):
+    """Test that mostly slow successful calls open the circuit."""
+    breaker = CircuitBreaker(
+        "e",
+        policy=_policy(slow_call_seconds=10.0, slow_call_rate_threshold=0.75),
+        clock=fake_clock,
+    )
+
+    _call(breaker, fake_clock, seconds=1.0)
+    for _ in range(3):
+        _call(breaker, fake_clock, seconds=12.0)
+
+    stats = breaker.stats()
+    assert stats.state == OPEN
+    assert stats.failure_rate == 0.0
+    assert stats.slow_call_rate == pytest.approx(0.75)
+
+
+def test_old_outcomes_leave_the_window(fake_clock):
+    """Test that failures older than the window no longer count."""
+    breaker = CircuitBreaker("e", policy=_policy(), clock=fake_clock)
+
+    for _ in range(3):
+        _call(breaker, fake_clock, TimeoutError())
+    fake_clock.now += 120.0
+    _call(breaker, fake_clock)
+
+    stats = breaker.stats()
+    assert stats.state == CLOSED
+    assert stats.calls == 1
+
+
+@pytest.mark.parametrize(
+    ("error", "expected"),
+    [
+        (TimeoutError(), True),
+        (ConnectionError("refused"), True),
+        (httpx.ConnectError("refused"), True),
+        (json.JSONDecodeError("bad json", "{", 0), False),
+        (ValueError("bad request"), False),
+    ],
+)
+def test_is_endpoint_failure(error, expected):
+    """Test that only transport errors, timeouts, 429 and 5xx are endpoint failures."""
+    assert is_endpoint_failure(error) is expected
+
+
+@pytest.mark.parametrize(
+    "error",
+    [ValueError("bad request"), json.JSONDecodeError("bad json", "{", 0)],
+)
+def test_errors_not_about_the_endpoint_are_not_failures(error, fake_clock):
+    """Test that bad requests and malformed responses leave the window unchanged."""
+    breaker = CircuitBreaker("e", policy=_policy(), clock=fake_clock)
+
+    for _ in range(4):
+        _call(breaker, fake_clock, error)
+
+    assert breaker.stats().calls == 0
+    assert breaker.state == CLOSED
+
+
+def test_half_open_trials_close_the_circuit(fake_clock):
+    """Test that successful trial calls close an open circuit with an empty window."""
+    breaker = _open_breaker(fake_clock)
+
+    assert breaker.stats().seconds_until_half_open == pytest.approx(30.0)
+    fake_clock.now += 30.0
+    assert breaker.state == HALF_OPEN
+
+    permits = [breaker.acquire() for _ in range(HALF_OPEN_TRIAL_CALLS)]
+    assert breaker.acquire() is None
+    for permit in permits:
+        breaker.record(permit)
+
+    stats = breaker.stats()
+    assert stats.state == CLOSED
+    assert stats.calls == 0
+    assert stats.seconds_until_half_open is None
+
+
+def test_failed_half_open_trial_reopens_the_circuit(fake_clock):
+    """Test that a failed trial call opens the circuit again."""
+    breaker = _open_breaker(fake_clock)
+    fake_clock.now += 30.0
+
+    _call(breaker, fake_clock, TimeoutError())
+
+    stats = breaker.stats()
+    assert stats.state == OPEN
+    assert stats.times_opened == 2
+
+
+def test_neutral_half_open_trial_frees_its_slot(fake_clock):
+    """Test that a trial ending with a neutral error lets another trial through."""
+    breaker = _open_breaker(fake_clock)
+    fake_clock.now += 30.0
+
+    permits = [breaker.acquire() for _ in range(HALF_OPEN_TRIAL_CALLS)]
+    breaker.record(permits[0], ValueError("bad request"))
+
+    assert breaker.acquire() is not None
+    assert breaker.state == HALF_OPEN
+
+
+def test_outcomes_from_before_a_state_change_are_ignored(fake_clock):
+    """Test that a call started while closed cannot close or reopen the circuit later."""
+    breaker = CircuitBreaker("e", policy=_policy(), clock=fake_clock)
+    stale = breaker.acquire()
+    for _ in range(4):
+        _call(breaker, fake_clock, TimeoutError())
+    fake_clock.now += 30.0
+    assert breaker.state == HALF_OPEN
+
+    breaker.record(stale, TimeoutError())
+
+    assert breaker.state == HALF_OPEN
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"failure_rate_threshold": 0.0},
+        {"slow_call_rate_threshold": 1.5},
+        {"min_calls": 0},
+        {"open_seconds": 0.0},
+    ],
+)
+def test_policy_rejects_invalid_settings(overrides):
+    """Test that rates outside (0, 1] and non-positive sizes are rejected."""
+    with pytest.raises(ValueError, match="Invalid LLM circuit breaker settings"):
+        CircuitBreakerPolicy(**overrides)
+
+
+def test_failover_configs_inherit_model_but_not_key():
+    """Test that fallbacks reuse the model unless they set one, but never the API key."""
+    llm_config = _config(backup="small", spare=None)
+    llm_config.fallbacks.append(
+        LLMEndpoint(llm_endpoint="http://own", api_key="own-key"),
+    )
+
+    configs = failover_configs(llm_config)
+
+    assert [(c.llm_endpoint, c.api_key, c.llm_model_name) for c in configs] == [
+        ("http://primary", "key", "big"),
+        ("http://backup", None, "small"),
+        ("http://spare", None, "big"),
+        ("http://own", "own-key", "big"),
+    ]
+
+
+def test_registry_disabled_passes_calls_through():
+    """Test that a disabled registry neither routes nor tracks calls."""
+    registry = CircuitBreakerRegistry()
+    llm_config = _config(backup=None)
+
+    assert registry.acquire(llm_config) == (llm_config, None)
+    assert registry.route(llm_config) is llm_config
+    registry.record(None, TimeoutError())
+    assert registry.stats() == []
+
+
+def test_registry_routes_to_next_healthy_endpoint():
+    """Test that calls skip open circuits in fallback order."""
+    registry = CircuitBreakerRegistry(enabled=True, policy=_policy(min_calls=1))
+    llm_config = _config(backup="small", spare=None)
+
+    target, permit = registry.acquire(llm_config)
+    assert target is llm_config
+    registry.record(permit, TimeoutError())
+
+    target, permit = registry.acquire(llm_config)
+    assert (target.llm_endpoint, target.llm_model_name) == ("http://backup", "small")
+    assert registry.route(llm_config).llm_endpoint == "http://backup"
+
+    _primary, backup, spare = failover_configs(llm_config)
+    _open_endpoint(registry, backup)
+    assert registry.acquire(llm_config)[0].llm_endpoint == "http://spare"
+
+    _open_endpoint(registry, spare)
+    with pytest.raises(CircuitOpenError, match="http://primary is unavailable"):
+        registry.acquire(llm_config)
+    assert registry.route(llm_config) is llm_config
+
+    stats = {s.endpoint: s for s in registry.stats()}
+    assert stats[_label(llm_config)].state == OPEN
+    assert stats[_label(llm_config)].rejected == 3
+
+
+def _open_slow_breaker(registry: CircuitBreakerRegistry, llm_config: LLMConfig, clock):
+    """Open the circuit of a configuration with one slow but successful call."""
+    breaker = registry.for_endpoint(llm_config)
+    breaker._clock = clock
+    permit = breaker.acquire()
+    clock.now += registry.policy.slow_call_seconds
+    breaker.record(permit)
+    assert breaker.state == OPEN
+    return breaker
+
+
+def test_registry_calls_slow_endpoint_when_no_fallback_is_healthy(fake_clock):
+    """Test that a circuit opened only for slowness does not turn calls into errors."""
+    registry = CircuitBreakerRegistry(enabled=True, policy=_policy(min_calls=1))
+    llm_config = _config()
+    breaker = _open_slow_breaker(registry, llm_config, fake_clock)
+
+    target, permit = registry.acquire(llm_config)
+    assert target is llm_config
+    assert permit.counted is False
+
+    registry.record(permit, TimeoutError())
+    stats = breaker.stats()
+    assert stats.state == OPEN
+    assert stats.calls == 1
+
+
+def test_registry_prefers_healthy_fallback_over_slow_endpoint(fake_clock):
+    """Test that a healthy fallback still takes calls from a slow endpoint."""
+    registry = CircuitBreakerRegistry(enabled=True, policy=_policy(min_calls=1))
+    llm_config = _config(backup=None)
+    _open_slow_breaker(registry, llm_config, fake_clock)
+
+    target, permit = registry.acquire(llm_config)
+
+    assert target.llm_endpoint == "http://backup"
+    assert permit.counted is True
+
+
+def test_failed_trial_of_slow_circuit_rejects_calls(fake_clock):
+    """Test that a circuit reopened by a failed trial refuses calls again."""
+    registry = CircuitBreakerRegistry(enabled=True, policy=_policy(min_calls=1))
+    llm_config = _config()
+    breaker = _open_slow_breaker(registry, llm_config, fake_clock)
+
+    fake_clock.now += breaker.policy.open_seconds
+    breaker.record(breaker.acquire(), TimeoutError())
+
+    assert breaker.state == OPEN
+    assert breaker.acquire_degraded() is None
+    with pytest.raises(CircuitOpenError):
+        registry.acquire(llm_config)
+
+
+def test_registry_shares_breakers_and_evicts_least_recently_used():
+    """Test that breakers are keyed by endpoint, model and API key, and capped in number."""
+    registry = CircuitBreakerRegistry(enabled=True, max_endpoints=2)
+
+    first = registry.for_endpoint(LLMConfig(llm_endpoint="http://a/"))
+    assert registry.for_endpoint(LLMConfig(llm_endpoint="http://a")) is first
+    other_model = LLMConfig(llm_endpoint="http://a", llm_model_name="small")
+    other_key = LLMConfig(llm_endpoint="http://a", api_key="other")
+    assert registry.for_endpoint(other_model) is not first
+    assert registry.for_endpoint(other_key) is not first
+
+    assert [s.endpoint for s in registry.stats()] == [
+        _label(other_model),
+        _label(other_key),
+    ]
+
+
+def test_configure_drops_breakers():
+    """Test that reconfiguring applies the new policy to every endpoint."""
+    registry = CircuitBreakerRegistry()
+    registry.for_endpoint(LLMConfig(llm_endpoint="http://a"))
+
+    registry.configure(enabled=True, policy=_policy(min_calls=7))
+
+    assert registry.stats() == []
+    assert registry.for_endpoint(LLMConfig()).policy.min_calls == 7
+
+
+@pytest.mark.asyncio
+async def test_call_with_failover_records_outcomes():
+    """Test that call_with_failover reports errors and routes around open circuits."""
+    llm_circuit_breakers.configure(enabled=True, policy=_policy(min_calls=1))
+    llm_config = _config(backup=None)
+    called = []
+
+    async def failing(target: LLMConfig) -> str:
+        called.append(target.llm_endpoint)
+        raise TimeoutError
+
+    async def succeeding(target: LLMConfig) -> str:
+        called.append(target.llm_endpoint)
+        return "ok"
+
+    with pytest.raises(TimeoutError):
+        await call_with_failover(llm_config, failing)
+    result = await call_with_failover(llm_config, succeeding)
+
+    assert result == "ok"
+    assert called == ["http://primary", "http://backup"]
+    primary, backup = failover_configs(llm_config)
+    stats = {s.endpoint: s for s in llm_circuit_breakers.stats()}
+    assert stats[_label(primary)].state == OPEN
+    assert stats[_label(backup)].calls == 1
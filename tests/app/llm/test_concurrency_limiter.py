@@ -0,0 +1,198 @@
+"""Tests for concurrency_limiter module."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from resume_editor.app.llm.concurrency_limiter import (
+    AdaptiveConcurrencyLimiter,
+    ConcurrencyLimiterRegistry,
+    ConcurrencyLimitPolicy,
+    endpoint_label,
+    is_overload_error,
+)
+from resume_editor.app.llm.models import LLMConfig
+
+
+class StatusError(Exception):
+    """An error carrying an HTTP status code, like the OpenAI API errors."""
+
+    def __init__(self, status_code: int) -> None:
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+@pytest.mark.parametrize(
+    ("error", "expected"),
+    [
+        (TimeoutError(), True),
+        (httpx.ReadTimeout("slow"), True),
+        (StatusError(429), True),
+        (StatusError(503), True),
+        (StatusError(400), False),
+        (ValueError("bad json"), False),
+    ],
+)
+def test_is_overload_error(error, expected):
+    """Test that only timeouts, 429 and 5xx count as overload."""
+    assert is_overload_error(error) is expected
+
+
+@pytest.mark.asyncio
+class TestAdaptiveConcurrencyLimiter:
+    """Tests for AdaptiveConcurrencyLimiter."""
+
+    async def test_raises_limit_when_saturated_and_latency_flat(self, fake_clock):
+        """Test the additive increase after successful saturated requests."""
+        limiter = AdaptiveConcurrencyLimiter(
+            "e", ConcurrencyLimitPolicy(initial_limit=1), clock=fake_clock
+        )
+
+        slot = await limiter.acquire()
+        fake_clock.now = 1.0
+        limiter.release(slot)
+
+        stats = limiter.stats()
+        assert (stats.limit, stats.increases) == (2, 1)
+        assert stats.min_latency_seconds == 1.0
+        assert stats.smoothed_latency_seconds == 1.0
+
+    async def test_keeps_limit_when_latency_rises(self, fake_clock):
+        """Test that inflated latency stops the limit from growing."""
+        limiter = AdaptiveConcurrencyLimiter(
+            "e", ConcurrencyLimitPolicy(initial_limit=1), clock=fake_clock
+        )
+        slot = await limiter.acquire()
+        fake_clock.now = 1.0
+        limiter.release(slot)
+
+        first, second = await limiter.acquire(), await limiter.acquire()
+        fake_clock.now = 21.0
+        limiter.release(first)
+        limiter.release(second)
+
+        stats = limiter.stats()
+        assert (stats.limit, stats.increases) == (2, 1)
+        assert stats.smoothed_latency_seconds > 2 * stats.min_latency_seconds
+
+    async def test_cuts_limit_once_per_round_on_overload(self, fake_clock):
+        """Test the multiplicative decrease ignores requests started before a cut."""
+        limiter = AdaptiveConcurrencyLimiter(
+            "e", ConcurrencyLimitPolicy(initial_limit=8), clock=fake_clock
+        )
+        first, second = await limiter.acquire(), await limiter.acquire()
+
+        fake_clock.now = 1.0
+        first.fail(StatusError(429))
+        limiter.release(first)
+        second.fail(TimeoutError())
+        limiter.release(second)
+        assert limiter.limit == 4
+
+        fake_clock.now = 2.0
+        third = await limiter.acquire()
+        third.fail(StatusError(502))
+        limiter.release(third)
+
+        stats = limiter.stats()
+        assert (stats.limit, stats.decreases, stats.in_flight) == (2, 2, 0)
+
+    async def test_other_errors_leave_limit_unchanged(self):
+        """Test that errors not signalling overload do not adjust the limit."""
+        limiter = AdaptiveConcurrencyLimiter(
+            "e", ConcurrencyLimitPolicy(initial_limit=3)
+        )
+        slot = await limiter.acquire()
+        slot.fail(ValueError("bad json"))
+        limiter.release(slot)
+
+        stats = limiter.stats()
+        assert (stats.limit, stats.increases, stats.decreases) == (3, 0, 0)
+        assert stats.min_latency_seconds is None
+
+    async def test_waiters_are_granted_released_slots(self):
+        """Test that a waiting request gets the next free slot."""
+        limiter = AdaptiveConcurrencyLimiter(
+            "e", ConcurrencyLimitPolicy(initial_limit=1, max_limit=1)
+        )
+        slot = await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert limiter.stats().waiting == 1
+
+        limiter.release(slot)
+        await asyncio.wait_for(waiter, timeout=1)
+
+        stats = limiter.stats()
+        assert (stats.in_flight, stats.waiting) == (1, 0)
+
+    async def test_cancelled_waiter_does_not_leak_a_slot(self):
+        """Test that cancelling a waiting request frees its place."""
+        limiter = AdaptiveConcurrencyLimiter(
+            "e", ConcurrencyLimitPolicy(initial_limit=1, max_limit=1)
+        )
+        slot = await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        limiter.release(slot)
+
+        await asyncio.wait_for(limiter.acquire(), timeout=1)
+        assert limiter.stats().in_flight == 1
+
+    async def test_slot_records_escaping_errors(self):
+        """Test that the slot context manager reports errors and frees the slot."""
+        limiter = AdaptiveConcurrencyLimiter(
+            "e", ConcurrencyLimitPolicy(initial_limit=4)
+        )
+
+        with pytest.raises(TimeoutError):
+            async with limiter.slot():
+                raise TimeoutError
+
+        stats = limiter.stats()
+        assert (stats.limit, stats.decreases, stats.in_flight) == (2, 1, 0)
+
+
+def test_registry_shares_limiters_per_endpoint():
+    """Test that sessions on one endpoint share a limiter whatever the model or key."""
+    registry = ConcurrencyLimiterRegistry()
+    limiter = registry.for_endpoint(
+        LLMConfig(llm_endpoint="http://llm/v1/", llm_model_name="a", api_key="k1"),
+    )
+
+    same = registry.for_endpoint(
+        LLMConfig(llm_endpoint="http://llm/v1", llm_model_name="b", api_key="k2"),
+    )
+    default = registry.for_endpoint(LLMConfig())
+
+    assert same is limiter
+    assert default is not limiter
+    assert [s.endpoint for s in registry.stats()] == [
+        endpoint_label("http://llm/v1"),
+        endpoint_label("https://api.openai.com/v1"),
+    ]
+
+
+def test_registry_evicts_least_recently_used():
+    """Test LRU eviction once the endpoint cap is exceeded."""
+    registry = ConcurrencyLimiterRegistry(max_endpoints=1)
+    first = registry.for_endpoint(LLMConfig(llm_endpoint="http://a"))
+    registry.for_endpoint(LLMConfig(llm_endpoint="http://b"))
+
+    assert registry.for_endpoint(LLMConfig(llm_endpoint="http://a")) is not first
+    assert [s.endpoint for s in registry.stats()] == [endpoint_label("http://a")]
+
+
+def test_endpoint_label_hides_the_url():
+    """Test that labels are short, stable and do not contain the endpoint."""
+    label = endpoint_label("http://llm.internal:8000/v1")
+
+    assert label == endpoint_label("http://llm.internal:8000/v1")
+    assert label != endpoint_label("http://other:8000/v1")
+    assert len(label) == 12
+    assert "llm.internal" not in label
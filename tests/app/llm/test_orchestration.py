@@ -7,10 +7,10 @@ from pydantic import BaseModel, ValidationError
 
 from resume_editor.app.llm.models import JobAnalysis, LLMConfig, RefinedRole
 from resume_editor.app.llm.orchestration import (
-    _invoke_chain_and_parse,
     _parse_json_with_fix,
     refine_role,
 )
+from resume_editor.app.llm.orchestration_banner import _async_invoke_chain_and_parse
 from resume_editor.app.models.resume.experience import InclusionStatus, Role
 
 
@@ -64,49 +64,59 @@ class _TestModel(BaseModel):
     number: int
 
 
+def _chain_returning(content: str) -> MagicMock:
+    """Build a chain mock whose ainvoke returns a message with the given content."""
+    chain = MagicMock()
+    chain.ainvoke = AsyncMock(return_value=MagicMock(content=content))
+    return chain
+
+
+@pytest.mark.asyncio
 @patch("resume_editor.app.llm.orchestration_banner._parse_json_with_fix")
-def test_invoke_chain_and_parse_success(mock_parse_json_with_fix):
-    """Test _invoke_chain_and_parse successfully parses and validates."""
-    mock_chain = MagicMock()
-    mock_chain.invoke.return_value.content = '{"key": "value", "number": 123}'
+async def test_async_invoke_chain_and_parse_success(mock_parse_json_with_fix):
+    """Test _async_invoke_chain_and_parse successfully parses and validates."""
+    mock_chain = _chain_returning('{"key": "value", "number": 123}')
     mock_parse_json_with_fix.return_value = {"key": "value", "number": 123}
 
-    result = _invoke_chain_and_parse(mock_chain, _TestModel, arg="test")
+    result = await _async_invoke_chain_and_parse(
+        mock_chain, _TestModel, "test_stage", arg="test"
+    )
 
-    mock_chain.invoke.assert_called_once_with({"arg": "test"})
+    mock_chain.ainvoke.assert_awaited_once()
+    assert mock_chain.ainvoke.call_args.args[0] == {"arg": "test"}
     mock_parse_json_with_fix.assert_called_once_with('{"key": "value", "number": 123}')
     assert isinstance(result, _TestModel)
     assert result.key == "value"
     assert result.number == 123
 
 
+@pytest.mark.asyncio
 @patch("resume_editor.app.llm.orchestration_banner._parse_json_with_fix")
-def test_invoke_chain_and_parse_parse_failure(mock_parse_json_with_fix):
-    """Test _invoke_chain_and_parse raises ValueError on JSONDecodeError."""
-    mock_chain = MagicMock()
-    mock_chain.invoke.return_value.content = "invalid json"
+async def test_async_invoke_chain_and_parse_parse_failure(mock_parse_json_with_fix):
+    """Test _async_invoke_chain_and_parse raises ValueError on JSONDecodeError."""
+    mock_chain = _chain_returning("invalid json")
     mock_parse_json_with_fix.side_effect = json.JSONDecodeError("msg", "doc", 0)
 
     with pytest.raises(
         ValueError,
         match="The AI service returned an unexpected response. Please try again.",
     ):
-        _invoke_chain_and_parse(mock_chain, _TestModel)
+        await _async_invoke_chain_and_parse(mock_chain, _TestModel, "test_stage")
     mock_parse_json_with_fix.assert_called_once_with("invalid json")
 
 
+@pytest.mark.asyncio
 @patch("resume_editor.app.llm.orchestration_banner._parse_json_with_fix")
-def test_invoke_chain_and_parse_validation_failure(mock_parse_json_with_fix):
-    """Test _invoke_chain_and_parse raises ValueError on ValidationError."""
-    mock_chain = MagicMock()
-    mock_chain.invoke.return_value.content = '{"key": "value"}'  # missing 'number'
+async def test_async_invoke_chain_and_parse_validation_failure(mock_parse_json_with_fix):
+    """Test _async_invoke_chain_and_parse raises ValueError on ValidationError."""
+    mock_chain = _chain_returning('{"key": "value"}')  # missing 'number'
     mock_parse_json_with_fix.return_value = {"key": "value"}  # missing 'number'
 
     with pytest.raises(
         ValueError,
         match="The AI service returned an unexpected response. Please try again.",
     ):
-        _invoke_chain_and_parse(mock_chain, _TestModel)
+        await _async_invoke_chain_and_parse(mock_chain, _TestModel, "test_stage")
 
     mock_parse_json_with_fix.assert_called_once_with('{"key": "value"}')
 
@@ -146,9 +156,9 @@ def sample_llm_config():
 
 
 @pytest.mark.asyncio
-@patch("resume_editor.app.llm.orchestration_refinement.parse_json_markdown")
-@patch("resume_editor.app.llm.orchestration_refinement.initialize_llm_client")
-@patch("resume_editor.app.llm.orchestration_refinement.ChatPromptTemplate")
+@patch("resume_editor.app.llm.role_requests.parse_json_markdown")
+@patch("resume_editor.app.llm.role_requests.get_llm_client")
+@patch("resume_editor.app.llm.role_requests.ChatPromptTemplate")
 async def test_refine_role_success(
     mock_prompt_template,
     mock_init_llm,
@@ -192,9 +202,9 @@ async def test_refine_role_success(
 
 
 @pytest.mark.asyncio
-@patch("resume_editor.app.llm.orchestration_refinement.parse_json_markdown")
-@patch("resume_editor.app.llm.orchestration_refinement.initialize_llm_client")
-@patch("resume_editor.app.llm.orchestration_refinement.ChatPromptTemplate")
+@patch("resume_editor.app.llm.role_requests.parse_json_markdown")
+@patch("resume_editor.app.llm.role_requests.get_llm_client")
+@patch("resume_editor.app.llm.role_requests.ChatPromptTemplate")
 async def test_refine_role_parse_failure(
     mock_prompt_template,
     mock_init_llm,
@@ -9,6 +9,7 @@ from resume_editor.app.llm.orchestration_analysis import (
     _parse_job_analysis_response,
     analyze_job_description,
 )
+from resume_editor.app.llm.retry_policy import RetryBudget
 
 
 def test_parse_job_analysis_response_valid():
@@ -49,7 +50,7 @@ async def test_analyze_job_description_success():
     mock_response = '{"key_skills": ["python"], "themes": ["backend"]}'
 
     with patch(
-        "resume_editor.app.llm.orchestration_analysis.initialize_llm_client"
+        "resume_editor.app.llm.orchestration_analysis.get_llm_client"
     ) as mock_init:
         with patch(
             "resume_editor.app.llm.orchestration_analysis._parse_job_analysis_response"
@@ -72,3 +73,34 @@ async def test_analyze_job_description_success():
                     "resume content",
                 )
                 assert result is not None
+
+
+@pytest.mark.asyncio
+@patch("resume_editor.app.llm.retry_policy.asyncio.sleep", new_callable=AsyncMock)
+@patch("resume_editor.app.llm.orchestration_analysis.get_prepared_chain")
+@patch("resume_editor.app.llm.orchestration_analysis.get_llm_client")
+async def test_analyze_job_description_retries_transient_failures(
+    mock_get_client, mock_get_chain, mock_sleep
+):
+    """Test that a timed-out job analysis is retried and spends the budget."""
+    mock_chain = Mock()
+    mock_chain.ainvoke = AsyncMock(
+        side_effect=[
+            TimeoutError("slow endpoint"),
+            '{"key_skills": ["python"], "primary_duties": [], "themes": []}',
+        ],
+    )
+    mock_get_chain.return_value = mock_chain
+    budget = RetryBudget(max_retries=2)
+
+    analysis, _ = await analyze_job_description(
+        "Job description",
+        Mock(),
+        "resume content",
+        retry_budget=budget,
+    )
+
+    assert analysis.key_skills == ["python"]
+    assert mock_chain.ainvoke.await_count == 2
+    mock_sleep.assert_awaited_once()
+    assert budget.remaining == 1
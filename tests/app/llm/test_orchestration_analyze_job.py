@@ -112,7 +112,7 @@ def mock_chain_invocations_for_analysis():
     """
     with (
         patch(
-            "resume_editor.app.llm.orchestration_analysis.initialize_llm_client"
+            "resume_editor.app.llm.orchestration_analysis.get_llm_client"
         ) as mock_init_llm,
         patch(
             "resume_editor.app.llm.orchestration_analysis.ChatPromptTemplate"
@@ -3,7 +3,7 @@
 import json
 import logging
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from langchain_core.messages import AIMessage
@@ -17,16 +17,18 @@ from resume_editor.app.llm.models import (
     RefinedRoleRecord,
     RunningLog,
 )
-from resume_editor.app.llm.orchestration_banner import (
+from resume_editor.app.llm.banner_evidence import (
     _calculate_certification_relevance,
     _calculate_education_relevance,
     _calculate_project_relevance,
     _extract_cross_section_evidence,
     _extract_section_content,
     _format_role_data_for_banner,
-    _invoke_banner_generation_chain,
     _split_projects_section,
-    generate_banner_from_running_log,
+)
+from resume_editor.app.llm.orchestration_banner import (
+    _async_invoke_banner_generation_chain,
+    async_generate_banner_from_running_log,
 )
 
 log = logging.getLogger(__name__)
@@ -452,265 +454,171 @@ class TestFormatRoleDataForBanner:
         assert len(formatted[0]["description"]) <= 300
 
 
-class TestInvokeBannerGenerationChain:
-    """Tests for _invoke_banner_generation_chain function."""
+@pytest.mark.asyncio
+class TestAsyncInvokeBannerGenerationChain:
+    """Tests for _async_invoke_banner_generation_chain function."""
 
-    @patch("resume_editor.app.llm.orchestration_banner.GeneratedBanner")
-    @patch("resume_editor.app.llm.orchestration_banner._parse_json_with_fix")
-    def test_successful_banner_generation(
-        self,
-        mock_parse_json,
-        mock_banner_model,
-        job_analysis_fixture,
-        refined_role_records_fixture,
+    async def test_awaits_prepared_chain(
+        self, job_analysis_fixture, refined_role_records_fixture
     ):
-        """Test successful banner generation."""
-        # Setup mocks to avoid complex chain mocking
-        mock_parse_json.return_value = {
-            "bullets": [
-                {"category": "Backend", "description": "Python expert (Tech Corp)"}
-            ],
-            "education_bullet": None,
-        }
-
-        # Create expected banner
-        expected_banner = GeneratedBanner(
-            bullets=[
-                BannerBullet(
-                    category="Backend", description="Python expert (Tech Corp)"
-                )
-            ],
-            education_bullet=None,
-        )
-        mock_banner_model.model_validate.return_value = expected_banner
-
-        mock_llm = MagicMock()
-
-        # The actual function will fail due to chain mocking, but we can verify error handling
-        # by testing that None is returned when chain fails
-        banner = _invoke_banner_generation_chain(
-            llm=mock_llm,
-            job_analysis=job_analysis_fixture,
-            refined_roles=refined_role_records_fixture,
-            cross_section_evidence=[],
-            original_banner=None,
+        """Test that the prepared chain is awaited and its response parsed."""
+        chain = MagicMock()
+        chain.ainvoke = AsyncMock(
+            return_value=json.dumps(
+                {"bullets": [{"category": "Backend", "description": "Python expert"}]}
+            ),
         )
 
-        # Since we can't easily mock the full chain, we at least verify the function runs
-        # and returns None when chain invocation fails
-        assert banner is None or isinstance(banner, GeneratedBanner)
-
-    @patch("resume_editor.app.llm.orchestration_banner._parse_json_with_fix")
-    def test_returns_none_on_error(
-        self, mock_parse_json, job_analysis_fixture, refined_role_records_fixture
+        with patch(
+            "resume_editor.app.llm.orchestration_banner.get_prepared_chain",
+            return_value=chain,
+        ):
+            banner = await _async_invoke_banner_generation_chain(
+                llm=MagicMock(),
+                job_analysis=job_analysis_fixture,
+                refined_roles=refined_role_records_fixture,
+                cross_section_evidence=[],
+                original_banner=None,
+            )
+
+        assert banner.bullets[0].category == "Backend"
+        chain.ainvoke.assert_awaited_once()
+        chain.invoke.assert_not_called()
+        assert chain.ainvoke.call_args.args[0]["original_banner"] == ""
+
+    async def test_returns_none_on_error(
+        self, job_analysis_fixture, refined_role_records_fixture
     ):
-        """Test that None is returned on error."""
-        mock_parse_json.side_effect = Exception("JSON parsing error")
-
-        mock_llm = MagicMock()
-
-        banner = _invoke_banner_generation_chain(
-            llm=mock_llm,
-            job_analysis=job_analysis_fixture,
-            refined_roles=refined_role_records_fixture,
-            cross_section_evidence=[],
-            original_banner=None,
-        )
+        """Test that None is returned when the chain fails."""
+        chain = MagicMock()
+        chain.ainvoke = AsyncMock(side_effect=RuntimeError("boom"))
+
+        with patch(
+            "resume_editor.app.llm.orchestration_banner.get_prepared_chain",
+            return_value=chain,
+        ):
+            banner = await _async_invoke_banner_generation_chain(
+                llm=MagicMock(),
+                job_analysis=job_analysis_fixture,
+                refined_roles=refined_role_records_fixture,
+                cross_section_evidence=[],
+                original_banner=None,
+            )
 
         assert banner is None
 
-    @patch("resume_editor.app.llm.orchestration_banner._parse_json_with_fix")
-    def test_handles_education_bullet(
-        self, mock_parse_json, job_analysis_fixture, refined_role_records_fixture
-    ):
-        """Test that education bullet is handled when present."""
-        mock_parse_json.return_value = {
-            "bullets": [{"category": "Backend", "description": "Python expert"}],
-            "education_bullet": {
-                "category": "Education",
-                "description": "MS in CS relevant to role",
-            },
-        }
-
-        mock_llm = MagicMock()
-
-        banner = _invoke_banner_generation_chain(
-            llm=mock_llm,
-            job_analysis=job_analysis_fixture,
-            refined_roles=refined_role_records_fixture,
-            cross_section_evidence=[],
-            original_banner=None,
-        )
-
-        # Since we can't easily mock the full chain, we at least verify error handling
-        assert banner is None or (
-            isinstance(banner, GeneratedBanner) and banner.education_bullet is not None
-        )
-
 
-class TestGenerateBannerFromRunningLog:
-    """Tests for generate_banner_from_running_log function."""
+@pytest.mark.asyncio
+class TestAsyncGenerateBannerFromRunningLog:
+    """Tests for async_generate_banner_from_running_log function."""
 
-    @patch("resume_editor.app.llm.orchestration_banner._invoke_banner_generation_chain")
-    @patch("resume_editor.app.llm.orchestration_banner._extract_cross_section_evidence")
-    @patch("resume_editor.app.llm.orchestration_banner.initialize_llm_client")
-    def test_successful_banner_generation(
+    @patch(
+        "resume_editor.app.llm.orchestration_banner._async_invoke_banner_generation_chain",
+        new_callable=AsyncMock,
+    )
+    @patch("resume_editor.app.llm.orchestration_banner.get_llm_client")
+    async def test_formats_generated_banner(
         self,
         mock_init_llm,
-        mock_extract_evidence,
         mock_invoke_chain,
         running_log_fixture,
         llm_config_fixture,
     ):
-        """Test successful banner generation from running log."""
-        mock_llm = MagicMock()
-        mock_init_llm.return_value = mock_llm
-        mock_extract_evidence.return_value = []
-
-        generated_banner = GeneratedBanner(
-            bullets=[
-                BannerBullet(
-                    category="Backend", description="Python expert (Tech Corp)"
-                ),
-                BannerBullet(
-                    category="Leadership", description="Led teams (Startup Inc)"
-                ),
-            ],
+        """Test that the awaited banner is formatted as Markdown bullets."""
+        mock_invoke_chain.return_value = GeneratedBanner(
+            bullets=[BannerBullet(category="Cloud", description="AWS expert")],
             education_bullet=None,
         )
-        mock_invoke_chain.return_value = generated_banner
 
-        banner = generate_banner_from_running_log(
-            running_log=running_log_fixture,
-            original_resume_content="# Experience\n## Roles",
-            llm_config=llm_config_fixture,
-            original_banner="Original banner",
-        )
-
-        assert banner is not None
-        assert "**Backend:**" in banner
-        assert "Python expert (Tech Corp)" in banner
-        assert "**Leadership:**" in banner
-
-    def test_returns_empty_string_when_no_job_analysis(
-        self, running_log_fixture, llm_config_fixture
-    ):
-        """Test that empty string is returned when no job analysis."""
-        running_log_fixture.job_analysis = None
-
-        banner = generate_banner_from_running_log(
+        banner = await async_generate_banner_from_running_log(
             running_log=running_log_fixture,
             original_resume_content="",
             llm_config=llm_config_fixture,
         )
 
-        assert banner == ""
+        assert banner == "- **Cloud:** AWS expert"
+        mock_invoke_chain.assert_awaited_once()
 
-    def test_returns_empty_string_when_no_refined_roles(
-        self, running_log_fixture, llm_config_fixture
+    @patch(
+        "resume_editor.app.llm.orchestration_banner._async_invoke_banner_generation_chain",
+        new_callable=AsyncMock,
+    )
+    async def test_returns_empty_string_without_refined_roles(
+        self, mock_invoke_chain, running_log_fixture, llm_config_fixture
     ):
-        """Test that empty string is returned when no refined roles."""
+        """Test that an incomplete running log skips the LLM call."""
         running_log_fixture.refined_roles = []
 
-        banner = generate_banner_from_running_log(
+        banner = await async_generate_banner_from_running_log(
             running_log=running_log_fixture,
             original_resume_content="",
             llm_config=llm_config_fixture,
         )
 
         assert banner == ""
+        mock_invoke_chain.assert_not_called()
 
-    @patch("resume_editor.app.llm.orchestration_banner._invoke_banner_generation_chain")
-    @patch("resume_editor.app.llm.orchestration_banner._extract_cross_section_evidence")
-    @patch("resume_editor.app.llm.orchestration_banner.initialize_llm_client")
-    def test_includes_education_bullet_when_present(
-        self,
-        mock_init_llm,
-        mock_extract_evidence,
-        mock_invoke_chain,
-        running_log_fixture,
-        llm_config_fixture,
+    @patch(
+        "resume_editor.app.llm.orchestration_banner._async_invoke_banner_generation_chain",
+        new_callable=AsyncMock,
+        return_value=None,
+    )
+    @patch("resume_editor.app.llm.orchestration_banner.get_llm_client")
+    async def test_returns_empty_string_when_chain_returns_none(
+        self, _mock_init_llm, _mock_invoke_chain, running_log_fixture, llm_config_fixture
     ):
-        """Test that education bullet is included when present."""
-        mock_llm = MagicMock()
-        mock_init_llm.return_value = mock_llm
-        mock_extract_evidence.return_value = []
-
-        generated_banner = GeneratedBanner(
-            bullets=[BannerBullet(category="Backend", description="Python expert")],
-            education_bullet=BannerBullet(category="Education", description="MS in CS"),
-        )
-        mock_invoke_chain.return_value = generated_banner
-
-        banner = generate_banner_from_running_log(
+        """Test that a failed chain yields an empty banner."""
+        banner = await async_generate_banner_from_running_log(
             running_log=running_log_fixture,
             original_resume_content="",
             llm_config=llm_config_fixture,
         )
 
-        assert "**Education:**" in banner
-        assert "MS in CS" in banner
+        assert banner == ""
 
-    @patch("resume_editor.app.llm.orchestration_banner._invoke_banner_generation_chain")
-    @patch("resume_editor.app.llm.orchestration_banner._extract_cross_section_evidence")
-    @patch("resume_editor.app.llm.orchestration_banner.initialize_llm_client")
-    def test_returns_empty_string_when_chain_returns_none(
-        self,
-        mock_init_llm,
-        mock_extract_evidence,
-        mock_invoke_chain,
-        running_log_fixture,
-        llm_config_fixture,
+    @patch(
+        "resume_editor.app.llm.orchestration_banner._async_invoke_banner_generation_chain",
+        new_callable=AsyncMock,
+    )
+    async def test_returns_empty_string_without_job_analysis(
+        self, mock_invoke_chain, running_log_fixture, llm_config_fixture
     ):
-        """Test that empty string is returned when chain returns None."""
-        mock_llm = MagicMock()
-        mock_init_llm.return_value = mock_llm
-        mock_extract_evidence.return_value = []
-        mock_invoke_chain.return_value = None
+        """Test that a running log without a job analysis skips the LLM call."""
+        running_log_fixture.job_analysis = None
 
-        banner = generate_banner_from_running_log(
+        banner = await async_generate_banner_from_running_log(
             running_log=running_log_fixture,
             original_resume_content="",
             llm_config=llm_config_fixture,
         )
 
         assert banner == ""
+        mock_invoke_chain.assert_not_called()
 
-    @patch("resume_editor.app.llm.orchestration_banner._invoke_banner_generation_chain")
-    @patch("resume_editor.app.llm.orchestration_banner._extract_cross_section_evidence")
-    @patch("resume_editor.app.llm.orchestration_banner.initialize_llm_client")
-    def test_formats_as_markdown_bullets(
+    @patch(
+        "resume_editor.app.llm.orchestration_banner._async_invoke_banner_generation_chain",
+        new_callable=AsyncMock,
+    )
+    @patch("resume_editor.app.llm.orchestration_banner.get_llm_client")
+    async def test_includes_education_bullet_when_present(
         self,
-        mock_init_llm,
-        mock_extract_evidence,
+        _mock_init_llm,
         mock_invoke_chain,
         running_log_fixture,
         llm_config_fixture,
     ):
-        """Test that banner is formatted as Markdown bullet points."""
-        mock_llm = MagicMock()
-        mock_init_llm.return_value = mock_llm
-        mock_extract_evidence.return_value = []
-
-        generated_banner = GeneratedBanner(
-            bullets=[
-                BannerBullet(category="Cloud", description="AWS expert (Company A)"),
-                BannerBullet(
-                    category="Backend", description="Python developer (Company B)"
-                ),
-            ],
-            education_bullet=None,
+        """Test that the education bullet follows the other bullets."""
+        mock_invoke_chain.return_value = GeneratedBanner(
+            bullets=[BannerBullet(category="Backend", description="Python expert")],
+            education_bullet=BannerBullet(category="Education", description="MS in CS"),
         )
-        mock_invoke_chain.return_value = generated_banner
 
-        banner = generate_banner_from_running_log(
+        banner = await async_generate_banner_from_running_log(
             running_log=running_log_fixture,
             original_resume_content="",
             llm_config=llm_config_fixture,
         )
 
-        lines = banner.split("\n")
-        non_empty_lines = [line for line in lines if line.strip()]
-        assert all(line.startswith("- **") for line in non_empty_lines)
-        # Check format: - **Category:** Description
-        assert all(":**" in line for line in non_empty_lines)
+        assert banner == (
+            "- **Backend:** Python expert\n- **Education:** MS in CS"
+        )
@@ -8,15 +8,13 @@ from langchain_openai import ChatOpenAI
 from pydantic import ValidationError
 
 from resume_editor.app.llm.models import (
-    CandidateAnalysis,
-    GeneratedIntroduction,
+    JobAnalysis,
     JobKeyRequirements,
     LLMConfig,
 )
-from resume_editor.app.llm.orchestration import (
-    _generate_introduction_from_analysis,
-    _invoke_chain_and_parse,
-    generate_introduction_from_resume,
+from resume_editor.app.llm.orchestration_banner import (
+    _split_job_requirements,
+    async_generate_introduction_from_resume,
 )
 
 log = logging.getLogger(__name__)
@@ -30,14 +28,6 @@ def mock_llm():
     return mock
 
 
-@pytest.fixture
-def mock_llm_sync():
-    """Fixture for a synchronous mock ChatOpenAI instance."""
-    mock = MagicMock()
-    mock.invoke = MagicMock()
-    return mock
-
-
 @pytest.fixture
 def llm_config_fixture():
     """Fixture for a sample LLMConfig."""
@@ -60,234 +50,117 @@ def job_description_fixture():
     return "Software Engineer with Python experience."
 
 
-@patch(
-    "resume_editor.app.llm.orchestration_banner._invoke_chain_and_parse",
-    new_callable=MagicMock,
-)
-def test_generate_introduction_from_analysis_success(
-    mock_invoke_chain_and_parse,
-    mock_llm_sync,
+@pytest.mark.asyncio
+@patch("resume_editor.app.llm.orchestration_banner.get_llm_client")
+async def test_async_generate_introduction_from_resume_uses_ainvoke(
+    mock_init_llm,
+    llm_config_fixture,
     resume_content_fixture,
+    job_description_fixture,
 ):
-    """Test _generate_introduction_from_analysis successfully generates an introduction."""
-    _msg = "test_generate_introduction_from_analysis_success starting"
-    log.debug(_msg)
-
-    job_analysis_json = (
-        '{"key_skills": ["Python"], "candidate_priorities": ["Backend"]}'
-    )
-    mock_invoke_chain_and_parse.side_effect = [
-        CandidateAnalysis(
-            analysis=[
-                {
-                    "job_requirement": "python",
-                    "evidence": [
-                        {
-                            "evidence": "strong experience",
-                            "source_section": "Work",
-                            "relevance": "direct",
-                        }
-                    ],
-                }
-            ]
-        ),
-        GeneratedIntroduction(strengths=["Expert in Python", "Loves backend work"]),
-    ]
-    original_banner = "This is the original banner"
-
-    introduction = _generate_introduction_from_analysis(
-        job_analysis_json=job_analysis_json,
-        resume_content=resume_content_fixture,
-        llm=mock_llm_sync,
-        original_banner=original_banner,
+    """Test async_generate_introduction_from_resume awaits ainvoke for every step."""
+    mock_llm = MagicMock(spec=ChatOpenAI)
+    mock_llm.ainvoke = AsyncMock(
+        side_effect=[
+            AIMessage(
+                content='```json\n{"key_skills": ["Python"], "candidate_priorities": ["Backend"]}\n```'
+            ),
+            AIMessage(
+                content='```json\n{"analysis": [{"job_requirement": "python", "evidence": [{"evidence": "strong experience", "source_section": "Work", "relevance": "direct"}]}]}\n```'
+            ),
+            AIMessage(
+                content='```json\n{"analysis": [{"job_requirement": "backend", "evidence": []}]}\n```'
+            ),
+            AIMessage(content='```json\n{"strengths": ["Expert in Python"]}\n```'),
+        ],
     )
+    mock_init_llm.return_value = mock_llm
 
-    assert introduction == "- Expert in Python\n- Loves backend work"
-    assert mock_invoke_chain_and_parse.call_count == 2
-
-    # Check call arguments for resume analysis
-    resume_analysis_call = mock_invoke_chain_and_parse.call_args_list[0]
-    assert resume_analysis_call.args[1] == CandidateAnalysis
-    assert resume_analysis_call.kwargs["resume_content"] == resume_content_fixture
-    assert resume_analysis_call.kwargs["job_requirements"] == job_analysis_json
-    assert resume_analysis_call.kwargs["original_banner"] == original_banner
-
-    # Check call arguments for synthesis
-    synthesis_call = mock_invoke_chain_and_parse.call_args_list[1]
-    assert synthesis_call.args[1] == GeneratedIntroduction
-    assert "candidate_analysis" in synthesis_call.kwargs
-
-    _msg = "test_generate_introduction_from_analysis_success returning"
-    log.debug(_msg)
-
-
-@patch(
-    "resume_editor.app.llm.orchestration_banner._invoke_chain_and_parse",
-    new_callable=MagicMock,
-)
-def test_generate_introduction_from_analysis_failure(
-    mock_invoke_chain_and_parse,
-    mock_llm_sync,
-    resume_content_fixture,
-):
-    """Test _generate_introduction_from_analysis handles exceptions."""
-    _msg = "test_generate_introduction_from_analysis_failure starting"
-    log.debug(_msg)
-
-    job_analysis_json = '{"key_skills": ["Python"]}'
-    mock_invoke_chain_and_parse.side_effect = ValueError("test error")
-
-    introduction = _generate_introduction_from_analysis(
-        job_analysis_json=job_analysis_json,
+    result = await async_generate_introduction_from_resume(
         resume_content=resume_content_fixture,
-        llm=mock_llm_sync,
-        original_banner=None,
+        job_description=job_description_fixture,
+        llm_config=llm_config_fixture,
+        original_banner="Original banner",
     )
 
-    assert introduction == ""
-    mock_invoke_chain_and_parse.assert_called_once()
-    assert mock_invoke_chain_and_parse.call_args.kwargs["original_banner"] == ""
-
-    _msg = "test_generate_introduction_from_analysis_failure returning"
-    log.debug(_msg)
+    assert result == "- Expert in Python"
+    # Job analysis, one resume analysis per requirement group, then synthesis
+    assert mock_llm.ainvoke.await_count == 4
+    synthesis_prompt = mock_llm.ainvoke.await_args_list[3].args[0].to_string()
+    assert synthesis_prompt.index('"python"') < synthesis_prompt.index('"backend"')
+    mock_llm.invoke.assert_not_called()
 
 
-@patch("resume_editor.app.llm.orchestration_banner.initialize_llm_client")
-def test_generate_introduction_from_resume_end_to_end_mocked(
+@pytest.mark.asyncio
+@patch("resume_editor.app.llm.orchestration_banner.get_llm_client")
+async def test_async_generate_introduction_from_resume_job_analysis_fails(
     mock_init_llm,
     llm_config_fixture,
     resume_content_fixture,
     job_description_fixture,
 ):
-    """Test generate_introduction_from_resume end-to-end with mocked LLM calls."""
-    _msg = "test_generate_introduction_from_resume_end_to_end_mocked starting"
-    log.debug(_msg)
-
-    mock_llm_sync = MagicMock(spec=ChatOpenAI)
-    mock_init_llm.return_value = mock_llm_sync
+    """Test async_generate_introduction_from_resume returns "" when job analysis fails."""
+    mock_llm = MagicMock(spec=ChatOpenAI)
+    mock_llm.ainvoke = AsyncMock(return_value=AIMessage(content="not json"))
+    mock_init_llm.return_value = mock_llm
 
-    # Setup side effects for the three LLM calls
-    mock_llm_sync.invoke.side_effect = [
-        # 1. Job Analysis call (for JobKeyRequirements)
-        AIMessage(
-            content='```json\n{"key_skills": ["Python", "FastAPI"], "candidate_priorities": ["Backend"]}\n```'
-        ),
-        # 2. Resume Analysis call (for CandidateAnalysis)
-        AIMessage(
-            content='```json\n{"analysis": [{"job_requirement": "python", "evidence": [{"evidence": "strong experience", "source_section": "Work", "relevance": "direct"}]}]}\n```'
-        ),
-        # 3. Synthesis call (for GeneratedIntroduction)
-        AIMessage(
-            content='```json\n{"strengths": ["Expert in Python", "Great with FastAPI"]}\n```'
-        ),
-    ]
-
-    original_banner = "This is the original banner."
-    result = generate_introduction_from_resume(
+    result = await async_generate_introduction_from_resume(
         resume_content=resume_content_fixture,
         job_description=job_description_fixture,
         llm_config=llm_config_fixture,
-        original_banner=original_banner,
     )
 
-    assert result == "- Expert in Python\n- Great with FastAPI"
-    assert mock_init_llm.call_count == 1
-    assert mock_llm_sync.invoke.call_count == 3
-
-    # Check that original_banner was in the prompt for the resume analysis call
-    resume_analysis_prompt_value = mock_llm_sync.invoke.call_args_list[1].args[0]
-    assert original_banner in resume_analysis_prompt_value.to_string()
-
-    _msg = "test_generate_introduction_from_resume_end_to_end_mocked returning"
-    log.debug(_msg)
+    assert result == ""
+    assert mock_llm.ainvoke.await_count == 1
 
 
-@patch("resume_editor.app.llm.orchestration_banner.initialize_llm_client")
-@patch(
-    "resume_editor.app.llm.orchestration_banner._generate_introduction_from_analysis"
-)
-@patch("resume_editor.app.llm.orchestration_banner._invoke_chain_and_parse")
-def test_generate_introduction_from_resume_success(
-    mock_invoke_chain,
-    mock_internal_generate,
+@pytest.mark.asyncio
+@patch("resume_editor.app.llm.orchestration_banner.get_llm_client")
+async def test_async_generate_introduction_reuses_job_analysis(
     mock_init_llm,
     llm_config_fixture,
     resume_content_fixture,
     job_description_fixture,
 ):
-    """Test generate_introduction_from_resume orchestrates calls and returns result."""
-    _msg = "test_generate_introduction_from_resume_success starting"
-    log.debug(_msg)
-
-    # Mock the return values of the dependencies
-    mock_invoke_chain.return_value = JobKeyRequirements(
-        key_skills=["Python"], candidate_priorities=["Backend"]
+    """Test a supplied JobAnalysis replaces the introduction's job analysis call."""
+    mock_llm = MagicMock(spec=ChatOpenAI)
+    mock_llm.ainvoke = AsyncMock(
+        side_effect=[
+            AIMessage(content='{"analysis": []}'),
+            AIMessage(content='{"analysis": []}'),
+            AIMessage(content='{"strengths": ["Builds services"]}'),
+        ],
+    )
+    mock_init_llm.return_value = mock_llm
+    job_analysis = JobAnalysis(
+        key_skills=["Python"],
+        primary_duties=["Build services"],
+        themes=[],
     )
-    mock_internal_generate.return_value = "This is a generated introduction."
-    original_banner = "This is a banner."
 
-    # Call the function under test
-    result = generate_introduction_from_resume(
+    result = await async_generate_introduction_from_resume(
         resume_content=resume_content_fixture,
         job_description=job_description_fixture,
         llm_config=llm_config_fixture,
-        original_banner=original_banner,
+        job_analysis=job_analysis,
     )
 
-    # Assert the final result
-    assert result == "This is a generated introduction."
-
-    # Assert that dependencies were called correctly
-    mock_init_llm.assert_called_once_with(llm_config_fixture)
-    mock_invoke_chain.assert_called_once()
-    # Can't easily check chain object, so use ANY
-    assert mock_invoke_chain.call_args.args[1] == JobKeyRequirements
-    assert (
-        mock_invoke_chain.call_args.kwargs["job_description"] == job_description_fixture
+    assert result == "- Builds services"
+    assert mock_llm.ainvoke.await_count == 3
+    skills_prompt, priorities_prompt = (
+        call.args[0].to_string() for call in mock_llm.ainvoke.await_args_list[:2]
     )
-
-    mock_internal_generate.assert_called_once()
+    assert '{"key_skills":["Python"],"candidate_priorities":[]}' in skills_prompt
     assert (
-        mock_internal_generate.call_args.kwargs["resume_content"]
-        == resume_content_fixture
+        '{"key_skills":[],"candidate_priorities":["Build services"]}'
+        in priorities_prompt
     )
-    assert "job_analysis_json" in mock_internal_generate.call_args.kwargs
-    assert mock_internal_generate.call_args.kwargs["original_banner"] == original_banner
 
-    _msg = "test_generate_introduction_from_resume_success returning"
-    log.debug(_msg)
 
+def test_split_job_requirements_drops_empty_groups():
+    """Test empty groups are omitted and empty requirements stay a single group."""
+    skills_only = JobKeyRequirements(key_skills=["Python"], candidate_priorities=[])
+    empty = JobKeyRequirements(key_skills=[], candidate_priorities=[])
 
-@patch("resume_editor.app.llm.orchestration_banner.initialize_llm_client")
-@patch("resume_editor.app.llm.orchestration_banner._invoke_chain_and_parse")
-@patch(
-    "resume_editor.app.llm.orchestration_banner._generate_introduction_from_analysis"
-)
-def test_generate_introduction_from_resume_job_analysis_fails(
-    mock_generate_from_analysis,
-    mock_invoke_chain_and_parse,
-    mock_init_llm,
-    llm_config_fixture,
-    resume_content_fixture,
-    job_description_fixture,
-):
-    """Test generate_introduction_from_resume returns empty on job analysis failure."""
-    _msg = "test_generate_introduction_from_resume_job_analysis_fails starting"
-    log.debug(_msg)
-
-    mock_invoke_chain_and_parse.side_effect = ValueError("test error")
-
-    result = generate_introduction_from_resume(
-        resume_content=resume_content_fixture,
-        job_description=job_description_fixture,
-        llm_config=llm_config_fixture,
-        original_banner="some banner",
-    )
-
-    assert result == ""
-    mock_init_llm.assert_called_once_with(llm_config_fixture)
-    mock_invoke_chain_and_parse.assert_called_once()
-    mock_generate_from_analysis.assert_not_called()
-
-    _msg = "test_generate_introduction_from_resume_job_analysis_fails returning"
-    log.debug(_msg)
+    assert _split_job_requirements(skills_only) == [skills_only]
+    assert _split_job_requirements(empty) == [empty]
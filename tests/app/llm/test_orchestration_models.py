@@ -16,9 +16,12 @@ def test_handle_retry_delay_params_creation():
         response_str="test",
         error=Exception("test"),
         job_analysis=None,
+        delay_seconds=1.5,
     )
     assert params.attempt == 0
     assert params.response_str == "test"
+    assert params.delay_seconds == 1.5
+    assert params.max_attempts == 3
     assert params.semaphore is None
     assert params.progress_callback is None
 
@@ -34,3 +37,5 @@ def test_process_refinement_error_params_creation():
     )
     assert params.attempt == 1
     assert isinstance(params.error, ValueError)
+    assert params.retry_policy.max_attempts == 3
+    assert params.retry_budget is None
@@ -1,6 +1,6 @@
 import asyncio
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
 import json
@@ -15,6 +15,7 @@ from resume_editor.app.llm.orchestration import (
     _unwrap_exception_group,
     async_refine_experience_section,
 )
+from resume_editor.app.llm.orchestration_refinement import RefinementState
 from resume_editor.app.llm.models import (
     CandidateAnalysis,
     GeneratedIntroduction,
@@ -141,6 +142,7 @@ async def test_async_refine_experience_section_execution(
         job_description=job_description,
         llm_config=llm_config,
         resume_content_for_context=resume_content,
+        retry_budget=ANY,
     )
     assert mock_refine_role.call_count == len(mock_roles)
 
@@ -265,6 +267,7 @@ async def test_async_refine_experience_section_no_roles(
         job_description=job_description,
         llm_config=llm_config,
         resume_content_for_context=resume_content,
+        retry_budget=ANY,
     )
 
     # The function returns after finding no roles, so no refinement tasks are created.
@@ -272,6 +275,41 @@ async def test_async_refine_experience_section_no_roles(
     assert len(events) == 3
 
 
+@pytest.mark.asyncio
+@patch(
+    "resume_editor.app.llm.orchestration_analysis.analyze_job_description",
+    new_callable=AsyncMock,
+)
+@patch("resume_editor.app.llm.orchestration_refinement.extract_experience_info")
+async def test_async_refine_experience_section_uses_loaded_experience(
+    mock_extract_experience: MagicMock,
+    mock_analyze_job: AsyncMock,
+):
+    """
+    Test that an experience section passed in the state is not parsed again.
+    """
+    # Arrange
+    mock_analyze_job.return_value = (create_mock_job_analysis(), None)
+    state = RefinementState(
+        experience_info=ExperienceResponse(roles=[], projects=[]),
+    )
+
+    # Act
+    events = [
+        event
+        async for event in async_refine_experience_section(
+            resume_content="resume content",
+            job_description="some job",
+            llm_config=LLMConfig(),
+            state=state,
+        )
+    ]
+
+    # Assert
+    mock_extract_experience.assert_not_called()
+    assert len(events) == 3
+
+
 @pytest.mark.asyncio
 @patch("resume_editor.app.llm.orchestration_refinement.asyncio.TaskGroup")
 @patch(
@@ -526,7 +564,7 @@ async def test_async_refine_experience_does_not_yield_introduction():
 
     with (
         patch(
-            "resume_editor.app.llm.orchestration_analysis.initialize_llm_client",
+            "resume_editor.app.llm.orchestration_analysis.get_llm_client",
             return_value=mock_llm_instance,
         ),
         patch(
@@ -10,7 +10,20 @@ from resume_editor.app.llm.orchestration import (
     DEFAULT_LLM_TEMPERATURE,
     refine_role,
 )
-from resume_editor.app.llm.models import JobAnalysis, LLMConfig, RefinedRole
+from resume_editor.app.llm.circuit_breaker import (
+    CircuitBreakerPolicy,
+    CircuitOpenError,
+    circuit_breaker_key,
+    failover_configs,
+    llm_circuit_breakers,
+)
+from resume_editor.app.llm.concurrency_limiter import endpoint_label
+from resume_editor.app.llm.models import (
+    JobAnalysis,
+    LLMConfig,
+    LLMEndpoint,
+    RefinedRole,
+)
 from resume_editor.app.models.resume.experience import (
     Role,
     RoleBasics,
@@ -148,12 +161,12 @@ def mock_chain_invocations_for_role_refine():
     """
     with (
         patch(
-            "resume_editor.app.llm.orchestration_refinement.initialize_llm_client"
+            "resume_editor.app.llm.role_requests.get_llm_client"
         ) as mock_init_llm,
         patch(
-            "resume_editor.app.llm.orchestration_refinement.ChatPromptTemplate"
+            "resume_editor.app.llm.role_requests.ChatPromptTemplate"
         ) as mock_prompt_template_class,
-        patch("resume_editor.app.llm.orchestration_refinement.PydanticOutputParser"),
+        patch("resume_editor.app.llm.role_requests.PydanticOutputParser"),
         patch("langchain_core.output_parsers.StrOutputParser"),
     ):
         mock_prompt_from_messages = MagicMock()
@@ -226,9 +239,18 @@ async def test_refine_role_success(mock_chain_invocations_for_role_refine):
     final_chain.ainvoke.assert_called_once()
     invoke_args = final_chain.ainvoke.call_args.args[0]
 
-    assert invoke_args["role_json"] == mock_role.model_dump_json(indent=2)
+    assert invoke_args["role_json"] == mock_role.model_dump_json(
+        exclude={"basics": {"inclusion_status"}},
+        exclude_none=True,
+        exclude_defaults=True,
+    )
     assert invoke_args["job_analysis_json"] == mock_job_analysis.model_dump_json(
-        indent=2
+        include={"key_skills", "primary_duties", "themes", "inferred_themes"},
+        exclude_none=True,
+        exclude_defaults=True,
+    )
+    assert final_chain.ainvoke.call_args.kwargs["config"]["callbacks"][0].stage == (
+        "role_refine"
     )
 
 
@@ -636,3 +658,70 @@ async def test_refine_role_progress_callback_during_retry(
 
     # Verify the chain was called 3 times
     assert final_chain.ainvoke.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_refine_role_fails_over_while_circuit_is_open(
+    mock_chain_invocations_for_role_refine,
+):
+    """Test that a retry goes to the fallback endpoint once the primary's circuit opens."""
+    llm_circuit_breakers.configure(
+        enabled=True,
+        policy=CircuitBreakerPolicy(min_calls=1),
+    )
+    final_chain = mock_chain_invocations_for_role_refine["final_chain"]
+    final_chain.ainvoke.side_effect = [
+        TimeoutError("slow endpoint"),
+        final_chain.ainvoke.return_value,
+    ]
+    llm_config = LLMConfig(
+        llm_endpoint="http://primary/v1",
+        api_key="key",
+        llm_model_name="big",
+        fallbacks=[LLMEndpoint(llm_endpoint="http://backup/v1", llm_model_name="small")],
+    )
+
+    with patch("resume_editor.app.llm.orchestration_refinement.asyncio.sleep"):
+        result = await refine_role(
+            role=create_mock_role(),
+            job_analysis=create_mock_job_analysis(),
+            llm_config=llm_config,
+        )
+
+    assert result.summary.text == "Refined summary."
+    targets = [
+        call.args[0] for call in mock_chain_invocations_for_role_refine["init_llm"].call_args_list
+    ]
+    assert [(t.llm_endpoint, t.llm_model_name) for t in targets] == [
+        ("http://primary/v1", "big"),
+        ("http://backup/v1", "small"),
+    ]
+    primary, backup = failover_configs(llm_config)
+    stats = {s.endpoint: s.state for s in llm_circuit_breakers.stats()}
+    assert stats == {
+        endpoint_label(circuit_breaker_key(primary)): "open",
+        endpoint_label(circuit_breaker_key(backup)): "closed",
+    }
+
+
+@pytest.mark.asyncio
+async def test_refine_role_fails_fast_when_every_circuit_is_open(
+    mock_chain_invocations_for_role_refine,
+):
+    """Test that refine_role neither calls nor retries while every circuit is open."""
+    llm_circuit_breakers.configure(
+        enabled=True,
+        policy=CircuitBreakerPolicy(min_calls=1),
+    )
+    llm_config = LLMConfig(llm_endpoint="http://primary/v1")
+    breaker = llm_circuit_breakers.for_endpoint(llm_config)
+    breaker.record(breaker.acquire(), TimeoutError())
+
+    with pytest.raises(CircuitOpenError):
+        await refine_role(
+            role=create_mock_role(),
+            job_analysis=create_mock_job_analysis(),
+            llm_config=llm_config,
+        )
+
+    mock_chain_invocations_for_role_refine["final_chain"].ainvoke.assert_not_called()
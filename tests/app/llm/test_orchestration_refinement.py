@@ -5,8 +5,9 @@ import json
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
+import httpx
 import pytest
-from openai import AuthenticationError
+from openai import AuthenticationError, InternalServerError, RateLimitError
 from pydantic import ValidationError
 
 from resume_editor.app.llm.models import (
@@ -18,20 +19,32 @@ from resume_editor.app.llm.models import (
 from resume_editor.app.llm.orchestration_models import (
     HandleRetryDelayParams,
     ProcessRefinementErrorParams,
+    RefineRoleOptions,
 )
 from resume_editor.app.llm.orchestration_refinement import (
-    _attempt_refine_role,
+    RefinementOrchestratorParams,
+    RefinementState,
+    _analyze_job_if_needed,
+    _build_refinement_jobs,
     _create_error_context,
     _handle_retry_delay,
     _is_retryable_error,
     _log_failed_attempt,
+    _plan_refinement_batches,
     _process_refinement_error,
+    _refine_batch_and_put_on_queue,
     _refine_role_and_put_on_queue,
     _truncate_for_log,
     _unwrap_exception_group,
     async_refine_experience_section,
     refine_role,
 )
+from resume_editor.app.llm.retry_policy import RetryBudget
+from resume_editor.app.llm.role_batching import RoleBatchPolicy
+from resume_editor.app.llm.role_refinement_cache import (
+    role_refinement_cache,
+    role_refinement_cache_key,
+)
 from resume_editor.app.models.resume.experience import (
     Role,
     RoleBasics,
@@ -111,6 +124,17 @@ class TestIsRetryableError:
         error = InvalidToken()
         assert _is_retryable_error(error) is False
 
+    def test_server_error_is_retryable(self):
+        """Test that 5xx API errors are retryable."""
+        error = InternalServerError(
+            message="Bad gateway",
+            response=httpx.Response(
+                502, request=httpx.Request("POST", "http://llm/v1/chat/completions")
+            ),
+            body=None,
+        )
+        assert _is_retryable_error(error) is True
+
     def test_general_exception_is_not_retryable(self):
         """Test that general Exception is not retryable."""
         error = Exception("Something went wrong")
@@ -186,73 +210,6 @@ class TestCreateErrorContext:
         assert "Click Start Refinement to resume" in result
 
 
-@pytest.mark.asyncio
-class TestAttemptRefineRole:
-    """Tests for _attempt_refine_role function."""
-
-    async def test_attempt_refine_role_success(self):
-        """Test successful role refinement attempt."""
-        mock_chain = AsyncMock()
-        refined_role_dict = {
-            "basics": {
-                "company": "Test Company",
-                "title": "Test Title",
-                "start_date": "2020-01-01T00:00:00",
-                "inclusion_status": "Include",
-            },
-            "summary": {"text": "Test summary"},
-            "responsibilities": {"text": "* Test responsibilities"},
-            "skills": {"skills": ["Python"]},
-        }
-        mock_chain.ainvoke.return_value = (
-            f"```json\n{json.dumps(refined_role_dict)}\n```"
-        )
-
-        success, result, error = await _attempt_refine_role(
-            chain=mock_chain,
-            job_analysis_json="{}",
-            role_json="{}",
-        )
-
-        assert success is True
-        assert isinstance(result, RefinedRole)
-        assert error is None
-        assert result.basics.company == "Test Company"
-
-    async def test_attempt_refine_role_authentication_error(self):
-        """Test that AuthenticationError is re-raised."""
-        mock_chain = AsyncMock()
-        mock_chain.ainvoke.side_effect = AuthenticationError(
-            message="Invalid API key",
-            response=MagicMock(),
-            body=None,
-        )
-
-        with pytest.raises(AuthenticationError):
-            await _attempt_refine_role(
-                chain=mock_chain,
-                job_analysis_json="{}",
-                role_json="{}",
-            )
-
-    async def test_attempt_refine_role_json_error(self):
-        """Test that JSON errors return failure."""
-        mock_chain = AsyncMock()
-        mock_chain.ainvoke.return_value = "not valid json"
-
-        success, result, error = await _attempt_refine_role(
-            chain=mock_chain,
-            job_analysis_json="{}",
-            role_json="{}",
-        )
-
-        assert success is False
-        assert result is None
-        assert error is not None
-        assert isinstance(error, json.JSONDecodeError)
-
-
-@pytest.mark.asyncio
 class TestHandleRetryDelay:
     """Tests for _handle_retry_delay function."""
 
@@ -272,6 +229,7 @@ class TestHandleRetryDelay:
             response_str="test response",
             error=error,
             job_analysis=job_analysis,
+            delay_seconds=2.5,
             semaphore=mock_semaphore,
             progress_callback=None,
         )
@@ -284,7 +242,7 @@ class TestHandleRetryDelay:
 
         mock_semaphore.release.assert_called_once()
         mock_semaphore.acquire.assert_called_once()
-        mock_sleep.assert_called_once_with(3)
+        mock_sleep.assert_called_once_with(2.5)
 
     async def test_handle_retry_delay_with_callback(self):
         """Test retry delay with progress callback."""
@@ -299,6 +257,8 @@ class TestHandleRetryDelay:
             response_str="test response",
             error=error,
             job_analysis=job_analysis,
+            delay_seconds=0.0,
+            max_attempts=4,
             semaphore=None,
             progress_callback=mock_callback,
         )
@@ -312,7 +272,7 @@ class TestHandleRetryDelay:
         mock_callback.assert_called_once()
         call_args = mock_callback.call_args[0][0]
         assert "Retrying role refinement" in call_args
-        assert "attempt 2/3" in call_args
+        assert "attempt 2/4" in call_args
         assert "Old Title @ Old Company" in call_args
 
 
@@ -398,13 +358,13 @@ class TestRefineRole:
         """Fixture to mock the LangChain chain invocation."""
         with (
             patch(
-                "resume_editor.app.llm.orchestration_refinement.initialize_llm_client"
+                "resume_editor.app.llm.role_requests.get_llm_client"
             ) as mock_init,
             patch(
-                "resume_editor.app.llm.orchestration_refinement.ChatPromptTemplate"
+                "resume_editor.app.llm.role_requests.ChatPromptTemplate"
             ) as mock_prompt,
             patch(
-                "resume_editor.app.llm.orchestration_refinement.PydanticOutputParser"
+                "resume_editor.app.llm.role_requests.PydanticOutputParser"
             ),
         ):
             mock_llm = MagicMock()
@@ -453,6 +413,35 @@ class TestRefineRole:
         assert result.summary.text == "Refined summary."
         assert result.basics.inclusion_status == role.basics.inclusion_status
 
+    async def test_refine_role_streams_with_partial_callback(
+        self, mock_chain_invocations
+    ):
+        """Test that a partial callback streams the response on a usage-reporting client."""
+        mock_chain = mock_chain_invocations["chain"]
+        response = await mock_chain.ainvoke({})
+        mock_chain.ainvoke.reset_mock()
+
+        async def astream(chain_input, config=None):
+            for i in range(0, len(response), 16):
+                yield response[i : i + 16]
+
+        mock_chain.astream = astream
+        partial_callback = AsyncMock()
+
+        result = await refine_role(
+            role=create_mock_role(),
+            job_analysis=create_mock_job_analysis(),
+            llm_config=LLMConfig(),
+            options=RefineRoleOptions(partial_callback=partial_callback),
+        )
+
+        assert result.summary.text == "Refined summary."
+        partial_callback.assert_awaited()
+        mock_chain.ainvoke.assert_not_awaited()
+        mock_chain_invocations["init"].return_value.bind.assert_called_once_with(
+            stream_usage=True
+        )
+
     async def test_refine_role_with_retries(self, mock_chain_invocations):
         """Test role refinement with retries."""
         mock_chain = mock_chain_invocations["chain"]
@@ -513,6 +502,53 @@ class TestRefineRole:
 
         assert mock_chain.ainvoke.call_count == 3
 
+    async def test_refine_role_honours_retry_after_on_rate_limit(
+        self, mock_chain_invocations
+    ):
+        """Test that a rate-limited attempt is retried after the server's delay."""
+        mock_chain = mock_chain_invocations["chain"]
+        valid_response = mock_chain.ainvoke.return_value
+        rate_limit = RateLimitError(
+            message="Too many requests",
+            response=httpx.Response(
+                429,
+                headers={"retry-after": "2"},
+                request=httpx.Request("POST", "http://llm/v1/chat/completions"),
+            ),
+            body=None,
+        )
+        mock_chain.ainvoke.side_effect = [rate_limit, valid_response]
+
+        with patch(
+            "resume_editor.app.llm.orchestration_refinement.asyncio.sleep"
+        ) as mock_sleep:
+            mock_sleep.return_value = None
+            result = await refine_role(
+                role=create_mock_role(),
+                job_analysis=create_mock_job_analysis(),
+                llm_config=LLMConfig(),
+            )
+
+        assert isinstance(result, RefinedRole)
+        mock_sleep.assert_called_once_with(2.0)
+
+    async def test_refine_role_stops_when_retry_budget_is_spent(
+        self, mock_chain_invocations
+    ):
+        """Test that an exhausted retry budget fails the role without retrying."""
+        mock_chain = mock_chain_invocations["chain"]
+        mock_chain.ainvoke.return_value = "```json\n{ invalid json }\n```"
+
+        with pytest.raises(ValueError, match="after 1 attempts"):
+            await refine_role(
+                role=create_mock_role(),
+                job_analysis=create_mock_job_analysis(),
+                llm_config=LLMConfig(),
+                options=RefineRoleOptions(retry_budget=RetryBudget(max_retries=0)),
+            )
+
+        assert mock_chain.ainvoke.call_count == 1
+
     async def test_refine_role_authentication_error(self, mock_chain_invocations):
         """Test that authentication error is raised immediately."""
         mock_chain = mock_chain_invocations["chain"]
@@ -639,6 +675,267 @@ class TestRefineRoleAndPutOnQueue:
         assert "Refining role" in events[0]["message"]
         assert events[1]["status"] == "role_refined"
         assert events[1]["original_index"] == 0
+        assert events[1]["cached"] is False
+
+    async def test_cached_role_is_emitted_without_llm_call(self):
+        """Test that a job carrying a cached result is emitted without an LLM call."""
+        refined = RefinedRole.model_validate(create_mock_role().model_dump())
+        job = RoleRefinementJob(
+            role=create_mock_role(),
+            job_analysis=create_mock_job_analysis(),
+            llm_config=LLMConfig(),
+            original_index=3,
+            cached_data=refined.model_dump(mode="json"),
+        )
+        event_queue = asyncio.Queue()
+
+        with patch(
+            "resume_editor.app.llm.orchestration_refinement.refine_role",
+            new_callable=AsyncMock,
+        ) as mock_refine:
+            await _refine_role_and_put_on_queue(job, asyncio.Semaphore(1), event_queue)
+
+        mock_refine.assert_not_awaited()
+        assert event_queue.get_nowait() == {
+            "status": "role_refined",
+            "data": refined.model_dump(mode="json"),
+            "original_index": 3,
+            "cached": True,
+        }
+        assert event_queue.empty()
+
+    async def test_streaming_puts_role_progress_events(self):
+        """Test that partial summaries are queued as role_progress events when streaming."""
+        job = RoleRefinementJob(
+            role=create_mock_role(),
+            job_analysis=create_mock_job_analysis(),
+            llm_config=LLMConfig(),
+            original_index=2,
+        )
+        refined = RefinedRole.model_validate(create_mock_role().model_dump())
+        event_queue = asyncio.Queue()
+
+        async def refine_with_preview(**kwargs):
+            await kwargs["options"].partial_callback("Refined sum")
+            return refined
+
+        with (
+            patch(
+                "resume_editor.app.llm.orchestration_refinement.is_role_streaming_enabled",
+                return_value=True,
+            ),
+            patch(
+                "resume_editor.app.llm.orchestration_refinement.refine_role",
+                side_effect=refine_with_preview,
+            ),
+        ):
+            await _refine_role_and_put_on_queue(job, asyncio.Semaphore(1), event_queue)
+
+        events = []
+        while not event_queue.empty():
+            events.append(await event_queue.get())
+
+        assert [e["status"] for e in events] == [
+            "in_progress",
+            "role_progress",
+            "role_refined",
+        ]
+        assert events[1] == {
+            "status": "role_progress",
+            "original_index": 2,
+            "role_title": "Old Title @ Old Company",
+            "summary": "Refined sum",
+        }
+
+    async def test_streaming_disabled_passes_no_partial_callback(self):
+        """Test that responses are not streamed when role streaming is disabled."""
+        job = RoleRefinementJob(
+            role=create_mock_role(),
+            job_analysis=create_mock_job_analysis(),
+            llm_config=LLMConfig(),
+            original_index=0,
+        )
+        refined = RefinedRole.model_validate(create_mock_role().model_dump())
+
+        with patch(
+            "resume_editor.app.llm.orchestration_refinement.refine_role",
+            new_callable=AsyncMock,
+            return_value=refined,
+        ) as mock_refine:
+            await _refine_role_and_put_on_queue(
+                job, asyncio.Semaphore(1), asyncio.Queue()
+            )
+
+        assert mock_refine.call_args.kwargs["options"].partial_callback is None
+
+    async def test_fresh_role_is_stored_in_cache(self):
+        """Test that a freshly refined role is cached for the next refinement."""
+        job = RoleRefinementJob(
+            role=create_mock_role(),
+            job_analysis=create_mock_job_analysis(),
+            llm_config=LLMConfig(),
+            original_index=0,
+        )
+        refined = RefinedRole.model_validate(create_mock_role().model_dump())
+
+        with patch(
+            "resume_editor.app.llm.orchestration_refinement.refine_role",
+            new_callable=AsyncMock,
+            return_value=refined,
+        ):
+            await _refine_role_and_put_on_queue(
+                job, asyncio.Semaphore(1), asyncio.Queue()
+            )
+
+        cache_key = role_refinement_cache_key(
+            job.role, job.job_analysis, job.llm_config.llm_model_name
+        )
+        assert role_refinement_cache.get(cache_key) == refined.model_dump(mode="json")
+
+
+@pytest.mark.parametrize(
+    ("bypass_role_cache", "expected_hits", "expected_misses"),
+    [(False, 1, 1), (True, 0, 0)],
+)
+def test_build_refinement_jobs_looks_each_role_up_once(
+    bypass_role_cache, expected_hits, expected_misses
+):
+    """Test that jobs carry their cache entry from a single lookup per role."""
+    role_a = create_mock_role()
+    role_a.basics.company = "A"
+    role_b = create_mock_role()
+    role_b.basics.company = "B"
+    job_analysis = create_mock_job_analysis()
+    cached = create_refined_role_dict("A")
+    role_refinement_cache.put(
+        role_refinement_cache_key(role_a, job_analysis, None), cached
+    )
+    params = RefinementOrchestratorParams(
+        resume_content="resume",
+        job_description="job",
+        llm_config=LLMConfig(),
+        state=RefinementState(bypass_role_cache=bypass_role_cache),
+    )
+
+    jobs = _build_refinement_jobs(params, job_analysis, [(0, role_a), (1, role_b)])
+
+    assert [job.original_index for job in jobs] == [0, 1]
+    assert jobs[0].cached_data == (None if bypass_role_cache else cached)
+    assert jobs[1].cached_data is None
+    stats = role_refinement_cache.stats()
+    assert (stats.hits, stats.misses) == (expected_hits, expected_misses)
+
+
+def create_refined_role_dict(company: str, summary: str = "Refined summary.") -> dict:
+    """Helper to create the LLM's JSON for a refined role at a company."""
+    return {
+        "basics": {
+            "company": company,
+            "title": "Old Title",
+            "start_date": "2020-01-01T00:00:00",
+        },
+        "summary": {"text": summary},
+    }
+
+
+def create_role_job(company: str, index: int) -> RoleRefinementJob:
+    """Helper to create a refinement job for a role at a company."""
+    role = create_mock_role()
+    role.basics.company = company
+    return RoleRefinementJob(
+        role=role,
+        job_analysis=create_mock_job_analysis(),
+        llm_config=LLMConfig(),
+        original_index=index,
+    )
+
+
+@pytest.mark.asyncio
+class TestRefineBatchAndPutOnQueue:
+    """Tests for _refine_batch_and_put_on_queue function."""
+
+    async def test_invalid_roles_fall_back_to_single_refinement(self):
+        """Test that roles the batch did not refine are refined one by one."""
+        jobs = [create_role_job("A", 0), create_role_job("B", 1)]
+        batch_result = RefinedRole.model_validate(create_refined_role_dict("A"))
+        single_result = RefinedRole.model_validate(create_refined_role_dict("B"))
+        event_queue = asyncio.Queue()
+
+        with (
+            patch(
+                "resume_editor.app.llm.orchestration_refinement.refine_role_batch",
+                new_callable=AsyncMock,
+                return_value=[batch_result, None],
+            ) as mock_batch,
+            patch(
+                "resume_editor.app.llm.orchestration_refinement.refine_role",
+                new_callable=AsyncMock,
+                return_value=single_result,
+            ) as mock_refine,
+        ):
+            await _refine_batch_and_put_on_queue(jobs, asyncio.Semaphore(1), event_queue)
+
+        events = []
+        while not event_queue.empty():
+            events.append(await event_queue.get())
+
+        mock_batch.assert_awaited_once()
+        assert mock_refine.call_args.kwargs["role"] is jobs[1].role
+        refined = [e for e in events if e["status"] == "role_refined"]
+        assert [(e["original_index"], e["data"]["basics"]["company"]) for e in refined] == [
+            (0, "A"),
+            (1, "B"),
+        ]
+        assert "Refining 2 roles together" in events[0]["message"]
+
+    async def test_single_job_is_refined_alone(self):
+        """Test that a batch of one job uses single-role refinement."""
+        job = create_role_job("A", 0)
+
+        with (
+            patch(
+                "resume_editor.app.llm.orchestration_refinement.refine_role_batch",
+                new_callable=AsyncMock,
+            ) as mock_batch,
+            patch(
+                "resume_editor.app.llm.orchestration_refinement.refine_role",
+                new_callable=AsyncMock,
+                return_value=RefinedRole.model_validate(create_refined_role_dict("A")),
+            ) as mock_refine,
+        ):
+            await _refine_batch_and_put_on_queue(
+                [job], asyncio.Semaphore(1), asyncio.Queue()
+            )
+
+        mock_batch.assert_not_awaited()
+        mock_refine.assert_awaited_once()
+
+
+class TestPlanRefinementBatches:
+    """Tests for _plan_refinement_batches function."""
+
+    def test_batching_disabled_refines_each_role_alone(self):
+        """Test that every job is its own batch without a batch token budget."""
+        jobs = [create_role_job(c, i) for i, c in enumerate("ABC")]
+
+        with patch(
+            "resume_editor.app.llm.orchestration_refinement.get_role_batch_policy",
+            return_value=RoleBatchPolicy(token_budget=0),
+        ):
+            assert _plan_refinement_batches(jobs) == [[job] for job in jobs]
+
+    def test_small_roles_share_a_batch_and_cached_roles_stay_alone(self):
+        """Test that uncached roles are packed together and cached ones are not."""
+        jobs = [create_role_job(c, i) for i, c in enumerate("ABC")]
+        jobs[0].cached_data = create_refined_role_dict("A")
+
+        with patch(
+            "resume_editor.app.llm.orchestration_refinement.get_role_batch_policy",
+            return_value=RoleBatchPolicy(token_budget=10000, max_roles=6),
+        ):
+            batches = _plan_refinement_batches(jobs)
+
+        assert batches == [[jobs[0]], [jobs[1], jobs[2]]]
 
 
 @pytest.mark.asyncio
@@ -774,3 +1071,60 @@ class TestAsyncRefineExperienceSection:
         # Check that skip message is in events
         skip_messages = [e for e in events if "Skipping" in str(e.get("message", ""))]
         assert len(skip_messages) > 0
+
+
+@pytest.mark.asyncio
+async def test_analyze_job_if_needed_uses_persistent_cache_hit():
+    """Test that a cached analysis is returned without calling the LLM."""
+    cached = create_mock_job_analysis()
+    cache = MagicMock()
+    cache.get = AsyncMock(return_value=cached)
+    cache.put = AsyncMock()
+    params = RefinementOrchestratorParams(
+        resume_content="resume",
+        job_description="job",
+        llm_config=LLMConfig(),
+        state=RefinementState(analysis_cache=cache, analysis_cache_key="key"),
+    )
+
+    with patch(
+        "resume_editor.app.llm.orchestration_analysis.analyze_job_description",
+        new_callable=AsyncMock,
+    ) as mock_analyze:
+        result = await _analyze_job_if_needed(params)
+
+    assert result is cached
+    cache.get.assert_awaited_once_with("key")
+    mock_analyze.assert_not_called()
+    cache.put.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_analyze_job_if_needed_stores_fresh_analysis_on_cache_miss():
+    """Test that a fresh analysis is stored in the cache after a miss."""
+    fresh = create_mock_job_analysis()
+    cache = MagicMock()
+    cache.get = AsyncMock(return_value=None)
+    cache.put = AsyncMock()
+    params = RefinementOrchestratorParams(
+        resume_content="resume",
+        job_description="job",
+        llm_config=LLMConfig(),
+        state=RefinementState(analysis_cache=cache, analysis_cache_key="key"),
+    )
+
+    with patch(
+        "resume_editor.app.llm.orchestration_analysis.analyze_job_description",
+        new_callable=AsyncMock,
+        return_value=(fresh, None),
+    ) as mock_analyze:
+        result = await _analyze_job_if_needed(params)
+
+    assert result is fresh
+    mock_analyze.assert_awaited_once_with(
+        job_description="job",
+        llm_config=params.llm_config,
+        resume_content_for_context="resume",
+        retry_budget=None,
+    )
+    cache.put.assert_awaited_once_with("key", fresh)
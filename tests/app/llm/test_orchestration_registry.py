@@ -0,0 +1,164 @@
+"""Tests for orchestration_registry module."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from resume_editor.app.llm.models import LLMConfig
+from resume_editor.app.llm.orchestration_registry import (
+    LLMClientRegistry,
+    _HttpPools,
+    llm_client_key,
+)
+
+CONFIG_A = LLMConfig(llm_endpoint="http://llm-a", api_key="key-a", llm_model_name="m")
+CONFIG_B = LLMConfig(llm_endpoint="http://llm-b", api_key="key-b", llm_model_name="m")
+
+
+@pytest.fixture
+def mock_init_llm():
+    """Patch client creation so each call returns a distinct mock client."""
+    with patch(
+        "resume_editor.app.llm.orchestration_registry.initialize_llm_client",
+        side_effect=lambda *args, **kwargs: MagicMock(),
+    ) as mock_init:
+        yield mock_init
+
+
+def test_llm_client_key_hashes_api_key():
+    """Test that the key holds a digest of the API key, never the key itself."""
+    key = llm_client_key(CONFIG_A)
+
+    assert key[:2] == ("http://llm-a", "m")
+    assert "key-a" not in key[2]
+    assert len(key[2]) == 64
+    assert llm_client_key(LLMConfig()) == llm_client_key(
+        LLMConfig(llm_model_name="gpt-4o"),
+    )
+
+
+def test_get_client_reuses_client_and_shares_http_pools(mock_init_llm):
+    """Test that one client is created per key and all share the HTTP pools."""
+    registry = LLMClientRegistry()
+
+    first = registry.get_client(CONFIG_A)
+    again = registry.get_client(LLMConfig(**CONFIG_A.model_dump()))
+    other = registry.get_client(CONFIG_B)
+
+    assert first is again
+    assert first is not other
+    assert mock_init_llm.call_count == 2
+    pools = [call.kwargs["http_async_client"] for call in mock_init_llm.call_args_list]
+    assert pools[0] is pools[1]
+    assert isinstance(pools[0], httpx.AsyncClient)
+    stats = registry.stats()
+    assert (stats.clients, stats.client_hits, stats.client_misses) == (2, 1, 2)
+
+
+def test_get_chain_builds_once_per_client(mock_init_llm):
+    """Test that prepared chains are cached per registry client and name."""
+    registry = LLMClientRegistry()
+    llm = registry.get_client(CONFIG_A)
+    build = MagicMock(side_effect=lambda _llm: MagicMock())
+
+    first = registry.get_chain(llm, "role_refine", build)
+    again = registry.get_chain(llm, "role_refine", build)
+    other = registry.get_chain(llm, "job_analysis", build)
+
+    assert first is again
+    assert first is not other
+    assert build.call_count == 2
+    build.assert_called_with(llm)
+    assert registry.stats().chain_hits == 1
+
+
+def test_get_chain_for_foreign_client_is_not_cached():
+    """Test that a client from outside the registry always gets a fresh chain."""
+    registry = LLMClientRegistry()
+    build = MagicMock(side_effect=lambda _llm: MagicMock())
+    llm = MagicMock()
+
+    assert registry.get_chain(llm, "x", build) is not registry.get_chain(llm, "x", build)
+    assert registry.stats().chains == 0
+
+
+def test_client_key_identifies_pooled_clients(mock_init_llm):
+    """Test that a pooled client maps back to its key and a foreign one to None."""
+    registry = LLMClientRegistry()
+    llm = registry.get_client(CONFIG_A)
+
+    assert registry.client_key(llm) == llm_client_key(CONFIG_A)
+    assert registry.client_key(MagicMock()) is None
+
+
+def test_eviction_drops_least_recently_used_client_and_its_chains(mock_init_llm):
+    """Test LRU eviction of clients together with their prepared chains."""
+    registry = LLMClientRegistry(max_clients=1)
+    llm_a = registry.get_client(CONFIG_A)
+    registry.get_chain(llm_a, "role_refine", lambda _llm: MagicMock())
+
+    llm_b = registry.get_client(CONFIG_B)
+
+    stats = registry.stats()
+    assert (stats.clients, stats.chains, stats.evictions) == (1, 0, 2)
+    assert registry.get_client(CONFIG_B) is llm_b
+    assert registry.get_client(CONFIG_A) is not llm_a
+
+
+def test_event_loop_change_replaces_clients(mock_init_llm):
+    """Test that clients bound to a finished event loop are not reused."""
+    registry = LLMClientRegistry()
+
+    async def get():
+        return registry.get_client(CONFIG_A)
+
+    first = asyncio.run(get())
+    second = asyncio.run(get())
+
+    assert first is not second
+
+
+def test_warm_requests_model_list_once_per_keepalive_window(mock_init_llm):
+    """Test that warming opens one pooled connection and skips recent warm-ups."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"data": []})
+
+    def create_pools(loop, _keepalive_expiry):
+        transport = httpx.MockTransport(handler)
+        return _HttpPools(
+            sync_client=httpx.Client(transport=transport),
+            async_client=httpx.AsyncClient(transport=transport),
+            loop=loop,
+        )
+
+    registry = LLMClientRegistry()
+
+    async def warm_twice():
+        await registry.warm(CONFIG_A)
+        await registry.warm(CONFIG_A)
+        await registry.aclose()
+
+    with patch(
+        "resume_editor.app.llm.orchestration_registry._create_http_pools",
+        side_effect=create_pools,
+    ):
+        asyncio.run(warm_twice())
+
+    assert [str(r.url) for r in requests] == ["http://llm-a/models"]
+
+
+def test_warm_ignores_failures():
+    """Test that a failing warm-up is logged and swallowed."""
+    registry = LLMClientRegistry()
+    with patch(
+        "resume_editor.app.llm.orchestration_registry.initialize_llm_client",
+        side_effect=ValueError("no key"),
+    ):
+        asyncio.run(registry.warm(CONFIG_A))
+
+    assert registry.stats().warmups == 0
@@ -0,0 +1,148 @@
+"""Tests for prompt_encoding module."""
+
+import json
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from resume_editor.app.llm.models import CrossSectionEvidence, JobAnalysis
+from resume_editor.app.llm.prompt_encoding import (
+    ROLE_REFINE_JOB_ANALYSIS_FIELDS,
+    ROLE_REFINE_ROLE_EXCLUDE,
+    encode_json,
+    encode_model,
+    encode_models,
+    get_prompt_encoding,
+)
+from resume_editor.app.models.resume.experience import (
+    Role,
+    RoleBasics,
+    RoleSkills,
+    RoleSummary,
+)
+
+
+def create_role() -> Role:
+    """Create a role with unset optional fields."""
+    return Role(
+        basics=RoleBasics(
+            company="Acme",
+            title="Engineer",
+            start_date=datetime(2020, 1, 1),
+        ),
+        summary=RoleSummary(text="Built things."),
+        skills=RoleSkills(skills=["Python"]),
+    )
+
+
+def test_compact_encoding_drops_whitespace_nulls_and_excluded_fields():
+    """Test that compact encoding keeps only the fields with information."""
+    role_json = encode_model(
+        create_role(),
+        encoding="compact",
+        exclude=ROLE_REFINE_ROLE_EXCLUDE,
+    )
+
+    assert "\n" not in role_json
+    assert "null" not in role_json
+    assert "inclusion_status" not in role_json
+    assert json.loads(role_json) == {
+        "basics": {
+            "company": "Acme",
+            "title": "Engineer",
+            "start_date": "2020-01-01T00:00:00",
+        },
+        "summary": {"text": "Built things."},
+        "skills": {"skills": ["Python"]},
+    }
+
+
+def test_compact_encoding_keeps_only_included_fields():
+    """Test that the role refinement prompt gets only the job analysis it uses."""
+    analysis = JobAnalysis(
+        key_skills=["Python"],
+        primary_duties=["Build"],
+        themes=["ownership"],
+        company_name="Acme",
+        pay_rate="$100k",
+    )
+
+    encoded = encode_model(
+        analysis,
+        encoding="compact",
+        include=ROLE_REFINE_JOB_ANALYSIS_FIELDS,
+    )
+
+    assert json.loads(encoded) == {
+        "key_skills": ["Python"],
+        "primary_duties": ["Build"],
+        "themes": ["ownership"],
+    }
+
+
+def test_indented_encoding_dumps_every_field():
+    """Test that indented encoding keeps the full, indented dump."""
+    role = create_role()
+
+    encoded = encode_model(role, encoding="indented", exclude=ROLE_REFINE_ROLE_EXCLUDE)
+
+    assert encoded == role.model_dump_json(indent=2)
+
+
+def test_compact_encoding_is_smaller():
+    """Test that compact encoding saves characters over indented encoding."""
+    role = create_role()
+
+    compact = encode_model(role, encoding="compact")
+    indented = encode_model(role, encoding="indented")
+
+    assert len(compact) < len(indented)
+
+
+def test_encode_json_and_models():
+    """Test the encoding of plain data and lists of models."""
+    evidence = [
+        CrossSectionEvidence(section_type="Education", content="BSc", relevance_score=7),
+    ]
+
+    assert encode_json({"a": [1, 2]}, encoding="compact") == '{"a":[1,2]}'
+    assert encode_json({"a": 1}, encoding="indented") == '{\n  "a": 1\n}'
+    assert json.loads(encode_models(evidence, encoding="compact")) == [
+        evidence[0].model_dump(mode="json", exclude_none=True, exclude_defaults=True),
+    ]
+
+
+def test_encoding_defaults_to_settings():
+    """Test that the configured encoding is used when none is given."""
+    settings = MagicMock(llm_prompt_encoding="indented")
+    with patch(
+        "resume_editor.app.llm.prompt_encoding.get_settings",
+        return_value=settings,
+    ):
+        assert get_prompt_encoding() == "indented"
+        assert encode_json({"a": 1}) == '{\n  "a": 1\n}'
+
+
+def test_encode_models_drops_excluded_fields_when_compact():
+    """Test that the excluded fields of every model are dropped in compact encoding."""
+    roles = [create_role(), create_role()]
+
+    compact = json.loads(
+        encode_models(roles, encoding="compact", exclude=ROLE_REFINE_ROLE_EXCLUDE),
+    )
+    indented = json.loads(
+        encode_models(roles, encoding="indented", exclude=ROLE_REFINE_ROLE_EXCLUDE),
+    )
+
+    assert all("inclusion_status" not in role["basics"] for role in compact)
+    assert all("inclusion_status" in role["basics"] for role in indented)
+
+
+def test_encode_models_drops_defaults_when_compact():
+    """Test that compact encoding of a list drops defaults like encode_model does."""
+    roles = [create_role()]
+
+    compact = json.loads(encode_models(roles, encoding="compact"))
+    indented = json.loads(encode_models(roles, encoding="indented"))
+
+    assert compact == [json.loads(encode_model(roles[0], encoding="compact"))]
+    assert "inclusion_status" in indented[0]["basics"]
@@ -0,0 +1,216 @@
+"""Tests for rate_limiter module."""
+
+import asyncio
+import fcntl
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from resume_editor.app.llm.models import LLMConfig
+from resume_editor.app.llm.orchestration_registry import llm_client_key
+from resume_editor.app.llm.rate_limiter import (
+    FileRateLimitBackend,
+    LLMRateLimiter,
+    MemoryRateLimitBackend,
+    RateLimits,
+    estimate_tokens,
+    rate_limit_key,
+    take_from_buckets,
+)
+
+
+def test_rate_limit_key_ignores_model_and_trailing_slash():
+    """Test that models on one endpoint and API key share a key."""
+    key = rate_limit_key(
+        llm_client_key(LLMConfig(llm_endpoint="http://llm/v1/", api_key="k", llm_model_name="a")),
+    )
+
+    same = rate_limit_key(
+        llm_client_key(LLMConfig(llm_endpoint="http://llm/v1", api_key="k", llm_model_name="b")),
+    )
+    other_key = rate_limit_key(
+        llm_client_key(LLMConfig(llm_endpoint="http://llm/v1", api_key="other")),
+    )
+
+    assert key == same
+    assert key != other_key
+    assert key.startswith("http://llm/v1#")
+    assert len(key.split("#")[1]) == 64
+    assert rate_limit_key(llm_client_key(LLMConfig())).startswith(
+        "https://api.openai.com/v1#",
+    )
+
+
+def test_estimate_tokens_adds_template_and_completion_allowances():
+    """Test that the estimate covers the input, the template and the completion."""
+    assert estimate_tokens({"a": "x" * 400, "b": "y" * 400}) == 200 + 500 + 1000
+
+
+def test_take_from_buckets_starts_full_and_refills():
+    """Test that buckets start with a minute's budget and refill continuously."""
+    limits = RateLimits(requests_per_minute=2, tokens_per_minute=1000)
+
+    state, wait = take_from_buckets(None, limits, 400, now=0.0)
+    assert wait == 0.0
+    state, wait = take_from_buckets(state, limits, 400, now=0.0)
+    assert wait == 0.0
+    assert state == {"requests": 0.0, "tokens": 200.0, "updated_at": 0.0}
+
+    state, wait = take_from_buckets(state, limits, 400, now=0.0)
+    assert wait == 30.0
+    assert state["requests"] == 0.0
+
+    state, wait = take_from_buckets(state, limits, 400, now=30.0)
+    assert wait == 0.0
+    assert state == {"requests": 0.0, "tokens": 300.0, "updated_at": 30.0}
+
+
+def test_take_from_buckets_waits_for_the_emptier_bucket():
+    """Test that a request waits until both budgets cover it."""
+    limits = RateLimits(requests_per_minute=100, tokens_per_minute=600)
+    state = {"requests": 50.0, "tokens": 100.0, "updated_at": 0.0}
+
+    new_state, wait = take_from_buckets(state, limits, 400, now=0.0)
+
+    assert wait == 30.0
+    assert new_state["requests"] == 50.0
+
+
+def test_take_from_buckets_caps_oversized_requests():
+    """Test that a request above the token budget goes through on a full bucket."""
+    limits = RateLimits(tokens_per_minute=1000)
+
+    state, wait = take_from_buckets(None, limits, 5000, now=0.0)
+
+    assert wait == 0.0
+    assert state == {"tokens": 0.0, "updated_at": 0.0}
+
+
+def test_file_backend_shares_buckets_between_instances(tmp_path):
+    """Test that backends on one state directory, as in separate workers, share a budget."""
+    limits = RateLimits(requests_per_minute=1)
+    first = FileRateLimitBackend(tmp_path)
+    second = FileRateLimitBackend(tmp_path)
+
+    assert first.try_acquire("http://llm#k", limits, 10, now=0.0) == 0.0
+    assert second.try_acquire("http://llm#k", limits, 10, now=0.0) == 60.0
+    assert second.try_acquire("http://other#k", limits, 10, now=0.0) == 0.0
+    assert all("llm" not in path.name for path in tmp_path.iterdir())
+
+
+def test_file_backend_recovers_from_corrupt_state(tmp_path):
+    """Test that an unreadable state file is replaced with full buckets."""
+    backend = FileRateLimitBackend(tmp_path)
+    backend._path("k").write_text("{not json")
+
+    assert backend.try_acquire("k", RateLimits(requests_per_minute=1), 1, now=0.0) == 0.0
+
+
+def test_memory_backend_evicts_least_recently_used():
+    """Test LRU eviction of keys, which then start again with full buckets."""
+    limits = RateLimits(requests_per_minute=1)
+    backend = MemoryRateLimitBackend(max_keys=1)
+
+    backend.try_acquire("a", limits, 1, now=0.0)
+    backend.try_acquire("b", limits, 1, now=0.0)
+
+    assert backend.try_acquire("a", limits, 1, now=0.0) == 0.0
+
+
+@pytest.mark.asyncio
+class TestLLMRateLimiter:
+    """Tests for LLMRateLimiter."""
+
+    async def test_unlimited_by_default(self):
+        """Test that nothing is throttled or recorded without configured budgets."""
+        limiter = LLMRateLimiter()
+
+        assert await limiter.acquire("k", 10**6) == 0.0
+        assert limiter.stats().acquired == 0
+
+    async def test_waits_until_budget_refills(self, fake_clock):
+        """Test that a request over budget sleeps until the bucket refills."""
+        limiter = LLMRateLimiter(RateLimits(requests_per_minute=60), clock=fake_clock)
+
+        async def advance(seconds):
+            fake_clock.now += seconds
+
+        with patch(
+            "resume_editor.app.llm.rate_limiter.asyncio.sleep",
+            side_effect=advance,
+        ) as mock_sleep:
+            assert [await limiter.acquire("k", 1) for _ in range(60)][-1] == 0.0
+            waited = await limiter.acquire("k", 1)
+
+        assert waited == pytest.approx(1.0)
+        mock_sleep.assert_awaited_once()
+        stats = limiter.stats()
+        assert (stats.acquired, stats.throttled) == (61, 1)
+        assert stats.max_wait_seconds == pytest.approx(1.0)
+
+    async def test_try_acquire_never_waits(self, fake_clock):
+        """Test that a non-blocking request is refused instead of throttled."""
+        limiter = LLMRateLimiter(RateLimits(requests_per_minute=1), clock=fake_clock)
+
+        assert await limiter.try_acquire("k", 1) is True
+        assert await limiter.try_acquire("k", 1) is False
+        assert await LLMRateLimiter().try_acquire("k", 10**6) is True
+        assert (limiter.stats().acquired, limiter.stats().throttled) == (1, 0)
+
+    async def test_file_backend_lock_wait_leaves_the_event_loop_running(self, tmp_path):
+        """Test that waiting for another worker's file lock does not block the loop."""
+        backend = FileRateLimitBackend(tmp_path)
+        limiter = LLMRateLimiter(RateLimits(requests_per_minute=60), backend=backend)
+        held = backend._path("k").open("a")
+        fcntl.flock(held, fcntl.LOCK_EX)
+        release = threading.Timer(0.2, held.close)
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        release.start()
+        try:
+            await limiter.acquire("k", 1)
+        finally:
+            ticker.cancel()
+            release.join()
+
+        assert ticks >= 5
+        assert await limiter.try_acquire("k", 1) is True
+
+    async def test_ainvoke_takes_from_the_budget_before_invoking(self):
+        """Test that the chain is invoked after its estimated tokens are taken."""
+        limiter = LLMRateLimiter(RateLimits(tokens_per_minute=100000))
+        chain = MagicMock()
+        chain.ainvoke = AsyncMock(return_value="ok")
+
+        with patch.object(limiter, "acquire", wraps=limiter.acquire) as mock_acquire:
+            result = await limiter.ainvoke(chain, {"text": "x" * 40}, "k")
+            await limiter.ainvoke(chain, {"text": "x"}, None)
+
+        assert result == "ok"
+        mock_acquire.assert_awaited_once_with("k", 10 + 500 + 1000)
+        chain.ainvoke.assert_awaited_with({"text": "x"}, config=None)
+
+    async def test_configure_validates_and_switches_backend(self, tmp_path):
+        """Test configuring the budgets and the file backend."""
+        limiter = LLMRateLimiter()
+
+        limiter.configure(10, 20000, backend="file", state_dir=tmp_path)
+        stats = limiter.stats()
+        assert (stats.backend, stats.requests_per_minute) == ("file", 10)
+
+        with pytest.raises(ValueError):
+            limiter.configure(-1, 0)
+        with pytest.raises(ValueError):
+            limiter.configure(1, 0, backend="redis")
+
+        limiter.reset()
+        assert limiter.stats().backend == "memory"
+        assert limiter.limits.enabled is False
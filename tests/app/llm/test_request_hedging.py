@@ -0,0 +1,165 @@
+"""Tests for request_hedging module."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from resume_editor.app.llm.request_hedging import (
+    MIN_LATENCY_SAMPLES,
+    RequestHedger,
+    latency_quantile,
+)
+
+
+def create_warm_hedger(
+    latency: float = 0.01,
+    samples: int = MIN_LATENCY_SAMPLES,
+    **kwargs,
+) -> RequestHedger:
+    """Create an enabled hedger that has seen enough latencies of endpoint "k"."""
+    hedger = RequestHedger(enabled=True, min_hedge_delay_seconds=0.0, **kwargs)
+    for _ in range(samples):
+        hedger.record_latency("k", latency)
+    return hedger
+
+
+def test_latency_quantile_nearest_rank():
+    """Test the nearest-rank quantile."""
+    latencies = [float(i) for i in range(1, 101)]
+
+    assert latency_quantile(latencies, 0.95) == 95.0
+    assert latency_quantile([3.0, 1.0], 0.95) == 3.0
+    assert latency_quantile([2.0], 0.0) == 2.0
+
+
+def test_hedge_delay_needs_samples_and_respects_minimum():
+    """Test that the delay is the p95 once warm and never below the minimum."""
+    hedger = RequestHedger(enabled=True, min_hedge_delay_seconds=0.5)
+    assert hedger.hedge_delay("k") is None
+
+    for i in range(MIN_LATENCY_SAMPLES):
+        hedger.record_latency("k", 0.1 * (i + 1))
+
+    assert hedger.hedge_delay("k") == pytest.approx(1.9)
+    assert hedger.hedge_delay("other") is None
+
+    hedger.configure(enabled=True, min_hedge_delay_seconds=5.0)
+    assert hedger.hedge_delay("k") == 5.0
+
+    hedger.configure(enabled=False)
+    assert hedger.hedge_delay("k") is None
+
+
+def test_configure_rejects_negative_values():
+    """Test that a negative ratio or delay is rejected."""
+    hedger = RequestHedger()
+
+    with pytest.raises(ValueError):
+        hedger.configure(enabled=True, max_hedge_ratio=-0.1)
+    with pytest.raises(ValueError):
+        hedger.configure(enabled=True, min_hedge_delay_seconds=-1.0)
+
+
+@pytest.mark.asyncio
+class TestRun:
+    """Tests for RequestHedger.run."""
+
+    async def test_fast_request_is_not_hedged(self):
+        """Test that a request finishing before the delay is used alone."""
+        hedger = create_warm_hedger(latency=1.0, max_hedge_ratio=1.0)
+        calls = []
+
+        async def request(hedge):
+            calls.append(hedge)
+            return "primary"
+
+        assert await hedger.run("k", request) == "primary"
+        assert calls == [False]
+        assert hedger.stats().hedges == 0
+
+    async def test_slow_request_is_hedged_and_loser_cancelled(self):
+        """Test that the hedge's result is used and the stuck primary is cancelled."""
+        hedger = create_warm_hedger(max_hedge_ratio=1.0)
+        primary_cancelled = asyncio.Event()
+
+        async def request(hedge):
+            if hedge:
+                return "hedge"
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                primary_cancelled.set()
+                raise
+            return "primary"
+
+        assert await hedger.run("k", request) == "hedge"
+        await asyncio.wait_for(primary_cancelled.wait(), timeout=1)
+        stats = hedger.stats()
+        assert (stats.requests, stats.hedges, stats.hedge_wins) == (1, 1, 1)
+        assert stats.hedge_rate == 1.0
+
+    async def test_failed_first_finisher_waits_for_the_other(self):
+        """Test that a request failing first does not beat a slower success."""
+        hedger = create_warm_hedger(max_hedge_ratio=1.0)
+
+        async def request(hedge):
+            if hedge:
+                raise TimeoutError("hedge failed")
+            await asyncio.sleep(0.05)
+            return "primary"
+
+        assert await hedger.run("k", request) == "primary"
+        assert hedger.stats().hedge_wins == 0
+
+    async def test_both_failing_raises(self):
+        """Test that an error is raised when both requests fail."""
+        hedger = create_warm_hedger(max_hedge_ratio=1.0)
+
+        async def request(hedge):
+            await asyncio.sleep(0.02)
+            raise TimeoutError("hedge" if hedge else "primary")
+
+        with pytest.raises(TimeoutError):
+            await hedger.run("k", request)
+
+    async def test_hedge_budget_and_admission(self):
+        """Test that hedges need credit and admission, and are counted as denied."""
+        # Enough fast samples that the slow primaries do not move the p95.
+        hedger = create_warm_hedger(samples=100, max_hedge_ratio=0.5)
+
+        async def request(hedge):
+            if hedge:
+                return "hedge"
+            await asyncio.sleep(0.2)
+            return "primary"
+
+        # Half a credit after the first request: no hedge.
+        assert await hedger.run("k", request) == "primary"
+        # A full credit after the second, but the rate limit refuses it.
+        refuse = AsyncMock(return_value=False)
+        assert await hedger.run("k", request, admit=refuse) == "primary"
+        refuse.assert_awaited_once()
+        # The refused credit was kept for the next request.
+        assert await hedger.run("k", request, admit=AsyncMock(return_value=True)) == "hedge"
+
+        stats = hedger.stats()
+        assert (stats.requests, stats.hedges, stats.hedges_denied) == (3, 1, 2)
+
+    async def test_disabled_hedger_only_records_latency(self):
+        """Test that nothing is hedged when hedging is disabled."""
+        hedger = RequestHedger(enabled=False, max_hedge_ratio=1.0)
+
+        async def request(hedge):
+            return "primary"
+
+        for _ in range(MIN_LATENCY_SAMPLES + 1):
+            assert await hedger.run("k", request) == "primary"
+
+        assert hedger.stats().hedges == 0
+        hedger.configure(enabled=True, min_hedge_delay_seconds=0.0)
+        assert hedger.hedge_delay("k") is not None
+
+        hedger.reset()
+        assert hedger.stats().requests == 0
+        assert hedger.hedge_delay("k") is None
@@ -0,0 +1,172 @@
+"""Tests for retry_policy module."""
+
+import json
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from openai import (
+    APITimeoutError,
+    AuthenticationError,
+    BadRequestError,
+    InternalServerError,
+    RateLimitError,
+)
+
+from resume_editor.app.llm.retry_policy import (
+    RetryBudget,
+    RetryPolicy,
+    call_with_retries,
+    get_retry_policy,
+    is_retryable_llm_error,
+    retry_after_seconds,
+)
+
+REQUEST = httpx.Request("POST", "http://llm/v1/chat/completions")
+
+
+def _response(status_code: int, headers: dict | None = None) -> httpx.Response:
+    """Build an HTTP response for an OpenAI API error."""
+    return httpx.Response(status_code, headers=headers or {}, request=REQUEST)
+
+
+def _rate_limit_error(headers: dict | None = None, code: str | None = None):
+    """Build a RateLimitError with optional headers and error code."""
+    body = {"code": code} if code else None
+    return RateLimitError(
+        message="Too many requests", response=_response(429, headers), body=body
+    )
+
+
+@pytest.mark.parametrize(
+    ("error", "expected"),
+    [
+        (json.JSONDecodeError("msg", "doc", 0), True),
+        (TimeoutError(), True),
+        (ConnectionError(), True),
+        (APITimeoutError(request=REQUEST), True),
+        (_rate_limit_error(), True),
+        (_rate_limit_error(code="insufficient_quota"), False),
+        (InternalServerError(message="oops", response=_response(503), body=None), True),
+        (BadRequestError(message="bad", response=_response(400), body=None), False),
+        (
+            AuthenticationError(message="no", response=MagicMock(), body=None),
+            False,
+        ),
+        (ValueError("other"), False),
+    ],
+)
+def test_is_retryable_llm_error(error, expected):
+    """Test the classification of transient and permanent errors."""
+    assert is_retryable_llm_error(error) is expected
+
+
+def test_retry_after_prefers_milliseconds_header():
+    """Test that retry-after-ms takes precedence over Retry-After."""
+    error = _rate_limit_error({"retry-after-ms": "1500", "retry-after": "9"})
+    assert retry_after_seconds(error) == 1.5
+
+
+def test_retry_after_parses_seconds_and_dates():
+    """Test Retry-After given as seconds or as an HTTP date."""
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+    assert retry_after_seconds(_rate_limit_error({"retry-after": "4"})) == 4.0
+    from_date = retry_after_seconds(
+        _rate_limit_error({"retry-after": format_datetime(retry_at, usegmt=True)}),
+    )
+    assert 25.0 < from_date <= 30.0
+    assert retry_after_seconds(_rate_limit_error({"retry-after": "soon"})) is None
+    assert retry_after_seconds(TimeoutError()) is None
+
+
+def test_backoff_delay_uses_full_jitter_with_cap():
+    """Test that the backoff is drawn below an exponentially growing, capped ceiling."""
+    policy = RetryPolicy(base_delay_seconds=1.0, max_delay_seconds=5.0)
+
+    with patch(
+        "resume_editor.app.llm.retry_policy.random.uniform",
+        side_effect=lambda low, high: high,
+    ) as mock_uniform:
+        delays = [policy.backoff_delay(attempt) for attempt in range(4)]
+
+    assert delays == [1.0, 2.0, 4.0, 5.0]
+    assert all(call.args[0] == 0.0 for call in mock_uniform.call_args_list)
+
+
+def test_next_delay_gives_up_on_last_attempt_and_permanent_errors():
+    """Test that the policy stops after max_attempts and on non-retryable errors."""
+    policy = RetryPolicy(max_attempts=2)
+
+    assert policy.next_delay(TimeoutError(), attempt=0) is not None
+    assert policy.next_delay(TimeoutError(), attempt=1) is None
+    assert policy.next_delay(ValueError("bad"), attempt=0) is None
+
+
+def test_next_delay_honours_retry_after_up_to_max_delay():
+    """Test Retry-After replaces the backoff and long waits end the retries."""
+    policy = RetryPolicy(max_delay_seconds=10.0)
+
+    assert policy.next_delay(_rate_limit_error({"retry-after": "3"}), 0) == 3.0
+    assert policy.next_delay(_rate_limit_error({"retry-after": "60"}), 0) is None
+
+
+def test_next_delay_spends_the_retry_budget():
+    """Test that every retry spends the shared budget until it runs out."""
+    policy = RetryPolicy()
+    budget = RetryBudget(max_retries=1)
+
+    assert policy.next_delay(TimeoutError(), 0, budget) is not None
+    assert budget.remaining == 0
+    assert policy.next_delay(TimeoutError(), 0, budget) is None
+    assert policy.next_delay(ValueError("bad"), 0, RetryBudget(1)) is None
+
+
+def test_get_retry_policy_reads_settings():
+    """Test that the policy mirrors the configured settings."""
+    settings = MagicMock(
+        llm_retry_max_attempts=5,
+        llm_retry_base_delay_seconds=0.5,
+        llm_retry_max_delay_seconds=8.0,
+        llm_retry_budget=20,
+    )
+    with patch(
+        "resume_editor.app.llm.retry_policy.get_settings", return_value=settings
+    ):
+        policy = get_retry_policy()
+
+    assert policy == RetryPolicy(
+        max_attempts=5,
+        base_delay_seconds=0.5,
+        max_delay_seconds=8.0,
+        retry_budget=20,
+    )
+
+
+@pytest.mark.asyncio
+@patch("resume_editor.app.llm.retry_policy.asyncio.sleep", new_callable=AsyncMock)
+async def test_call_with_retries_retries_transient_failures(mock_sleep):
+    """Test that transient failures are retried after the policy's delay."""
+    operation = AsyncMock(side_effect=[TimeoutError(), "ok"])
+    policy = RetryPolicy(base_delay_seconds=0.0)
+
+    result = await call_with_retries(operation, policy=policy)
+
+    assert result == "ok"
+    assert operation.await_count == 2
+    mock_sleep.assert_awaited_once_with(0.0)
+
+
+@pytest.mark.asyncio
+@patch("resume_editor.app.llm.retry_policy.asyncio.sleep", new_callable=AsyncMock)
+async def test_call_with_retries_reraises_when_giving_up(mock_sleep):
+    """Test that the last error is raised once the policy gives up."""
+    operation = AsyncMock(side_effect=ValueError("bad"))
+
+    with pytest.raises(ValueError, match="bad"):
+        await call_with_retries(operation, policy=RetryPolicy())
+
+    assert operation.await_count == 1
+    mock_sleep.assert_not_awaited()
@@ -0,0 +1,208 @@
+"""Tests for role_batching module."""
+
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from openai import AuthenticationError
+
+from resume_editor.app.llm.models import JobAnalysis, LLMConfig
+from resume_editor.app.llm.role_batching import (
+    RoleBatchPolicy,
+    _parse_role_batch_response,
+    estimate_role_tokens,
+    get_role_batch_policy,
+    plan_role_batches,
+    refine_role_batch,
+)
+from resume_editor.app.models.resume.experience import Role, RoleBasics, RoleSummary
+
+
+def create_role(company: str = "Old Company") -> Role:
+    """Helper to create a role at a company."""
+    return Role(
+        basics=RoleBasics(
+            company=company,
+            title="Old Title",
+            start_date=datetime(2020, 1, 1),
+        ),
+        summary=RoleSummary(text="Old summary."),
+    )
+
+
+def create_job_analysis() -> JobAnalysis:
+    """Helper to create a job analysis."""
+    return JobAnalysis(
+        key_skills=["python", "fastapi"],
+        primary_duties=["develop things"],
+        themes=["agile"],
+    )
+
+
+def create_refined_role_dict(company: str, summary: str = "Refined summary.") -> dict:
+    """Helper to create the LLM's JSON for a refined role at a company."""
+    return {
+        "basics": {
+            "company": company,
+            "title": "Old Title",
+            "start_date": "2020-01-01T00:00:00",
+        },
+        "summary": {"text": summary},
+    }
+
+
+def test_policy_from_settings():
+    """Test that the batch policy is built from the settings."""
+    settings = MagicMock(llm_role_batch_token_budget=800, llm_role_batch_max_roles=3)
+    with patch(
+        "resume_editor.app.llm.role_batching.get_settings",
+        return_value=settings,
+    ):
+        policy = get_role_batch_policy()
+
+    assert policy == RoleBatchPolicy(token_budget=800, max_roles=3)
+    assert policy.enabled is True
+    assert RoleBatchPolicy(token_budget=0).enabled is False
+    assert RoleBatchPolicy(max_roles=1).enabled is False
+
+
+def test_estimate_role_tokens():
+    """Test the character-based token estimate of a role."""
+    assert estimate_role_tokens("x" * 400) == 100
+    assert estimate_role_tokens("") == 1
+
+
+def test_small_roles_fill_the_gaps_left_by_large_ones():
+    """Test first-fit packing in resume order up to the token budget."""
+    policy = RoleBatchPolicy(token_budget=1000, max_roles=6)
+
+    batches = plan_role_batches(
+        ["a", "b", "c", "d", "e"],
+        [600, 700, 300, 200, 100],
+        policy,
+    )
+
+    assert batches == [["a", "c", "e"], ["b", "d"]]
+
+
+def test_role_count_and_oversized_roles():
+    """Test the per-request role cap and roles above the token budget."""
+    policy = RoleBatchPolicy(token_budget=1000, max_roles=2)
+
+    batches = plan_role_batches(["a", "b", "c", "d"], [10, 10, 10, 5000], policy)
+
+    assert batches == [["a", "b"], ["c"], ["d"]]
+
+
+def test_disabled_policy_keeps_roles_alone():
+    """Test that every role is its own request without batching."""
+    batches = plan_role_batches(["a", "b"], [1, 1], RoleBatchPolicy(token_budget=0))
+
+    assert batches == [["a"], ["b"]]
+
+
+class TestParseRoleBatchResponse:
+    """Tests for _parse_role_batch_response function."""
+
+    def test_entries_are_matched_to_roles_by_position(self):
+        """Test that valid entries are kept and invalid or missing ones are None."""
+        roles = [create_role(c) for i, c in enumerate("ABCD")]
+        response = {
+            "roles": [
+                create_refined_role_dict("A"),
+                {"summary": {"text": "no basics"}},
+                create_refined_role_dict("D"),
+            ],
+        }
+
+        results = _parse_role_batch_response(
+            f"```json\n{json.dumps(response)}\n```", roles
+        )
+
+        assert results[0].summary.text == "Refined summary."
+        assert results[0].basics.inclusion_status == roles[0].basics.inclusion_status
+        # An invalid entry, an entry for another role and a missing entry
+        assert results[1:] == [None, None, None]
+
+    def test_response_without_roles_list(self):
+        """Test that a response without a roles list refines no role."""
+        roles = [create_role(), create_role()]
+
+        assert _parse_role_batch_response('{"roles": {}}', roles) == [None, None]
+        assert _parse_role_batch_response("[1, 2]", roles) == [None, None]
+
+
+@pytest.mark.asyncio
+class TestRefineRoleBatch:
+    """Tests for refine_role_batch function."""
+
+    @pytest.fixture
+    def mock_batch_chain(self):
+        """Fixture to mock the prepared batch refinement chain."""
+        mock_chain = MagicMock()
+        with (
+            patch("resume_editor.app.llm.role_batching.get_llm_client"),
+            patch(
+                "resume_editor.app.llm.role_batching.get_prepared_chain",
+                return_value=mock_chain,
+            ) as mock_get_chain,
+        ):
+            yield mock_chain, mock_get_chain
+
+    async def test_refines_roles_in_one_request(self, mock_batch_chain):
+        """Test that several roles share one request with one job analysis."""
+        mock_chain, mock_get_chain = mock_batch_chain
+        response = {
+            "roles": [create_refined_role_dict("A"), create_refined_role_dict("B")],
+        }
+        mock_chain.ainvoke = AsyncMock(return_value=json.dumps(response))
+        roles = [create_role("A"), create_role("B")]
+
+        results = await refine_role_batch(
+            roles=roles,
+            job_analysis=create_job_analysis(),
+            llm_config=LLMConfig(),
+        )
+
+        assert [r.basics.company for r in results] == ["A", "B"]
+        assert mock_get_chain.call_args.args[1] == "role_refine_batch"
+        mock_chain.ainvoke.assert_awaited_once()
+        chain_input = mock_chain.ainvoke.call_args.args[0]
+        assert chain_input["role_count"] == 2
+        assert "inclusion_status" not in chain_input["roles_json"]
+        assert [r["basics"]["company"] for r in json.loads(chain_input["roles_json"])] == [
+            "A",
+            "B",
+        ]
+
+    async def test_failed_request_refines_no_role(self, mock_batch_chain):
+        """Test that a failed request leaves every role to single-role refinement."""
+        mock_chain, _ = mock_batch_chain
+        mock_chain.ainvoke = AsyncMock(side_effect=TimeoutError("slow"))
+
+        results = await refine_role_batch(
+            roles=[create_role(), create_role()],
+            job_analysis=create_job_analysis(),
+            llm_config=LLMConfig(),
+        )
+
+        assert results == [None, None]
+
+    async def test_authentication_error_is_raised(self, mock_batch_chain):
+        """Test that an authentication failure is not hidden by the fallback."""
+        mock_chain, _ = mock_batch_chain
+        mock_chain.ainvoke = AsyncMock(
+            side_effect=AuthenticationError(
+                message="Invalid API key",
+                response=MagicMock(),
+                body=None,
+            ),
+        )
+
+        with pytest.raises(AuthenticationError):
+            await refine_role_batch(
+                roles=[create_role(), create_role()],
+                job_analysis=create_job_analysis(),
+                llm_config=LLMConfig(),
+            )
@@ -0,0 +1,78 @@
+"""Tests for role_refinement_cache module."""
+
+from datetime import datetime
+
+from resume_editor.app.llm.models import JobAnalysis
+from resume_editor.app.llm.role_refinement_cache import (
+    RoleRefinementCache,
+    role_refinement_cache_key,
+)
+from resume_editor.app.models.resume.experience import Role, RoleBasics
+
+ROLE = Role(
+    basics=RoleBasics(
+        company="Acme",
+        title="Engineer",
+        start_date=datetime(2020, 1, 1),
+    ),
+)
+ANALYSIS = JobAnalysis(key_skills=["python"], primary_duties=["build"], themes=[])
+
+
+def test_cache_key_depends_on_every_input():
+    """Test that the key changes with the role, analysis and model only."""
+    key = role_refinement_cache_key(ROLE, ANALYSIS, "m")
+    other_role = ROLE.model_copy(
+        update={"basics": ROLE.basics.model_copy(update={"title": "Lead"})},
+    )
+    other_analysis = ANALYSIS.model_copy(update={"themes": ["speed"]})
+
+    assert key == role_refinement_cache_key(ROLE.model_copy(), ANALYSIS, "m")
+    assert key != role_refinement_cache_key(other_role, ANALYSIS, "m")
+    assert key != role_refinement_cache_key(ROLE, other_analysis, "m")
+    assert key != role_refinement_cache_key(ROLE, ANALYSIS, "other")
+    assert role_refinement_cache_key(ROLE, ANALYSIS, None) == role_refinement_cache_key(
+        ROLE, ANALYSIS, "gpt-4o"
+    )
+
+
+def test_get_returns_private_copies_and_counts_hit_rate():
+    """Test that hits return copies and the stats report the hit rate."""
+    cache = RoleRefinementCache()
+    data = {"basics": {"title": "Engineer"}}
+
+    assert cache.get("k") is None
+    cache.put("k", data)
+    data["basics"]["title"] = "changed"
+    first = cache.get("k")
+    first["basics"]["title"] = "mutated"
+
+    assert cache.get("k") == {"basics": {"title": "Engineer"}}
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (2, 1, 1)
+    assert stats.hit_rate == 2 / 3
+
+
+def test_put_evicts_least_recently_used():
+    """Test LRU eviction once the entry cap is exceeded."""
+    cache = RoleRefinementCache(max_entries=2)
+    cache.put("a", {})
+    cache.put("b", {})
+    cache.get("a")
+    cache.put("c", {})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {}
+    assert cache.stats().evictions == 1
+
+
+def test_clear_resets_entries_and_counters():
+    """Test that clear drops entries and zeroes the counters."""
+    cache = RoleRefinementCache()
+    cache.put("a", {})
+    cache.get("a")
+
+    cache.clear()
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries, stats.hit_rate) == (0, 0, 0, 0.0)
@@ -0,0 +1,262 @@
+"""Tests for role_requests module."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from openai import AuthenticationError
+
+from resume_editor.app.llm.concurrency_limiter import (
+    AdaptiveConcurrencyLimiter,
+    ConcurrencyLimitPolicy,
+)
+from resume_editor.app.llm.models import RefinedRole
+from resume_editor.app.llm.orchestration_models import RoleRefinementRequest
+from resume_editor.app.llm.request_hedging import (
+    MIN_LATENCY_SAMPLES,
+    llm_request_hedger,
+)
+from resume_editor.app.llm.role_requests import (
+    _attempt_refine_role,
+    _attempt_refine_role_with_limit,
+)
+
+
+@pytest.mark.asyncio
+class TestAttemptRefineRole:
+    """Tests for _attempt_refine_role function."""
+
+    async def test_attempt_refine_role_success(self):
+        """Test successful role refinement attempt."""
+        mock_chain = AsyncMock()
+        refined_role_dict = {
+            "basics": {
+                "company": "Test Company",
+                "title": "Test Title",
+                "start_date": "2020-01-01T00:00:00",
+                "inclusion_status": "Include",
+            },
+            "summary": {"text": "Test summary"},
+            "responsibilities": {"text": "* Test responsibilities"},
+            "skills": {"skills": ["Python"]},
+        }
+        mock_chain.ainvoke.return_value = (
+            f"```json\n{json.dumps(refined_role_dict)}\n```"
+        )
+
+        success, result, error = await _attempt_refine_role(
+            chain=mock_chain,
+            job_analysis_json="{}",
+            role_json="{}",
+        )
+
+        assert success is True
+        assert isinstance(result, RefinedRole)
+        assert error is None
+        assert result.basics.company == "Test Company"
+
+    async def test_attempt_refine_role_authentication_error(self):
+        """Test that AuthenticationError is re-raised."""
+        mock_chain = AsyncMock()
+        mock_chain.ainvoke.side_effect = AuthenticationError(
+            message="Invalid API key",
+            response=MagicMock(),
+            body=None,
+        )
+
+        with pytest.raises(AuthenticationError):
+            await _attempt_refine_role(
+                chain=mock_chain,
+                job_analysis_json="{}",
+                role_json="{}",
+            )
+
+    async def test_attempt_refine_role_json_error(self):
+        """Test that JSON errors return failure."""
+        mock_chain = AsyncMock()
+        mock_chain.ainvoke.return_value = "not valid json"
+
+        success, result, error = await _attempt_refine_role(
+            chain=mock_chain,
+            job_analysis_json="{}",
+            role_json="{}",
+        )
+
+        assert success is False
+        assert result is None
+        assert error is not None
+        assert isinstance(error, json.JSONDecodeError)
+
+    async def test_streamed_attempt_previews_summary_and_validates_whole_response(self):
+        """Test that a streamed response previews the summary and is validated once complete."""
+        refined_role_json = json.dumps(
+            {
+                "basics": {
+                    "company": "Test Company",
+                    "title": "Test Title",
+                    "start_date": "2020-01-01T00:00:00",
+                },
+                "summary": {"text": "Led the backend platform team at a fast pace."},
+                "skills": {"skills": ["Python"]},
+            },
+        )
+        response = f"```json\n{refined_role_json}\n```"
+        chunks = [response[i : i + 8] for i in range(0, len(response), 8)]
+
+        async def astream(chain_input, config=None):
+            for chunk in chunks:
+                yield chunk
+
+        mock_chain = MagicMock()
+        mock_chain.astream = astream
+        previews = []
+
+        async def partial_callback(summary):
+            previews.append(summary)
+
+        success, result, error = await _attempt_refine_role(
+            chain=mock_chain,
+            job_analysis_json="{}",
+            role_json="{}",
+            partial_callback=partial_callback,
+        )
+
+        assert (success, error) == (True, None)
+        assert result.summary.text == "Led the backend platform team at a fast pace."
+        assert previews
+        assert all(
+            "Led the backend platform team at a fast pace.".startswith(p)
+            for p in previews
+        )
+        assert previews == sorted(previews, key=len)
+
+    async def test_streamed_attempt_with_truncated_response_fails(self):
+        """Test that a stream ending mid-role fails validation despite its previews."""
+
+        async def astream(chain_input, config=None):
+            yield '{"basics": {"company": "A", "title": "T", "start_date": "2020-01-01"}, '
+            yield '"summary": {"text": "Led the backend platform team'
+
+        mock_chain = MagicMock()
+        mock_chain.astream = astream
+
+        success, result, error = await _attempt_refine_role(
+            chain=mock_chain,
+            job_analysis_json="{}",
+            role_json="{}",
+            partial_callback=AsyncMock(),
+        )
+
+        assert (success, result) == (False, None)
+        assert isinstance(error, json.JSONDecodeError)
+
+    async def test_hedged_attempt_uses_first_response(self):
+        """Test that a slow attempt is hedged and the hedge's response is used."""
+        refined_role_json = json.dumps(
+            {
+                "basics": {
+                    "company": "Test Company",
+                    "title": "Test Title",
+                    "start_date": "2020-01-01T00:00:00",
+                },
+                "summary": {"text": "Hedged summary"},
+            },
+        )
+        calls = []
+
+        async def ainvoke(chain_input, config=None):
+            calls.append(chain_input)
+            if len(calls) == 1:
+                await asyncio.sleep(10)
+            return refined_role_json
+
+        mock_chain = MagicMock()
+        mock_chain.ainvoke = ainvoke
+        llm_request_hedger.configure(
+            enabled=True, max_hedge_ratio=1.0, min_hedge_delay_seconds=0.0
+        )
+        for _ in range(MIN_LATENCY_SAMPLES):
+            llm_request_hedger.record_latency("key", 0.01)
+
+        success, result, error = await _attempt_refine_role(
+            chain=mock_chain,
+            job_analysis_json="{}",
+            role_json="{}",
+            hedge_key="key",
+        )
+
+        assert (success, error) == (True, None)
+        assert result.summary.text == "Hedged summary"
+        assert len(calls) == 2
+        assert llm_request_hedger.stats().hedge_wins == 1
+
+    async def test_attempt_with_limit_reports_overload(self):
+        """Test that a timed-out attempt frees its slot and cuts the endpoint's limit."""
+        mock_chain = AsyncMock()
+        mock_chain.ainvoke.side_effect = TimeoutError("slow endpoint")
+        limiter = AdaptiveConcurrencyLimiter(
+            "e", ConcurrencyLimitPolicy(initial_limit=4)
+        )
+
+        success, result, error = await _attempt_refine_role_with_limit(
+            limiter=limiter,
+            chain=mock_chain,
+            request=RoleRefinementRequest(job_analysis_json="{}", role_json="{}"),
+        )
+
+        assert (success, result) == (False, None)
+        assert isinstance(error, TimeoutError)
+        stats = limiter.stats()
+        assert (stats.limit, stats.decreases, stats.in_flight) == (2, 1, 0)
+
+    async def test_attempt_with_limit_releases_slot_on_authentication_error(self):
+        """Test that a re-raised AuthenticationError still frees the slot."""
+        mock_chain = AsyncMock()
+        mock_chain.ainvoke.side_effect = AuthenticationError(
+            message="Invalid API key",
+            response=MagicMock(),
+            body=None,
+        )
+        limiter = AdaptiveConcurrencyLimiter(
+            "e", ConcurrencyLimitPolicy(initial_limit=4)
+        )
+
+        with pytest.raises(AuthenticationError):
+            await _attempt_refine_role_with_limit(
+                limiter=limiter,
+                chain=mock_chain,
+                request=RoleRefinementRequest(job_analysis_json="{}", role_json="{}"),
+            )
+
+        stats = limiter.stats()
+        assert (stats.limit, stats.in_flight) == (4, 0)
+
+    async def test_attempt_with_limit_waits_for_rate_limit_before_slot(self):
+        """Test that the shared rate limit is awaited before a slot is taken."""
+        mock_chain = AsyncMock()
+        mock_chain.ainvoke.return_value = '{"basics": {}}'
+        limiter = AdaptiveConcurrencyLimiter(
+            "e", ConcurrencyLimitPolicy(initial_limit=1)
+        )
+
+        async def assert_no_slot_held(key, tokens):
+            assert limiter.stats().in_flight == 0
+
+        with patch(
+            "resume_editor.app.llm.role_requests.llm_rate_limiter.acquire",
+            side_effect=assert_no_slot_held,
+        ) as mock_acquire:
+            await _attempt_refine_role_with_limit(
+                limiter=limiter,
+                chain=mock_chain,
+                request=RoleRefinementRequest(
+                    job_analysis_json="{}",
+                    role_json="{}",
+                    throttle_key="http://llm#digest",
+                ),
+            )
+
+        mock_acquire.assert_awaited_once()
+        assert mock_acquire.await_args.args[0] == "http://llm#digest"
+        assert mock_acquire.await_args.args[1] > 0
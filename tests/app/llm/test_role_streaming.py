@@ -0,0 +1,52 @@
+"""Tests for role_streaming module."""
+
+from unittest.mock import MagicMock, patch
+
+from resume_editor.app.llm.role_streaming import (
+    PartialRoleParser,
+    is_role_streaming_enabled,
+    partial_role_summary,
+)
+
+
+def test_streaming_enabled_from_settings():
+    """Test that streaming follows the setting."""
+    settings = MagicMock(llm_role_refine_streaming=True)
+    with patch(
+        "resume_editor.app.llm.role_streaming.get_settings",
+        return_value=settings,
+    ):
+        assert is_role_streaming_enabled() is True
+
+
+def test_partial_role_summary_reads_unterminated_json():
+    """Test that the summary is read from a fenced, unterminated response."""
+    text = '```json\n{"basics": {"company": "Acme"}, "summary": {"text": "Led the'
+
+    assert partial_role_summary(text) == "Led the"
+    assert partial_role_summary('```json\n{"basics": {"company": "Ac') is None
+    assert partial_role_summary("not json") is None
+    assert partial_role_summary('{"summary": {"text": 3}}') is None
+
+
+def test_parser_previews_growing_summary():
+    """Test that previews are sent only when the summary has grown."""
+    parser = PartialRoleParser(min_chars=10)
+    chunks = [
+        '{"basics": {"company": "Acme"}, ',
+        '"summary": {"text": "Led',
+        " the platform team",
+        '"}, "skills": {"skills": ["Go"]}}',
+    ]
+
+    previews = [parser.feed(chunk) for chunk in chunks]
+
+    assert previews == [None, "Led", "Led the platform team", None]
+    assert parser.text == "".join(chunks)
+
+
+def test_parser_waits_for_enough_new_characters():
+    """Test that short chunks are not parsed until enough text arrived."""
+    parser = PartialRoleParser(min_chars=1000)
+
+    assert parser.feed('{"summary": {"text": "Led the team') is None
@@ -0,0 +1,115 @@
+"""Tests for token_usage module."""
+
+import asyncio
+import logging
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, Generation, LLMResult
+
+from resume_editor.app.llm.token_usage import (
+    TokenUsage,
+    TokenUsageLedger,
+    token_usage_config,
+    track_token_usage,
+    usage_from_llm_result,
+)
+
+
+def _chat_result(prompt_tokens: int, completion_tokens: int) -> LLMResult:
+    """Build a chat model result carrying standard usage metadata."""
+    message = AIMessage(
+        content="ok",
+        usage_metadata={
+            "input_tokens": prompt_tokens,
+            "output_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        },
+    )
+    return LLMResult(generations=[[ChatGeneration(message=message)]])
+
+
+def test_usage_from_message_metadata():
+    """Test that the messages' usage metadata is read."""
+    usage = usage_from_llm_result(_chat_result(120, 30))
+
+    assert usage == TokenUsage(calls=1, prompt_tokens=120, completion_tokens=30)
+    assert usage.total_tokens == 150
+
+
+def test_usage_falls_back_to_llm_output():
+    """Test that the provider's token_usage is used when messages carry none."""
+    result = LLMResult(
+        generations=[[Generation(text="ok")]],
+        llm_output={"token_usage": {"prompt_tokens": 7, "completion_tokens": 3}},
+    )
+
+    assert usage_from_llm_result(result) == TokenUsage(1, 7, 3)
+    assert usage_from_llm_result(LLMResult(generations=[[]])) == TokenUsage(calls=1)
+
+
+def test_ledger_sums_usage_by_stage():
+    """Test that the ledger sums calls per stage and in total."""
+    ledger = TokenUsageLedger()
+    ledger.record("role_refine", TokenUsage(1, 100, 20))
+    ledger.record("role_refine", TokenUsage(1, 50, 10))
+    ledger.record("banner_generation", TokenUsage(1, 10, 5))
+
+    assert ledger.as_dict() == {
+        "role_refine": {
+            "calls": 2,
+            "prompt_tokens": 150,
+            "completion_tokens": 30,
+            "total_tokens": 180,
+        },
+        "banner_generation": {
+            "calls": 1,
+            "prompt_tokens": 10,
+            "completion_tokens": 5,
+            "total_tokens": 15,
+        },
+        "total": {
+            "calls": 3,
+            "prompt_tokens": 160,
+            "completion_tokens": 35,
+            "total_tokens": 195,
+        },
+    }
+
+
+def test_callback_logs_usage_with_extra_fields(caplog):
+    """Test that each call's usage is attached to its log record."""
+    handler = token_usage_config("job_analysis")["callbacks"][0]
+
+    with caplog.at_level(logging.INFO, logger="resume_editor.app.llm.token_usage"):
+        handler.on_llm_end(_chat_result(40, 8))
+
+    record = caplog.records[-1]
+    assert (record.llm_stage, record.prompt_tokens, record.completion_tokens) == (
+        "job_analysis",
+        40,
+        8,
+    )
+    assert handler.ledger is None
+
+
+@pytest.mark.asyncio
+async def test_tracked_calls_are_recorded_including_from_tasks():
+    """Test that calls made in tasks started within the block share the ledger."""
+
+    async def call(stage: str) -> None:
+        token_usage_config(stage)["callbacks"][0].on_llm_end(_chat_result(10, 2))
+
+    with track_token_usage() as ledger:
+        await asyncio.gather(
+            asyncio.create_task(call("role_refine")),
+            asyncio.create_task(call("role_refine")),
+        )
+        await call("banner_generation")
+
+    await call("outside")
+
+    assert ledger.stages() == {
+        "role_refine": TokenUsage(2, 20, 4),
+        "banner_generation": TokenUsage(1, 10, 2),
+    }
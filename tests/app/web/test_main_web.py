@@ -14,7 +14,20 @@ from resume_editor.app.api.routes.route_logic.resume_parsing import (
     parse_resume_content,
 )
 from resume_editor.app.core.auth import get_current_user, get_current_user_from_cookie
+from resume_editor.app.core.runtime_monitor import runtime_monitor
 from resume_editor.app.database.database import get_db
+from resume_editor.app.llm.circuit_breaker import (
+    CircuitBreakerPolicy,
+    circuit_breaker_key,
+    llm_circuit_breakers,
+)
+from resume_editor.app.llm.concurrency_limiter import (
+    endpoint_label,
+    llm_concurrency_limiters,
+)
+from resume_editor.app.llm.models import LLMConfig
+from resume_editor.app.llm.rate_limiter import llm_rate_limiter
+from resume_editor.app.llm.request_hedging import llm_request_hedger
 from resume_editor.app.main import create_app, initialize_database
 from resume_editor.app.models.resume_model import (
     Resume as DatabaseResume,
@@ -22,7 +35,10 @@ from resume_editor.app.models.resume_model import (
 )
 from resume_editor.app.models.role import Role
 from resume_editor.app.models.user import User, UserData
-from resume_editor.app.models.user_settings import UserSettings
+from resume_editor.app.models.user_settings import (
+    UserSettings,
+    UserSettingsData,
+)
 from resume_editor.app.schemas.user import UserSettingsUpdateRequest
 
 log = logging.getLogger(__name__)
@@ -105,6 +121,145 @@ def test_health_check():
     app.dependency_overrides.clear()
 
 
+def test_parse_executor_health():
+    """
+    GIVEN the application is running
+    WHEN the /health/parse-executor endpoint is requested
+    THEN the parse executor queue depth and wait time metrics are returned.
+    """
+    app = create_app()
+    client = TestClient(app)
+    response = client.get("/health/parse-executor")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["kind"] in ("thread", "process")
+    assert {"queue_depth", "max_queue_depth", "total_wait_ms", "max_wait_ms"} <= set(
+        body
+    )
+    app.dependency_overrides.clear()
+
+
+
+def test_role_refinement_cache_health():
+    """
+    GIVEN the application is running
+    WHEN the /health/role-refinement-cache endpoint is requested
+    THEN the role refinement cache hit-rate metrics are returned.
+    """
+    app = create_app()
+    client = TestClient(app)
+    response = client.get("/health/role-refinement-cache")
+    assert response.status_code == 200
+    assert response.json() == {
+        "hits": 0,
+        "misses": 0,
+        "evictions": 0,
+        "entries": 0,
+        "hit_rate": 0.0,
+    }
+    app.dependency_overrides.clear()
+
+
+def test_llm_concurrency_health():
+    """
+    GIVEN the application is running
+    WHEN the /health/llm-concurrency endpoint is requested
+    THEN the adaptive concurrency limit of each LLM endpoint is returned under
+    a label that does not reveal the endpoint URL.
+    """
+    llm_concurrency_limiters.for_endpoint(LLMConfig(llm_endpoint="http://llm:8000/v1/"))
+    app = create_app()
+    client = TestClient(app)
+    response = client.get("/health/llm-concurrency")
+    assert response.status_code == 200
+    assert response.json() == [
+        {
+            "endpoint": endpoint_label("http://llm:8000/v1"),
+            "limit": 5,
+            "in_flight": 0,
+            "waiting": 0,
+            "min_latency_seconds": None,
+            "smoothed_latency_seconds": None,
+            "increases": 0,
+            "decreases": 0,
+        },
+    ]
+    app.dependency_overrides.clear()
+
+
+def test_llm_rate_limit_health():
+    """
+    GIVEN the application is running with shared LLM rate limits
+    WHEN the /health/llm-rate-limit endpoint is requested
+    THEN the configured budgets and wait statistics are returned.
+    """
+    llm_rate_limiter.configure(requests_per_minute=60, tokens_per_minute=90000)
+    app = create_app()
+    client = TestClient(app)
+    response = client.get("/health/llm-rate-limit")
+    assert response.status_code == 200
+    assert response.json() == {
+        "backend": "memory",
+        "requests_per_minute": 60,
+        "tokens_per_minute": 90000,
+        "acquired": 0,
+        "throttled": 0,
+        "total_wait_seconds": 0.0,
+        "max_wait_seconds": 0.0,
+    }
+    app.dependency_overrides.clear()
+
+
+def test_llm_hedging_health():
+    """
+    GIVEN the application is running with LLM request hedging enabled
+    WHEN the /health/llm-hedging endpoint is requested
+    THEN the hedging settings, hedge rate and wins are returned.
+    """
+    llm_request_hedger.configure(enabled=True, max_hedge_ratio=0.2)
+    app = create_app()
+    client = TestClient(app)
+    response = client.get("/health/llm-hedging")
+    assert response.status_code == 200
+    assert response.json() == {
+        "enabled": True,
+        "max_hedge_ratio": 0.2,
+        "min_hedge_delay_seconds": 2.0,
+        "requests": 0,
+        "hedges": 0,
+        "hedge_wins": 0,
+        "hedges_denied": 0,
+        "hedge_rate": 0.0,
+    }
+    app.dependency_overrides.clear()
+
+
+def test_llm_circuit_breakers_health():
+    """
+    GIVEN an LLM endpoint whose circuit opened after a timed-out call
+    WHEN the /health/llm-circuit-breakers endpoint is requested
+    THEN the circuit's state, failure rate and open count are returned under
+    a label that does not reveal the endpoint URL.
+    """
+    llm_circuit_breakers.configure(
+        enabled=True,
+        policy=CircuitBreakerPolicy(min_calls=1),
+    )
+    llm_config = LLMConfig(llm_endpoint="http://llm/v1")
+    _, permit = llm_circuit_breakers.acquire(llm_config)
+    llm_circuit_breakers.record(permit, TimeoutError("slow endpoint"))
+    app = create_app()
+    client = TestClient(app)
+    response = client.get("/health/llm-circuit-breakers")
+    assert response.status_code == 200
+    [breaker] = response.json()
+    assert breaker["endpoint"] == endpoint_label(circuit_breaker_key(llm_config))
+    assert breaker["state"] == "open"
+    assert (breaker["calls"], breaker["failure_rate"]) == (1, 1.0)
+    assert breaker["times_opened"] == 1
+    assert 0 < breaker["seconds_until_half_open"] <= 30.0
+    app.dependency_overrides.clear()
+
 def test_get_login_page():
     """
     GIVEN a request to the login page
@@ -191,6 +346,25 @@ def test_login_for_access_token_failure(mock_authenticate_user):
     app.dependency_overrides.clear()
 
 
+def test_runtime_health():
+    """
+    GIVEN the application is running with event-loop lag samples recorded
+    WHEN the /health/runtime endpoint is requested
+    THEN this worker's pid, lag percentiles and memory use are returned.
+    """
+    runtime_monitor.record_lag(0.002)
+    runtime_monitor.record_lag(0.05)
+    app = create_app()
+    client = TestClient(app)
+    response = client.get("/health/runtime")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["lag_samples"] == 2
+    assert body["loop_lag_max_ms"] == 50.0
+    assert body["peak_rss_kib"] > 0
+
+
+
 def test_logout():
     """
     GIVEN an authenticated user
@@ -496,7 +670,9 @@ def test_settings_page_displays_model_name():
     app.dependency_overrides[get_current_user_from_cookie] = get_mock_user
 
     # Scenario 1: User has settings with a model name
-    mock_settings_with_name = UserSettings(user_id=1, llm_model_name="test-model")
+    mock_settings_with_name = UserSettings(
+        data=UserSettingsData(user_id=1, llm_model_name="test-model"),
+    )
     mock_db_with_name = MagicMock()
     mock_db_with_name.query.return_value.filter.return_value.first.return_value = (
         mock_settings_with_name
@@ -515,7 +691,9 @@ def test_settings_page_displays_model_name():
     assert model_name_input["value"] == "test-model"
 
     # Scenario 2: User has settings but no model name
-    mock_settings_no_name = UserSettings(user_id=1, llm_model_name=None)
+    mock_settings_no_name = UserSettings(
+        data=UserSettingsData(user_id=1, llm_model_name=None),
+    )
     mock_db_no_name = MagicMock()
     mock_db_no_name.query.return_value.filter.return_value.first.return_value = (
         mock_settings_no_name
@@ -654,6 +832,59 @@ def test_update_settings_form_submission(mock_update_user_settings):
     app.dependency_overrides.clear()
 
 
+@patch("resume_editor.app.web.pages.update_user_settings")
+def test_update_settings_fallback_endpoints(mock_update_user_settings):
+    """
+    GIVEN an authenticated user
+    WHEN they submit fallback endpoints, one per line
+    THEN valid lines are passed on in order and an invalid line is reported.
+    """
+    app = create_app()
+    client = TestClient(app)
+    app.dependency_overrides.clear()
+
+    mock_user = User(
+        data=UserData(
+            id_=1, username="testuser", email="test@test.com", hashed_password="hashed"
+        )
+    )
+
+    def get_mock_user():
+        return mock_user
+
+    mock_db = MagicMock()
+
+    def get_mock_db():
+        yield mock_db
+
+    app.dependency_overrides[get_current_user_from_cookie] = get_mock_user
+    app.dependency_overrides[get_db] = get_mock_db
+
+    response = client.post(
+        "/settings",
+        data={
+            "llm_fallback_endpoints": "http://backup/v1 small\n\nhttp://spare/v1 key=sk-spare",
+        },
+    )
+
+    assert response.status_code == 200
+    assert "Your settings have been updated" in response.text
+    settings_data = mock_update_user_settings.call_args.kwargs["settings_data"]
+    assert [
+        (f.llm_endpoint, f.llm_model_name, f.api_key)
+        for f in settings_data.llm_fallback_endpoints
+    ] == [("http://backup/v1", "small", None), ("http://spare/v1", None, "sk-spare")]
+
+    mock_update_user_settings.reset_mock()
+    response = client.post("/settings", data={"llm_fallback_endpoints": "backup"})
+
+    assert response.status_code == 200
+    assert "Each fallback endpoint must be an http(s) URL" in response.text
+    mock_update_user_settings.assert_not_called()
+
+    app.dependency_overrides.clear()
+
+
 @patch("resume_editor.app.web.pages.update_user_settings")
 def test_update_settings_empty_api_key_preserved(mock_update_user_settings):
     """
@@ -394,8 +394,13 @@ def test_update_resume_view_page_post():
         patch(
             "resume_editor.app.web.pages.reconstruct_resume_with_new_introduction"
         ) as mock_reconstruct,
+        patch(
+            "resume_editor.app.web.pages.build_structured_data"
+        ) as mock_build_structured,
     ):
         mock_reconstruct.return_value = "reconstructed content"
+        structured_data = {"content_hash": "hash", "sections": {}}
+        mock_build_structured.return_value = structured_data
 
         response = client.post(
             "/resumes/1/view",
@@ -410,11 +415,13 @@ def test_update_resume_view_page_post():
         mock_reconstruct.assert_called_once_with(
             resume_content="# My Resume Content", introduction="New Intro"
         )
+        mock_build_structured.assert_called_once_with("reconstructed content")
         expected_params = ResumeUpdateParams(
             introduction="New Intro",
             notes="New Notes",
             company="",
             content="reconstructed content",
+            structured_data=structured_data,
         )
         mock_update_resume.assert_called_once_with(
             db=mock_db_session,
@@ -551,7 +558,10 @@ def test_handle_create_resume_success():
     mock_new_resume.id = 2
 
     with (
-        patch("resume_editor.app.web.pages.validate_resume_content") as mock_validate,
+        patch(
+            "resume_editor.app.web.pages.build_validated_structured_data",
+            return_value=None,
+        ) as mock_validate,
         patch(
             "resume_editor.app.web.pages.create_resume_db", return_value=mock_new_resume
         ) as mock_create_resume,
@@ -607,7 +617,10 @@ def test_handle_create_resume_validation_error():
     app.dependency_overrides[get_db] = get_mock_db
 
     with (
-        patch("resume_editor.app.web.pages.validate_resume_content") as mock_validate,
+        patch(
+            "resume_editor.app.web.pages.build_validated_structured_data",
+            return_value=None,
+        ) as mock_validate,
         patch("resume_editor.app.web.pages.create_resume_db") as mock_create_resume,
     ):
         mock_validate.side_effect = HTTPException(
@@ -1,13 +1,39 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from resume_editor.app.api.routes.route_logic.resume_parse_cache import (
+    resume_parse_cache,
+)
 from resume_editor.app.core.config import get_settings
+from resume_editor.app.core.runtime_monitor import runtime_monitor
+from resume_editor.app.llm.circuit_breaker import llm_circuit_breakers
+from resume_editor.app.llm.concurrency_limiter import llm_concurrency_limiters
+from resume_editor.app.llm.orchestration_registry import llm_client_registry
+from resume_editor.app.llm.rate_limiter import llm_rate_limiter
+from resume_editor.app.llm.request_hedging import llm_request_hedger
+from resume_editor.app.llm.role_refinement_cache import role_refinement_cache
 from resume_editor.app.main import create_app
 
 
+class FakeClock:
+    """A manually advanced clock for time-based limiters and breakers."""
+
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def fake_clock() -> FakeClock:
+    """Fixture to provide a manually advanced clock starting at zero."""
+    return FakeClock()
+
+
 @pytest.fixture
 def mock_db_engine():
     """Fixture to provide a mock database engine."""
@@ -54,6 +80,22 @@ def mock_database_imports():
             "resume_editor.app.core.security.get_settings",
         ) as mock_get_settings_security,
         patch("resume_editor.app.core.auth.get_settings") as mock_get_settings_auth,
+        patch("resume_editor.app.main.get_settings") as mock_get_settings_main,
+        patch(
+            "resume_editor.app.api.routes.route_logic.job_analysis_cache.get_settings",
+        ) as mock_get_settings_analysis_cache,
+        patch(
+            "resume_editor.app.llm.retry_policy.get_settings",
+        ) as mock_get_settings_retry_policy,
+        patch(
+            "resume_editor.app.llm.prompt_encoding.get_settings",
+        ) as mock_get_settings_prompt_encoding,
+        patch(
+            "resume_editor.app.llm.role_batching.get_settings",
+        ) as mock_get_settings_role_batching,
+        patch(
+            "resume_editor.app.llm.role_streaming.get_settings",
+        ) as mock_get_settings_role_streaming,
     ):
         # Create a mock settings object with valid values
         mock_settings = MagicMock()
@@ -63,10 +105,109 @@ def mock_database_imports():
         mock_settings.access_token_expire_minutes = 30
         mock_settings.algorithm = "HS256"
         mock_settings.secret_key = "test-secret-key"
+        mock_settings.parse_executor_kind = "thread"
+        mock_settings.parse_executor_max_workers = 2
+        mock_settings.job_analysis_cache_enabled = False
+        mock_settings.job_analysis_cache_ttl_seconds = 3600
+        mock_settings.job_analysis_cache_max_entries = 100
+        mock_settings.llm_retry_max_attempts = 3
+        mock_settings.llm_retry_base_delay_seconds = 1.0
+        mock_settings.llm_retry_max_delay_seconds = 30.0
+        mock_settings.llm_retry_budget = 10
+        mock_settings.llm_rate_limit_requests_per_minute = 0
+        mock_settings.llm_rate_limit_tokens_per_minute = 0
+        mock_settings.llm_rate_limit_backend = "memory"
+        mock_settings.llm_prompt_encoding = "compact"
+        mock_settings.llm_role_batch_token_budget = 0
+        mock_settings.llm_role_batch_max_roles = 6
+        mock_settings.llm_role_refine_streaming = False
+        mock_settings.llm_hedge_enabled = False
+        mock_settings.llm_hedge_max_ratio = 0.1
+        mock_settings.llm_hedge_min_delay_seconds = 2.0
+        mock_settings.llm_circuit_breaker_enabled = False
+        mock_settings.llm_circuit_breaker_failure_rate = 0.5
+        mock_settings.llm_circuit_breaker_slow_call_seconds = 30.0
+        mock_settings.llm_circuit_breaker_slow_call_rate = 0.8
+        mock_settings.llm_circuit_breaker_min_calls = 10
+        mock_settings.llm_circuit_breaker_open_seconds = 30.0
         mock_get_settings.return_value = mock_settings
         mock_get_settings_security.return_value = mock_settings
         mock_get_settings_auth.return_value = mock_settings
+        mock_get_settings_main.return_value = mock_settings
+        mock_get_settings_analysis_cache.return_value = mock_settings
+        mock_get_settings_retry_policy.return_value = mock_settings
+        mock_get_settings_prompt_encoding.return_value = mock_settings
+        mock_get_settings_role_batching.return_value = mock_settings
+        mock_get_settings_role_streaming.return_value = mock_settings
+        yield
+
+
+@pytest.fixture(autouse=True)
+def clear_resume_parse_cache():
+    """Auto-used fixture to keep cached parse results from leaking between tests."""
+    resume_parse_cache.clear()
+    yield
+    resume_parse_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_role_refinement_cache():
+    """Auto-used fixture to keep cached refined roles from leaking between tests."""
+    role_refinement_cache.clear()
+    yield
+    role_refinement_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_llm_concurrency_limiters():
+    """Auto-used fixture to keep adapted concurrency limits from leaking between tests."""
+    llm_concurrency_limiters.clear()
+    yield
+    llm_concurrency_limiters.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_llm_rate_limiter():
+    """Auto-used fixture to keep configured rate limits and buckets from leaking between tests."""
+    llm_rate_limiter.reset()
+    yield
+    llm_rate_limiter.reset()
+
+
+@pytest.fixture(autouse=True)
+def reset_llm_request_hedger():
+    """Auto-used fixture to keep hedging settings and latencies from leaking between tests."""
+    llm_request_hedger.reset()
+    yield
+    llm_request_hedger.reset()
+
+
+@pytest.fixture(autouse=True)
+def reset_llm_circuit_breakers():
+    """Auto-used fixture to keep circuit breaker settings and states from leaking between tests."""
+    llm_circuit_breakers.reset()
+    yield
+    llm_circuit_breakers.reset()
+
+
+@pytest.fixture(autouse=True)
+def reset_runtime_monitor():
+    """Auto-used fixture to keep event-loop lag samples from leaking between tests."""
+    runtime_monitor.reset()
+    yield
+    runtime_monitor.reset()
+
+
+@pytest.fixture(autouse=True)
+def isolate_llm_client_registry():
+    """Auto-used fixture to keep pooled LLM clients and connection warm-ups out of tests."""
+    llm_client_registry.clear()
+    with patch(
+        "resume_editor.app.llm.orchestration_refinement.warm_llm_client",
+        new=AsyncMock(),
+    ):
         yield
+    llm_client_registry.clear()
 
 
 @pytest.fixture
@@ -0,0 +1,254 @@
+import json
+import random
+
+import httpx
+import pytest
+from click.testing import CliRunner
+from fastapi.testclient import TestClient
+from langchain_openai import ChatOpenAI
+
+from benchmarks.fake_llm_server import (
+    FakeLLMProfile,
+    choose_fault,
+    classify_prompt,
+    create_app,
+    main,
+    sample_latency,
+)
+from resume_editor.app.llm import prompts
+from resume_editor.app.llm.models import (
+    GeneratedBanner,
+    JobAnalysis,
+    RefinedRole,
+    RefinedRoleBatch,
+)
+
+ROLE = {
+    "basics": {
+        "company": "Acme",
+        "title": "Engineer",
+        "start_date": "2020-01-01T00:00:00",
+    },
+    "skills": {"skills": ["Python"]},
+}
+
+
+def _client(**profile) -> TestClient:
+    """Build a client of a server that answers at once unless told otherwise."""
+    profile.setdefault("latency_ms", 0.0)
+    profile.setdefault("stream_chunk_delay_ms", 0.0)
+    return TestClient(create_app(FakeLLMProfile(**profile)))
+
+
+def _messages(system: str, human: str) -> list[dict[str, str]]:
+    """Build the chat messages of one of the application's prompts."""
+    return [
+        {"role": "system", "content": system},
+        {"role": "user", "content": human},
+    ]
+
+
+def _role_messages() -> list[dict[str, str]]:
+    """Build a single-role refinement request."""
+    return _messages(
+        prompts.ROLE_REFINE_SYSTEM_PROMPT,
+        prompts.ROLE_REFINE_HUMAN_PROMPT.format(
+            job_analysis_json="{}",
+            role_json=json.dumps(ROLE),
+        ),
+    )
+
+
+def _content(response: httpx.Response) -> str:
+    """Return the JSON body of a fenced chat completion."""
+    content = response.json()["choices"][0]["message"]["content"]
+    assert content.startswith("```json\n") and content.endswith("\n```")
+    return content.removeprefix("```json\n").removesuffix("\n```")
+
+
+def test_profile_rejects_invalid_rates():
+    """Test that fault rates must be probabilities summing to at most 1."""
+    with pytest.raises(ValueError):
+        FakeLLMProfile(error_rate=1.5)
+    with pytest.raises(ValueError):
+        FakeLLMProfile(error_rate=0.6, rate_limit_rate=0.6)
+    with pytest.raises(ValueError):
+        FakeLLMProfile(latency_ms=-1.0)
+
+
+def test_classify_prompt_recognizes_application_prompts():
+    """Test that each of the application's prompts is recognized."""
+    batch_system = prompts.ROLE_REFINE_BATCH_SYSTEM_PROMPT
+
+    assert classify_prompt(_role_messages()) == "role_refine"
+    assert classify_prompt(_messages(batch_system, "")) == "role_refine_batch"
+    assert (
+        classify_prompt(_messages(prompts.JOB_ANALYSIS_SYSTEM_PROMPT, ""))
+        == "job_analysis"
+    )
+    assert (
+        classify_prompt(_messages(prompts.BANNER_GENERATION_SYSTEM_PROMPT, ""))
+        == "banner_generation"
+    )
+    assert classify_prompt(_messages("Hello", "there")) == "unknown"
+
+
+def test_role_refinement_echoes_role_basics():
+    """Test that a refined role is schema-valid and keeps the role's facts."""
+    response = _client().post(
+        "/v1/chat/completions",
+        json={"model": "m", "messages": _role_messages()},
+    )
+
+    assert response.status_code == 200
+    role = RefinedRole.model_validate_json(_content(response))
+    assert (role.basics.company, role.basics.title) == ("Acme", "Engineer")
+    assert role.skills.skills == ["Python"]
+    assert role.summary.text
+    assert response.json()["usage"]["total_tokens"] > 0
+
+
+def test_batch_refinement_returns_one_role_per_input():
+    """Test that a batched request gets its roles back in order."""
+    second = {**ROLE, "basics": {**ROLE["basics"], "company": "Globex"}}
+    messages = _messages(
+        prompts.ROLE_REFINE_BATCH_SYSTEM_PROMPT,
+        prompts.ROLE_REFINE_BATCH_HUMAN_PROMPT.format(
+            job_analysis_json="{}",
+            roles_json=json.dumps([ROLE, second]),
+            role_count=2,
+        ),
+    )
+
+    response = _client().post("/v1/chat/completions", json={"messages": messages})
+
+    batch = RefinedRoleBatch.model_validate_json(_content(response))
+    assert [role.basics.company for role in batch.roles] == ["Acme", "Globex"]
+
+
+def test_job_analysis_and_banner_are_schema_valid():
+    """Test the job analysis and banner responses."""
+    client = _client()
+
+    analysis = client.post(
+        "/v1/chat/completions",
+        json={"messages": _messages(prompts.JOB_ANALYSIS_SYSTEM_PROMPT, "JD")},
+    )
+    banner = client.post(
+        "/v1/chat/completions",
+        json={"messages": _messages(prompts.BANNER_GENERATION_SYSTEM_PROMPT, "")},
+    )
+
+    assert JobAnalysis.model_validate_json(_content(analysis)).key_skills
+    assert GeneratedBanner.model_validate_json(_content(banner)).bullets
+
+
+def test_injected_faults():
+    """Test 429s with Retry-After, server errors and malformed JSON."""
+    body = {"messages": _role_messages()}
+
+    limited = _client(rate_limit_rate=1.0, retry_after_seconds=2.0).post(
+        "/v1/chat/completions", json=body
+    )
+    failed = _client(error_rate=1.0).post("/v1/chat/completions", json=body)
+    malformed_client = _client(malformed_rate=1.0)
+    malformed = malformed_client.post("/v1/chat/completions", json=body)
+
+    assert limited.status_code == 429
+    assert limited.headers["retry-after"] == "2"
+    assert limited.json()["error"]["type"] == "rate_limit_error"
+    assert failed.status_code == 500
+    content = malformed.json()["choices"][0]["message"]["content"]
+    with pytest.raises(json.JSONDecodeError):
+        json.loads(content.removeprefix("```json\n"))
+    stats = malformed_client.get("/stats").json()
+    assert (stats["requests"], stats["malformed"]) == (1, 1)
+    assert stats["by_kind"] == {"role_refine": 1}
+
+
+def test_streamed_response_matches_content_and_reports_usage():
+    """Test that the chunks add up to a valid role and end with the usage."""
+    with _client(stream_chunk_chars=7).stream(
+        "POST",
+        "/v1/chat/completions",
+        json={
+            "messages": _role_messages(),
+            "stream": True,
+            "stream_options": {"include_usage": True},
+        },
+    ) as response:
+        lines = [line for line in response.iter_lines() if line.startswith("data: ")]
+
+    assert lines[-1] == "data: [DONE]"
+    chunks = [json.loads(line.removeprefix("data: ")) for line in lines[:-1]]
+    content = "".join(
+        chunk["choices"][0]["delta"].get("content") or ""
+        for chunk in chunks
+        if chunk["choices"]
+    )
+    RefinedRole.model_validate_json(
+        content.removeprefix("```json\n").removesuffix("\n```"),
+    )
+    assert chunks[-1]["usage"]["completion_tokens"] > 0
+
+
+@pytest.mark.asyncio
+async def test_chat_openai_client_streams_from_the_server():
+    """Test that the application's LLM client can stream from the server."""
+    transport = httpx.ASGITransport(
+        app=create_app(FakeLLMProfile(latency_ms=0.0, stream_chunk_delay_ms=0.0)),
+    )
+    llm = ChatOpenAI(
+        model="fake-llm",
+        openai_api_base="http://fake-llm/v1",
+        api_key="not-needed",
+        http_async_client=httpx.AsyncClient(transport=transport),
+    ).bind(stream_usage=True)
+
+    chunks = [chunk async for chunk in llm.astream(_role_messages()[1]["content"])]
+
+    assert "".join(chunk.content for chunk in chunks).startswith("```json")
+    assert any(chunk.usage_metadata for chunk in chunks)
+
+
+def test_requests_are_deterministic_and_retries_redraw():
+    """Test that a seed fixes each attempt's fate while retries draw anew."""
+    body = {"messages": _role_messages()}
+    profile = {"error_rate": 0.5, "seed": 7}
+
+    statuses = []
+    for client in (_client(**profile), _client(**profile)):
+        statuses.append(
+            [
+                client.post("/v1/chat/completions", json=body).status_code
+                for _ in range(8)
+            ],
+        )
+
+    assert statuses[0] == statuses[1]
+    assert set(statuses[0]) == {200, 500}
+
+
+def test_latency_distributions():
+    """Test the fixed, uniform and lognormal latency distributions."""
+    rng = random.Random(0)
+
+    assert sample_latency(FakeLLMProfile(latency_distribution="fixed"), rng) == 0.8
+    uniform = FakeLLMProfile(
+        latency_ms=100.0,
+        latency_jitter_ms=50.0,
+        latency_distribution="uniform",
+    )
+    assert all(0.05 <= sample_latency(uniform, rng) <= 0.15 for _ in range(50))
+    lognormal = [sample_latency(FakeLLMProfile(), rng) for _ in range(200)]
+    assert min(lognormal) > 0
+    assert max(lognormal) > 0.8 > min(lognormal)
+    assert choose_fault(FakeLLMProfile(), rng) is None
+
+
+def test_main_rejects_invalid_profile():
+    """Test that the CLI reports an invalid profile instead of starting."""
+    result = CliRunner().invoke(main, ["--error-rate", "2"])
+
+    assert result.exit_code != 0
+    assert "fault rates" in result.output
@@ -0,0 +1,149 @@
+import json
+from unittest.mock import Mock
+
+import pytest
+from click.testing import CliRunner
+
+from benchmarks import resume_benchmarks
+from benchmarks.resume_benchmarks import (
+    BenchmarkOperation,
+    compare_to_baseline,
+    main,
+    measure_operation,
+    percentile_summary,
+    run_benchmarks,
+    scaling_exponent,
+)
+from benchmarks.resume_generator import SyntheticResumeSpec
+
+
+def _fake_operation() -> BenchmarkOperation:
+    """Build an operation that records its calls instead of parsing."""
+    return BenchmarkOperation(
+        name="fake",
+        prepare=lambda content: (content,),
+        func=Mock(side_effect=lambda content: content.upper()),
+        reset=Mock(),
+    )
+
+
+def test_percentile_summary_uses_nearest_rank():
+    """Test percentile selection on a known distribution."""
+    summary = percentile_summary([float(value) for value in range(100, 0, -1)])
+
+    assert summary["min"] == 1.0
+    assert summary["max"] == 100.0
+    assert summary["mean"] == 50.5
+    assert summary["p50"] == 50.0
+    assert summary["p90"] == 90.0
+    assert summary["p99"] == 99.0
+    assert percentile_summary([3.0])["p99"] == 3.0
+
+
+def test_scaling_exponent_detects_growth_order():
+    """Test the log-log slope for linear and quadratic growth."""
+    assert scaling_exponent((1, 2.0), (16, 32.0)) == pytest.approx(1.0)
+    assert scaling_exponent((1, 2.0), (4, 32.0)) == pytest.approx(2.0)
+    assert scaling_exponent((4, 1.0), (4, 2.0)) is None
+    assert scaling_exponent((1, 0.0), (4, 2.0)) is None
+
+
+def test_measure_operation_resets_before_every_run():
+    """Test that the reset hook runs for each timed and traced iteration."""
+    operation = _fake_operation()
+
+    measured = measure_operation(operation, "abc", iterations=3)
+
+    assert operation.func.call_count == 7
+    assert operation.reset.call_count == 6
+    assert set(measured) == {"timing_ms", "alloc_kib"}
+    assert measured["timing_ms"]["min"] >= 0
+    assert measured["alloc_kib"]["min"] >= 0
+
+
+def test_run_benchmarks_scales_spec_and_reports_scaling():
+    """Test that each scale multiplies the entry counts of the base spec."""
+    operation = _fake_operation()
+
+    report = run_benchmarks(
+        SyntheticResumeSpec(roles=2, projects=1, certifications=1),
+        scales=(1, 3),
+        iterations=2,
+        operations=(operation,),
+    )
+
+    assert [result["scale"] for result in report["results"]] == [1, 3]
+    assert report["results"][1]["spec"]["roles"] == 6
+    assert report["results"][1]["spec"]["projects"] == 3
+    assert report["results"][1]["spec"]["bullets_per_role"] == 5
+    assert set(report["scaling"]) == {"fake"}
+    assert report["meta"]["iterations"] == 2
+    json.dumps(report)
+
+
+def test_compare_to_baseline_flags_regressions():
+    """Test ratios against a baseline and the regression threshold."""
+    report = {
+        "results": [
+            {"operation": "op", "scale": 1, "timing_ms": {"p50": 3.0}},
+            {"operation": "op", "scale": 4, "timing_ms": {"p50": 4.0}},
+            {"operation": "new", "scale": 1, "timing_ms": {"p50": 1.0}},
+        ],
+    }
+    baseline = {
+        "results": [
+            {"operation": "op", "scale": 1, "timing_ms": {"p50": 2.0}},
+            {"operation": "op", "scale": 4, "timing_ms": {"p50": 4.0}},
+        ],
+    }
+
+    comparison = compare_to_baseline(report, baseline, threshold=1.25)
+
+    assert [(entry["scale"], entry["regressed"]) for entry in comparison] == [
+        (1, True),
+        (4, False),
+    ]
+    assert comparison[0]["ratio"] == 1.5
+
+
+def test_main_exits_nonzero_on_regression(tmp_path, monkeypatch):
+    """Test the CLI writes the report and fails when a baseline regresses."""
+    report = {
+        "results": [{"operation": "op", "scale": 1, "timing_ms": {"p50": 2.0}}],
+    }
+    mock_run = Mock(return_value=report)
+    monkeypatch.setattr(resume_benchmarks, "run_benchmarks", mock_run)
+    baseline_path = tmp_path / "baseline.json"
+    baseline_path.write_text(
+        json.dumps(
+            {"results": [{"operation": "op", "scale": 1, "timing_ms": {"p50": 1.0}}]},
+        ),
+    )
+    output_path = tmp_path / "report.json"
+
+    result = CliRunner().invoke(
+        main,
+        [
+            "--scales",
+            "4,1",
+            "--iterations",
+            "2",
+            "--output",
+            str(output_path),
+            "--baseline",
+            str(baseline_path),
+        ],
+    )
+
+    assert result.exit_code == 1
+    assert mock_run.call_args.args[1:] == ((1, 4), 2)
+    saved = json.loads(output_path.read_text())
+    assert saved["comparison"][0]["regressed"] is True
+
+
+def test_main_rejects_invalid_scales():
+    """Test that non-numeric scales are reported as a usage error."""
+    result = CliRunner().invoke(main, ["--scales", "1,x"])
+
+    assert result.exit_code == 2
+    assert "scales must be comma separated integers" in result.output
@@ -0,0 +1,60 @@
+from benchmarks.resume_generator import SyntheticResumeSpec, generate_resume_markdown
+
+
+def test_generate_resume_markdown_counts_entries():
+    """Test that the generator emits the requested number of entries."""
+    spec = SyntheticResumeSpec(
+        roles=7,
+        projects=3,
+        certifications=4,
+        bullets_per_role=6,
+    )
+
+    content = generate_resume_markdown(spec)
+    lines = content.splitlines()
+
+    assert lines.count("### Role") == 7
+    assert lines.count("### Project") == 3
+    assert lines.count("## Certification") == 4
+    assert sum(1 for line in lines if line.startswith("* ") and "%" in line) == 42
+    assert [line for line in lines if line.startswith("# ")] == [
+        "# Personal",
+        "# Education",
+        "# Certifications",
+        "# Experience",
+    ]
+
+
+def test_generate_resume_markdown_is_deterministic_per_seed():
+    """Test that output depends only on the spec, including its seed."""
+    spec = SyntheticResumeSpec(roles=3, seed=11)
+
+    assert generate_resume_markdown(spec) == generate_resume_markdown(spec)
+    assert generate_resume_markdown(spec) != generate_resume_markdown(
+        SyntheticResumeSpec(roles=3, seed=12),
+    )
+
+
+def test_generate_resume_markdown_dates_roles_newest_first():
+    """Test that roles run back in time in one-year steps."""
+    content = generate_resume_markdown(SyntheticResumeSpec(roles=3, projects=0))
+    starts = [line for line in content.splitlines() if line.startswith("Start date:")]
+
+    assert starts[1:] == [
+        "Start date: 01/2024",
+        "Start date: 01/2023",
+        "Start date: 01/2022",
+    ]
+    assert "End date: 12/2023" in content
+    assert "## Projects" not in content
+
+
+def test_generate_resume_markdown_omits_empty_sections():
+    """Test that zero counts leave out the matching containers."""
+    content = generate_resume_markdown(
+        SyntheticResumeSpec(roles=0, projects=0, certifications=0),
+    )
+
+    assert "# Certifications" not in content
+    assert "## Roles" not in content
+    assert content.rstrip().endswith("# Experience")
@@ -0,0 +1,156 @@
+from collections import Counter
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+
+from benchmarks.sse_load_benchmark import (
+    BenchmarkUser,
+    LoadTestConfig,
+    SessionResult,
+    compare_to_baseline,
+    merge_runtime_sample,
+    run_session,
+    summarize,
+)
+
+
+def _stream_app(events: list[str]) -> FastAPI:
+    """Build an app whose refine stream sends the given events."""
+    app = FastAPI()
+
+    @app.get("/api/resumes/{resume_id}/refine/stream")
+    async def stream(resume_id: int, request: Request) -> StreamingResponse:
+        assert request.cookies["access_token"] == "token"
+        assert request.query_params["force_fresh"] == "true"
+
+        async def body():
+            for event in events:
+                yield f"event: {event}\ndata: <p>{resume_id}</p>\n\n"
+
+        return StreamingResponse(body(), media_type="text/event-stream")
+
+    return app
+
+
+def _client(app: FastAPI) -> httpx.AsyncClient:
+    """Build a client that calls the app in-process."""
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://app",
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_session_times_first_and_done_events():
+    """Test that a completed stream's events are counted and timed."""
+    app = _stream_app(["progress", "progress", "done", "close"])
+
+    async with _client(app) as client:
+        result = await run_session(
+            client,
+            BenchmarkUser("user", "token", 7),
+            LoadTestConfig(),
+        )
+
+    assert result.ok
+    assert result.error is None
+    assert result.events == Counter(progress=2, done=1, close=1)
+    assert 0 <= result.time_to_first_event_s <= result.time_to_done_s
+    assert result.duration_s >= result.time_to_done_s
+
+
+@pytest.mark.asyncio
+async def test_run_session_records_failures():
+    """Test that error events and HTTP errors fail the session without raising."""
+    async with _client(_stream_app(["progress", "error", "close"])) as client:
+        errored = await run_session(
+            client,
+            BenchmarkUser("user", "token", 7),
+            LoadTestConfig(),
+        )
+
+    assert (errored.ok, errored.error) == (False, "error event")
+
+    async with _client(FastAPI()) as client:
+        not_found = await run_session(
+            client,
+            BenchmarkUser("user", "token", 7),
+            LoadTestConfig(),
+        )
+
+    assert not_found.error == "HTTP 404"
+
+
+def test_summarize_reports_latencies_throughput_and_workers():
+    """Test the report body built from session results and runtime samples."""
+    results = [
+        SessionResult(200, Counter(progress=3, done=1), 0.1, 2.0, 2.0),
+        SessionResult(200, Counter(progress=1, error=1), 0.3, None, 1.0, "error event"),
+    ]
+    workers: dict = {}
+    merge_runtime_sample(
+        workers,
+        {"pid": 2, "loop_lag_p99_ms": 5.0, "loop_lag_max_ms": 9.0, "peak_rss_kib": 10},
+    )
+    merge_runtime_sample(
+        workers,
+        {"pid": 2, "loop_lag_p99_ms": 3.0, "loop_lag_max_ms": 12.0, "peak_rss_kib": 20},
+    )
+
+    report = summarize(results, wall_seconds=2.0, workers=workers)
+
+    assert report["sessions"] == {
+        "started": 2,
+        "completed": 1,
+        "failed": 1,
+        "errors": {"error event": 1},
+    }
+    assert report["time_to_first_event_ms"]["max"] == pytest.approx(300.0)
+    assert report["time_to_done_ms"]["p50"] == pytest.approx(2000.0)
+    assert report["events_per_second"] == 3.0
+    assert report["events"] == {"progress": 4, "done": 1, "error": 1}
+    assert report["workers"] == [
+        {
+            "pid": 2,
+            "samples": 2,
+            "loop_lag_p99_ms": 5.0,
+            "loop_lag_max_ms": 12.0,
+            "peak_rss_kib": 20,
+        },
+    ]
+
+
+def test_summarize_without_completed_sessions():
+    """Test that missing latencies are reported as None."""
+    report = summarize([SessionResult(error="ConnectError")], 0.0, {})
+
+    assert report["time_to_done_ms"] is None
+    assert report["time_to_first_event_ms"] is None
+    assert report["events_per_second"] == 0.0
+
+
+def test_compare_to_baseline_flags_slower_latency_and_lower_throughput():
+    """Test that both slower medians and fewer events per second regress."""
+    baseline = {
+        "time_to_first_event_ms": {"p50": 100.0},
+        "time_to_done_ms": {"p50": 1000.0},
+        "events_per_second": 50.0,
+    }
+    current = {
+        "time_to_first_event_ms": {"p50": 110.0},
+        "time_to_done_ms": {"p50": 1500.0},
+        "events_per_second": 25.0,
+    }
+
+    comparison = {
+        entry["metric"]: entry
+        for entry in compare_to_baseline(current, baseline, threshold=1.25)
+    }
+
+    assert comparison["time_to_first_event_ms"]["regressed"] is False
+    assert comparison["time_to_done_ms"]["ratio"] == pytest.approx(1.5)
+    assert comparison["time_to_done_ms"]["regressed"] is True
+    assert comparison["events_per_second"]["ratio"] == pytest.approx(2.0)
+    assert compare_to_baseline({"time_to_done_ms": None}, baseline, 1.25) == []
@@ -27,6 +27,50 @@ def test_settings_default_values():
         # Test API keys
         assert settings.llm_api_key is None
 
+        # Test parsing worker pool settings
+        assert settings.parse_executor_kind == "thread"
+        assert settings.parse_executor_max_workers == 4
+
+        # Test job analysis cache settings
+        assert settings.job_analysis_cache_enabled is True
+        assert settings.job_analysis_cache_ttl_seconds == 604800
+        assert settings.job_analysis_cache_max_entries == 1000
+
+        # Test LLM retry policy settings
+        assert settings.llm_retry_max_attempts == 3
+        assert settings.llm_retry_base_delay_seconds == 1.0
+        assert settings.llm_retry_max_delay_seconds == 30.0
+        assert settings.llm_retry_budget == 10
+
+        # Test shared LLM rate limit settings
+        assert settings.llm_rate_limit_requests_per_minute == 0
+        assert settings.llm_rate_limit_tokens_per_minute == 0
+        assert settings.llm_rate_limit_backend == "memory"
+        assert settings.llm_rate_limit_state_dir.endswith("resume_editor_llm_rate_limits")
+
+        # Test prompt encoding settings
+        assert settings.llm_prompt_encoding == "compact"
+
+        # Test batched role refinement settings
+        assert settings.llm_role_batch_token_budget == 1500
+        assert settings.llm_role_batch_max_roles == 6
+
+        # Test streamed role refinement settings
+        assert settings.llm_role_refine_streaming is True
+
+        # Test request hedging settings
+        assert settings.llm_hedge_enabled is False
+        assert settings.llm_hedge_max_ratio == 0.1
+        assert settings.llm_hedge_min_delay_seconds == 2.0
+
+        # Test circuit breaker settings
+        assert settings.llm_circuit_breaker_enabled is True
+        assert settings.llm_circuit_breaker_failure_rate == 0.5
+        assert settings.llm_circuit_breaker_slow_call_seconds == 30.0
+        assert settings.llm_circuit_breaker_slow_call_rate == 0.8
+        assert settings.llm_circuit_breaker_min_calls == 10
+        assert settings.llm_circuit_breaker_open_seconds == 30.0
+
 
 def test_settings_from_environment():
     """Test that Settings loads values from environment variables."""
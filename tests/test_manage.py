@@ -94,3 +94,35 @@ def test_main(mock_cli):
     """Test that main calls cli."""
     main()
     mock_cli.assert_called_once_with()
+
+
+@patch("manage.backfill_structured_data")
+@patch("manage.get_session_local")
+def test_backfill_structured_data_success(mock_get_session_local, mock_backfill):
+    """Test the backfill-structured-data command reports refreshed resumes."""
+    mock_db = mock_get_session_local.return_value.return_value
+    mock_backfill.return_value = 3
+    runner = CliRunner()
+
+    result = runner.invoke(cli, ["backfill-structured-data"])
+
+    assert result.exit_code == 0
+    assert "Backfilling structured resume data..." in result.output
+    assert "Backfilled structured data for 3 resumes." in result.output
+    mock_backfill.assert_called_once_with(db=mock_db)
+    mock_db.close.assert_called_once()
+
+
+@patch("manage.backfill_structured_data")
+@patch("manage.get_session_local")
+def test_backfill_structured_data_error(mock_get_session_local, mock_backfill):
+    """Test the backfill-structured-data command handles errors."""
+    mock_db = mock_get_session_local.return_value.return_value
+    mock_backfill.side_effect = Exception("db down")
+    runner = CliRunner()
+
+    result = runner.invoke(cli, ["backfill-structured-data"])
+
+    assert result.exit_code == 0
+    assert "Error backfilling structured data: db down" in result.output
+    mock_db.close.assert_called_once()
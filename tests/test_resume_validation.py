@@ -45,7 +45,7 @@ Name: John Doe"""
     ) as mock_validate:
         mock_validate.return_value = None
         perform_pre_save_validation(content)
-        mock_validate.assert_called_once_with(content)
+        mock_validate.assert_called_once_with(content, original_content=None)
 
 
 def test_perform_pre_save_validation_failure():